@@ -1 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from botocraft.budget import call_budget
+    from botocraft.instrumentation import OperationStats
+
 __version__: str = "0.30.0"
+
+
+def stats() -> dict[str, OperationStats]:
+    """
+    Return what botocraft has asked of AWS so far in this process.
+
+    Returns:
+        Per-operation call counters, keyed by ``service.operation`` (e.g.
+        ``ecs.describe_services``).  See
+        :py:class:`botocraft.instrumentation.OperationStats`.
+
+    """
+    # Imported here so that ``import botocraft`` does not import boto3
+    from botocraft.instrumentation import instrumentation
+
+    return instrumentation.stats()
+
+
+def reset_stats() -> None:
+    """
+    Zero the counters returned by :py:func:`stats`.
+    """
+    from botocraft.instrumentation import instrumentation
+
+    instrumentation.reset()
+
+
+def __getattr__(name: str) -> Any:
+    # call_budget is imported on first use, like the services
+    if name != "call_budget":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from botocraft.budget import call_budget
+
+    globals()[name] = call_budget
+    return call_budget
+
+
+__all__ = ["call_budget", "reset_stats", "stats"]
@@ -0,0 +1,380 @@
+"""
+Call budgets: catch code that makes far more AWS calls than it should.
+
+Relationship properties and tag-fetching decorators make it easy to write a
+loop that quietly makes one AWS call per item.  Wrap code in
+:py:func:`call_budget` to fail (or warn) as soon as it makes more calls than
+allowed, or calls the same operation again and again with a different single
+identifier each time (the "N+1" pattern that
+:py:meth:`~botocraft.services.abstract.PrimaryBoto3ModelQuerySet.prefetch_related`
+and :py:meth:`~botocraft.services.abstract.Boto3ModelManager.batch` fix):
+
+.. code-block:: python
+
+    with botocraft.call_budget(max_calls=50):
+        for service in Service.objects.list(cluster="prod"):
+            print(service.cluster.clusterName)
+
+The error names the operation, the botocraft method that made the calls, the
+relationship property or decorator they came from, and the line of your code
+that triggered them.  Calls are counted by the
+:py:mod:`botocraft.instrumentation` hooks, so the ``instrumentation.enabled``
+setting must be on (it is by default); :py:func:`call_budget` raises
+:py:exc:`RuntimeError` if it is not, rather than count nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from botocore.loaders import Loader
+
+#: The call budgets active in the current thread or task, innermost last.
+_BUDGETS: ContextVar[tuple[CallBudget, ...]] = ContextVar(
+    "botocraft_call_budgets", default=()
+)
+
+#: The botocraft package directory, to tell botocraft frames from user code.
+_PACKAGE_DIR = Path(__file__).resolve().parent
+#: botocraft modules that only plumb calls through, and never cause them.
+_PLUMBING = frozenset(
+    str(_PACKAGE_DIR / name)
+    for name in (
+        "budget.py",
+        "clients.py",
+        "hydration.py",
+        "instrumentation.py",
+        "ratelimit.py",
+        "services/abstract.py",
+        "services/batching.py",
+        "services/cache.py",
+        "services/identity.py",
+        "services/prefetch.py",
+        "services/singleflight.py",
+    )
+)
+
+
+class CallBudgetExceededError(Exception):
+    """
+    Raised when code inside :py:func:`call_budget` makes too many AWS calls.
+    """
+
+
+class CallBudgetWarning(UserWarning):
+    """
+    Warned when code inside ``call_budget(action="warn")`` makes too many AWS
+    calls.
+    """
+
+
+def active_budgets() -> tuple[CallBudget, ...]:
+    """
+    Return the call budgets active in the current thread or task.
+
+    Returns:
+        The active budgets, innermost last.
+
+    """
+    return _BUDGETS.get()
+
+
+@lru_cache(maxsize=1)
+def _library_dirs() -> tuple[str, ...]:
+    """
+    Return the directories of code that is never the user code to blame: the
+    standard library (e.g. ``functools.cached_property``), boto3 and botocore.
+
+    Returns:
+        The directories, as strings.
+
+    """
+    import sysconfig
+
+    import boto3
+    import botocore
+
+    return tuple(
+        str(path)
+        for path in (
+            Path(sysconfig.get_paths()["stdlib"]).resolve(),
+            Path(boto3.__file__).resolve().parent,
+            Path(botocore.__file__).resolve().parent,
+        )
+    )
+
+
+def _origin() -> tuple[str | None, str | None]:
+    """
+    Find where the AWS call being made came from.
+
+    Returns:
+        The outermost botocraft relationship property, decorator or method
+        on the stack (e.g. ``Service.cluster`` or
+        ``connections_include_tags``), and the ``file:line`` of the user code
+        that called into botocraft.
+
+    """
+    source: str | None = None
+    location: str | None = None
+    library_dirs = _library_dirs()
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(str(_PACKAGE_DIR)):
+            if filename not in _PLUMBING:
+                name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+                source = name.split(".<locals>", 1)[0]
+            location = None
+        elif location is None and not filename.startswith(library_dirs):
+            location = f"{filename}:{frame.f_lineno}"
+        frame = frame.f_back  # type: ignore[assignment]
+    return source, location
+
+
+@lru_cache(maxsize=512)
+def _pagination_tokens(service_name: str) -> dict[str, frozenset[str]]:
+    """
+    Return the arguments that carry a pagination token, for each paginated
+    operation of a service, from botocore's paginator models.
+
+    Args:
+        service_name: The boto3 service name.
+
+    Returns:
+        The token arguments, by boto3 client method name.
+
+    """
+    from botocore import xform_name
+    from botocore.exceptions import DataNotFoundError
+
+    try:
+        model = _loader().load_service_model(service_name, "paginators-1")
+    except DataNotFoundError:
+        return {}
+    tokens: dict[str, frozenset[str]] = {}
+    for name, paginator in model.get("pagination", {}).items():
+        token = paginator.get("input_token") or ()
+        tokens[xform_name(name)] = frozenset(
+            [token] if isinstance(token, str) else token
+        )
+    return tokens
+
+
+@lru_cache(maxsize=1)
+def _loader() -> Loader:
+    """
+    Return the botocore data loader, created once per process.
+
+    Returns:
+        The loader.
+
+    """
+    from botocore.loaders import create_loader
+
+    return create_loader()
+
+
+def _is_single_item(service_name: str, operation: str, params: dict[str, Any]) -> bool:
+    """
+    Return whether a call looks up one resource: it has no list arguments,
+    or one of them holds a single identifier.  Pages after the first of a
+    paginated listing are never single-item calls.
+
+    Args:
+        service_name: The boto3 service name.
+        operation: The boto3 client method name.
+        params: The boto3 call arguments.
+
+    Returns:
+        Whether the call is a single-item lookup.
+
+    """
+    if _pagination_tokens(service_name).get(operation, frozenset()) & params.keys():
+        return False
+    lists = [value for value in params.values() if isinstance(value, list)]
+    return not lists or any(len(value) == 1 for value in lists)
+
+
+class CallBudget:
+    """
+    Count the AWS calls made inside a :py:func:`call_budget` block.
+
+    Args:
+        max_calls: The most AWS calls allowed, or ``None`` for no limit.
+
+    Keyword Args:
+        max_repeats: The most times one operation may be called with
+            different single-item arguments, or ``None`` for no limit.
+        action: ``"raise"`` to raise :py:class:`CallBudgetExceededError`
+            from the call that goes over budget, or ``"warn"`` to warn with
+            :py:class:`CallBudgetWarning` once per problem.
+
+    """
+
+    def __init__(
+        self,
+        max_calls: int | None = None,
+        *,
+        max_repeats: int | None = 10,
+        action: Literal["raise", "warn"] = "raise",
+    ) -> None:
+        #: The most AWS calls allowed, or ``None``.
+        self.max_calls = max_calls
+        #: The most single-item calls allowed per operation, or ``None``.
+        self.max_repeats = max_repeats
+        #: What to do when the budget is exceeded.
+        self.action = action
+        #: AWS calls made so far.
+        self.calls = 0
+        #: AWS calls made so far, by ``service.operation``.
+        self.operations: Counter[str] = Counter()
+        #: Where each operation's calls came from, by ``service.operation``.
+        self.origins: dict[str, Counter[tuple[str | None, ...]]] = {}
+        self._single_items: dict[str, set[str]] = {}
+        self._reported: set[str] = set()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        service_name: str,
+        operation: str,
+        params: dict[str, Any],
+        caller: str | None,
+    ) -> None:
+        """
+        Count one AWS call, and act if it goes over budget.
+
+        Args:
+            service_name: The boto3 service name.
+            operation: The boto3 client method name.
+            params: The call arguments.
+            caller: The botocraft method the call was made for, if known.
+
+        Raises:
+            CallBudgetExceededError: If the call goes over budget and
+                :py:attr:`action` is ``"raise"``.
+
+        """
+        name = f"{service_name}.{operation}"
+        origin = (caller, *_origin())
+        problems: list[tuple[str, str]] = []
+        with self._lock:
+            self.calls += 1
+            self.operations[name] += 1
+            self.origins.setdefault(name, Counter())[origin] += 1
+            if self.max_calls is not None and self.calls > self.max_calls:
+                problems.append(
+                    (
+                        "calls",
+                        f"{self.calls} AWS calls made, over the budget of "
+                        f"{self.max_calls}; the most made was "
+                        f"{self._describe(self.operations.most_common(1)[0][0])}",
+                    )
+                )
+            if self.max_repeats is not None and _is_single_item(
+                service_name, operation, params
+            ):
+                arguments = json.dumps(params, sort_keys=True, default=str)
+                seen = self._single_items.setdefault(name, set())
+                seen.add(arguments)
+                if len(seen) > self.max_repeats:
+                    problems.append(
+                        (
+                            name,
+                            f"{len(seen)} single-item calls with different "
+                            f"arguments, over the limit of {self.max_repeats}: "
+                            f"{self._describe(name)}.  Batch these lookups with "
+                            "prefetch_related(), or Manager.load() inside "
+                            "Manager.batch()",
+                        )
+                    )
+            problems = [p for p in problems if p[0] not in self._reported]
+            self._reported.update(kind for kind, _ in problems)
+        for _, message in problems:
+            if self.action == "raise":
+                raise CallBudgetExceededError(message)
+            warnings.warn(message, CallBudgetWarning, stacklevel=2)
+
+    def _describe(self, name: str) -> str:
+        """
+        Describe an operation's calls and where most of them came from.  Call
+        with the lock held.
+
+        Args:
+            name: The ``service.operation``.
+
+        Returns:
+            A human readable summary.
+
+        """
+        (caller, source, location), count = self.origins[name].most_common(1)[0]
+        parts = [f"{name} x{self.operations[name]}"]
+        if source and source != caller:
+            parts.append(f"from {source}")
+        if caller:
+            parts.append(f"via {caller}")
+        if location:
+            parts.append(f"at {location}")
+        if count != self.operations[name]:
+            parts.append(f"({count} of them)")
+        return " ".join(parts)
+
+
+@contextmanager
+def call_budget(
+    max_calls: int | None = None,
+    *,
+    max_repeats: int | None = 10,
+    action: Literal["raise", "warn"] = "raise",
+) -> Iterator[CallBudget]:
+    """
+    Limit the AWS calls made inside a block.
+
+    Budgets nest; every active budget counts each call.  Calls made on
+    worker threads that copy the caller's context, like the ones
+    :py:func:`botocraft.hydration.hydrate` starts, count too.
+
+    Args:
+        max_calls: The most AWS calls allowed, or ``None`` for no limit.
+
+    Keyword Args:
+        max_repeats: The most times one operation may be called with
+            different single-item arguments, or ``None`` for no limit.
+        action: ``"raise"`` to raise :py:class:`CallBudgetExceededError`,
+            or ``"warn"`` to warn with :py:class:`CallBudgetWarning`.
+
+    Raises:
+        RuntimeError: If the ``instrumentation.enabled`` setting is off, so
+            no call would be counted.
+
+    Yields:
+        The :py:class:`CallBudget`, to inspect the calls made.
+
+    """
+    from botocraft.instrumentation import attributing
+
+    if not attributing():
+        msg = (
+            "call_budget() counts calls through botocraft's instrumentation, "
+            "but the instrumentation.enabled setting is off"
+        )
+        raise RuntimeError(msg)
+    budget = CallBudget(max_calls, max_repeats=max_repeats, action=action)
+    token = _BUDGETS.set((*_BUDGETS.get(), budget))
+    try:
+        yield budget
+    finally:
+        _BUDGETS.reset(token)
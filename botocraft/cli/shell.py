@@ -1,10 +1,33 @@
+import code
 import importlib.util
-import subprocess
-import sys
+from typing import Any
 
 from .cli import cli
 
 
+class ServicesNamespace(dict):
+    """
+    The shell's namespace: names not yet defined in the shell are looked up
+    in :py:mod:`botocraft.services`.
+
+    This works like ``from botocraft.services import *``, except that a
+    service module is only imported when one of its names is first used, so
+    the shell starts without importing every service.
+    """
+
+    def __missing__(self, name: str) -> Any:
+        import botocraft.services
+        from botocraft.services._index import NAMES
+
+        if name not in NAMES:
+            # Not ours: fall through to builtins, or NameError
+            raise KeyError(name)
+        value = getattr(botocraft.services, name)
+        # Keep it, so functions defined in the shell find it too
+        self[name] = value
+        return value
+
+
 @cli.command(
     short_help="Run an interactive python shell with all services loaded", name="shell"
 )
@@ -12,16 +35,17 @@ def shell_command():
     """
     Start an interactive Python shell with preloaded imports.
     """
-    # Import botocraft.services
-    preload_command = "from botocraft.services import *; import boto3"
+    import boto3
+
+    namespace = ServicesNamespace(__name__="__main__", boto3=boto3)
 
     # Check if IPython is installed
     ipython_installed = importlib.util.find_spec("IPython") is not None
 
     if ipython_installed:
-        # If IPython is installed, start IPython with the preloaded command
-        subprocess.run(["ipython", "-i", "-c", preload_command], check=False)
+        import IPython
+
+        IPython.start_ipython(argv=[], user_ns=namespace)
     else:
-        # If IPython is not installed, start the default Python shell with the
-        # preloaded command
-        subprocess.run([sys.executable, "-i", "-c", preload_command], check=False)
+        # If IPython is not installed, start the default Python shell
+        code.interact(local=namespace)
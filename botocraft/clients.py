@@ -0,0 +1,452 @@
+"""Process-wide pools for boto3 clients and botocraft managers."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+import boto3
+
+from botocraft.instrumentation import instrumentation
+from botocraft.ratelimit import rate_limiter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from botocore.config import Config
+
+    from botocraft.services.abstract import Boto3ModelManager
+
+#: Guards creation of the boto3 default session.
+_DEFAULT_SESSION_LOCK = threading.Lock()
+#: Session bound by :py:func:`using_session` for the current thread or task.
+_SCOPED_SESSION: ContextVar[boto3.session.Session | None] = ContextVar(
+    "botocraft_scoped_session", default=None
+)
+
+
+def default_session() -> boto3.session.Session:
+    """
+    Return the process-wide boto3 default session, creating it if needed.
+
+    This is the same session :py:func:`boto3.client` uses, so clients built
+    from it and clients built by plain ``boto3.client(...)`` calls share
+    credential and endpoint resolution.
+
+    Returns:
+        The boto3 default session.
+
+    """
+    session = boto3.DEFAULT_SESSION
+    if session is None:
+        with _DEFAULT_SESSION_LOCK:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            session = boto3.DEFAULT_SESSION
+    return session  # type: ignore[return-value]
+
+
+def scoped_session() -> boto3.session.Session | None:
+    """
+    Return the session bound by :py:func:`using_session`, if any.
+
+    Returns:
+        The bound session, or ``None`` outside a ``using_session`` block.
+
+    """
+    return _SCOPED_SESSION.get()
+
+
+def current_session() -> boto3.session.Session:
+    """
+    Return the session managers should use when none is given explicitly.
+
+    This is the session bound by the innermost :py:func:`using_session` block
+    in the current thread or asyncio task, falling back to
+    :py:func:`default_session`.
+
+    Returns:
+        The boto3 session in scope.
+
+    """
+    return _SCOPED_SESSION.get() or default_session()
+
+
+@contextmanager
+def using_session(
+    session: boto3.session.Session | None,
+) -> Iterator[boto3.session.Session]:
+    """
+    Bind ``session`` as the session for ``Model.objects`` within a block.
+
+    The binding lives in a :py:class:`contextvars.ContextVar`, so it only
+    affects the current thread or asyncio task.  Worker threads do not inherit
+    it; enter ``using_session`` inside the worker, or run the worker through
+    :py:func:`contextvars.copy_context`.
+
+    Example:
+        .. code-block:: python
+
+            with using_session(prod_session):
+                clusters = Cluster.objects.list()
+
+    Args:
+        session: The session to bind.  ``None`` falls back to the default
+            session.
+
+    Yields:
+        The session now in scope.
+
+    """
+    token = _SCOPED_SESSION.set(session)
+    try:
+        yield current_session()
+    finally:
+        _SCOPED_SESSION.reset(token)
+
+
+def _config_key(config: Config | None) -> tuple[tuple[str, str], ...] | None:
+    """
+    Build a hashable key for a botocore ``Config``.
+
+    Two configs with the same user-supplied options produce the same key, so
+    callers that build equivalent configs on every call still share a client.
+
+    Args:
+        config: The botocore config, if any.
+
+    Returns:
+        A hashable representation of the config, or ``None``.
+
+    """
+    if config is None:
+        return None
+    options = getattr(config, "_user_provided_options", None) or {}
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters describing how well a pool is being reused.
+
+    Args:
+        hits: Lookups served from the pool.
+        misses: Lookups that had to build a new entry.
+        evictions: Entries dropped because the pool was full.
+        size: Number of entries currently held.
+
+    """
+
+    #: Lookups served from the pool.
+    hits: int = 0
+    #: Lookups that had to build a new entry.
+    misses: int = 0
+    #: Entries dropped because the pool was full.
+    evictions: int = 0
+    #: Number of entries currently held.
+    size: int = 0
+
+
+class _LRUPool:
+    """
+    A thread-safe, bounded least-recently-used map.
+
+    Entries keep a strong reference to the session they were built for, so
+    the ``id()`` used in the key cannot be recycled while the entry is live.
+    The pool lock is only held to read and insert entries.  Entries are built
+    outside it, under a lock for their key, so lookups that hit are never held
+    up by a slow build, while threads racing on the same key still all get the
+    same entry.
+
+    Args:
+        max_size: Maximum number of entries to keep, or ``None`` to read the
+            limit from :py:class:`botocraft.config.BotocraftSettings` on first
+            use.
+
+    """
+
+    #: Name of the :py:class:`botocraft.config.PoolSettings` field that holds
+    #: this pool's default size.
+    size_setting: str
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[Any, ...], tuple[Any, Any]] = OrderedDict()
+        #: Locks for the keys being built, so each key is built once
+        self._building: dict[tuple[Any, ...], threading.Lock] = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum number of entries this pool holds.
+        """
+        if self._max_size is None:
+            from botocraft.config import BotocraftSettings
+
+            self._max_size = getattr(BotocraftSettings().pool, self.size_setting)
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    def _get(self, key: tuple[Any, ...], session: Any) -> Any | None:
+        """
+        Return the pooled value for ``key``, counting a hit, if it is held.
+
+        Call with the pool lock held.
+
+        Args:
+            key: The pool key.
+            session: The session the value belongs to.
+
+        Returns:
+            The pooled value, or ``None``.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not session:
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def _lookup(self, key: tuple[Any, ...], session: Any, factory) -> Any:
+        """
+        Return the pooled value for ``key``, building it with ``factory``.
+
+        Args:
+            key: The pool key.
+            session: The session the value belongs to.
+            factory: Zero-argument callable that builds the value on a miss.
+
+        Returns:
+            The pooled value.
+
+        """
+        with self._lock:
+            value = self._get(key, session)
+            if value is not None:
+                return value
+            building = self._building.setdefault(key, threading.Lock())
+        with building:
+            with self._lock:
+                # Another thread may have built it while we waited
+                value = self._get(key, session)
+                if value is not None:
+                    return value
+                self._misses += 1
+            try:
+                value = factory()
+                with self._lock:
+                    self._entries[key] = (session, value)
+                    self._entries.move_to_end(key)
+                    self._evict()
+            finally:
+                with self._lock:
+                    if self._building.get(key) is building:
+                        del self._building[key]
+            return value
+
+    def _evict(self) -> None:
+        """
+        Drop least-recently-used entries until the pool fits ``max_size``.
+        """
+        while len(self._entries) > max(self.max_size, 0):
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop every pooled entry and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> PoolStats:
+        """
+        Return the current reuse counters for this pool.
+
+        Returns:
+            A snapshot of the pool counters.
+
+        """
+        with self._lock:
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ClientPool(_LRUPool):
+    """
+    Share boto3 clients keyed by session, service, region and config.
+
+    botocore clients are thread-safe and expensive to build, so every manager
+    that talks to the same service through the same session should reuse one.
+    Building clients from one boto3 session is not thread-safe, so clients
+    for the same session are built one at a time; clients for different
+    sessions are built concurrently.
+    """
+
+    size_setting = "max_clients"
+
+    def __init__(self, max_size: int | None = None) -> None:
+        super().__init__(max_size)
+        #: One lock per session, held while building a client from it
+        self._session_locks: WeakKeyDictionary[Any, threading.Lock] = (
+            WeakKeyDictionary()
+        )
+
+    def _session_lock(self, session: boto3.session.Session) -> threading.Lock:
+        """
+        Return the lock held while building clients from ``session``.
+
+        Args:
+            session: The boto3 session.
+
+        Returns:
+            The session's lock.
+
+        """
+        with self._lock:
+            lock = self._session_locks.get(session)
+            if lock is None:
+                lock = self._session_locks[session] = threading.Lock()
+            return lock
+
+    def get(
+        self,
+        service_name: str,
+        session: boto3.session.Session | None = None,
+        region_name: str | None = None,
+        config: Config | None = None,
+    ) -> Any:
+        """
+        Return a pooled boto3 client, building it on first use.
+
+        New clients are rate limited by
+        :py:data:`botocraft.ratelimit.rate_limiter` when the
+        ``rate_limit.enabled`` setting is on, and report their calls to
+        :py:data:`botocraft.instrumentation.instrumentation` when the
+        ``instrumentation.enabled`` setting is on.
+
+        Args:
+            service_name: The boto3 service name, e.g. ``ecs``.
+
+        Keyword Args:
+            session: The boto3 session to build the client from.  Defaults to
+                :py:func:`current_session`.
+            region_name: Region override for the client.
+            config: botocore config for the client.
+
+        Returns:
+            A boto3 client.
+
+        """
+        session = session or current_session()
+        key = (id(session), service_name, region_name, _config_key(config))
+
+        def factory() -> Any:
+            kwargs: dict[str, Any] = {}
+            if region_name is not None:
+                kwargs["region_name"] = region_name
+            if config is not None:
+                kwargs["config"] = config
+            with self._session_lock(session):
+                if session is boto3.DEFAULT_SESSION:
+                    # Go through the module-level helper so code that patches
+                    # ``boto3.client`` sees the call.
+                    client = boto3.client(service_name, **kwargs)  # type: ignore[call-overload]
+                else:
+                    client = session.client(service_name, **kwargs)  # type: ignore[call-overload]
+            rate_limiter.install(client, service_name)
+            instrumentation.install(client, service_name)
+            return client
+
+        return self._lookup(key, session, factory)
+
+
+class ManagerPool(_LRUPool):
+    """
+    Share :py:class:`~botocraft.services.abstract.Boto3ModelManager` instances
+    keyed by manager class and session.
+
+    This is what backs ``Model.objects`` and ``manager.using(session)``.
+    Pooled managers are never rebound to another session, so one instance can
+    be used from any number of threads at once.
+    """
+
+    size_setting = "max_managers"
+
+    def get(
+        self,
+        manager_class: type[Boto3ModelManager],
+        session: boto3.session.Session | None = None,
+    ) -> Boto3ModelManager:
+        """
+        Return the pooled manager of ``manager_class`` bound to ``session``.
+
+        Args:
+            manager_class: The manager class to look up.
+
+        Keyword Args:
+            session: The boto3 session the manager should use.  Defaults to
+                :py:func:`current_session`.
+
+        Returns:
+            A manager instance.
+
+        """
+        session = session or current_session()
+        key = (manager_class, id(session))
+
+        def factory() -> Boto3ModelManager:
+            if session is boto3.DEFAULT_SESSION and _SCOPED_SESSION.get() is None:
+                # Subclasses that override ``__init__`` without a ``session``
+                # argument still work for the default session.
+                manager = manager_class()
+            else:
+                manager = manager_class(session=session)
+            # Pooled managers are shared, so bind them to the session they are
+            # pooled under rather than whichever session is in scope when
+            # they are first used
+            manager.session = session
+            return manager
+
+        return self._lookup(key, session, factory)
+
+
+#: The process-wide boto3 client pool.
+client_pool = ClientPool()
+#: The process-wide manager pool.
+manager_pool = ManagerPool()
+
+
+def clear_pools() -> None:
+    """
+    Drop every pooled client and manager.
+
+    Call this after rotating credentials on the default session, or between
+    tests that patch :py:func:`boto3.client`.
+    """
+    manager_pool.clear()
+    client_pool.clear()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +34,212 @@ class TunnelSettings(BaseModel):
     ready_timeout_seconds: int = 10
 
 
+class PoolSettings(BaseModel):
+    """
+    Store sizing for the process-wide client and manager pools.
+
+    Args:
+        max_clients: Maximum number of boto3 clients kept alive at once.
+        max_managers: Maximum number of manager instances kept alive at once.
+
+    """
+
+    #: Maximum number of boto3 clients kept in the shared client pool.
+    max_clients: int = 128
+    #: Maximum number of managers kept in the shared manager pool.
+    max_managers: int = 256
+
+
+class HydrationSettings(BaseModel):
+    """
+    Store concurrency settings for batch-describe hydration.
+
+    Args:
+        max_workers: Maximum number of batch-describe calls in flight at once.
+
+    """
+
+    #: Maximum number of batch-describe calls in flight at once, across the
+    #: whole process.
+    max_workers: int = 8
+
+
+class IdentityMapSettings(BaseModel):
+    """
+    Store bounds for identity maps of models fetched with ``get()``.
+
+    Args:
+        enabled: Whether every session gets a process-wide identity map.
+        ttl_seconds: How long a fetched model is reused before it is fetched
+            again.
+        max_size: Maximum number of entries kept per identity map.
+
+    """
+
+    #: Whether ``get()`` consults a process-wide identity map per session.
+    #: When ``False``, only :py:func:`botocraft.services.identity.identity_map`
+    #: blocks use one.
+    enabled: bool = False
+    #: Seconds a fetched model is reused before it is fetched again.
+    ttl_seconds: float = 60.0
+    #: Maximum number of entries kept in one identity map.
+    max_size: int = 4096
+
+
+class CacheSettings(BaseModel):
+    """
+    Store settings for the manager ``get``/``list`` response cache.
+
+    Args:
+        backend: Which cache backend to use: ``memory``, ``sqlite`` or ``none``.
+        ttl_seconds: Default number of seconds a cached response is served.
+        ttls: Per-operation TTL overrides, keyed by ``Manager.method`` (e.g.
+            ``ClusterManager.get``), manager class name, or service name.
+        max_size: Maximum number of cached responses.
+        path: SQLite database file for the ``sqlite`` backend.
+
+    """
+
+    #: Which response cache backend to use.  ``none`` disables caching.
+    backend: Literal["memory", "sqlite", "none"] = "none"
+    #: Default number of seconds a cached response is served.
+    ttl_seconds: float = 30.0
+    #: Per-operation TTL overrides in seconds.  Keys are ``Manager.method``,
+    #: a manager class name, or a boto3 service name, most specific first.
+    #: A TTL of ``0`` disables caching for that operation.
+    ttls: dict[str, float] = {}
+    #: Maximum number of cached responses, least recently used dropped first.
+    max_size: int = 1024
+    #: SQLite database file used by the ``sqlite`` backend.
+    path: str = "~/.botocraft-cache.sqlite3"
+
+
+class BatchingSettings(BaseModel):
+    """
+    Store settings for batching ``get()`` calls into ``get_many()`` calls.
+
+    Args:
+        window_seconds: How long a ``get()`` waits for concurrent ``get()``
+            calls to batch with.  ``0`` turns window batching off.
+
+    """
+
+    #: Seconds a ``get()`` waits for concurrent ``get()`` calls on the same
+    #: manager to batch with.  ``0`` turns window batching off; ``batch()``
+    #: blocks still batch.
+    window_seconds: float = 0.0
+
+
+class RateLimitSettings(BaseModel):
+    """
+    Store settings for the adaptive per-operation AWS rate limiter.
+
+    Args:
+        enabled: Whether pooled clients wait for a token before each call.
+        rate: Default calls per second allowed for each operation.
+        rates: Per-operation rate ceilings, keyed by ``service.operation``
+            (e.g. ``ec2.describe_instances``) or service name.
+        burst: Calls an idle operation may make back to back.
+        min_rate: Calls per second the rate never shrinks below.
+        decrease_factor: What the rate is multiplied by on throttling.
+        increase: Calls per second added back after each successful call.
+        cooldown_seconds: Throttling errors within this many seconds of the
+            last decrease do not shrink the rate again.
+
+    """
+
+    #: Whether pooled clients wait for a token before each call.
+    enabled: bool = False
+    #: Default calls per second allowed for each operation.
+    rate: float = 20.0
+    #: Per-operation rate ceilings in calls per second.  Keys are
+    #: ``service.operation`` with the boto3 method name, or a boto3 service
+    #: name, most specific first.
+    rates: dict[str, float] = {}
+    #: Calls an idle operation may make back to back.
+    burst: float = 10
+    #: Calls per second the rate never shrinks below.
+    min_rate: float = 0.5
+    #: What the rate is multiplied by when a call is throttled.
+    decrease_factor: float = 0.5
+    #: Calls per second added back after each successful call.
+    increase: float = 0.1
+    #: Seconds after a decrease during which more throttling is not counted
+    #: again.
+    cooldown_seconds: float = 1.0
+
+
+class InstrumentationSettings(BaseModel):
+    """
+    Store settings for instrumentation of the AWS calls botocraft makes.
+
+    Args:
+        enabled: Whether pooled clients report their calls to
+            :py:func:`botocraft.stats`.
+        opentelemetry: Whether calls are also recorded as OpenTelemetry
+            metrics when the ``opentelemetry`` package is installed.
+
+    """
+
+    #: Whether pooled clients report their calls to :py:func:`botocraft.stats`.
+    enabled: bool = True
+    #: Whether calls are also recorded as OpenTelemetry metrics when the
+    #: ``opentelemetry`` package is installed.
+    opentelemetry: bool = True
+
+
+class ResponseSettings(BaseModel):
+    """
+    Store settings for building models from AWS responses.
+
+    Args:
+        validation: Whether an AWS response the models reject raises a
+            validation error, or is built without validation because
+            botocore has already parsed and typed the response.
+        lazy: Whether nested models in AWS responses are built the first time
+            they are read, rather than up front.  Lazy models are not
+            validated.
+        deduplicate: Whether to intern low-cardinality strings and share
+            equal frozen models among the models built from each AWS
+            response.
+        intern_fields: Field names, matched without regard to case, whose
+            string values are interned when deduplicating.  Fields typed as
+            enums are always interned.
+
+    """
+
+    #: Whether AWS responses the models reject raise a validation error.
+    validation: bool = True
+    #: Whether nested models in AWS responses are built on first access.
+    lazy: bool = False
+    #: Whether to intern low-cardinality strings and share equal frozen
+    #: models among the models built from each AWS response.
+    deduplicate: bool = False
+    #: Fields whose string values repeat across a large inventory, interned
+    #: when deduplicating on top of every enum-typed field.
+    intern_fields: list[str] = [
+        "AvailabilityZone",
+        "AvailabilityZoneId",
+        "Region",
+        "RegionName",
+        "InstanceType",
+        "ImageId",
+        "OwnerId",
+        "VpcId",
+        "SubnetId",
+        "GroupId",
+        "GroupName",
+        "Key",
+        "clusterArn",
+        "containerInstanceArn",
+        "taskDefinitionArn",
+        "capacityProviderName",
+        "group",
+        "platformVersion",
+        "platformFamily",
+    ]
+
+
 class BotocraftSettings(BaseSettings):
     """
     Store env-backed and TOML-backed runtime configuration for ``botocraft``.
@@ -50,11 +257,35 @@ class BotocraftSettings(BaseSettings):
 
     Args:
         tunnel: Nested tunnel-aware connection settings.
+        pool: Nested client and manager pool settings.
+        hydration: Nested batch-describe hydration settings.
+        identity_map: Nested identity map settings.
+        cache: Nested response cache settings.
+        batching: Nested ``get()`` batching settings.
+        rate_limit: Nested adaptive rate limiter settings.
+        instrumentation: Nested API call instrumentation settings.
+        responses: Nested AWS response parsing settings.
 
     """
 
     #: Runtime settings that control tunnel-aware endpoint resolution.
     tunnel: TunnelSettings = TunnelSettings()
+    #: Runtime settings that size the shared client and manager pools.
+    pool: PoolSettings = PoolSettings()
+    #: Runtime settings that control concurrent ARN-to-model hydration.
+    hydration: HydrationSettings = HydrationSettings()
+    #: Runtime settings that bound the identity maps used by ``get()``.
+    identity_map: IdentityMapSettings = IdentityMapSettings()
+    #: Runtime settings that configure the manager response cache.
+    cache: CacheSettings = CacheSettings()
+    #: Runtime settings that control batching ``get()`` into ``get_many()``.
+    batching: BatchingSettings = BatchingSettings()
+    #: Runtime settings for the adaptive per-operation rate limiter.
+    rate_limit: RateLimitSettings = RateLimitSettings()
+    #: Runtime settings for instrumentation of AWS API calls.
+    instrumentation: InstrumentationSettings = InstrumentationSettings()
+    #: Runtime settings for building models from AWS responses.
+    responses: ResponseSettings = ResponseSettings()
 
     #: Pydantic settings configuration for env-backed and nested values.
     model_config = SettingsConfigDict(
@@ -115,17 +115,14 @@ def _bind_manager_session(manager: Any, session: boto3.session.Session | None) -
         session: Session to bind, if any.
 
     Returns:
-        Same manager instance with session applied when supported.
-
-    Side Effects:
-        Mutates manager session/client state when a session is supplied.
+        A manager bound to ``session``.  Managers that support ``using`` return
+        a pooled manager for that session; compatible fakes are mutated in place.
 
     """
     if session is None:
         return manager
     if hasattr(manager, "using"):
-        manager.using(session)
-        return manager
+        return manager.using(session)
     manager.session = session
     return manager
 
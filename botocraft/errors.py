@@ -0,0 +1,19 @@
+"""
+The AWS error codes botocraft treats specially.
+"""
+
+#: Error codes AWS services use to signal request throttling.
+THROTTLING_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "SlowDown",
+        "EC2ThrottledException",
+    }
+)
@@ -0,0 +1,221 @@
+"""
+Concurrent hydration of identifiers into models through batch-describe APIs.
+
+Many AWS list operations return only identifiers (ARNs, names, IDs), and the
+matching describe operation accepts a limited number of identifiers per call.
+:py:func:`hydrate` splits the identifiers into chunks no larger than the
+operation's limit, runs the chunks over a bounded thread pool shared by the
+whole process, and returns the results in the order of the input identifiers.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from botocraft.config import HydrationSettings
+
+T = TypeVar("T")
+
+#: Maximum identifiers accepted per call by the operations mixins call
+#: directly, keyed by ``(service, operation)``.  The limit of a manager's
+#: ``get_many()`` is its ``get_many_batch_size``, generated from the
+#: ``batch_size`` in the service's ``managers.yml``.
+BATCH_LIMITS: dict[tuple[str, str], int] = {
+    ("ecs", "describe_task_definition"): 1,
+    ("codebuild", "batch_get_projects"): 100,
+    ("codebuild", "batch_get_builds"): 100,
+    ("codebuild", "batch_get_build_batches"): 100,
+    ("codebuild", "batch_get_fleets"): 100,
+    ("codebuild", "batch_get_report_groups"): 100,
+    ("codebuild", "batch_get_reports"): 100,
+    ("codebuild", "batch_get_sandboxes"): 100,
+    ("codepipeline", "get_pipeline"): 1,
+}
+
+#: Marks the threads of the shared hydration pool.
+_worker = threading.local()
+#: The shared hydration pool, created on first use.
+_EXECUTOR: ThreadPoolExecutor | None = None
+#: Guards creation of :py:data:`_EXECUTOR`.
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def batch_limit(service_name: str, operation: str) -> int:
+    """
+    Return the maximum identifiers ``operation`` accepts in one call.
+
+    Args:
+        service_name: The boto3 service name, e.g. ``ecs``.
+        operation: The boto3 client method name, e.g. ``describe_services``.
+
+    Raises:
+        KeyError: If the operation is not in :py:data:`BATCH_LIMITS`.
+
+    Returns:
+        The batch limit for the operation.
+
+    """
+    return BATCH_LIMITS[(service_name, operation)]
+
+
+@lru_cache(maxsize=1)
+def _settings() -> HydrationSettings:
+    """
+    Load the hydration settings once per process.
+
+    Returns:
+        The configured hydration settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().hydration
+
+
+def _mark_worker() -> None:
+    """
+    Mark the current thread as a worker of the shared hydration pool.
+    """
+    _worker.active = True
+
+
+def _executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide hydration thread pool, creating it on first use.
+
+    Returns:
+        The thread pool, sized by the ``hydration.max_workers`` setting.
+
+    """
+    global _EXECUTOR  # noqa: PLW0603
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_settings().max_workers,
+                    thread_name_prefix="botocraft-hydrate",
+                    initializer=_mark_worker,
+                )
+    return _EXECUTOR
+
+
+def hydrate(
+    identifiers: Sequence[T],
+    fetch: Callable[[list[T]], Iterable[Any] | None],
+    *,
+    batch_size: int,
+    max_workers: int | None = None,
+) -> list[Any]:
+    """
+    Turn ``identifiers`` into models by describing them in concurrent chunks.
+
+    ``fetch`` is called once per chunk of at most ``batch_size`` identifiers
+    and should return the models for that chunk (a list, a queryset, or
+    ``None``).  Chunks run on up to ``max_workers`` threads of one thread pool
+    shared by the whole process.  The combined result keeps chunk order, so
+    models come back in the same order as ``identifiers`` as long as ``fetch``
+    preserves order within a chunk.
+
+    When ``hydrate`` is called from a ``fetch`` that is already running on the
+    pool (e.g. ``prefetch_related()`` describing a relationship with a batched
+    ``get_many()``), its chunks run one after another on that thread, so
+    nested hydration never needs more threads than the pool has.
+
+    Throttled calls are retried by botocore, as configured by the client's
+    ``retries`` config; ``hydrate`` does not retry chunks itself.
+
+    The caller's :py:mod:`contextvars` context (including any session bound
+    with :py:func:`botocraft.clients.using_session`) is copied into each
+    worker.
+
+    Example:
+        .. code-block:: python
+
+            services = hydrate(
+                arns,
+                lambda chunk: self.get_many(chunk, cluster=cluster),
+                batch_size=self.get_many_batch_size,
+            )
+
+    Args:
+        identifiers: The identifiers to hydrate.
+        fetch: Callable that describes one chunk of identifiers.
+
+    Keyword Args:
+        batch_size: Maximum identifiers per ``fetch`` call.
+        max_workers: Maximum concurrent ``fetch`` calls.  Defaults to, and is
+            limited by, the ``hydration.max_workers`` setting.
+
+    Returns:
+        The hydrated models, in input order.
+
+    """
+    items = list(identifiers)
+    if not items:
+        return []
+    settings = _settings()
+    chunks = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    workers = min(max_workers or settings.max_workers, len(chunks))
+    if workers <= 1 or getattr(_worker, "active", False):
+        results = [list(fetch(chunk) or []) for chunk in chunks]
+    else:
+        results = _fetch_concurrently(fetch, chunks, workers)
+    return [model for chunk_results in results for model in chunk_results]
+
+
+def _fetch_concurrently(
+    fetch: Callable[[list[T]], Iterable[Any] | None],
+    chunks: list[list[T]],
+    workers: int,
+) -> list[list[Any]]:
+    """
+    Fetch ``chunks`` on ``workers`` tasks of the shared pool.
+
+    Each task takes the next chunk until none are left, so one call never
+    holds more than ``workers`` of the pool's threads, and other callers'
+    chunks are not stuck behind all of this call's.
+
+    Args:
+        fetch: Callable that describes one chunk of identifiers.
+        chunks: The chunks of identifiers.
+        workers: Number of tasks to run.
+
+    Raises:
+        Exception: The first error ``fetch`` raised.  Chunks not yet started
+            are skipped.
+
+    Returns:
+        The results of each chunk, in chunk order.
+
+    """
+    results: list[list[Any]] = [[] for _ in chunks]
+    pending = iter(enumerate(chunks))
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def work() -> None:
+        while not failed.is_set():
+            with lock:
+                index, chunk = next(pending, (None, None))
+            if chunk is None:
+                return
+            try:
+                results[index] = list(fetch(chunk) or [])
+            except BaseException:
+                failed.set()
+                raise
+
+    executor = _executor()
+    futures = [
+        executor.submit(contextvars.copy_context().run, work) for _ in range(workers)
+    ]
+    for future in futures:
+        future.result()
+    return results
@@ -0,0 +1,554 @@
+"""
+Instrumentation of the AWS calls botocraft makes.
+
+Every client built by :py:data:`botocraft.clients.client_pool` reports each
+API call it makes through botocore's event system to the process-wide
+:py:data:`instrumentation`, which keeps per service and operation counters:
+calls, errors, retries, throttles, pages, response bytes and a latency
+histogram.  Each call is also attributed to the botocraft manager method it
+was made for (e.g. ``ServiceManager.list``), even when the call is made on a
+hydration worker thread.
+
+Read the counters with :py:func:`botocraft.stats`, and reset them with
+:py:func:`botocraft.reset_stats`.  When the ``opentelemetry`` package is
+installed, the same measurements are also recorded as OpenTelemetry metrics.
+"""
+
+from __future__ import annotations
+
+import bisect
+import importlib.util
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any
+
+from botocore import xform_name
+
+from botocraft.budget import active_budgets
+from botocraft.errors import THROTTLING_ERROR_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from botocraft.config import InstrumentationSettings
+
+#: Upper bounds, in seconds, of the latency histogram buckets.  A last,
+#: unbounded bucket counts everything slower.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+#: The botocraft manager method the current thread or task is running.
+_CALLER: ContextVar[str | None] = ContextVar("botocraft_caller", default=None)
+
+
+@lru_cache(maxsize=1)
+def _settings() -> InstrumentationSettings:
+    """
+    Load the instrumentation settings once per process.
+
+    Returns:
+        The configured instrumentation settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().instrumentation
+
+
+def attributing() -> bool:
+    """
+    Return whether :py:func:`attributed` methods should claim the AWS calls
+    they make.
+
+    Returns:
+        Whether ``instrumentation.enabled`` is set.
+
+    """
+    return _settings().enabled
+
+
+def attributed(label: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Attribute the AWS calls ``func`` makes to ``label``, unless an outer
+    botocraft method already claimed them.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    every public method its subclasses define.
+
+    Args:
+        label: The caller name, e.g. ``ServiceManager.list``.
+        func: The method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _CALLER.get() is not None:
+            return func(*args, **kwargs)
+        token = _CALLER.set(label)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _CALLER.reset(token)
+
+    return wrapper
+
+
+@dataclass
+class OperationStats:
+    """
+    Counters for the calls made to one AWS operation.
+
+    Args:
+        service: The boto3 service name.
+        operation: The boto3 client method name.
+
+    """
+
+    #: The boto3 service name, e.g. ``ecs``.
+    service: str
+    #: The boto3 client method name, e.g. ``describe_services``.
+    operation: str
+    #: Calls made, each counted once however many times it was retried.
+    calls: int = 0
+    #: Calls that ended in an error.
+    errors: int = 0
+    #: Retried attempts.
+    retries: int = 0
+    #: Attempts that were throttled.
+    throttles: int = 0
+    #: Pages fetched by paginated listings.
+    pages: int = 0
+    #: Response body bytes received.
+    bytes: int = 0
+    #: Total seconds spent in calls, retries included.
+    total_seconds: float = 0.0
+    #: Call counts per :py:data:`LATENCY_BUCKETS` bucket, plus one for slower
+    #: calls.
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    #: Call counts by the botocraft method that made them.
+    callers: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        The mean call latency in seconds.
+        """
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            percent: The percentile, from 0 to 100.
+
+        Returns:
+            The upper bound of the bucket the percentile falls in, or
+            ``inf`` if it is in the last bucket.
+
+        """
+        target = self.calls * percent / 100
+        seen = 0
+        for bound, count in zip(
+            (*LATENCY_BUCKETS, float("inf")), self.latency_buckets, strict=True
+        ):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return 0.0
+
+
+class _OpenTelemetryExporter:
+    """
+    Record call measurements as OpenTelemetry metrics.
+
+    Args:
+        meter: The OpenTelemetry meter to create the instruments on.
+
+    """
+
+    def __init__(self, meter: Any) -> None:
+        self.calls = meter.create_counter(
+            "botocraft.aws.calls", unit="{call}", description="AWS API calls"
+        )
+        self.errors = meter.create_counter(
+            "botocraft.aws.errors", unit="{call}", description="Failed AWS API calls"
+        )
+        self.retries = meter.create_counter(
+            "botocraft.aws.retries", unit="{attempt}", description="Retried attempts"
+        )
+        self.throttles = meter.create_counter(
+            "botocraft.aws.throttles",
+            unit="{attempt}",
+            description="Throttled attempts",
+        )
+        self.pages = meter.create_counter(
+            "botocraft.aws.pages", unit="{page}", description="Pages fetched"
+        )
+        self.bytes = meter.create_counter(
+            "botocraft.aws.response.size", unit="By", description="Response bytes"
+        )
+        self.duration = meter.create_histogram(
+            "botocraft.aws.duration", unit="s", description="AWS API call latency"
+        )
+
+    @staticmethod
+    def attributes(service: str, operation: str, caller: str | None) -> dict[str, str]:
+        """
+        Return the metric attributes for an operation.
+
+        Args:
+            service: The boto3 service name.
+            operation: The boto3 client method name.
+            caller: The botocraft method that made the call, if known.
+
+        Returns:
+            The attributes.
+
+        """
+        attributes = {
+            "rpc.system": "aws-api",
+            "rpc.service": service,
+            "rpc.method": operation,
+        }
+        if caller:
+            attributes["botocraft.method"] = caller
+        return attributes
+
+
+class Instrumentation:
+    """
+    The process-wide API call counters, and the botocore event handlers that
+    feed them.
+    """
+
+    def __init__(self) -> None:
+        self._operations: dict[tuple[str, str], OperationStats] = {}
+        self._lock = threading.Lock()
+        self._exporter: _OpenTelemetryExporter | None = None
+        self._exporter_checked = False
+
+    def install(self, client: Any, service_name: str) -> None:
+        """
+        Instrument every call ``client`` makes, if ``instrumentation.enabled``
+        is set.
+
+        :py:class:`botocraft.clients.ClientPool` calls this on each client it
+        builds.
+
+        Args:
+            client: The boto3 client.
+            service_name: The boto3 service name the client was built for.
+
+        """
+        if not _settings().enabled:
+            return
+        events = client.meta.events
+        for event, handler in (
+            ("before-parameter-build", self._started),
+            ("needs-retry", self._attempted),
+            ("after-call", self._finished),
+            ("after-call-error", self._failed),
+        ):
+            events.register(
+                event,
+                partial(handler, service_name),
+                unique_id=f"botocraft-instrumentation-{event}",
+            )
+
+    def enable_opentelemetry(self, meter: Any = None) -> None:
+        """
+        Record every measurement as an OpenTelemetry metric too.
+
+        This happens on its own when the ``opentelemetry`` package is
+        installed and the ``instrumentation.opentelemetry`` setting is on.
+
+        Args:
+            meter: The meter to record on.  Defaults to the ``botocraft``
+                meter of the global meter provider.
+
+        """
+        if meter is None:
+            from opentelemetry import metrics
+
+            from botocraft import __version__
+
+            meter = metrics.get_meter("botocraft", __version__)
+        self._exporter = _OpenTelemetryExporter(meter)
+        self._exporter_checked = True
+
+    def _export(self) -> _OpenTelemetryExporter | None:
+        """
+        Return the OpenTelemetry exporter, setting it up on first use.
+
+        Returns:
+            The exporter, or ``None`` if OpenTelemetry is not in use.
+
+        """
+        if not self._exporter_checked:
+            self._exporter_checked = True
+            if (
+                _settings().opentelemetry
+                and importlib.util.find_spec("opentelemetry") is not None
+            ):
+                self.enable_opentelemetry()
+        return self._exporter
+
+    def _stats(self, service: str, operation: str) -> OperationStats:
+        """
+        Return the counters for an operation.  Call with the lock held.
+
+        Args:
+            service: The boto3 service name.
+            operation: The boto3 client method name.
+
+        Returns:
+            The operation's counters.
+
+        """
+        key = (service, operation)
+        stats = self._operations.get(key)
+        if stats is None:
+            stats = self._operations[key] = OperationStats(service, operation)
+        return stats
+
+    def _started(
+        self,
+        service_name: str,
+        event_name: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        **_: Any,
+    ) -> None:
+        """
+        Note when a call starts, and which botocraft method it is for, and
+        count it against any active :py:func:`botocraft.budget.call_budget`.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: ``before-parameter-build.<service id>.<OperationName>``.
+            params: The call arguments.
+            context: botocore's per-call request context.
+
+        """
+        caller = _CALLER.get()
+        if context is not None:
+            context["botocraft_started"] = time.perf_counter()
+            context["botocraft_caller"] = caller
+        budgets = active_budgets()
+        if budgets:
+            operation = xform_name(event_name.rsplit(".", 1)[-1])
+            for budget in budgets:
+                budget.record(service_name, operation, params or {}, caller)
+
+    def _attempted(
+        self,
+        service_name: str,
+        event_name: str,
+        response: tuple[Any, dict[str, Any]] | None = None,
+        **_: Any,
+    ) -> None:
+        """
+        Count throttled attempts, including ones botocore retries.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: ``needs-retry.<service id>.<OperationName>``.
+            response: The HTTP response and the parsed response, or ``None``.
+
+        """
+        if response is None:
+            return
+        if response[1].get("Error", {}).get("Code") not in THROTTLING_ERROR_CODES:
+            return
+        operation = xform_name(event_name.rsplit(".", 1)[-1])
+        with self._lock:
+            self._stats(service_name, operation).throttles += 1
+        exporter = self._export()
+        if exporter is not None:
+            exporter.throttles.add(
+                1, exporter.attributes(service_name, operation, _CALLER.get())
+            )
+
+    def _finished(
+        self,
+        service_name: str,
+        event_name: str,
+        http_response: Any = None,
+        parsed: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        **_: Any,
+    ) -> None:
+        """
+        Record a call that got a response.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: ``after-call.<service id>.<OperationName>``.
+            http_response: The botocore HTTP response.
+            parsed: The parsed response.
+            context: botocore's per-call request context.
+
+        """
+        parsed = parsed or {}
+        # Only count bodies botocore already read; never consume a stream.
+        content = getattr(http_response, "_content", None)
+        if isinstance(content, bytes):
+            size = len(content)
+        else:
+            headers = getattr(http_response, "headers", None) or {}
+            size = int(headers.get("content-length") or 0)
+        self._record(
+            service_name,
+            event_name,
+            context,
+            error="Error" in parsed,
+            retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+            size=size,
+        )
+
+    def _failed(
+        self,
+        service_name: str,
+        event_name: str,
+        context: dict[str, Any] | None = None,
+        **_: Any,
+    ) -> None:
+        """
+        Record a call that raised before getting a response.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: ``after-call-error.<service id>.<OperationName>``.
+            context: botocore's per-call request context.
+
+        """
+        self._record(service_name, event_name, context, error=True)
+
+    def _record(  # noqa: PLR0913
+        self,
+        service_name: str,
+        event_name: str,
+        context: dict[str, Any] | None,
+        *,
+        error: bool,
+        retries: int = 0,
+        size: int = 0,
+    ) -> None:
+        """
+        Record a finished call.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: The botocore event, ending in the operation name.
+            context: botocore's per-call request context.
+
+        Keyword Args:
+            error: Whether the call failed.
+            retries: How many times the call was retried.
+            size: Response body bytes.
+
+        """
+        context = context or {}
+        started = context.get("botocraft_started")
+        elapsed = time.perf_counter() - started if started is not None else 0.0
+        caller = context.get("botocraft_caller")
+        operation = xform_name(event_name.rsplit(".", 1)[-1])
+        with self._lock:
+            stats = self._stats(service_name, operation)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.retries += retries
+            stats.bytes += size
+            stats.total_seconds += elapsed
+            stats.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            if caller:
+                stats.callers[caller] = stats.callers.get(caller, 0) + 1
+        exporter = self._export()
+        if exporter is not None:
+            attributes = exporter.attributes(service_name, operation, caller)
+            exporter.calls.add(1, attributes)
+            exporter.duration.record(elapsed, attributes)
+            exporter.bytes.add(size, attributes)
+            if error:
+                exporter.errors.add(1, attributes)
+            if retries:
+                exporter.retries.add(retries, attributes)
+
+    def record_page(self, service_name: str, operation: str) -> None:
+        """
+        Count one page fetched by a paginated listing.
+
+        :py:meth:`botocraft.services.abstract.Boto3ModelManager.paginate`
+        calls this for each page.
+
+        Args:
+            service_name: The boto3 service name.
+            operation: The boto3 client method name.
+
+        """
+        with self._lock:
+            self._stats(service_name, operation).pages += 1
+        exporter = self._export()
+        if exporter is not None:
+            exporter.pages.add(
+                1, exporter.attributes(service_name, operation, _CALLER.get())
+            )
+
+    def stats(self) -> dict[str, OperationStats]:
+        """
+        Return the counters of every operation called so far.
+
+        Returns:
+            Copies of the :py:class:`OperationStats`, keyed by
+            ``service.operation``.
+
+        """
+        with self._lock:
+            return {
+                f"{service}.{operation}": OperationStats(
+                    service=stats.service,
+                    operation=stats.operation,
+                    calls=stats.calls,
+                    errors=stats.errors,
+                    retries=stats.retries,
+                    throttles=stats.throttles,
+                    pages=stats.pages,
+                    bytes=stats.bytes,
+                    total_seconds=stats.total_seconds,
+                    latency_buckets=list(stats.latency_buckets),
+                    callers=dict(stats.callers),
+                )
+                for (service, operation), stats in sorted(self._operations.items())
+            }
+
+    def reset(self) -> None:
+        """
+        Zero every counter.
+        """
+        with self._lock:
+            self._operations.clear()
+
+
+#: The process-wide API call instrumentation used by pooled clients.
+instrumentation = Instrumentation()
@@ -250,7 +250,7 @@ class ModelInvocationLoggingConfigurationModelMixin:
             return None
         from botocraft.services import LogGroup
 
-        return LogGroup.objects.using(self.session).get(
+        return self.relationship_manager(LogGroup).get(
             logGroupIdentifier=log_group_name
         )
 
@@ -268,4 +268,4 @@ class ModelInvocationLoggingConfigurationModelMixin:
             return None
         from botocraft.services import Bucket
 
-        return Bucket.objects.using(self.session).get(BucketName=bucket_name)
+        return self.relationship_manager(Bucket).get(BucketName=bucket_name)
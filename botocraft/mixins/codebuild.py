@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Iterable, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
+from botocraft.hydration import batch_limit, hydrate
 from botocraft.mixins.common import arg_value, coerce_queryset_results
 from botocraft.services.abstract import Boto3Model, PrimaryBoto3ModelQuerySet
 
@@ -15,30 +16,47 @@ if TYPE_CHECKING:
         CommandExecution,
         Fleet,
         Project,
-        Report,
         ReportGroup,
         Sandbox,
         Webhook,
     )
 
-#: Maximum resource names or identifiers to send in a single CodeBuild batch API call.
-_BATCH_CHUNK_SIZE: int = 100
 
-
-def _chunked(items: list[str], size: int) -> Iterable[list[str]]:
+def _batch_get(  # noqa: PLR0913
+    self: Any,
+    model_class: type[Boto3Model],
+    operation: str,
+    request_key: str,
+    response_key: str,
+    identifiers: list[str],
+) -> list[Boto3Model]:
     """
-    Yield fixed-size chunks from a list of strings.
+    Describe identifiers through one of the CodeBuild ``batch_get_*`` APIs.
+
+    Chunks are sized from :py:data:`botocraft.hydration.BATCH_LIMITS`
+    and fetched concurrently by :py:func:`botocraft.hydration.hydrate`.
 
     Args:
-        items: Values to chunk.
-        size: Maximum chunk length.
+        self: The active manager instance with a configured boto3 client.
+        model_class: Model class to build from each response payload.
+        operation: The ``batch_get_*`` client method name.
+        request_key: Request parameter that takes the identifier list.
+        response_key: Response key that holds the described payloads.
+        identifiers: Names, IDs, or ARNs to describe.
 
-    Yields:
-        Consecutive slices no longer than ``size``.
+    Returns:
+        The hydrated models, in identifier order.
 
     """
-    for index in range(0, len(items), size):
-        yield items[index : index + size]
+    method = getattr(self.client, operation)
+
+    def describe(chunk: list[str]) -> list[Boto3Model]:
+        response = method(**{request_key: chunk})
+        return [model_class(**payload) for payload in response.get(response_key) or []]
+
+    return hydrate(
+        identifiers, describe, batch_size=batch_limit("codebuild", operation)
+    )
 
 
 def project_response_to_project(
@@ -96,13 +114,9 @@ def project_names_to_projects(
         names = [item for item in coerce_queryset_results(raw) if isinstance(item, str)]
         if not names:
             return PrimaryBoto3ModelQuerySet([])
-        projects: list[Project] = []
-        for chunk in _chunked(names, _BATCH_CHUNK_SIZE):
-            resp = self.client.batch_get_projects(names=chunk)
-            projects.extend(
-                Project(**project_payload)
-                for project_payload in (resp.get("projects") or [])
-            )
+        projects = _batch_get(
+            self, Project, "batch_get_projects", "names", "projects", names
+        )
         query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", projects))
         self.sessionize(query_set)
         return query_set
@@ -159,12 +173,7 @@ def _hydrate_build_ids(self: Any, ids: list[str]) -> PrimaryBoto3ModelQuerySet:
 
     if not ids:
         return PrimaryBoto3ModelQuerySet([])
-    builds: list[Build] = []
-    for chunk in _chunked(ids, _BATCH_CHUNK_SIZE):
-        resp = self.client.batch_get_builds(ids=chunk)
-        builds.extend(
-            Build(**build_payload) for build_payload in (resp.get("builds") or [])
-        )
+    builds = _batch_get(self, Build, "batch_get_builds", "ids", "builds", ids)
     query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", builds))
     self.sessionize(query_set)
     return query_set
@@ -278,13 +287,9 @@ def _hydrate_build_batch_ids(self: Any, ids: list[str]) -> PrimaryBoto3ModelQuer
 
     if not ids:
         return PrimaryBoto3ModelQuerySet([])
-    batches: list[BuildBatch] = []
-    for chunk in _chunked(ids, _BATCH_CHUNK_SIZE):
-        resp = self.client.batch_get_build_batches(ids=chunk)
-        batches.extend(
-            BuildBatch(**batch_payload)
-            for batch_payload in (resp.get("buildBatches") or [])
-        )
+    batches = _batch_get(
+        self, BuildBatch, "batch_get_build_batches", "ids", "buildBatches", ids
+    )
     query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", batches))
     self.sessionize(query_set)
     return query_set
@@ -404,12 +409,7 @@ def fleet_names_to_fleets(
         names = [item for item in coerce_queryset_results(raw) if isinstance(item, str)]
         if not names:
             return PrimaryBoto3ModelQuerySet([])
-        fleets: list[Fleet] = []
-        for chunk in _chunked(names, _BATCH_CHUNK_SIZE):
-            resp = self.client.batch_get_fleets(names=chunk)
-            fleets.extend(
-                Fleet(**fleet_payload) for fleet_payload in (resp.get("fleets") or [])
-            )
+        fleets = _batch_get(self, Fleet, "batch_get_fleets", "names", "fleets", names)
         query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", fleets))
         self.sessionize(query_set)
         return query_set
@@ -466,13 +466,14 @@ def _hydrate_report_group_arns(self: Any, arns: list[str]) -> PrimaryBoto3ModelQ
 
     if not arns:
         return PrimaryBoto3ModelQuerySet([])
-    groups: list[ReportGroup] = []
-    for chunk in _chunked(arns, _BATCH_CHUNK_SIZE):
-        resp = self.client.batch_get_report_groups(reportGroupArns=chunk)
-        groups.extend(
-            ReportGroup(**group_payload)
-            for group_payload in (resp.get("reportGroups") or [])
-        )
+    groups = _batch_get(
+        self,
+        ReportGroup,
+        "batch_get_report_groups",
+        "reportGroupArns",
+        "reportGroups",
+        arns,
+    )
     query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", groups))
     self.sessionize(query_set)
     return query_set
@@ -517,12 +518,9 @@ def _hydrate_report_arns(self: Any, arns: list[str]) -> PrimaryBoto3ModelQuerySe
 
     if not arns:
         return PrimaryBoto3ModelQuerySet([])
-    reports: list[Report] = []
-    for chunk in _chunked(arns, _BATCH_CHUNK_SIZE):
-        resp = self.client.batch_get_reports(reportArns=chunk)
-        reports.extend(
-            Report(**report_payload) for report_payload in (resp.get("reports") or [])
-        )
+    reports = _batch_get(
+        self, Report, "batch_get_reports", "reportArns", "reports", arns
+    )
     query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", reports))
     self.sessionize(query_set)
     return query_set
@@ -669,13 +667,9 @@ def _hydrate_sandbox_ids(self: Any, ids: list[str]) -> PrimaryBoto3ModelQuerySet
 
     if not ids:
         return PrimaryBoto3ModelQuerySet([])
-    sandboxes: list[Sandbox] = []
-    for chunk in _chunked(ids, _BATCH_CHUNK_SIZE):
-        resp = self.client.batch_get_sandboxes(ids=chunk)
-        sandboxes.extend(
-            Sandbox(**sandbox_payload)
-            for sandbox_payload in (resp.get("sandboxes") or [])
-        )
+    sandboxes = _batch_get(
+        self, Sandbox, "batch_get_sandboxes", "ids", "sandboxes", ids
+    )
     query_set = PrimaryBoto3ModelQuerySet(cast("list[Boto3Model]", sandboxes))
     self.sessionize(query_set)
     return query_set
@@ -1,6 +1,7 @@
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, cast
 
+from botocraft.hydration import batch_limit, hydrate
 from botocraft.mixins.common import arg_value, ensure_queryset
 from botocraft.services.abstract import Boto3Model, PrimaryBoto3ModelQuerySet
 
@@ -93,8 +94,10 @@ def pipeline_summaries_to_pipelines(
         Wrapped list method returning fully hydrated Pipeline models.
 
     Side Effects:
-        Performs one ``GetPipeline`` call per listed pipeline, in order, after
-        ``ListPipelines`` pagination completes.
+        Performs one ``GetPipeline`` call per listed pipeline after
+        ``ListPipelines`` pagination completes.  The calls run concurrently
+        through :py:func:`botocraft.hydration.hydrate`; results keep
+        the listing order.
 
     """
 
@@ -102,16 +105,21 @@ def pipeline_summaries_to_pipelines(
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         hydrate_version = kwargs.get("version")
         results = ensure_queryset(func(self, *args, **kwargs))
-        pipelines: list[Boto3Model] = []
-        for item in results.results:
-            thin = _pipeline_from_payload(item.model_dump(exclude_none=True))
-            pipeline_name = thin.pipelineName
-            if pipeline_name:
-                full = self.get(pipeline_name, version=hydrate_version)
+
+        def describe(chunk: list[Any]) -> list[Boto3Model]:
+            thin = _pipeline_from_payload(chunk[0].model_dump(exclude_none=True))
+            if thin.pipelineName:
+                full = self.get(thin.pipelineName, version=hydrate_version)
                 if full is not None:
-                    pipelines.append(full)
-                    continue
-            pipelines.append(thin)
+                    return [full]
+            return [thin]
+
+        # ``GetPipeline`` describes one pipeline per call.
+        pipelines = hydrate(
+            results.results,
+            describe,
+            batch_size=batch_limit("codepipeline", "get_pipeline"),
+        )
         query_set = PrimaryBoto3ModelQuerySet(pipelines)
         self.sessionize(query_set)
         return query_set
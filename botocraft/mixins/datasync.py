@@ -249,8 +249,7 @@ def datasync_task_execution_from_start(
             return execution
         from botocraft.services.datasync import DataSyncTaskExecutionManager
 
-        manager = DataSyncTaskExecutionManager()
-        manager.session = self.session
+        manager = DataSyncTaskExecutionManager(session=self.session)
         return manager.get(execution_arn)
 
     return wrapper
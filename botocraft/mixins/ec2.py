@@ -13,6 +13,7 @@ from zoneinfo import ZoneInfo
 import psutil
 
 from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+from botocraft.services.trusted import projected_through
 
 if TYPE_CHECKING:
     from botocraft.services import (
@@ -121,23 +122,46 @@ ResourceType = Literal[
 # ----------
 
 
+def _reservation_instances(reservation: "Reservation | dict") -> list:
+    """
+    Return the instances of a reservation, which is a dict when the manager
+    method was given ``raw=True``.
+
+    Args:
+        reservation: The reservation.
+
+    Returns:
+        Its instances.
+
+    """
+    if isinstance(reservation, dict):
+        return reservation.get("Instances") or []
+    return reservation.Instances or []
+
+
 def ec2_instances_only(
     func: Callable[..., "PrimaryBoto3ModelQuerySet"],
 ) -> Callable[..., "PrimaryBoto3ModelQuerySet"]:
     """
     Wraps a boto3 method that returns a list of :py:class:`Reservation` objects
     to return a list of :py:class:`Instance` objects instead.
+
+    Works the same way for ``only=`` projections and ``raw=True`` dicts.
     """
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
-        qs = func(*args, **kwargs)
-        instances: list["Instance"] = []  # noqa: UP037
-        if hasattr(qs, "results") and qs.results:
-            for reservation in qs.results:
-                instances.extend(cast("list[Instance]", reservation.Instances))  # type: ignore[attr-defined]
-            return PrimaryBoto3ModelQuerySet(instances)  # type: ignore[arg-type]
-        return PrimaryBoto3ModelQuerySet([])
+        with projected_through("Instances"):
+            qs = func(*args, **kwargs)
+        if not isinstance(qs, PrimaryBoto3ModelQuerySet):
+            return PrimaryBoto3ModelQuerySet([])
+        # Flatten lazily, so reservations are only fetched as far as the
+        # caller reads instances.
+        return PrimaryBoto3ModelQuerySet(
+            cast("Instance", instance)
+            for reservation in qs
+            for instance in _reservation_instances(reservation)
+        )
 
     return wrapper
 
@@ -152,10 +176,11 @@ def ec2_instance_only(
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> "Instance | None":
-        reservation = func(*args, **kwargs)
+        with projected_through("Instances"):
+            reservation = func(*args, **kwargs)
         if not reservation:
             return None
-        return cast("list[Instance]", reservation.Instances)[0]
+        return cast("list[Instance]", _reservation_instances(reservation))[0]
 
     return wrapper
 
@@ -8,11 +8,11 @@ from collections.abc import Callable
 from functools import cached_property, wraps
 from typing import TYPE_CHECKING, Any, Literal, cast
 
+from botocraft.hydration import batch_limit, hydrate
 from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
 
 if TYPE_CHECKING:
     from botocraft.services import (
-        Cluster,
         Daemon,
         DaemonTaskDefinition,
         DeleteTaskDefinitionsResponse,
@@ -114,17 +114,8 @@ def ecs_services_only(
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         arns = func(self, *args, **kwargs)
-        services = []
-        # We have to do this in batches of 10 because the get_many method,
-        # which uses the boto3 ``describe_services`` method, only accepts 10 ARNs
-        # at a time.
-        for i in range(0, len(arns), 10):
-            services.extend(
-                self.get_many(
-                    arns[i : i + 10], cluster=kwargs["cluster"], include=["TAGS"]
-                ).results
-            )
-        return PrimaryBoto3ModelQuerySet(services)
+        # ``get_many`` describes the ARNs in chunks of 10 itself.
+        return self.get_many(arns, cluster=kwargs["cluster"], include=["TAGS"])
 
     return wrapper
 
@@ -145,16 +136,8 @@ def ecs_clusters_only(
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         arns = func(self, *args, **kwargs)
-        clusters: list[Cluster] = []
-        # We have to do this in batches of 100 because the get_many method,
-        # which uses the boto3 ``describe_clusters`` method, only accepts 100 ARNs
-        # at a time.
-        for i in range(0, len(arns), 100):
-            qs = self.get_many(clusters=arns[i : i + 100], include=["TAGS"])
-            clusters.extend(
-                qs.results if isinstance(qs, PrimaryBoto3ModelQuerySet) else qs.clusters  # type: ignore[arg-type]
-            )
-        return PrimaryBoto3ModelQuerySet(clusters)  # type: ignore[arg-type]
+        # ``get_many`` describes the ARNs in chunks of 100 itself.
+        return self.get_many(clusters=arns, include=["TAGS"])
 
     return wrapper
 
@@ -191,9 +174,12 @@ def ecs_task_definitions_only(
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         identifiers = func(self, *args, **kwargs)
-        responses = [
-            self.get(identifier, include=["TAGS"]) for identifier in identifiers
-        ]
+        # ``describe_task_definition`` only describes one task definition.
+        responses = hydrate(
+            identifiers,
+            lambda chunk: [self.get(chunk[0], include=["TAGS"])],
+            batch_size=batch_limit("ecs", "describe_task_definition"),
+        )
         return PrimaryBoto3ModelQuerySet(responses)
 
     return wrapper
@@ -211,19 +197,10 @@ def ecs_container_instances_only(
     :py:class:`botocraft.services.ecs.ContainerInstance` objects.
     """
 
+    @wraps(func)
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         arns = func(self, *args, **kwargs)
-        container_instances = []
-        for i in range(0, len(arns), 100):
-            _instances = self.get_many(
-                cluster=kwargs["cluster"], containerInstances=arns[i : i + 100]
-            )
-            if isinstance(_instances, PrimaryBoto3ModelQuerySet):
-                _instances = _instances.results
-            # If we got a list of ContainerInstanceBrief objects, we need to convert
-            if _instances:
-                container_instances.extend(_instances)
-        return PrimaryBoto3ModelQuerySet(container_instances)
+        return self.get_many(cluster=kwargs["cluster"], containerInstances=arns)
 
     return wrapper
 
@@ -241,12 +218,8 @@ def ecs_container_instances_tasks_only(
         from botocraft.services.ecs import Task
 
         arns = func(self, *args, **kwargs)
-        tasks: list[Task] = []
-        for i in range(0, len(arns), 100):
-            tasks.extend(
-                cast("TaskManager", Task.objects).get_many(arns[i : i + 100]).results  # type: ignore[arg-type]
-            )
-        return PrimaryBoto3ModelQuerySet(tasks)  # type: ignore[arg-type]
+        manager = cast("TaskManager", Task.objects.using(self.session))
+        return manager.get_many(arns)
 
     return wrapper
 
@@ -274,17 +247,10 @@ def ecs_service_deployments_only(
             for d in func(self, *args, **kwargs)
             if d.serviceDeploymentArn
         ]
-        deployments: list[ServiceDeployment] = []
-        for i in range(0, len(arns), 20):
-            _deployments = cast(
-                "ServiceDeploymentManager", ServiceDeployment.objects
-            ).get_many(arns[i : i + 20])
-            if isinstance(_deployments, PrimaryBoto3ModelQuerySet):
-                _deployments = _deployments.results  # type: ignore[assignment]
-            # If we got a list of ServiceDeploymentBrief objects, we need to convert
-            if _deployments:
-                deployments.extend(_deployments)  # type: ignore[arg-type]
-        return PrimaryBoto3ModelQuerySet(deployments)  # type: ignore[arg-type]
+        manager = cast(
+            "ServiceDeploymentManager", ServiceDeployment.objects.using(self.session)
+        )
+        return manager.get_many(arns)
 
     return wrapper
 
@@ -353,15 +319,8 @@ def ecs_tasks_only(
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         arns = func(self, *args, **kwargs)
-        tasks = []
-        # We have to do this in batches of 100 because the get_many method,
-        # which uses the boto3 ``describe_tasks`` method, only accepts 100 ARNs
-        # at a time.
-        for i in range(0, len(arns), 100):
-            tasks.extend(
-                self.get_many(cluster=kwargs["cluster"], tasks=arns[i : i + 100])
-            )
-        return PrimaryBoto3ModelQuerySet(tasks)  # type: ignore[arg-type]
+        # ``get_many`` describes the ARNs in chunks of 100 itself.
+        return self.get_many(cluster=kwargs["cluster"], tasks=arns)
 
     return wrapper
 
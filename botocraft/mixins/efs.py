@@ -305,7 +305,7 @@ class MountTargetModelMixin:
             QuerySet of EC2 security groups attached to this mount target.
 
         """
-        return self.objects.using(self.session).get_security_groups(  # type: ignore[attr-defined]
+        return self.relationship_manager(type(self)).get_security_groups(  # type: ignore[attr-defined]
             self.MountTargetId
         )
 
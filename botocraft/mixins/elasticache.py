@@ -181,7 +181,7 @@ class CacheClusterModelMixin:
         This is a dictionary of key/value pairs, where the key is the tag name
         and the value is the tag value
         """
-        return self.objects.using(self.session).get_tags(self.arn)  # type: ignore[attr-defined]
+        return self.relationship_manager(type(self)).get_tags(self.arn)  # type: ignore[attr-defined]
 
     def open_connection_target(
         self,
@@ -388,7 +388,7 @@ class ReplicationGroupModelMixin:
         This is a dictionary of key/value pairs, where the key is the tag name
         and the value is the tag value
         """
-        return self.objects.using(self.session).get_tags(self.arn)  # type: ignore[attr-defined]
+        return self.relationship_manager(type(self)).get_tags(self.arn)  # type: ignore[attr-defined]
 
     def open_connection_target(
         self,
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable
 from typing_extensions import Literal
 
 from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+from botocraft.services.trusted import shaped
 
 if TYPE_CHECKING:
     from botocraft.services import (
@@ -54,6 +55,14 @@ def object_list_add_bucket_name_and_tags(
         extras = kwargs.get("Include", [])
         qs = func(self, *args, **kwargs)
         for obj in qs.results:
+            if shaped():
+                # ``only=`` projections are immutable, raw objects are dicts,
+                # and summaries hold no tags
+                if isinstance(obj, dict):
+                    obj["BucketName"] = bucket_name
+                elif hasattr(obj, "BucketName") and not isinstance(obj, tuple):
+                    obj.BucketName = bucket_name
+                continue
             obj.BucketName = bucket_name  # type: ignore[attr-defined]
             if "TAGS" in extras:
                 obj.Tags = S3Object.objects.get_tags(Bucket=obj.BucketName, Key=obj.Key)  # type: ignore[attr-defined]
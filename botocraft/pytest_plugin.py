@@ -0,0 +1,65 @@
+"""
+A pytest plugin that keeps the AWS calls tests make within a budget.
+
+Enable it in your ``conftest.py``:
+
+.. code-block:: python
+
+    pytest_plugins = ["botocraft.pytest_plugin"]
+
+Then either request the ``call_budget`` fixture, which runs the whole test
+inside :py:func:`botocraft.budget.call_budget` and returns the
+:py:class:`~botocraft.budget.CallBudget` so the test can inspect it, or mark
+the test with its limits:
+
+.. code-block:: python
+
+    @pytest.mark.call_budget(max_calls=20, max_repeats=3)
+    def test_service_report():
+        build_service_report("prod")
+
+The marker takes the same arguments as
+:py:func:`botocraft.budget.call_budget`.  Without it, the fixture only catches
+repeated single-item calls.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from botocraft.budget import call_budget as _call_budget
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from botocraft.budget import CallBudget
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "call_budget(max_calls=None, *, max_repeats=10, action='raise'): "
+        "limit the AWS calls the test makes",
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Marked tests get the fixture without having to request it
+    for item in items:
+        if item.get_closest_marker("call_budget") and isinstance(item, pytest.Function):
+            if "call_budget" not in item.fixturenames:
+                item.fixturenames.append("call_budget")
+
+
+@pytest.fixture
+def call_budget(request: pytest.FixtureRequest) -> Iterator[CallBudget]:
+    """
+    Run the test inside a :py:func:`botocraft.budget.call_budget` block.
+    """
+    marker = request.node.get_closest_marker("call_budget")
+    args = marker.args if marker else ()
+    kwargs = marker.kwargs if marker else {}
+    with _call_budget(*args, **kwargs) as budget:
+        yield budget
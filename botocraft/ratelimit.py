@@ -0,0 +1,337 @@
+"""
+Adaptive client-side rate limiting of AWS calls, per service and operation.
+
+Inventory jobs that fan out over many resources can send describe calls
+faster than AWS accepts them, and then spend their time in botocore's
+retries.  With the ``rate_limit.enabled`` setting on, every client built by
+:py:data:`botocraft.clients.client_pool` takes a token from a shared
+:py:class:`TokenBucket` before each HTTP attempt, retries included.
+
+Each bucket adapts its rate the way TCP does (AIMD): a throttling error
+multiplies the rate by ``decrease_factor``, and each successful call adds
+``increase`` calls per second back, up to the configured ceiling.  Buckets
+are keyed by boto3 service name and snake_case operation name (e.g.
+``ec2.describe_instances``), and are shared by every thread and client in
+the process.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
+
+from botocore import xform_name
+
+from botocraft.errors import THROTTLING_ERROR_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from botocraft.config import RateLimitSettings
+
+
+@lru_cache(maxsize=1)
+def _settings() -> RateLimitSettings:
+    """
+    Load the rate limit settings once per process.
+
+    Returns:
+        The configured rate limit settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().rate_limit
+
+
+@dataclass
+class RateStats:
+    """
+    The state of one operation's rate limit.
+
+    Args:
+        rate: The calls per second currently allowed.
+        max_rate: The calls per second the rate recovers to.
+        calls: Calls that took a token.
+        throttles: Throttling errors seen.
+        waited_seconds: Total time callers spent waiting for a token.
+
+    """
+
+    #: The calls per second currently allowed.
+    rate: float
+    #: The calls per second the rate recovers to.
+    max_rate: float
+    #: Calls that took a token.
+    calls: int = 0
+    #: Throttling errors seen.
+    throttles: int = 0
+    #: Total time callers spent waiting for a token.
+    waited_seconds: float = 0.0
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket whose refill rate adapts to throttling.
+
+    Args:
+        max_rate: The calls per second the rate starts at and recovers to.
+
+    Keyword Args:
+        burst: The most tokens an idle bucket holds.
+        min_rate: The rate never shrinks below this.
+        decrease_factor: Multiply the rate by this on throttling.
+        increase: Calls per second added back after each successful call.
+        cooldown_seconds: Throttling errors within this many seconds of the
+            last decrease do not shrink the rate again, so one burst of
+            throttled concurrent calls only counts once.
+        clock: Returns the current time in seconds.
+        sleep: Sleeps for a number of seconds.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_rate: float,
+        *,
+        burst: float = 10,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase: float = 0.1,
+        cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        #: The calls per second the rate recovers to.
+        self.max_rate = max_rate
+        #: The calls per second currently allowed.
+        self.rate = max_rate
+        #: The most tokens an idle bucket holds.
+        self.burst = max(burst, 1)
+        self.min_rate = min(min_rate, max_rate)
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._decreased: float | None = None
+        self._calls = 0
+        self._throttles = 0
+        self._waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens earned since the last refill.  Call with the lock held.
+
+        Args:
+            now: The current time.
+
+        """
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        Returns:
+            The number of seconds spent waiting.
+
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._calls += 1
+                    self._waited += waited
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def record_throttle(self) -> None:
+        """
+        Shrink the rate after a throttling error.
+        """
+        with self._lock:
+            now = self._clock()
+            self._throttles += 1
+            if (
+                self._decreased is not None
+                and now - self._decreased < self.cooldown_seconds
+            ):
+                return
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._decreased = now
+
+    def record_success(self) -> None:
+        """
+        Grow the rate back towards :py:attr:`max_rate` after a successful call.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(self._clock())
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> RateStats:
+        """
+        Return the current rate and counters.
+
+        Returns:
+            A snapshot of the bucket.
+
+        """
+        with self._lock:
+            return RateStats(
+                rate=self.rate,
+                max_rate=self.max_rate,
+                calls=self._calls,
+                throttles=self._throttles,
+                waited_seconds=self._waited,
+            )
+
+
+class RateLimiter:
+    """
+    The process-wide set of :py:class:`TokenBucket` objects, one per service
+    and operation, and the botocore event handlers that use them.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, service_name: str, operation: str) -> TokenBucket:
+        """
+        Return the bucket for an operation, creating it on first use.
+
+        The ceiling comes from the ``rate_limit.rates`` setting, looked up by
+        ``service.operation`` and then by service name, falling back to
+        ``rate_limit.rate``.
+
+        Args:
+            service_name: The boto3 service name, e.g. ``ecs``.
+            operation: The boto3 client method name, e.g. ``describe_tasks``.
+
+        Returns:
+            The shared bucket.
+
+        """
+        key = (service_name, operation)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                settings = _settings()
+                max_rate = settings.rates.get(
+                    f"{service_name}.{operation}",
+                    settings.rates.get(service_name, settings.rate),
+                )
+                bucket = self._buckets[key] = TokenBucket(
+                    max_rate,
+                    burst=settings.burst,
+                    min_rate=settings.min_rate,
+                    decrease_factor=settings.decrease_factor,
+                    increase=settings.increase,
+                    cooldown_seconds=settings.cooldown_seconds,
+                )
+            return bucket
+
+    def install(self, client: Any, service_name: str) -> None:
+        """
+        Rate limit every call ``client`` makes, if ``rate_limit.enabled`` is
+        set.
+
+        :py:class:`botocraft.clients.ClientPool` calls this on each client it
+        builds.
+
+        Args:
+            client: The boto3 client.
+            service_name: The boto3 service name the client was built for.
+
+        """
+        if not _settings().enabled:
+            return
+        events = client.meta.events
+        events.register(
+            "before-send",
+            partial(self._before_send, service_name),
+            unique_id="botocraft-rate-limit-before-send",
+        )
+        events.register(
+            "needs-retry",
+            partial(self._needs_retry, service_name),
+            unique_id="botocraft-rate-limit-needs-retry",
+        )
+
+    def _before_send(self, service_name: str, event_name: str, **_: Any) -> None:
+        """
+        Wait for a token before each HTTP attempt.
+
+        Args:
+            service_name: The boto3 service name.
+            event_name: ``before-send.<service id>.<OperationName>``.
+
+        """
+        operation = xform_name(event_name.rsplit(".", 1)[-1])
+        self.bucket(service_name, operation).acquire()
+
+    def _needs_retry(
+        self,
+        service_name: str,
+        response: tuple[Any, dict[str, Any]] | None = None,
+        operation: Any = None,
+        **_: Any,
+    ) -> None:
+        """
+        Adapt the rate to the outcome of each HTTP attempt.
+
+        Args:
+            service_name: The boto3 service name.
+            response: The HTTP response and the parsed response, or ``None``
+                if the attempt raised.
+            operation: The botocore operation model.
+
+        """
+        if response is None or operation is None:
+            return
+        bucket = self.bucket(service_name, xform_name(operation.name))
+        code = response[1].get("Error", {}).get("Code")
+        if code in THROTTLING_ERROR_CODES:
+            bucket.record_throttle()
+        elif code is None:
+            bucket.record_success()
+
+    def stats(self) -> dict[str, RateStats]:
+        """
+        Return the state of every operation called so far.
+
+        Returns:
+            :py:class:`RateStats` keyed by ``service.operation``.
+
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            f"{service}.{operation}": bucket.stats()
+            for (service, operation), bucket in sorted(buckets.items())
+        }
+
+    def reset(self) -> None:
+        """
+        Forget every bucket, so rates start again from the settings.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+#: The process-wide rate limiter used by pooled clients.
+rate_limiter = RateLimiter()
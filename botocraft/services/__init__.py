@@ -1,35 +1,76 @@
-from .bedrock_runtime import *  # noqa: F401,F403
-from .codebuild import *  # noqa: F401,F403
-from .kinesis import *  # noqa: F401,F403
-from .ssm import *  # noqa: F401,F403
-from .secretsmanager import *  # noqa: F401,F403
-from .kms import *  # noqa: F401,F403
-from .cloudwatch import *  # noqa: F401,F403
-from .s3 import *  # noqa: F401,F403
-from .sesv2 import *  # noqa: F401,F403
-from .datasync import *  # noqa: F401,F403
-from .inspector2 import *  # noqa: F401,F403
-from .opensearch import *  # noqa: F401,F403
-from .ecr import *  # noqa: F401,F403
-from .ecs import *  # noqa: F401,F403
-from .application_autoscaling import *  # noqa: F401,F403
-from .codepipeline import *  # noqa: F401,F403
-from .elb import *  # noqa: F401,F403
-from .schemas import *  # noqa: F401,F403
-from .sqs import *  # noqa: F401,F403
-from .bedrock import *  # noqa: F401,F403
-from .iam import *  # noqa: F401,F403
-from .logs import *  # noqa: F401,F403
-from .docdb import *  # noqa: F401,F403
-from .ses import *  # noqa: F401,F403
-from .events import *  # noqa: F401,F403
-from .autoscaling import *  # noqa: F401,F403
-from .elbv2 import *  # noqa: F401,F403
-from .elasticache import *  # noqa: F401,F403
-from .rds import *  # noqa: F401,F403
-from .codeconnections import *  # noqa: F401,F403
-from .efs import *  # noqa: F401,F403
-from .sts import *  # noqa: F401,F403
-from .acm import *  # noqa: F401,F403
-from .route53 import *  # noqa: F401,F403
-from .ec2 import *  # noqa: F401,F403
+"""
+The botocraft service models and managers.
+
+This file is automatically generated by ``botocraft sync``.  Do not edit it
+directly.
+
+Every public name of every service module can be imported from here, but a
+service module is only imported the first time one of its names is used, so
+``from botocraft.services import Queue`` imports just
+:py:mod:`botocraft.services.sqs`.  :py:mod:`botocraft.services._index` lists
+the module each name is imported from.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from ._index import NAMES
+
+if TYPE_CHECKING:
+    from .bedrock_runtime import *  # noqa: F403
+    from .codebuild import *  # noqa: F403
+    from .kinesis import *  # noqa: F403
+    from .ssm import *  # noqa: F403
+    from .secretsmanager import *  # noqa: F403
+    from .kms import *  # noqa: F403
+    from .cloudwatch import *  # noqa: F403
+    from .s3 import *  # noqa: F403
+    from .sesv2 import *  # noqa: F403
+    from .datasync import *  # noqa: F403
+    from .inspector2 import *  # noqa: F403
+    from .opensearch import *  # noqa: F403
+    from .ecr import *  # noqa: F403
+    from .ecs import *  # noqa: F403
+    from .application_autoscaling import *  # noqa: F403
+    from .codepipeline import *  # noqa: F403
+    from .elb import *  # noqa: F403
+    from .schemas import *  # noqa: F403
+    from .sqs import *  # noqa: F403
+    from .bedrock import *  # noqa: F403
+    from .iam import *  # noqa: F403
+    from .logs import *  # noqa: F403
+    from .docdb import *  # noqa: F403
+    from .ses import *  # noqa: F403
+    from .events import *  # noqa: F403
+    from .autoscaling import *  # noqa: F403
+    from .elbv2 import *  # noqa: F403
+    from .elasticache import *  # noqa: F403
+    from .rds import *  # noqa: F403
+    from .codeconnections import *  # noqa: F403
+    from .efs import *  # noqa: F403
+    from .sts import *  # noqa: F403
+    from .acm import *  # noqa: F403
+    from .route53 import *  # noqa: F403
+    from .ec2 import *  # noqa: F403
+
+__all__ = list(NAMES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in NAMES:
+        value = getattr(import_module(NAMES[name]), name)
+    else:
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg) from None
+    # Later lookups find the name without calling us
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(NAMES))
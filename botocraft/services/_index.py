@@ -0,0 +1,2919 @@
+"""
+The module each name in :py:mod:`botocraft.services` is imported from.
+
+This file is automatically generated by ``botocraft sync``.  Do not edit it
+directly.
+"""
+
+#: The service modules, in the order their names were looked up.
+MODULES: tuple[str, ...] = (
+    "bedrock_runtime",
+    "codebuild",
+    "kinesis",
+    "ssm",
+    "secretsmanager",
+    "kms",
+    "cloudwatch",
+    "s3",
+    "sesv2",
+    "datasync",
+    "inspector2",
+    "opensearch",
+    "ecr",
+    "ecs",
+    "application_autoscaling",
+    "codepipeline",
+    "elb",
+    "schemas",
+    "sqs",
+    "bedrock",
+    "iam",
+    "logs",
+    "docdb",
+    "ses",
+    "events",
+    "autoscaling",
+    "elbv2",
+    "elasticache",
+    "rds",
+    "codeconnections",
+    "efs",
+    "sts",
+    "acm",
+    "route53",
+    "ec2",
+)
+
+#: The import path of the module each name is imported from.
+NAMES: dict[str, str] = {
+    "ACMCertificate": "botocraft.services.acm",
+    "ACMCertificateManager": "botocraft.services.acm",
+    "ACMHttpRedirect": "botocraft.services.acm",
+    "ACMRenewalSummary": "botocraft.services.acm",
+    "ACMResourceRecord": "botocraft.services.acm",
+    "AIMLOptionsInput": "botocraft.services.opensearch",
+    "AIMLOptionsOutput": "botocraft.services.opensearch",
+    "AIMLOptionsStatus": "botocraft.services.opensearch",
+    "AMI": "botocraft.services.ec2",
+    "AMIManager": "botocraft.services.ec2",
+    "AMIManagerMixin": "botocraft.mixins.ec2",
+    "AMIModelMixin": "botocraft.mixins.ec2",
+    "AbstractEventFactory": "botocraft.eventbridge.factory",
+    "AcceleratorCountRequest": "botocraft.services.ec2",
+    "AcceleratorTotalMemoryMiBRequest": "botocraft.services.ec2",
+    "AcceptVpcPeeringConnectionResult": "botocraft.services.ec2",
+    "AccessControlPolicy": "botocraft.services.s3",
+    "AccessKeyMetadata": "botocraft.services.iam",
+    "AccessPoint": "botocraft.services.efs",
+    "AccessPointManager": "botocraft.services.efs",
+    "AccessPointManagerMixin": "botocraft.mixins.efs",
+    "AccessPoliciesStatus": "botocraft.services.opensearch",
+    "AccountAggregation": "botocraft.services.inspector2",
+    "AccountAggregationResponse": "botocraft.services.inspector2",
+    "AccountEnforcedGuardrailInferenceInputConfiguration": "botocraft.services.bedrock",
+    "Action": "botocraft.services.elbv2",
+    "ActionConfigurationProperty": "botocraft.services.codepipeline",
+    "ActionDeclaration": "botocraft.services.codepipeline",
+    "ActionType": "botocraft.services.codepipeline",
+    "ActionTypeArtifactDetails": "botocraft.services.codepipeline",
+    "ActionTypeDeclaration": "botocraft.services.codepipeline",
+    "ActionTypeExecutor": "botocraft.services.codepipeline",
+    "ActionTypeId": "botocraft.services.codepipeline",
+    "ActionTypeIdentifier": "botocraft.services.codepipeline",
+    "ActionTypeManager": "botocraft.services.codepipeline",
+    "ActionTypePermissions": "botocraft.services.codepipeline",
+    "ActionTypeProperty": "botocraft.services.codepipeline",
+    "ActionTypeSettings": "botocraft.services.codepipeline",
+    "ActionTypeUrls": "botocraft.services.codepipeline",
+    "ActivityType": "botocraft.services.autoscaling",
+    "AddAvailabilityZonesOutput": "botocraft.services.elb",
+    "AddTagsOutput": "botocraft.services.elb",
+    "AdditionalAttribute": "botocraft.services.elb",
+    "AdditionalStorageVolume": "botocraft.services.rds",
+    "AdditionalStorageVolumeOutput": "botocraft.services.rds",
+    "AdvancedConfiguration": "botocraft.services.ecs",
+    "AdvancedOptionsStatus": "botocraft.services.opensearch",
+    "AdvancedSecurityOptionsInput": "botocraft.services.opensearch",
+    "AdvancedSecurityOptionsStatus": "botocraft.services.opensearch",
+    "AgentListEntry": "botocraft.services.datasync",
+    "AggregationRequest": "botocraft.services.inspector2",
+    "AggregationResponse": "botocraft.services.inspector2",
+    "AgreementAvailability": "botocraft.services.bedrock",
+    "Alarm": "botocraft.services.application_autoscaling",
+    "AlarmHistoryItem": "botocraft.services.cloudwatch",
+    "AlarmMuteRule": "botocraft.services.cloudwatch",
+    "AlarmMuteRuleManager": "botocraft.services.cloudwatch",
+    "AmiAggregation": "botocraft.services.inspector2",
+    "AmiAggregationResponse": "botocraft.services.inspector2",
+    "AnomalyDetectionInfo": "botocraft.services.elbv2",
+    "Any": "typing",
+    "AnyToolChoice": "botocraft.services.bedrock_runtime",
+    "AppCookieStickinessPolicy": "botocraft.services.elb",
+    "ApplicationAutoscalingCustomizedMetricSpecification": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingPredefinedMetricSpecification": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingPredictiveScalingPolicyConfiguration": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingScalableTargetAction": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingStepScalingPolicyConfiguration": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingSuspendedState": "botocraft.services.application_autoscaling",
+    "ApplicationAutoscalingTargetTrackingScalingPolicyConfiguration": "botocraft.services.application_autoscaling",
+    "AppliedGuardrailDetails": "botocraft.services.bedrock_runtime",
+    "ApplySecurityGroupsToLoadBalancerOutput": "botocraft.services.elb",
+    "ArtifactDetails": "botocraft.services.codepipeline",
+    "ArtifactRevision": "botocraft.services.codepipeline",
+    "ArtifactStore": "botocraft.services.codepipeline",
+    "AssignPrivateIpAddressesResult": "botocraft.services.ec2",
+    "AssignedPrivateIpAddress": "botocraft.services.ec2",
+    "AssociateNatGatewayAddressResult": "botocraft.services.ec2",
+    "AssociateRouteTableResult": "botocraft.services.ec2",
+    "AssociateVPCWithHostedZoneResponse": "botocraft.services.route53",
+    "AssumeRole": "botocraft.services.sts",
+    "AssumeRoleManager": "botocraft.services.sts",
+    "AssumeRoleWithSAMLResponse": "botocraft.services.sts",
+    "AssumeRoleWithWebIdentityResponse": "botocraft.services.sts",
+    "AsyncInvokeOutputDataConfig": "botocraft.services.bedrock_runtime",
+    "AsyncInvokeS3OutputDataConfig": "botocraft.services.bedrock_runtime",
+    "AsyncInvokeSummary": "botocraft.services.bedrock_runtime",
+    "AtigData": "botocraft.services.inspector2",
+    "AttachLoadBalancerToSubnetsOutput": "botocraft.services.elb",
+    "AttachNetworkInterfaceResult": "botocraft.services.ec2",
+    "AttachVpnGatewayResult": "botocraft.services.ec2",
+    "AttachedPermissionsBoundary": "botocraft.services.iam",
+    "AttachedPolicy": "botocraft.services.iam",
+    "Attachment": "botocraft.services.sesv2",
+    "AttachmentEnaSrdSpecification": "botocraft.services.ec2",
+    "AttachmentEnaSrdUdpSpecification": "botocraft.services.ec2",
+    "Attribute": "botocraft.services.ecs",
+    "AttributeBooleanValue": "botocraft.services.ec2",
+    "AttributeValue": "botocraft.services.ec2",
+    "AudioBlock": "botocraft.services.bedrock_runtime",
+    "AudioSource": "botocraft.services.bedrock_runtime",
+    "AuthenticateCognitoActionConfig": "botocraft.services.elbv2",
+    "AuthenticateOidcActionConfig": "botocraft.services.elbv2",
+    "AuthenticationMode": "botocraft.services.elasticache",
+    "AuthorizeCacheSecurityGroupIngressResult": "botocraft.services.elasticache",
+    "AuthorizeSecurityGroupEgressResult": "botocraft.services.ec2",
+    "AuthorizeSecurityGroupIngressResult": "botocraft.services.ec2",
+    "AutoRepairConfiguration": "botocraft.services.ecs",
+    "AutoRetryConfig": "botocraft.services.codebuild",
+    "AutoScalingAcceleratorCountRequest": "botocraft.services.autoscaling",
+    "AutoScalingAcceleratorTotalMemoryMiBRequest": "botocraft.services.autoscaling",
+    "AutoScalingActivity": "botocraft.services.autoscaling",
+    "AutoScalingAvailabilityZoneDistribution": "botocraft.services.autoscaling",
+    "AutoScalingAvailabilityZoneImpairmentPolicy": "botocraft.services.autoscaling",
+    "AutoScalingBaselineEbsBandwidthMbsRequest": "botocraft.services.autoscaling",
+    "AutoScalingBaselinePerformanceFactorsRequest": "botocraft.services.autoscaling",
+    "AutoScalingBlockDeviceMapping": "botocraft.services.autoscaling",
+    "AutoScalingCapacityReservationSpecification": "botocraft.services.autoscaling",
+    "AutoScalingCapacityReservationTarget": "botocraft.services.autoscaling",
+    "AutoScalingCpuPerformanceFactorRequest": "botocraft.services.autoscaling",
+    "AutoScalingGroup": "botocraft.services.autoscaling",
+    "AutoScalingGroupManager": "botocraft.services.autoscaling",
+    "AutoScalingGroupModelMixin": "botocraft.mixins.autoscaling",
+    "AutoScalingGroupProvider": "botocraft.services.ecs",
+    "AutoScalingGroupProviderUpdate": "botocraft.services.ecs",
+    "AutoScalingGroupsType": "botocraft.services.autoscaling",
+    "AutoScalingInstanceDetails": "botocraft.services.autoscaling",
+    "AutoScalingInstanceLifecyclePolicy": "botocraft.services.autoscaling",
+    "AutoScalingInstanceMaintenancePolicy": "botocraft.services.autoscaling",
+    "AutoScalingInstanceMonitoring": "botocraft.services.autoscaling",
+    "AutoScalingInstanceReference": "botocraft.services.autoscaling",
+    "AutoScalingInstanceRequirements": "botocraft.services.autoscaling",
+    "AutoScalingInstanceReusePolicy": "botocraft.services.autoscaling",
+    "AutoScalingInstancesDistribution": "botocraft.services.autoscaling",
+    "AutoScalingInstancesType": "botocraft.services.autoscaling",
+    "AutoScalingLaunchTemplate": "botocraft.services.autoscaling",
+    "AutoScalingLaunchTemplateSpecification": "botocraft.services.autoscaling",
+    "AutoScalingMemoryMiBRequest": "botocraft.services.autoscaling",
+    "AutoScalingMixedInstancesPolicy": "botocraft.services.autoscaling",
+    "AutoScalingNetworkInterfaceCountRequest": "botocraft.services.autoscaling",
+    "AutoScalingPerformanceFactorReferenceRequest": "botocraft.services.autoscaling",
+    "AutoScalingRetentionTriggers": "botocraft.services.autoscaling",
+    "AutoScalingTagDescription": "botocraft.services.autoscaling",
+    "AutoScalingTotalLocalStorageGBRequest": "botocraft.services.autoscaling",
+    "AutoScalingWarmPoolConfiguration": "botocraft.services.autoscaling",
+    "AutoToolChoice": "botocraft.services.bedrock_runtime",
+    "AutoTuneMaintenanceSchedule": "botocraft.services.opensearch",
+    "AutoTuneOptionsInput": "botocraft.services.opensearch",
+    "AutoTuneOptionsOutput": "botocraft.services.opensearch",
+    "AutoTuneOptionsStatus": "botocraft.services.opensearch",
+    "AutoTuneStatus": "botocraft.services.opensearch",
+    "AutomatedReasoningCheckFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckImpossibleFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckInputTextReference": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckInvalidFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckLogicWarning": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckNoTranslationsFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckRule": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckSatisfiableFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckScenario": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckTooComplexFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckTranslation": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckTranslationAmbiguousFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckTranslationOption": "botocraft.services.bedrock",
+    "AutomatedReasoningCheckValidFinding": "botocraft.services.bedrock",
+    "AutomatedReasoningLogicStatement": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicy": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddRuleAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddRuleFromNaturalLanguageAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddRuleMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddTypeAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddTypeMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddTypeValue": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddVariableAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAddVariableMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotatedChunk": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotatedContent": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotatedLine": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotations": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAnnotationsManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyAtomicStatement": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildLog": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildLogEntry": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildResultAssetManifest": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildResultAssetManifestEntry": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildResultAssets": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildStep": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildStepContext": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildStepMessage": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflow": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowDocument": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowRepairContent": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowResultAssets": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowResultAssetsManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowSource": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyBuildWorkflowSummary": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinition": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionElement": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionQualityReport": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionRule": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionType": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionTypeValue": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionTypeValuePair": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDefinitionVariable": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteRuleAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteRuleMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteTypeAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteTypeMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteTypeValue": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteVariableAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDeleteVariableMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyDisjointRuleSet": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyFidelityReport": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyGenerateFidelityReportContent": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyGeneratedTestCase": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyGeneratedTestCases": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyIngestContentAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyModelMixin": "botocraft.mixins.bedrock",
+    "AutomatedReasoningPolicyMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyNextScenario": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyNextScenarioManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyPlanning": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyReportSourceDocument": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyRuleReport": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyScenario": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyScenarios": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicySourceDocument": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyStatementLocation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyStatementReference": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyTestCase": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyTestCaseManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyTestResult": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyTestResultManager": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyTypeValueAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateFromRuleFeedbackAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateFromScenarioFeedbackAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateRuleAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateRuleMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateTypeAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateTypeMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateTypeValue": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateVariableAnnotation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyUpdateVariableMutation": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyVariableReport": "botocraft.services.bedrock",
+    "AutomatedReasoningPolicyWorkflowTypeContent": "botocraft.services.bedrock",
+    "AutomatedSnapshotPauseOptionsStatus": "botocraft.services.opensearch",
+    "AutomatedSnapshotPauseRequestOptions": "botocraft.services.opensearch",
+    "AvailabilityZone": "botocraft.services.elbv2",
+    "AvailabilityZoneAddress": "botocraft.services.ec2",
+    "AwsEc2InstanceDetails": "botocraft.services.inspector2",
+    "AwsEcrContainerAggregation": "botocraft.services.inspector2",
+    "AwsEcrContainerAggregationResponse": "botocraft.services.inspector2",
+    "AwsEcrContainerImageDetails": "botocraft.services.inspector2",
+    "AwsLambdaFunctionDetails": "botocraft.services.inspector2",
+    "AwsVpcConfiguration": "botocraft.services.ecs",
+    "AzureBlobSasConfiguration": "botocraft.services.datasync",
+    "BackendServerDescription": "botocraft.services.elb",
+    "BackupPolicyDescription": "botocraft.services.efs",
+    "BaselineEbsBandwidthMbpsRequest": "botocraft.services.ec2",
+    "BaselinePerformanceFactorsRequest": "botocraft.services.ec2",
+    "BatchArrayProperties": "botocraft.services.events",
+    "BatchDeleteBuildsOutput": "botocraft.services.codebuild",
+    "BatchDeleteEvaluationJobError": "botocraft.services.bedrock",
+    "BatchDeleteEvaluationJobItem": "botocraft.services.bedrock",
+    "BatchDeleteEvaluationJobResponse": "botocraft.services.bedrock",
+    "BatchDeleteImageResponse": "botocraft.services.ecr",
+    "BatchGetBuildBatchesOutput": "botocraft.services.codebuild",
+    "BatchGetBuildsOutput": "botocraft.services.codebuild",
+    "BatchGetCommandExecutionsOutput": "botocraft.services.codebuild",
+    "BatchGetFindingDetailsResponse": "botocraft.services.inspector2",
+    "BatchGetFleetsOutput": "botocraft.services.codebuild",
+    "BatchGetImageResponse": "botocraft.services.ecr",
+    "BatchGetProjectsOutput": "botocraft.services.codebuild",
+    "BatchGetReportGroupsOutput": "botocraft.services.codebuild",
+    "BatchGetReportsOutput": "botocraft.services.codebuild",
+    "BatchGetSandboxesOutput": "botocraft.services.codebuild",
+    "BatchRestrictions": "botocraft.services.codebuild",
+    "BatchResultErrorEntry": "botocraft.services.sqs",
+    "BatchRetryStrategy": "botocraft.services.events",
+    "BedrockDeleteResourcePolicyResponse": "botocraft.services.bedrock",
+    "BedrockMessage": "botocraft.services.bedrock_runtime",
+    "BedrockPutResourcePolicyResponse": "botocraft.services.bedrock",
+    "BedrockVpcConfig": "botocraft.services.bedrock",
+    "BeforeEntryConditions": "botocraft.services.codepipeline",
+    "BlockerDeclaration": "botocraft.services.codepipeline",
+    "Boto3Model": "botocraft.services.abstract",
+    "Boto3ModelManager": "botocraft.services.abstract",
+    "Boto3Summary": "botocraft.services.summary",
+    "Bucket": "botocraft.services.s3",
+    "BucketLifecycleConfiguration": "botocraft.services.s3",
+    "BucketLoggingConfiguration": "botocraft.services.s3",
+    "BucketManager": "botocraft.services.s3",
+    "BucketManagerMixin": "botocraft.mixins.s3",
+    "Build": "botocraft.services.codebuild",
+    "BuildArtifacts": "botocraft.services.codebuild",
+    "BuildBatch": "botocraft.services.codebuild",
+    "BuildBatchFilter": "botocraft.services.codebuild",
+    "BuildBatchManager": "botocraft.services.codebuild",
+    "BuildBatchPhase": "botocraft.services.codebuild",
+    "BuildGroup": "botocraft.services.codebuild",
+    "BuildManager": "botocraft.services.codebuild",
+    "BuildNotDeleted": "botocraft.services.codebuild",
+    "BuildPhase": "botocraft.services.codebuild",
+    "BuildStatusConfig": "botocraft.services.codebuild",
+    "BuildSummary": "botocraft.services.codebuild",
+    "BulkEmailEntryResult": "botocraft.services.sesv2",
+    "CSVOutput": "botocraft.services.s3",
+    "CacheCluster": "botocraft.services.elasticache",
+    "CacheClusterManager": "botocraft.services.elasticache",
+    "CacheClusterMessage": "botocraft.services.elasticache",
+    "CacheClusterModelMixin": "botocraft.mixins.elasticache",
+    "CacheDetail": "botocraft.services.bedrock_runtime",
+    "CacheNode": "botocraft.services.elasticache",
+    "CacheNodeTypeSpecificParameter": "botocraft.services.elasticache",
+    "CacheNodeTypeSpecificValue": "botocraft.services.elasticache",
+    "CacheParameter": "botocraft.services.elasticache",
+    "CacheParameterGroup": "botocraft.services.elasticache",
+    "CacheParameterGroupDetails": "botocraft.services.elasticache",
+    "CacheParameterGroupManager": "botocraft.services.elasticache",
+    "CacheParameterGroupNameMessage": "botocraft.services.elasticache",
+    "CacheParameterGroupStatus": "botocraft.services.elasticache",
+    "CacheParameterGroupsMessage": "botocraft.services.elasticache",
+    "CacheParameterManager": "botocraft.services.elasticache",
+    "CachePointBlock": "botocraft.services.bedrock_runtime",
+    "CacheSecurityGroup": "botocraft.services.elasticache",
+    "CacheSecurityGroupManager": "botocraft.services.elasticache",
+    "CacheSecurityGroupMembership": "botocraft.services.elasticache",
+    "CacheSecurityGroupMessage": "botocraft.services.elasticache",
+    "CacheSubnetGroup": "botocraft.services.elasticache",
+    "CacheSubnetGroupManager": "botocraft.services.elasticache",
+    "CacheSubnetGroupMessage": "botocraft.services.elasticache",
+    "CallerIdentity": "botocraft.services.sts",
+    "CallerIdentityManager": "botocraft.services.sts",
+    "CanaryConfiguration": "botocraft.services.ecs",
+    "CancelAutomatedReasoningPolicyBuildWorkflowResponse": "botocraft.services.bedrock",
+    "CancelFindingsReportResponse": "botocraft.services.inspector2",
+    "CancelKeyDeletionResponse": "botocraft.services.kms",
+    "CancelRotateSecretResponse": "botocraft.services.secretsmanager",
+    "CancelTaskExecutionResponse": "botocraft.services.datasync",
+    "CapacityProvider": "botocraft.services.ecs",
+    "CapacityProviderManager": "botocraft.services.ecs",
+    "CapacityProviderManagerMixin": "botocraft.mixins.ecs",
+    "CapacityProviderStrategyItem": "botocraft.services.ecs",
+    "CapacityReservationRequest": "botocraft.services.ecs",
+    "CapacityReservationSpecification": "botocraft.services.ec2",
+    "CapacityReservationSpecificationResponse": "botocraft.services.ec2",
+    "CapacityReservationTargetResponse": "botocraft.services.ec2",
+    "Certificate": "botocraft.services.elbv2",
+    "CertificateOptions": "botocraft.services.acm",
+    "CertificateSummary": "botocraft.services.acm",
+    "Change": "botocraft.services.route53",
+    "ChangeBatch": "botocraft.services.route53",
+    "ChangeCidrCollectionResponse": "botocraft.services.route53",
+    "ChangeInfo": "botocraft.services.route53",
+    "ChangeMessageVisibilityBatchRequestEntry": "botocraft.services.sqs",
+    "ChangeMessageVisibilityBatchResult": "botocraft.services.sqs",
+    "ChangeMessageVisibilityBatchResultEntry": "botocraft.services.sqs",
+    "ChangeResourceRecordSetsResponse": "botocraft.services.route53",
+    "CidrBlockSummary": "botocraft.services.route53",
+    "CidrBlockSummaryManager": "botocraft.services.route53",
+    "CidrCollectionChange": "botocraft.services.route53",
+    "CisScanConfiguration": "botocraft.services.inspector2",
+    "CisScanConfigurationManager": "botocraft.services.inspector2",
+    "CisScanConfigurationManagerMixin": "botocraft.mixins.inspector2",
+    "CisStringFilter": "botocraft.services.inspector2",
+    "CisTargets": "botocraft.services.inspector2",
+    "CisaData": "botocraft.services.inspector2",
+    "Citation": "botocraft.services.bedrock_runtime",
+    "CitationGeneratedContent": "botocraft.services.bedrock_runtime",
+    "CitationLocation": "botocraft.services.bedrock_runtime",
+    "CitationSourceContent": "botocraft.services.bedrock_runtime",
+    "CitationSourceContentDelta": "botocraft.services.bedrock_runtime",
+    "CitationsConfig": "botocraft.services.bedrock_runtime",
+    "CitationsContentBlock": "botocraft.services.bedrock_runtime",
+    "CitationsDelta": "botocraft.services.bedrock_runtime",
+    "ClassVar": "typing",
+    "ClassicELB": "botocraft.services.elb",
+    "ClassicELBAccessLog": "botocraft.services.elb",
+    "ClassicELBConnectionDraining": "botocraft.services.elb",
+    "ClassicELBConnectionSettings": "botocraft.services.elb",
+    "ClassicELBCrossZoneLoadBalancing": "botocraft.services.elb",
+    "ClassicELBHealthCheck": "botocraft.services.elb",
+    "ClassicELBInstance": "botocraft.services.elb",
+    "ClassicELBInstanceState": "botocraft.services.elb",
+    "ClassicELBListener": "botocraft.services.elb",
+    "ClassicELBLoadBalancerAttributes": "botocraft.services.elb",
+    "ClassicELBManager": "botocraft.services.elb",
+    "ClassicELBManagerMixin": "botocraft.mixins.elb",
+    "ClassicELBModelMixin": "botocraft.mixins.elb",
+    "ClassicELBPolicies": "botocraft.services.elb",
+    "ClassicELBSourceSecurityGroup": "botocraft.services.elb",
+    "ClassicELBTagDescription": "botocraft.services.elb",
+    "CloudWatchAlarmMuteRule": "botocraft.services.cloudwatch",
+    "CloudWatchAlarmMuteSchedule": "botocraft.services.cloudwatch",
+    "CloudWatchAlarmMuteTargets": "botocraft.services.cloudwatch",
+    "CloudWatchAlarmPromQLCriteria": "botocraft.services.cloudwatch",
+    "CloudWatchAnomalyDetector": "botocraft.services.cloudwatch",
+    "CloudWatchAnomalyDetectorConfiguration": "botocraft.services.cloudwatch",
+    "CloudWatchAnomalyDetectorManager": "botocraft.services.cloudwatch",
+    "CloudWatchAnomalyDetectorManagerMixin": "botocraft.mixins.cloudwatch",
+    "CloudWatchDashboard": "botocraft.services.cloudwatch",
+    "CloudWatchDashboardManager": "botocraft.services.cloudwatch",
+    "CloudWatchDimension": "botocraft.services.cloudwatch",
+    "CloudWatchDimensionConfiguration": "botocraft.services.ses",
+    "CloudWatchEntity": "botocraft.services.cloudwatch",
+    "CloudWatchEvaluationCriteria": "botocraft.services.cloudwatch",
+    "CloudWatchGetDataPeriod": "botocraft.services.cloudwatch",
+    "CloudWatchGetDataStat": "botocraft.services.cloudwatch",
+    "CloudWatchInsightRule": "botocraft.services.cloudwatch",
+    "CloudWatchInsightRuleManager": "botocraft.services.cloudwatch",
+    "CloudWatchInsightRuleManagerMixin": "botocraft.mixins.cloudwatch",
+    "CloudWatchLogOptionsSpecification": "botocraft.services.ec2",
+    "CloudWatchLogsConfig": "botocraft.services.codebuild",
+    "CloudWatchLogsDestinationDetails": "botocraft.services.elasticache",
+    "CloudWatchMetric": "botocraft.services.cloudwatch",
+    "CloudWatchMetricCharacteristics": "botocraft.services.cloudwatch",
+    "CloudWatchMetricDataQuery": "botocraft.services.cloudwatch",
+    "CloudWatchMetricManager": "botocraft.services.cloudwatch",
+    "CloudWatchMetricManagerMixin": "botocraft.mixins.cloudwatch",
+    "CloudWatchMetricMathAnomalyDetector": "botocraft.services.cloudwatch",
+    "CloudWatchMetricModelMixin": "botocraft.mixins.cloudwatch",
+    "CloudWatchMetricStat": "botocraft.services.cloudwatch",
+    "CloudWatchMetricStream": "botocraft.services.cloudwatch",
+    "CloudWatchMetricStreamFilter": "botocraft.services.cloudwatch",
+    "CloudWatchMetricStreamManager": "botocraft.services.cloudwatch",
+    "CloudWatchMetricStreamStatisticsConfiguration": "botocraft.services.cloudwatch",
+    "CloudWatchMetricUnit": "botocraft.services.cloudwatch",
+    "CloudWatchSingleMetricAnomalyDetector": "botocraft.services.cloudwatch",
+    "CloudWatchTag": "botocraft.services.cloudwatch",
+    "CloudwatchLogsExportConfiguration": "botocraft.services.docdb",
+    "Cluster": "botocraft.services.ecs",
+    "ClusterConfigStatus": "botocraft.services.opensearch",
+    "ClusterConfiguration": "botocraft.services.ecs",
+    "ClusterManager": "botocraft.services.ecs",
+    "ClusterMasterUserSecret": "botocraft.services.docdb",
+    "ClusterServiceConnectDefaults": "botocraft.services.ecs",
+    "ClusterServiceConnectDefaultsRequest": "botocraft.services.ecs",
+    "ClusterSetting": "botocraft.services.ecs",
+    "CodeBuildEnvironmentPlatform": "botocraft.services.codebuild",
+    "CodeBuildEnvironmentPlatformManager": "botocraft.services.codebuild",
+    "CodeBuildTestCase": "botocraft.services.codebuild",
+    "CodeBuildTestCaseManager": "botocraft.services.codebuild",
+    "CodeConnectionsVpcConfiguration": "botocraft.services.codeconnections",
+    "CodeCoverage": "botocraft.services.codebuild",
+    "CodeCoverageManager": "botocraft.services.codebuild",
+    "CodeCoverageReportSummary": "botocraft.services.codebuild",
+    "CodeFilePath": "botocraft.services.inspector2",
+    "CodeRepositoryAggregation": "botocraft.services.inspector2",
+    "CodeRepositoryAggregationResponse": "botocraft.services.inspector2",
+    "CodeRepositoryDetails": "botocraft.services.inspector2",
+    "CodeVulnerabilityDetails": "botocraft.services.inspector2",
+    "CognitoOptionsStatus": "botocraft.services.opensearch",
+    "CollectionSummary": "botocraft.services.route53",
+    "CommandExecution": "botocraft.services.codebuild",
+    "CommandExecutionManager": "botocraft.services.codebuild",
+    "CommonPrefix": "botocraft.services.s3",
+    "CompositeAlarm": "botocraft.services.cloudwatch",
+    "CompositeAlarmManager": "botocraft.services.cloudwatch",
+    "ComputeConfiguration": "botocraft.services.codebuild",
+    "Condition": "botocraft.services.codepipeline",
+    "ConfigurationSet": "botocraft.services.sesv2",
+    "ConfigurationSetManager": "botocraft.services.sesv2",
+    "ConfigureHealthCheckOutput": "botocraft.services.elb",
+    "Connection": "botocraft.services.codeconnections",
+    "ConnectionManager": "botocraft.services.codeconnections",
+    "ConnectionTrackingSpecificationRequest": "botocraft.services.ec2",
+    "ConnectionTrackingSpecificationResponse": "botocraft.services.ec2",
+    "ConsumerDescription": "botocraft.services.kinesis",
+    "ContactList": "botocraft.services.sesv2",
+    "ContactListManager": "botocraft.services.sesv2",
+    "Container": "botocraft.services.ecs",
+    "ContainerDefinition": "botocraft.services.ecs",
+    "ContainerDependency": "botocraft.services.ecs",
+    "ContainerImage": "botocraft.services.ecs",
+    "ContainerInstance": "botocraft.services.ecs",
+    "ContainerInstanceHealthStatus": "botocraft.services.ecs",
+    "ContainerInstanceManager": "botocraft.services.ecs",
+    "ContainerInstanceResource": "botocraft.services.ecs",
+    "ContainerOverride": "botocraft.services.ecs",
+    "ContainerRestartPolicy": "botocraft.services.ecs",
+    "ContentBlock": "botocraft.services.bedrock_runtime",
+    "ContentBlockDelta": "botocraft.services.bedrock_runtime",
+    "ContentBlockDeltaEvent": "botocraft.services.bedrock_runtime",
+    "ContentBlockStart": "botocraft.services.bedrock_runtime",
+    "ContentBlockStartEvent": "botocraft.services.bedrock_runtime",
+    "ContentBlockStopEvent": "botocraft.services.bedrock_runtime",
+    "ContinuationEvent": "botocraft.services.s3",
+    "Conversation": "botocraft.services.bedrock_runtime",
+    "ConversationManager": "botocraft.services.bedrock_runtime",
+    "ConversationManagerMixin": "botocraft.mixins.bedrock_runtime",
+    "ConverseMetrics": "botocraft.services.bedrock_runtime",
+    "ConverseOutput": "botocraft.services.bedrock_runtime",
+    "ConverseStream": "botocraft.mixins.bedrock_runtime",
+    "ConverseStreamMetadataEvent": "botocraft.services.bedrock_runtime",
+    "ConverseStreamMetrics": "botocraft.services.bedrock_runtime",
+    "ConverseStreamOutput": "botocraft.services.bedrock_runtime",
+    "ConverseStreamResponse": "botocraft.services.bedrock_runtime",
+    "ConverseStreamResponseMixin": "botocraft.mixins.bedrock_runtime",
+    "ConverseStreamTrace": "botocraft.services.bedrock_runtime",
+    "ConverseTokensRequest": "botocraft.services.bedrock_runtime",
+    "ConverseTrace": "botocraft.services.bedrock_runtime",
+    "CopyImageResult": "botocraft.services.ec2",
+    "CopyObjectOutput": "botocraft.services.s3",
+    "CopySnapshotResult": "botocraft.services.ec2",
+    "CountTokensInput": "botocraft.services.bedrock_runtime",
+    "CpuOptionsRequest": "botocraft.services.ec2",
+    "CpuPerformanceFactor": "botocraft.services.ec2",
+    "CpuPerformanceFactorRequest": "botocraft.services.ec2",
+    "CreateAccessKeyResponse": "botocraft.services.iam",
+    "CreateAgentResponse": "botocraft.services.datasync",
+    "CreateAutomatedReasoningPolicyResponse": "botocraft.services.bedrock",
+    "CreateAutomatedReasoningPolicyTestCaseResponse": "botocraft.services.bedrock",
+    "CreateAutomatedReasoningPolicyVersionResponse": "botocraft.services.bedrock",
+    "CreateCacheClusterResult": "botocraft.services.elasticache",
+    "CreateCacheParameterGroupResult": "botocraft.services.elasticache",
+    "CreateCacheSecurityGroupResult": "botocraft.services.elasticache",
+    "CreateCacheSubnetGroupResult": "botocraft.services.elasticache",
+    "CreateCapacityProviderResponse": "botocraft.services.ecs",
+    "CreateCidrCollectionResponse": "botocraft.services.route53",
+    "CreateCisScanConfigurationResponse": "botocraft.services.inspector2",
+    "CreateCisTargets": "botocraft.services.inspector2",
+    "CreateClusterResponse": "botocraft.services.ecs",
+    "CreateConnectionOutput": "botocraft.services.codeconnections",
+    "CreateCustomActionTypeOutput": "botocraft.services.codepipeline",
+    "CreateCustomModelResponse": "botocraft.services.bedrock",
+    "CreateCustomerGatewayResult": "botocraft.services.ec2",
+    "CreateDBClusterResult": "botocraft.services.docdb",
+    "CreateDBInstanceResult": "botocraft.services.rds",
+    "CreateDBSubnetGroupResult": "botocraft.services.rds",
+    "CreateDhcpOptionsResult": "botocraft.services.ec2",
+    "CreateDiscovererResponse": "botocraft.services.schemas",
+    "CreateDomainResponse": "botocraft.services.opensearch",
+    "CreateEvaluationJobResponse": "botocraft.services.bedrock",
+    "CreateEventBusResponse": "botocraft.services.events",
+    "CreateExpressGatewayServiceResponse": "botocraft.services.ecs",
+    "CreateFilterResponse": "botocraft.services.inspector2",
+    "CreateFindingsReportResponse": "botocraft.services.inspector2",
+    "CreateFleetOutput": "botocraft.services.codebuild",
+    "CreateFlowLogsResult": "botocraft.services.ec2",
+    "CreateFoundationModelAgreementResponse": "botocraft.services.bedrock",
+    "CreateGroupResponse": "botocraft.services.iam",
+    "CreateGuardrailResponse": "botocraft.services.bedrock",
+    "CreateGuardrailVersionResponse": "botocraft.services.bedrock",
+    "CreateHostOutput": "botocraft.services.codeconnections",
+    "CreateHostedZoneResponse": "botocraft.services.route53",
+    "CreateImageResult": "botocraft.services.ec2",
+    "CreateInferenceProfileResponse": "botocraft.services.bedrock",
+    "CreateInstanceProfileResponse": "botocraft.services.iam",
+    "CreateInternetGatewayResult": "botocraft.services.ec2",
+    "CreateKeyResponse": "botocraft.services.kms",
+    "CreateLaunchTemplateResult": "botocraft.services.ec2",
+    "CreateLaunchTemplateVersionResult": "botocraft.services.ec2",
+    "CreateListenerOutput": "botocraft.services.elbv2",
+    "CreateLoadBalancerListenerOutput": "botocraft.services.elb",
+    "CreateLoadBalancerOutput": "botocraft.services.elbv2",
+    "CreateLoadBalancerPolicyOutput": "botocraft.services.elb",
+    "CreateLocationAzureBlobResponse": "botocraft.services.datasync",
+    "CreateLocationEfsResponse": "botocraft.services.datasync",
+    "CreateLocationFsxLustreResponse": "botocraft.services.datasync",
+    "CreateLocationFsxOntapResponse": "botocraft.services.datasync",
+    "CreateLocationFsxOpenZfsResponse": "botocraft.services.datasync",
+    "CreateLocationFsxWindowsResponse": "botocraft.services.datasync",
+    "CreateLocationHdfsResponse": "botocraft.services.datasync",
+    "CreateLocationNfsResponse": "botocraft.services.datasync",
+    "CreateLocationObjectStorageResponse": "botocraft.services.datasync",
+    "CreateLocationS3Response": "botocraft.services.datasync",
+    "CreateLocationSmbResponse": "botocraft.services.datasync",
+    "CreateLoginProfileResponse": "botocraft.services.iam",
+    "CreateManagedInstancesProviderConfiguration": "botocraft.services.ecs",
+    "CreateMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "CreateModelCopyJobResponse": "botocraft.services.bedrock",
+    "CreateModelCustomizationJobResponse": "botocraft.services.bedrock",
+    "CreateModelInvocationJobResponse": "botocraft.services.bedrock",
+    "CreateNatGatewayResult": "botocraft.services.ec2",
+    "CreateNetworkAclResult": "botocraft.services.ec2",
+    "CreateNetworkInterfaceResult": "botocraft.services.ec2",
+    "CreatePackageResponse": "botocraft.services.opensearch",
+    "CreatePipelineOutput": "botocraft.services.codepipeline",
+    "CreatePlacementGroupResult": "botocraft.services.ec2",
+    "CreatePolicyResponse": "botocraft.services.iam",
+    "CreatePolicyVersionResponse": "botocraft.services.iam",
+    "CreateProjectOutput": "botocraft.services.codebuild",
+    "CreatePromptRouterResponse": "botocraft.services.bedrock",
+    "CreateProvisionedModelThroughputResponse": "botocraft.services.bedrock",
+    "CreateQueryLoggingConfigResponse": "botocraft.services.route53",
+    "CreateQueueResult": "botocraft.services.sqs",
+    "CreateRegistryResponse": "botocraft.services.schemas",
+    "CreateReplicationGroupResult": "botocraft.services.elasticache",
+    "CreateReportGroupOutput": "botocraft.services.codebuild",
+    "CreateRepositoryResponse": "botocraft.services.ecr",
+    "CreateRoleResponse": "botocraft.services.iam",
+    "CreateRouteResult": "botocraft.services.ec2",
+    "CreateRouteTableResult": "botocraft.services.ec2",
+    "CreateRuleOutput": "botocraft.services.elbv2",
+    "CreateSchemaResponse": "botocraft.services.schemas",
+    "CreateSecretResponse": "botocraft.services.secretsmanager",
+    "CreateSecurityGroupResult": "botocraft.services.ec2",
+    "CreateServiceLinkedRoleResponse": "botocraft.services.iam",
+    "CreateServiceResponse": "botocraft.services.ecs",
+    "CreateSyncConfigurationOutput": "botocraft.services.codeconnections",
+    "CreateTargetGroupOutput": "botocraft.services.elbv2",
+    "CreateTaskResponse": "botocraft.services.datasync",
+    "CreateTaskSetResponse": "botocraft.services.ecs",
+    "CreateTenantResponse": "botocraft.services.sesv2",
+    "CreateUserResponse": "botocraft.services.iam",
+    "CreateVPCAssociationAuthorizationResponse": "botocraft.services.route53",
+    "CreateVpcEndpointResponse": "botocraft.services.opensearch",
+    "CreateVpcEndpointResult": "botocraft.services.ec2",
+    "CreateVpcPeeringConnectionResult": "botocraft.services.ec2",
+    "CreateVpnConnectionResult": "botocraft.services.ec2",
+    "CreateVpnGatewayResult": "botocraft.services.ec2",
+    "CreateWebhookOutput": "botocraft.services.codebuild",
+    "CreatedAt": "botocraft.services.ecs",
+    "CreditSpecificationRequest": "botocraft.services.ec2",
+    "CustomModel": "botocraft.services.bedrock",
+    "CustomModelManager": "botocraft.services.bedrock",
+    "CustomModelUnits": "botocraft.services.bedrock",
+    "CustomerGateway": "botocraft.services.ec2",
+    "CustomerGatewayManager": "botocraft.services.ec2",
+    "CustomizationConfig": "botocraft.services.bedrock",
+    "Cvss2": "botocraft.services.inspector2",
+    "Cvss3": "botocraft.services.inspector2",
+    "Cvss4": "botocraft.services.inspector2",
+    "CvssScore": "botocraft.services.inspector2",
+    "CvssScoreAdjustment": "botocraft.services.inspector2",
+    "CvssScoreDetails": "botocraft.services.inspector2",
+    "DBClusterMember": "botocraft.services.docdb",
+    "DBClusterRole": "botocraft.services.docdb",
+    "DBInstance": "botocraft.services.rds",
+    "DBInstanceAutomatedBackupsReplication": "botocraft.services.rds",
+    "DBInstanceManager": "botocraft.services.rds",
+    "DBInstanceMessage": "botocraft.services.rds",
+    "DBInstanceRole": "botocraft.services.rds",
+    "DBInstanceStatusInfo": "botocraft.services.docdb",
+    "DBParameterGroupStatus": "botocraft.services.rds",
+    "DBSecurityGroupMembership": "botocraft.services.rds",
+    "DBSubnetGroupMessage": "botocraft.services.rds",
+    "Daemon": "botocraft.services.ecs",
+    "DaemonCapacityProvider": "botocraft.services.ecs",
+    "DaemonContainerDefinition": "botocraft.services.ecs",
+    "DaemonContainerImage": "botocraft.services.ecs",
+    "DaemonDeployment": "botocraft.services.ecs",
+    "DaemonDeploymentManager": "botocraft.services.ecs",
+    "DaemonDeploymentManagerMixin": "botocraft.mixins.ecs",
+    "DaemonLinuxParameters": "botocraft.services.ecs",
+    "DaemonManager": "botocraft.services.ecs",
+    "DaemonManagerMixin": "botocraft.mixins.ecs",
+    "DaemonRevision": "botocraft.services.ecs",
+    "DaemonRevisionDetail": "botocraft.services.ecs",
+    "DaemonRevisionManager": "botocraft.services.ecs",
+    "DaemonTaskDefinition": "botocraft.services.ecs",
+    "DaemonTaskDefinitionManager": "botocraft.services.ecs",
+    "DaemonTaskDefinitionManagerMixin": "botocraft.mixins.ecs",
+    "DaemonVolume": "botocraft.services.ecs",
+    "DailySchedule": "botocraft.services.inspector2",
+    "DataProcessingDetails": "botocraft.services.bedrock",
+    "DataSyncAgent": "botocraft.services.datasync",
+    "DataSyncAgentManager": "botocraft.services.datasync",
+    "DataSyncCmkSecretConfig": "botocraft.services.datasync",
+    "DataSyncCustomSecretConfig": "botocraft.services.datasync",
+    "DataSyncEc2Config": "botocraft.services.datasync",
+    "DataSyncFilterRule": "botocraft.services.datasync",
+    "DataSyncFsxProtocol": "botocraft.services.datasync",
+    "DataSyncListTasksResponse": "botocraft.services.datasync",
+    "DataSyncLocationAzureBlob": "botocraft.services.datasync",
+    "DataSyncLocationAzureBlobManager": "botocraft.services.datasync",
+    "DataSyncLocationEfs": "botocraft.services.datasync",
+    "DataSyncLocationEfsManager": "botocraft.services.datasync",
+    "DataSyncLocationFsxLustre": "botocraft.services.datasync",
+    "DataSyncLocationFsxLustreManager": "botocraft.services.datasync",
+    "DataSyncLocationFsxOntap": "botocraft.services.datasync",
+    "DataSyncLocationFsxOntapManager": "botocraft.services.datasync",
+    "DataSyncLocationFsxOpenZfs": "botocraft.services.datasync",
+    "DataSyncLocationFsxOpenZfsManager": "botocraft.services.datasync",
+    "DataSyncLocationFsxWindows": "botocraft.services.datasync",
+    "DataSyncLocationFsxWindowsManager": "botocraft.services.datasync",
+    "DataSyncLocationHdfs": "botocraft.services.datasync",
+    "DataSyncLocationHdfsManager": "botocraft.services.datasync",
+    "DataSyncLocationNfs": "botocraft.services.datasync",
+    "DataSyncLocationNfsManager": "botocraft.services.datasync",
+    "DataSyncLocationObjectStorage": "botocraft.services.datasync",
+    "DataSyncLocationObjectStorageManager": "botocraft.services.datasync",
+    "DataSyncLocationS3": "botocraft.services.datasync",
+    "DataSyncLocationS3Manager": "botocraft.services.datasync",
+    "DataSyncLocationSmb": "botocraft.services.datasync",
+    "DataSyncLocationSmbManager": "botocraft.services.datasync",
+    "DataSyncManagedSecretConfig": "botocraft.services.datasync",
+    "DataSyncManifestConfig": "botocraft.services.datasync",
+    "DataSyncNfsMountOptions": "botocraft.services.datasync",
+    "DataSyncOnPremConfig": "botocraft.services.datasync",
+    "DataSyncOptions": "botocraft.services.datasync",
+    "DataSyncPlatform": "botocraft.services.datasync",
+    "DataSyncPrivateLinkConfig": "botocraft.services.datasync",
+    "DataSyncQopConfiguration": "botocraft.services.datasync",
+    "DataSyncReportResult": "botocraft.services.datasync",
+    "DataSyncS3Config": "botocraft.services.datasync",
+    "DataSyncSmbMountOptions": "botocraft.services.datasync",
+    "DataSyncTask": "botocraft.services.datasync",
+    "DataSyncTaskExecution": "botocraft.services.datasync",
+    "DataSyncTaskExecutionManager": "botocraft.services.datasync",
+    "DataSyncTaskExecutionResultDetail": "botocraft.services.datasync",
+    "DataSyncTaskManager": "botocraft.services.datasync",
+    "DataSyncTaskReportConfig": "botocraft.services.datasync",
+    "DataSyncTaskSchedule": "botocraft.services.datasync",
+    "DataSyncTaskScheduleDetails": "botocraft.services.datasync",
+    "DateFilter": "botocraft.services.inspector2",
+    "DebugSession": "botocraft.services.codebuild",
+    "DedicatedIp": "botocraft.services.sesv2",
+    "DedicatedIpManager": "botocraft.services.sesv2",
+    "DedicatedIpPool": "botocraft.services.sesv2",
+    "DedicatedIpPoolManager": "botocraft.services.sesv2",
+    "DefaultConnectionTrackingConfiguration": "botocraft.services.ec2",
+    "DelegatedAdmin": "botocraft.services.inspector2",
+    "DelegatedAdminAccount": "botocraft.services.inspector2",
+    "DelegatedAdminAccountManager": "botocraft.services.inspector2",
+    "Delete": "botocraft.services.s3",
+    "DeleteAccessPointOutput": "botocraft.services.elb",
+    "DeleteAgentResponse": "botocraft.services.datasync",
+    "DeleteAutomatedReasoningPolicyBuildWorkflowResponse": "botocraft.services.bedrock",
+    "DeleteAutomatedReasoningPolicyResponse": "botocraft.services.bedrock",
+    "DeleteAutomatedReasoningPolicyTestCaseResponse": "botocraft.services.bedrock",
+    "DeleteBuildBatchOutput": "botocraft.services.codebuild",
+    "DeleteCacheClusterResult": "botocraft.services.elasticache",
+    "DeleteCapacityProviderResponse": "botocraft.services.ecs",
+    "DeleteCidrCollectionResponse": "botocraft.services.route53",
+    "DeleteCisScanConfigurationResponse": "botocraft.services.inspector2",
+    "DeleteClusterResponse": "botocraft.services.ecs",
+    "DeleteConfigurationSetResponse": "botocraft.services.sesv2",
+    "DeleteConnectionOutput": "botocraft.services.codeconnections",
+    "DeleteContactListResponse": "botocraft.services.sesv2",
+    "DeleteCustomModelResponse": "botocraft.services.bedrock",
+    "DeleteDBClusterResult": "botocraft.services.docdb",
+    "DeleteDBInstanceResult": "botocraft.services.rds",
+    "DeleteDashboardsOutput": "botocraft.services.cloudwatch",
+    "DeleteDedicatedIpPoolResponse": "botocraft.services.sesv2",
+    "DeleteDomainResponse": "botocraft.services.opensearch",
+    "DeleteEmailTemplateResponse": "botocraft.services.sesv2",
+    "DeleteEnforcedGuardrailConfigurationResponse": "botocraft.services.bedrock",
+    "DeleteExpressGatewayServiceResponse": "botocraft.services.ecs",
+    "DeleteFilterResponse": "botocraft.services.inspector2",
+    "DeleteFleetOutput": "botocraft.services.codebuild",
+    "DeleteFlowLogsResult": "botocraft.services.ec2",
+    "DeleteFoundationModelAgreementResponse": "botocraft.services.bedrock",
+    "DeleteGuardrailResponse": "botocraft.services.bedrock",
+    "DeleteHostOutput": "botocraft.services.codeconnections",
+    "DeleteHostedZoneResponse": "botocraft.services.route53",
+    "DeleteImportedModelResponse": "botocraft.services.bedrock",
+    "DeleteInferenceProfileResponse": "botocraft.services.bedrock",
+    "DeleteInsightRulesOutput": "botocraft.services.cloudwatch",
+    "DeleteKeyPairResult": "botocraft.services.ec2",
+    "DeleteLaunchTemplateResult": "botocraft.services.ec2",
+    "DeleteLaunchTemplateVersionsResponseErrorItem": "botocraft.services.ec2",
+    "DeleteLaunchTemplateVersionsResponseSuccessItem": "botocraft.services.ec2",
+    "DeleteLaunchTemplateVersionsResult": "botocraft.services.ec2",
+    "DeleteListenerOutput": "botocraft.services.elbv2",
+    "DeleteLoadBalancerListenerOutput": "botocraft.services.elb",
+    "DeleteLoadBalancerOutput": "botocraft.services.elbv2",
+    "DeleteLoadBalancerPolicyOutput": "botocraft.services.elb",
+    "DeleteLocationResponse": "botocraft.services.datasync",
+    "DeleteMarkerEntry": "botocraft.services.s3",
+    "DeleteMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "DeleteMessageBatchRequestEntry": "botocraft.services.sqs",
+    "DeleteMessageBatchResult": "botocraft.services.sqs",
+    "DeleteMessageBatchResultEntry": "botocraft.services.sqs",
+    "DeleteMetricStreamOutput": "botocraft.services.cloudwatch",
+    "DeleteModelInvocationLoggingConfigurationResponse": "botocraft.services.bedrock",
+    "DeleteMultiRegionEndpointResponse": "botocraft.services.sesv2",
+    "DeleteNatGatewayResult": "botocraft.services.ec2",
+    "DeleteObjectTaggingOutput": "botocraft.services.s3",
+    "DeleteObjectsOutput": "botocraft.services.s3",
+    "DeletePackageResponse": "botocraft.services.opensearch",
+    "DeleteParameterResult": "botocraft.services.ssm",
+    "DeleteProjectOutput": "botocraft.services.codebuild",
+    "DeletePromptRouterResponse": "botocraft.services.bedrock",
+    "DeleteProvisionedModelThroughputResponse": "botocraft.services.bedrock",
+    "DeleteQueryLoggingConfigResponse": "botocraft.services.route53",
+    "DeleteReceiptFilterResponse": "botocraft.services.ses",
+    "DeleteReceiptRuleSetResponse": "botocraft.services.ses",
+    "DeleteReplicationGroupResult": "botocraft.services.elasticache",
+    "DeleteReportGroupOutput": "botocraft.services.codebuild",
+    "DeleteReportOutput": "botocraft.services.codebuild",
+    "DeleteRepositoryResponse": "botocraft.services.ecr",
+    "DeleteResourcePolicyOutput": "botocraft.services.codebuild",
+    "DeleteResourcePolicyResponse": "botocraft.services.secretsmanager",
+    "DeleteRuleOutput": "botocraft.services.elbv2",
+    "DeleteScalingPolicyResponse": "botocraft.services.application_autoscaling",
+    "DeleteScheduledActionResponse": "botocraft.services.application_autoscaling",
+    "DeleteSecretResponse": "botocraft.services.secretsmanager",
+    "DeleteSecurityGroupResult": "botocraft.services.ec2",
+    "DeleteServiceLinkedRoleResponse": "botocraft.services.iam",
+    "DeleteServiceResponse": "botocraft.services.ecs",
+    "DeleteSnapshotReturnCode": "botocraft.services.ec2",
+    "DeleteSourceCredentialsOutput": "botocraft.services.codebuild",
+    "DeleteSuppressedDestinationResponse": "botocraft.services.sesv2",
+    "DeleteSyncConfigurationOutput": "botocraft.services.codeconnections",
+    "DeleteTargetGroupOutput": "botocraft.services.elbv2",
+    "DeleteTaskDefinitionsResponse": "botocraft.services.ecs",
+    "DeleteTaskResponse": "botocraft.services.datasync",
+    "DeleteTaskSetResponse": "botocraft.services.ecs",
+    "DeleteTemplateResponse": "botocraft.services.ses",
+    "DeleteTenantResponse": "botocraft.services.sesv2",
+    "DeleteVPCAssociationAuthorizationResponse": "botocraft.services.route53",
+    "DeleteVpcEndpointResponse": "botocraft.services.opensearch",
+    "DeleteVpcEndpointsResult": "botocraft.services.ec2",
+    "DeleteVpcPeeringConnectionResult": "botocraft.services.ec2",
+    "DeleteWebhookOutput": "botocraft.services.codebuild",
+    "DeletedObject": "botocraft.services.s3",
+    "DeliverabilityTestReport": "botocraft.services.sesv2",
+    "DeliverabilityTestReportManager": "botocraft.services.sesv2",
+    "Deployment": "botocraft.services.ecs",
+    "DeploymentAlarms": "botocraft.services.ecs",
+    "DeploymentCircuitBreaker": "botocraft.services.ecs",
+    "DeploymentConfiguration": "botocraft.services.ecs",
+    "DeploymentController": "botocraft.services.ecs",
+    "DeploymentEphemeralStorage": "botocraft.services.ecs",
+    "DeploymentLifecycleHook": "botocraft.services.ecs",
+    "DeploymentLifecycleHookDetail": "botocraft.services.ecs",
+    "DeploymentLifecycleHookTimeoutConfiguration": "botocraft.services.ecs",
+    "DeploymentStrategyOptionsStatus": "botocraft.services.opensearch",
+    "DeregisterEndPointsOutput": "botocraft.services.elb",
+    "DeregisterImageResult": "botocraft.services.ec2",
+    "DeregisterMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "DeregisterScalableTargetResponse": "botocraft.services.application_autoscaling",
+    "DeregisterTaskDefinitionResponse": "botocraft.services.ecs",
+    "DescribeAccessPointsOutput": "botocraft.services.elb",
+    "DescribeAccessPointsResponse": "botocraft.services.efs",
+    "DescribeAlarmHistoryOutput": "botocraft.services.cloudwatch",
+    "DescribeAlarmsOutput": "botocraft.services.cloudwatch",
+    "DescribeAnomalyDetectorsOutput": "botocraft.services.cloudwatch",
+    "DescribeCapacityProvidersResponse": "botocraft.services.ecs",
+    "DescribeCertificateResponse": "botocraft.services.acm",
+    "DescribeClassicELBAttributesResponse": "botocraft.services.elb",
+    "DescribeClustersResponse": "botocraft.services.ecs",
+    "DescribeCodeCoveragesOutput": "botocraft.services.codebuild",
+    "DescribeContainerInstancesResponse": "botocraft.services.ecs",
+    "DescribeCustomerGatewaysResult": "botocraft.services.ec2",
+    "DescribeDaemonResponse": "botocraft.services.ecs",
+    "DescribeDaemonRevisionsResponse": "botocraft.services.ecs",
+    "DescribeDaemonTaskDefinitionResponse": "botocraft.services.ecs",
+    "DescribeDhcpOptionsResult": "botocraft.services.ec2",
+    "DescribeDhcpOptionsResultDhcpOptions": "botocraft.services.ec2",
+    "DescribeDiscovererResponse": "botocraft.services.schemas",
+    "DescribeDomainResponse": "botocraft.services.opensearch",
+    "DescribeEndPointStateOutput": "botocraft.services.elb",
+    "DescribeEventBusResponse_to_EventBus": "botocraft.mixins.events",
+    "DescribeExpressGatewayServiceResponse": "botocraft.services.ecs",
+    "DescribeFileSystemsResponse": "botocraft.services.efs",
+    "DescribeFlowLogsResult": "botocraft.services.ec2",
+    "DescribeImageReplicationStatusResponse": "botocraft.services.ecr",
+    "DescribeImageScanFindingsResponse": "botocraft.services.ecr",
+    "DescribeImagesResult": "botocraft.services.ec2",
+    "DescribeInstanceTypesResult": "botocraft.services.ec2",
+    "DescribeInstancesResult": "botocraft.services.ec2",
+    "DescribeInternetGatewaysResult": "botocraft.services.ec2",
+    "DescribeKeyPairsResult": "botocraft.services.ec2",
+    "DescribeKeyResponse": "botocraft.services.kms",
+    "DescribeLaunchTemplateVersionsResult": "botocraft.services.ec2",
+    "DescribeLaunchTemplatesResult": "botocraft.services.ec2",
+    "DescribeListenersOutput": "botocraft.services.elbv2",
+    "DescribeLoadBalancerAttributesOutput": "botocraft.services.elbv2",
+    "DescribeLoadBalancerPoliciesOutput": "botocraft.services.elb",
+    "DescribeLoadBalancerPolicyTypesOutput": "botocraft.services.elb",
+    "DescribeLoadBalancersOutput": "botocraft.services.elbv2",
+    "DescribeLockedSnapshotsResult": "botocraft.services.ec2",
+    "DescribeLogGroupsResponse": "botocraft.services.logs",
+    "DescribeMountTargetsResponse": "botocraft.services.efs",
+    "DescribeNatGatewaysResult": "botocraft.services.ec2",
+    "DescribeNetworkAclsResult": "botocraft.services.ec2",
+    "DescribeNetworkInterfacePermissionsResult": "botocraft.services.ec2",
+    "DescribeNetworkInterfacesResult": "botocraft.services.ec2",
+    "DescribePackagesFilter": "botocraft.services.opensearch",
+    "DescribePackagesResponse": "botocraft.services.opensearch",
+    "DescribeParametersResult": "botocraft.services.ssm",
+    "DescribePlacementGroupsResult": "botocraft.services.ec2",
+    "DescribeRegistryResponse": "botocraft.services.schemas",
+    "DescribeReplicationConfigurationsResponse": "botocraft.services.efs",
+    "DescribeRepositoriesResponse": "botocraft.services.ecr",
+    "DescribeRouteTablesResult": "botocraft.services.ec2",
+    "DescribeRuleResponse": "botocraft.services.events",
+    "DescribeRuleResponse_to_EventRule": "botocraft.mixins.events",
+    "DescribeRulesOutput": "botocraft.services.elbv2",
+    "DescribeScalableTargetsResponse": "botocraft.services.application_autoscaling",
+    "DescribeScalingPoliciesResponse": "botocraft.services.application_autoscaling",
+    "DescribeScheduledActionsResponse": "botocraft.services.application_autoscaling",
+    "DescribeSchemaResponse": "botocraft.services.schemas",
+    "DescribeSecretResponse": "botocraft.services.secretsmanager",
+    "DescribeSecurityGroupsResult": "botocraft.services.ec2",
+    "DescribeServiceDeploymentsResponse": "botocraft.services.ecs",
+    "DescribeServiceRevisionsResponse": "botocraft.services.ecs",
+    "DescribeServicesResponse": "botocraft.services.ecs",
+    "DescribeSnapshotsResult": "botocraft.services.ec2",
+    "DescribeStreamConsumerOutput": "botocraft.services.kinesis",
+    "DescribeStreamSummaryOutput": "botocraft.services.kinesis",
+    "DescribeSubnetsResult": "botocraft.services.ec2",
+    "DescribeTagsOutput": "botocraft.services.elb",
+    "DescribeTargetGroupsOutput": "botocraft.services.elbv2",
+    "DescribeTargetHealthOutput": "botocraft.services.elbv2",
+    "DescribeTaskDefinitionResponse": "botocraft.services.ecs",
+    "DescribeTaskSetsResponse": "botocraft.services.ecs",
+    "DescribeTasksResponse": "botocraft.services.ecs",
+    "DescribeTestCasesOutput": "botocraft.services.codebuild",
+    "DescribeUserGroupsResult": "botocraft.services.elasticache",
+    "DescribeUsersResult": "botocraft.services.elasticache",
+    "DescribeVolumesResult": "botocraft.services.ec2",
+    "DescribeVpcAttributeResult": "botocraft.services.ec2",
+    "DescribeVpcEndpointsResponse": "botocraft.services.opensearch",
+    "DescribeVpcEndpointsResult": "botocraft.services.ec2",
+    "DescribeVpcPeeringConnectionsResult": "botocraft.services.ec2",
+    "DescribeVpcsResult": "botocraft.services.ec2",
+    "DescribeVpnConnectionsResult": "botocraft.services.ec2",
+    "DescribeVpnGatewaysResult": "botocraft.services.ec2",
+    "Destination": "botocraft.services.inspector2",
+    "DestinationOptionsRequest": "botocraft.services.ec2",
+    "DestinationOptionsResponse": "botocraft.services.ec2",
+    "DestinationToCreate": "botocraft.services.efs",
+    "DetachLoadBalancerFromSubnetsOutput": "botocraft.services.elb",
+    "Details": "botocraft.services.sesv2",
+    "Device": "botocraft.services.ecs",
+    "DhcpConfiguration": "botocraft.services.ec2",
+    "DhcpOptions": "botocraft.services.ec2",
+    "DhcpOptionsManager": "botocraft.services.ec2",
+    "DimensionFilter": "botocraft.services.cloudwatch",
+    "DimensionalPriceRate": "botocraft.services.bedrock",
+    "DisableDelegatedAdminAccountResponse": "botocraft.services.inspector2",
+    "DisableImageDeregistrationProtectionResult": "botocraft.services.ec2",
+    "DisableInsightRulesOutput": "botocraft.services.cloudwatch",
+    "DisableSnapshotBlockPublicAccessResult": "botocraft.services.ec2",
+    "DisassociateNatGatewayAddressResult": "botocraft.services.ec2",
+    "DisassociateVPCFromHostedZoneResponse": "botocraft.services.route53",
+    "Discoverer": "botocraft.services.schemas",
+    "DiscovererManager": "botocraft.services.schemas",
+    "DiskInfo": "botocraft.services.ec2",
+    "DistillationConfig": "botocraft.services.bedrock",
+    "DnsEntry": "botocraft.services.ec2",
+    "DnsOptionsSpecification": "botocraft.services.ec2",
+    "DocDBCertificateDetails": "botocraft.services.docdb",
+    "DocDBCluster": "botocraft.services.docdb",
+    "DocDBClusterManager": "botocraft.services.docdb",
+    "DocDBClusterMessage": "botocraft.services.docdb",
+    "DocDBClusterModelMixin": "botocraft.mixins.docdb",
+    "DocDBCreateDBInstanceResult": "botocraft.services.docdb",
+    "DocDBCreateDBSubnetGroupResult": "botocraft.services.docdb",
+    "DocDBDeleteDBInstanceResult": "botocraft.services.docdb",
+    "DocDBEndpoint": "botocraft.services.docdb",
+    "DocDBInstance": "botocraft.services.docdb",
+    "DocDBInstanceManager": "botocraft.services.docdb",
+    "DocDBInstanceMessage": "botocraft.services.docdb",
+    "DocDBModifyDBInstanceResult": "botocraft.services.docdb",
+    "DocDBModifyDBSubnetGroupResult": "botocraft.services.docdb",
+    "DocDBPendingCloudwatchLogsExports": "botocraft.services.docdb",
+    "DocDBPendingModifiedValues": "botocraft.services.docdb",
+    "DocDBSubnetGroup": "botocraft.services.docdb",
+    "DocDBSubnetGroupManager": "botocraft.services.docdb",
+    "DocDBSubnetGroupMessage": "botocraft.services.docdb",
+    "DockerServer": "botocraft.services.codebuild",
+    "DockerServerStatus": "botocraft.services.codebuild",
+    "Document": "botocraft.services.bedrock_runtime",
+    "DocumentBlock": "botocraft.services.bedrock_runtime",
+    "DocumentCharLocation": "botocraft.services.bedrock_runtime",
+    "DocumentChunkLocation": "botocraft.services.bedrock_runtime",
+    "DocumentContentBlock": "botocraft.services.bedrock_runtime",
+    "DocumentPageLocation": "botocraft.services.bedrock_runtime",
+    "DocumentSource": "botocraft.services.bedrock_runtime",
+    "DomainEndpointOptionsStatus": "botocraft.services.opensearch",
+    "DomainMembership": "botocraft.services.rds",
+    "DomainModelMixin": "botocraft.mixins.opensearch",
+    "DomainValidation": "botocraft.services.acm",
+    "DomainValidationOption": "botocraft.services.acm",
+    "EBSOptionsStatus": "botocraft.services.opensearch",
+    "EBSTagSpecification": "botocraft.services.ecs",
+    "EC2BaselinePerformanceFactors": "botocraft.services.ec2",
+    "EC2BlockDeviceMapping": "botocraft.services.ec2",
+    "EC2BlockPublicAccessStates": "botocraft.services.ec2",
+    "EC2CapacityReservationTarget": "botocraft.services.ec2",
+    "EC2CidrBlockAssociation": "botocraft.services.ec2",
+    "EC2CloudWatchLogOptions": "botocraft.services.ec2",
+    "EC2ConnectionTrackingConfiguration": "botocraft.services.ec2",
+    "EC2ConnectionTrackingSpecification": "botocraft.services.ec2",
+    "EC2CpuOptions": "botocraft.services.ec2",
+    "EC2DetailedMonitoring": "botocraft.services.ec2",
+    "EC2DnsOptions": "botocraft.services.ec2",
+    "EC2EbsInfo": "botocraft.services.ec2",
+    "EC2EbsOptimizedInfo": "botocraft.services.ec2",
+    "EC2EfaInfo": "botocraft.services.ec2",
+    "EC2EnaSrdUdpSpecification": "botocraft.services.ec2",
+    "EC2EnclaveOptions": "botocraft.services.ec2",
+    "EC2FpgaInfo": "botocraft.services.ec2",
+    "EC2GpuInfo": "botocraft.services.ec2",
+    "EC2HibernationOptions": "botocraft.services.ec2",
+    "EC2IamInstanceProfile": "botocraft.services.ec2",
+    "EC2IcmpTypeCode": "botocraft.services.ec2",
+    "EC2InferenceAcceleratorInfo": "botocraft.services.ec2",
+    "EC2InstanceStorageInfo": "botocraft.services.ec2",
+    "EC2InstanceType": "botocraft.services.ec2",
+    "EC2InstanceTypeManager": "botocraft.services.ec2",
+    "EC2LastError": "botocraft.services.ec2",
+    "EC2LaunchTemplateSpecification": "botocraft.services.ec2",
+    "EC2MediaAcceleratorInfo": "botocraft.services.ec2",
+    "EC2MemoryGiBPerVCpuRequest": "botocraft.services.ec2",
+    "EC2MemoryInfo": "botocraft.services.ec2",
+    "EC2NetworkBandwidthGbpsRequest": "botocraft.services.ec2",
+    "EC2NetworkInfo": "botocraft.services.ec2",
+    "EC2NeuronInfo": "botocraft.services.ec2",
+    "EC2NitroTpmInfo": "botocraft.services.ec2",
+    "EC2Placement": "botocraft.services.ec2",
+    "EC2PlacementGroupInfo": "botocraft.services.ec2",
+    "EC2PrivateDnsNameOptionsOnLaunch": "botocraft.services.ec2",
+    "EC2ProcessorInfo": "botocraft.services.ec2",
+    "EC2ProvisionedBandwidth": "botocraft.services.ec2",
+    "EC2PublicIpDnsNameOptions": "botocraft.services.ec2",
+    "EC2ResponseError": "botocraft.services.ec2",
+    "EC2SecurityGroup": "botocraft.services.elasticache",
+    "EC2StateReason": "botocraft.services.ec2",
+    "EC2TagsManagerMixin": "botocraft.mixins.ec2",
+    "EC2VCpuInfo": "botocraft.services.ec2",
+    "EC2VolumeModification": "botocraft.services.ec2",
+    "EC2VpcAttachment": "botocraft.services.ec2",
+    "EC2VpcEndpoint": "botocraft.services.ec2",
+    "EC2VpcEndpointManager": "botocraft.services.ec2",
+    "ECRAttribute": "botocraft.services.ecr",
+    "ECRImage": "botocraft.services.ecr",
+    "ECRImageManager": "botocraft.services.ecr",
+    "ECRImageManagerMixin": "botocraft.mixins.ecr",
+    "ECRImageMixin": "botocraft.mixins.ecr",
+    "ECSAcceleratorCountRequest": "botocraft.services.ecs",
+    "ECSAcceleratorTotalMemoryMiBRequest": "botocraft.services.ecs",
+    "ECSBaselineEbsBandwidthMbpsRequest": "botocraft.services.ecs",
+    "ECSContainerDefinitionSecret": "botocraft.services.ecs",
+    "ECSContainerInstanceModelMixin": "botocraft.mixins.ecs",
+    "ECSInstanceRequirementsRequest": "botocraft.services.ecs",
+    "ECSManagedResources": "botocraft.services.ecs",
+    "ECSMemoryGiBPerVCpuRequest": "botocraft.services.ecs",
+    "ECSMemoryMiBRequest": "botocraft.services.ecs",
+    "ECSNetworkBandwidthGbpsRequest": "botocraft.services.ecs",
+    "ECSNetworkInterfaceCountRequest": "botocraft.services.ecs",
+    "ECSProxyConfiguration": "botocraft.services.ecs",
+    "ECSServiceManagerMixin": "botocraft.mixins.ecs",
+    "ECSServiceModelMixin": "botocraft.mixins.ecs",
+    "ECSTag": "botocraft.services.ecs",
+    "ECSTaskModelMixin": "botocraft.mixins.ecs",
+    "ECSTotalLocalStorageGBRequest": "botocraft.services.ecs",
+    "ECSVCpuCountRangeRequest": "botocraft.services.ecs",
+    "EFSBackupPolicy": "botocraft.services.efs",
+    "EFSCreationInfo": "botocraft.services.efs",
+    "EFSDestination": "botocraft.services.efs",
+    "EFSPosixUser": "botocraft.services.efs",
+    "EFSRootDirectory": "botocraft.services.efs",
+    "EbsBlockDevice": "botocraft.services.ec2",
+    "EbsCardInfo": "botocraft.services.ec2",
+    "EbsInstanceBlockDevice": "botocraft.services.ec2",
+    "EbsInstanceBlockDeviceSpecification": "botocraft.services.ec2",
+    "EbsMapping": "botocraft.services.autoscaling",
+    "Ec2InstanceAggregation": "botocraft.services.inspector2",
+    "Ec2InstanceAggregationResponse": "botocraft.services.inspector2",
+    "ElastiCacheAuthentication": "botocraft.services.elasticache",
+    "ElastiCacheDestinationDetails": "botocraft.services.elasticache",
+    "ElastiCacheEndpoint": "botocraft.services.elasticache",
+    "ElastiCacheGlobalReplicationGroupInfo": "botocraft.services.elasticache",
+    "ElastiCacheManagerTagsMixin": "botocraft.mixins.elasticache",
+    "ElastiCacheNotificationConfiguration": "botocraft.services.elasticache",
+    "ElastiCachePendingModifiedValues": "botocraft.services.elasticache",
+    "ElastiCacheScaleConfig": "botocraft.services.elasticache",
+    "ElastiCacheSlotMigration": "botocraft.services.elasticache",
+    "ElastiCacheSubnet": "botocraft.services.elasticache",
+    "ElastiCacheSubnetOutpost": "botocraft.services.elasticache",
+    "ElastiCacheUser": "botocraft.services.elasticache",
+    "ElastiCacheUserGroup": "botocraft.services.elasticache",
+    "ElastiCacheUserGroupManager": "botocraft.services.elasticache",
+    "ElastiCacheUserManager": "botocraft.services.elasticache",
+    "ElasticGpuAssociation": "botocraft.services.ec2",
+    "ElasticGpuSpecification": "botocraft.services.ec2",
+    "ElasticGpuSpecificationResponse": "botocraft.services.ec2",
+    "ElasticInferenceAccelerator": "botocraft.services.ec2",
+    "ElasticInferenceAcceleratorAssociation": "botocraft.services.ec2",
+    "ElbV2AdministrativeOverride": "botocraft.services.elbv2",
+    "ElbV2HostHeaderRewriteConfig": "botocraft.services.elbv2",
+    "ElbV2IpamPools": "botocraft.services.elbv2",
+    "ElbV2TargetGroupStickinessConfig": "botocraft.services.elbv2",
+    "ElbV2UrlRewriteConfig": "botocraft.services.elbv2",
+    "EmailIdentity": "botocraft.services.sesv2",
+    "EmailIdentityManager": "botocraft.services.sesv2",
+    "EmailTemplate": "botocraft.services.sesv2",
+    "EmailTemplateContent": "botocraft.services.sesv2",
+    "EmailTemplateManager": "botocraft.services.sesv2",
+    "EmailTemplateMetadata": "botocraft.services.sesv2",
+    "EnaSrdSpecification": "botocraft.services.ec2",
+    "EnaSrdSpecificationRequest": "botocraft.services.ec2",
+    "EnaSrdUdpSpecificationRequest": "botocraft.services.ec2",
+    "EnableDelegatedAdminAccountResponse": "botocraft.services.inspector2",
+    "EnableImageDeregistrationProtectionResult": "botocraft.services.ec2",
+    "EnableInsightRulesOutput": "botocraft.services.cloudwatch",
+    "EnableSnapshotBlockPublicAccessResult": "botocraft.services.ec2",
+    "EnabledMetric": "botocraft.services.autoscaling",
+    "EnclaveOptionsRequest": "botocraft.services.ec2",
+    "EncryptionAtRestOptionsStatus": "botocraft.services.opensearch",
+    "EncryptionConfiguration": "botocraft.services.ecr",
+    "EncryptionKey": "botocraft.services.codepipeline",
+    "EndEvent": "botocraft.services.s3",
+    "EndpointConfig": "botocraft.services.bedrock",
+    "EnforcedGuardrailsConfiguration": "botocraft.services.bedrock",
+    "EnforcedGuardrailsConfigurationManager": "botocraft.services.bedrock",
+    "EnhancedImageScanFinding": "botocraft.services.ecr",
+    "EntityMetricData": "botocraft.services.cloudwatch",
+    "EnvironmentFile": "botocraft.services.ecs",
+    "EnvironmentImage": "botocraft.services.codebuild",
+    "EnvironmentLanguage": "botocraft.services.codebuild",
+    "EnvironmentVariable": "botocraft.services.codebuild",
+    "EphemeralStorage": "botocraft.services.ecs",
+    "Epss": "botocraft.services.inspector2",
+    "EpssDetails": "botocraft.services.inspector2",
+    "Error": "botocraft.services.s3",
+    "ErrorBlock": "botocraft.services.bedrock_runtime",
+    "EvaluationInferenceConfigSummary": "botocraft.services.bedrock",
+    "EvaluationJob": "botocraft.services.bedrock",
+    "EvaluationJobManager": "botocraft.services.bedrock",
+    "EvaluationModelConfigSummary": "botocraft.services.bedrock",
+    "EvaluationRagConfigSummary": "botocraft.services.bedrock",
+    "EvaluationSummary": "botocraft.services.bedrock",
+    "EventBus": "botocraft.services.events",
+    "EventBusManager": "botocraft.services.events",
+    "EventDestination": "botocraft.services.ses",
+    "EventFactory": "botocraft.eventbridge.factory",
+    "EventRule": "botocraft.services.events",
+    "EventRuleManager": "botocraft.services.events",
+    "EventRule_purge_CreatedBy_attribute": "botocraft.mixins.events",
+    "EventTarget": "botocraft.services.events",
+    "EventTargetManager": "botocraft.services.events",
+    "EventsAppSyncParameters": "botocraft.services.events",
+    "EventsAwsVpcConfiguration": "botocraft.services.events",
+    "EventsBatchParameters": "botocraft.services.events",
+    "EventsCapacityProviderStrategyItem": "botocraft.services.events",
+    "EventsDeadLetterConfig": "botocraft.services.events",
+    "EventsEcsParameters": "botocraft.services.events",
+    "EventsHttpParameters": "botocraft.services.events",
+    "EventsInputTransformer": "botocraft.services.events",
+    "EventsKinesisParameters": "botocraft.services.events",
+    "EventsLogConfig": "botocraft.services.events",
+    "EventsNetworkConfiguration": "botocraft.services.events",
+    "EventsPlacementConstraint": "botocraft.services.events",
+    "EventsPlacementStrategy": "botocraft.services.events",
+    "EventsRedshiftDataParameters": "botocraft.services.events",
+    "EventsRetryPolicy": "botocraft.services.events",
+    "EventsRunCommandParameters": "botocraft.services.events",
+    "EventsSageMakerPipelineParameters": "botocraft.services.events",
+    "EventsSqsParameters": "botocraft.services.events",
+    "Evidence": "botocraft.services.inspector2",
+    "ExecuteCommandConfiguration": "botocraft.services.ecs",
+    "ExecuteCommandLogConfiguration": "botocraft.services.ecs",
+    "ExecutionTrigger": "botocraft.services.codepipeline",
+    "ExecutorConfiguration": "botocraft.services.codepipeline",
+    "ExploitObserved": "botocraft.services.inspector2",
+    "ExploitabilityDetails": "botocraft.services.inspector2",
+    "ExportAutomatedReasoningPolicyVersionResponse": "botocraft.services.bedrock",
+    "ExportSchemaResponse": "botocraft.services.schemas",
+    "ExportedEnvironmentVariable": "botocraft.services.codebuild",
+    "ExpressGatewayContainer": "botocraft.services.ecs",
+    "ExpressGatewayRepositoryCredentials": "botocraft.services.ecs",
+    "ExpressGatewayScalingTarget": "botocraft.services.ecs",
+    "ExpressGatewayService": "botocraft.services.ecs",
+    "ExpressGatewayServiceAwsLogsConfiguration": "botocraft.services.ecs",
+    "ExpressGatewayServiceConfiguration": "botocraft.services.ecs",
+    "ExpressGatewayServiceManager": "botocraft.services.ecs",
+    "ExpressGatewayServiceManagerMixin": "botocraft.mixins.ecs",
+    "ExpressGatewayServiceNetworkConfiguration": "botocraft.services.ecs",
+    "ExpressGatewayServiceStatus": "botocraft.services.ecs",
+    "ExtendedKeyUsage": "botocraft.services.acm",
+    "ExternalSecretRotationMetadataItem": "botocraft.services.secretsmanager",
+    "FailoverDBClusterResult": "botocraft.services.docdb",
+    "Failure": "botocraft.services.ecs",
+    "FailureConditions": "botocraft.services.codepipeline",
+    "Field": "pydantic.fields",
+    "FileSystem": "botocraft.services.efs",
+    "FileSystemManager": "botocraft.services.efs",
+    "FileSystemManagerMixin": "botocraft.mixins.efs",
+    "FileSystemPolicyDescription": "botocraft.services.efs",
+    "FileSystemProtectionDescription": "botocraft.services.efs",
+    "FileSystemSize": "botocraft.services.efs",
+    "Filter": "botocraft.services.common",
+    "FilterCriteria": "botocraft.services.inspector2",
+    "Filters": "botocraft.services.acm",
+    "Finding": "botocraft.services.inspector2",
+    "FindingDetail": "botocraft.services.inspector2",
+    "FindingDetailsError": "botocraft.services.inspector2",
+    "FindingManager": "botocraft.services.inspector2",
+    "FindingTypeAggregation": "botocraft.services.inspector2",
+    "FindingTypeAggregationResponse": "botocraft.services.inspector2",
+    "FindingsReport": "botocraft.services.inspector2",
+    "FindingsReportManager": "botocraft.services.inspector2",
+    "FirelensConfiguration": "botocraft.services.ecs",
+    "FixedResponseActionConfig": "botocraft.services.elbv2",
+    "Fleet": "botocraft.services.codebuild",
+    "FleetManager": "botocraft.services.codebuild",
+    "FleetProxyRule": "botocraft.services.codebuild",
+    "FleetStatus": "botocraft.services.codebuild",
+    "FlowLog": "botocraft.services.ec2",
+    "FlowLogManager": "botocraft.services.ec2",
+    "ForwardActionConfig": "botocraft.services.elbv2",
+    "FoundationModel": "botocraft.services.bedrock",
+    "FoundationModelAgreement": "botocraft.services.bedrock",
+    "FoundationModelAgreementManager": "botocraft.services.bedrock",
+    "FoundationModelDetails": "botocraft.services.bedrock",
+    "FoundationModelLifecycle": "botocraft.services.bedrock",
+    "FoundationModelManager": "botocraft.services.bedrock",
+    "FoundationModelRuntimeMixin": "botocraft.mixins.bedrock_runtime",
+    "FpgaDeviceInfo": "botocraft.services.ec2",
+    "FpgaDeviceMemoryInfo": "botocraft.services.ec2",
+    "FsxProtocolNfs": "botocraft.services.datasync",
+    "FsxProtocolSmb": "botocraft.services.datasync",
+    "FsxUpdateProtocol": "botocraft.services.datasync",
+    "FsxUpdateProtocolSmb": "botocraft.services.datasync",
+    "GetAccessKeyLastUsedResponse": "botocraft.services.iam",
+    "GetActionTypeOutput": "botocraft.services.codepipeline",
+    "GetAlarmMuteRuleOutput": "botocraft.services.cloudwatch",
+    "GetAsyncInvokeResponse": "botocraft.services.bedrock_runtime",
+    "GetAutomatedReasoningPolicyResponse": "botocraft.services.bedrock",
+    "GetAutomatedReasoningPolicyTestCaseResponse": "botocraft.services.bedrock",
+    "GetAutomatedReasoningPolicyTestResultResponse": "botocraft.services.bedrock",
+    "GetBucketLifecycleConfigurationOutput": "botocraft.services.s3",
+    "GetBucketPolicyOutput": "botocraft.services.s3",
+    "GetBucketTaggingOutput": "botocraft.services.s3",
+    "GetBucketWebsiteOutput": "botocraft.services.s3",
+    "GetConnectionOutput": "botocraft.services.codeconnections",
+    "GetCustomModelResponse": "botocraft.services.bedrock",
+    "GetCustomVerificationEmailTemplateResponse": "botocraft.services.ses",
+    "GetDashboardOutput": "botocraft.services.cloudwatch",
+    "GetDedicatedIpPoolResponse": "botocraft.services.sesv2",
+    "GetDedicatedIpResponse": "botocraft.services.sesv2",
+    "GetDedicatedIpsResponse": "botocraft.services.sesv2",
+    "GetDelegatedAdminAccountResponse": "botocraft.services.inspector2",
+    "GetFindingsReportStatusResponse": "botocraft.services.inspector2",
+    "GetFoundationModelAvailabilityResponse": "botocraft.services.bedrock",
+    "GetFoundationModelResponse": "botocraft.services.bedrock",
+    "GetGroupPolicyResponse": "botocraft.services.iam",
+    "GetGroupResponse": "botocraft.services.iam",
+    "GetHostOutput": "botocraft.services.codeconnections",
+    "GetHostedZoneCountResponse": "botocraft.services.route53",
+    "GetHostedZoneLimitResponse": "botocraft.services.route53",
+    "GetHostedZoneResponse": "botocraft.services.route53",
+    "GetImportedModelResponse": "botocraft.services.bedrock",
+    "GetInferenceProfileResponse": "botocraft.services.bedrock",
+    "GetInstanceProfileResponse": "botocraft.services.iam",
+    "GetLogGroupFieldsResponse": "botocraft.services.logs",
+    "GetLoginProfileResponse": "botocraft.services.iam",
+    "GetMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "GetMetricStreamOutput": "botocraft.services.cloudwatch",
+    "GetModelCopyJobResponse": "botocraft.services.bedrock",
+    "GetModelInvocationJobResponse": "botocraft.services.bedrock",
+    "GetModelInvocationLoggingConfigurationResponse": "botocraft.services.bedrock",
+    "GetMultiRegionEndpointResponse": "botocraft.services.sesv2",
+    "GetObjectAclOutput": "botocraft.services.s3",
+    "GetObjectAttributesOutput": "botocraft.services.s3",
+    "GetObjectAttributesParts": "botocraft.services.s3",
+    "GetObjectLegalHoldOutput": "botocraft.services.s3",
+    "GetObjectLockConfigurationOutput": "botocraft.services.s3",
+    "GetObjectOutput": "botocraft.services.s3",
+    "GetObjectOutputMixin": "botocraft.mixins.s3",
+    "GetObjectRetentionOutput": "botocraft.services.s3",
+    "GetObjectTaggingOutput": "botocraft.services.s3",
+    "GetParametersResult": "botocraft.services.ssm",
+    "GetPipelineExecutionOutput": "botocraft.services.codepipeline",
+    "GetPipelineOutput": "botocraft.services.codepipeline",
+    "GetPolicyResponse": "botocraft.services.iam",
+    "GetPolicyVersionResponse": "botocraft.services.iam",
+    "GetPromptRouterResponse": "botocraft.services.bedrock",
+    "GetProvisionedModelThroughputResponse": "botocraft.services.bedrock",
+    "GetPublicAccessBlockOutput": "botocraft.services.s3",
+    "GetQueryLoggingConfigResponse": "botocraft.services.route53",
+    "GetRandomPasswordResponse": "botocraft.services.secretsmanager",
+    "GetReportGroupTrendOutput": "botocraft.services.codebuild",
+    "GetResourcePolicyOutput": "botocraft.services.codebuild",
+    "GetResourcePolicyResponse": "botocraft.services.secretsmanager",
+    "GetRolePolicyResponse": "botocraft.services.iam",
+    "GetRoleResponse": "botocraft.services.iam",
+    "GetSSHPublicKeyResponse": "botocraft.services.iam",
+    "GetSecretValueResponse": "botocraft.services.secretsmanager",
+    "GetSnapshotBlockPublicAccessStateResult": "botocraft.services.ec2",
+    "GetSuppressedDestinationResponse": "botocraft.services.sesv2",
+    "GetSyncBlockerSummaryOutput": "botocraft.services.codeconnections",
+    "GetSyncConfigurationOutput": "botocraft.services.codeconnections",
+    "GetTemplateResponse": "botocraft.services.ses",
+    "GetTenantResponse": "botocraft.services.sesv2",
+    "GetUserPolicyResponse": "botocraft.services.iam",
+    "GetUserResponse": "botocraft.services.iam",
+    "GitBranchFilterCriteria": "botocraft.services.codepipeline",
+    "GitConfiguration": "botocraft.services.codepipeline",
+    "GitFilePathFilterCriteria": "botocraft.services.codepipeline",
+    "GitPullRequestFilter": "botocraft.services.codepipeline",
+    "GitPushFilter": "botocraft.services.codepipeline",
+    "GitSubmodulesConfig": "botocraft.services.codebuild",
+    "GitTagFilterCriteria": "botocraft.services.codepipeline",
+    "GpuDeviceInfo": "botocraft.services.ec2",
+    "GpuDeviceMemoryInfo": "botocraft.services.ec2",
+    "GraderConfig": "botocraft.services.bedrock",
+    "Grant": "botocraft.services.s3",
+    "GroupIdentifier": "botocraft.services.ec2",
+    "Guardrail": "botocraft.services.bedrock",
+    "GuardrailApplication": "botocraft.services.bedrock_runtime",
+    "GuardrailApplicationManager": "botocraft.services.bedrock_runtime",
+    "GuardrailAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningImpossibleFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningInputTextReference": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningInvalidFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningLogicWarning": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningNoTranslationsFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningPolicy": "botocraft.services.bedrock",
+    "GuardrailAutomatedReasoningPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningPolicyConfig": "botocraft.services.bedrock",
+    "GuardrailAutomatedReasoningRule": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningSatisfiableFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningScenario": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningStatement": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningTooComplexFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningTranslation": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningTranslationAmbiguousFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningTranslationOption": "botocraft.services.bedrock_runtime",
+    "GuardrailAutomatedReasoningValidFinding": "botocraft.services.bedrock_runtime",
+    "GuardrailConfiguration": "botocraft.services.bedrock_runtime",
+    "GuardrailContentBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailContentFilter": "botocraft.services.bedrock_runtime",
+    "GuardrailContentFilterConfig": "botocraft.services.bedrock",
+    "GuardrailContentFiltersTier": "botocraft.services.bedrock",
+    "GuardrailContentFiltersTierConfig": "botocraft.services.bedrock",
+    "GuardrailContentPolicy": "botocraft.services.bedrock",
+    "GuardrailContentPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailContentPolicyConfig": "botocraft.services.bedrock",
+    "GuardrailContextualGroundingFilter": "botocraft.services.bedrock_runtime",
+    "GuardrailContextualGroundingFilterConfig": "botocraft.services.bedrock",
+    "GuardrailContextualGroundingPolicy": "botocraft.services.bedrock",
+    "GuardrailContextualGroundingPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailContextualGroundingPolicyConfig": "botocraft.services.bedrock",
+    "GuardrailConverseContentBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailConverseImageBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailConverseImageSource": "botocraft.services.bedrock_runtime",
+    "GuardrailConverseTextBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailCoverage": "botocraft.services.bedrock_runtime",
+    "GuardrailCrossRegionConfig": "botocraft.services.bedrock",
+    "GuardrailCrossRegionDetails": "botocraft.services.bedrock",
+    "GuardrailCustomWord": "botocraft.services.bedrock_runtime",
+    "GuardrailImageBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailImageCoverage": "botocraft.services.bedrock_runtime",
+    "GuardrailImageSource": "botocraft.services.bedrock_runtime",
+    "GuardrailInvocationMetrics": "botocraft.services.bedrock_runtime",
+    "GuardrailManagedWord": "botocraft.services.bedrock_runtime",
+    "GuardrailManagedWords": "botocraft.services.bedrock",
+    "GuardrailManagedWordsConfig": "botocraft.services.bedrock",
+    "GuardrailManager": "botocraft.services.bedrock",
+    "GuardrailOutputContent": "botocraft.services.bedrock_runtime",
+    "GuardrailPiiEntity": "botocraft.services.bedrock",
+    "GuardrailPiiEntityConfig": "botocraft.services.bedrock",
+    "GuardrailPiiEntityFilter": "botocraft.services.bedrock_runtime",
+    "GuardrailRegex": "botocraft.services.bedrock",
+    "GuardrailRegexConfig": "botocraft.services.bedrock",
+    "GuardrailRegexFilter": "botocraft.services.bedrock_runtime",
+    "GuardrailRuntimeMixin": "botocraft.mixins.bedrock_runtime",
+    "GuardrailSensitiveInformationPolicy": "botocraft.services.bedrock",
+    "GuardrailSensitiveInformationPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailSensitiveInformationPolicyConfig": "botocraft.services.bedrock",
+    "GuardrailStreamConfiguration": "botocraft.services.bedrock_runtime",
+    "GuardrailSummary": "botocraft.services.bedrock",
+    "GuardrailTextBlock": "botocraft.services.bedrock_runtime",
+    "GuardrailTextCharactersCoverage": "botocraft.services.bedrock_runtime",
+    "GuardrailTopic": "botocraft.services.bedrock_runtime",
+    "GuardrailTopicConfig": "botocraft.services.bedrock",
+    "GuardrailTopicPolicy": "botocraft.services.bedrock",
+    "GuardrailTopicPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailTopicPolicyConfig": "botocraft.services.bedrock",
+    "GuardrailTopicsTier": "botocraft.services.bedrock",
+    "GuardrailTopicsTierConfig": "botocraft.services.bedrock",
+    "GuardrailTraceAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailUsage": "botocraft.services.bedrock_runtime",
+    "GuardrailWord": "botocraft.services.bedrock",
+    "GuardrailWordConfig": "botocraft.services.bedrock",
+    "GuardrailWordPolicy": "botocraft.services.bedrock",
+    "GuardrailWordPolicyAssessment": "botocraft.services.bedrock_runtime",
+    "GuardrailWordPolicyConfig": "botocraft.services.bedrock",
+    "HashKeyRange": "botocraft.services.kinesis",
+    "HdfsNameNode": "botocraft.services.datasync",
+    "HealthCheck": "botocraft.services.ecs",
+    "HibernationOptionsRequest": "botocraft.services.ec2",
+    "HookDetails": "botocraft.services.ecs",
+    "Host": "botocraft.services.codeconnections",
+    "HostEntry": "botocraft.services.ecs",
+    "HostHeaderConditionConfig": "botocraft.services.elbv2",
+    "HostManager": "botocraft.services.codeconnections",
+    "HostVolumeProperties": "botocraft.services.ecs",
+    "HostedZone": "botocraft.services.route53",
+    "HostedZoneConfig": "botocraft.services.route53",
+    "HostedZoneFailureReasons": "botocraft.services.route53",
+    "HostedZoneFeatures": "botocraft.services.route53",
+    "HostedZoneLimit": "botocraft.services.route53",
+    "HostedZoneManager": "botocraft.services.route53",
+    "HostedZoneModelMixin": "botocraft.mixins.route53",
+    "HostedZoneOwner": "botocraft.services.route53",
+    "HostedZoneSummary": "botocraft.services.route53",
+    "HttpHeaderConditionConfig": "botocraft.services.elbv2",
+    "HttpRequestMethodConditionConfig": "botocraft.services.elbv2",
+    "IAMAccessKey": "botocraft.services.iam",
+    "IAMAccessKeyLastUsed": "botocraft.services.iam",
+    "IAMAccessKeyManager": "botocraft.services.iam",
+    "IAMFederationOptionsInput": "botocraft.services.opensearch",
+    "IAMFederationOptionsOutput": "botocraft.services.opensearch",
+    "IAMGroup": "botocraft.services.iam",
+    "IAMGroupManager": "botocraft.services.iam",
+    "IAMLoginProfile": "botocraft.services.iam",
+    "IAMLoginProfileManager": "botocraft.services.iam",
+    "IAMPolicy": "botocraft.services.iam",
+    "IAMPolicyManager": "botocraft.services.iam",
+    "IAMPolicyManagerMixin": "botocraft.mixins.iam",
+    "IAMPolicyMixin": "botocraft.mixins.iam",
+    "IAMPolicyVersion": "botocraft.services.iam",
+    "IAMPolicyVersionManager": "botocraft.services.iam",
+    "IAMRole": "botocraft.services.iam",
+    "IAMRoleLastUsed": "botocraft.services.iam",
+    "IAMRoleManager": "botocraft.services.iam",
+    "IAMSSHPublicKey": "botocraft.services.iam",
+    "IAMSSHPublicKeyManager": "botocraft.services.iam",
+    "IAMTag": "botocraft.services.iam",
+    "IAMUser": "botocraft.services.iam",
+    "IAMUserManager": "botocraft.services.iam",
+    "IKEVersionsListValue": "botocraft.services.ec2",
+    "IKEVersionsRequestListValue": "botocraft.services.ec2",
+    "IPAddressTypeStatus": "botocraft.services.opensearch",
+    "IamInstanceProfileSpecification": "botocraft.services.ec2",
+    "IdentityCenterOptionsInput": "botocraft.services.opensearch",
+    "IdentityCenterOptionsStatus": "botocraft.services.opensearch",
+    "ImageBlock": "botocraft.services.bedrock_runtime",
+    "ImageBlockDelta": "botocraft.services.bedrock_runtime",
+    "ImageBlockStart": "botocraft.services.bedrock_runtime",
+    "ImageFailure": "botocraft.services.ecr",
+    "ImageIdentifier": "botocraft.services.ecr",
+    "ImageLayerAggregation": "botocraft.services.inspector2",
+    "ImageLayerAggregationResponse": "botocraft.services.inspector2",
+    "ImageReplicationStatus": "botocraft.services.ecr",
+    "ImageScanFinding": "botocraft.services.ecr",
+    "ImageScanFindings": "botocraft.services.ecr",
+    "ImageScanStatus": "botocraft.services.ecr",
+    "ImageScanningConfiguration": "botocraft.services.ecr",
+    "ImageSource": "botocraft.services.bedrock_runtime",
+    "ImageTagMutabilityExclusionFilter": "botocraft.services.ecr",
+    "ImportCertificateResponse": "botocraft.services.acm",
+    "ImportKeyPairResult": "botocraft.services.ec2",
+    "ImportSourceCredentialsOutput": "botocraft.services.codebuild",
+    "ImportedModel": "botocraft.services.bedrock",
+    "ImportedModelManager": "botocraft.services.bedrock",
+    "InferenceAccelerator": "botocraft.services.ecs",
+    "InferenceAcceleratorOverride": "botocraft.services.ecs",
+    "InferenceConfiguration": "botocraft.services.bedrock_runtime",
+    "InferenceDeviceInfo": "botocraft.services.ec2",
+    "InferenceDeviceMemoryInfo": "botocraft.services.ec2",
+    "InferenceProfile": "botocraft.services.bedrock",
+    "InferenceProfileManager": "botocraft.services.bedrock",
+    "InferenceProfileModel": "botocraft.services.bedrock",
+    "InferenceProfileModelMixin": "botocraft.mixins.bedrock",
+    "InferenceProfileModelSource": "botocraft.services.bedrock",
+    "InfrastructureOptimization": "botocraft.services.ecs",
+    "IngressPathSummary": "botocraft.services.ecs",
+    "InputArtifact": "botocraft.services.codepipeline",
+    "InputSerialization": "botocraft.services.s3",
+    "Inspector2Filter": "botocraft.services.inspector2",
+    "Inspector2FilterManager": "botocraft.services.inspector2",
+    "Inspector2Resource": "botocraft.services.inspector2",
+    "InspectorScoreDetails": "botocraft.services.inspector2",
+    "Instance": "botocraft.services.ec2",
+    "InstanceAcceleratorCount": "botocraft.services.ec2",
+    "InstanceAcceleratorTotalMemoryMiB": "botocraft.services.ec2",
+    "InstanceAttachmentEnaSrdSpecification": "botocraft.services.ec2",
+    "InstanceAttachmentEnaSrdUdpSpecification": "botocraft.services.ec2",
+    "InstanceBaselineEbsBandwidthMbps": "botocraft.services.ec2",
+    "InstanceBlockDeviceMapping": "botocraft.services.ec2",
+    "InstanceBlockDeviceMappingSpecification": "botocraft.services.ec2",
+    "InstanceCreditSpecification": "botocraft.services.ec2",
+    "InstanceHealthCheckResult": "botocraft.services.ecs",
+    "InstanceIpv4Prefix": "botocraft.services.ec2",
+    "InstanceIpv6Address": "botocraft.services.ec2",
+    "InstanceIpv6AddressRequest": "botocraft.services.ec2",
+    "InstanceIpv6Prefix": "botocraft.services.ec2",
+    "InstanceLaunchTemplate": "botocraft.services.ecs",
+    "InstanceLaunchTemplateUpdate": "botocraft.services.ecs",
+    "InstanceMaintenanceOptions": "botocraft.services.ec2",
+    "InstanceMaintenanceOptionsRequest": "botocraft.services.ec2",
+    "InstanceManager": "botocraft.services.ec2",
+    "InstanceMarketOptionsRequest": "botocraft.services.ec2",
+    "InstanceMemoryGiBPerVCpu": "botocraft.services.ec2",
+    "InstanceMemoryMiB": "botocraft.services.ec2",
+    "InstanceMetadataOptions": "botocraft.services.autoscaling",
+    "InstanceMetadataOptionsRequest": "botocraft.services.ec2",
+    "InstanceMetadataOptionsResponse": "botocraft.services.ec2",
+    "InstanceModelMixin": "botocraft.mixins.ec2",
+    "InstanceNetworkBandwidthGbps": "botocraft.services.ec2",
+    "InstanceNetworkInterface": "botocraft.services.ec2",
+    "InstanceNetworkInterfaceAssociation": "botocraft.services.ec2",
+    "InstanceNetworkInterfaceAttachment": "botocraft.services.ec2",
+    "InstanceNetworkInterfaceCount": "botocraft.services.ec2",
+    "InstanceNetworkInterfaceSpecification": "botocraft.services.ec2",
+    "InstanceNetworkPerformanceOptions": "botocraft.services.ec2",
+    "InstanceNetworkPerformanceOptionsRequest": "botocraft.services.ec2",
+    "InstancePrivateIpAddress": "botocraft.services.ec2",
+    "InstanceProfile": "botocraft.services.iam",
+    "InstanceProfileManager": "botocraft.services.iam",
+    "InstanceRequirementsRequest": "botocraft.services.ec2",
+    "InstanceSecondaryInterface": "botocraft.services.ec2",
+    "InstanceSecondaryInterfaceAttachment": "botocraft.services.ec2",
+    "InstanceSecondaryInterfacePrivateIpAddress": "botocraft.services.ec2",
+    "InstanceSecondaryInterfacePrivateIpAddressRequest": "botocraft.services.ec2",
+    "InstanceSecondaryInterfaceSpecificationRequest": "botocraft.services.ec2",
+    "InstanceState": "botocraft.services.ec2",
+    "InstanceStateChange": "botocraft.services.ec2",
+    "InstanceTotalLocalStorageGB": "botocraft.services.ec2",
+    "InternalServerException": "botocraft.services.bedrock_runtime",
+    "InternetGateway": "botocraft.services.ec2",
+    "InternetGatewayAttachment": "botocraft.services.ec2",
+    "InternetGatewayManager": "botocraft.services.ec2",
+    "InvalidateProjectCacheOutput": "botocraft.services.codebuild",
+    "InvocationLogSource": "botocraft.services.bedrock",
+    "InvocationLogsConfig": "botocraft.services.bedrock",
+    "InvokeModelResponse": "botocraft.services.bedrock_runtime",
+    "InvokeModelResponseStream": "botocraft.mixins.bedrock_runtime",
+    "InvokeModelTokensRequest": "botocraft.services.bedrock_runtime",
+    "InvokeModelWithResponseStreamResponse": "botocraft.services.bedrock_runtime",
+    "InvokeModelWithResponseStreamResponseMixin": "botocraft.mixins.bedrock_runtime",
+    "IpPermission": "botocraft.services.ec2",
+    "IpRange": "botocraft.services.ec2",
+    "Ipv4PrefixSpecification": "botocraft.services.ec2",
+    "Ipv4PrefixSpecificationRequest": "botocraft.services.ec2",
+    "Ipv4PrefixSpecificationResponse": "botocraft.services.ec2",
+    "Ipv6CidrBlock": "botocraft.services.ec2",
+    "Ipv6PrefixSpecification": "botocraft.services.ec2",
+    "Ipv6PrefixSpecificationRequest": "botocraft.services.ec2",
+    "Ipv6PrefixSpecificationResponse": "botocraft.services.ec2",
+    "Ipv6Range": "botocraft.services.ec2",
+    "JSONInput": "botocraft.services.s3",
+    "JSONOutput": "botocraft.services.s3",
+    "JWTOptionsInput": "botocraft.services.opensearch",
+    "JWTOptionsOutput": "botocraft.services.opensearch",
+    "JobWorkerExecutorConfiguration": "botocraft.services.codepipeline",
+    "JsonSchemaDefinition": "botocraft.services.bedrock_runtime",
+    "JwtValidationActionAdditionalClaim": "botocraft.services.elbv2",
+    "JwtValidationActionConfig": "botocraft.services.elbv2",
+    "KMSKey": "botocraft.services.kms",
+    "KMSKeyManager": "botocraft.services.kms",
+    "KMSMultiRegionConfiguration": "botocraft.services.kms",
+    "KernelCapabilities": "botocraft.services.ecs",
+    "KeyListEntry": "botocraft.services.kms",
+    "KeyPair": "botocraft.services.ec2",
+    "KeyPairInfo": "botocraft.services.ec2",
+    "KeyPairManager": "botocraft.services.ec2",
+    "KeyUsage": "botocraft.services.acm",
+    "KeyValuePair": "botocraft.services.ecs",
+    "KinesisConsumer": "botocraft.services.kinesis",
+    "KinesisConsumerManager": "botocraft.services.kinesis",
+    "KinesisConsumerManagerMixin": "botocraft.mixins.kinesis",
+    "KinesisEnhancedMetrics": "botocraft.services.kinesis",
+    "KinesisFirehoseDestinationDetails": "botocraft.services.elasticache",
+    "KinesisRecord": "botocraft.services.kinesis",
+    "KinesisShard": "botocraft.services.kinesis",
+    "KinesisShardManager": "botocraft.services.kinesis",
+    "KinesisShardManagerMixin": "botocraft.mixins.kinesis",
+    "KinesisStream": "botocraft.services.kinesis",
+    "KinesisStreamManager": "botocraft.services.kinesis",
+    "KinesisStreamManagerMixin": "botocraft.mixins.kinesis",
+    "KinesisStreamModeDetails": "botocraft.services.kinesis",
+    "KinesisStreamModelMixin": "botocraft.mixins.kinesis",
+    "KinesisWarmThroughput": "botocraft.services.kinesis",
+    "LBCookieStickinessPolicy": "botocraft.services.elb",
+    "LabelOptions": "botocraft.services.cloudwatch",
+    "LambdaExecutorConfiguration": "botocraft.services.codepipeline",
+    "LambdaFunctionAggregation": "botocraft.services.inspector2",
+    "LambdaFunctionAggregationResponse": "botocraft.services.inspector2",
+    "LambdaGraderConfig": "botocraft.services.bedrock",
+    "LambdaLayerAggregation": "botocraft.services.inspector2",
+    "LambdaLayerAggregationResponse": "botocraft.services.inspector2",
+    "LambdaVpcConfig": "botocraft.services.inspector2",
+    "LaunchConfiguration": "botocraft.services.autoscaling",
+    "LaunchConfigurationManager": "botocraft.services.autoscaling",
+    "LaunchConfigurationsType": "botocraft.services.autoscaling",
+    "LaunchTemplate": "botocraft.services.ec2",
+    "LaunchTemplateBlockDeviceMapping": "botocraft.services.ec2",
+    "LaunchTemplateBlockDeviceMappingRequest": "botocraft.services.ec2",
+    "LaunchTemplateCapacityReservationSpecificationRequest": "botocraft.services.ec2",
+    "LaunchTemplateCapacityReservationSpecificationResponse": "botocraft.services.ec2",
+    "LaunchTemplateCpuOptions": "botocraft.services.ec2",
+    "LaunchTemplateCpuOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateEbsBlockDevice": "botocraft.services.ec2",
+    "LaunchTemplateEbsBlockDeviceRequest": "botocraft.services.ec2",
+    "LaunchTemplateElasticInferenceAccelerator": "botocraft.services.ec2",
+    "LaunchTemplateElasticInferenceAcceleratorResponse": "botocraft.services.ec2",
+    "LaunchTemplateEnaSrdSpecification": "botocraft.services.ec2",
+    "LaunchTemplateEnaSrdUdpSpecification": "botocraft.services.ec2",
+    "LaunchTemplateEnclaveOptions": "botocraft.services.ec2",
+    "LaunchTemplateEnclaveOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateHibernationOptions": "botocraft.services.ec2",
+    "LaunchTemplateHibernationOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateIamInstanceProfileSpecification": "botocraft.services.ec2",
+    "LaunchTemplateIamInstanceProfileSpecificationRequest": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMaintenanceOptions": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMaintenanceOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMarketOptions": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMarketOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMetadataOptions": "botocraft.services.ec2",
+    "LaunchTemplateInstanceMetadataOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateInstanceNetworkInterfaceSpecification": "botocraft.services.ec2",
+    "LaunchTemplateInstanceNetworkInterfaceSpecificationRequest": "botocraft.services.ec2",
+    "LaunchTemplateInstanceRequirements": "botocraft.services.ec2",
+    "LaunchTemplateInstanceSecondaryInterfaceSpecification": "botocraft.services.ec2",
+    "LaunchTemplateInstanceSecondaryInterfaceSpecificationRequest": "botocraft.services.ec2",
+    "LaunchTemplateLicenseConfiguration": "botocraft.services.ec2",
+    "LaunchTemplateLicenseConfigurationRequest": "botocraft.services.ec2",
+    "LaunchTemplateManager": "botocraft.services.ec2",
+    "LaunchTemplateNetworkPerformanceOptions": "botocraft.services.ec2",
+    "LaunchTemplateNetworkPerformanceOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateOverrides": "botocraft.services.autoscaling",
+    "LaunchTemplatePlacement": "botocraft.services.ec2",
+    "LaunchTemplatePlacementRequest": "botocraft.services.ec2",
+    "LaunchTemplatePrivateDnsNameOptions": "botocraft.services.ec2",
+    "LaunchTemplatePrivateDnsNameOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateSpotMarketOptions": "botocraft.services.ec2",
+    "LaunchTemplateSpotMarketOptionsRequest": "botocraft.services.ec2",
+    "LaunchTemplateTagSpecification": "botocraft.services.ec2",
+    "LaunchTemplateTagSpecificationRequest": "botocraft.services.ec2",
+    "LaunchTemplateVersion": "botocraft.services.ec2",
+    "LaunchTemplateVersionManager": "botocraft.services.ec2",
+    "LaunchTemplatesMonitoring": "botocraft.services.ec2",
+    "LaunchTemplatesMonitoringRequest": "botocraft.services.ec2",
+    "LegalTerm": "botocraft.services.bedrock",
+    "LicenseConfiguration": "botocraft.services.ec2",
+    "LicenseConfigurationRequest": "botocraft.services.ec2",
+    "LifecycleConfigurationDescription": "botocraft.services.efs",
+    "LifecycleExpiration": "botocraft.services.s3",
+    "LifecycleHookSpecification": "botocraft.services.autoscaling",
+    "LifecyclePolicy": "botocraft.services.efs",
+    "LifecycleRule": "botocraft.services.s3",
+    "LifecycleRuleAndOperator": "botocraft.services.s3",
+    "LifecycleRuleFilter": "botocraft.services.s3",
+    "LinearConfiguration": "botocraft.services.ecs",
+    "LinuxParameters": "botocraft.services.ecs",
+    "ListAccessKeysResponse": "botocraft.services.iam",
+    "ListAccessKeysResponseAccessKeyMetadata": "botocraft.services.iam",
+    "ListActionTypesOutput": "botocraft.services.codepipeline",
+    "ListAgentsResponse": "botocraft.services.datasync",
+    "ListAlarmMuteRulesOutput": "botocraft.services.cloudwatch",
+    "ListAsyncInvokesResponse": "botocraft.services.bedrock_runtime",
+    "ListAttachedGroupPoliciesResponse": "botocraft.services.iam",
+    "ListAttachedRolePoliciesResponse": "botocraft.services.iam",
+    "ListAttachedUserPoliciesResponse": "botocraft.services.iam",
+    "ListAutomatedReasoningPoliciesResponse": "botocraft.services.bedrock",
+    "ListAutomatedReasoningPolicyBuildWorkflowsResponse": "botocraft.services.bedrock",
+    "ListAutomatedReasoningPolicyTestCasesResponse": "botocraft.services.bedrock",
+    "ListAutomatedReasoningPolicyTestResultsResponse": "botocraft.services.bedrock",
+    "ListBucketsOutput": "botocraft.services.s3",
+    "ListBuildBatchesForProjectOutput": "botocraft.services.codebuild",
+    "ListBuildBatchesOutput": "botocraft.services.codebuild",
+    "ListBuildsForProjectOutput": "botocraft.services.codebuild",
+    "ListBuildsOutput": "botocraft.services.codebuild",
+    "ListCertificatesResponse": "botocraft.services.acm",
+    "ListCidrBlocksResponse": "botocraft.services.route53",
+    "ListCidrCollectionsResponse": "botocraft.services.route53",
+    "ListCisScanConfigurationsFilterCriteria": "botocraft.services.inspector2",
+    "ListCisScanConfigurationsResponse": "botocraft.services.inspector2",
+    "ListClustersResponse": "botocraft.services.ecs",
+    "ListCommandExecutionsForSandboxOutput": "botocraft.services.codebuild",
+    "ListConfigurationSetsResponse": "botocraft.services.sesv2",
+    "ListConnectionsOutput": "botocraft.services.codeconnections",
+    "ListContactListsResponse": "botocraft.services.sesv2",
+    "ListContainerInstancesResponse": "botocraft.services.ecs",
+    "ListCuratedEnvironmentImagesOutput": "botocraft.services.codebuild",
+    "ListCustomModelsResponse": "botocraft.services.bedrock",
+    "ListCustomVerificationEmailTemplatesResponse": "botocraft.services.ses",
+    "ListDashboardsOutput": "botocraft.services.cloudwatch",
+    "ListDedicatedIpPoolsResponse": "botocraft.services.sesv2",
+    "ListDelegatedAdminAccountsResponse": "botocraft.services.inspector2",
+    "ListDeliverabilityTestReportsResponse": "botocraft.services.sesv2",
+    "ListDiscoverersResponse": "botocraft.services.schemas",
+    "ListEmailTemplatesResponse": "botocraft.services.sesv2",
+    "ListEnforcedGuardrailsConfigurationResponse": "botocraft.services.bedrock",
+    "ListEntitiesForPolicyResponse": "botocraft.services.iam",
+    "ListEvaluationJobsResponse": "botocraft.services.bedrock",
+    "ListEventBusesResponse": "botocraft.services.events",
+    "ListFiltersResponse": "botocraft.services.inspector2",
+    "ListFindingAggregationsResponse": "botocraft.services.inspector2",
+    "ListFindingsResponse": "botocraft.services.inspector2",
+    "ListFleetsOutput": "botocraft.services.codebuild",
+    "ListFoundationModelAgreementOffersResponse": "botocraft.services.bedrock",
+    "ListFoundationModelsResponse": "botocraft.services.bedrock",
+    "ListGroupPoliciesResponse": "botocraft.services.iam",
+    "ListGroupsForUserResponse": "botocraft.services.iam",
+    "ListGroupsResponse": "botocraft.services.iam",
+    "ListGuardrailsResponse": "botocraft.services.bedrock",
+    "ListHostedZonesByNameResponse": "botocraft.services.route53",
+    "ListHostedZonesByVPCResponse": "botocraft.services.route53",
+    "ListHostedZonesResponse": "botocraft.services.route53",
+    "ListHostsOutput": "botocraft.services.codeconnections",
+    "ListIdentitiesResponse": "botocraft.services.ses",
+    "ListImagesFilter": "botocraft.services.ecr",
+    "ListImagesResponse": "botocraft.services.ecr",
+    "ListImportedModelsResponse": "botocraft.services.bedrock",
+    "ListInferenceProfilesResponse": "botocraft.services.bedrock",
+    "ListInstanceProfilesForRoleResponse": "botocraft.services.iam",
+    "ListInstanceProfilesResponse": "botocraft.services.iam",
+    "ListKeysResponse": "botocraft.services.kms",
+    "ListLocationsResponse": "botocraft.services.datasync",
+    "ListMarketplaceModelEndpointsResponse": "botocraft.services.bedrock",
+    "ListMetricStreamsOutput": "botocraft.services.cloudwatch",
+    "ListMetricsOutput": "botocraft.services.cloudwatch",
+    "ListModelCopyJobsResponse": "botocraft.services.bedrock",
+    "ListModelCustomizationJobsResponse": "botocraft.services.bedrock",
+    "ListModelInvocationJobsResponse": "botocraft.services.bedrock",
+    "ListMultiRegionEndpointsResponse": "botocraft.services.sesv2",
+    "ListObjectVersionsOutput": "botocraft.services.s3",
+    "ListObjectsV2Output": "botocraft.services.s3",
+    "ListPipelineExecutionsOutput": "botocraft.services.codepipeline",
+    "ListPipelinesOutput": "botocraft.services.codepipeline",
+    "ListPoliciesResponse": "botocraft.services.iam",
+    "ListPolicyVersionsResponse": "botocraft.services.iam",
+    "ListProjectsOutput": "botocraft.services.codebuild",
+    "ListPromptRoutersResponse": "botocraft.services.bedrock",
+    "ListProvisionedModelThroughputsResponse": "botocraft.services.bedrock",
+    "ListQueryLoggingConfigsResponse": "botocraft.services.route53",
+    "ListQueuesResult": "botocraft.services.sqs",
+    "ListReceiptFiltersResponse": "botocraft.services.ses",
+    "ListReceiptRuleSetsResponse": "botocraft.services.ses",
+    "ListRegistriesResponse": "botocraft.services.schemas",
+    "ListReportGroupsOutput": "botocraft.services.codebuild",
+    "ListReportsForReportGroupOutput": "botocraft.services.codebuild",
+    "ListReportsOutput": "botocraft.services.codebuild",
+    "ListRepositorySyncDefinitionsOutput": "botocraft.services.codeconnections",
+    "ListResourceRecordSetsResponse": "botocraft.services.route53",
+    "ListRolePoliciesResponse": "botocraft.services.iam",
+    "ListRolesResponse": "botocraft.services.iam",
+    "ListRuleNamesByTargetResponse": "botocraft.services.events",
+    "ListRulesResponse": "botocraft.services.events",
+    "ListSSHPublicKeysResponse": "botocraft.services.iam",
+    "ListSandboxesForProjectOutput": "botocraft.services.codebuild",
+    "ListSandboxesOutput": "botocraft.services.codebuild",
+    "ListSchemaVersionsResponse": "botocraft.services.schemas",
+    "ListSchemasResponse": "botocraft.services.schemas",
+    "ListSecretVersionIdsResponse": "botocraft.services.secretsmanager",
+    "ListSecretsResponse": "botocraft.services.secretsmanager",
+    "ListServiceDeploymentsResponse": "botocraft.services.ecs",
+    "ListServicesResponse": "botocraft.services.ecs",
+    "ListSharedProjectsOutput": "botocraft.services.codebuild",
+    "ListSharedReportGroupsOutput": "botocraft.services.codebuild",
+    "ListSourceCredentialsOutput": "botocraft.services.codebuild",
+    "ListStreamConsumersOutput": "botocraft.services.kinesis",
+    "ListStreamsOutput": "botocraft.services.kinesis",
+    "ListSuppressedDestinationsResponse": "botocraft.services.sesv2",
+    "ListSyncConfigurationsOutput": "botocraft.services.codeconnections",
+    "ListTagsForResourceResponse": "botocraft.services.ecr",
+    "ListTargetsByRuleResponse": "botocraft.services.events",
+    "ListTaskDefinitionFamiliesResponse": "botocraft.services.ecs",
+    "ListTaskDefinitionsResponse": "botocraft.services.ecs",
+    "ListTaskExecutionsResponse": "botocraft.services.datasync",
+    "ListTasksResponse": "botocraft.services.ecs",
+    "ListTemplatesResponse": "botocraft.services.ses",
+    "ListTenantsResponse": "botocraft.services.sesv2",
+    "ListUserPoliciesResponse": "botocraft.services.iam",
+    "ListUsersResponse": "botocraft.services.iam",
+    "ListVPCAssociationAuthorizationsResponse": "botocraft.services.route53",
+    "Listener": "botocraft.services.elbv2",
+    "ListenerDescription": "botocraft.services.elb",
+    "ListenerManager": "botocraft.services.elbv2",
+    "Literal": "typing",
+    "LoadBalancer": "botocraft.services.elbv2",
+    "LoadBalancerAddress": "botocraft.services.elbv2",
+    "LoadBalancerAttribute": "botocraft.services.elbv2",
+    "LoadBalancerConfiguration": "botocraft.services.ecs",
+    "LoadBalancerManager": "botocraft.services.elbv2",
+    "LoadBalancerManagerMixin": "botocraft.mixins.elbv2",
+    "LoadBalancerState": "botocraft.services.elbv2",
+    "LocationFilter": "botocraft.services.datasync",
+    "LocationListEntry": "botocraft.services.datasync",
+    "LockSnapshotResult": "botocraft.services.ec2",
+    "LockedSnapshotsInfo": "botocraft.services.ec2",
+    "LogConfiguration": "botocraft.services.ecs",
+    "LogDeliveryConfiguration": "botocraft.services.elasticache",
+    "LogDeliveryConfigurationRequest": "botocraft.services.elasticache",
+    "LogGroup": "botocraft.services.logs",
+    "LogGroupField": "botocraft.services.logs",
+    "LogGroupManager": "botocraft.services.logs",
+    "LogGroupManagerMixin": "botocraft.mixins.logs",
+    "LogPublishingOption": "botocraft.services.opensearch",
+    "LogPublishingOptionsStatus": "botocraft.services.opensearch",
+    "LogsConfig": "botocraft.services.codebuild",
+    "LogsLocation": "botocraft.services.codebuild",
+    "ManagedAgent": "botocraft.services.ecs",
+    "ManagedApplicationAutoScalingPolicy": "botocraft.services.ecs",
+    "ManagedAutoScaling": "botocraft.services.ecs",
+    "ManagedCertificate": "botocraft.services.ecs",
+    "ManagedIngressPath": "botocraft.services.ecs",
+    "ManagedInstancesLocalStorageConfiguration": "botocraft.services.ecs",
+    "ManagedInstancesNetworkConfiguration": "botocraft.services.ecs",
+    "ManagedInstancesProvider": "botocraft.services.ecs",
+    "ManagedInstancesStorageConfiguration": "botocraft.services.ecs",
+    "ManagedListener": "botocraft.services.ecs",
+    "ManagedListenerRule": "botocraft.services.ecs",
+    "ManagedLoadBalancer": "botocraft.services.ecs",
+    "ManagedLogGroup": "botocraft.services.ecs",
+    "ManagedMetricAlarm": "botocraft.services.ecs",
+    "ManagedScalableTarget": "botocraft.services.ecs",
+    "ManagedScaling": "botocraft.services.ecs",
+    "ManagedSecurityGroup": "botocraft.services.ecs",
+    "ManagedStorageConfiguration": "botocraft.services.ecs",
+    "ManagedTargetGroup": "botocraft.services.ecs",
+    "MapFilter": "botocraft.services.inspector2",
+    "MarketplaceModelEndpoint": "botocraft.services.bedrock",
+    "MarketplaceModelEndpointManager": "botocraft.services.bedrock",
+    "MarketplaceModelEndpointSummary": "botocraft.services.bedrock",
+    "MediaDeviceInfo": "botocraft.services.ec2",
+    "MediaDeviceMemoryInfo": "botocraft.services.ec2",
+    "MemoryGiBPerVCpuRequest": "botocraft.services.autoscaling",
+    "MemoryMiBRequest": "botocraft.services.ec2",
+    "Message": "botocraft.services.sqs",
+    "MessageAttributeValue": "botocraft.services.sqs",
+    "MessageHeader": "botocraft.services.sesv2",
+    "MessageManager": "botocraft.services.sqs",
+    "MessageModelMixin": "botocraft.mixins.sqs",
+    "MessageStartEvent": "botocraft.services.bedrock_runtime",
+    "MessageStopEvent": "botocraft.services.bedrock_runtime",
+    "MessageSystemAttributeValue": "botocraft.services.sqs",
+    "MetricAlarm": "botocraft.services.cloudwatch",
+    "MetricAlarmManager": "botocraft.services.cloudwatch",
+    "MetricDatum": "botocraft.services.cloudwatch",
+    "MetricDimension": "botocraft.services.application_autoscaling",
+    "MetricStreamStatisticsMetric": "botocraft.services.cloudwatch",
+    "ModelCopyJob": "botocraft.services.bedrock",
+    "ModelCopyJobManager": "botocraft.services.bedrock",
+    "ModelCustomizationJob": "botocraft.services.bedrock",
+    "ModelCustomizationJobManager": "botocraft.services.bedrock",
+    "ModelCustomizationJobSummary": "botocraft.services.bedrock",
+    "ModelDataSource": "botocraft.services.bedrock",
+    "ModelEnforcement": "botocraft.services.bedrock",
+    "ModelInputPayload": "botocraft.services.bedrock_runtime",
+    "ModelInvocationJob": "botocraft.services.bedrock",
+    "ModelInvocationJobInputDataConfig": "botocraft.services.bedrock",
+    "ModelInvocationJobManager": "botocraft.services.bedrock",
+    "ModelInvocationJobOutputDataConfig": "botocraft.services.bedrock",
+    "ModelInvocationJobS3InputDataConfig": "botocraft.services.bedrock",
+    "ModelInvocationJobS3OutputDataConfig": "botocraft.services.bedrock",
+    "ModelInvocationLoggingConfiguration": "botocraft.services.bedrock",
+    "ModelInvocationLoggingConfigurationManager": "botocraft.services.bedrock",
+    "ModelInvocationLoggingConfigurationModelMixin": "botocraft.mixins.bedrock",
+    "ModelStreamErrorException": "botocraft.services.bedrock_runtime",
+    "ModelTimeoutException": "botocraft.services.bedrock_runtime",
+    "ModelType": "botocraft.services.ec2",
+    "ModifyAdditionalStorageVolume": "botocraft.services.rds",
+    "ModifyCacheClusterResult": "botocraft.services.elasticache",
+    "ModifyCacheSubnetGroupResult": "botocraft.services.elasticache",
+    "ModifyDBClusterResult": "botocraft.services.docdb",
+    "ModifyDBInstanceResult": "botocraft.services.rds",
+    "ModifyDBSubnetGroupResult": "botocraft.services.rds",
+    "ModifyListenerOutput": "botocraft.services.elbv2",
+    "ModifyLoadBalancerAttributesOutput": "botocraft.services.elb",
+    "ModifyReplicationGroupResult": "botocraft.services.elasticache",
+    "ModifyRuleOutput": "botocraft.services.elbv2",
+    "ModifyTargetGroupOutput": "botocraft.services.elbv2",
+    "ModifyVolumeResult": "botocraft.services.ec2",
+    "ModifyVpcEndpointResult": "botocraft.services.ec2",
+    "ModifyVpcPeeringConnectionOptionsResult": "botocraft.services.ec2",
+    "ModifyVpnConnectionResult": "botocraft.services.ec2",
+    "MonthlySchedule": "botocraft.services.inspector2",
+    "MountPoint": "botocraft.services.ecs",
+    "MountTarget": "botocraft.services.efs",
+    "MountTargetManager": "botocraft.services.efs",
+    "MountTargetManagerMixin": "botocraft.mixins.efs",
+    "MountTargetModelMixin": "botocraft.mixins.efs",
+    "MultiRegionEndpoint": "botocraft.services.sesv2",
+    "MultiRegionEndpointManager": "botocraft.services.sesv2",
+    "MultiRegionKey": "botocraft.services.kms",
+    "MutualAuthenticationAttributes": "botocraft.services.elbv2",
+    "NatGateway": "botocraft.services.ec2",
+    "NatGatewayAddress": "botocraft.services.ec2",
+    "NatGatewayAttachedAppliance": "botocraft.services.ec2",
+    "NatGatewayManager": "botocraft.services.ec2",
+    "NaturalLanguageQueryGenerationOptionsInput": "botocraft.services.opensearch",
+    "NaturalLanguageQueryGenerationOptionsOutput": "botocraft.services.opensearch",
+    "NetworkAcl": "botocraft.services.ec2",
+    "NetworkAclAssociation": "botocraft.services.ec2",
+    "NetworkAclEntry": "botocraft.services.ec2",
+    "NetworkAclManager": "botocraft.services.ec2",
+    "NetworkAclPortRange": "botocraft.services.ec2",
+    "NetworkBandwidthGbpsRequest": "botocraft.services.autoscaling",
+    "NetworkBinding": "botocraft.services.ecs",
+    "NetworkCardInfo": "botocraft.services.ec2",
+    "NetworkConfiguration": "botocraft.services.ecs",
+    "NetworkInterface": "botocraft.services.ec2",
+    "NetworkInterfaceAssociation": "botocraft.services.ec2",
+    "NetworkInterfaceAttachment": "botocraft.services.ec2",
+    "NetworkInterfaceAttachmentChanges": "botocraft.services.ec2",
+    "NetworkInterfaceCountRequest": "botocraft.services.ec2",
+    "NetworkInterfaceIpv6Address": "botocraft.services.ec2",
+    "NetworkInterfaceManager": "botocraft.services.ec2",
+    "NetworkInterfacePermission": "botocraft.services.ec2",
+    "NetworkInterfacePermissionState": "botocraft.services.ec2",
+    "NetworkInterfacePrivateIpAddress": "botocraft.services.ec2",
+    "NetworkPath": "botocraft.services.inspector2",
+    "NetworkReachabilityDetails": "botocraft.services.inspector2",
+    "NeuronDeviceCoreInfo": "botocraft.services.ec2",
+    "NeuronDeviceInfo": "botocraft.services.ec2",
+    "NeuronDeviceMemoryInfo": "botocraft.services.ec2",
+    "NewDhcpConfiguration": "botocraft.services.ec2",
+    "NodeGroup": "botocraft.services.elasticache",
+    "NodeGroupConfiguration": "botocraft.services.elasticache",
+    "NodeGroupMember": "botocraft.services.elasticache",
+    "NodeOption": "botocraft.services.opensearch",
+    "NodeToNodeEncryptionOptionsStatus": "botocraft.services.opensearch",
+    "NoncurrentVersionTransition": "botocraft.services.s3",
+    "NumberFilter": "botocraft.services.inspector2",
+    "OTelEnrichmentStatus": "botocraft.services.cloudwatch",
+    "OTelEnrichmentStatusManager": "botocraft.services.cloudwatch",
+    "ObjectIdentifier": "botocraft.services.s3",
+    "ObjectLockRetention": "botocraft.services.s3",
+    "ObjectPart": "botocraft.services.s3",
+    "ObjectVersion": "botocraft.services.s3",
+    "OffPeakWindowOptionsStatus": "botocraft.services.opensearch",
+    "Offer": "botocraft.services.bedrock",
+    "OneTimeSchedule": "botocraft.services.inspector2",
+    "OpenSearchAdvancedSecurityOptions": "botocraft.services.opensearch",
+    "OpenSearchAutoTuneOptions": "botocraft.services.opensearch",
+    "OpenSearchAutomatedSnapshotPauseOptions": "botocraft.services.opensearch",
+    "OpenSearchChangeProgressDetails": "botocraft.services.opensearch",
+    "OpenSearchClusterConfig": "botocraft.services.opensearch",
+    "OpenSearchCognitoOptions": "botocraft.services.opensearch",
+    "OpenSearchColdStorageOptions": "botocraft.services.opensearch",
+    "OpenSearchDeploymentStrategyOptions": "botocraft.services.opensearch",
+    "OpenSearchDomain": "botocraft.services.opensearch",
+    "OpenSearchDomainConfig": "botocraft.services.opensearch",
+    "OpenSearchDomainEndpointOptions": "botocraft.services.opensearch",
+    "OpenSearchDomainManager": "botocraft.services.opensearch",
+    "OpenSearchDomainManagerMixin": "botocraft.mixins.opensearch",
+    "OpenSearchDryRunProgressStatus": "botocraft.services.opensearch",
+    "OpenSearchDryRunResults": "botocraft.services.opensearch",
+    "OpenSearchDuration": "botocraft.services.opensearch",
+    "OpenSearchEBSOptions": "botocraft.services.opensearch",
+    "OpenSearchEncryptionAtRestOptions": "botocraft.services.opensearch",
+    "OpenSearchErrorDetails": "botocraft.services.opensearch",
+    "OpenSearchIdentityCenterOptions": "botocraft.services.opensearch",
+    "OpenSearchMasterUserOptions": "botocraft.services.opensearch",
+    "OpenSearchModifyingProperties": "botocraft.services.opensearch",
+    "OpenSearchNodeConfig": "botocraft.services.opensearch",
+    "OpenSearchNodeToNodeEncryptionOptions": "botocraft.services.opensearch",
+    "OpenSearchOffPeakWindow": "botocraft.services.opensearch",
+    "OpenSearchOffPeakWindowOptions": "botocraft.services.opensearch",
+    "OpenSearchPackage": "botocraft.services.opensearch",
+    "OpenSearchPackageConfiguration": "botocraft.services.opensearch",
+    "OpenSearchPackageEncryptionOptions": "botocraft.services.opensearch",
+    "OpenSearchPackageManager": "botocraft.services.opensearch",
+    "OpenSearchPackageManagerMixin": "botocraft.mixins.opensearch",
+    "OpenSearchPackageVendingOptions": "botocraft.services.opensearch",
+    "OpenSearchPluginProperties": "botocraft.services.opensearch",
+    "OpenSearchS3VectorsEngine": "botocraft.services.opensearch",
+    "OpenSearchServerlessVectorAcceleration": "botocraft.services.opensearch",
+    "OpenSearchServiceSoftwareOptions": "botocraft.services.opensearch",
+    "OpenSearchSnapshotOptions": "botocraft.services.opensearch",
+    "OpenSearchSoftwareUpdateOptions": "botocraft.services.opensearch",
+    "OpenSearchVPCDerivedInfo": "botocraft.services.opensearch",
+    "OpenSearchVPCOptions": "botocraft.services.opensearch",
+    "OpenSearchVpcEndpoint": "botocraft.services.opensearch",
+    "OpenSearchVpcEndpointManager": "botocraft.services.opensearch",
+    "OpenSearchVpcEndpointSummary": "botocraft.services.opensearch",
+    "OpenSearchWindowStartTime": "botocraft.services.opensearch",
+    "OpenSearchZoneAwarenessConfig": "botocraft.services.opensearch",
+    "OperatorRequest": "botocraft.services.ec2",
+    "OperatorResponse": "botocraft.services.ec2",
+    "OptionGroupMembership": "botocraft.services.rds",
+    "OptionStatus": "botocraft.services.opensearch",
+    "OrderedDict": "collections",
+    "Outpost": "botocraft.services.rds",
+    "OutputArtifact": "botocraft.services.codepipeline",
+    "OutputConfig": "botocraft.services.bedrock_runtime",
+    "OutputDataConfig": "botocraft.services.bedrock",
+    "OutputFormat": "botocraft.services.bedrock_runtime",
+    "OutputFormatStructure": "botocraft.services.bedrock_runtime",
+    "OutputSerialization": "botocraft.services.s3",
+    "PackageAggregation": "botocraft.services.inspector2",
+    "PackageAggregationResponse": "botocraft.services.inspector2",
+    "PackageFilter": "botocraft.services.inspector2",
+    "PackageSource": "botocraft.services.opensearch",
+    "PackageVulnerabilityDetails": "botocraft.services.inspector2",
+    "Parameter": "botocraft.services.ssm",
+    "ParameterInlinePolicy": "botocraft.services.ssm",
+    "ParameterManager": "botocraft.services.ssm",
+    "ParameterMetadata": "botocraft.services.ssm",
+    "ParameterMetadataSummary": "botocraft.services.ssm",
+    "ParameterNameValue": "botocraft.services.elasticache",
+    "ParameterStringFilter": "botocraft.services.ssm",
+    "ParametersFilter": "botocraft.services.ssm",
+    "ParquetInput": "botocraft.services.s3",
+    "PartialFailure": "botocraft.services.cloudwatch",
+    "PathPatternConditionConfig": "botocraft.services.elbv2",
+    "PayloadPart": "botocraft.services.bedrock_runtime",
+    "PeeringConnectionOptions": "botocraft.services.ec2",
+    "PeeringConnectionOptionsRequest": "botocraft.services.ec2",
+    "PendingLogDeliveryConfiguration": "botocraft.services.elasticache",
+    "PerformanceConfiguration": "botocraft.services.bedrock_runtime",
+    "PerformanceFactorReference": "botocraft.services.ec2",
+    "PerformanceFactorReferenceRequest": "botocraft.services.ec2",
+    "Phase1DHGroupNumbersListValue": "botocraft.services.ec2",
+    "Phase1DHGroupNumbersRequestListValue": "botocraft.services.ec2",
+    "Phase1EncryptionAlgorithmsListValue": "botocraft.services.ec2",
+    "Phase1EncryptionAlgorithmsRequestListValue": "botocraft.services.ec2",
+    "Phase1IntegrityAlgorithmsListValue": "botocraft.services.ec2",
+    "Phase1IntegrityAlgorithmsRequestListValue": "botocraft.services.ec2",
+    "Phase2DHGroupNumbersListValue": "botocraft.services.ec2",
+    "Phase2DHGroupNumbersRequestListValue": "botocraft.services.ec2",
+    "Phase2EncryptionAlgorithmsListValue": "botocraft.services.ec2",
+    "Phase2EncryptionAlgorithmsRequestListValue": "botocraft.services.ec2",
+    "Phase2IntegrityAlgorithmsListValue": "botocraft.services.ec2",
+    "Phase2IntegrityAlgorithmsRequestListValue": "botocraft.services.ec2",
+    "PhaseContext": "botocraft.services.codebuild",
+    "Pipeline": "botocraft.services.codepipeline",
+    "PipelineExecution": "botocraft.services.codepipeline",
+    "PipelineExecutionFilter": "botocraft.services.codepipeline",
+    "PipelineExecutionManager": "botocraft.services.codepipeline",
+    "PipelineExecutionSummary": "botocraft.services.codepipeline",
+    "PipelineManager": "botocraft.services.codepipeline",
+    "PipelineMetadata": "botocraft.services.codepipeline",
+    "PipelineRollbackMetadata": "botocraft.services.codepipeline",
+    "PipelineSummary": "botocraft.services.codepipeline",
+    "PipelineTriggerDeclaration": "botocraft.services.codepipeline",
+    "PipelineVariable": "botocraft.services.codepipeline",
+    "PipelineVariableDeclaration": "botocraft.services.codepipeline",
+    "PlacementConstraint": "botocraft.services.ecs",
+    "PlacementGroup": "botocraft.services.ec2",
+    "PlacementGroupManager": "botocraft.services.ec2",
+    "PlacementStrategy": "botocraft.services.ecs",
+    "PolicyAttribute": "botocraft.services.elb",
+    "PolicyAttributeDescription": "botocraft.services.elb",
+    "PolicyAttributeTypeDescription": "botocraft.services.elb",
+    "PolicyDescription": "botocraft.services.elb",
+    "PolicyGroup": "botocraft.services.iam",
+    "PolicyRole": "botocraft.services.iam",
+    "PolicyTypeDescription": "botocraft.services.elb",
+    "PolicyUser": "botocraft.services.iam",
+    "PortMapping": "botocraft.services.ecs",
+    "PortRange": "botocraft.services.inspector2",
+    "PortRangeFilter": "botocraft.services.inspector2",
+    "PredictiveScalingCustomizedMetricSpecification": "botocraft.services.application_autoscaling",
+    "PredictiveScalingMetric": "botocraft.services.application_autoscaling",
+    "PredictiveScalingMetricDataQuery": "botocraft.services.application_autoscaling",
+    "PredictiveScalingMetricDimension": "botocraft.services.application_autoscaling",
+    "PredictiveScalingMetricSpecification": "botocraft.services.application_autoscaling",
+    "PredictiveScalingMetricStat": "botocraft.services.application_autoscaling",
+    "PredictiveScalingPredefinedLoadMetricSpecification": "botocraft.services.application_autoscaling",
+    "PredictiveScalingPredefinedMetricPairSpecification": "botocraft.services.application_autoscaling",
+    "PredictiveScalingPredefinedScalingMetricSpecification": "botocraft.services.application_autoscaling",
+    "PrefixListId": "botocraft.services.ec2",
+    "PricingTerm": "botocraft.services.bedrock",
+    "PrimaryBoto3Model": "botocraft.services.abstract",
+    "PrimaryBoto3ModelQuerySet": "botocraft.services.abstract",
+    "PrivateDnsNameOptionsRequest": "botocraft.services.ec2",
+    "PrivateDnsNameOptionsResponse": "botocraft.services.ec2",
+    "PrivateIpAddressSpecification": "botocraft.services.ec2",
+    "ProcessorFeature": "botocraft.services.rds",
+    "ProductCode": "botocraft.services.ec2",
+    "Progress": "botocraft.services.s3",
+    "ProgressEvent": "botocraft.services.s3",
+    "Project": "botocraft.services.codebuild",
+    "ProjectArtifacts": "botocraft.services.codebuild",
+    "ProjectBadge": "botocraft.services.codebuild",
+    "ProjectBuildBatchConfig": "botocraft.services.codebuild",
+    "ProjectCache": "botocraft.services.codebuild",
+    "ProjectEnvironment": "botocraft.services.codebuild",
+    "ProjectFileSystemLocation": "botocraft.services.codebuild",
+    "ProjectFleet": "botocraft.services.codebuild",
+    "ProjectManager": "botocraft.services.codebuild",
+    "ProjectSource": "botocraft.services.codebuild",
+    "ProjectSourceVersion": "botocraft.services.codebuild",
+    "PromptRouter": "botocraft.services.bedrock",
+    "PromptRouterManager": "botocraft.services.bedrock",
+    "PromptRouterModelMixin": "botocraft.mixins.bedrock",
+    "PromptRouterTargetModel": "botocraft.services.bedrock",
+    "PromptRouterTrace": "botocraft.services.bedrock_runtime",
+    "PromptVariableValues": "botocraft.services.bedrock_runtime",
+    "PropagatingVgw": "botocraft.services.ec2",
+    "ProvisionedModelThroughput": "botocraft.services.bedrock",
+    "ProvisionedModelThroughputManager": "botocraft.services.bedrock",
+    "ProxyConfiguration": "botocraft.services.codebuild",
+    "PullRequestBuildPolicy": "botocraft.services.codebuild",
+    "PutBucketLifecycleConfigurationOutput": "botocraft.services.s3",
+    "PutEnforcedGuardrailConfigurationResponse": "botocraft.services.bedrock",
+    "PutEventsRequestEntry": "botocraft.services.events",
+    "PutEventsResponse": "botocraft.services.events",
+    "PutEventsResultEntry": "botocraft.services.events",
+    "PutModelInvocationLoggingConfigurationResponse": "botocraft.services.bedrock",
+    "PutObjectAclOutput": "botocraft.services.s3",
+    "PutObjectLegalHoldOutput": "botocraft.services.s3",
+    "PutObjectLockConfigurationOutput": "botocraft.services.s3",
+    "PutObjectOutput": "botocraft.services.s3",
+    "PutObjectRetentionOutput": "botocraft.services.s3",
+    "PutObjectTaggingOutput": "botocraft.services.s3",
+    "PutParameterResult": "botocraft.services.ssm",
+    "PutResourcePolicyOutput": "botocraft.services.codebuild",
+    "PutResourcePolicyResponse": "botocraft.services.secretsmanager",
+    "PutRuleResponse": "botocraft.services.events",
+    "PutScalingPolicyResponse": "botocraft.services.application_autoscaling",
+    "PutSecretValueResponse": "botocraft.services.secretsmanager",
+    "PutTargetsResponse": "botocraft.services.events",
+    "PutTargetsResultEntry": "botocraft.services.events",
+    "QueryStringConditionConfig": "botocraft.services.elbv2",
+    "QueryStringKeyValuePair": "botocraft.services.elbv2",
+    "Queue": "botocraft.services.sqs",
+    "QueueManager": "botocraft.services.sqs",
+    "QueueManagerMixin": "botocraft.mixins.sqs",
+    "QueueModelMixin": "botocraft.mixins.sqs",
+    "RDSAvailabilityZone": "botocraft.services.rds",
+    "RDSCertificateDetails": "botocraft.services.rds",
+    "RDSDBSubnetGroup": "botocraft.services.rds",
+    "RDSDBSubnetGroupManager": "botocraft.services.rds",
+    "RDSEndpoint": "botocraft.services.rds",
+    "RDSInstanceModelMixin": "botocraft.mixins.rds",
+    "RDSMasterUserSecret": "botocraft.services.rds",
+    "RDSPendingCloudwatchLogsExports": "botocraft.services.rds",
+    "RDSPendingModifiedValues": "botocraft.services.rds",
+    "RDSSubnet": "botocraft.services.rds",
+    "RDSTagSpecification": "botocraft.services.rds",
+    "RFTConfig": "botocraft.services.bedrock",
+    "RFTHyperParameters": "botocraft.services.bedrock",
+    "Range": "botocraft.services.cloudwatch",
+    "RawMessage": "botocraft.services.sesv2",
+    "ReadonlyBoto3Model": "botocraft.services.abstract",
+    "ReadonlyBoto3ModelManager": "botocraft.services.abstract",
+    "ReadonlyPrimaryBoto3Model": "botocraft.services.abstract",
+    "ReasoningContentBlock": "botocraft.services.bedrock_runtime",
+    "ReasoningContentBlockDelta": "botocraft.services.bedrock_runtime",
+    "ReasoningTextBlock": "botocraft.services.bedrock_runtime",
+    "RebootDBInstanceResult": "botocraft.services.docdb",
+    "ReceiptAction": "botocraft.services.ses",
+    "ReceiptIpFilter": "botocraft.services.ses",
+    "ReceiptRule": "botocraft.services.ses",
+    "ReceiveMessageResult": "botocraft.services.sqs",
+    "Recommendation": "botocraft.services.inspector2",
+    "RecordsEvent": "botocraft.services.s3",
+    "Redirect": "botocraft.services.s3",
+    "RedirectActionConfig": "botocraft.services.elbv2",
+    "ReferencedSecurityGroup": "botocraft.services.ec2",
+    "RegisterEndPointsOutput": "botocraft.services.elb",
+    "RegisterMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "RegisterScalableTargetResponse": "botocraft.services.application_autoscaling",
+    "RegisterTaskDefinitionResponse": "botocraft.services.ecs",
+    "Registry": "botocraft.services.schemas",
+    "RegistryCredential": "botocraft.services.codebuild",
+    "RegistryManager": "botocraft.services.schemas",
+    "RejectVpcPeeringConnectionResult": "botocraft.services.ec2",
+    "Remediation": "botocraft.services.inspector2",
+    "RemoveAvailabilityZonesOutput": "botocraft.services.elb",
+    "RemoveTagsOutput": "botocraft.services.elb",
+    "RemoveTargetsResponse": "botocraft.services.events",
+    "RemoveTargetsResultEntry": "botocraft.services.events",
+    "RenameObjectOutput": "botocraft.services.s3",
+    "ReplicaRegionType": "botocraft.services.secretsmanager",
+    "ReplicationConfiguration": "botocraft.services.efs",
+    "ReplicationConfigurationManager": "botocraft.services.efs",
+    "ReplicationGroup": "botocraft.services.elasticache",
+    "ReplicationGroupManager": "botocraft.services.elasticache",
+    "ReplicationGroupMessage": "botocraft.services.elasticache",
+    "ReplicationGroupModelMixin": "botocraft.mixins.elasticache",
+    "ReplicationGroupPendingModifiedValues": "botocraft.services.elasticache",
+    "ReplicationStatusType": "botocraft.services.secretsmanager",
+    "Report": "botocraft.services.codebuild",
+    "ReportDestination": "botocraft.services.datasync",
+    "ReportDestinationS3": "botocraft.services.datasync",
+    "ReportExportConfig": "botocraft.services.codebuild",
+    "ReportFilter": "botocraft.services.codebuild",
+    "ReportGroup": "botocraft.services.codebuild",
+    "ReportGroupManager": "botocraft.services.codebuild",
+    "ReportGroupTrendStats": "botocraft.services.codebuild",
+    "ReportManager": "botocraft.services.codebuild",
+    "ReportOverride": "botocraft.services.datasync",
+    "ReportOverrides": "botocraft.services.datasync",
+    "ReportWithRawData": "botocraft.services.codebuild",
+    "Repository": "botocraft.services.ecr",
+    "RepositoryAggregation": "botocraft.services.inspector2",
+    "RepositoryAggregationResponse": "botocraft.services.inspector2",
+    "RepositoryCredentials": "botocraft.services.ecs",
+    "RepositoryManager": "botocraft.services.ecr",
+    "RepositoryMixin": "botocraft.mixins.ecr",
+    "RepositorySyncDefinition": "botocraft.services.codeconnections",
+    "RepositorySyncDefinitionManager": "botocraft.services.codeconnections",
+    "RequestCertificateResponse": "botocraft.services.acm",
+    "RequestLaunchTemplateData": "botocraft.services.ec2",
+    "RequestMetadataBaseFilters": "botocraft.services.bedrock",
+    "RequestMetadataFilters": "botocraft.services.bedrock",
+    "RequestProgress": "botocraft.services.s3",
+    "Reservation": "botocraft.services.ec2",
+    "ReshardingStatus": "botocraft.services.elasticache",
+    "ResolvedArtifact": "botocraft.services.codebuild",
+    "ResolvedConfiguration": "botocraft.services.ecs",
+    "ResolvedPipelineVariable": "botocraft.services.codepipeline",
+    "Resource": "botocraft.services.ecr",
+    "ResourceDetails": "botocraft.services.inspector2",
+    "ResourcePolicy": "botocraft.services.bedrock",
+    "ResourcePolicyManager": "botocraft.services.bedrock",
+    "ResourcePolicyManagerMixin": "botocraft.mixins.bedrock",
+    "ResourceRecord": "botocraft.services.route53",
+    "ResourceRequirement": "botocraft.services.ecs",
+    "ResponseCodeMatcher": "botocraft.services.elbv2",
+    "ResponseLaunchTemplateData": "botocraft.services.ec2",
+    "ResponseStream": "botocraft.services.bedrock_runtime",
+    "RestoreDBClusterToPointInTimeResult": "botocraft.services.docdb",
+    "RestoreObjectOutput": "botocraft.services.s3",
+    "RestoreRequest": "botocraft.services.s3",
+    "RestoreSecretResponse": "botocraft.services.secretsmanager",
+    "RetryBuildBatchOutput": "botocraft.services.codebuild",
+    "RetryBuildOutput": "botocraft.services.codebuild",
+    "RetryConfiguration": "botocraft.services.codepipeline",
+    "RevokeCacheSecurityGroupIngressResult": "botocraft.services.elasticache",
+    "RevokeCertificateResponse": "botocraft.services.acm",
+    "RevokeSecurityGroupEgressResult": "botocraft.services.ec2",
+    "RevokeSecurityGroupIngressResult": "botocraft.services.ec2",
+    "RevokedSecurityGroupRule": "botocraft.services.ec2",
+    "RewriteConfig": "botocraft.services.elbv2",
+    "Rollback": "botocraft.services.ecs",
+    "RotateSecretResponse": "botocraft.services.secretsmanager",
+    "RotationRulesType": "botocraft.services.secretsmanager",
+    "Route": "botocraft.services.ec2",
+    "Route53AliasTarget": "botocraft.services.route53",
+    "Route53CidrCollection": "botocraft.services.route53",
+    "Route53CidrCollectionManager": "botocraft.services.route53",
+    "Route53CidrRoutingConfig": "botocraft.services.route53",
+    "Route53Coordinates": "botocraft.services.route53",
+    "Route53DelegationSet": "botocraft.services.route53",
+    "Route53GeoLocation": "botocraft.services.route53",
+    "Route53GeoProximityLocation": "botocraft.services.route53",
+    "Route53LinkedService": "botocraft.services.route53",
+    "Route53QueryLoggingConfig": "botocraft.services.route53",
+    "Route53QueryLoggingConfigManager": "botocraft.services.route53",
+    "Route53ResourceRecordSet": "botocraft.services.route53",
+    "Route53ResourceRecordSetManager": "botocraft.services.route53",
+    "Route53VPC": "botocraft.services.route53",
+    "Route53VPCManager": "botocraft.services.route53",
+    "RouteDetails": "botocraft.services.sesv2",
+    "RouteTable": "botocraft.services.ec2",
+    "RouteTableAssociation": "botocraft.services.ec2",
+    "RouteTableAssociationState": "botocraft.services.ec2",
+    "RouteTableManager": "botocraft.services.ec2",
+    "RoutingCriteria": "botocraft.services.bedrock",
+    "Rule": "botocraft.services.elbv2",
+    "RuleCondition": "botocraft.services.elbv2",
+    "RuleDeclaration": "botocraft.services.codepipeline",
+    "RuleManager": "botocraft.services.elbv2",
+    "RuleTransform": "botocraft.services.elbv2",
+    "RuleTypeId": "botocraft.services.codepipeline",
+    "RunCommandTarget": "botocraft.services.events",
+    "RunInstancesMonitoringEnabled": "botocraft.services.ec2",
+    "RunTaskResponse": "botocraft.services.ecs",
+    "RuntimePlatform": "botocraft.services.ecs",
+    "S3AbortIncompleteMultipartUpload": "botocraft.services.s3",
+    "S3CORSRule": "botocraft.services.s3",
+    "S3CSVInput": "botocraft.services.s3",
+    "S3Checksum": "botocraft.services.s3",
+    "S3Condition": "botocraft.services.s3",
+    "S3CopyObjectResult": "botocraft.services.s3",
+    "S3DataSource": "botocraft.services.bedrock",
+    "S3DefaultRetention": "botocraft.services.s3",
+    "S3ErrorDocument": "botocraft.services.s3",
+    "S3GlacierJobParameters": "botocraft.services.s3",
+    "S3Grantee": "botocraft.services.s3",
+    "S3IndexDocument": "botocraft.services.s3",
+    "S3Location": "botocraft.services.bedrock_runtime",
+    "S3LogsConfig": "botocraft.services.codebuild",
+    "S3ManifestConfig": "botocraft.services.datasync",
+    "S3NoncurrentVersionExpiration": "botocraft.services.s3",
+    "S3Object": "botocraft.services.s3",
+    "S3ObjectLockConfiguration": "botocraft.services.s3",
+    "S3ObjectLockLegalHold": "botocraft.services.s3",
+    "S3ObjectLockRule": "botocraft.services.s3",
+    "S3ObjectManager": "botocraft.services.s3",
+    "S3ObjectSummary": "botocraft.services.s3",
+    "S3OutputLocation": "botocraft.services.s3",
+    "S3Owner": "botocraft.services.s3",
+    "S3PartitionedPrefix": "botocraft.services.s3",
+    "S3PublicAccessBlockConfiguration": "botocraft.services.s3",
+    "S3RedirectAllRequestsTo": "botocraft.services.s3",
+    "S3ReportExportConfig": "botocraft.services.codebuild",
+    "S3RestoreStatus": "botocraft.services.s3",
+    "S3RoutingRule": "botocraft.services.s3",
+    "S3SelectParameters": "botocraft.services.s3",
+    "S3SimplePrefix": "botocraft.services.s3",
+    "S3Tagging": "botocraft.services.s3",
+    "S3TargetObjectKeyFormat": "botocraft.services.s3",
+    "SAMLIdp": "botocraft.services.opensearch",
+    "SAMLOptionsInput": "botocraft.services.opensearch",
+    "SAMLOptionsOutput": "botocraft.services.opensearch",
+    "SESAddHeaderAction": "botocraft.services.ses",
+    "SESBody": "botocraft.services.ses",
+    "SESBounceAction": "botocraft.services.ses",
+    "SESBulkEmailDestination": "botocraft.services.ses",
+    "SESBulkEmailDestinationStatus": "botocraft.services.ses",
+    "SESCloudWatchDestination": "botocraft.services.ses",
+    "SESConfigurationSet": "botocraft.services.ses",
+    "SESConfigurationSetManager": "botocraft.services.ses",
+    "SESConfigurationSetManagerMixin": "botocraft.mixins.ses",
+    "SESConnectAction": "botocraft.services.ses",
+    "SESContent": "botocraft.services.ses",
+    "SESCustomVerificationEmailTemplate": "botocraft.services.ses",
+    "SESCustomVerificationEmailTemplateManager": "botocraft.services.ses",
+    "SESCustomVerificationEmailTemplateManagerMixin": "botocraft.mixins.ses",
+    "SESDeleteConfigurationSetResponse": "botocraft.services.ses",
+    "SESDeliveryOptions": "botocraft.services.ses",
+    "SESDestination": "botocraft.services.ses",
+    "SESIdentity": "botocraft.services.ses",
+    "SESIdentityManager": "botocraft.services.ses",
+    "SESIdentityManagerMixin": "botocraft.mixins.ses",
+    "SESKinesisFirehoseDestination": "botocraft.services.ses",
+    "SESLambdaAction": "botocraft.services.ses",
+    "SESListConfigurationSetsResponse": "botocraft.services.ses",
+    "SESMessage": "botocraft.services.ses",
+    "SESMessageTag": "botocraft.services.ses",
+    "SESRawMessage": "botocraft.services.ses",
+    "SESReceiptFilter": "botocraft.services.ses",
+    "SESReceiptFilterManager": "botocraft.services.ses",
+    "SESReceiptFilterManagerMixin": "botocraft.mixins.ses",
+    "SESReceiptRuleSet": "botocraft.services.ses",
+    "SESReceiptRuleSetManager": "botocraft.services.ses",
+    "SESReceiptRuleSetManagerMixin": "botocraft.mixins.ses",
+    "SESReputationOptions": "botocraft.services.ses",
+    "SESS3Action": "botocraft.services.ses",
+    "SESSNSAction": "botocraft.services.ses",
+    "SESSNSDestination": "botocraft.services.ses",
+    "SESStopAction": "botocraft.services.ses",
+    "SESTemplate": "botocraft.services.ses",
+    "SESTemplateManager": "botocraft.services.ses",
+    "SESTemplateManagerMixin": "botocraft.mixins.ses",
+    "SESTrackingOptions": "botocraft.services.ses",
+    "SESV2ArchivingOptions": "botocraft.services.sesv2",
+    "SESV2Body": "botocraft.services.sesv2",
+    "SESV2BulkEmailContent": "botocraft.services.sesv2",
+    "SESV2BulkEmailEntry": "botocraft.services.sesv2",
+    "SESV2Content": "botocraft.services.sesv2",
+    "SESV2DashboardOptions": "botocraft.services.sesv2",
+    "SESV2DeliverabilityTestReportManagerMixin": "botocraft.mixins.sesv2",
+    "SESV2DeliveryOptions": "botocraft.services.sesv2",
+    "SESV2Destination": "botocraft.services.sesv2",
+    "SESV2DkimAttributes": "botocraft.services.sesv2",
+    "SESV2EmailContent": "botocraft.services.sesv2",
+    "SESV2EmailIdentityManagerMixin": "botocraft.mixins.sesv2",
+    "SESV2GuardianOptions": "botocraft.services.sesv2",
+    "SESV2IspPlacement": "botocraft.services.sesv2",
+    "SESV2ListManagementOptions": "botocraft.services.sesv2",
+    "SESV2MailFromAttributes": "botocraft.services.sesv2",
+    "SESV2Message": "botocraft.services.sesv2",
+    "SESV2MessageTag": "botocraft.services.sesv2",
+    "SESV2MultiRegionEndpointRoute": "botocraft.services.sesv2",
+    "SESV2PlacementStatistics": "botocraft.services.sesv2",
+    "SESV2ReplacementEmailContent": "botocraft.services.sesv2",
+    "SESV2ReplacementTemplate": "botocraft.services.sesv2",
+    "SESV2ReputationOptions": "botocraft.services.sesv2",
+    "SESV2SOARecord": "botocraft.services.sesv2",
+    "SESV2SendingOptions": "botocraft.services.sesv2",
+    "SESV2SuppressionConditionThreshold": "botocraft.services.sesv2",
+    "SESV2SuppressionConfidenceThreshold": "botocraft.services.sesv2",
+    "SESV2SuppressionOptions": "botocraft.services.sesv2",
+    "SESV2SuppressionValidationOptions": "botocraft.services.sesv2",
+    "SESV2Tag": "botocraft.services.sesv2",
+    "SESV2Template": "botocraft.services.sesv2",
+    "SESV2Topic": "botocraft.services.sesv2",
+    "SESV2TrackingOptions": "botocraft.services.sesv2",
+    "SESV2VdmOptions": "botocraft.services.sesv2",
+    "SESV2VerificationInfo": "botocraft.services.sesv2",
+    "SESWorkmailAction": "botocraft.services.ses",
+    "SSHPublicKeyMetadata": "botocraft.services.iam",
+    "SSMSession": "botocraft.services.codebuild",
+    "STSAssumedRoleUser": "botocraft.services.sts",
+    "STSCredentials": "botocraft.services.sts",
+    "STSPolicyDescriptorType": "botocraft.services.sts",
+    "STSProvidedContext": "botocraft.services.sts",
+    "SageMakerEndpoint": "botocraft.services.bedrock",
+    "SageMakerPipelineParameter": "botocraft.services.events",
+    "Sandbox": "botocraft.services.codebuild",
+    "SandboxManager": "botocraft.services.codebuild",
+    "SandboxSession": "botocraft.services.codebuild",
+    "SandboxSessionPhase": "botocraft.services.codebuild",
+    "ScalableTarget": "botocraft.services.application_autoscaling",
+    "ScalableTargetManager": "botocraft.services.application_autoscaling",
+    "ScalableTargetModelMixin": "botocraft.mixins.application_autoscaling",
+    "Scale": "botocraft.services.ecs",
+    "ScalingConfigurationInput": "botocraft.services.codebuild",
+    "ScalingConfigurationOutput": "botocraft.services.codebuild",
+    "ScalingPolicy": "botocraft.services.application_autoscaling",
+    "ScalingPolicyManager": "botocraft.services.application_autoscaling",
+    "ScanRange": "botocraft.services.s3",
+    "Schedule": "botocraft.services.inspector2",
+    "ScheduleKeyDeletionResponse": "botocraft.services.kms",
+    "ScheduledAction": "botocraft.services.application_autoscaling",
+    "ScheduledActionManager": "botocraft.services.application_autoscaling",
+    "Schema": "botocraft.services.schemas",
+    "SchemaManager": "botocraft.services.schemas",
+    "SchemaVersionSummary": "botocraft.services.schemas",
+    "ScopeConfiguration": "botocraft.services.codebuild",
+    "ScoreDetails": "botocraft.services.ecr",
+    "SearchResultBlock": "botocraft.services.bedrock_runtime",
+    "SearchResultContentBlock": "botocraft.services.bedrock_runtime",
+    "SearchResultLocation": "botocraft.services.bedrock_runtime",
+    "SearchVulnerabilitiesFilterCriteria": "botocraft.services.inspector2",
+    "SearchVulnerabilitiesResponse": "botocraft.services.inspector2",
+    "SecondaryInterfacePrivateIpAddressSpecification": "botocraft.services.ec2",
+    "SecondaryInterfacePrivateIpAddressSpecificationRequest": "botocraft.services.ec2",
+    "Secret": "botocraft.services.secretsmanager",
+    "SecretManager": "botocraft.services.secretsmanager",
+    "SecretVersion": "botocraft.services.secretsmanager",
+    "SecretVersionManager": "botocraft.services.secretsmanager",
+    "SecretsFilter": "botocraft.services.secretsmanager",
+    "SecureBlobAttributeValue": "botocraft.services.ec2",
+    "SecurityGroup": "botocraft.services.ec2",
+    "SecurityGroupIdentifier": "botocraft.services.ec2",
+    "SecurityGroupManager": "botocraft.services.ec2",
+    "SecurityGroupMembership": "botocraft.services.elasticache",
+    "SecurityGroupModelMixin": "botocraft.mixins.ec2",
+    "SecurityGroupRule": "botocraft.services.ec2",
+    "SelectObjectContentEventStream": "botocraft.services.s3",
+    "SelectObjectContentOutput": "botocraft.services.s3",
+    "SelectiveContentGuarding": "botocraft.services.bedrock",
+    "SendBulkEmailResponse": "botocraft.services.sesv2",
+    "SendEmailResponse": "botocraft.services.sesv2",
+    "SendMessageBatchRequestEntry": "botocraft.services.sqs",
+    "SendMessageBatchResult": "botocraft.services.sqs",
+    "SendMessageBatchResultEntry": "botocraft.services.sqs",
+    "SendMessageResult": "botocraft.services.sqs",
+    "SequenceNumberRange": "botocraft.services.kinesis",
+    "ServerlessV2ScalingConfiguration": "botocraft.services.docdb",
+    "ServerlessV2ScalingConfigurationInfo": "botocraft.services.docdb",
+    "Service": "botocraft.services.ecs",
+    "ServiceConnectAccessLogConfiguration": "botocraft.services.ecs",
+    "ServiceConnectClientAlias": "botocraft.services.ecs",
+    "ServiceConnectConfiguration": "botocraft.services.ecs",
+    "ServiceConnectService": "botocraft.services.ecs",
+    "ServiceConnectServiceResource": "botocraft.services.ecs",
+    "ServiceConnectTestTrafficHeaderMatchRules": "botocraft.services.ecs",
+    "ServiceConnectTestTrafficHeaderRules": "botocraft.services.ecs",
+    "ServiceConnectTestTrafficRules": "botocraft.services.ecs",
+    "ServiceConnectTlsCertificateAuthority": "botocraft.services.ecs",
+    "ServiceConnectTlsConfiguration": "botocraft.services.ecs",
+    "ServiceCurrentRevisionSummary": "botocraft.services.ecs",
+    "ServiceDeployment": "botocraft.services.ecs",
+    "ServiceDeploymentAlarms": "botocraft.services.ecs",
+    "ServiceDeploymentBrief": "botocraft.services.ecs",
+    "ServiceDeploymentCircuitBreaker": "botocraft.services.ecs",
+    "ServiceDeploymentManager": "botocraft.services.ecs",
+    "ServiceEvent": "botocraft.services.ecs",
+    "ServiceManagedEBSVolumeConfiguration": "botocraft.services.ecs",
+    "ServiceManager": "botocraft.services.ecs",
+    "ServiceRegistry": "botocraft.services.ecs",
+    "ServiceRevision": "botocraft.services.ecs",
+    "ServiceRevisionLoadBalancer": "botocraft.services.ecs",
+    "ServiceRevisionManager": "botocraft.services.ecs",
+    "ServiceRevisionManagerMixin": "botocraft.mixins.ecs",
+    "ServiceRevisionSummary": "botocraft.services.ecs",
+    "ServiceTier": "botocraft.services.bedrock_runtime",
+    "ServiceUnavailableException": "botocraft.services.bedrock_runtime",
+    "ServiceVolumeConfiguration": "botocraft.services.ecs",
+    "SetLoadBalancerListenerSSLCertificateOutput": "botocraft.services.elb",
+    "SetLoadBalancerPoliciesForBackendServerOutput": "botocraft.services.elb",
+    "SetLoadBalancerPoliciesOfListenerOutput": "botocraft.services.elb",
+    "SeverityCounts": "botocraft.services.inspector2",
+    "Snapshot": "botocraft.services.ec2",
+    "SnapshotManager": "botocraft.services.ec2",
+    "SnapshotOptionsStatus": "botocraft.services.opensearch",
+    "SoftwareUpdateOptionsStatus": "botocraft.services.opensearch",
+    "SortCriteria": "botocraft.services.inspector2",
+    "SourceAuth": "botocraft.services.codebuild",
+    "SourceCredentials": "botocraft.services.codebuild",
+    "SourceCredentialsManager": "botocraft.services.codebuild",
+    "SourceIpConditionConfig": "botocraft.services.elbv2",
+    "SourceManifestConfig": "botocraft.services.datasync",
+    "SourceRevision": "botocraft.services.codepipeline",
+    "SourceRevisionOverride": "botocraft.services.codepipeline",
+    "SpecificToolChoice": "botocraft.services.bedrock_runtime",
+    "SpotMarketOptions": "botocraft.services.ec2",
+    "StageDeclaration": "botocraft.services.codepipeline",
+    "StartAsyncInvokeResponse": "botocraft.services.bedrock_runtime",
+    "StartAutomatedReasoningPolicyBuildWorkflowResponse": "botocraft.services.bedrock",
+    "StartAutomatedReasoningPolicyTestWorkflowResponse": "botocraft.services.bedrock",
+    "StartBuildBatchOutput": "botocraft.services.codebuild",
+    "StartBuildOutput": "botocraft.services.codebuild",
+    "StartCommandExecutionOutput": "botocraft.services.codebuild",
+    "StartDBClusterResult": "botocraft.services.docdb",
+    "StartDiscovererResponse": "botocraft.services.schemas",
+    "StartInstancesResult": "botocraft.services.ec2",
+    "StartMetricStreamsOutput": "botocraft.services.cloudwatch",
+    "StartOTelEnrichmentOutput": "botocraft.services.cloudwatch",
+    "StartPipelineExecutionOutput": "botocraft.services.codepipeline",
+    "StartSandboxConnectionOutput": "botocraft.services.codebuild",
+    "StartSandboxOutput": "botocraft.services.codebuild",
+    "StartTaskExecutionResponse": "botocraft.services.datasync",
+    "StatisticSet": "botocraft.services.cloudwatch",
+    "Stats": "botocraft.services.s3",
+    "StatsEvent": "botocraft.services.s3",
+    "StatusDetails": "botocraft.services.bedrock",
+    "Step": "botocraft.services.inspector2",
+    "StepAdjustment": "botocraft.services.application_autoscaling",
+    "StopBuildBatchOutput": "botocraft.services.codebuild",
+    "StopBuildOutput": "botocraft.services.codebuild",
+    "StopDBClusterResult": "botocraft.services.docdb",
+    "StopDiscovererResponse": "botocraft.services.schemas",
+    "StopEvaluationJobResponse": "botocraft.services.bedrock",
+    "StopExecutionTrigger": "botocraft.services.codepipeline",
+    "StopInstancesResult": "botocraft.services.ec2",
+    "StopMetricStreamsOutput": "botocraft.services.cloudwatch",
+    "StopModelCustomizationJobResponse": "botocraft.services.bedrock",
+    "StopModelInvocationJobResponse": "botocraft.services.bedrock",
+    "StopOTelEnrichmentOutput": "botocraft.services.cloudwatch",
+    "StopPipelineExecutionOutput": "botocraft.services.codepipeline",
+    "StopSandboxOutput": "botocraft.services.codebuild",
+    "StopServiceDeploymentResponse": "botocraft.services.ecs",
+    "StopTaskResponse": "botocraft.services.ecs",
+    "StreamDescriptionSummary": "botocraft.services.kinesis",
+    "StreamingBody": "botocore.response",
+    "StringFilter": "botocraft.services.inspector2",
+    "Subnet": "botocraft.services.ec2",
+    "SubnetCidrBlockState": "botocraft.services.ec2",
+    "SubnetConfiguration": "botocraft.services.ec2",
+    "SubnetIpPrefixes": "botocraft.services.ec2",
+    "SubnetIpv6CidrBlockAssociation": "botocraft.services.ec2",
+    "SubnetManager": "botocraft.services.ec2",
+    "SubnetMapping": "botocraft.services.elbv2",
+    "SubnetModelMixin": "botocraft.mixins.ec2",
+    "SucceededInStageFilter": "botocraft.services.codepipeline",
+    "SuccessConditions": "botocraft.services.codepipeline",
+    "SupportTerm": "botocraft.services.bedrock",
+    "SuppressedDestination": "botocraft.services.sesv2",
+    "SuppressedDestinationAttributes": "botocraft.services.sesv2",
+    "SuppressedDestinationManager": "botocraft.services.sesv2",
+    "SuppressedDestinationSummary": "botocraft.services.sesv2",
+    "SuspendedProcess": "botocraft.services.autoscaling",
+    "SyncBlocker": "botocraft.services.codeconnections",
+    "SyncBlockerContext": "botocraft.services.codeconnections",
+    "SyncBlockerManager": "botocraft.services.codeconnections",
+    "SyncBlockerSummary": "botocraft.services.codeconnections",
+    "SyncBlockerSummaryManager": "botocraft.services.codeconnections",
+    "SyncConfiguration": "botocraft.services.codeconnections",
+    "SyncConfigurationManager": "botocraft.services.codeconnections",
+    "SystemContentBlock": "botocraft.services.bedrock_runtime",
+    "SystemControl": "botocraft.services.ecs",
+    "SystemTool": "botocraft.services.bedrock_runtime",
+    "Tag": "botocraft.services.common",
+    "TagFilter": "botocraft.services.inspector2",
+    "TagKeyOnly": "botocraft.services.elb",
+    "TagListEntry": "botocraft.services.datasync",
+    "TagSpecification": "botocraft.services.ec2",
+    "TagsDictMixin": "botocraft.mixins.tags",
+    "TargetDescription": "botocraft.services.elbv2",
+    "TargetGrant": "botocraft.services.s3",
+    "TargetGroup": "botocraft.services.elbv2",
+    "TargetGroupManager": "botocraft.services.elbv2",
+    "TargetGroupTuple": "botocraft.services.elbv2",
+    "TargetHealthDescription": "botocraft.services.elbv2",
+    "TargetHealthInfo": "botocraft.services.elbv2",
+    "TargetTrackingMetric": "botocraft.services.application_autoscaling",
+    "TargetTrackingMetricDataQuery": "botocraft.services.application_autoscaling",
+    "TargetTrackingMetricDimension": "botocraft.services.application_autoscaling",
+    "TargetTrackingMetricStat": "botocraft.services.application_autoscaling",
+    "TargetTrackingScalingConfiguration": "botocraft.services.codebuild",
+    "Task": "botocraft.services.ecs",
+    "TaskDefinition": "botocraft.services.ecs",
+    "TaskDefinitionManager": "botocraft.services.ecs",
+    "TaskDefinitionManagerMixin": "botocraft.mixins.ecs",
+    "TaskDefinitionModelMixin": "botocraft.mixins.ecs",
+    "TaskDefinitionPlacementConstraint": "botocraft.services.ecs",
+    "TaskEphemeralStorage": "botocraft.services.ecs",
+    "TaskExecutionFilesFailedDetail": "botocraft.services.datasync",
+    "TaskExecutionFilesListedDetail": "botocraft.services.datasync",
+    "TaskExecutionFoldersFailedDetail": "botocraft.services.datasync",
+    "TaskExecutionFoldersListedDetail": "botocraft.services.datasync",
+    "TaskExecutionListEntry": "botocraft.services.datasync",
+    "TaskFilter": "botocraft.services.datasync",
+    "TaskListEntry": "botocraft.services.datasync",
+    "TaskManagedEBSVolumeConfiguration": "botocraft.services.ecs",
+    "TaskManagedEBSVolumeTerminationPolicy": "botocraft.services.ecs",
+    "TaskManager": "botocraft.services.ecs",
+    "TaskOverride": "botocraft.services.ecs",
+    "TaskSet": "botocraft.services.ecs",
+    "TaskSetManager": "botocraft.services.ecs",
+    "TaskSetManagerMixin": "botocraft.mixins.ecs",
+    "TaskVolumeConfiguration": "botocraft.services.ecs",
+    "TeacherModelConfig": "botocraft.services.bedrock",
+    "TemplateMetadata": "botocraft.services.ses",
+    "Tenant": "botocraft.services.sesv2",
+    "TenantInfo": "botocraft.services.sesv2",
+    "TenantManager": "botocraft.services.sesv2",
+    "TermDetails": "botocraft.services.bedrock",
+    "TerminateInstancesResult": "botocraft.services.ec2",
+    "TestCaseFilter": "botocraft.services.codebuild",
+    "TestReportSummary": "botocraft.services.codebuild",
+    "ThrottlingException": "botocraft.services.bedrock_runtime",
+    "Time": "botocraft.services.inspector2",
+    "TimeoutConfiguration": "botocraft.services.ecs",
+    "TitleAggregation": "botocraft.services.inspector2",
+    "TitleAggregationResponse": "botocraft.services.inspector2",
+    "Tmpfs": "botocraft.services.ecs",
+    "TokenCount": "botocraft.services.bedrock_runtime",
+    "TokenUsage": "botocraft.services.bedrock_runtime",
+    "Tool": "botocraft.services.bedrock_runtime",
+    "ToolChoice": "botocraft.services.bedrock_runtime",
+    "ToolConfiguration": "botocraft.services.bedrock_runtime",
+    "ToolInputSchema": "botocraft.services.bedrock_runtime",
+    "ToolResultBlock": "botocraft.services.bedrock_runtime",
+    "ToolResultBlockDelta": "botocraft.services.bedrock_runtime",
+    "ToolResultBlockStart": "botocraft.services.bedrock_runtime",
+    "ToolResultContentBlock": "botocraft.services.bedrock_runtime",
+    "ToolSpecification": "botocraft.services.bedrock_runtime",
+    "ToolUseBlock": "botocraft.services.bedrock_runtime",
+    "ToolUseBlockDelta": "botocraft.services.bedrock_runtime",
+    "ToolUseBlockStart": "botocraft.services.bedrock_runtime",
+    "TotalLocalStorageGBRequest": "botocraft.services.ec2",
+    "TrafficSourceIdentifier": "botocraft.services.autoscaling",
+    "TrainingDataConfig": "botocraft.services.bedrock",
+    "TrainingDetails": "botocraft.services.bedrock",
+    "TrainingMetrics": "botocraft.services.bedrock",
+    "Transition": "botocraft.services.s3",
+    "TunnelOption": "botocraft.services.ec2",
+    "Ulimit": "botocraft.services.ecs",
+    "UnlockSnapshotResult": "botocraft.services.ec2",
+    "UnsuccessfulItem": "botocraft.services.ec2",
+    "UnsuccessfulItemError": "botocraft.services.ec2",
+    "UpdateAgentResponse": "botocraft.services.datasync",
+    "UpdateAutomatedReasoningPolicyAnnotationsResponse": "botocraft.services.bedrock",
+    "UpdateAutomatedReasoningPolicyResponse": "botocraft.services.bedrock",
+    "UpdateAutomatedReasoningPolicyTestCaseResponse": "botocraft.services.bedrock",
+    "UpdateCapacityProviderResponse": "botocraft.services.ecs",
+    "UpdateCisScanConfigurationResponse": "botocraft.services.inspector2",
+    "UpdateCisTargets": "botocraft.services.inspector2",
+    "UpdateClusterResponse": "botocraft.services.ecs",
+    "UpdateDiscovererResponse": "botocraft.services.schemas",
+    "UpdateDomainConfigResponse": "botocraft.services.opensearch",
+    "UpdateEventBusResponse": "botocraft.services.events",
+    "UpdateFilterResponse": "botocraft.services.inspector2",
+    "UpdateFleetOutput": "botocraft.services.codebuild",
+    "UpdateGuardrailResponse": "botocraft.services.bedrock",
+    "UpdateHostedZoneCommentResponse": "botocraft.services.route53",
+    "UpdateLocationAzureBlobResponse": "botocraft.services.datasync",
+    "UpdateLocationEfsResponse": "botocraft.services.datasync",
+    "UpdateLocationFsxLustreResponse": "botocraft.services.datasync",
+    "UpdateLocationFsxOntapResponse": "botocraft.services.datasync",
+    "UpdateLocationFsxOpenZfsResponse": "botocraft.services.datasync",
+    "UpdateLocationFsxWindowsResponse": "botocraft.services.datasync",
+    "UpdateLocationHdfsResponse": "botocraft.services.datasync",
+    "UpdateLocationNfsResponse": "botocraft.services.datasync",
+    "UpdateLocationObjectStorageResponse": "botocraft.services.datasync",
+    "UpdateLocationS3Response": "botocraft.services.datasync",
+    "UpdateLocationSmbResponse": "botocraft.services.datasync",
+    "UpdateManagedInstancesProviderConfiguration": "botocraft.services.ecs",
+    "UpdateMarketplaceModelEndpointResponse": "botocraft.services.bedrock",
+    "UpdatePackageResponse": "botocraft.services.opensearch",
+    "UpdatePipelineOutput": "botocraft.services.codepipeline",
+    "UpdateProjectOutput": "botocraft.services.codebuild",
+    "UpdateProjectVisibilityOutput": "botocraft.services.codebuild",
+    "UpdateRegistryResponse": "botocraft.services.schemas",
+    "UpdateReportGroupOutput": "botocraft.services.codebuild",
+    "UpdateRoleDescriptionResponse": "botocraft.services.iam",
+    "UpdateSchemaResponse": "botocraft.services.schemas",
+    "UpdateSecretResponse": "botocraft.services.secretsmanager",
+    "UpdateSecretVersionStageResponse": "botocraft.services.secretsmanager",
+    "UpdateServiceResponse": "botocraft.services.ecs",
+    "UpdateShardCountOutput": "botocraft.services.kinesis",
+    "UpdateStreamWarmThroughputOutput": "botocraft.services.kinesis",
+    "UpdateSyncBlockerOutput": "botocraft.services.codeconnections",
+    "UpdateSyncConfigurationOutput": "botocraft.services.codeconnections",
+    "UpdateTaskExecutionResponse": "botocraft.services.datasync",
+    "UpdateTaskResponse": "botocraft.services.datasync",
+    "UpdateTaskSetResponse": "botocraft.services.ecs",
+    "UpdateVpcEndpointResponse": "botocraft.services.opensearch",
+    "UpdateWebhookOutput": "botocraft.services.codebuild",
+    "UploadSSHPublicKeyResponse": "botocraft.services.iam",
+    "UserGroupPendingChanges": "botocraft.services.elasticache",
+    "UserGroupsUpdateStatus": "botocraft.services.elasticache",
+    "UserIdGroupPair": "botocraft.services.ec2",
+    "VCpuCountRange": "botocraft.services.ec2",
+    "VCpuCountRangeRequest": "botocraft.services.ec2",
+    "VCpuCountRequest": "botocraft.services.autoscaling",
+    "VPCDerivedInfoStatus": "botocraft.services.opensearch",
+    "ValidationDataConfig": "botocraft.services.bedrock",
+    "ValidationDetails": "botocraft.services.bedrock",
+    "ValidationError": "botocraft.services.ec2",
+    "ValidationException": "botocraft.services.bedrock_runtime",
+    "ValidationFailure": "botocraft.services.opensearch",
+    "ValidationWarning": "botocraft.services.ec2",
+    "Validator": "botocraft.services.bedrock",
+    "ValidatorMetric": "botocraft.services.bedrock",
+    "ValidityTerm": "botocraft.services.bedrock",
+    "VersionInfo": "botocraft.services.ecs",
+    "VersionStatus": "botocraft.services.opensearch",
+    "VgwTelemetry": "botocraft.services.ec2",
+    "VideoBlock": "botocraft.services.bedrock_runtime",
+    "VideoSource": "botocraft.services.bedrock_runtime",
+    "Volume": "botocraft.services.ec2",
+    "VolumeAttachment": "botocraft.services.ec2",
+    "VolumeFrom": "botocraft.services.ecs",
+    "VolumeManager": "botocraft.services.ec2",
+    "Vpc": "botocraft.services.ec2",
+    "VpcCidrBlockAssociation": "botocraft.services.ec2",
+    "VpcCidrBlockState": "botocraft.services.ec2",
+    "VpcConfig": "botocraft.services.codebuild",
+    "VpcEncryptionControl": "botocraft.services.ec2",
+    "VpcEncryptionControlExclusion": "botocraft.services.ec2",
+    "VpcEncryptionControlExclusions": "botocraft.services.ec2",
+    "VpcEndpointError": "botocraft.services.opensearch",
+    "VpcIpv6CidrBlockAssociation": "botocraft.services.ec2",
+    "VpcLatticeConfiguration": "botocraft.services.ecs",
+    "VpcManager": "botocraft.services.ec2",
+    "VpcModelMixin": "botocraft.mixins.ec2",
+    "VpcPeeringConnection": "botocraft.services.ec2",
+    "VpcPeeringConnectionManager": "botocraft.services.ec2",
+    "VpcPeeringConnectionOptionsDescription": "botocraft.services.ec2",
+    "VpcPeeringConnectionStateReason": "botocraft.services.ec2",
+    "VpcPeeringConnectionVpcInfo": "botocraft.services.ec2",
+    "VpcSecurityGroupMembership": "botocraft.services.docdb",
+    "VpnConnection": "botocraft.services.ec2",
+    "VpnConnectionManager": "botocraft.services.ec2",
+    "VpnConnectionOptions": "botocraft.services.ec2",
+    "VpnConnectionOptionsSpecification": "botocraft.services.ec2",
+    "VpnConnectionVgwTelemetry": "botocraft.services.ec2",
+    "VpnGateway": "botocraft.services.ec2",
+    "VpnGatewayManager": "botocraft.services.ec2",
+    "VpnStaticRoute": "botocraft.services.ec2",
+    "VpnTunnelLogOptions": "botocraft.services.ec2",
+    "VpnTunnelLogOptionsSpecification": "botocraft.services.ec2",
+    "VpnTunnelOptionsSpecification": "botocraft.services.ec2",
+    "Vulnerability": "botocraft.services.inspector2",
+    "VulnerabilityManager": "botocraft.services.inspector2",
+    "VulnerabilityManagerMixin": "botocraft.mixins.inspector2",
+    "VulnerablePackage": "botocraft.services.inspector2",
+    "WebLocation": "botocraft.services.bedrock_runtime",
+    "Webhook": "botocraft.services.codebuild",
+    "WebhookFilter": "botocraft.services.codebuild",
+    "WebhookManager": "botocraft.services.codebuild",
+    "WebsiteConfiguration": "botocraft.services.s3",
+    "WeeklySchedule": "botocraft.services.inspector2",
+    "XksKeyConfigurationType": "botocraft.services.kms",
+    "action_type_declaration_response_to_action_type": "botocraft.mixins.codepipeline",
+    "action_type_response_to_action_type": "botocraft.mixins.codepipeline",
+    "add_attributes_for_get": "botocraft.mixins.elb",
+    "add_attributes_for_list": "botocraft.mixins.elb",
+    "add_certificate_tags": "botocraft.mixins.acm",
+    "add_tags_for_get": "botocraft.mixins.elb",
+    "add_tags_for_list": "botocraft.mixins.elb",
+    "bucket_list_names_to_buckets": "botocraft.mixins.s3",
+    "bucket_update_safe_get_lifecycle": "botocraft.mixins.s3",
+    "build_batch_ids_to_build_batches": "botocraft.mixins.codebuild",
+    "build_batch_ids_to_build_batches_with_project": "botocraft.mixins.codebuild",
+    "build_batch_response_to_build_batch": "botocraft.mixins.codebuild",
+    "build_ids_to_builds": "botocraft.mixins.codebuild",
+    "build_ids_to_builds_with_project": "botocraft.mixins.codebuild",
+    "build_response_to_build": "botocraft.mixins.codebuild",
+    "builtins": "botocraft.services.ec2",
+    "cached_property": "functools",
+    "cast": "typing",
+    "certificates_only": "botocraft.mixins.acm",
+    "command_execution_response_to_command_execution": "botocraft.mixins.codebuild",
+    "configuration_set_names_to_models": "botocraft.mixins.sesv2",
+    "connection_create_to_connection": "botocraft.mixins.codeconnections",
+    "connection_response_to_connection": "botocraft.mixins.codeconnections",
+    "connections_include_tags": "botocraft.mixins.codeconnections",
+    "consumer_include_tags": "botocraft.mixins.kinesis",
+    "consumers_include_tags": "botocraft.mixins.kinesis",
+    "convert_delegated_admin": "botocraft.mixins.inspector2",
+    "convert_log_group_tags": "botocraft.mixins.logs",
+    "convert_log_groups_tags": "botocraft.mixins.logs",
+    "create_log_group_extended": "botocraft.mixins.logs",
+    "custom_verification_template_response_to_model": "botocraft.mixins.ses",
+    "dataclass": "dataclasses",
+    "datasync_add_tags": "botocraft.mixins.datasync",
+    "datasync_add_tags_to_queryset": "botocraft.mixins.datasync",
+    "datasync_list_azure_blob_locations": "botocraft.mixins.datasync",
+    "datasync_list_efs_locations": "botocraft.mixins.datasync",
+    "datasync_list_fsx_lustre_locations": "botocraft.mixins.datasync",
+    "datasync_list_fsx_ontap_locations": "botocraft.mixins.datasync",
+    "datasync_list_fsx_openzfs_locations": "botocraft.mixins.datasync",
+    "datasync_list_fsx_windows_locations": "botocraft.mixins.datasync",
+    "datasync_list_hdfs_locations": "botocraft.mixins.datasync",
+    "datasync_list_nfs_locations": "botocraft.mixins.datasync",
+    "datasync_list_object_storage_locations": "botocraft.mixins.datasync",
+    "datasync_list_s3_locations": "botocraft.mixins.datasync",
+    "datasync_list_smb_locations": "botocraft.mixins.datasync",
+    "datasync_refresh_after_create": "botocraft.mixins.datasync",
+    "datasync_refresh_after_update": "botocraft.mixins.datasync",
+    "datasync_task_execution_from_start": "botocraft.mixins.datasync",
+    "datetime": "datetime",
+    "dedicated_ip_pool_names_to_models": "botocraft.mixins.sesv2",
+    "discoverer_response_to_discoverer": "botocraft.mixins.schemas",
+    "ec2_instance_only": "botocraft.mixins.ec2",
+    "ec2_instances_only": "botocraft.mixins.ec2",
+    "ecs_clusters_only": "botocraft.mixins.ecs",
+    "ecs_container_instances_only": "botocraft.mixins.ecs",
+    "ecs_service_deployments_only": "botocraft.mixins.ecs",
+    "ecs_services_only": "botocraft.mixins.ecs",
+    "ecs_task_definition_delete_all": "botocraft.mixins.ecs",
+    "ecs_task_definition_include_tags": "botocraft.mixins.ecs",
+    "ecs_task_definitions_only": "botocraft.mixins.ecs",
+    "ecs_task_populate_taskDefinition": "botocraft.mixins.ecs",
+    "ecs_task_populate_taskDefinitions": "botocraft.mixins.ecs",
+    "ecs_tasks_only": "botocraft.mixins.ecs",
+    "efs_access_point_add_tags": "botocraft.mixins.efs",
+    "efs_access_points_add_tags": "botocraft.mixins.efs",
+    "efs_file_system_add_tags": "botocraft.mixins.efs",
+    "efs_file_systems_add_tags": "botocraft.mixins.efs",
+    "elasticache_user_add_tags": "botocraft.mixins.elasticache",
+    "elasticache_user_group_add_tags": "botocraft.mixins.elasticache",
+    "elasticache_user_groups_get_add_tags": "botocraft.mixins.elasticache",
+    "elasticache_users_get_add_tags": "botocraft.mixins.elasticache",
+    "event_rules_only": "botocraft.mixins.events",
+    "fleet_names_to_fleets": "botocraft.mixins.codebuild",
+    "fleet_response_to_fleet": "botocraft.mixins.codebuild",
+    "group_attached_policies_only": "botocraft.mixins.iam",
+    "group_inline_policies_only": "botocraft.mixins.iam",
+    "host_create_to_host": "botocraft.mixins.codeconnections",
+    "host_response_to_host": "botocraft.mixins.codeconnections",
+    "host_update_to_host": "botocraft.mixins.codeconnections",
+    "hosts_include_tags": "botocraft.mixins.codeconnections",
+    "iam_attached_policies_only": "botocraft.mixins.iam",
+    "identity_names_to_models": "botocraft.mixins.ses",
+    "image_list_images_ecr_images_only": "botocraft.mixins.ecr",
+    "kms_keys_only": "botocraft.mixins.kms",
+    "list_augment_delegated_admin_accounts": "botocraft.mixins.inspector2",
+    "load_balancer_attributes_to_dict": "botocraft.mixins.elbv2",
+    "multi_region_endpoint_response_to_model": "botocraft.mixins.sesv2",
+    "multiple_docdb_cluster_include_tags": "botocraft.mixins.docdb",
+    "multiple_docdb_instance_include_tags": "botocraft.mixins.docdb",
+    "multiple_docdb_subnet_group_include_tags": "botocraft.mixins.docdb",
+    "object_list_add_bucket_name_and_tags": "botocraft.mixins.s3",
+    "pipeline_execution_list_add_pipeline_name": "botocraft.mixins.codepipeline",
+    "pipeline_execution_response_to_pipeline_execution": "botocraft.mixins.codepipeline",
+    "pipeline_response_to_pipeline": "botocraft.mixins.codepipeline",
+    "pipeline_summaries_to_pipelines": "botocraft.mixins.codepipeline",
+    "project_names_to_projects": "botocraft.mixins.codebuild",
+    "project_response_to_project": "botocraft.mixins.codebuild",
+    "queue_list_urls_to_queues": "botocraft.mixins.sqs",
+    "queue_recieve_messages_add_event_factory": "botocraft.mixins.sqs",
+    "queue_recieve_messages_add_queue_url": "botocraft.mixins.sqs",
+    "refresh_configuration_set_after_mutation": "botocraft.mixins.sesv2",
+    "refresh_contact_list_after_mutation": "botocraft.mixins.sesv2",
+    "refresh_custom_verification_template_after_mutation": "botocraft.mixins.ses",
+    "refresh_dedicated_ip_pool_after_mutation": "botocraft.mixins.sesv2",
+    "refresh_email_template_after_mutation": "botocraft.mixins.sesv2",
+    "refresh_multi_region_endpoint_after_mutation": "botocraft.mixins.sesv2",
+    "refresh_suppressed_destination_after_mutation": "botocraft.mixins.sesv2",
+    "registry_response_to_registry": "botocraft.mixins.schemas",
+    "repo_get_add_tags": "botocraft.mixins.ecr",
+    "repo_list_add_tags": "botocraft.mixins.ecr",
+    "repo_list_images_ecr_images_only": "botocraft.mixins.ecr",
+    "report_arns_to_reports": "botocraft.mixins.codebuild",
+    "report_arns_to_reports_with_group": "botocraft.mixins.codebuild",
+    "report_group_arns_to_report_groups": "botocraft.mixins.codebuild",
+    "report_group_response_to_report_group": "botocraft.mixins.codebuild",
+    "repository_sync_definitions_add_context": "botocraft.mixins.codeconnections",
+    "role_attached_policies_only": "botocraft.mixins.iam",
+    "role_inline_policies_only": "botocraft.mixins.iam",
+    "sandbox_ids_to_sandboxes": "botocraft.mixins.codebuild",
+    "sandbox_ids_to_sandboxes_with_project": "botocraft.mixins.codebuild",
+    "sandbox_response_to_sandbox": "botocraft.mixins.codebuild",
+    "scalable_target_only": "botocraft.mixins.application_autoscaling",
+    "scaling_policy_only": "botocraft.mixins.application_autoscaling",
+    "schema_list_add_registry_name": "botocraft.mixins.schemas",
+    "schema_response_to_schema": "botocraft.mixins.schemas",
+    "secrets_only": "botocraft.mixins.secretsmanager",
+    "single_docdb_cluster_include_tags": "botocraft.mixins.docdb",
+    "single_docdb_instance_include_tags": "botocraft.mixins.docdb",
+    "single_docdb_subnet_group_include_tags": "botocraft.mixins.docdb",
+    "single_opensearch_domain_include_tags": "botocraft.mixins.opensearch",
+    "single_opensearch_domain_update_include_tags": "botocraft.mixins.opensearch",
+    "stream_include_tags": "botocraft.mixins.kinesis",
+    "streams_include_tags": "botocraft.mixins.kinesis",
+    "sync_blocker_summary_response_to_sync_blocker_summary": "botocraft.mixins.codeconnections",
+    "sync_configuration_response_to_sync_configuration": "botocraft.mixins.codeconnections",
+    "template_metadata_to_models": "botocraft.mixins.ses",
+    "tenant_response_to_model": "botocraft.mixins.sesv2",
+    "update_sync_blocker_response_to_sync_blocker": "botocraft.mixins.codeconnections",
+    "webhook_response_with_project_name": "botocraft.mixins.codebuild",
+}
@@ -1,5 +1,12 @@
-from collections.abc import Sequence
-from functools import cached_property
+from collections.abc import Iterable, Sequence
+import contextlib
+from contextlib import AbstractContextManager
+from contextvars import ContextVar, copy_context
+import enum
+import inspect
+from functools import cached_property, lru_cache, partial, wraps
+import itertools
+import operator
 import re
 from collections import OrderedDict
 from datetime import datetime
@@ -13,9 +20,118 @@ from typing import (
 )
 
 import boto3
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
+
+from botocraft.clients import (
+    client_pool,
+    current_session,
+    manager_pool,
+    scoped_session,
+)
+from botocraft.instrumentation import attributed, attributing, instrumentation
+from botocraft.hydration import hydrate
+
+from .exceptions import MultipleObjectsReturnedError, NotUpdatableError
+from .batching import BatchFuture, batch_scope, batched, queue_lookup, windowed
+from .cache import cached_response, caching, invalidates_responses
+from .identity import WRITE_METHODS, identity_mapped, invalidates_identity, mapped
+from .singleflight import coalesced, coalescing
+from .summary import Boto3Summary
+from .trusted import (
+    PENDING,
+    build_pending,
+    materialize,
+    parse,
+    parse_scoped,
+    shaped,
+)
+from .prefetch import (
+    RECORDED_LOOKUPS,
+    LookupRecorder,
+    prefetch_related_objects,
+    prefetch_relationships,
+)
+
+
+#: The session given to models built while a manager method runs.
+_MODEL_SESSION: ContextVar[boto3.session.Session | None] = ContextVar(
+    "botocraft_model_session", default=None
+)
+
+
+def binds_session(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Give every model built while the manager method ``func`` runs the
+    manager's session, as the model is constructed.
+
+    :py:class:`Boto3ModelManager` applies this to every public method its
+    subclasses define, so the models they return need no
+    :py:meth:`Boto3ModelManager.sessionize` pass afterwards.
+
+    Args:
+        func: The manager method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        token = _MODEL_SESSION.set(self.session)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _MODEL_SESSION.reset(token)
+
+    return wrapper
+
+
+#: A layer of a manager method: whether its feature is on for the call
+#: running, and the decorator that adds the feature to a method.
+Layer = tuple[Callable[[], bool], Callable[[Callable[..., Any]], Callable[..., Any]]]
+
+
+def layered(func: Callable[..., Any], layers: Sequence[Layer]) -> Callable[..., Any]:
+    """
+    Wrap the manager method ``func`` in ``layers``, outermost first, but
+    enter only the layers whose feature is on when it is called.
+
+    Each combination of features is wrapped once, on first use, so with
+    every optional feature off a call goes straight to ``func``.
+
+    Args:
+        func: The manager method to wrap.
+        layers: The layers the method may need.
+
+    Returns:
+        The wrapped method.
 
-from .exceptions import NotUpdatableError
+    """
+    chains: dict[tuple[bool, ...], Callable[..., Any]] = {}
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        active = tuple(on() for on, _ in layers)
+        chain = chains.get(active)
+        if chain is None:
+            chain = func
+            for on, (_, decorate) in zip(
+                reversed(active), reversed(layers), strict=True
+            ):
+                if on:
+                    chain = decorate(chain)
+            # Another thread may build the same chain; either will do
+            chains[active] = chain
+        return chain(self, *args, **kwargs)
+
+    return wrapper
 
 
 class TransformMixin:
@@ -79,12 +195,13 @@ class Boto3Model(TransformMixin, BaseModel):
 
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
-    #: The boto3 session to use for this model.  This is set by the manager,
-    #: and is used in relationships.  We have to use ``Any`` here because we
+    #: The boto3 session to use for this model.  This is set as the model is
+    #: built inside a manager method (see :py:func:`binds_session`), and is
+    #: used in relationships.  We have to use ``Any`` here because we
     #: pydantic complains vociferously if we use ``boto3.session.Session``.
     #: We exclude it from the model dump because it's not something that should
     #: be serialized.
-    session: Any | None = Field(default=None, exclude=True)
+    session: Any | None = Field(default_factory=_MODEL_SESSION.get, exclude=True)
 
     def set_session(self, session: boto3.session.Session) -> None:
         """
@@ -97,12 +214,119 @@ class Boto3Model(TransformMixin, BaseModel):
             The model instance.
 
         """
-        if self.model_config.get("frozen"):
-            self.model_config["frozen"] = False
-            self.session = session
-            self.model_config["frozen"] = True
-        else:
-            self.session = session
+        # Write the field directly: this works on frozen models too, without
+        # unfreezing the model class for every other thread.
+        self.__dict__["session"] = session
+
+    def relationship_manager(self, model_class: type["Boto3Model"]) -> Any:
+        """
+        Return the manager a relationship property loads ``model_class``
+        models with.
+
+        This is the manager for this model's session.  While
+        :py:func:`~botocraft.services.prefetch.prefetch_related_objects` is
+        recording relationship lookups, it is a
+        :py:class:`~botocraft.services.prefetch.LookupRecorder` for that
+        manager instead, so the lookup can be batched with the same lookup
+        on other models.
+
+        Args:
+            model_class: The model class to load.
+
+        Returns:
+            The manager to load ``model_class`` models with.
+
+        """
+        manager = model_class.objects.using(self.session)  # type: ignore[attr-defined]
+        recorded = RECORDED_LOOKUPS.get()
+        if recorded is not None:
+            return LookupRecorder(manager, recorded)
+        return manager
+
+
+class LazyBoto3Model(Boto3Model):
+    """
+    The base class for boto3 models whose nested models a response parsed
+    with ``lazy=True`` may leave to be built on first access (see
+    :py:mod:`botocraft.services.trusted`).
+
+    Reading a field builds it.  Serialization, equality, iteration, repr,
+    copying and pickling build every pending field first, so a lazily built
+    model behaves like one built in full.
+    """
+
+    #: Whether responses parsed with ``lazy=True`` may leave this model's
+    #: nested models to be built on first access.
+    _lazy_loadable: ClassVar[bool] = True
+
+    def __getattr__(self, name: str) -> Any:
+        if PENDING in self.__dict__:
+            token = _MODEL_SESSION.set(self.__dict__.get("session"))
+            try:
+                found, value = build_pending(self, name)
+            finally:
+                _MODEL_SESSION.reset(token)
+            if found:
+                return value
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def _materialize(self) -> None:
+        """
+        Build any nested models this model left to be built on first access,
+        before something reads all of its fields at once.
+        """
+        if PENDING in self.__dict__:
+            token = _MODEL_SESSION.set(self.__dict__.get("session"))
+            try:
+                materialize(self)
+            finally:
+                _MODEL_SESSION.reset(token)
+
+    # As for any pydantic model; frozen subclasses get pydantic's hash
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        pending = self.__dict__.get(PENDING)
+        if pending:
+            pending.pop(name, None)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyBoto3Model):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __iter__(self) -> Any:
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        self._materialize()
+        return super().__repr_args__()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        self._materialize()
+        return super().__getstate__()
+
+    def __copy__(self) -> "LazyBoto3Model":
+        self._materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "LazyBoto3Model":
+        self._materialize()
+        return super().__deepcopy__(memo)
+
+    @model_serializer(mode="wrap")
+    def _serialize_built(self, handler: SerializerFunctionWrapHandler):
+        # Here rather than in model_dump(), so models nested in other models,
+        # TypeAdapter and the like serialize lazily built fields too.  No
+        # return annotation: that would replace the model's JSON schema.
+        # Generated fields default to None even where they are annotated
+        # with a model, so this may be given None.
+        if isinstance(self, LazyBoto3Model):
+            self._materialize()
+        return handler(self)
 
 
 class ReadonlyBoto3Model(Boto3Model):
@@ -116,30 +340,200 @@ class ReadonlyBoto3Model(Boto3Model):
 class Boto3ModelManager(TransformMixin):
     #: The name of the boto3 service.  Example: ``ec2``, ``s3``, etc.
     service_name: str
+    #: The boto3 operation behind both ``get`` and ``get_many``, if they share one.
+    get_many_operation: ClassVar[str | None] = None
+    #: The ``get`` argument and the ``get_many`` argument that takes a list of
+    #: them, if several ``get`` calls can be folded into one ``get_many`` call.
+    get_many_arg: ClassVar[tuple[str, str] | None] = None
+    #: The most identifiers one ``get_many`` call takes, if it is known.
+    get_many_batch_size: ClassVar[int | None] = None
+
+    #: The session explicitly bound to this manager, if any.
+    _session: boto3.session.Session | None = None
+    #: The client resolved for this manager, if any.
+    _client: Any = None
+
+    def __init__(self, session: boto3.session.Session | None = None) -> None:
+        """
+        Bind the manager to a session.
+
+        Nothing is loaded here: the default session and the boto3 client are
+        resolved on first use of :py:attr:`session` or :py:attr:`client`, so
+        managers that never make an API call cost almost nothing to build.
+
+        Keyword Args:
+            session: The boto3 session to use.  Defaults to the session bound
+                by :py:func:`botocraft.clients.using_session`, or the boto3
+                default session.
+
+        """
+        self._session = session or scoped_session()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Make the subclass's ``get()`` consult the identity map in scope (see
+        :py:mod:`botocraft.services.identity`), its ``get()`` and ``list()``
+        use the response cache (see :py:mod:`botocraft.services.cache`), its
+        ``get()`` and ``get_many()`` coalesce identical concurrent calls (see
+        :py:mod:`botocraft.services.singleflight`), its ``get()`` batch into
+        ``get_many()`` when asked to (see
+        :py:mod:`botocraft.services.batching`), and its write methods
+        invalidate the identity map and the cache.  Every public method
+        records itself as the caller of the AWS calls it makes (see
+        :py:mod:`botocraft.instrumentation`), gives the models it builds the
+        manager's session (see :py:func:`binds_session`), and takes
+        ``validate``, ``lazy``, ``only`` and ``raw`` arguments (see
+        :py:mod:`botocraft.services.trusted` and
+        :py:mod:`botocraft.services.projection`).
+
+        Each of these features that can be turned off is only entered by
+        calls made while it is on (see :py:func:`layered`).
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not inspect.isfunction(value) or name.startswith("_"):
+                continue
+            layers: list[Layer] = [
+                (attributing, partial(attributed, f"{cls.__name__}.{name}"))
+            ]
+            if name == "get":
+                layers += [
+                    (windowed, batched),
+                    (mapped, identity_mapped),
+                    (caching, cached_response),
+                    (coalescing, coalesced),
+                ]
+            elif name == "get_many":
+                layers.append((coalescing, coalesced))
+            elif name == "list":
+                layers.append((caching, cached_response))
+            elif name in WRITE_METHODS:
+                layers += [
+                    (mapped, invalidates_identity),
+                    (caching, invalidates_responses),
+                ]
+            setattr(cls, name, parse_scoped(binds_session(layered(value, layers))))
+
+    @property
+    def session(self) -> boto3.session.Session:
+        """
+        The boto3 session to use for this manager.
+        """
+        # A manager with no session of its own follows the session in scope,
+        # so it is never left bound to one ``using_session()`` block
+        return self._session or current_session()
+
+    @session.setter
+    def session(self, value: boto3.session.Session | None) -> None:
+        self._session = value
+
+    @property
+    def client(self) -> Any:
+        """
+        The boto3 client for the AWS service, shared through the client pool.
+        """
+        if self._client is not None:
+            return self._client
+        client = client_pool.get(self.service_name, session=self.session)
+        if self._session is not None:
+            self._client = client
+        return client
 
-    def __init__(self) -> None:
-        #: The boto3 client for the AWS service
-        self.client = boto3.client(self.service_name)  # type: ignore[call-overload]
-        #: The boto3 session to use for this manager.
-        self.session = boto3.session.Session()
+    @client.setter
+    def client(self, value: Any) -> None:
+        # Count the calls a client set by hand makes too, as for pooled ones
+        if getattr(getattr(value, "meta", None), "events", None) is not None:
+            instrumentation.install(value, self.service_name)
+        self._client = value
 
     def using(self, session: boto3.session.Session | None) -> "Boto3ModelManager":
         """
-        Use a different boto3 session for this manager.
+        Return a manager of this class that uses ``session``.
+
+        The returned manager comes from the shared manager pool, so repeated
+        calls with the same session (e.g. from relationship properties) reuse
+        the same manager and client.  ``self`` is never modified, so one
+        manager can be shared by many threads that each bind their own
+        session.
 
         Args:
-            session: The boto3 session to use.
+            session: The boto3 session to use.  If ``None``, or the session
+                this manager already uses, ``self`` is returned.
+
+        """
+        if session is None or session is self.session:
+            return self
+        return manager_pool.get(self.__class__, session)
+
+    def batch(self) -> AbstractContextManager[None]:
+        """
+        Batch this manager's :py:meth:`load` calls into ``get_many()`` calls
+        within a block.
+
+        The lookups queued with :py:meth:`load` are sent as one
+        ``get_many()`` call when the batch reaches the API limit, when a
+        future's ``result()`` is called, or when the block ends.  ``get()``
+        is not affected, and still returns a model.
+
+        Example:
+            .. code-block:: python
+
+                with Cluster.objects.batch():
+                    futures = [Cluster.objects.load(arn) for arn in cluster_arns]
+                clusters = [future.result() for future in futures]
+
+        Returns:
+            A context manager.
+
+        """
+        return batch_scope(self.__class__)
+
+    def load(self, *args, **kwargs) -> BatchFuture:
+        """
+        Queue a ``get()`` in this manager's :py:meth:`batch` block.
+
+        Outside a ``batch()`` block, and on managers without a batched
+        ``get_many()``, the lookup is made right away and the future
+        returned is already resolved.
+
+        Args:
+            *args: The ``get()`` positional arguments.
+            **kwargs: The ``get()`` keyword arguments.
+
+        Returns:
+            A :py:class:`~botocraft.services.batching.BatchFuture` that
+            resolves to what ``get()`` would have returned.
 
         """
-        # TODO: this is a bad way to do this -- it means that whatever session
-        # was last set with .using() will be transparently used by all other
-        # calls to the manager.  This is not good.  We need som way to make
-        # it like a context manager, so that the session is only used for the
-        # duration of the actual method call.
-        if session is not None:
-            self.session = session
-            self.client = session.client(self.service_name)  # type: ignore[call-overload]
-        return self
+        return queue_lookup(self, *args, **kwargs)
+
+    def parse(
+        self,
+        response_class: type[BaseModel],
+        response: dict[str, Any],
+        *,
+        validate: bool | None = None,
+    ) -> Any:
+        """
+        Build a model from a boto3 response.
+
+        The response is validated by pydantic unless the ``validate=False``
+        argument to the manager method running, or the
+        ``responses.validation`` setting, says to trust botocore's parsing
+        instead (see :py:mod:`botocraft.services.trusted`).
+
+        Args:
+            response_class: The model for the response.
+            response: The boto3 response.
+
+        Keyword Args:
+            validate: Override whether to validate the response.
+
+        Returns:
+            The response model.
+
+        """
+        return parse(response_class, response, validate=validate)
 
     def serialize(self, arg: Any) -> Any:
         """
@@ -170,11 +564,154 @@ class Boto3ModelManager(TransformMixin):
             return [self.serialize(a) for a in arg]
         return arg
 
+    def paginate(
+        self,
+        operation: str,
+        response_class: type[BaseModel],
+        response_attr: str,
+        args: dict[str, Any],
+    ) -> "PrimaryBoto3ModelQuerySet | list[Any]":
+        """
+        Run a paginated boto3 list operation and stream its results.
+
+        Only the first non-empty page is fetched up front, to find out what
+        kind of items the operation returns.  If they are
+        :py:class:`Boto3Model` objects (or projections, summaries or dicts of
+        them, when the manager method was given ``only``, ``summary`` or
+        ``raw``), the rest of the pages are fetched on demand by the returned
+        :py:class:`PrimaryBoto3ModelQuerySet`, so ``first()``, ``exists()``,
+        slicing and breaking out of a loop stop pagination early.  Otherwise (e.g. lists of ARNs) every page is
+        fetched and a plain list is returned.
+
+        Args:
+            operation: The boto3 client method to paginate.
+            response_class: The model for one page of the response.
+            response_attr: The attribute of ``response_class`` holding the
+                items.
+            args: The operation arguments.  ``None`` values are dropped.
+
+        Returns:
+            A lazy queryset of models, or a list of non-model items.
+
+        """
+        pages = self._iter_pages(operation, response_class, response_attr, args)
+        for page in pages:
+            if not page:
+                continue
+            if isinstance(page[0], Boto3Model) or (
+                shaped() and isinstance(page[0], (tuple, dict, Boto3Summary))
+            ):
+                return PrimaryBoto3ModelQuerySet(
+                    itertools.chain(page, itertools.chain.from_iterable(pages))
+                )
+            return page + [item for _page in pages for item in _page]
+        return []
+
+    def describe_batched(
+        self,
+        operation: str,
+        response_class: type[BaseModel],
+        response_attr: str,
+        args: dict[str, Any],
+        *,
+        batch_arg: str,
+        batch_size: int,
+    ) -> "PrimaryBoto3ModelQuerySet":
+        """
+        Run a batch-describe boto3 operation over any number of identifiers.
+
+        AWS describe operations accept a limited number of identifiers per
+        call.  ``args[batch_arg]`` is split into chunks of at most
+        ``batch_size``, the chunks are described concurrently with
+        :py:func:`botocraft.hydration.hydrate`, and the results are
+        merged into one queryset in the order of the chunks.  If
+        ``args[batch_arg]`` is ``None``, the operation is called once.
+
+        Generated ``get_many`` methods use this when their method definition
+        in ``managers.yml`` sets ``batch_size``.
+
+        Args:
+            operation: The boto3 client method to call.
+            response_class: The model for the response.
+            response_attr: The attribute of ``response_class`` holding the
+                items.
+            args: The operation arguments.  ``None`` values are dropped.
+
+        Keyword Args:
+            batch_arg: The argument in ``args`` holding the identifiers.
+            batch_size: Maximum identifiers per call.
+
+        Returns:
+            A queryset of every item described.
+
+        """
+
+        def describe(chunk: list[Any] | None) -> list[Any]:
+            _args = {**args, batch_arg: chunk}
+            _response = getattr(self.client, operation)(
+                **{k: v for k, v in _args.items() if v is not None}
+            )
+            response = self.parse(response_class, _response)
+            return list(getattr(response, response_attr) or [])
+
+        identifiers = args.get(batch_arg)
+        if identifiers is None:
+            items = describe(None)
+        else:
+            items = hydrate(identifiers, describe, batch_size=batch_size)
+        return PrimaryBoto3ModelQuerySet(items)
+
+    def _iter_pages(
+        self,
+        operation: str,
+        response_class: type[BaseModel],
+        response_attr: str,
+        args: dict[str, Any],
+    ) -> Iterator[list[Any]]:
+        """
+        Yield the items of each page of a paginated boto3 operation.
+
+        Args:
+            operation: The boto3 client method to paginate.
+            response_class: The model for one page of the response.
+            response_attr: The attribute of ``response_class`` holding the
+                items.
+            args: The operation arguments.  ``None`` values are dropped.
+
+        Yields:
+            The items of one page.
+
+        """
+        # Pages are fetched lazily, after the manager method has returned, so
+        # fetch and parse them in the context it ran in (session, caller,
+        # call budget, validate, only, raw)
+        context = copy_context()
+        context.run(_MODEL_SESSION.set, self.session)
+        paginator = self.client.get_paginator(operation)
+        response_iterator = iter(
+            paginator.paginate(**{k: v for k, v in args.items() if v is not None})
+        )
+        while (_response := context.run(next, response_iterator, None)) is not None:
+            if list(_response.keys()) == ["ResponseMetadata"]:
+                return
+            _response.pop("ResponseMetadata", None)
+            context.run(instrumentation.record_page, self.service_name, operation)
+            response = context.run(self.parse, response_class, _response)
+            items = getattr(response, response_attr)
+            if items:
+                yield list(items)
+            elif not getattr(response, "NextToken", None):
+                return
+
     def sessionize(self, response: Any) -> None:  # noqa: PLR0912
         """
         Look through ``response`` for any object with ``set_session`` as
         an attribute and set the session on that object.
 
+        Models built inside a manager method already have the session (see
+        :py:func:`binds_session`); this is for models built elsewhere, or to
+        move models to this manager's session.
+
         .. note::
 
             I'm making an assumption here that the only PrimaryBoto3Model
@@ -361,8 +898,10 @@ class ReadonlyPrimaryBoto3Model(  # pylint: disable=abstract-method
     #: The manager for this model
     manager_class: ClassVar[type[Boto3ModelManager]]
 
-    #: Get the manager for this model, and set it as a class property
-    objects: ClassVar[classproperty] = classproperty(lambda cls: cls.manager_class())
+    #: Get the shared manager for this model, and set it as a class property
+    objects: ClassVar[classproperty] = classproperty(
+        lambda cls: manager_pool.get(cls.manager_class)
+    )
 
     def save(self, **kwargs):
         """
@@ -380,7 +919,7 @@ class ReadonlyPrimaryBoto3Model(  # pylint: disable=abstract-method
 
 
 class PrimaryBoto3Model(  # pylint: disable=abstract-method
-    ModelIdentityMixin, Boto3Model
+    ModelIdentityMixin, LazyBoto3Model
 ):
     """
     The base class for all boto3 models that get returned as the primary object
@@ -390,8 +929,10 @@ class PrimaryBoto3Model(  # pylint: disable=abstract-method
     #: The manager for this model
     manager_class: ClassVar[type[Boto3ModelManager]]
 
-    #: Get the manager for this model, and set it as a class property
-    objects: ClassVar[classproperty] = classproperty(lambda cls: cls.manager_class())
+    #: Get the shared manager for this model, and set it as a class property
+    objects: ClassVar[classproperty] = classproperty(
+        lambda cls: manager_pool.get(cls.manager_class)
+    )
 
     def save(self, **kwargs):
         """
@@ -421,27 +962,162 @@ class PrimaryBoto3Model(  # pylint: disable=abstract-method
 
 
 class PrimaryBoto3ModelQuerySet:
-    def __init__(self, results: list[Boto3Model]) -> None:
+    def __init__(self, results: Iterable[Boto3Model] | None) -> None:
+        """
+        Initialize the queryset with results.
+
+        If ``results`` is a list, the queryset wraps it directly.  Any other
+        iterable (e.g. the page stream from :py:meth:`Boto3ModelManager.paginate`)
+        is consumed lazily: models are pulled from it only as far as an
+        operation needs them, and cached as they arrive.
+
+        Args:
+            results: List or iterable of Boto3Model objects
+        """
+        #: Models fetched so far.
+        self._cache: list[Boto3Model] = []
+        #: Where to pull more models from, or ``None`` once exhausted.
+        self._source: Iterator[Boto3Model] | None = None
+        if isinstance(results, list):
+            self._cache = results
+        elif results is not None:
+            self._source = iter(results)
+        self._relationship_cache: dict[Any, dict[int, Any]] = {}
+        #: The queryset holding the models the :py:attr:`_steps` run over.
+        self._root: PrimaryBoto3ModelQuerySet = self
+        #: Recorded ``filter()``, ``exclude()`` and ``order_by()`` steps.
+        self._steps: tuple[tuple[str, Any, bool], ...] = ()
+        #: ``(field, lookup, value)`` for the ``exact`` and ``in`` lookups of
+        #: the recorded ``filter()`` steps, which an index can serve.
+        self._indexable: tuple[tuple[str, str, Any], ...] = ()
+        #: Indexes built by :py:meth:`index_by`, keyed by field name.  ``None``
+        #: marks a field whose values cannot be indexed.
+        self._indexes: dict[str, dict[Any, list[Boto3Model]] | None] = {}
+        #: Position of each model in :py:attr:`results`, keyed by ``id()``.
+        self._positions: dict[int, int] | None = None
+
+    @property
+    def results(self) -> list[Boto3Model]:
         """
-        Initialize the queryset with a list of results.
+        All models in the queryset.  Reading this fetches any remaining pages.
+        """
+        if self._source is not None:
+            self._cache.extend(self._source)
+            self._source = None
+        return self._cache
+
+    @results.setter
+    def results(self, value: list[Boto3Model] | None) -> None:
+        self._cache = value or []
+        self._source = None
+        self._indexes = {}
+        self._positions = None
+
+    def _fill(self, count: int) -> int:
+        """
+        Pull models from the source until at least ``count`` are cached.
 
         Args:
-            results: List of Boto3Model objects
+            count: The number of models wanted.
+
+        Returns:
+            The number of models cached, which is less than ``count`` only if
+            the source ran out.
+
+        """
+        missing = count - len(self._cache)
+        if missing > 0 and self._source is not None:
+            self._cache.extend(itertools.islice(self._source, missing))
+            if len(self._cache) < count:
+                self._source = None
+        return len(self._cache)
+
+    def _clone(
+        self,
+        step: tuple[str, Any, bool],
+        indexable: tuple[tuple[str, str, Any], ...] = (),
+    ) -> "PrimaryBoto3ModelQuerySet":
         """
-        self.results = results
-        if not self.results:
-            self.results = []
-        self._relationship_cache: dict[str, dict[int, Any]] = {}
+        Return a new queryset that applies ``step`` after this one's steps.
+
+        The clone runs over the same root models as this queryset, so pages
+        are fetched once no matter how many querysets are derived from a
+        listing, and this queryset is left untouched.
+
+        Args:
+            step: The ``(kind, operation, flag)`` step to record.
+            indexable: Index-servable lookups of ``step``, if it is a filter.
+
+        Returns:
+            The derived queryset.
+        """
+        clone = self.__class__(None)
+        clone._root = self._root  # noqa: SLF001
+        clone._relationship_cache = self._root._relationship_cache  # noqa: SLF001
+        clone._steps = (*self._steps, step)  # noqa: SLF001
+        clone._indexable = (*self._indexable, *indexable)  # noqa: SLF001
+        clone._source = clone._evaluate()  # noqa: SLF001
+        return clone
+
+    def _evaluate(self) -> Iterator[Boto3Model]:
+        """
+        Run the recorded steps over the root models.
+
+        Filters commute with stable sorts, so every ``filter()`` and
+        ``exclude()`` step is applied in a single pass over the root models,
+        in the order they were recorded, and the ``order_by()`` steps are then
+        applied to the survivors.  Without an ``order_by()`` the output is
+        produced as the root models arrive, so ``first()`` and slices only
+        fetch as many pages as they need.
+
+        ``prefetch_related()`` steps run on the survivors before they are
+        sorted.
+
+        If the root queryset has an index (see :py:meth:`index_by`) for a
+        field used in an ``exact`` or ``in`` lookup, only the models the index
+        returns for that lookup are tested.
+
+        Yields:
+            The models that pass every filter, in order.
+        """
+        matchers = [
+            (match, negate) for kind, match, negate in self._steps if kind == "filter"
+        ]
+        orderings = [keys for kind, keys, _ in self._steps if kind == "order"]
+        prefetches = [names for kind, names, _ in self._steps if kind == "prefetch"]
+        root = self._root
+        candidates = root._candidates(self._indexable)  # noqa: SLF001
+        if candidates is None:
+            # Once every page is fetched, skip the page-fetching iterator
+            candidates = root if root._source is not None else root._cache  # noqa: SLF001
+        rows: Iterable[Boto3Model] = candidates
+        if matchers:
+            rows = (
+                model
+                for model in candidates
+                if all(match(model) is not negate for match, negate in matchers)
+            )
+        if not orderings and not prefetches:
+            yield from rows
+            return
+        ordered = list(rows)
+        for names in prefetches:
+            prefetch_related_objects(ordered, *names)
+        for keys in orderings:
+            ordered = self._sort(ordered, keys)
+        yield from ordered
 
     def first(self) -> Boto3Model | None:
         """
         Get the first model in the queryset.
 
+        This fetches at most one page.
+
         Returns:
             The first Boto3Model object or None if the queryset is empty
         """
-        if self.results:
-            return self.results[0]
+        if self._fill(1):
+            return self._cache[0]
         return None
 
     def __len__(self) -> int:
@@ -457,10 +1133,12 @@ class PrimaryBoto3ModelQuerySet:
         """
         Check if the queryset contains any models.
 
+        This fetches at most one page.
+
         Returns:
             True if there are models in the queryset, False otherwise
         """
-        return bool(self.results)
+        return bool(self._fill(1))
 
     def count(self) -> int:
         """
@@ -475,37 +1153,101 @@ class PrimaryBoto3ModelQuerySet:
         """
         Check if the queryset contains any models.
 
+        This fetches at most one page.
+
         Returns:
             True if there are models in the queryset, False otherwise
         """
-        return bool(self.results)
+        return bool(self._fill(1))
 
-    def order_by(self, field_spec: str) -> "PrimaryBoto3ModelQuerySet":
+    def _accessor(self, field_name: str) -> Callable[[Any], Any]:
         """
-        Order the queryset by the specified field.
+        Build a function that reads ``field_name`` from a model.
 
         Args:
-            field_spec: Field to order by, can include '__' for nested fields.
-                        Prefix with '-' for descending order.
+            field_name: The field name, can include '__' for nested fields.
 
         Returns:
-            The ordered queryset
+            The accessor function.
         """
-        if not self.results:
-            return self
+        filter_obj = Boto3ModelManagerFilter(
+            [], dummy=True, relationship_cache=self._relationship_cache
+        )
+        return filter_obj._accessor(_split_path(field_name))  # noqa: SLF001
+
+    def _matcher(self, filters: dict[str, Any]) -> Callable[[Any], bool]:
+        """
+        Compile ``filters`` into a function that tests one model.
+
+        Args:
+            filters: Django-style filter keyword arguments.
+
+        Returns:
+            The compiled match function.
+        """
+        return Boto3ModelManagerFilter(
+            [], relationship_cache=self._relationship_cache, **filters
+        ).matcher()
+
+    def order_by(self, *field_specs: str) -> "PrimaryBoto3ModelQuerySet":
+        """
+        Order the queryset by one or more fields.
+
+        Models are sorted by the first field, then ties are broken by the
+        second field, and so on.  Each field is read once per model, and
+        relationships on the field paths are loaded concurrently for all
+        models before sorting starts.
+
+        Example:
+            .. code-block:: python
 
-        reverse = False
-        if field_spec.startswith("-"):
-            reverse = True
-            field_spec = field_spec[1:]
+                instances = Instance.objects.list().order_by(
+                    "-LaunchTime", "InstanceType"
+                )
+
+        Args:
+            *field_specs: Fields to order by, can include '__' for nested
+                fields.  Prefix with '-' for descending order.
+
+        Raises:
+            ValueError: If no fields are given.
+
+        Returns:
+            A new, ordered queryset
+        """
+        if not field_specs:
+            msg = "order_by() requires at least one field name"
+            raise ValueError(msg)
+        keys = []
+        for field_spec in field_specs:
+            reverse = field_spec.startswith("-")
+            field_name = field_spec[1:] if reverse else field_spec
+            keys.append(
+                (
+                    _split_path(field_name),
+                    self._sort_key(field_name),
+                    reverse,
+                )
+            )
+        return self._clone(("order", tuple(keys), False))
+
+    def _sort_key(self, field_name: str) -> Callable[[Any], tuple[bool, Any]]:
+        """
+        Build the sort key function for ``field_name``.
+
+        Args:
+            field_name: The field to sort on, can include '__' for nested
+                fields.
 
+        Returns:
+            A function returning a ``(has_value, value)`` sort key.
+        """
         # Use the same field accessor as the filter to get nested fields
+        access = self._accessor(field_name)
+
         def get_field_value(model):
-            filter_obj = Boto3ModelManagerFilter(
-                [model], dummy=True, relationship_cache=self._relationship_cache
-            )
             try:
-                value = filter_obj._get_field_value(model, field_spec)  # noqa: SLF001
+                value = access(model)
             except AttributeError:
                 # If the field doesn't exist, return (False, None) so it sorts first
                 return (False, None)
@@ -525,31 +1267,273 @@ class PrimaryBoto3ModelQuerySet:
             # Return None for missing values so they sort at the beginning
             return (True, value) if value is not None else (False, value)
 
-        self.results = sorted(self.results, key=get_field_value, reverse=reverse)
-        return self
+        return get_field_value
+
+    @staticmethod
+    def _sort(
+        models: list[Boto3Model],
+        keys: tuple[tuple[tuple[str, ...], Callable[[Any], Any], bool], ...],
+    ) -> list[Boto3Model]:
+        """
+        Sort ``models`` on several keys, computing each key once per model.
+
+        Args:
+            models: The models to sort.
+            keys: ``(field path, key function, reverse)`` for each sort field,
+                most significant first.
+
+        Returns:
+            The sorted models.
+        """
+        for parts, _, _ in keys:
+            prefetch_relationships(models, parts)
+        # Compute each key once per model, then sort positions by the keys
+        columns = [[function(model) for model in models] for _, function, _ in keys]
+        order = list(range(len(models)))
+        directions = {reverse for _, _, reverse in keys}
+        if len(directions) == 1:
+            rows = columns[0] if len(columns) == 1 else list(zip(*columns, strict=True))
+            order.sort(key=rows.__getitem__, reverse=directions.pop())
+        else:
+            # Mixed directions: stable sorts from the least significant key up
+            for column, (_, _, reverse) in reversed(
+                list(zip(columns, keys, strict=True))
+            ):
+                order.sort(key=column.__getitem__, reverse=reverse)
+        return [models[position] for position in order]
 
     def filter(self, **kwargs) -> "PrimaryBoto3ModelQuerySet":
         """
-        Filter the model using the manager's filter method.
+        Return a new queryset of the models that match all of ``kwargs``.
+
+        Nothing is evaluated until the new queryset is used, and this
+        queryset is left unchanged.
 
         Args:
             **kwargs: The filter criteria.
 
         Returns:
-            A filter object that can be used to filter the model.
+            A new, filtered queryset.
 
         """
-        if not self.results:
-            msg = "No results to filter"
-            raise ValueError(msg)
-
-        # Create a new relationship cache for this filter operation
-        self._relationship_cache = {}
-        filter_obj = Boto3ModelManagerFilter(
-            self.results, relationship_cache=self._relationship_cache, **kwargs
+        return self._clone(
+            ("filter", self._matcher(kwargs), False), self._index_lookups(kwargs)
         )
-        self.results = filter_obj()
-        return self
+
+    def exclude(self, **kwargs) -> "PrimaryBoto3ModelQuerySet":
+        """
+        Return a new queryset without the models that match all of ``kwargs``.
+
+        This is the inverse of :py:meth:`filter`: a model is dropped only if
+        it matches every criterion.
+
+        Args:
+            **kwargs: The filter criteria.
+
+        Returns:
+            A new queryset.
+
+        """
+        return self._clone(("filter", self._matcher(kwargs), True))
+
+    def prefetch_related(self, *lookups: str) -> "PrimaryBoto3ModelQuerySet":
+        """
+        Return a new queryset that loads the relationships ``lookups`` in bulk.
+
+        When the queryset is evaluated, each relationship (e.g. ``cluster``
+        on ECS services) is loaded for every model at once: each distinct
+        related object is fetched once, with the batch describe API where
+        there is one, and stored on every model that refers to it.  Reading
+        the relationship afterwards makes no AWS calls.
+
+        Use ``__`` to also load relationships of the related objects, e.g.
+        ``"service__cluster"``.
+
+        Example:
+            .. code-block:: python
+
+                services = Service.objects.list(cluster="prod").prefetch_related(
+                    "cluster", "task_definition"
+                )
+                for service in services:
+                    print(service.cluster.clusterName)
+
+        Args:
+            *lookups: The relationships to load.
+
+        Returns:
+            A new queryset.
+
+        """
+        return self._clone(("prefetch", lookups, False))
+
+    @staticmethod
+    def _index_lookups(filters: dict[str, Any]) -> tuple[tuple[str, str, Any], ...]:
+        """
+        Pick out the lookups in ``filters`` that an index could serve.
+
+        Args:
+            filters: Django-style filter keyword arguments.
+
+        Returns:
+            ``(field, lookup, value)`` for each ``exact`` lookup, and for each
+            ``in`` lookup against a list, tuple or set.
+        """
+        lookups = []
+        for field_spec, value in filters.items():
+            parts, lookup = Boto3ModelManagerFilter.parse_spec(field_spec)
+            if lookup == "exact" or (
+                lookup == "in" and isinstance(value, (list, tuple, set, frozenset))
+            ):
+                lookups.append(("__".join(parts), lookup, value))
+        return tuple(lookups)
+
+    def _candidates(
+        self, lookups: tuple[tuple[str, str, Any], ...]
+    ) -> list[Boto3Model] | None:
+        """
+        Use an existing index to narrow down the models that can match.
+
+        Args:
+            lookups: ``(field, lookup, value)`` lookups, as returned by
+                :py:meth:`_index_lookups`.
+
+        Returns:
+            The models that could match all of ``lookups``, in queryset order,
+            or ``None`` if no index covers any of them.
+        """
+        for field, lookup, value in lookups:
+            index = self._indexes.get(field)
+            if index is None:
+                continue
+            try:
+                if lookup == "exact":
+                    return index.get(value, [])
+                buckets = [index[key] for key in value if key in index]
+            except TypeError:
+                # Unhashable filter values can't be looked up
+                continue
+            if len(buckets) == 1:
+                return buckets[0]
+            if self._positions is None:
+                self._positions = {id(model): i for i, model in enumerate(self.results)}
+            found = {id(model): model for bucket in buckets for model in bucket}
+            return sorted(found.values(), key=lambda model: self._positions[id(model)])
+        return None
+
+    def index_by(self, field_name: str) -> dict[Any, list[Boto3Model]]:
+        """
+        Return a dict mapping each value of ``field_name`` to its models.
+
+        The index is built in one pass and cached on the queryset, and from
+        then on ``exact`` and ``in`` lookups on ``field_name`` in
+        :py:meth:`filter` and :py:meth:`get` (on this queryset or any queryset
+        derived from it) are answered from the index instead of by scanning
+        every model.  If the field holds a list, the model is indexed under
+        each item in the list, matching how :py:meth:`filter` treats lists.
+        Models without the field are left out.
+
+        Example:
+            .. code-block:: python
+
+                volumes = Volume.objects.list().index_by("Attachments__InstanceId")
+                for instance in Instance.objects.list():
+                    attached = volumes.get(instance.InstanceId, [])
+
+        Args:
+            field_name: The field to index on, can include '__' for nested
+                fields.
+
+        Raises:
+            TypeError: If some value of ``field_name`` is not hashable.
+
+        Returns:
+            The index.  Treat it as read-only.
+        """
+        index = self._indexes.get(field_name)
+        if index is not None:
+            return index
+        access = self._accessor(field_name)
+        index = {}
+        for model in self.results:
+            try:
+                value = access(model)
+            except (AttributeError, TypeError):
+                # Models without the field can't match an exact lookup
+                continue
+            if isinstance(value, list):
+                keys = [item for item in value if item is not None]
+            else:
+                keys = [value]
+            for key in keys:
+                bucket = index.setdefault(key, [])
+                if not bucket or bucket[-1] is not model:
+                    bucket.append(model)
+        self._indexes[field_name] = index
+        return index
+
+    def in_bulk(
+        self, id_list: Iterable[Any] | None = None, *, field_name: str = "pk"
+    ) -> dict[Any, Boto3Model]:
+        """
+        Return a dict mapping values of ``field_name`` to models.
+
+        Like Django's ``in_bulk()``, but served from :py:meth:`index_by`.
+        If several models share a value, the first one wins.
+
+        Args:
+            id_list: Only include these values.  Defaults to every value.
+
+        Keyword Args:
+            field_name: The field to map on.  Defaults to ``pk``.
+
+        Returns:
+            A dict of field value to model.
+        """
+        index = self.index_by(field_name)
+        if id_list is None:
+            return {key: models[0] for key, models in index.items()}
+        return {key: index[key][0] for key in id_list if key in index}
+
+    def get(self, **kwargs) -> Boto3Model | None:
+        """
+        Return the single model matching all of ``kwargs``.
+
+        Unlike ``Model.objects.get()``, this searches the models already in
+        the queryset and makes no AWS calls.  The first ``exact`` or ``in``
+        lookup is served from an index on its field, built on first use, so
+        repeated ``get()`` calls each take constant time.
+
+        Args:
+            **kwargs: The filter criteria.
+
+        Raises:
+            MultipleObjectsReturnedError: If more than one model matches.
+
+        Returns:
+            The matching model, or ``None`` if nothing matches.
+        """
+        lookups = self._index_lookups(kwargs)
+        for field, _, _ in lookups:
+            if field not in self._indexes:
+                try:
+                    self.index_by(field)
+                except TypeError:
+                    self._indexes[field] = None
+                    continue
+            if self._indexes[field] is not None:
+                break
+        candidates = self._candidates(lookups)
+        match = self._matcher(kwargs)
+        matches = [
+            model
+            for model in (self.results if candidates is None else candidates)
+            if match(model)
+        ]
+        if len(matches) > 1:
+            msg = f"get() returned {len(matches)} models for {kwargs!r}"
+            raise MultipleObjectsReturnedError(msg)
+        return matches[0] if matches else None
 
     def values(self, *fields) -> list[dict]:
         """
@@ -565,30 +1549,14 @@ class PrimaryBoto3ModelQuerySet:
         Returns:
             A list of dictionaries with the requested fields.
         """
-        if not self.results:
-            return []
-
-        result_list = []
-        for obj in self.results:
-            if not fields:
-                # If no fields specified, convert the entire object to a dict
-                result_list.append(
-                    obj.model_dump() if hasattr(obj, "model_dump") else vars(obj)
-                )
-            else:
-                # Extract only the specified fields
-                result = {}
-                filter_obj = Boto3ModelManagerFilter(
-                    [obj], dummy=True, relationship_cache=self._relationship_cache
-                )
-                for field in fields:
-                    try:
-                        result[field] = filter_obj._get_field_value(obj, field)  # noqa: SLF001
-                    except (AttributeError, KeyError):  # noqa: PERF203
-                        result[field] = None
-                result_list.append(result)
-
-        return result_list
+        if not fields:
+            # If no fields specified, convert the entire object to a dict
+            return [
+                obj.model_dump() if hasattr(obj, "model_dump") else vars(obj)
+                for obj in self
+            ]
+        project = self._projector(fields)
+        return [dict(zip(fields, project(obj), strict=True)) for obj in self]
 
     def values_list(self, *fields, flat=False) -> list:
         """
@@ -617,40 +1585,51 @@ class PrimaryBoto3ModelQuerySet:
             msg = "flat=True is only valid when values_list() is called with a single field"
             raise ValueError(msg)
 
-        if not self.results:
-            return []
+        project = self._projector(fields)
+        if flat:
+            # Return single values for flat=True
+            return [project(obj)[0] for obj in self]
+        return [project(obj) for obj in self]
 
-        result_list = []
-        for obj in self.results:
-            filter_obj = Boto3ModelManagerFilter(
-                [obj], dummy=True, relationship_cache=self._relationship_cache
-            )
-            if flat:
-                # Return single values for flat=True
+    def _projector(self, fields: tuple[str, ...]) -> Callable[[Any], tuple]:
+        """
+        Build a function that reads ``fields`` from a model.
+
+        Missing fields read as ``None``.
+
+        Args:
+            fields: The field names to read.
+
+        Returns:
+            A function returning a tuple of the field values.
+        """
+        accessors = [self._accessor(field) for field in fields]
+
+        def project(obj: Any) -> tuple:
+            result = []
+            for access in accessors:
                 try:
-                    result_list.append(filter_obj._get_field_value(obj, fields[0]))  # noqa: SLF001
-                except (AttributeError, KeyError):
-                    result_list.append(None)
-            else:
-                # Return tuples of values
-                result = []
-                for field in fields:
-                    try:
-                        result.append(filter_obj._get_field_value(obj, field))  # noqa: SLF001
-                    except (AttributeError, KeyError):  # noqa: PERF203
-                        result.append(None)
-                result_list.append(tuple(result))
+                    result.append(access(obj))
+                except (AttributeError, KeyError):  # noqa: PERF203
+                    result.append(None)
+            return tuple(result)
 
-        return result_list
+        return project
 
     def __iter__(self) -> Iterator[Boto3Model]:
         """
         Enable iteration over the filtered results.
 
+        Pages are fetched as the iteration reaches them, so breaking out of
+        the loop early stops pagination.
+
         Returns:
             Iterator over filtered models or values if values()/values_list() was called
         """
-        return iter(self.results)
+        index = 0
+        while index < self._fill(index + 1):
+            yield self._cache[index]
+            index += 1
 
     def all(self) -> list[Boto3Model]:
         """
@@ -675,10 +1654,21 @@ class PrimaryBoto3ModelQuerySet:
             Either a new queryset if a slice is used, or a single model instance
             if a single index is used.
         """
-        new_results = self.results[index]
-        if not isinstance(new_results, list):
-            return new_results
-        return self.__class__(new_results)
+        if isinstance(index, slice):
+            if (
+                (index.start is None or index.start >= 0)
+                and index.stop is not None
+                and index.stop >= 0
+                and (index.step is None or index.step > 0)
+            ):
+                # Only fetch as far as the end of the slice.
+                self._fill(index.stop)
+                return self.__class__(self._cache[index])
+            return self.__class__(self.results[index])
+        if isinstance(index, int) and index >= 0:
+            self._fill(index + 1)
+            return self._cache[index]
+        return self.results[index]
 
     def __add__(
         self, other: "PrimaryBoto3ModelQuerySet"
@@ -689,6 +1679,137 @@ class PrimaryBoto3ModelQuerySet:
         return self.__class__(self.results + other.results)
 
 
+#: The UTC timezone, used to normalise datetimes before date/time lookups.
+_UTC = ZoneInfo("UTC")
+
+#: Date/time lookups, mapped to the part of a UTC datetime they compare.
+_DATETIME_PARTS: dict[str, Callable[[datetime], Any]] = {
+    "date": datetime.date,
+    "year": operator.attrgetter("year"),
+    "iso_year": lambda dt: dt.isocalendar()[0],
+    "month": operator.attrgetter("month"),
+    "day": operator.attrgetter("day"),
+    "week": lambda dt: dt.isocalendar()[1],
+    "week_day": lambda dt: dt.weekday() + 1,
+    "iso_week_day": lambda dt: dt.isocalendar()[2],
+    "quarter": lambda dt: (dt.month - 1) // 3 + 1,
+    "time": datetime.time,
+    "hour": operator.attrgetter("hour"),
+    "minute": operator.attrgetter("minute"),
+    "second": operator.attrgetter("second"),
+}
+
+
+class _AttributeKind(enum.Enum):
+    """How a class exposes a named attribute, for field path resolution."""
+
+    #: A ``property`` or ``cached_property``, e.g. a relationship.
+    PROPERTY = "property"
+    #: A pydantic model field.
+    FIELD = "field"
+    #: Anything else; resolved by probing at runtime.
+    OTHER = "other"
+
+
+@lru_cache(maxsize=4096)
+def _attribute_kind(cls: type, name: str) -> _AttributeKind:
+    """
+    Classify how ``cls`` exposes ``name``.  Cached per class and name.
+
+    Args:
+        cls: The class to inspect
+        name: The attribute name
+
+    Returns:
+        The kind of attribute
+    """
+    attr = getattr(cls, name, None)
+    if isinstance(attr, (property, cached_property)):
+        return _AttributeKind.PROPERTY
+    if name in (getattr(cls, "model_fields", None) or {}):
+        return _AttributeKind.FIELD
+    return _AttributeKind.OTHER
+
+
+@lru_cache(maxsize=1024)
+def _split_path(field_name: str) -> tuple[str, ...]:
+    """
+    Split a ``__``-separated field path.  Cached per path.
+
+    Args:
+        field_name: The field path
+
+    Returns:
+        The path parts
+    """
+    return tuple(field_name.split("__"))
+
+
+def _to_utc(value: Any) -> datetime | None:
+    """
+    Normalise ``value`` to a UTC datetime, or ``None`` if it is not one.
+
+    Naive datetimes are assumed to already be in UTC.
+
+    Args:
+        value: The value to normalise
+
+    Returns:
+        The UTC datetime, or ``None``
+    """
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    return value.astimezone(_UTC)
+
+
+def _datetime_lookup(
+    part: Callable[[datetime], Any], field_val: Any, filter_val: Any
+) -> bool:
+    """
+    Compare one part of ``field_val``, as a UTC datetime, to ``filter_val``.
+
+    Args:
+        part: Extracts the compared part from a UTC datetime
+        field_val: The field value
+        filter_val: The value to compare against
+
+    Returns:
+        False if ``field_val`` is not a datetime, else the comparison result
+    """
+    dt = _to_utc(field_val)
+    return dt is not None and part(dt) == filter_val
+
+
+def _prepare_in(filter_val: Any) -> Callable[[Any], bool]:
+    """
+    Build a membership test for the ``in`` lookup, using a set when possible.
+
+    Args:
+        filter_val: The collection to test membership in
+
+    Returns:
+        A function that tests whether a field value is in ``filter_val``
+    """
+    if not isinstance(filter_val, (list, tuple)):
+        # Strings keep substring semantics; sets and dicts are already hashed
+        return lambda field_val: field_val in filter_val
+    try:
+        members = frozenset(filter_val)
+    except TypeError:
+        return lambda field_val: field_val in filter_val
+
+    def contains(field_val: Any) -> bool:
+        try:
+            return field_val in members
+        except TypeError:
+            # Unhashable field values fall back to a linear scan
+            return field_val in filter_val
+
+    return contains
+
+
 class Boto3ModelManagerFilter:
     """
     A filter class for Boto3Model objects that provides Django-like filtering capabilities.
@@ -738,20 +1859,11 @@ class Boto3ModelManagerFilter:
     @staticmethod
     def _ensure_utc_datetime(dt_value: Any) -> datetime | None:
         """Convert a value to UTC datetime if it's a datetime with tzinfo."""
-        if not isinstance(dt_value, datetime):
-            return None
-
-        # Create a copy to avoid modifying the original
-        dt_copy = dt_value
+        return _to_utc(dt_value)
 
-        # If it has a timezone, convert to UTC
-        if dt_copy.tzinfo is not None:
-            return dt_copy.astimezone(ZoneInfo("UTC"))
-
-        # No timezone info, assume it's UTC
-        return dt_copy.replace(tzinfo=ZoneInfo("UTC"))
-
-    #: Map of supported lookups to their filter functions
+    #: Map of supported lookups to their filter functions.  These are the
+    #: reference implementations; :py:attr:`COMPILED_LOOKUPS` holds the
+    #: precompiled equivalents that :py:meth:`compile` actually uses.
     LOOKUPS: ClassVar[dict[str, Callable[[Any, Any], bool]]] = {
         # String lookups
         "exact": lambda field_val, filter_val: field_val == filter_val,
@@ -795,82 +1907,54 @@ class Boto3ModelManagerFilter:
             isinstance(field_val, dict) and filter_val in field_val
         ),
         # Date/time lookups
-        "date": lambda field_val, filter_val: (
-            isinstance(field_val, datetime)
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).date()  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "year": lambda field_val, filter_val: (
-            isinstance(field_val, datetime)
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).year  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "iso_year": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).isocalendar()[0]  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "month": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).month  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "day": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).day  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "week": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).isocalendar()[1]  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "week_day": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and (Boto3ModelManagerFilter._ensure_utc_datetime(field_val).weekday() + 1)  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "iso_week_day": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).isocalendar()[2]  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "quarter": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and (
-                (Boto3ModelManagerFilter._ensure_utc_datetime(field_val).month - 1) // 3  # type: ignore[union-attr]
-                + 1
-            )
-            == filter_val
-        ),
-        "time": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).time()  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "hour": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).hour  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "minute": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).minute  # type: ignore[union-attr]
-            == filter_val
-        ),
-        "second": lambda field_val, filter_val: (
-            Boto3ModelManagerFilter._ensure_utc_datetime(field_val) is not None
-            and Boto3ModelManagerFilter._ensure_utc_datetime(field_val).second  # type: ignore[union-attr]
-            == filter_val
+        **{
+            name: partial(_datetime_lookup, part)
+            for name, part in _DATETIME_PARTS.items()
+        },
+    }
+
+    #: How lookups normalise their filter value.  :py:meth:`compile` runs
+    #: these once per filter instead of once per model.
+    PREPARE: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "iexact": lambda filter_val: str(filter_val).lower(),
+        "contains": str,
+        "icontains": lambda filter_val: str(filter_val).lower(),
+        "startswith": str,
+        "istartswith": lambda filter_val: str(filter_val).lower(),
+        "endswith": str,
+        "iendswith": lambda filter_val: str(filter_val).lower(),
+        "regex": re.compile,
+        "iregex": lambda filter_val: re.compile(filter_val, re.IGNORECASE),
+        "in": _prepare_in,
+    }
+
+    #: Lookups that take a filter value already normalised by
+    #: :py:attr:`PREPARE`.  Lookups missing here fall back to
+    #: :py:attr:`LOOKUPS`.
+    COMPILED_LOOKUPS: ClassVar[dict[str, Callable[[Any, Any], bool]]] = {
+        "exact": operator.eq,
+        "iexact": lambda field_val, lowered: str(field_val).lower() == lowered,
+        "contains": lambda field_val, needle: needle in str(field_val),
+        "icontains": lambda field_val, needle: needle in str(field_val).lower(),
+        "startswith": lambda field_val, prefix: str(field_val).startswith(prefix),
+        "istartswith": lambda field_val, prefix: (
+            str(field_val).lower().startswith(prefix)
         ),
+        "endswith": lambda field_val, suffix: str(field_val).endswith(suffix),
+        "iendswith": lambda field_val, suffix: str(field_val).lower().endswith(suffix),
+        "regex": lambda field_val, pattern: pattern.search(str(field_val)) is not None,
+        "iregex": lambda field_val, pattern: pattern.search(str(field_val)) is not None,
+        "in": lambda field_val, contains: contains(field_val),
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
     }
 
     def __init__(
         self,
         models: list[Boto3Model],
-        relationship_cache: dict[str, dict[int, Any]] | None = None,
+        relationship_cache: dict[Any, dict[int, Any]] | None = None,
         **filters: Any,
     ) -> None:
         """
@@ -899,11 +1983,7 @@ class Boto3ModelManagerFilter:
         Returns:
             True if it's a property or cached_property, False otherwise
         """
-        if not hasattr(obj.__class__, attr_name):
-            return False
-
-        attr = getattr(obj.__class__, attr_name)
-        return isinstance(attr, (property, cached_property))
+        return _attribute_kind(obj.__class__, attr_name) is _AttributeKind.PROPERTY
 
     def _get_property_value(self, obj: Any, attr_name: str) -> Any:
         """
@@ -916,28 +1996,16 @@ class Boto3ModelManagerFilter:
         Returns:
             The value of the property
         """
-        # Create a cache key based on object id and property name
-        cache_key = f"{obj.__class__.__name__}.{attr_name}"
+        # Cache per (class, property), then per object
+        per_object = self._relationship_cache.setdefault((obj.__class__, attr_name), {})
         obj_id = id(obj)
+        try:
+            return per_object[obj_id]
+        except KeyError:
+            value = per_object[obj_id] = getattr(obj, attr_name)
+            return value
 
-        # Check if we've already cached this property value
-        if (
-            cache_key in self._relationship_cache
-            and obj_id in self._relationship_cache[cache_key]
-        ):
-            return self._relationship_cache[cache_key][obj_id]
-
-        # If not cached, get the property value
-        value = getattr(obj, attr_name)
-
-        # Cache the result
-        if cache_key not in self._relationship_cache:
-            self._relationship_cache[cache_key] = {}
-        self._relationship_cache[cache_key][obj_id] = value
-
-        return value
-
-    def _get_field_value(self, model: Boto3Model, field_name: str) -> Any:  # noqa: PLR0911, PLR0912, PLR0915
+    def _get_field_value(self, model: Boto3Model, field_name: str) -> Any:
         """
         Get a field value from a model, supporting nested attribute access.
         This method handles complex nested structures including lists, dictionaries,
@@ -957,89 +2025,81 @@ class Boto3ModelManagerFilter:
         Raises:
             AttributeError: If the field doesn't exist on the model
         """
-        parts = field_name.split("__")
-        value = model
+        return self._resolve(model, _split_path(field_name))
 
-        for i, part in enumerate(parts):
-            if value is None:
-                return None
+    def _resolve(  # noqa: PLR0911, PLR0912
+        self, model: Any, parts: tuple[str, ...], start: int = 0
+    ) -> Any:
+        """
+        Resolve an already-split field path against ``model``.
 
-            # Handle relationship properties
-            if i == 0 and self._is_property_method(value, part):
-                # Get the relationship property value with caching
-                related_obj = self._get_property_value(value, part)
-
-                # If this is the last part, return the related object(s)
-                if i == len(parts) - 1:
-                    return related_obj
-
-                # If there are more parts, continue traversing
-                if related_obj is None:
-                    return None
-
-                # Handle both single objects and lists of related objects
-                if isinstance(related_obj, list):
-                    # Recursively process each related object with the remaining path
-                    remaining_path = "__".join(parts[i + 1 :])
-                    results = []
-                    for item in related_obj:
-                        if item is not None:
-                            try:
-                                result = self._get_field_value(item, remaining_path)
-                                if result is not None:
-                                    if isinstance(result, list):
-                                        results.extend(result)
-                                    else:
-                                        results.append(result)
-                            except (AttributeError, KeyError, TypeError, IndexError):
-                                pass
-                    return results or None
-                # Continue with the next part using the related object
-                value = related_obj
-                continue
+        This is the engine behind :py:meth:`_get_field_value`.  Paths are split
+        once, and how each class exposes an attribute (pydantic field, property,
+        or neither) is looked up once per class instead of once per model.
 
-            # Special case for handling dictionary access with nested paths
-            if i == 0 and hasattr(value, part) and len(parts) > 1:
-                # Get the top-level attribute
-                attr_value = getattr(value, part)
-                if isinstance(attr_value, dict):
-                    # If it's a dictionary, handle the nested parts
-                    nested_parts = parts[1:]
-                    nested_value = attr_value
-                    for nested_part in nested_parts:
-                        if nested_value is None or not isinstance(nested_value, dict):
-                            return None
-                        nested_value = cast(
-                            "dict[str, Any]", nested_value.get(nested_part)
-                        )
-                    return nested_value
+        Args:
+            model: The object to resolve the path on
+            parts: The field path, split on ``__``
+            start: Resume at ``parts[start]``, treating ``model`` as the value
+                already reached by ``parts[:start]``
 
-            # Handle lists - automatically traverse all items
-            if isinstance(value, (list, tuple)) and value:
-                # Get the remaining path to check
-                remaining_path = "__".join([part, *parts[i + 1 :]])
+        Returns:
+            The field value or list of values when traversing through lists
 
+        Raises:
+            AttributeError: If the field doesn't exist on the model
+        """
+        value = model
+        last = len(parts) - 1
+
+        for i in range(start, len(parts)):
+            part = parts[i]
+            if value is None:
+                return None
+
+            if i == 0:
+                kind = _attribute_kind(value.__class__, part)
+                # Handle relationship properties
+                if kind is _AttributeKind.PROPERTY:
+                    related_obj = self._get_property_value(value, part)
+                    if i == last or related_obj is None:
+                        return related_obj
+                    # Handle both single objects and lists of related objects
+                    if isinstance(related_obj, list):
+                        return self._resolve_each(related_obj, parts[i + 1 :])
+                    value = related_obj
+                    continue
+                # Model fields always exist, so skip the generic probing
+                if kind is _AttributeKind.FIELD:
+                    value = getattr(value, part)
+                    # Special case for dictionary access with nested paths
+                    if last and isinstance(value, dict):
+                        for nested_part in parts[1:]:
+                            if not isinstance(value, dict):
+                                return None
+                            value = value.get(nested_part)
+                        return value
+                    continue
+                # Special case for handling dictionary access with nested paths
+                if last and hasattr(value, part):
+                    attr_value = getattr(value, part)
+                    if isinstance(attr_value, dict):
+                        nested_value: Any = attr_value
+                        for nested_part in parts[1:]:
+                            if not isinstance(nested_value, dict):
+                                return None
+                            nested_value = nested_value.get(nested_part)
+                        return nested_value
+
+            # Handle lists - automatically traverse all items.  Named tuples
+            # (``only=`` projections) are records, not lists
+            if value and (isinstance(value, list) or type(value) is tuple):
                 # If this is the last part and all items have this attribute
-                if i == len(parts) - 1 and all(
+                if i == last and all(
                     hasattr(item, part) for item in value if item is not None
                 ):
                     return [getattr(item, part) for item in value if item is not None]
-
-                # Get values from all items in the list that have this path
-                results = []
-                for item in value:
-                    if item is not None:
-                        try:
-                            result = self._get_field_value(item, remaining_path)
-                            if result is not None:
-                                if isinstance(result, list):
-                                    results.extend(result)
-                                else:
-                                    results.append(result)
-                        except (AttributeError, KeyError, TypeError, IndexError):
-                            # Skip items that don't have this attribute
-                            pass
-                return results or None
+                return self._resolve_each(value, parts[i:])
 
             # Handle dictionary access
             if isinstance(value, dict):
@@ -1061,6 +2121,161 @@ class Boto3ModelManagerFilter:
 
         return value
 
+    def _resolve_each(self, items: Iterable[Any], parts: tuple[str, ...]) -> Any:
+        """
+        Resolve ``parts`` on each item, flattening the non-``None`` results.
+
+        Args:
+            items: The objects to resolve the path on
+            parts: The remaining field path
+
+        Returns:
+            The combined values, or ``None`` if no item had a value
+        """
+        results: list[Any] = []
+        for item in items:
+            if item is None:
+                continue
+            try:
+                result = self._resolve(item, parts)
+            except (AttributeError, KeyError, TypeError, IndexError):
+                # Skip items that don't have this attribute
+                continue
+            if result is not None:
+                if isinstance(result, list):
+                    results.extend(result)
+                else:
+                    results.append(result)
+        return results or None
+
+    def compile(self) -> list[tuple[tuple[str, ...], Callable[[Any], bool]]]:
+        """
+        Compile :py:attr:`filters` into a query plan.
+
+        Each ``field__lookup=value`` keyword becomes a pair of the split field
+        path and a predicate with the filter value already normalised, so
+        nothing is re-parsed or re-compiled per model.
+
+        Returns:
+            A list of ``(field path, predicate)`` pairs.
+        """
+        return [
+            self._compile_filter(field_spec, filter_value)
+            for field_spec, filter_value in self.filters.items()
+        ]
+
+    @classmethod
+    def parse_spec(cls, field_spec: str) -> tuple[tuple[str, ...], str]:
+        """
+        Split a ``field__lookup`` specifier into its field path and lookup.
+
+        Args:
+            field_spec: The field specifier (field_name or field_name__lookup)
+
+        Returns:
+            The split field path and the lookup name.
+        """
+        parts = _split_path(field_spec)
+        # Default lookup is exact match; the part after ``__`` might be part
+        # of the field path rather than a lookup
+        if len(parts) > 1 and parts[-1] in cls.LOOKUPS:
+            return parts[:-1], parts[-1]
+        return parts, "exact"
+
+    def _compile_filter(
+        self, field_spec: str, filter_value: Any
+    ) -> tuple[tuple[str, ...], Callable[[Any], bool]]:
+        """
+        Compile one ``field__lookup=value`` filter.
+
+        Args:
+            field_spec: The field specifier (field_name or field_name__lookup)
+            filter_value: The value to filter against
+
+        Returns:
+            The split field path and the compiled predicate.
+        """
+        parts, lookup = self.parse_spec(field_spec)
+        function = self.COMPILED_LOOKUPS.get(lookup, self.LOOKUPS[lookup])
+        prepare = self.PREPARE.get(lookup)
+        prepared = prepare(filter_value) if prepare is not None else filter_value
+        return parts, lambda field_val: function(field_val, prepared)
+
+    def _accessor(self, parts: tuple[str, ...]) -> Callable[[Any], Any]:
+        """
+        Build a function that resolves ``parts`` on a model.
+
+        When the first part is a pydantic field of the model's class (checked
+        once per class), the field is read directly and dictionaries are
+        walked inline; everything else goes through :py:meth:`_resolve`.
+
+        Args:
+            parts: The split field path
+
+        Returns:
+            The accessor function
+        """
+        head = parts[0]
+        rest = parts[1:]
+        resolve = self._resolve
+        #: Whether ``head`` is a pydantic field, per model class
+        is_field: dict[type, bool] = {}
+
+        def access(model: Any) -> Any:
+            cls = model.__class__
+            direct = is_field.get(cls)
+            if direct is None:
+                direct = is_field[cls] = (
+                    _attribute_kind(cls, head) is _AttributeKind.FIELD
+                )
+            if not direct:
+                return resolve(model, parts)
+            value = getattr(model, head)
+            if not rest:
+                return value
+            if isinstance(value, dict):
+                for part in rest:
+                    if not isinstance(value, dict):
+                        return None
+                    value = value.get(part)
+                return value
+            return resolve(value, parts, 1)
+
+        return access
+
+    def matcher(self) -> Callable[[Any], bool]:
+        """
+        Compile :py:attr:`filters` into a function that tests one model.
+
+        Returns:
+            A function returning True if a model passes every filter.
+        """
+        plan = [
+            (self._accessor(parts), predicate) for parts, predicate in self.compile()
+        ]
+
+        def matches(model: Any) -> bool:
+            # A model must pass all filters to be included
+            for access, predicate in plan:
+                try:
+                    field_value = access(model)
+                    # If any item in a list value matches, the filter matches
+                    if isinstance(field_value, list):
+                        matched = any(
+                            predicate(val) for val in field_value if val is not None
+                        )
+                    else:
+                        matched = predicate(field_value)
+                except (AttributeError, TypeError):
+                    # If the field doesn't exist or can't be compared, it
+                    # doesn't match
+                    return False
+                if not matched:
+                    return False
+            return True
+
+        return matches
+
     def _apply_filter(
         self, model: Boto3Model, field_spec: str, filter_value: Any
     ) -> bool:
@@ -1075,31 +2290,31 @@ class Boto3ModelManagerFilter:
         Returns:
             True if the model passes the filter, False otherwise
         """
-        # Parse the field specifier into field name and lookup type
-        parts = field_spec.split("__")
-        field_name = "__".join(parts[0:-1])
+        return self._matches(model, *self._compile_filter(field_spec, filter_value))
 
-        # Default lookup is exact match
-        lookup = "exact"
-        if len(parts) > 1 and parts[-1] in self.LOOKUPS:
-            lookup = parts[-1]
-        else:
-            # The part after __ might be part of the field path, not a lookup
-            field_name = field_spec
+    def _matches(
+        self,
+        model: Boto3Model,
+        parts: tuple[str, ...],
+        predicate: Callable[[Any], bool],
+    ) -> bool:
+        """
+        Check one compiled filter against one model.
 
-        try:
-            field_value = self._get_field_value(model, field_name)
+        Args:
+            model: The Boto3Model instance
+            parts: The split field path
+            predicate: The compiled lookup
 
+        Returns:
+            True if the model passes the filter, False otherwise
+        """
+        try:
+            field_value = self._resolve(model, parts)
             # Handle list values - if any item in the list matches, return True
             if isinstance(field_value, list):
-                return any(
-                    self.LOOKUPS[lookup](val, filter_value)
-                    for val in field_value
-                    if val is not None
-                )
-
-            # Apply the appropriate lookup filter
-            return self.LOOKUPS[lookup](field_value, filter_value)
+                return any(predicate(val) for val in field_value if val is not None)
+            return predicate(field_value)
         except (AttributeError, TypeError):
             # If the field doesn't exist or can't be compared, it doesn't match
             return False
@@ -1118,21 +2333,17 @@ class Boto3ModelManagerFilter:
         """
         Apply all filters and return the filtered list of models.
 
+        The filters are compiled once with :py:meth:`compile` and then run
+        over the models in a single pass.
+
         Returns:
             List of Boto3Model objects that pass all filters
         """
         if self._result is not None:
             return self._result
 
-        result: list[Boto3Model] = []
-        for model in self.models:
-            # A model must pass all filters to be included
-            if all(
-                self._apply_filter(model, field, value)
-                for field, value in self.filters.items()
-            ):
-                result.append(model)  # noqa: PERF401
-
+        match = self.matcher()
+        result = [model for model in self.models if match(model)]
         self._result = result
         return result
 
@@ -69,13 +69,12 @@ class ACMCertificateManager(Boto3ModelManager):
         _response = self.client.import_certificate(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ImportCertificateResponse(**_response)
+        response = self.parse(ImportCertificateResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.CertificateArn
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete(self, CertificateArn: str) -> None:
@@ -111,10 +110,9 @@ class ACMCertificateManager(Boto3ModelManager):
         _response = self.client.describe_certificate(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeCertificateResponse(**_response)
+        response = self.parse(DescribeCertificateResponse, _response)
 
         if response and response.Certificate:
-            self.sessionize(response.Certificate)
             return response.Certificate
         return None
 
@@ -151,7 +149,6 @@ class ACMCertificateManager(Boto3ModelManager):
             SortOrder: Specifies the order of sorted results. If you specify
                 ``SortOrder``, you must also specify ``SortBy``.
         """
-        paginator = self.client.get_paginator("list_certificates")
         args: dict[str, Any] = dict(
             CertificateStatuses=self.serialize(CertificateStatuses),
             Includes=self.serialize(Includes),
@@ -159,26 +156,12 @@ class ACMCertificateManager(Boto3ModelManager):
             SortBy=self.serialize(SortBy),
             SortOrder=self.serialize(SortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_certificates",
+            ListCertificatesResponse,
+            "CertificateSummaryList",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListCertificatesResponse(**_response)
-            if response.CertificateSummaryList:
-                results.extend(response.CertificateSummaryList)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def renew(self, CertificateArn: str) -> "None":
         """
@@ -300,13 +283,12 @@ class ACMCertificateManager(Boto3ModelManager):
         _response = self.client.request_certificate(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RequestCertificateResponse(**_response)
+        response = self.parse(RequestCertificateResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.CertificateArn
 
-        self.sessionize(results)
         return cast("str", results)
 
     def revoke(
@@ -343,13 +325,12 @@ class ACMCertificateManager(Boto3ModelManager):
         _response = self.client.revoke_certificate(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RevokeCertificateResponse(**_response)
+        response = self.parse(RevokeCertificateResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.CertificateArn
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -55,9 +55,8 @@ class ScalingPolicyManager(Boto3ModelManager):
         _response = self.client.put_scaling_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutScalingPolicyResponse(**_response)
+        response = self.parse(PutScalingPolicyResponse, _response)
 
-        self.sessionize(response)
         return cast("PutScalingPolicyResponse", response)
 
     def delete(
@@ -179,33 +178,18 @@ class ScalingPolicyManager(Boto3ModelManager):
                 property. If you specify a scalable dimension, you must also specify a
                 resource ID.
         """
-        paginator = self.client.get_paginator("describe_scaling_policies")
         args: dict[str, Any] = dict(
             ServiceNamespace=self.serialize(ServiceNamespace),
             PolicyNames=self.serialize(PolicyNames),
             ResourceId=self.serialize(ResourceId),
             ScalableDimension=self.serialize(ScalableDimension),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_scaling_policies",
+            DescribeScalingPoliciesResponse,
+            "ScalingPolicies",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeScalingPoliciesResponse(**_response)
-            if response.ScalingPolicies:
-                results.extend(response.ScalingPolicies)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @scaling_policy_only
     def update(self, model: "ScalingPolicy") -> "PutScalingPolicyResponse":
@@ -234,9 +218,8 @@ class ScalingPolicyManager(Boto3ModelManager):
         _response = self.client.put_scaling_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutScalingPolicyResponse(**_response)
+        response = self.parse(PutScalingPolicyResponse, _response)
 
-        self.sessionize(response)
         return cast("PutScalingPolicyResponse", response)
 
     def get(
@@ -292,10 +275,9 @@ class ScalingPolicyManager(Boto3ModelManager):
         _response = self.client.describe_scaling_policies(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeScalingPoliciesResponse(**_response)
+        response = self.parse(DescribeScalingPoliciesResponse, _response)
 
         if response and response.ScalingPolicies:
-            self.sessionize(response.ScalingPolicies[0])
             return response.ScalingPolicies[0]
         return None
 
@@ -334,9 +316,8 @@ class ScalableTargetManager(Boto3ModelManager):
         _response = self.client.register_scalable_target(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RegisterScalableTargetResponse(**_response)
+        response = self.parse(RegisterScalableTargetResponse, _response)
 
-        self.sessionize(response)
         return cast("RegisterScalableTargetResponse", response)
 
     def delete(
@@ -456,32 +437,17 @@ class ScalableTargetManager(Boto3ModelManager):
                 scalable dimension, you must also specify a
                 resource ID.
         """
-        paginator = self.client.get_paginator("describe_scalable_targets")
         args: dict[str, Any] = dict(
             ServiceNamespace=self.serialize(ServiceNamespace),
             ResourceIds=self.serialize(ResourceIds),
             ScalableDimension=self.serialize(ScalableDimension),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_scalable_targets",
+            DescribeScalableTargetsResponse,
+            "ScalableTargets",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeScalableTargetsResponse(**_response)
-            if response.ScalableTargets:
-                results.extend(response.ScalableTargets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def get(
         self,
@@ -533,10 +499,9 @@ class ScalableTargetManager(Boto3ModelManager):
         _response = self.client.describe_scalable_targets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeScalableTargetsResponse(**_response)
+        response = self.parse(DescribeScalableTargetsResponse, _response)
 
         if response and response.ScalableTargets:
-            self.sessionize(response.ScalableTargets[0])
             return response.ScalableTargets[0]
         return None
 
@@ -711,33 +676,18 @@ class ScheduledActionManager(Boto3ModelManager):
                 property. If you specify a scalable dimension, you must also specify a
                 resource ID.
         """
-        paginator = self.client.get_paginator("describe_scheduled_actions")
         args: dict[str, Any] = dict(
             ServiceNamespace=self.serialize(ServiceNamespace),
             ScheduledActionNames=self.serialize(ScheduledActionNames),
             ResourceId=self.serialize(ResourceId),
             ScalableDimension=self.serialize(ScalableDimension),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_scheduled_actions",
+            DescribeScheduledActionsResponse,
+            "ScheduledActions",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeScheduledActionsResponse(**_response)
-            if response.ScheduledActions:
-                results.extend(response.ScheduledActions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def get(
         self,
@@ -792,10 +742,9 @@ class ScheduledActionManager(Boto3ModelManager):
         _response = self.client.describe_scheduled_actions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeScheduledActionsResponse(**_response)
+        response = self.parse(DescribeScheduledActionsResponse, _response)
 
         if response and response.ScheduledActions:
-            self.sessionize(response.ScheduledActions[0])
             return response.ScheduledActions[0]
         return None
 
@@ -1778,7 +1727,7 @@ class ScalingPolicy(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ScalableTarget.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ScalableTarget).get(**pk)  # type: ignore[arg-type]
 
 
 class ApplicationAutoscalingSuspendedState(Boto3Model):
@@ -1978,7 +1927,7 @@ class ScalableTarget(ScalableTargetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return ScalingPolicy.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ScalingPolicy).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def scheduled_action(self) -> "ScheduledAction | None":
@@ -2002,7 +1951,7 @@ class ScalableTarget(ScalableTargetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ScheduledAction.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ScheduledAction).get(**pk)  # type: ignore[arg-type]
 
 
 class ApplicationAutoscalingScalableTargetAction(Boto3Model):
@@ -2173,7 +2122,7 @@ class ScheduledAction(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ScalableTarget.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ScalableTarget).get(**pk)  # type: ignore[arg-type]
 
 
 # =======================
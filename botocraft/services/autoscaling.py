@@ -228,10 +228,9 @@ class AutoScalingGroupManager(Boto3ModelManager):
         _response = self.client.describe_auto_scaling_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AutoScalingGroupsType(**_response)
+        response = self.parse(AutoScalingGroupsType, _response)
 
         if response and response.AutoScalingGroups:
-            self.sessionize(response.AutoScalingGroups[0])
             return response.AutoScalingGroups[0]
         return None
 
@@ -254,32 +253,17 @@ class AutoScalingGroupManager(Boto3ModelManager):
                 ``true`` (default), the response includes instance details.
             Filters: One or more filters to limit the results based on specific tags.
         """
-        paginator = self.client.get_paginator("describe_auto_scaling_groups")
         args: dict[str, Any] = dict(
             AutoScalingGroupNames=self.serialize(AutoScalingGroupNames),
             IncludeInstances=self.serialize(IncludeInstances),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_auto_scaling_groups",
+            AutoScalingGroupsType,
+            "AutoScalingGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = AutoScalingGroupsType(**_response)
-            if response.AutoScalingGroups:
-                results.extend(response.AutoScalingGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def scale(self, AutoScalingGroupName: str, DesiredCapacity: int) -> None:
         """
@@ -320,13 +304,12 @@ class AutoScalingGroupManager(Boto3ModelManager):
         results: "builtins.list[AutoScalingInstanceDetails]" = []
 
         for _response in response_iterator:
-            response = AutoScalingInstancesType(**_response)
+            response = self.parse(AutoScalingInstancesType, _response)
             if response.AutoScalingInstances is not None:
                 results.extend(response.AutoScalingInstances)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AutoScalingInstanceDetails]", results)
 
     def terminate_instance(
@@ -352,13 +335,12 @@ class AutoScalingGroupManager(Boto3ModelManager):
         _response = self.client.terminate_instance_in_auto_scaling_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ActivityType(**_response)
+        response = self.parse(ActivityType, _response)
 
         results: "ActivityType" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ActivityType", results)
 
 
@@ -433,10 +415,9 @@ class LaunchConfigurationManager(Boto3ModelManager):
         _response = self.client.describe_launch_configurations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = LaunchConfigurationsType(**_response)
+        response = self.parse(LaunchConfigurationsType, _response)
 
         if response and response.LaunchConfigurations:
-            self.sessionize(response.LaunchConfigurations[0])
             return response.LaunchConfigurations[0]
         return None
 
@@ -451,30 +432,15 @@ class LaunchConfigurationManager(Boto3ModelManager):
                 property, all launch configurations are
                 described.
         """
-        paginator = self.client.get_paginator("describe_launch_configurations")
         args: dict[str, Any] = dict(
             LaunchConfigurationNames=self.serialize(LaunchConfigurationNames)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_launch_configurations",
+            LaunchConfigurationsType,
+            "LaunchConfigurations",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = LaunchConfigurationsType(**_response)
-            if response.LaunchConfigurations:
-                results.extend(response.LaunchConfigurations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -1802,7 +1768,7 @@ operation is in progress.
             )
         except AttributeError:
             return None
-        return LaunchConfiguration.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchConfiguration).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def launch_template(self) -> "LaunchTemplateVersion | None":
         """
@@ -1824,7 +1790,7 @@ operation is in progress.
             )
         except AttributeError:
             return None
-        return LaunchTemplateVersion.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchTemplateVersion).get(**pk)  # type: ignore[arg-type]
 class EbsMapping(Boto3Model):
     """
     Describes information used to set up an Amazon EBS volume specified in a block
@@ -2198,7 +2164,7 @@ class LaunchConfiguration(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def ami(self) -> "AMI | None":
@@ -2220,7 +2186,7 @@ class LaunchConfiguration(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AMI.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AMI).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def instance_type(self) -> "EC2InstanceType | None":
@@ -2243,7 +2209,7 @@ class LaunchConfiguration(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return EC2InstanceType.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(EC2InstanceType).get(**pk)  # type: ignore[arg-type]
 # =======================
 # Request/Response Models
 # =======================
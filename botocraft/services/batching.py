@@ -0,0 +1,440 @@
+"""
+DataLoader-style batching of manager ``get()`` calls into ``get_many()``.
+
+Managers whose ``get()`` and ``get_many()`` share a boto3 operation (they
+declare :py:attr:`~botocraft.services.abstract.Boto3ModelManager.get_many_arg`)
+can describe many resources in one call, but code that calls ``get()`` in a
+loop never benefits.  Two opt-in ways to batch them exist:
+
+* Inside a ``with Model.objects.batch():`` block, ``Model.objects.load()``
+  queues a lookup and returns a :py:class:`BatchFuture`.  Pending lookups are
+  sent as one ``get_many()`` call when the batch reaches the API limit, when
+  a future's :py:meth:`BatchFuture.result` is called, or when the block ends.
+  ``get()`` itself always returns a model, even inside the block, so code
+  that does not ask for a future never gets one.
+* With the ``batching.window_seconds`` setting above zero, ``get()`` calls
+  made by any thread within that window of each other are merged into one
+  ``get_many()`` call; each caller still gets its own model back.
+
+Identifiers that ``get_many()`` does not return are looked up again with a
+plain ``get()``, so batching never changes what ``get()`` returns.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any
+
+from .identity import current_identity_map, freeze
+from .trusted import parse_mode, shaped
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from botocraft.config import BatchingSettings
+
+    from .abstract import Boto3ModelManager
+
+#: The manager classes batching ``load()`` in the current thread or task, each
+#: with its loaders.
+_SCOPES: ContextVar[dict[type, dict[Any, BatchLoader]] | None] = ContextVar(
+    "botocraft_batch_scopes", default=None
+)
+#: The ``get()`` arguments that change how responses are parsed; lookups
+#: given them are not batched.
+_SHAPING_ARGUMENTS = frozenset({"validate", "lazy", "only", "raw", "summary"})
+#: Guards :py:data:`_WINDOW_LOADERS`.
+_WINDOW_LOCK = threading.Lock()
+#: The process-wide loaders used when ``batching.window_seconds`` is set.
+_WINDOW_LOADERS: dict[Any, BatchLoader] = {}
+
+
+@lru_cache(maxsize=1)
+def _settings() -> BatchingSettings:
+    """
+    Load the batching settings once per process.
+
+    Returns:
+        The configured batching settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().batching
+
+
+def batch_size(manager: Boto3ModelManager) -> int:
+    """
+    Return how many identifiers one ``get_many()`` call on ``manager`` takes.
+
+    Args:
+        manager: The manager.
+
+    Returns:
+        The manager's ``get_many_batch_size``, or ``1`` if it is not known.
+
+    """
+    return manager.get_many_batch_size or 1
+
+
+def identity_keys(model: Any) -> set[str]:
+    """
+    Return the strings a model can be looked up by: its ARN, name and pk.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The model's string identifiers.
+
+    """
+    keys = set()
+    for attr in ("arn", "name", "pk"):
+        with contextlib.suppress(Exception):
+            value = getattr(model, attr)
+            if isinstance(value, str):
+                keys.add(value)
+    return keys
+
+
+def fetch_many(
+    manager: Boto3ModelManager, kwargs: dict[str, Any], identifiers: list[str]
+) -> list[tuple[str, Any]]:
+    """
+    Describe ``identifiers`` in one ``get_many`` call.
+
+    Args:
+        manager: The manager to call.
+        kwargs: The other ``get`` keyword arguments.
+        identifiers: The identifiers to describe.
+
+    Returns:
+        ``(identifier, model)`` for each identifier found.
+
+    """
+    many_arg = manager.get_many_arg[1]  # type: ignore[index]
+    models = manager.get_many(**kwargs, **{many_arg: identifiers})  # type: ignore[attr-defined]
+    found: dict[str, Any] = {}
+    for model in models or []:
+        for key in identity_keys(model):
+            found.setdefault(key, model)
+    return [
+        (identifier, found[identifier])
+        for identifier in identifiers
+        if identifier in found
+    ]
+
+
+class BatchFuture(Future):
+    """
+    The pending result of a batched lookup.
+
+    Calling :py:meth:`result` sends the batch it belongs to, if it has not
+    been sent yet, so reading a future inside a ``batch()`` block never
+    deadlocks.
+
+    Args:
+        loader: The loader the lookup is queued on.
+
+    """
+
+    def __init__(self, loader: BatchLoader | None = None) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def result(self, timeout: float | None = None) -> Any:
+        if self._loader is not None and not self._loader.window:
+            self._loader.flush()
+        return super().result(timeout)
+
+
+class BatchLoader:
+    """
+    Queue ``get()`` lookups that differ only in their identifier, and send
+    them as ``get_many()`` calls.
+
+    Args:
+        manager: The manager to call.
+        get: The unbatched ``get()`` to fall back to.
+        kwargs: The ``get()`` keyword arguments other than the identifier.
+        window: Seconds to wait for more lookups before sending a batch, or
+            ``None`` to wait for :py:meth:`flush`.
+        on_flush: Called with the loader each time it sends a batch.
+
+    """
+
+    def __init__(
+        self,
+        manager: Boto3ModelManager,
+        get: Callable[..., Any],
+        kwargs: dict[str, Any],
+        window: float | None = None,
+        on_flush: Callable[[BatchLoader], None] | None = None,
+    ) -> None:
+        #: The manager to call.
+        self.manager = manager
+        #: The ``get()`` keyword arguments other than the identifier.
+        self.kwargs = kwargs
+        #: Seconds to wait for more lookups, or ``None``.
+        self.window = window
+        #: How many identifiers one ``get_many()`` call takes.
+        self.batch_size = batch_size(manager)
+        self._get = get
+        self._on_flush = on_flush
+        self._pending: dict[str, list[BatchFuture]] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def load(self, identifier: str) -> BatchFuture:
+        """
+        Queue a lookup of ``identifier``.
+
+        Args:
+            identifier: The identifier to look up.
+
+        Returns:
+            The future result of the lookup.
+
+        """
+        future = BatchFuture(self)
+        with self._lock:
+            self._pending.setdefault(identifier, []).append(future)
+            full = len(self._pending) >= self.batch_size
+            if not full and self.window and self._timer is None:
+                # Send from the caller's context, so the batch keeps its
+                # call budget and caller attribution
+                self._timer = threading.Timer(
+                    self.window, copy_context().run, args=(self.flush,)
+                )
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """
+        Send every queued lookup.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if self._on_flush is not None:
+            self._on_flush(self)
+        if not pending:
+            return
+        identifiers = list(pending)
+        try:
+            found = dict(fetch_many(self.manager, self.kwargs, identifiers))
+            for identifier in identifiers:
+                if identifier not in found:
+                    found[identifier] = self._get(
+                        self.manager,
+                        **self.kwargs,
+                        **{self.manager.get_many_arg[0]: identifier},  # type: ignore[index]
+                    )
+        except BaseException as error:
+            for futures in pending.values():
+                for future in futures:
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+            return
+        for identifier, futures in pending.items():
+            for future in futures:
+                future.set_result(found[identifier])
+
+
+def _loader_key(
+    manager: Boto3ModelManager, arguments: tuple[tuple[str, Any], ...]
+) -> tuple[Any, ...]:
+    """
+    Return the key of the loader for a ``get()`` call.
+
+    Args:
+        manager: The manager ``get()`` is called on.
+        arguments: The frozen call arguments, without the identifier.
+
+    Returns:
+        The loader key.
+
+    """
+    return (manager.__class__, id(manager.session), parse_mode(), arguments)
+
+
+def _forget_window_loader(key: tuple[Any, ...], loader: BatchLoader) -> None:
+    """
+    Stop routing new window-batched lookups to ``loader``, so it never
+    outlives the manager and client it was built with.
+
+    Args:
+        key: The loader key.
+        loader: The loader that is sending its batch.
+
+    """
+    with _WINDOW_LOCK:
+        if _WINDOW_LOADERS.get(key) is loader:
+            del _WINDOW_LOADERS[key]
+
+
+@contextmanager
+def batch_scope(manager_class: type[Boto3ModelManager]) -> Iterator[None]:
+    """
+    Batch ``load()`` calls on ``manager_class`` within a block.
+
+    This is what :py:meth:`Boto3ModelManager.batch
+    <botocraft.services.abstract.Boto3ModelManager.batch>` returns.  The scope
+    lives in a :py:class:`contextvars.ContextVar`, like
+    :py:func:`botocraft.clients.using_session`.
+
+    Args:
+        manager_class: The manager class to batch.
+
+    """
+    scopes = dict(_SCOPES.get() or {})
+    loaders: dict[Any, BatchLoader] = {}
+    scopes[manager_class] = loaders
+    token = _SCOPES.set(scopes)
+    try:
+        yield
+    finally:
+        _SCOPES.reset(token)
+        for loader in loaders.values():
+            loader.flush()
+
+
+def _queue_point(
+    manager: Boto3ModelManager,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[bool, Any, str | None, tuple[tuple[str, Any], ...]]:
+    """
+    Work out how a ``get()`` call on ``manager`` can be batched.
+
+    Args:
+        manager: The manager ``get()`` is called on.
+        func: The manager's ``get()``.
+        args: The positional arguments, excluding ``self``.
+        kwargs: The keyword arguments.
+
+    Returns:
+        Whether the identity map in scope already holds the model, and that
+        model; then the identifier to queue, or ``None`` if the call cannot
+        be batched, and the other frozen arguments to queue it with.
+
+    """
+    arguments = freeze(func, args, kwargs)
+    identifier = (
+        dict(arguments or ()).get(manager.get_many_arg[0])
+        if manager.get_many_arg
+        else None
+    )
+    mapping = current_identity_map()
+    if arguments is not None and mapping is not None:
+        found, model = mapping.lookup(manager, arguments)
+        if found:
+            return True, model, None, ()
+    if not isinstance(identifier, str) or batch_size(manager) <= 1:
+        return False, None, None, ()
+    rest = tuple(item for item in arguments if item[0] != manager.get_many_arg[0])  # type: ignore[union-attr,index]
+    return False, None, identifier, rest
+
+
+def queue_lookup(manager: Boto3ModelManager, *args, **kwargs) -> BatchFuture:
+    """
+    Queue a ``get()`` lookup on ``manager`` in the ``batch()`` block in scope.
+
+    This is what :py:meth:`Boto3ModelManager.load
+    <botocraft.services.abstract.Boto3ModelManager.load>` calls.  Outside a
+    ``batch()`` block for the manager's class, on managers that do not
+    batch, and for calls given ``validate``, ``lazy``, ``only``, ``raw`` or
+    ``summary``, the lookup is made right away and the future returned is
+    already resolved.
+
+    Args:
+        manager: The manager to look up on.
+        *args: The ``get()`` positional arguments.
+        **kwargs: The ``get()`` keyword arguments.
+
+    Returns:
+        The future result of the lookup.
+
+    """
+    get = type(manager).get
+    loaders = (_SCOPES.get() or {}).get(manager.__class__)
+    if loaders is not None and not shaped() and not _SHAPING_ARGUMENTS & kwargs.keys():
+        found, model, identifier, rest = _queue_point(manager, get, args, kwargs)
+        if identifier is not None:
+            key = _loader_key(manager, rest)
+            loader = loaders.get(key)
+            if loader is None:
+                loader = loaders[key] = BatchLoader(manager, get, dict(rest))
+            return loader.load(identifier)
+    else:
+        found, model = False, None
+    future = BatchFuture()
+    future.set_result(model if found else manager.get(*args, **kwargs))
+    return future
+
+
+def windowed() -> bool:
+    """
+    Return whether :py:func:`batched` methods wait for concurrent calls to
+    batch with.
+
+    Returns:
+        Whether ``batching.window_seconds`` is set.
+
+    """
+    return _settings().window_seconds > 0
+
+
+def batched(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a manager ``get()`` method batch with concurrent ``get()`` calls
+    when ``batching.window_seconds`` is set.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    the ``get()`` each of its subclasses defines.  It always returns the
+    model.  Only managers that declare ``get_many_arg`` actually batch, and
+    calls given ``only`` or ``raw`` are not batched.
+
+    Args:
+        func: The ``get()`` method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        window = _settings().window_seconds
+        if window <= 0 or shaped():
+            return func(self, *args, **kwargs)
+        found, model, identifier, rest = _queue_point(self, func, args, kwargs)
+        if identifier is None:
+            return model if found else func(self, *args, **kwargs)
+        key = _loader_key(self, rest)
+        with _WINDOW_LOCK:
+            loader = _WINDOW_LOADERS.get(key)
+            if loader is None:
+                loader = BatchLoader(
+                    self,
+                    func,
+                    dict(rest),
+                    window=window,
+                    on_flush=partial(_forget_window_loader, key),
+                )
+                _WINDOW_LOADERS[key] = loader
+        return loader.load(identifier).result()
+
+    return wrapper
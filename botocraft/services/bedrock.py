@@ -51,10 +51,9 @@ class FoundationModelManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_foundation_model(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetFoundationModelResponse(**_response)
+        response = self.parse(GetFoundationModelResponse, _response)
 
         if response and response.modelDetails:
-            self.sessionize(response.modelDetails)
             return response.modelDetails
         return None
 
@@ -94,9 +93,8 @@ class FoundationModelManager(ReadonlyBoto3ModelManager):
         _response = self.client.list_foundation_models(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListFoundationModelsResponse(**_response)
+        response = self.parse(ListFoundationModelsResponse, _response)
         if response and response.modelSummaries:
-            self.sessionize(response.modelSummaries)
             return PrimaryBoto3ModelQuerySet(response.modelSummaries)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -113,13 +111,12 @@ class FoundationModelManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_foundation_model_availability(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetFoundationModelAvailabilityResponse(**_response)
+        response = self.parse(GetFoundationModelAvailabilityResponse, _response)
 
         results: "GetFoundationModelAvailabilityResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetFoundationModelAvailabilityResponse", results)
 
 
@@ -138,9 +135,8 @@ class FoundationModelAgreementManager(Boto3ModelManager):
         _response = self.client.create_foundation_model_agreement(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFoundationModelAgreementResponse(**_response)
+        response = self.parse(CreateFoundationModelAgreementResponse, _response)
 
-        self.sessionize(response.modelId)
         return cast("str", response.modelId)
 
     def delete(self, modelId: str) -> None:
@@ -173,13 +169,12 @@ class FoundationModelAgreementManager(Boto3ModelManager):
         _response = self.client.list_foundation_model_agreement_offers(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListFoundationModelAgreementOffersResponse(**_response)
+        response = self.parse(ListFoundationModelAgreementOffersResponse, _response)
 
         results: "builtins.list[Offer]" = None
         if response is not None:
             results = response.offers
 
-        self.sessionize(results)
         return cast("builtins.list[Offer]", results)
 
 
@@ -240,9 +235,8 @@ class CustomModelManager(Boto3ModelManager):
         _response = self.client.create_custom_model(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCustomModelResponse(**_response)
+        response = self.parse(CreateCustomModelResponse, _response)
 
-        self.sessionize(response.modelArn)
         return cast("str", response.modelArn)
 
     def get(self, modelArn: str) -> "CustomModel | None":
@@ -260,10 +254,9 @@ class CustomModelManager(Boto3ModelManager):
         _response = self.client.get_custom_model(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CustomModel(**_response)
+        response = self.parse(CustomModel, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -302,7 +295,6 @@ class CustomModelManager(Boto3ModelManager):
             modelStatus: The status of them model to filter results by. Possible values
                 include:
         """
-        paginator = self.client.get_paginator("list_custom_models")
         args: dict[str, Any] = dict(
             creationTimeBefore=self.serialize(creationTimeBefore),
             creationTimeAfter=self.serialize(creationTimeAfter),
@@ -314,26 +306,9 @@ class CustomModelManager(Boto3ModelManager):
             isOwned=self.serialize(isOwned),
             modelStatus=self.serialize(modelStatus),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_custom_models", ListCustomModelsResponse, "modelSummaries", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListCustomModelsResponse(**_response)
-            if response.modelSummaries:
-                results.extend(response.modelSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, modelArn: str) -> None:
         """
@@ -365,10 +340,9 @@ class ImportedModelManager(Boto3ModelManager):
         _response = self.client.get_imported_model(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ImportedModel(**_response)
+        response = self.parse(ImportedModel, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -399,7 +373,6 @@ class ImportedModelManager(Boto3ModelManager):
             sortOrder: Specifies whetehr to sort the results in ascending or descending
                 order.
         """
-        paginator = self.client.get_paginator("list_imported_models")
         args: dict[str, Any] = dict(
             creationTimeBefore=self.serialize(creationTimeBefore),
             creationTimeAfter=self.serialize(creationTimeAfter),
@@ -407,26 +380,9 @@ class ImportedModelManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_imported_models", ListImportedModelsResponse, "modelSummaries", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListImportedModelsResponse(**_response)
-            if response.modelSummaries:
-                results.extend(response.modelSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, modelArn: str) -> None:
         """
@@ -520,9 +476,8 @@ class GuardrailManager(Boto3ModelManager):
         _response = self.client.create_guardrail(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateGuardrailResponse(**_response)
+        response = self.parse(CreateGuardrailResponse, _response)
 
-        self.sessionize(response.guardrailArn)
         return cast("str", response.guardrailArn)
 
     def get(
@@ -549,10 +504,9 @@ class GuardrailManager(Boto3ModelManager):
         _response = self.client.get_guardrail(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Guardrail(**_response)
+        response = self.parse(Guardrail, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -571,30 +525,12 @@ class GuardrailManager(Boto3ModelManager):
             guardrailIdentifier: The unique identifier of the guardrail. This can be an
                 ID or the ARN.
         """
-        paginator = self.client.get_paginator("list_guardrails")
         args: dict[str, Any] = dict(
             guardrailIdentifier=self.serialize(guardrailIdentifier)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_guardrails", ListGuardrailsResponse, "guardrails", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListGuardrailsResponse(**_response)
-            if response.guardrails:
-                results.extend(response.guardrails)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self,
@@ -656,9 +592,8 @@ class GuardrailManager(Boto3ModelManager):
         _response = self.client.update_guardrail(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateGuardrailResponse(**_response)
+        response = self.parse(UpdateGuardrailResponse, _response)
 
-        self.sessionize(response.guardrailArn)
         return cast("str", response.guardrailArn)
 
     def delete(
@@ -715,13 +650,12 @@ class GuardrailManager(Boto3ModelManager):
         _response = self.client.create_guardrail_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateGuardrailVersionResponse(**_response)
+        response = self.parse(CreateGuardrailVersionResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.version
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -776,9 +710,8 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.create_automated_reasoning_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateAutomatedReasoningPolicyResponse(**_response)
+        response = self.parse(CreateAutomatedReasoningPolicyResponse, _response)
 
-        self.sessionize(response.policyArn)
         return cast("str", response.policyArn)
 
     def get(self, policyArn: str) -> "AutomatedReasoningPolicy | None":
@@ -797,10 +730,9 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.get_automated_reasoning_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AutomatedReasoningPolicy(**_response)
+        response = self.parse(AutomatedReasoningPolicy, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -816,28 +748,13 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
                 specified Amazon Resource Name (ARN). If not
                 provided, the DRAFT versions for all policies are listed.
         """
-        paginator = self.client.get_paginator("list_automated_reasoning_policies")
         args: dict[str, Any] = dict(policyArn=self.serialize(policyArn))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_automated_reasoning_policies",
+            ListAutomatedReasoningPoliciesResponse,
+            "automatedReasoningPolicySummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListAutomatedReasoningPoliciesResponse(**_response)
-            if response.automatedReasoningPolicySummaries:
-                results.extend(response.automatedReasoningPolicySummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self,
@@ -865,9 +782,8 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.update_automated_reasoning_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateAutomatedReasoningPolicyResponse(**_response)
+        response = self.parse(UpdateAutomatedReasoningPolicyResponse, _response)
 
-        self.sessionize(response.policyArn)
         return cast("str", response.policyArn)
 
     def delete(self, policyArn: str, *, force: "bool | None" = None) -> None:
@@ -934,13 +850,12 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.create_automated_reasoning_policy_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateAutomatedReasoningPolicyVersionResponse(**_response)
+        response = self.parse(CreateAutomatedReasoningPolicyVersionResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.version
 
-        self.sessionize(results)
         return cast("str", results)
 
     def export_version(self, policyArn: str) -> "AutomatedReasoningPolicyDefinition":
@@ -960,13 +875,12 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.export_automated_reasoning_policy_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ExportAutomatedReasoningPolicyVersionResponse(**_response)
+        response = self.parse(ExportAutomatedReasoningPolicyVersionResponse, _response)
 
         results: "AutomatedReasoningPolicyDefinition" = None
         if response is not None:
             results = response.policyDefinition
 
-        self.sessionize(results)
         return cast("AutomatedReasoningPolicyDefinition", results)
 
     def start_build_workflow(
@@ -1014,13 +928,12 @@ class AutomatedReasoningPolicyManager(Boto3ModelManager):
         _response = self.client.start_automated_reasoning_policy_build_workflow(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartAutomatedReasoningPolicyBuildWorkflowResponse(**_response)
+        response = self.parse(StartAutomatedReasoningPolicyBuildWorkflowResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.buildWorkflowId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -1047,10 +960,9 @@ class AutomatedReasoningPolicyBuildWorkflowManager(Boto3ModelManager):
         _response = self.client.get_automated_reasoning_policy_build_workflow(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AutomatedReasoningPolicyBuildWorkflow(**_response)
+        response = self.parse(AutomatedReasoningPolicyBuildWorkflow, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1076,14 +988,13 @@ class AutomatedReasoningPolicyBuildWorkflowManager(Boto3ModelManager):
                 break
             if "ResponseMetadata" in _response:
                 del _response["ResponseMetadata"]
-            response = ListAutomatedReasoningPolicyBuildWorkflowsResponse(**_response)
+            response = self.parse(ListAutomatedReasoningPolicyBuildWorkflowsResponse, _response)
             if response.automatedReasoningPolicyBuildWorkflowSummaries:
                 results.extend(response.automatedReasoningPolicyBuildWorkflowSummaries)
             else:
                 if getattr(response, "NextToken", None):
                     continue
                 break
-        self.sessionize(results)
         if results and isinstance(results[0], Boto3Model):
             return PrimaryBoto3ModelQuerySet(results)
         return results
@@ -1112,13 +1023,12 @@ class AutomatedReasoningPolicyBuildWorkflowManager(Boto3ModelManager):
         _response = self.client.cancel_automated_reasoning_policy_build_workflow(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CancelAutomatedReasoningPolicyBuildWorkflowResponse(**_response)
+        response = self.parse(CancelAutomatedReasoningPolicyBuildWorkflowResponse, _response)
 
         results: "CancelAutomatedReasoningPolicyBuildWorkflowResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("CancelAutomatedReasoningPolicyBuildWorkflowResponse", results)
 
     def delete(
@@ -1186,13 +1096,12 @@ class AutomatedReasoningPolicyBuildWorkflowManager(Boto3ModelManager):
         _response = self.client.start_automated_reasoning_policy_test_workflow(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartAutomatedReasoningPolicyTestWorkflowResponse(**_response)
+        response = self.parse(StartAutomatedReasoningPolicyTestWorkflowResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.policyArn
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -1234,9 +1143,8 @@ class AutomatedReasoningPolicyTestCaseManager(Boto3ModelManager):
         _response = self.client.create_automated_reasoning_policy_test_case(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateAutomatedReasoningPolicyTestCaseResponse(**_response)
+        response = self.parse(CreateAutomatedReasoningPolicyTestCaseResponse, _response)
 
-        self.sessionize(response.testCaseId)
         return cast("str", response.testCaseId)
 
     def get(
@@ -1256,10 +1164,9 @@ class AutomatedReasoningPolicyTestCaseManager(Boto3ModelManager):
         _response = self.client.get_automated_reasoning_policy_test_case(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetAutomatedReasoningPolicyTestCaseResponse(**_response)
+        response = self.parse(GetAutomatedReasoningPolicyTestCaseResponse, _response)
 
         if response and response.testCase:
-            self.sessionize(response.testCase)
             return response.testCase
         return None
 
@@ -1287,14 +1194,13 @@ class AutomatedReasoningPolicyTestCaseManager(Boto3ModelManager):
                 break
             if "ResponseMetadata" in _response:
                 del _response["ResponseMetadata"]
-            response = ListAutomatedReasoningPolicyTestCasesResponse(**_response)
+            response = self.parse(ListAutomatedReasoningPolicyTestCasesResponse, _response)
             if response.testCases:
                 results.extend(response.testCases)
             else:
                 if getattr(response, "NextToken", None):
                     continue
                 break
-        self.sessionize(results)
         if results and isinstance(results[0], Boto3Model):
             return PrimaryBoto3ModelQuerySet(results)
         return results
@@ -1334,9 +1240,8 @@ class AutomatedReasoningPolicyTestCaseManager(Boto3ModelManager):
         _response = self.client.update_automated_reasoning_policy_test_case(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateAutomatedReasoningPolicyTestCaseResponse(**_response)
+        response = self.parse(UpdateAutomatedReasoningPolicyTestCaseResponse, _response)
 
-        self.sessionize(response.testCaseId)
         return cast("str", response.testCaseId)
 
     def delete(self, policyArn: str, testCaseId: str, lastUpdatedAt: datetime) -> None:
@@ -1390,10 +1295,9 @@ class AutomatedReasoningPolicyTestResultManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_automated_reasoning_policy_test_result(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetAutomatedReasoningPolicyTestResultResponse(**_response)
+        response = self.parse(GetAutomatedReasoningPolicyTestResultResponse, _response)
 
         if response and response.testResult:
-            self.sessionize(response.testResult)
             return response.testResult
         return None
 
@@ -1424,14 +1328,13 @@ class AutomatedReasoningPolicyTestResultManager(ReadonlyBoto3ModelManager):
                 break
             if "ResponseMetadata" in _response:
                 del _response["ResponseMetadata"]
-            response = ListAutomatedReasoningPolicyTestResultsResponse(**_response)
+            response = self.parse(ListAutomatedReasoningPolicyTestResultsResponse, _response)
             if response.testResults:
                 results.extend(response.testResults)
             else:
                 if getattr(response, "NextToken", None):
                     continue
                 break
-        self.sessionize(results)
         if results and isinstance(results[0], Boto3Model):
             return PrimaryBoto3ModelQuerySet(results)
         return results
@@ -1463,10 +1366,9 @@ class AutomatedReasoningPolicyNextScenarioManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_automated_reasoning_policy_next_scenario(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AutomatedReasoningPolicyNextScenario(**_response)
+        response = self.parse(AutomatedReasoningPolicyNextScenario, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1525,10 +1427,9 @@ class AutomatedReasoningPolicyBuildWorkflowResultAssetsManager(
                 **{k: v for k, v in args.items() if v is not None}
             )
         )
-        response = AutomatedReasoningPolicyBuildWorkflowResultAssets(**_response)
+        response = self.parse(AutomatedReasoningPolicyBuildWorkflowResultAssets, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1559,10 +1460,9 @@ class AutomatedReasoningPolicyAnnotationsManager(Boto3ModelManager):
         _response = self.client.get_automated_reasoning_policy_annotations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AutomatedReasoningPolicyAnnotations(**_response)
+        response = self.parse(AutomatedReasoningPolicyAnnotations, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1587,9 +1487,8 @@ class AutomatedReasoningPolicyAnnotationsManager(Boto3ModelManager):
         _response = self.client.update_automated_reasoning_policy_annotations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateAutomatedReasoningPolicyAnnotationsResponse(**_response)
+        response = self.parse(UpdateAutomatedReasoningPolicyAnnotationsResponse, _response)
 
-        self.sessionize(response.annotationSetHash)
         return cast("str", response.annotationSetHash)
 
 
@@ -1631,9 +1530,8 @@ class PromptRouterManager(Boto3ModelManager):
         _response = self.client.create_prompt_router(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePromptRouterResponse(**_response)
+        response = self.parse(CreatePromptRouterResponse, _response)
 
-        self.sessionize(response.promptRouterArn)
         return cast("str", response.promptRouterArn)
 
     def get(self, promptRouterArn: str) -> "PromptRouter | None":
@@ -1647,10 +1545,9 @@ class PromptRouterManager(Boto3ModelManager):
         _response = self.client.get_prompt_router(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PromptRouter(**_response)
+        response = self.parse(PromptRouter, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1664,28 +1561,13 @@ class PromptRouterManager(Boto3ModelManager):
             type: The type of the prompt routers, such as whether it's default or
                 custom.
         """
-        paginator = self.client.get_paginator("list_prompt_routers")
         args: dict[str, Any] = dict(type=self.serialize(type))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_prompt_routers",
+            ListPromptRoutersResponse,
+            "promptRouterSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListPromptRoutersResponse(**_response)
-            if response.promptRouterSummaries:
-                results.extend(response.promptRouterSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, promptRouterArn: str) -> None:
         """
@@ -1742,9 +1624,8 @@ class EvaluationJobManager(Boto3ModelManager):
         _response = self.client.create_evaluation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateEvaluationJobResponse(**_response)
+        response = self.parse(CreateEvaluationJobResponse, _response)
 
-        self.sessionize(response.jobArn)
         return cast("str", response.jobArn)
 
     def get(self, jobArn: str) -> "EvaluationJob | None":
@@ -1759,10 +1640,9 @@ class EvaluationJobManager(Boto3ModelManager):
         _response = self.client.get_evaluation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EvaluationJob(**_response)
+        response = self.parse(EvaluationJob, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1797,7 +1677,6 @@ class EvaluationJobManager(Boto3ModelManager):
             sortOrder: Specifies whether to sort the list of evaluation jobs by either
                 ascending or descending order.
         """
-        paginator = self.client.get_paginator("list_evaluation_jobs")
         args: dict[str, Any] = dict(
             creationTimeAfter=self.serialize(creationTimeAfter),
             creationTimeBefore=self.serialize(creationTimeBefore),
@@ -1807,26 +1686,9 @@ class EvaluationJobManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_evaluation_jobs", ListEvaluationJobsResponse, "jobSummaries", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListEvaluationJobsResponse(**_response)
-            if response.jobSummaries:
-                results.extend(response.jobSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def stop(self, jobArn: str) -> "StopEvaluationJobResponse":
         """
@@ -1840,13 +1702,12 @@ class EvaluationJobManager(Boto3ModelManager):
         _response = self.client.stop_evaluation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopEvaluationJobResponse(**_response)
+        response = self.parse(StopEvaluationJobResponse, _response)
 
         results: "StopEvaluationJobResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StopEvaluationJobResponse", results)
 
     def batch_delete(
@@ -1867,13 +1728,12 @@ class EvaluationJobManager(Boto3ModelManager):
         _response = self.client.batch_delete_evaluation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchDeleteEvaluationJobResponse(**_response)
+        response = self.parse(BatchDeleteEvaluationJobResponse, _response)
 
         results: "BatchDeleteEvaluationJobResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("BatchDeleteEvaluationJobResponse", results)
 
 
@@ -1886,28 +1746,13 @@ class EnforcedGuardrailsConfigurationManager(Boto3ModelManager):
         """
         Lists the account-level enforced guardrail configurations.
         """
-        paginator = self.client.get_paginator("list_enforced_guardrails_configuration")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_enforced_guardrails_configuration",
+            ListEnforcedGuardrailsConfigurationResponse,
+            "guardrailsConfig",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListEnforcedGuardrailsConfigurationResponse(**_response)
-            if response.guardrailsConfig:
-                results.extend(response.guardrailsConfig)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def put(
         self,
@@ -1932,13 +1777,12 @@ class EnforcedGuardrailsConfigurationManager(Boto3ModelManager):
         _response = self.client.put_enforced_guardrail_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutEnforcedGuardrailConfigurationResponse(**_response)
+        response = self.parse(PutEnforcedGuardrailConfigurationResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.configId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete(self, configId: str) -> None:
@@ -2000,9 +1844,8 @@ class ModelCustomizationJobManager(Boto3ModelManager):
         _response = self.client.create_model_customization_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateModelCustomizationJobResponse(**_response)
+        response = self.parse(CreateModelCustomizationJobResponse, _response)
 
-        self.sessionize(response.jobArn)
         return cast("str", response.jobArn)
 
     def get(self, jobArn: str) -> "ModelCustomizationJob | None":
@@ -2020,10 +1863,9 @@ class ModelCustomizationJobManager(Boto3ModelManager):
         _response = self.client.get_model_customization_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModelCustomizationJob(**_response)
+        response = self.parse(ModelCustomizationJob, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -2053,7 +1895,6 @@ class ModelCustomizationJobManager(Boto3ModelManager):
             sortBy: The field to sort by in the returned list of jobs.
             sortOrder: The sort order of the results.
         """
-        paginator = self.client.get_paginator("list_model_customization_jobs")
         args: dict[str, Any] = dict(
             creationTimeAfter=self.serialize(creationTimeAfter),
             creationTimeBefore=self.serialize(creationTimeBefore),
@@ -2062,26 +1903,12 @@ class ModelCustomizationJobManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_model_customization_jobs",
+            ListModelCustomizationJobsResponse,
+            "modelCustomizationJobSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListModelCustomizationJobsResponse(**_response)
-            if response.modelCustomizationJobSummaries:
-                results.extend(response.modelCustomizationJobSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def stop(self, jobArn: str) -> "StopModelCustomizationJobResponse":
         """
@@ -2097,13 +1924,12 @@ class ModelCustomizationJobManager(Boto3ModelManager):
         _response = self.client.stop_model_customization_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopModelCustomizationJobResponse(**_response)
+        response = self.parse(StopModelCustomizationJobResponse, _response)
 
         results: "StopModelCustomizationJobResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StopModelCustomizationJobResponse", results)
 
 
@@ -2160,9 +1986,8 @@ class InferenceProfileManager(Boto3ModelManager):
         _response = self.client.create_inference_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateInferenceProfileResponse(**_response)
+        response = self.parse(CreateInferenceProfileResponse, _response)
 
-        self.sessionize(response.inferenceProfileArn)
         return cast("str", response.inferenceProfileArn)
 
     def get(self, inferenceProfileArn: str) -> "InferenceProfile | None":
@@ -2182,10 +2007,9 @@ class InferenceProfileManager(Boto3ModelManager):
         _response = self.client.get_inference_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = InferenceProfile(**_response)
+        response = self.parse(InferenceProfile, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -2201,28 +2025,13 @@ class InferenceProfileManager(Boto3ModelManager):
         Keyword Args:
             typeEquals: Filters for inference profiles that match the type you specify.
         """
-        paginator = self.client.get_paginator("list_inference_profiles")
         args: dict[str, Any] = dict(typeEquals=self.serialize(typeEquals))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_inference_profiles",
+            ListInferenceProfilesResponse,
+            "inferenceProfileSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListInferenceProfilesResponse(**_response)
-            if response.inferenceProfileSummaries:
-                results.extend(response.inferenceProfileSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, inferenceProfileArn: str) -> None:
         """
@@ -2282,9 +2091,8 @@ class ModelCopyJobManager(Boto3ModelManager):
         _response = self.client.create_model_copy_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateModelCopyJobResponse(**_response)
+        response = self.parse(CreateModelCopyJobResponse, _response)
 
-        self.sessionize(response.jobArn)
         return cast("str", response.jobArn)
 
     def get(self, jobArn: str) -> "ModelCopyJob | None":
@@ -2301,10 +2109,9 @@ class ModelCopyJobManager(Boto3ModelManager):
         _response = self.client.get_model_copy_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModelCopyJob(**_response)
+        response = self.parse(ModelCopyJob, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -2348,7 +2155,6 @@ class ModelCopyJobManager(Boto3ModelManager):
             sortOrder: Specifies whether to sort the results in ascending or descending
                 order.
         """
-        paginator = self.client.get_paginator("list_model_copy_jobs")
         args: dict[str, Any] = dict(
             creationTimeAfter=self.serialize(creationTimeAfter),
             creationTimeBefore=self.serialize(creationTimeBefore),
@@ -2359,26 +2165,12 @@ class ModelCopyJobManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_model_copy_jobs",
+            ListModelCopyJobsResponse,
+            "modelCopyJobSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListModelCopyJobsResponse(**_response)
-            if response.modelCopyJobSummaries:
-                results.extend(response.modelCopyJobSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class ModelInvocationJobManager(Boto3ModelManager):
@@ -2418,9 +2210,8 @@ class ModelInvocationJobManager(Boto3ModelManager):
         _response = self.client.create_model_invocation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateModelInvocationJobResponse(**_response)
+        response = self.parse(CreateModelInvocationJobResponse, _response)
 
-        self.sessionize(response.jobArn)
         return cast("str", response.jobArn)
 
     def get(self, jobArn: str) -> "ModelInvocationJob | None":
@@ -2436,10 +2227,9 @@ class ModelInvocationJobManager(Boto3ModelManager):
         _response = self.client.get_model_invocation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModelInvocationJob(**_response)
+        response = self.parse(ModelInvocationJob, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -2471,7 +2261,6 @@ class ModelInvocationJobManager(Boto3ModelManager):
             sortOrder: Specifies whether to sort the results by ascending or descending
                 order.
         """
-        paginator = self.client.get_paginator("list_model_invocation_jobs")
         args: dict[str, Any] = dict(
             submitTimeAfter=self.serialize(submitTimeAfter),
             submitTimeBefore=self.serialize(submitTimeBefore),
@@ -2480,26 +2269,12 @@ class ModelInvocationJobManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_model_invocation_jobs",
+            ListModelInvocationJobsResponse,
+            "invocationJobSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListModelInvocationJobsResponse(**_response)
-            if response.invocationJobSummaries:
-                results.extend(response.invocationJobSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def stop(self, jobArn: str) -> "StopModelInvocationJobResponse":
         """
@@ -2514,13 +2289,12 @@ class ModelInvocationJobManager(Boto3ModelManager):
         _response = self.client.stop_model_invocation_job(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopModelInvocationJobResponse(**_response)
+        response = self.parse(StopModelInvocationJobResponse, _response)
 
         results: "StopModelInvocationJobResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StopModelInvocationJobResponse", results)
 
 
@@ -2537,10 +2311,9 @@ class ModelInvocationLoggingConfigurationManager(Boto3ModelManager):
         _response = self.client.get_model_invocation_logging_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetModelInvocationLoggingConfigurationResponse(**_response)
+        response = self.parse(GetModelInvocationLoggingConfigurationResponse, _response)
 
         if response and response.loggingConfig:
-            self.sessionize(response.loggingConfig)
             return response.loggingConfig
         return None
 
@@ -2557,13 +2330,12 @@ class ModelInvocationLoggingConfigurationManager(Boto3ModelManager):
         _response = self.client.put_model_invocation_logging_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutModelInvocationLoggingConfigurationResponse(**_response)
+        response = self.parse(PutModelInvocationLoggingConfigurationResponse, _response)
 
         results: "PutModelInvocationLoggingConfigurationResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutModelInvocationLoggingConfigurationResponse", results)
 
     def delete(
@@ -2597,13 +2369,12 @@ class ResourcePolicyManager(ResourcePolicyManagerMixin, Boto3ModelManager):
         _response = self.client.put_resource_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BedrockPutResourcePolicyResponse(**_response)
+        response = self.parse(BedrockPutResourcePolicyResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.resourceArn
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete(self, resourceArn: str) -> None:
@@ -2667,9 +2438,8 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
         _response = self.client.create_marketplace_model_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateMarketplaceModelEndpointResponse(**_response)
+        response = self.parse(CreateMarketplaceModelEndpointResponse, _response)
 
-        self.sessionize(response.marketplaceModelEndpoint)
         return cast("MarketplaceModelEndpoint", response.marketplaceModelEndpoint)
 
     def get(self, endpointArn: str) -> "MarketplaceModelEndpoint | None":
@@ -2685,10 +2455,9 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
         _response = self.client.get_marketplace_model_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetMarketplaceModelEndpointResponse(**_response)
+        response = self.parse(GetMarketplaceModelEndpointResponse, _response)
 
         if response and response.marketplaceModelEndpoint:
-            self.sessionize(response.marketplaceModelEndpoint)
             return response.marketplaceModelEndpoint
         return None
 
@@ -2703,28 +2472,13 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
             modelSourceEquals: If specified, only endpoints for the given model source
                 identifier are returned.
         """
-        paginator = self.client.get_paginator("list_marketplace_model_endpoints")
         args: dict[str, Any] = dict(modelSourceEquals=self.serialize(modelSourceEquals))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_marketplace_model_endpoints",
+            ListMarketplaceModelEndpointsResponse,
+            "marketplaceModelEndpoints",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListMarketplaceModelEndpointsResponse(**_response)
-            if response.marketplaceModelEndpoints:
-                results.extend(response.marketplaceModelEndpoints)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self, model: "MarketplaceModelEndpoint", clientRequestToken: "str | None" = None
@@ -2754,9 +2508,8 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
         _response = self.client.update_marketplace_model_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateMarketplaceModelEndpointResponse(**_response)
+        response = self.parse(UpdateMarketplaceModelEndpointResponse, _response)
 
-        self.sessionize(response.marketplaceModelEndpoint)
         return cast("MarketplaceModelEndpoint", response.marketplaceModelEndpoint)
 
     def delete(self, endpointArn: str) -> None:
@@ -2792,13 +2545,12 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
         _response = self.client.register_marketplace_model_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RegisterMarketplaceModelEndpointResponse(**_response)
+        response = self.parse(RegisterMarketplaceModelEndpointResponse, _response)
 
         results: "MarketplaceModelEndpoint" = None
         if response is not None:
             results = response.marketplaceModelEndpoint
 
-        self.sessionize(results)
         return cast("MarketplaceModelEndpoint", results)
 
     def deregister(
@@ -2817,13 +2569,12 @@ class MarketplaceModelEndpointManager(Boto3ModelManager):
         _response = self.client.deregister_marketplace_model_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeregisterMarketplaceModelEndpointResponse(**_response)
+        response = self.parse(DeregisterMarketplaceModelEndpointResponse, _response)
 
         results: "DeregisterMarketplaceModelEndpointResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DeregisterMarketplaceModelEndpointResponse", results)
 
 
@@ -2877,9 +2628,8 @@ class ProvisionedModelThroughputManager(Boto3ModelManager):
         _response = self.client.create_provisioned_model_throughput(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateProvisionedModelThroughputResponse(**_response)
+        response = self.parse(CreateProvisionedModelThroughputResponse, _response)
 
-        self.sessionize(response.provisionedModelArn)
         return cast("str", response.provisionedModelArn)
 
     def get(self, provisionedModelArn: str) -> "ProvisionedModelThroughput | None":
@@ -2899,10 +2649,9 @@ class ProvisionedModelThroughputManager(Boto3ModelManager):
         _response = self.client.get_provisioned_model_throughput(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ProvisionedModelThroughput(**_response)
+        response = self.parse(ProvisionedModelThroughput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -2939,7 +2688,6 @@ class ProvisionedModelThroughputManager(Boto3ModelManager):
                 Throughputs.
             sortOrder: The sort order of the results.
         """
-        paginator = self.client.get_paginator("list_provisioned_model_throughputs")
         args: dict[str, Any] = dict(
             creationTimeAfter=self.serialize(creationTimeAfter),
             creationTimeBefore=self.serialize(creationTimeBefore),
@@ -2949,26 +2697,12 @@ class ProvisionedModelThroughputManager(Boto3ModelManager):
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_provisioned_model_throughputs",
+            ListProvisionedModelThroughputsResponse,
+            "provisionedModelSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListProvisionedModelThroughputsResponse(**_response)
-            if response.provisionedModelSummaries:
-                results.extend(response.provisionedModelSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self,
@@ -3326,7 +3060,7 @@ class CustomModel(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FoundationModel.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FoundationModel).get(**pk)  # type: ignore[arg-type]
 
 
 class ImportedModel(PrimaryBoto3Model):
@@ -3938,7 +3672,7 @@ class Guardrail(GuardrailRuntimeMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return KMSKey.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(KMSKey).get(**pk)  # type: ignore[arg-type]
 
     def create_version(self, description: str | None = None) -> "str":
         """
@@ -4672,9 +4406,7 @@ class AutomatedReasoningPolicy(AutomatedReasoningPolicyModelMixin, PrimaryBoto3M
             )
         except AttributeError:
             return []
-        return AutomatedReasoningPolicyBuildWorkflow.objects.using(self.session).list(
-            **pk
-        )  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicyBuildWorkflow).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def test_cases(self) -> "list[AutomatedReasoningPolicyTestCase] | None":
@@ -4696,7 +4428,7 @@ class AutomatedReasoningPolicy(AutomatedReasoningPolicyModelMixin, PrimaryBoto3M
             )
         except AttributeError:
             return []
-        return AutomatedReasoningPolicyTestCase.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicyTestCase).list(**pk)  # type: ignore[arg-type]
 
     def create_version(self, lastUpdatedDefinitionHash: str) -> "str":
         """
@@ -4883,7 +4615,7 @@ class AutomatedReasoningPolicyBuildWorkflow(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AutomatedReasoningPolicy.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicy).get(**pk)  # type: ignore[arg-type]
 
 
 class AutomatedReasoningPolicyTestCase(PrimaryBoto3Model):
@@ -6352,7 +6084,7 @@ class AutomatedReasoningPolicyBuildWorkflowResultAssets(ReadonlyPrimaryBoto3Mode
             )
         except AttributeError:
             return None
-        return AutomatedReasoningPolicy.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicy).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def build_workflow(self) -> "AutomatedReasoningPolicyBuildWorkflow | None":
         """
@@ -6375,9 +6107,7 @@ class AutomatedReasoningPolicyBuildWorkflowResultAssets(ReadonlyPrimaryBoto3Mode
             )
         except AttributeError:
             return None
-        return AutomatedReasoningPolicyBuildWorkflow.objects.using(self.session).get(
-            **pk
-        )  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicyBuildWorkflow).get(**pk)  # type: ignore[arg-type]
 
 
 class AutomatedReasoningPolicyAnnotations(PrimaryBoto3Model):
@@ -6472,7 +6202,7 @@ class AutomatedReasoningPolicyAnnotations(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AutomatedReasoningPolicy.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicy).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def build_workflow(self) -> "AutomatedReasoningPolicyBuildWorkflow | None":
         """
@@ -6495,9 +6225,7 @@ class AutomatedReasoningPolicyAnnotations(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AutomatedReasoningPolicyBuildWorkflow.objects.using(self.session).get(
-            **pk
-        )  # type: ignore[arg-type]
+        return self.relationship_manager(AutomatedReasoningPolicyBuildWorkflow).get(**pk)  # type: ignore[arg-type]
 
 
 class RoutingCriteria(Boto3Model):
@@ -6640,7 +6368,7 @@ class PromptRouter(PromptRouterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FoundationModel.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FoundationModel).get(**pk)  # type: ignore[arg-type]
 
 
 class EvaluationJob(PrimaryBoto3Model):
@@ -6786,7 +6514,7 @@ class EvaluationJob(PrimaryBoto3Model):
             "roleArn",
             r"^arn:aws[a-zA-Z-]*:iam::\d+:role/(?P<RoleName>.+)$",
         )
-        return IAMRole.objects.using(self.session).get(**pk)
+        return self.relationship_manager(IAMRole).get(**pk)
 
 
 class SelectiveContentGuarding(Boto3Model):
@@ -6936,7 +6664,7 @@ class EnforcedGuardrailsConfiguration(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Guardrail.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Guardrail).get(**pk)  # type: ignore[arg-type]
 
 class InferenceProfileModel(Boto3Model):
     """
@@ -7625,7 +7353,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             "roleArn",
             r"^arn:aws[a-zA-Z-]*:iam::\d+:role/(?P<RoleName>.+)$",
         )
-        return IAMRole.objects.using(self.session).get(**pk)
+        return self.relationship_manager(IAMRole).get(**pk)
 
     @cached_property
     def base_model(self) -> "FoundationModel | None":
@@ -7647,7 +7375,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FoundationModel.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FoundationModel).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def output_model(self) -> "CustomModel | None":
@@ -7669,7 +7397,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return CustomModel.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CustomModel).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def output_model_kms_key(self) -> "KMSKey | None":
@@ -7691,7 +7419,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return KMSKey.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(KMSKey).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
         """
@@ -7712,7 +7440,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -7734,7 +7462,7 @@ class ModelCustomizationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
 class ModelCopyJob(PrimaryBoto3Model):
     """
@@ -8088,7 +7816,7 @@ class ModelInvocationJob(PrimaryBoto3Model):
             "roleArn",
             r"^arn:aws[a-zA-Z-]*:iam::\d+:role/(?P<RoleName>.+)$",
         )
-        return IAMRole.objects.using(self.session).get(**pk)
+        return self.relationship_manager(IAMRole).get(**pk)
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -8110,7 +7838,7 @@ class ModelInvocationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -8132,7 +7860,7 @@ class ModelInvocationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
     @cached_property
     def foundation_model(self) -> "FoundationModel | None":
         """
@@ -8153,7 +7881,7 @@ class ModelInvocationJob(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FoundationModel.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FoundationModel).get(**pk)  # type: ignore[arg-type]
 
 
 class ModelInvocationLoggingConfiguration(
@@ -119,13 +119,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.converse(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Conversation(**_response)
+        response = self.parse(Conversation, _response)
 
         results: "Conversation" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("Conversation", results)
 
     def converse_stream(
@@ -221,13 +220,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.converse_stream(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ConverseStreamResponse(**_response)
+        response = self.parse(ConverseStreamResponse, _response)
 
         results: "ConverseStreamResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ConverseStreamResponse", results)
 
     def count_tokens(self, modelId: str, input: "CountTokensInput") -> "TokenCount":
@@ -253,13 +251,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.count_tokens(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = TokenCount(**_response)
+        response = self.parse(TokenCount, _response)
 
         results: "TokenCount" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("TokenCount", results)
 
     def invoke_model(
@@ -323,13 +320,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.invoke_model(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = InvokeModelResponse(**_response)
+        response = self.parse(InvokeModelResponse, _response)
 
         results: "InvokeModelResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("InvokeModelResponse", results)
 
     def invoke_model_with_response_stream(
@@ -393,13 +389,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.invoke_model_with_response_stream(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = InvokeModelWithResponseStreamResponse(**_response)
+        response = self.parse(InvokeModelWithResponseStreamResponse, _response)
 
         results: "InvokeModelWithResponseStreamResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("InvokeModelWithResponseStreamResponse", results)
 
     def start_async_invoke(
@@ -434,13 +429,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.start_async_invoke(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartAsyncInvokeResponse(**_response)
+        response = self.parse(StartAsyncInvokeResponse, _response)
 
         results: "StartAsyncInvokeResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StartAsyncInvokeResponse", results)
 
     def get_async_invoke(self, invocationArn: str) -> "GetAsyncInvokeResponse":
@@ -454,13 +448,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.get_async_invoke(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetAsyncInvokeResponse(**_response)
+        response = self.parse(GetAsyncInvokeResponse, _response)
 
         results: "GetAsyncInvokeResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetAsyncInvokeResponse", results)
 
     def list_async_invokes(
@@ -500,13 +493,12 @@ class ConversationManager(ConversationManagerMixin, ReadonlyBoto3ModelManager):
         _response = self.client.list_async_invokes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListAsyncInvokesResponse(**_response)
+        response = self.parse(ListAsyncInvokesResponse, _response)
 
         results: "ListAsyncInvokesResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ListAsyncInvokesResponse", results)
 
 
@@ -549,13 +541,12 @@ class GuardrailApplicationManager(ReadonlyBoto3ModelManager):
         _response = self.client.apply_guardrail(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GuardrailApplication(**_response)
+        response = self.parse(GuardrailApplication, _response)
 
         results: "GuardrailApplication" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GuardrailApplication", results)
 
 
@@ -0,0 +1,869 @@
+"""
+A pluggable cache for manager ``get`` and ``list`` responses.
+
+Many code paths poll the same describe and list operations.  With a cache
+backend configured in :py:class:`botocraft.config.CacheSettings`, every
+manager ``get()`` and ``list()`` first looks for a cached response for the
+same session, manager, method and arguments.  Three backends are available:
+
+* ``memory`` -- a process-local LRU (:py:class:`MemoryCache`)
+* ``sqlite`` -- an on-disk store shared between processes
+  (:py:class:`SQLiteCache`)
+* ``none`` -- no caching at all (:py:class:`NullCache`), the default
+
+Entries expire after a per-operation TTL.  When a manager's ``create``,
+``update``, ``partial_update`` or ``delete`` runs, cached ``get`` responses
+that share a primary key with the write, and all cached ``list`` responses of
+that manager, are dropped.
+
+The memory backend returns the very same model objects on a hit.  The SQLite
+backend stores responses as JSON, and validates them as models again, bound to
+the calling manager's session, when they are read back.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+from botocraft.clients import PoolStats
+
+from .identity import freeze
+from .trusted import parse_mode, shaped
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from botocraft.config import CacheSettings
+
+    from .abstract import Boto3ModelManager
+
+#: Guards creation of the process-wide response cache.
+_CACHE_LOCK = threading.Lock()
+#: The process-wide response cache, once created.
+_CACHE: ResponseCache | None = None
+#: Guards :py:data:`_SCOPES`.
+_SCOPES_LOCK = threading.Lock()
+#: The account and region scope of each session's cache keys.
+_SCOPES: WeakKeyDictionary[Any, tuple[Any, ...]] = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1)
+def _settings() -> CacheSettings:
+    """
+    Load the response cache settings once per process.
+
+    Returns:
+        The configured response cache settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().cache
+
+
+class ResponseCache:
+    """
+    The interface every response cache backend implements.
+
+    Keys are opaque strings built by :py:func:`cache_key`.  Each entry belongs
+    to a *namespace* (the manager class) and carries the identifiers it
+    depends on, or ``None`` for entries, like listings, that any write to the
+    namespace may change.
+    """
+
+    #: Whether the backend caches anything at all.
+    enabled: bool = True
+
+    def get(self, key: str, session: Any) -> tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: The cache key.
+            session: The session to bind restored models to.
+
+        Returns:
+            ``(True, value)`` on a hit, or ``(False, None)``.
+
+        """
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: float,
+        namespace: str,
+        identifiers: frozenset[str] | None,
+    ) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: The cache key.
+            value: The response.
+
+        Keyword Args:
+            ttl: Seconds to serve the response for.
+            namespace: The namespace the entry belongs to.
+            identifiers: The identifiers the response depends on, or ``None``
+                if any write to ``namespace`` invalidates it.
+
+        """
+        raise NotImplementedError
+
+    def invalidate(self, namespace: str, identifiers: Iterable[str]) -> None:
+        """
+        Drop the entries of ``namespace`` that a write to ``identifiers``
+        may have changed.
+
+        Args:
+            namespace: The namespace written to.
+            identifiers: The identifiers of the resources written.
+
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> PoolStats:
+        """
+        Return the current hit, miss and eviction counters.
+
+        Returns:
+            A snapshot of the cache counters.
+
+        """
+        raise NotImplementedError
+
+
+class NullCache(ResponseCache):
+    """
+    A response cache that caches nothing.
+    """
+
+    enabled = False
+
+    def get(self, key: str, session: Any) -> tuple[bool, Any]:
+        return False, None
+
+    def set(self, key: str, value: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        pass
+
+    def invalidate(self, namespace: str, identifiers: Iterable[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> PoolStats:
+        return PoolStats()
+
+
+class MemoryCache(ResponseCache):
+    """
+    A thread-safe, process-local LRU response cache.
+
+    Hits return the cached objects themselves.
+
+    Args:
+        max_size: Maximum number of entries.
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        #: Maximum number of entries.
+        self.max_size = max_size
+        self._entries: OrderedDict[
+            str, tuple[float, str, frozenset[str] | None, Any]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str, session: Any) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, entry[3]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+        return False, None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: float,
+        namespace: str,
+        identifiers: frozenset[str] | None,
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + ttl,
+                namespace,
+                identifiers,
+                value,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(self.max_size, 0):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, namespace: str, identifiers: Iterable[str]) -> None:
+        touched = frozenset(identifiers)
+        with self._lock:
+            stale = [
+                key
+                for key, (_, entry_namespace, entry_ids, _) in self._entries.items()
+                if entry_namespace == namespace
+                and (entry_ids is None or entry_ids & touched)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+def _model_path(model_class: type[BaseModel]) -> str:
+    """
+    Return the import path the SQLite cache stores a model class under.
+
+    Args:
+        model_class: The model class.
+
+    Raises:
+        TypeError: If the class cannot be imported by that path again.
+
+    Returns:
+        ``module:qualname``.
+
+    """
+    path = f"{model_class.__module__}:{model_class.__qualname__}"
+    if _model_class(path) is not model_class:
+        msg = f"{path} cannot be imported"
+        raise TypeError(msg)
+    return path
+
+
+def _model_class(path: str) -> type[BaseModel] | None:
+    """
+    Import a model class stored by :py:func:`_model_path`.
+
+    Only models in :py:mod:`botocraft.services` are imported.
+
+    Args:
+        path: ``module:qualname``.
+
+    Returns:
+        The model class, or ``None`` if ``path`` does not name one.
+
+    """
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith("botocraft.services."):
+        return None
+    try:
+        value: Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            value = getattr(value, name)
+    except (ImportError, AttributeError):
+        return None
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value
+    return None
+
+
+def _dump(item: Any) -> dict[str, Any]:
+    """
+    Encode one model, or JSON value, of a response for the SQLite cache.
+
+    Args:
+        item: The model or value.
+
+    Raises:
+        TypeError: If the item cannot be stored.
+
+    Returns:
+        The JSON-ready encoding.
+
+    """
+    if isinstance(item, BaseModel):
+        return {
+            "model": _model_path(type(item)),
+            "data": item.model_dump(mode="json", by_alias=True, exclude_unset=True),
+        }
+    return {"value": item}
+
+
+def _load(item: dict[str, Any]) -> Any:
+    """
+    Decode one model, or JSON value, stored by :py:func:`_dump`.
+
+    Models are validated, so nothing read from the database is trusted.
+
+    Args:
+        item: The encoding.
+
+    Raises:
+        ValueError: If the encoding names no model class.
+
+    Returns:
+        The model or value.
+
+    """
+    if "model" not in item:
+        return item["value"]
+    model_class = _model_class(item["model"])
+    if model_class is None:
+        msg = f"{item['model']} is not a botocraft model"
+        raise ValueError(msg)
+    return model_class.model_validate(item["data"])
+
+
+def _ensure_private(path: Path) -> None:
+    """
+    Create the SQLite cache file readable only by the current user, or check
+    that an existing one is not writable by anyone else.
+
+    Args:
+        path: The database file.
+
+    Raises:
+        PermissionError: If another user owns the file, or could write to it.
+
+    """
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+    except FileExistsError:
+        info = path.stat()
+        foreign = hasattr(os, "getuid") and info.st_uid != os.getuid()
+        if foreign or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            msg = (
+                f"Refusing to use response cache {path}: it is owned by, or "
+                "writable by, another user"
+            )
+            raise PermissionError(msg) from None
+
+
+class SQLiteCache(ResponseCache):
+    """
+    An on-disk LRU response cache backed by SQLite.
+
+    Responses are stored as JSON.  Models are stored without their boto3
+    session, and are validated and bound to the calling manager's session
+    when they are read back.  Responses that cannot be stored as JSON are not
+    cached.  Several processes can share one database file.
+
+    The file is created readable and writable only by the current user, and
+    a file that another user owns or can write to is refused.
+
+    Args:
+        path: The database file.
+        max_size: Maximum number of entries.
+
+    Raises:
+        PermissionError: If another user owns ``path``, or could write to it.
+
+    """
+
+    def __init__(self, path: str | Path, max_size: int = 1024) -> None:
+        #: The database file.
+        self.path = Path(path).expanduser()
+        #: Maximum number of entries.
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        _ensure_private(self.path)
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL,
+                wildcard INTEGER NOT NULL,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS identifiers (
+                key TEXT NOT NULL,
+                identifier TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS identifiers_key ON identifiers (key);
+            CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace);
+            """
+        )
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        """
+        Encode a response as JSON.
+
+        Args:
+            value: A ``get()`` response, or a ``list()`` response as
+                ``(is_queryset, items)``.
+
+        Raises:
+            TypeError: If the response cannot be stored as JSON.
+            ValueError: If the response cannot be stored as JSON.
+
+        Returns:
+            The JSON text.
+
+        """
+        if isinstance(value, tuple):
+            is_queryset, items = value
+            return json.dumps(
+                {"queryset": is_queryset, "items": [_dump(item) for item in items]}
+            )
+        return json.dumps({"item": _dump(value)})
+
+    @staticmethod
+    def _decode(text: str | bytes, session: Any) -> Any:
+        """
+        Decode a response encoded by :py:meth:`_encode`.
+
+        Args:
+            text: The JSON text.
+            session: The session to bind the models to.
+
+        Raises:
+            ValueError: If the text is not a response this version wrote.
+
+        Returns:
+            The response.
+
+        """
+        from .abstract import _MODEL_SESSION
+
+        data = json.loads(text)
+        token = _MODEL_SESSION.set(session)
+        try:
+            if "item" in data:
+                return _load(data["item"])
+            return (bool(data["queryset"]), [_load(item) for item in data["items"]])
+        finally:
+            _MODEL_SESSION.reset(token)
+
+    def _delete(self, keys: list[str]) -> None:
+        """
+        Drop the entries ``keys``.  The caller holds the lock.
+
+        Args:
+            keys: The keys to drop.
+
+        """
+        self._connection.executemany(
+            "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+        )
+        self._connection.executemany(
+            "DELETE FROM identifiers WHERE key = ?", [(key,) for key in keys]
+        )
+
+    def get(self, key: str, session: Any) -> tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires, value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] > now:
+                try:
+                    value = self._decode(row[1], session)
+                except (ValueError, TypeError, KeyError):
+                    # Written by an incompatible botocraft version
+                    self._delete([key])
+                else:
+                    self._connection.execute(
+                        "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+                    )
+                    self._hits += 1
+                    return True, value
+            elif row is not None:
+                self._delete([key])
+            self._misses += 1
+        return False, None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: float,
+        namespace: str,
+        identifiers: frozenset[str] | None,
+    ) -> None:
+        try:
+            encoded = self._encode(value)
+        except (TypeError, ValueError):
+            return
+        now = time.time()
+        with self._lock:
+            self._delete([key])
+            self._connection.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    namespace,
+                    now + ttl,
+                    now,
+                    identifiers is None,
+                    encoded,
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO identifiers VALUES (?, ?)",
+                [(key, identifier) for identifier in identifiers or ()],
+            )
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+            if count > self.max_size:
+                oldest = self._connection.execute(
+                    "SELECT key FROM entries ORDER BY accessed LIMIT ?",
+                    (count - max(self.max_size, 0),),
+                ).fetchall()
+                self._delete([row[0] for row in oldest])
+                self._evictions += len(oldest)
+
+    def invalidate(self, namespace: str, identifiers: Iterable[str]) -> None:
+        touched = list(identifiers)
+        with self._lock:
+            stale = {
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT key FROM entries WHERE namespace = ? AND wildcard",
+                    (namespace,),
+                )
+            }
+            if touched:
+                placeholders = ", ".join("?" * len(touched))
+                stale.update(
+                    row[0]
+                    for row in self._connection.execute(
+                        "SELECT DISTINCT entries.key FROM entries JOIN identifiers"  # noqa: S608
+                        " ON entries.key = identifiers.key"
+                        " WHERE entries.namespace = ?"
+                        f" AND identifiers.identifier IN ({placeholders})",
+                        (namespace, *touched),
+                    )
+                )
+            self._delete(list(stale))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute("DELETE FROM identifiers")
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=size,
+            )
+
+
+def response_cache() -> ResponseCache:
+    """
+    Return the process-wide response cache, building it from the settings on
+    first use.
+
+    Returns:
+        The response cache.
+
+    """
+    global _CACHE  # noqa: PLW0603
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                settings = _settings()
+                if settings.backend == "memory":
+                    _CACHE = MemoryCache(max_size=settings.max_size)
+                elif settings.backend == "sqlite":
+                    _CACHE = SQLiteCache(settings.path, max_size=settings.max_size)
+                else:
+                    _CACHE = NullCache()
+    return _CACHE
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """
+    Replace the process-wide response cache.
+
+    Args:
+        cache: The new cache, or ``None`` to rebuild it from the settings on
+            next use.
+
+    """
+    global _CACHE  # noqa: PLW0603
+    with _CACHE_LOCK:
+        _CACHE = cache
+
+
+def ttl_for(manager_class: type[Boto3ModelManager], method: str) -> float:
+    """
+    Return how long responses of ``manager_class.method`` are cached.
+
+    Args:
+        manager_class: The manager class.
+        method: The method name, e.g. ``get``.
+
+    Returns:
+        The TTL in seconds.  ``0`` or less means "don't cache".
+
+    """
+    settings = _settings()
+    name = manager_class.__name__
+    for key in (f"{name}.{method}", name, manager_class.service_name):
+        if key in settings.ttls:
+            return settings.ttls[key]
+    return settings.ttl_seconds
+
+
+def _namespace(manager_class: type[Boto3ModelManager]) -> str:
+    """
+    Return the cache namespace of a manager class.
+
+    Args:
+        manager_class: The manager class.
+
+    Returns:
+        Its dotted path.
+
+    """
+    return f"{manager_class.__module__}.{manager_class.__qualname__}"
+
+
+def _scope(session: Any) -> tuple[Any, ...]:
+    """
+    Return the account and region scope of ``session``'s cache keys.
+
+    Args:
+        session: The boto3 session.
+
+    Returns:
+        The session's region, profile and access key.
+
+    """
+    with _SCOPES_LOCK:
+        scope = _SCOPES.get(session)
+    if scope is None:
+        credentials = session.get_credentials()
+        scope = (
+            session.region_name,
+            session.profile_name,
+            getattr(credentials, "access_key", None),
+        )
+        with _SCOPES_LOCK:
+            _SCOPES[session] = scope
+    return scope
+
+
+def cache_key(
+    manager: Boto3ModelManager, method: str, arguments: tuple[tuple[str, Any], ...]
+) -> str:
+    """
+    Build the cache key for a manager call.
+
+    The key covers the session's region, profile and access key, so
+    responses are never shared between accounts or regions.  They are read
+    once per session, since reading the access key may refresh credentials.
+    It also covers whether the models are validated or built lazily (see
+    :py:func:`~botocraft.services.trusted.parse_mode`).
+
+    Args:
+        manager: The manager being called.
+        method: The method name.
+        arguments: The frozen call arguments, from
+            :py:func:`botocraft.services.identity.freeze`.
+
+    Returns:
+        The cache key.
+
+    """
+    raw = repr(
+        (
+            _namespace(type(manager)),
+            method,
+            _scope(manager.session),
+            parse_mode(),
+            arguments,
+        )
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _identifiers(value: Any) -> set[str]:
+    """
+    Return the identifiers a write argument or a fetched model refers to.
+
+    Args:
+        value: A call argument, or a model.
+
+    Returns:
+        The strings the value identifies resources by.
+
+    """
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, list | tuple):
+        return set().union(*(_identifiers(item) for item in value))
+    identifiers: set[str] = set()
+    for attr in ("arn", "name", "pk"):
+        with contextlib.suppress(Exception):
+            attribute = getattr(value, attr)
+            if isinstance(attribute, dict):
+                identifiers.update(v for v in attribute.values() if isinstance(v, str))
+            elif isinstance(attribute, str):
+                identifiers.add(attribute)
+    return identifiers
+
+
+def caching() -> bool:
+    """
+    Return whether :py:func:`cached_response` and
+    :py:func:`invalidates_responses` methods use the response cache.
+
+    Returns:
+        Whether the response cache is enabled.
+
+    """
+    return response_cache().enabled
+
+
+def cached_response(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a manager ``get()`` or ``list()`` method use the response cache.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    the ``get()`` and ``list()`` each of its subclasses defines.  ``get()``
+    responses that are ``None`` are not cached.  ``list()`` responses are read
+    in full before they are cached.  Calls given ``only`` or ``raw`` skip the
+    cache.
+
+    Args:
+        func: The method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+    method = func.__name__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = response_cache()
+        if not cache.enabled or shaped():
+            return func(self, *args, **kwargs)
+        ttl = ttl_for(type(self), method)
+        arguments = freeze(func, args, kwargs) if ttl > 0 else None
+        if arguments is None:
+            return func(self, *args, **kwargs)
+        from .abstract import PrimaryBoto3ModelQuerySet
+
+        key = cache_key(self, method, arguments)
+        found, value = cache.get(key, self.session)
+        if found:
+            if method == "list":
+                is_queryset, items = value
+                items = list(items)
+                return PrimaryBoto3ModelQuerySet(items) if is_queryset else items
+            return value
+        response = func(self, *args, **kwargs)
+        if response is None:
+            return response
+        if method == "list":
+            value = (isinstance(response, PrimaryBoto3ModelQuerySet), list(response))
+        else:
+            value = response
+        identifiers = (
+            None
+            if method == "list"
+            else frozenset(
+                _identifiers(response).union(*(_identifiers(v) for _, v in arguments))
+            )
+        )
+        cache.set(
+            key,
+            value,
+            ttl=ttl,
+            namespace=_namespace(type(self)),
+            identifiers=identifiers,
+        )
+        return response
+
+    return wrapper
+
+
+def invalidates_responses(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a manager write method drop the cached responses it may change.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    the write methods its subclasses define.
+
+    Args:
+        func: The write method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            cache = response_cache()
+            if cache.enabled:
+                identifiers = _identifiers(list(args) + list(kwargs.values()))
+                cache.invalidate(_namespace(type(self)), identifiers)
+
+    return wrapper
@@ -196,10 +196,9 @@ class MetricAlarmManager(Boto3ModelManager):
         _response = self.client.describe_alarms(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeAlarmsOutput(**_response)
+        response = self.parse(DescribeAlarmsOutput, _response)
 
         if response and response.MetricAlarms:
-            self.sessionize(response.MetricAlarms[0])
             return response.MetricAlarms[0]
         return None
 
@@ -248,7 +247,6 @@ class MetricAlarmManager(Boto3ModelManager):
                 find all alarms that send notifications to
                 that topic.
         """
-        paginator = self.client.get_paginator("describe_alarms")
         args: dict[str, Any] = dict(
             AlarmNames=self.serialize(AlarmNames),
             AlarmNamePrefix=self.serialize(AlarmNamePrefix),
@@ -258,26 +256,9 @@ class MetricAlarmManager(Boto3ModelManager):
             StateValue=self.serialize(StateValue),
             ActionPrefix=self.serialize(ActionPrefix),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_alarms", DescribeAlarmsOutput, "MetricAlarms", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeAlarmsOutput(**_response)
-            if response.MetricAlarms:
-                results.extend(response.MetricAlarms)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, AlarmName: str) -> None:
         """
@@ -406,13 +387,12 @@ class MetricAlarmManager(Boto3ModelManager):
         results: "builtins.list[AlarmHistoryItem]" = []
 
         for _response in response_iterator:
-            response = DescribeAlarmHistoryOutput(**_response)
+            response = self.parse(DescribeAlarmHistoryOutput, _response)
             if response.AlarmHistoryItems is not None:
                 results.extend(response.AlarmHistoryItems)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AlarmHistoryItem]", results)
 
 
@@ -564,10 +544,9 @@ class CompositeAlarmManager(Boto3ModelManager):
         _response = self.client.describe_alarms(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeAlarmsOutput(**_response)
+        response = self.parse(DescribeAlarmsOutput, _response)
 
         if response and response.CompositeAlarms:
-            self.sessionize(response.CompositeAlarms[0])
             return response.CompositeAlarms[0]
         return None
 
@@ -616,7 +595,6 @@ class CompositeAlarmManager(Boto3ModelManager):
                 find all alarms that send notifications to
                 that topic.
         """
-        paginator = self.client.get_paginator("describe_alarms")
         args: dict[str, Any] = dict(
             AlarmNames=self.serialize(AlarmNames),
             AlarmNamePrefix=self.serialize(AlarmNamePrefix),
@@ -626,26 +604,9 @@ class CompositeAlarmManager(Boto3ModelManager):
             StateValue=self.serialize(StateValue),
             ActionPrefix=self.serialize(ActionPrefix),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_alarms", DescribeAlarmsOutput, "CompositeAlarms", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeAlarmsOutput(**_response)
-            if response.CompositeAlarms:
-                results.extend(response.CompositeAlarms)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, AlarmName: str) -> None:
         """
@@ -774,13 +735,12 @@ class CompositeAlarmManager(Boto3ModelManager):
         results: "builtins.list[AlarmHistoryItem]" = []
 
         for _response in response_iterator:
-            response = DescribeAlarmHistoryOutput(**_response)
+            response = self.parse(DescribeAlarmHistoryOutput, _response)
             if response.AlarmHistoryItems is not None:
                 results.extend(response.AlarmHistoryItems)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AlarmHistoryItem]", results)
 
 
@@ -918,10 +878,9 @@ class CloudWatchMetricStreamManager(Boto3ModelManager):
         _response = self.client.get_metric_stream(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CloudWatchMetricStream(**_response)
+        response = self.parse(CloudWatchMetricStream, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -942,9 +901,8 @@ class CloudWatchMetricStreamManager(Boto3ModelManager):
         _response = self.client.list_metric_streams(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListMetricStreamsOutput(**_response)
+        response = self.parse(ListMetricStreamsOutput, _response)
         if response and response.Entries:
-            self.sessionize(response.Entries)
             return PrimaryBoto3ModelQuerySet(response.Entries)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -1055,10 +1013,9 @@ class CloudWatchDashboardManager(Boto3ModelManager):
         _response = self.client.get_dashboard(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CloudWatchDashboard(**_response)
+        response = self.parse(CloudWatchDashboard, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1078,30 +1035,12 @@ class CloudWatchDashboardManager(Boto3ModelManager):
                 string are listed. The maximum length is 255, and valid characters are
                 A-Z, a-z, 0-9, ".", "-", and "_".
         """
-        paginator = self.client.get_paginator("list_dashboards")
         args: dict[str, Any] = dict(
             DashboardNamePrefix=self.serialize(DashboardNamePrefix)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_dashboards", ListDashboardsOutput, "DashboardEntries", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListDashboardsOutput(**_response)
-            if response.DashboardEntries:
-                results.extend(response.DashboardEntries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, DashboardName: str) -> None:
         """
@@ -1326,33 +1265,18 @@ class CloudWatchAnomalyDetectorManager(
                 ``DescribeAnomalyDetectorsInput``. If empty,
                 defaults to ``SINGLE_METRIC``.
         """
-        paginator = self.client.get_paginator("describe_anomaly_detectors")
         args: dict[str, Any] = dict(
             Namespace=self.serialize(Namespace),
             MetricName=self.serialize(MetricName),
             Dimensions=self.serialize(Dimensions),
             AnomalyDetectorTypes=self.serialize(AnomalyDetectorTypes),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_anomaly_detectors",
+            DescribeAnomalyDetectorsOutput,
+            "AnomalyDetectors",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeAnomalyDetectorsOutput(**_response)
-            if response.AnomalyDetectors:
-                results.extend(response.AnomalyDetectors)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CloudWatchMetricManager(CloudWatchMetricManagerMixin, ReadonlyBoto3ModelManager):
@@ -1398,7 +1322,6 @@ class CloudWatchMetricManager(CloudWatchMetricManagerMixin, ReadonlyBoto3ModelMa
                 and also specify ``true`` for
                 ``IncludeLinkedAccounts``.
         """
-        paginator = self.client.get_paginator("list_metrics")
         args: dict[str, Any] = dict(
             Namespace=self.serialize(Namespace),
             MetricName=self.serialize(MetricName),
@@ -1407,26 +1330,7 @@ class CloudWatchMetricManager(CloudWatchMetricManagerMixin, ReadonlyBoto3ModelMa
             IncludeLinkedAccounts=self.serialize(IncludeLinkedAccounts),
             OwningAccount=self.serialize(OwningAccount),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListMetricsOutput(**_response)
-            if response.Metrics:
-                results.extend(response.Metrics)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_metrics", ListMetricsOutput, "Metrics", args)
 
 
 class AlarmMuteRuleManager(Boto3ModelManager):
@@ -1499,10 +1403,9 @@ class AlarmMuteRuleManager(Boto3ModelManager):
         _response = self.client.get_alarm_mute_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AlarmMuteRule(**_response)
+        response = self.parse(AlarmMuteRule, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1522,30 +1425,15 @@ class AlarmMuteRuleManager(Boto3ModelManager):
                 statuses. Valid values are ``SCHEDULED``,
                 ``ACTIVE``, or ``EXPIRED``.
         """
-        paginator = self.client.get_paginator("list_alarm_mute_rules")
         args: dict[str, Any] = dict(
             AlarmName=self.serialize(AlarmName), Statuses=self.serialize(Statuses)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_alarm_mute_rules",
+            ListAlarmMuteRulesOutput,
+            "AlarmMuteRuleSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListAlarmMuteRulesOutput(**_response)
-            if response.AlarmMuteRuleSummaries:
-                results.extend(response.AlarmMuteRuleSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, Name: str) -> None:
         """
@@ -1578,10 +1466,9 @@ class OTelEnrichmentStatusManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_otel_enrichment(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = OTelEnrichmentStatus(**_response)
+        response = self.parse(OTelEnrichmentStatus, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
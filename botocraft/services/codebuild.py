@@ -85,9 +85,8 @@ class ProjectManager(Boto3ModelManager):
         _response = self.client.create_project(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateProjectOutput(**_response)
+        response = self.parse(CreateProjectOutput, _response)
 
-        self.sessionize(response.project)
         return cast("Project", response.project)
 
     @project_response_to_project
@@ -130,9 +129,8 @@ class ProjectManager(Boto3ModelManager):
         _response = self.client.update_project(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateProjectOutput(**_response)
+        response = self.parse(UpdateProjectOutput, _response)
 
-        self.sessionize(response.project)
         return cast("Project", response.project)
 
     def delete(self, name: str) -> None:
@@ -157,10 +155,9 @@ class ProjectManager(Boto3ModelManager):
         _response = self.client.batch_get_projects(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetProjectsOutput(**_response)
+        response = self.parse(BatchGetProjectsOutput, _response)
 
         if response and response.projects:
-            self.sessionize(response.projects[0])
             return response.projects[0]
         return None
 
@@ -180,30 +177,10 @@ class ProjectManager(Boto3ModelManager):
                 include:
             sortOrder: The order in which to list build projects. Valid values include:
         """
-        paginator = self.client.get_paginator("list_projects")
         args: dict[str, Any] = dict(
             sortBy=self.serialize(sortBy), sortOrder=self.serialize(sortOrder)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListProjectsOutput(**_response)
-            if response.projects:
-                results.extend(response.projects)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_projects", ListProjectsOutput, "projects", args)
 
     @project_names_to_projects
     def list_shared(
@@ -234,13 +211,12 @@ class ProjectManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListSharedProjectsOutput(**_response)
+            response = self.parse(ListSharedProjectsOutput, _response)
             if response.projects is not None:
                 results.extend(response.projects)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def invalidate_cache(self, projectName: str) -> None:
@@ -301,13 +277,12 @@ class ProjectManager(Boto3ModelManager):
         _response = self.client.get_resource_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetResourcePolicyOutput(**_response)
+        response = self.parse(GetResourcePolicyOutput, _response)
 
         results: "GetResourcePolicyOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetResourcePolicyOutput", results)
 
     def put_resource_policy(self, policy: str, resourceArn: str) -> None:
@@ -358,10 +333,9 @@ class BuildManager(Boto3ModelManager):
         _response = self.client.batch_get_builds(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetBuildsOutput(**_response)
+        response = self.parse(BatchGetBuildsOutput, _response)
 
         if response and response.builds:
-            self.sessionize(response.builds[0])
             return response.builds[0]
         return None
 
@@ -375,28 +349,8 @@ class BuildManager(Boto3ModelManager):
         Keyword Args:
             sortOrder: The order to list build IDs. Valid values include:
         """
-        paginator = self.client.get_paginator("list_builds")
         args: dict[str, Any] = dict(sortOrder=self.serialize(sortOrder))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListBuildsOutput(**_response)
-            if response.ids:
-                results.extend(response.ids)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_builds", ListBuildsOutput, "ids", args)
 
     @build_ids_to_builds_with_project
     def list_for_project(
@@ -428,13 +382,12 @@ class BuildManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListBuildsForProjectOutput(**_response)
+            response = self.parse(ListBuildsForProjectOutput, _response)
             if response.ids is not None:
                 results.extend(response.ids)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     @build_response_to_build
@@ -627,13 +580,12 @@ class BuildManager(Boto3ModelManager):
         _response = self.client.start_build(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartBuildOutput(**_response)
+        response = self.parse(StartBuildOutput, _response)
 
         results: "Build" = None
         if response is not None:
             results = response.build
 
-        self.sessionize(results)
         return cast("Build", results)
 
     @build_response_to_build
@@ -648,13 +600,12 @@ class BuildManager(Boto3ModelManager):
         _response = self.client.stop_build(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopBuildOutput(**_response)
+        response = self.parse(StopBuildOutput, _response)
 
         results: "Build" = None
         if response is not None:
             results = response.build
 
-        self.sessionize(results)
         return cast("Build", results)
 
     @build_response_to_build
@@ -679,13 +630,12 @@ class BuildManager(Boto3ModelManager):
         _response = self.client.retry_build(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RetryBuildOutput(**_response)
+        response = self.parse(RetryBuildOutput, _response)
 
         results: "Build" = None
         if response is not None:
             results = response.build
 
-        self.sessionize(results)
         return cast("Build", results)
 
     def batch_delete(self, ids: "builtins.list[str]") -> "BatchDeleteBuildsOutput":
@@ -699,13 +649,12 @@ class BuildManager(Boto3ModelManager):
         _response = self.client.batch_delete_builds(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchDeleteBuildsOutput(**_response)
+        response = self.parse(BatchDeleteBuildsOutput, _response)
 
         results: "BatchDeleteBuildsOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("BatchDeleteBuildsOutput", results)
 
 
@@ -884,9 +833,8 @@ class BuildBatchManager(Boto3ModelManager):
         _response = self.client.start_build_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartBuildBatchOutput(**_response)
+        response = self.parse(StartBuildBatchOutput, _response)
 
-        self.sessionize(response.buildBatch)
         return cast("BuildBatch", response.buildBatch)
 
     def get(self, id: str) -> "BuildBatch | None":
@@ -900,10 +848,9 @@ class BuildBatchManager(Boto3ModelManager):
         _response = self.client.batch_get_build_batches(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetBuildBatchesOutput(**_response)
+        response = self.parse(BatchGetBuildBatchesOutput, _response)
 
         if response and response.buildBatches:
-            self.sessionize(response.buildBatches[0])
             return response.buildBatches[0]
         return None
 
@@ -923,30 +870,10 @@ class BuildBatchManager(Boto3ModelManager):
             sortOrder: Specifies the sort order of the returned items. Valid values
                 include:
         """
-        paginator = self.client.get_paginator("list_build_batches")
         args: dict[str, Any] = dict(
             filter=self.serialize(filter), sortOrder=self.serialize(sortOrder)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListBuildBatchesOutput(**_response)
-            if response.ids:
-                results.extend(response.ids)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_build_batches", ListBuildBatchesOutput, "ids", args)
 
     @build_batch_ids_to_build_batches_with_project
     def list_for_project(
@@ -981,13 +908,12 @@ class BuildBatchManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListBuildBatchesForProjectOutput(**_response)
+            response = self.parse(ListBuildBatchesForProjectOutput, _response)
             if response.ids is not None:
                 results.extend(response.ids)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def delete(self, id: str) -> None:
@@ -1014,13 +940,12 @@ class BuildBatchManager(Boto3ModelManager):
         _response = self.client.stop_build_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopBuildBatchOutput(**_response)
+        response = self.parse(StopBuildBatchOutput, _response)
 
         results: "BuildBatch" = None
         if response is not None:
             results = response.buildBatch
 
-        self.sessionize(results)
         return cast("BuildBatch", results)
 
     @build_batch_response_to_build_batch
@@ -1054,13 +979,12 @@ class BuildBatchManager(Boto3ModelManager):
         _response = self.client.retry_build_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RetryBuildBatchOutput(**_response)
+        response = self.parse(RetryBuildBatchOutput, _response)
 
         results: "BuildBatch" = None
         if response is not None:
             results = response.buildBatch
 
-        self.sessionize(results)
         return cast("BuildBatch", results)
 
 
@@ -1093,9 +1017,8 @@ class FleetManager(Boto3ModelManager):
         _response = self.client.create_fleet(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFleetOutput(**_response)
+        response = self.parse(CreateFleetOutput, _response)
 
-        self.sessionize(response.fleet)
         return cast("Fleet", response.fleet)
 
     @fleet_response_to_fleet
@@ -1124,9 +1047,8 @@ class FleetManager(Boto3ModelManager):
         _response = self.client.update_fleet(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateFleetOutput(**_response)
+        response = self.parse(UpdateFleetOutput, _response)
 
-        self.sessionize(response.fleet)
         return cast("Fleet", response.fleet)
 
     def delete(self, arn: str) -> None:
@@ -1151,10 +1073,9 @@ class FleetManager(Boto3ModelManager):
         _response = self.client.batch_get_fleets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetFleetsOutput(**_response)
+        response = self.parse(BatchGetFleetsOutput, _response)
 
         if response and response.fleets:
-            self.sessionize(response.fleets[0])
             return response.fleets[0]
         return None
 
@@ -1196,9 +1117,8 @@ class FleetManager(Boto3ModelManager):
         _response = self.client.list_fleets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListFleetsOutput(**_response)
+        response = self.parse(ListFleetsOutput, _response)
         if response and response.fleets:
-            self.sessionize(response.fleets)
             return PrimaryBoto3ModelQuerySet(response.fleets)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -1225,9 +1145,8 @@ class ReportGroupManager(Boto3ModelManager):
         _response = self.client.create_report_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateReportGroupOutput(**_response)
+        response = self.parse(CreateReportGroupOutput, _response)
 
-        self.sessionize(response.reportGroup)
         return cast("ReportGroup", response.reportGroup)
 
     @report_group_response_to_report_group
@@ -1247,9 +1166,8 @@ class ReportGroupManager(Boto3ModelManager):
         _response = self.client.update_report_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateReportGroupOutput(**_response)
+        response = self.parse(UpdateReportGroupOutput, _response)
 
-        self.sessionize(response.reportGroup)
         return cast("ReportGroup", response.reportGroup)
 
     def delete(self, arn: str, *, deleteReports: "bool | None" = None) -> None:
@@ -1282,10 +1200,9 @@ class ReportGroupManager(Boto3ModelManager):
         _response = self.client.batch_get_report_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetReportGroupsOutput(**_response)
+        response = self.parse(BatchGetReportGroupsOutput, _response)
 
         if response and response.reportGroups:
-            self.sessionize(response.reportGroups[0])
             return response.reportGroups[0]
         return None
 
@@ -1307,30 +1224,12 @@ class ReportGroupManager(Boto3ModelManager):
             sortBy: The criterion to be used to list build report groups. Valid values
                 include:
         """
-        paginator = self.client.get_paginator("list_report_groups")
         args: dict[str, Any] = dict(
             sortOrder=self.serialize(sortOrder), sortBy=self.serialize(sortBy)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_report_groups", ListReportGroupsOutput, "reportGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListReportGroupsOutput(**_response)
-            if response.reportGroups:
-                results.extend(response.reportGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @report_group_arns_to_report_groups
     def list_shared(
@@ -1361,13 +1260,12 @@ class ReportGroupManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListSharedReportGroupsOutput(**_response)
+            response = self.parse(ListSharedReportGroupsOutput, _response)
             if response.reportGroups is not None:
                 results.extend(response.reportGroups)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def get_trend(
@@ -1408,13 +1306,12 @@ class ReportGroupManager(Boto3ModelManager):
         _response = self.client.get_report_group_trend(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetReportGroupTrendOutput(**_response)
+        response = self.parse(GetReportGroupTrendOutput, _response)
 
         results: "GetReportGroupTrendOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetReportGroupTrendOutput", results)
 
 
@@ -1432,10 +1329,9 @@ class ReportManager(Boto3ModelManager):
         _response = self.client.batch_get_reports(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetReportsOutput(**_response)
+        response = self.parse(BatchGetReportsOutput, _response)
 
         if response and response.reports:
-            self.sessionize(response.reports[0])
             return response.reports[0]
         return None
 
@@ -1455,30 +1351,10 @@ class ReportManager(Boto3ModelManager):
                 values are:
             filter: A ``ReportFilter`` object used to filter the returned reports.
         """
-        paginator = self.client.get_paginator("list_reports")
         args: dict[str, Any] = dict(
             sortOrder=self.serialize(sortOrder), filter=self.serialize(filter)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListReportsOutput(**_response)
-            if response.reports:
-                results.extend(response.reports)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_reports", ListReportsOutput, "reports", args)
 
     @report_arns_to_reports_with_group
     def list_for_report_group(
@@ -1513,13 +1389,12 @@ class ReportManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListReportsForReportGroupOutput(**_response)
+            response = self.parse(ListReportsForReportGroupOutput, _response)
             if response.reports is not None:
                 results.extend(response.reports)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def delete(self, arn: str) -> None:
@@ -1559,9 +1434,8 @@ class WebhookManager(Boto3ModelManager):
         _response = self.client.create_webhook(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateWebhookOutput(**_response)
+        response = self.parse(CreateWebhookOutput, _response)
 
-        self.sessionize(response.webhook)
         return cast("Webhook", response.webhook)
 
     @webhook_response_with_project_name
@@ -1590,9 +1464,8 @@ class WebhookManager(Boto3ModelManager):
         _response = self.client.update_webhook(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateWebhookOutput(**_response)
+        response = self.parse(UpdateWebhookOutput, _response)
 
-        self.sessionize(response.webhook)
         return cast("Webhook", response.webhook)
 
     def delete(self, projectName: str) -> None:
@@ -1665,13 +1538,12 @@ class SourceCredentialsManager(Boto3ModelManager):
         _response = self.client.import_source_credentials(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ImportSourceCredentialsOutput(**_response)
+        response = self.parse(ImportSourceCredentialsOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.arn
 
-        self.sessionize(results)
         return cast("str", results)
 
     def list(
@@ -1684,9 +1556,8 @@ class SourceCredentialsManager(Boto3ModelManager):
         _response = self.client.list_source_credentials(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListSourceCredentialsOutput(**_response)
+        response = self.parse(ListSourceCredentialsOutput, _response)
         if response and response.sourceCredentialsInfos:
-            self.sessionize(response.sourceCredentialsInfos)
             return PrimaryBoto3ModelQuerySet(response.sourceCredentialsInfos)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -1717,10 +1588,9 @@ class SandboxManager(Boto3ModelManager):
         _response = self.client.batch_get_sandboxes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetSandboxesOutput(**_response)
+        response = self.parse(BatchGetSandboxesOutput, _response)
 
         if response and response.sandboxes:
-            self.sessionize(response.sandboxes[0])
             return response.sandboxes[0]
         return None
 
@@ -1734,28 +1604,8 @@ class SandboxManager(Boto3ModelManager):
         Keyword Args:
             sortOrder: The order in which sandbox records should be retrieved.
         """
-        paginator = self.client.get_paginator("list_sandboxes")
         args: dict[str, Any] = dict(sortOrder=self.serialize(sortOrder))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListSandboxesOutput(**_response)
-            if response.ids:
-                results.extend(response.ids)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_sandboxes", ListSandboxesOutput, "ids", args)
 
     @sandbox_ids_to_sandboxes_with_project
     def list_for_project(
@@ -1784,13 +1634,12 @@ class SandboxManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListSandboxesForProjectOutput(**_response)
+            response = self.parse(ListSandboxesForProjectOutput, _response)
             if response.ids is not None:
                 results.extend(response.ids)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     @sandbox_response_to_sandbox
@@ -1813,13 +1662,12 @@ class SandboxManager(Boto3ModelManager):
         _response = self.client.start_sandbox(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartSandboxOutput(**_response)
+        response = self.parse(StartSandboxOutput, _response)
 
         results: "Sandbox" = None
         if response is not None:
             results = response.sandbox
 
-        self.sessionize(results)
         return cast("Sandbox", results)
 
     @sandbox_response_to_sandbox
@@ -1834,13 +1682,12 @@ class SandboxManager(Boto3ModelManager):
         _response = self.client.stop_sandbox(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopSandboxOutput(**_response)
+        response = self.parse(StopSandboxOutput, _response)
 
         results: "Sandbox" = None
         if response is not None:
             results = response.sandbox
 
-        self.sessionize(results)
         return cast("Sandbox", results)
 
     def start_connection(self, sandboxId: str) -> "StartSandboxConnectionOutput":
@@ -1854,13 +1701,12 @@ class SandboxManager(Boto3ModelManager):
         _response = self.client.start_sandbox_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartSandboxConnectionOutput(**_response)
+        response = self.parse(StartSandboxConnectionOutput, _response)
 
         results: "StartSandboxConnectionOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StartSandboxConnectionOutput", results)
 
 
@@ -1882,10 +1728,9 @@ class CommandExecutionManager(Boto3ModelManager):
         _response = self.client.batch_get_command_executions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetCommandExecutionsOutput(**_response)
+        response = self.parse(BatchGetCommandExecutionsOutput, _response)
 
         if response and response.commandExecutions:
-            self.sessionize(response.commandExecutions[0])
             return response.commandExecutions[0]
         return None
 
@@ -1915,13 +1760,12 @@ class CommandExecutionManager(Boto3ModelManager):
         results: "builtins.list[CommandExecution]" = []
 
         for _response in response_iterator:
-            response = ListCommandExecutionsForSandboxOutput(**_response)
+            response = self.parse(ListCommandExecutionsForSandboxOutput, _response)
             if response.commandExecutions is not None:
                 results.extend(response.commandExecutions)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[CommandExecution]", results)
 
     @command_execution_response_to_command_execution
@@ -1946,13 +1790,12 @@ class CommandExecutionManager(Boto3ModelManager):
         _response = self.client.start_command_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartCommandExecutionOutput(**_response)
+        response = self.parse(StartCommandExecutionOutput, _response)
 
         results: "CommandExecution" = None
         if response is not None:
             results = response.commandExecution
 
-        self.sessionize(results)
         return cast("CommandExecution", results)
 
 
@@ -1981,7 +1824,6 @@ class CodeCoverageManager(Boto3ModelManager):
             minLineCoveragePercentage: The minimum line coverage percentage to report.
             maxLineCoveragePercentage: The maximum line coverage percentage to report.
         """
-        paginator = self.client.get_paginator("describe_code_coverages")
         args: dict[str, Any] = dict(
             reportArn=self.serialize(reportArn),
             sortOrder=self.serialize(sortOrder),
@@ -1989,26 +1831,12 @@ class CodeCoverageManager(Boto3ModelManager):
             minLineCoveragePercentage=self.serialize(minLineCoveragePercentage),
             maxLineCoveragePercentage=self.serialize(maxLineCoveragePercentage),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_code_coverages",
+            DescribeCodeCoveragesOutput,
+            "codeCoverages",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeCodeCoveragesOutput(**_response)
-            if response.codeCoverages:
-                results.extend(response.codeCoverages)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CodeBuildTestCaseManager(Boto3ModelManager):
@@ -2026,30 +1854,12 @@ class CodeBuildTestCaseManager(Boto3ModelManager):
         Keyword Args:
             filter: A ``TestCaseFilter`` object used to filter the returned reports.
         """
-        paginator = self.client.get_paginator("describe_test_cases")
         args: dict[str, Any] = dict(
             reportArn=self.serialize(reportArn), filter=self.serialize(filter)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_test_cases", DescribeTestCasesOutput, "testCases", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeTestCasesOutput(**_response)
-            if response.testCases:
-                results.extend(response.testCases)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CodeBuildEnvironmentPlatformManager(Boto3ModelManager):
@@ -2065,13 +1875,12 @@ class CodeBuildEnvironmentPlatformManager(Boto3ModelManager):
         _response = self.client.list_curated_environment_images(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListCuratedEnvironmentImagesOutput(**_response)
+        response = self.parse(ListCuratedEnvironmentImagesOutput, _response)
 
         results: "builtins.list[CodeBuildEnvironmentPlatform]" = None
         if response is not None:
             results = response.platforms
 
-        self.sessionize(results)
         return cast("builtins.list[CodeBuildEnvironmentPlatform]", results)
 
 
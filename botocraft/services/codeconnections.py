@@ -63,9 +63,8 @@ class ConnectionManager(Boto3ModelManager):
         _response = self.client.create_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateConnectionOutput(**_response)
+        response = self.parse(CreateConnectionOutput, _response)
 
-        self.sessionize(response)
         return cast("CreateConnectionOutput | None", response)
 
     def delete(self, arn: str) -> None:
@@ -92,10 +91,9 @@ class ConnectionManager(Boto3ModelManager):
         _response = self.client.get_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetConnectionOutput(**_response)
+        response = self.parse(GetConnectionOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -133,9 +131,8 @@ class ConnectionManager(Boto3ModelManager):
         _response = self.client.list_connections(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListConnectionsOutput(**_response)
+        response = self.parse(ListConnectionsOutput, _response)
         if response and response.Connections:
-            self.sessionize(response.Connections)
             return PrimaryBoto3ModelQuerySet(response.Connections)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -167,9 +164,8 @@ class HostManager(Boto3ModelManager):
         _response = self.client.create_host(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateHostOutput(**_response)
+        response = self.parse(CreateHostOutput, _response)
 
-        self.sessionize(response)
         return cast("CreateHostOutput | None", response)
 
     def delete(self, arn: str) -> None:
@@ -195,10 +191,9 @@ class HostManager(Boto3ModelManager):
         _response = self.client.get_host(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetHostOutput(**_response)
+        response = self.parse(GetHostOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -223,9 +218,8 @@ class HostManager(Boto3ModelManager):
         _response = self.client.list_hosts(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListHostsOutput(**_response)
+        response = self.parse(ListHostsOutput, _response)
         if response and response.Hosts:
-            self.sessionize(response.Hosts)
             return PrimaryBoto3ModelQuerySet(response.Hosts)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -276,9 +270,8 @@ class SyncConfigurationManager(Boto3ModelManager):
         _response = self.client.create_sync_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateSyncConfigurationOutput(**_response)
+        response = self.parse(CreateSyncConfigurationOutput, _response)
 
-        self.sessionize(response)
         return cast("CreateSyncConfigurationOutput | None", response)
 
     def delete(self, SyncType: Literal["CFN_STACK_SYNC"], ResourceName: str) -> None:
@@ -321,10 +314,9 @@ class SyncConfigurationManager(Boto3ModelManager):
         _response = self.client.get_sync_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSyncConfigurationOutput(**_response)
+        response = self.parse(GetSyncConfigurationOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -359,9 +351,8 @@ class SyncConfigurationManager(Boto3ModelManager):
         _response = self.client.list_sync_configurations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListSyncConfigurationsOutput(**_response)
+        response = self.parse(ListSyncConfigurationsOutput, _response)
         if response and response.SyncConfigurations:
-            self.sessionize(response.SyncConfigurations)
             return PrimaryBoto3ModelQuerySet(response.SyncConfigurations)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -391,9 +382,8 @@ class SyncConfigurationManager(Boto3ModelManager):
         _response = self.client.update_sync_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateSyncConfigurationOutput(**_response)
+        response = self.parse(UpdateSyncConfigurationOutput, _response)
 
-        self.sessionize(response)
         return cast("UpdateSyncConfigurationOutput | None", response)
 
 
@@ -421,9 +411,8 @@ class RepositorySyncDefinitionManager(ReadonlyBoto3ModelManager):
         _response = self.client.list_repository_sync_definitions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListRepositorySyncDefinitionsOutput(**_response)
+        response = self.parse(ListRepositorySyncDefinitionsOutput, _response)
         if response and response.RepositorySyncDefinitions:
-            self.sessionize(response.RepositorySyncDefinitions)
             return PrimaryBoto3ModelQuerySet(response.RepositorySyncDefinitions)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -450,10 +439,9 @@ class SyncBlockerSummaryManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_sync_blocker_summary(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSyncBlockerSummaryOutput(**_response)
+        response = self.parse(GetSyncBlockerSummaryOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -480,9 +468,8 @@ class SyncBlockerManager(Boto3ModelManager):
         _response = self.client.update_sync_blocker(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateSyncBlockerOutput(**_response)
+        response = self.parse(UpdateSyncBlockerOutput, _response)
 
-        self.sessionize(response)
         return cast("UpdateSyncBlockerOutput | None", response)
 
 
@@ -79,9 +79,8 @@ class PipelineManager(Boto3ModelManager):
         _response = self.client.create_pipeline(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePipelineOutput(**_response)
+        response = self.parse(CreatePipelineOutput, _response)
 
-        self.sessionize(response)
         return cast("CreatePipelineOutput", response)
 
     @pipeline_response_to_pipeline
@@ -125,9 +124,8 @@ class PipelineManager(Boto3ModelManager):
         _response = self.client.update_pipeline(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdatePipelineOutput(**_response)
+        response = self.parse(UpdatePipelineOutput, _response)
 
-        self.sessionize(response)
         return cast("UpdatePipelineOutput", response)
 
     def delete(self, name: str) -> None:
@@ -166,10 +164,9 @@ class PipelineManager(Boto3ModelManager):
         _response = self.client.get_pipeline(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetPipelineOutput(**_response)
+        response = self.parse(GetPipelineOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -190,28 +187,8 @@ class PipelineManager(Boto3ModelManager):
                 this version number. When omitted, the
                 current (latest) revision is used.
         """
-        paginator = self.client.get_paginator("list_pipelines")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListPipelinesOutput(**_response)
-            if response.pipelines:
-                results.extend(response.pipelines)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_pipelines", ListPipelinesOutput, "pipelines", args)
 
     def start_execution(
         self,
@@ -252,13 +229,12 @@ class PipelineManager(Boto3ModelManager):
         _response = self.client.start_pipeline_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartPipelineExecutionOutput(**_response)
+        response = self.parse(StartPipelineExecutionOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.pipelineExecutionId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def stop_execution(
@@ -300,13 +276,12 @@ class PipelineManager(Boto3ModelManager):
         _response = self.client.stop_pipeline_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopPipelineExecutionOutput(**_response)
+        response = self.parse(StopPipelineExecutionOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.pipelineExecutionId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -335,10 +310,9 @@ class PipelineExecutionManager(ReadonlyBoto3ModelManager):
         _response = self.client.get_pipeline_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetPipelineExecutionOutput(**_response)
+        response = self.parse(GetPipelineExecutionOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -356,30 +330,15 @@ class PipelineExecutionManager(ReadonlyBoto3ModelManager):
         Keyword Args:
             filter: The pipeline execution to filter on.
         """
-        paginator = self.client.get_paginator("list_pipeline_executions")
         args: dict[str, Any] = dict(
             pipelineName=self.serialize(pipelineName), filter=self.serialize(filter)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_pipeline_executions",
+            ListPipelineExecutionsOutput,
+            "pipelineExecutionSummaries",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListPipelineExecutionsOutput(**_response)
-            if response.pipelineExecutionSummaries:
-                results.extend(response.pipelineExecutionSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def stop(
         self,
@@ -420,13 +379,12 @@ class PipelineExecutionManager(ReadonlyBoto3ModelManager):
         _response = self.client.stop_pipeline_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopPipelineExecutionOutput(**_response)
+        response = self.parse(StopPipelineExecutionOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.pipelineExecutionId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -463,9 +421,8 @@ class ActionTypeManager(Boto3ModelManager):
         _response = self.client.create_custom_action_type(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCustomActionTypeOutput(**_response)
+        response = self.parse(CreateCustomActionTypeOutput, _response)
 
-        self.sessionize(response)
         return cast("CreateCustomActionTypeOutput", response)
 
     def delete(
@@ -533,10 +490,9 @@ class ActionTypeManager(Boto3ModelManager):
         _response = self.client.get_action_type(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetActionTypeOutput(**_response)
+        response = self.parse(GetActionTypeOutput, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -554,31 +510,13 @@ class ActionTypeManager(Boto3ModelManager):
                 specified entity.
             regionFilter: The Region to filter on for the list of action types.
         """
-        paginator = self.client.get_paginator("list_action_types")
         args: dict[str, Any] = dict(
             actionOwnerFilter=self.serialize(actionOwnerFilter),
             regionFilter=self.serialize(regionFilter),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_action_types", ListActionTypesOutput, "actionTypes", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListActionTypesOutput(**_response)
-            if response.actionTypes:
-                results.extend(response.actionTypes)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(self, model: "ActionType") -> None:
         """
@@ -63,9 +63,8 @@ class DataSyncAgentManager(Boto3ModelManager):
         _response = self.client.create_agent(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateAgentResponse(**_response)
+        response = self.parse(CreateAgentResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncAgent | None", response)
 
     @datasync_add_tags
@@ -82,10 +81,9 @@ class DataSyncAgentManager(Boto3ModelManager):
         _response = self.client.describe_agent(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncAgent(**_response)
+        response = self.parse(DataSyncAgent, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -97,28 +95,8 @@ class DataSyncAgentManager(Boto3ModelManager):
         Returns a list of DataSync agents that belong to an Amazon Web Services account
         in the Amazon Web Services Region specified in the request.
         """
-        paginator = self.client.get_paginator("list_agents")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListAgentsResponse(**_response)
-            if response.Agents:
-                results.extend(response.Agents)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_agents", ListAgentsResponse, "Agents", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncAgent") -> "DataSyncAgent | None":
@@ -133,9 +111,8 @@ class DataSyncAgentManager(Boto3ModelManager):
         _response = self.client.update_agent(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateAgentResponse(**_response)
+        response = self.parse(UpdateAgentResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncAgent | None", response)
 
     def delete(self, AgentArn: str) -> None:
@@ -180,9 +157,8 @@ class DataSyncTaskManager(Boto3ModelManager):
         _response = self.client.create_task(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateTaskResponse(**_response)
+        response = self.parse(CreateTaskResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncTask | None", response)
 
     @datasync_add_tags
@@ -199,10 +175,9 @@ class DataSyncTaskManager(Boto3ModelManager):
         _response = self.client.describe_task(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncTask(**_response)
+        response = self.parse(DataSyncTask, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -220,28 +195,8 @@ class DataSyncTaskManager(Boto3ModelManager):
                 ``ListTasks`` with filter name ``LocationId`` and
                 ``Operator Equals`` with the ARN for the location.
         """
-        paginator = self.client.get_paginator("list_tasks")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DataSyncListTasksResponse(**_response)
-            if response.Tasks:
-                results.extend(response.Tasks)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_tasks", DataSyncListTasksResponse, "Tasks", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncTask") -> "DataSyncTask | None":
@@ -267,9 +222,8 @@ class DataSyncTaskManager(Boto3ModelManager):
         _response = self.client.update_task(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateTaskResponse(**_response)
+        response = self.parse(UpdateTaskResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncTask | None", response)
 
     def delete(self, TaskArn: str) -> None:
@@ -344,13 +298,12 @@ class DataSyncTaskManager(Boto3ModelManager):
         _response = self.client.start_task_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartTaskExecutionResponse(**_response)
+        response = self.parse(StartTaskExecutionResponse, _response)
 
         results: "DataSyncTaskExecution | None" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DataSyncTaskExecution | None", results)
 
 
@@ -372,10 +325,9 @@ class DataSyncTaskExecutionManager(Boto3ModelManager):
         _response = self.client.describe_task_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncTaskExecution(**_response)
+        response = self.parse(DataSyncTaskExecution, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -387,28 +339,10 @@ class DataSyncTaskExecutionManager(Boto3ModelManager):
             TaskArn: Specifies the Amazon Resource Name (ARN) of the task that you want
                 execution information about.
         """
-        paginator = self.client.get_paginator("list_task_executions")
         args: dict[str, Any] = dict(TaskArn=self.serialize(TaskArn))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_task_executions", ListTaskExecutionsResponse, "TaskExecutions", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTaskExecutionsResponse(**_response)
-            if response.TaskExecutions:
-                results.extend(response.TaskExecutions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncTaskExecution") -> "DataSyncTaskExecution | None":
@@ -425,9 +359,8 @@ class DataSyncTaskExecutionManager(Boto3ModelManager):
         _response = self.client.update_task_execution(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateTaskExecutionResponse(**_response)
+        response = self.parse(UpdateTaskExecutionResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncTaskExecution | None", response)
 
     def cancel(self, TaskExecutionArn: str) -> None:
@@ -482,9 +415,8 @@ class DataSyncLocationAzureBlobManager(Boto3ModelManager):
         _response = self.client.create_location_azure_blob(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationAzureBlobResponse(**_response)
+        response = self.parse(CreateLocationAzureBlobResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationAzureBlob | None", response)
 
     @datasync_add_tags
@@ -501,10 +433,9 @@ class DataSyncLocationAzureBlobManager(Boto3ModelManager):
         _response = self.client.describe_location_azure_blob(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationAzureBlob(**_response)
+        response = self.parse(DataSyncLocationAzureBlob, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -522,28 +453,8 @@ class DataSyncLocationAzureBlobManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -571,9 +482,8 @@ class DataSyncLocationAzureBlobManager(Boto3ModelManager):
         _response = self.client.update_location_azure_blob(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationAzureBlobResponse(**_response)
+        response = self.parse(UpdateLocationAzureBlobResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationAzureBlob | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -613,9 +523,8 @@ class DataSyncLocationEfsManager(Boto3ModelManager):
         _response = self.client.create_location_efs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationEfsResponse(**_response)
+        response = self.parse(CreateLocationEfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationEfs | None", response)
 
     @datasync_add_tags
@@ -632,10 +541,9 @@ class DataSyncLocationEfsManager(Boto3ModelManager):
         _response = self.client.describe_location_efs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationEfs(**_response)
+        response = self.parse(DataSyncLocationEfs, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -653,28 +561,8 @@ class DataSyncLocationEfsManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncLocationEfs") -> "DataSyncLocationEfs | None":
@@ -696,9 +584,8 @@ class DataSyncLocationEfsManager(Boto3ModelManager):
         _response = self.client.update_location_efs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationEfsResponse(**_response)
+        response = self.parse(UpdateLocationEfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationEfs | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -737,9 +624,8 @@ class DataSyncLocationFsxLustreManager(Boto3ModelManager):
         _response = self.client.create_location_fsx_lustre(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationFsxLustreResponse(**_response)
+        response = self.parse(CreateLocationFsxLustreResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxLustre | None", response)
 
     @datasync_add_tags
@@ -756,10 +642,9 @@ class DataSyncLocationFsxLustreManager(Boto3ModelManager):
         _response = self.client.describe_location_fsx_lustre(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationFsxLustre(**_response)
+        response = self.parse(DataSyncLocationFsxLustre, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -777,28 +662,8 @@ class DataSyncLocationFsxLustreManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -818,9 +683,8 @@ class DataSyncLocationFsxLustreManager(Boto3ModelManager):
         _response = self.client.update_location_fsx_lustre(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationFsxLustreResponse(**_response)
+        response = self.parse(UpdateLocationFsxLustreResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxLustre | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -860,9 +724,8 @@ class DataSyncLocationFsxOntapManager(Boto3ModelManager):
         _response = self.client.create_location_fsx_ontap(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationFsxOntapResponse(**_response)
+        response = self.parse(CreateLocationFsxOntapResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxOntap | None", response)
 
     @datasync_add_tags
@@ -880,10 +743,9 @@ class DataSyncLocationFsxOntapManager(Boto3ModelManager):
         _response = self.client.describe_location_fsx_ontap(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationFsxOntap(**_response)
+        response = self.parse(DataSyncLocationFsxOntap, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -901,28 +763,8 @@ class DataSyncLocationFsxOntapManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -944,9 +786,8 @@ class DataSyncLocationFsxOntapManager(Boto3ModelManager):
         _response = self.client.update_location_fsx_ontap(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationFsxOntapResponse(**_response)
+        response = self.parse(UpdateLocationFsxOntapResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxOntap | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -986,9 +827,8 @@ class DataSyncLocationFsxOpenZfsManager(Boto3ModelManager):
         _response = self.client.create_location_fsx_open_zfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationFsxOpenZfsResponse(**_response)
+        response = self.parse(CreateLocationFsxOpenZfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxOpenZfs | None", response)
 
     @datasync_add_tags
@@ -1005,10 +845,9 @@ class DataSyncLocationFsxOpenZfsManager(Boto3ModelManager):
         _response = self.client.describe_location_fsx_open_zfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationFsxOpenZfs(**_response)
+        response = self.parse(DataSyncLocationFsxOpenZfs, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1026,28 +865,8 @@ class DataSyncLocationFsxOpenZfsManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -1069,9 +888,8 @@ class DataSyncLocationFsxOpenZfsManager(Boto3ModelManager):
         _response = self.client.update_location_fsx_open_zfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationFsxOpenZfsResponse(**_response)
+        response = self.parse(UpdateLocationFsxOpenZfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxOpenZfs | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1116,9 +934,8 @@ class DataSyncLocationFsxWindowsManager(Boto3ModelManager):
         _response = self.client.create_location_fsx_windows(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationFsxWindowsResponse(**_response)
+        response = self.parse(CreateLocationFsxWindowsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxWindows | None", response)
 
     @datasync_add_tags
@@ -1135,10 +952,9 @@ class DataSyncLocationFsxWindowsManager(Boto3ModelManager):
         _response = self.client.describe_location_fsx_windows(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationFsxWindows(**_response)
+        response = self.parse(DataSyncLocationFsxWindows, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1156,28 +972,8 @@ class DataSyncLocationFsxWindowsManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -1203,9 +999,8 @@ class DataSyncLocationFsxWindowsManager(Boto3ModelManager):
         _response = self.client.update_location_fsx_windows(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationFsxWindowsResponse(**_response)
+        response = self.parse(UpdateLocationFsxWindowsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationFsxWindows | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1253,9 +1048,8 @@ class DataSyncLocationHdfsManager(Boto3ModelManager):
         _response = self.client.create_location_hdfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationHdfsResponse(**_response)
+        response = self.parse(CreateLocationHdfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationHdfs | None", response)
 
     @datasync_add_tags
@@ -1271,10 +1065,9 @@ class DataSyncLocationHdfsManager(Boto3ModelManager):
         _response = self.client.describe_location_hdfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationHdfs(**_response)
+        response = self.parse(DataSyncLocationHdfs, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1292,28 +1085,8 @@ class DataSyncLocationHdfsManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncLocationHdfs") -> "DataSyncLocationHdfs | None":
@@ -1345,9 +1118,8 @@ class DataSyncLocationHdfsManager(Boto3ModelManager):
         _response = self.client.update_location_hdfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationHdfsResponse(**_response)
+        response = self.parse(UpdateLocationHdfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationHdfs | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1385,9 +1157,8 @@ class DataSyncLocationNfsManager(Boto3ModelManager):
         _response = self.client.create_location_nfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationNfsResponse(**_response)
+        response = self.parse(CreateLocationNfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationNfs | None", response)
 
     @datasync_add_tags
@@ -1404,10 +1175,9 @@ class DataSyncLocationNfsManager(Boto3ModelManager):
         _response = self.client.describe_location_nfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationNfs(**_response)
+        response = self.parse(DataSyncLocationNfs, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1425,28 +1195,8 @@ class DataSyncLocationNfsManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncLocationNfs") -> "DataSyncLocationNfs | None":
@@ -1468,9 +1218,8 @@ class DataSyncLocationNfsManager(Boto3ModelManager):
         _response = self.client.update_location_nfs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationNfsResponse(**_response)
+        response = self.parse(UpdateLocationNfsResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationNfs | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1519,9 +1268,8 @@ class DataSyncLocationObjectStorageManager(Boto3ModelManager):
         _response = self.client.create_location_object_storage(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationObjectStorageResponse(**_response)
+        response = self.parse(CreateLocationObjectStorageResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationObjectStorage | None", response)
 
     @datasync_add_tags
@@ -1538,10 +1286,9 @@ class DataSyncLocationObjectStorageManager(Boto3ModelManager):
         _response = self.client.describe_location_object_storage(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationObjectStorage(**_response)
+        response = self.parse(DataSyncLocationObjectStorage, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1559,28 +1306,8 @@ class DataSyncLocationObjectStorageManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(
@@ -1610,9 +1337,8 @@ class DataSyncLocationObjectStorageManager(Boto3ModelManager):
         _response = self.client.update_location_object_storage(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationObjectStorageResponse(**_response)
+        response = self.parse(UpdateLocationObjectStorageResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationObjectStorage | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1651,9 +1377,8 @@ class DataSyncLocationS3Manager(Boto3ModelManager):
         _response = self.client.create_location_s3(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationS3Response(**_response)
+        response = self.parse(CreateLocationS3Response, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationS3 | None", response)
 
     @datasync_add_tags
@@ -1670,10 +1395,9 @@ class DataSyncLocationS3Manager(Boto3ModelManager):
         _response = self.client.describe_location_s3(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationS3(**_response)
+        response = self.parse(DataSyncLocationS3, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1691,28 +1415,8 @@ class DataSyncLocationS3Manager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncLocationS3") -> "DataSyncLocationS3 | None":
@@ -1733,9 +1437,8 @@ class DataSyncLocationS3Manager(Boto3ModelManager):
         _response = self.client.update_location_s3(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationS3Response(**_response)
+        response = self.parse(UpdateLocationS3Response, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationS3 | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -1783,9 +1486,8 @@ class DataSyncLocationSmbManager(Boto3ModelManager):
         _response = self.client.create_location_smb(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLocationSmbResponse(**_response)
+        response = self.parse(CreateLocationSmbResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationSmb | None", response)
 
     @datasync_add_tags
@@ -1802,10 +1504,9 @@ class DataSyncLocationSmbManager(Boto3ModelManager):
         _response = self.client.describe_location_smb(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DataSyncLocationSmb(**_response)
+        response = self.parse(DataSyncLocationSmb, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1823,28 +1524,8 @@ class DataSyncLocationSmbManager(Boto3ModelManager):
                 ``ListLocations`` with filter name ``LocationType S3``
                 and ``Operator Equals``.
         """
-        paginator = self.client.get_paginator("list_locations")
         args: dict[str, Any] = dict(Filters=self.serialize(Filters))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListLocationsResponse(**_response)
-            if response.Locations:
-                results.extend(response.Locations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_locations", ListLocationsResponse, "Locations", args)
 
     @datasync_refresh_after_update
     def update(self, model: "DataSyncLocationSmb") -> "DataSyncLocationSmb | None":
@@ -1876,9 +1557,8 @@ class DataSyncLocationSmbManager(Boto3ModelManager):
         _response = self.client.update_location_smb(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateLocationSmbResponse(**_response)
+        response = self.parse(UpdateLocationSmbResponse, _response)
 
-        self.sessionize(response)
         return cast("DataSyncLocationSmb | None", response)
 
     def delete(self, LocationArn: str) -> None:
@@ -0,0 +1,258 @@
+"""
+Sharing repeated values among the models built from one AWS response.
+
+A large inventory repeats the same few strings over and over: availability
+zones, instance types, VPC and subnet IDs, cluster ARNs, enum values like
+``running``.  botocore makes a new string object for every one of them.
+With the ``responses.deduplicate`` setting on, each response is walked once
+after its models are built, and:
+
+* the string values of enum-typed fields, and of the fields named in
+  ``responses.intern_fields``, are replaced with :py:func:`sys.intern`
+  copies, so each distinct value is held once for the whole process;
+* equal models of frozen classes (e.g.
+  :py:class:`~botocraft.services.ecs.Deployment`) are replaced with one
+  shared instance per response.
+
+.. code-block:: toml
+
+    [responses]
+    deduplicate = true
+    intern_fields = ["AvailabilityZone", "InstanceType", "VpcId", "Key"]
+
+Models of classes that are not frozen are never shared, since changing one
+would change them all.  Frozen models still hold ordinary lists, so do not
+change those lists in place.  Nested models that a ``lazy=True`` response has
+not built yet are left alone.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from .trusted import PENDING, _mentions_model
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class _Layout(NamedTuple):
+    """
+    Which fields of one model class the walk looks at.
+    """
+
+    #: The fields holding strings to intern.
+    interned: tuple[str, ...]
+    #: The fields that may hold models.
+    nested: tuple[str, ...]
+    #: Whether equal models of the class can be shared.
+    shared: bool
+
+
+def _is_enum(annotation: Any) -> bool:
+    """
+    Return whether a field's type is a string enum (``Literal``), optionally
+    ``None``.
+
+    Args:
+        annotation: The field's type.
+
+    Returns:
+        Whether the field holds one of a fixed set of strings.
+
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return len(members) == 1 and _is_enum(members[0])
+    return get_origin(annotation) is Literal
+
+
+@lru_cache(maxsize=4096)
+def _layout(model_class: type[BaseModel], names: frozenset[str]) -> _Layout:
+    """
+    Work out, once per class, which fields the walk looks at.
+
+    Args:
+        model_class: The model class.
+        names: The lower-cased field names to intern.
+
+    Returns:
+        The class's layout.
+
+    """
+    interned: list[str] = []
+    nested: list[str] = []
+    for name, field in model_class.model_fields.items():
+        if _mentions_model(field.annotation):
+            nested.append(name)
+        elif (
+            _is_enum(field.annotation)
+            or {
+                name.lower(),
+                (field.alias or name).lower(),
+            }
+            & names
+        ):
+            interned.append(name)
+    return _Layout(
+        tuple(interned), tuple(nested), bool(model_class.model_config.get("frozen"))
+    )
+
+
+def _key(model: BaseModel) -> tuple[Any, ...] | None:
+    """
+    Build the key equal frozen models share.
+
+    The key covers the model's extra fields and which fields were set, as
+    well as its field values, so models are only shared when they dump the
+    same.
+
+    Args:
+        model: A model of a frozen class whose nested models are already
+            shared.
+
+    Returns:
+        The key, or ``None`` if the model holds something that cannot be
+        shared safely (a model of a class that is not frozen) or hashed.
+
+    """
+    extra = model.__pydantic_extra__ or {}
+    key: list[Any] = [type(model), frozenset(model.__pydantic_fields_set__)]
+    for value in (*model.__dict__.values(), sorted(extra.items(), key=itemgetter(0))):
+        frozen = _freeze(value)
+        if frozen is _UNSHAREABLE:
+            return None
+        key.append(frozen)
+    return tuple(key)
+
+
+#: Marks a value :py:func:`_key` cannot put in a key.
+_UNSHAREABLE: Any = object()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a field value hashable for :py:func:`_key`.
+
+    Args:
+        value: The field value.
+
+    Returns:
+        A hashable equivalent, or :py:data:`_UNSHAREABLE`.
+
+    """
+    if isinstance(value, BaseModel):
+        if not value.model_config.get("frozen"):
+            return _UNSHAREABLE
+        # Already the shared instance, so identity is equality
+        return ("model", id(value))
+    if isinstance(value, list | tuple):
+        items = tuple(_freeze(item) for item in value)
+        return _UNSHAREABLE if _UNSHAREABLE in items else items
+    if isinstance(value, dict):
+        items = tuple((key, _freeze(item)) for key, item in value.items())
+        return _UNSHAREABLE if any(item is _UNSHAREABLE for _, item in items) else items
+    try:
+        hash(value)
+    except TypeError:
+        return _UNSHAREABLE
+    return value
+
+
+class _Walk:
+    """
+    One deduplicating walk over the models built from a response.
+
+    Args:
+        names: The lower-cased field names to intern.
+
+    """
+
+    __slots__ = ("names", "shared")
+
+    def __init__(self, names: frozenset[str]) -> None:
+        self.names = names
+        #: The shared instance of each frozen model seen so far, by key.
+        self.shared: dict[tuple[Any, ...], BaseModel] = {}
+
+    def model(self, model: BaseModel) -> BaseModel:
+        """
+        Deduplicate a model and the models in it.
+
+        Args:
+            model: The model.
+
+        Returns:
+            The model, or an equal one seen earlier in the response.
+
+        """
+        fields = model.__dict__
+        layout = _layout(type(model), self.names)
+        for name in layout.interned:
+            value = fields.get(name)
+            if type(value) is str:
+                fields[name] = sys.intern(value)
+        for name in layout.nested:
+            value = fields.get(name)
+            if value is not None:
+                fields[name] = self.value(value)
+        if not layout.shared or PENDING in fields:
+            return model
+        key = _key(model)
+        if key is None:
+            return model
+        return self.shared.setdefault(key, model)
+
+    def value(self, value: Any) -> Any:
+        """
+        Deduplicate the models in a field value.
+
+        Args:
+            value: The field value.
+
+        Returns:
+            The value, with its models deduplicated.
+
+        """
+        if isinstance(value, BaseModel):
+            return self.model(value)
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self.value(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self.value(item)
+        return value
+
+
+def deduplicate(model: BaseModel, intern_fields: Iterable[str]) -> BaseModel:
+    """
+    Intern the low-cardinality strings in ``model`` and the models in it, and
+    share equal frozen models among them.
+
+    Args:
+        model: A model built from an AWS response.
+        intern_fields: Field names whose string values are interned, besides
+            the enum-typed fields.
+
+    Returns:
+        The model, which is ``model`` itself unless it is frozen and equal to
+        a model already shared.
+
+    """
+    names = frozenset(name.lower() for name in intern_fields)
+    return _Walk(names).model(model)
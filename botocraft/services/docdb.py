@@ -117,9 +117,8 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.create_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDBClusterResult(**_response)
+        response = self.parse(CreateDBClusterResult, _response)
 
-        self.sessionize(response.DBCluster)
         return cast("DocDBCluster", response.DBCluster)
 
     @single_docdb_cluster_include_tags
@@ -221,9 +220,8 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.modify_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyDBClusterResult(**_response)
+        response = self.parse(ModifyDBClusterResult, _response)
 
-        self.sessionize(response.DBCluster)
         return cast("DocDBCluster", response.DBCluster)
 
     def delete(
@@ -262,7 +260,7 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.delete_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteDBClusterResult(**_response)
+        response = self.parse(DeleteDBClusterResult, _response)
         return cast("DocDBCluster", response.DBCluster)
 
     @single_docdb_cluster_include_tags
@@ -288,10 +286,9 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.describe_db_clusters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBClusterMessage(**_response)
+        response = self.parse(DocDBClusterMessage, _response)
 
         if response and response.DBClusters:
-            self.sessionize(response.DBClusters[0])
             return response.DBClusters[0]
         return None
 
@@ -318,31 +315,13 @@ class DocDBClusterManager(Boto3ModelManager):
                 specific cluster is returned. This parameter isn't case sensitive.
             Filters: A filter that specifies one or more clusters to describe.
         """
-        paginator = self.client.get_paginator("describe_db_clusters")
         args: dict[str, Any] = dict(
             DBClusterIdentifier=self.serialize(DBClusterIdentifier),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_db_clusters", DocDBClusterMessage, "DBClusters", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DocDBClusterMessage(**_response)
-            if response.DBClusters:
-                results.extend(response.DBClusters)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @single_docdb_cluster_include_tags
     def failover(
@@ -367,13 +346,12 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.failover_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = FailoverDBClusterResult(**_response)
+        response = self.parse(FailoverDBClusterResult, _response)
 
         results: "DocDBCluster" = None
         if response is not None:
             results = response.DBCluster
 
-        self.sessionize(results)
         return cast("DocDBCluster", results)
 
     @single_docdb_cluster_include_tags
@@ -458,13 +436,12 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.restore_db_cluster_to_point_in_time(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RestoreDBClusterToPointInTimeResult(**_response)
+        response = self.parse(RestoreDBClusterToPointInTimeResult, _response)
 
         results: "DocDBCluster" = None
         if response is not None:
             results = response.DBCluster
 
-        self.sessionize(results)
         return cast("DocDBCluster", results)
 
     @single_docdb_cluster_include_tags
@@ -485,13 +462,12 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.start_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartDBClusterResult(**_response)
+        response = self.parse(StartDBClusterResult, _response)
 
         results: "DocDBCluster" = None
         if response is not None:
             results = response.DBCluster
 
-        self.sessionize(results)
         return cast("DocDBCluster", results)
 
     @single_docdb_cluster_include_tags
@@ -513,13 +489,12 @@ class DocDBClusterManager(Boto3ModelManager):
         _response = self.client.stop_db_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopDBClusterResult(**_response)
+        response = self.parse(StopDBClusterResult, _response)
 
         results: "DocDBCluster" = None
         if response is not None:
             results = response.DBCluster
 
-        self.sessionize(results)
         return cast("DocDBCluster", results)
 
 
@@ -553,9 +528,8 @@ class DocDBInstanceManager(Boto3ModelManager):
         _response = self.client.create_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBCreateDBInstanceResult(**_response)
+        response = self.parse(DocDBCreateDBInstanceResult, _response)
 
-        self.sessionize(response.DBInstance)
         return cast("DocDBInstance", response.DBInstance)
 
     @single_docdb_instance_include_tags
@@ -609,9 +583,8 @@ class DocDBInstanceManager(Boto3ModelManager):
         _response = self.client.modify_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBModifyDBInstanceResult(**_response)
+        response = self.parse(DocDBModifyDBInstanceResult, _response)
 
-        self.sessionize(response.DBInstance)
         return cast("DocDBInstance", response.DBInstance)
 
     def delete(self, DBInstanceIdentifier: str) -> "DocDBInstance":
@@ -628,7 +601,7 @@ class DocDBInstanceManager(Boto3ModelManager):
         _response = self.client.delete_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBDeleteDBInstanceResult(**_response)
+        response = self.parse(DocDBDeleteDBInstanceResult, _response)
         return cast("DocDBInstance", response.DBInstance)
 
     @multiple_docdb_instance_include_tags
@@ -649,31 +622,13 @@ class DocDBInstanceManager(Boto3ModelManager):
                         sensitive.
                     Filters: A filter that specifies one or more instances to describe.
         """
-        paginator = self.client.get_paginator("describe_db_instances")
         args: dict[str, Any] = dict(
             DBInstanceIdentifier=self.serialize(DBInstanceIdentifier),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_db_instances", DocDBInstanceMessage, "DBInstances", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DocDBInstanceMessage(**_response)
-            if response.DBInstances:
-                results.extend(response.DBInstances)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @single_docdb_instance_include_tags
     def get(self, DBInstanceIdentifier: str) -> "DocDBInstance | None":
@@ -693,10 +648,9 @@ class DocDBInstanceManager(Boto3ModelManager):
         _response = self.client.describe_db_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBInstanceMessage(**_response)
+        response = self.parse(DocDBInstanceMessage, _response)
 
         if response and response.DBInstances:
-            self.sessionize(response.DBInstances[0])
             return response.DBInstances[0]
         return None
 
@@ -726,13 +680,12 @@ class DocDBInstanceManager(Boto3ModelManager):
         _response = self.client.reboot_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RebootDBInstanceResult(**_response)
+        response = self.parse(RebootDBInstanceResult, _response)
 
         results: "DocDBInstance" = None
         if response is not None:
             results = response.DBInstance
 
-        self.sessionize(results)
         return cast("DocDBInstance", results)
 
 
@@ -769,9 +722,8 @@ class DocDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.create_db_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBCreateDBSubnetGroupResult(**_response)
+        response = self.parse(DocDBCreateDBSubnetGroupResult, _response)
 
-        self.sessionize(response.DBSubnetGroup)
         return cast("DocDBSubnetGroup", response.DBSubnetGroup)
 
     @single_docdb_subnet_group_include_tags
@@ -797,9 +749,8 @@ class DocDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.modify_db_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBModifyDBSubnetGroupResult(**_response)
+        response = self.parse(DocDBModifyDBSubnetGroupResult, _response)
 
-        self.sessionize(response.DBSubnetGroup)
         return cast("DocDBSubnetGroup", response.DBSubnetGroup)
 
     def delete(self, DBSubnetGroupName: str) -> None:
@@ -829,10 +780,9 @@ class DocDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.describe_db_subnet_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DocDBSubnetGroupMessage(**_response)
+        response = self.parse(DocDBSubnetGroupMessage, _response)
 
         if response and response.DBSubnetGroups:
-            self.sessionize(response.DBSubnetGroups[0])
             return response.DBSubnetGroups[0]
         return None
 
@@ -853,31 +803,13 @@ class DocDBSubnetGroupManager(Boto3ModelManager):
             DBSubnetGroupName: The name of the subnet group to return details for.
             Filters: This parameter is not currently supported.
         """
-        paginator = self.client.get_paginator("describe_db_subnet_groups")
         args: dict[str, Any] = dict(
             DBSubnetGroupName=self.serialize(DBSubnetGroupName),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_db_subnet_groups", DocDBSubnetGroupMessage, "DBSubnetGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DocDBSubnetGroupMessage(**_response)
-            if response.DBSubnetGroups:
-                results.extend(response.DBSubnetGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -1293,7 +1225,7 @@ class DocDBCluster(TagsDictMixin, DocDBClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return DocDBSubnetGroup.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(DocDBSubnetGroup).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -1319,7 +1251,7 @@ class DocDBCluster(TagsDictMixin, DocDBClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -1341,7 +1273,7 @@ class DocDBCluster(TagsDictMixin, DocDBClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -1367,7 +1299,7 @@ class DocDBCluster(TagsDictMixin, DocDBClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def kms_key(self) -> "KMSKey | None":
@@ -1389,7 +1321,7 @@ class DocDBCluster(TagsDictMixin, DocDBClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return KMSKey.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(KMSKey).get(**pk)  # type: ignore[arg-type]
 
     def start(self) -> "DocDBCluster":
         """
@@ -1880,7 +1812,7 @@ class DocDBInstance(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return DocDBSubnetGroup.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(DocDBSubnetGroup).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -1906,7 +1838,7 @@ class DocDBInstance(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -1928,7 +1860,7 @@ class DocDBInstance(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def kms_key(self) -> "KMSKey | None":
@@ -1950,7 +1882,7 @@ class DocDBInstance(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return KMSKey.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(KMSKey).get(**pk)  # type: ignore[arg-type]
 
     def reboot(self, ForceFailover: "bool | None" = None) -> "DocDBInstance":
         """
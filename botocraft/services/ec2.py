@@ -60,10 +60,9 @@ class VpcManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_vpcs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcsResult(**_response)
+        response = self.parse(DescribeVpcsResult, _response)
 
         if response and response.Vpcs:
-            self.sessionize(response.Vpcs[0])
             return response.Vpcs[0]
         return None
 
@@ -90,32 +89,12 @@ class VpcManager(ReadonlyBoto3ModelManager):
                 error response is ``DryRunOperation``.
                 Otherwise, it is ``UnauthorizedOperation``.
         """
-        paginator = self.client.get_paginator("describe_vpcs")
         args: dict[str, Any] = dict(
             Filters=self.serialize(Filters),
             VpcIds=self.serialize(VpcIds),
             DryRun=self.serialize(DryRun),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeVpcsResult(**_response)
-            if response.Vpcs:
-                results.extend(response.Vpcs)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_vpcs", DescribeVpcsResult, "Vpcs", args)
 
     def dns_hostnames(self, VpcId: str) -> bool:
         """
@@ -131,13 +110,12 @@ class VpcManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_vpc_attribute(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcAttributeResult(**_response)
+        response = self.parse(DescribeVpcAttributeResult, _response)
 
         results: bool = None
         if response is not None:
             results = response.EnableDnsHostnames["Value"]
 
-        self.sessionize(results)
         return cast("bool", results)
 
     def dns_support(self, VpcId: str) -> bool:
@@ -154,13 +132,12 @@ class VpcManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_vpc_attribute(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcAttributeResult(**_response)
+        response = self.parse(DescribeVpcAttributeResult, _response)
 
         results: bool = None
         if response is not None:
             results = response.EnableDnsSupport["Value"]
 
-        self.sessionize(results)
         return cast("bool", results)
 
     def network_address_usage_metrics(self, VpcId: str) -> bool:
@@ -179,13 +156,12 @@ class VpcManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_vpc_attribute(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcAttributeResult(**_response)
+        response = self.parse(DescribeVpcAttributeResult, _response)
 
         results: bool = None
         if response is not None:
             results = response.EnableNetworkAddressUsageMetrics["Value"]
 
-        self.sessionize(results)
         return cast("bool", results)
 
 
@@ -216,10 +192,9 @@ class SubnetManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_subnets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeSubnetsResult(**_response)
+        response = self.parse(DescribeSubnetsResult, _response)
 
         if response and response.Subnets:
-            self.sessionize(response.Subnets[0])
             return response.Subnets[0]
         return None
 
@@ -246,32 +221,12 @@ class SubnetManager(ReadonlyBoto3ModelManager):
                 error response is ``DryRunOperation``.
                 Otherwise, it is ``UnauthorizedOperation``.
         """
-        paginator = self.client.get_paginator("describe_subnets")
         args: dict[str, Any] = dict(
             Filters=self.serialize(Filters),
             SubnetIds=self.serialize(SubnetIds),
             DryRun=self.serialize(DryRun),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeSubnetsResult(**_response)
-            if response.Subnets:
-                results.extend(response.Subnets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_subnets", DescribeSubnetsResult, "Subnets", args)
 
 
 class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
@@ -304,9 +259,8 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_security_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateSecurityGroupResult(**_response)
+        response = self.parse(CreateSecurityGroupResult, _response)
 
-        self.sessionize(response.GroupId)
         return cast("str", response.GroupId)
 
     def delete(self, GroupId: str, *, DryRun: bool = False) -> "SecurityGroup":
@@ -329,7 +283,7 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_security_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteSecurityGroupResult(**_response)
+        response = self.parse(DeleteSecurityGroupResult, _response)
         return response
 
     def get(self, GroupId: str, *, DryRun: bool = False) -> "SecurityGroup | None":
@@ -352,10 +306,9 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_security_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeSecurityGroupsResult(**_response)
+        response = self.parse(DescribeSecurityGroupsResult, _response)
 
         if response and response.SecurityGroups:
-            self.sessionize(response.SecurityGroups[0])
             return response.SecurityGroups[0]
         return None
 
@@ -386,33 +339,18 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
                 combination of rules - not necessarily a single rule - match all
                 filters.
         """
-        paginator = self.client.get_paginator("describe_security_groups")
         args: dict[str, Any] = dict(
             GroupIds=self.serialize(GroupIds),
             GroupNames=self.serialize(GroupNames),
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_security_groups",
+            DescribeSecurityGroupsResult,
+            "SecurityGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeSecurityGroupsResult(**_response)
-            if response.SecurityGroups:
-                results.extend(response.SecurityGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def revoke_ingress(
         self,
@@ -445,13 +383,12 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.revoke_security_group_ingress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RevokeSecurityGroupIngressResult(**_response)
+        response = self.parse(RevokeSecurityGroupIngressResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
     def authorize_ingress(
@@ -488,13 +425,12 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.authorize_security_group_ingress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AuthorizeSecurityGroupIngressResult(**_response)
+        response = self.parse(AuthorizeSecurityGroupIngressResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
     def revoke_egress(
@@ -528,13 +464,12 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.revoke_security_group_egress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RevokeSecurityGroupEgressResult(**_response)
+        response = self.parse(RevokeSecurityGroupEgressResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
     def authorize_egress(
@@ -571,13 +506,12 @@ class SecurityGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.authorize_security_group_egress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AuthorizeSecurityGroupEgressResult(**_response)
+        response = self.parse(AuthorizeSecurityGroupEgressResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
 
@@ -613,9 +547,8 @@ class NetworkAclManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_network_acl(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateNetworkAclResult(**_response)
+        response = self.parse(CreateNetworkAclResult, _response)
 
-        self.sessionize(response.NetworkAclInstance)
         return cast("NetworkAcl", response.NetworkAclInstance)
 
     def delete(self, NetworkAclId: str, *, DryRun: bool = False) -> None:
@@ -666,10 +599,9 @@ class NetworkAclManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_network_acls(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeNetworkAclsResult(**_response)
+        response = self.parse(DescribeNetworkAclsResult, _response)
 
         if response and response.NetworkAcls:
-            self.sessionize(response.NetworkAcls[0])
             return response.NetworkAcls[0]
         return None
 
@@ -696,32 +628,14 @@ class NetworkAclManager(EC2TagsManagerMixin, Boto3ModelManager):
             NetworkAclIds: The IDs of the network ACLs.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_network_acls")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             NetworkAclIds=self.serialize(NetworkAclIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_network_acls", DescribeNetworkAclsResult, "NetworkAcls", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeNetworkAclsResult(**_response)
-            if response.NetworkAcls:
-                results.extend(response.NetworkAcls)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def create_entry(
         self,
@@ -941,9 +855,8 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.create_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateImageResult(**_response)
+        response = self.parse(CreateImageResult, _response)
 
-        self.sessionize(response.ImageId)
         return cast("str", response.ImageId)
 
     def delete(
@@ -977,7 +890,7 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.deregister_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeregisterImageResult(**_response)
+        response = self.parse(DeregisterImageResult, _response)
         return response
 
     def get(
@@ -1026,10 +939,9 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.describe_images(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeImagesResult(**_response)
+        response = self.parse(DescribeImagesResult, _response)
 
         if response and response.Images:
-            self.sessionize(response.Images[0])
             return response.Images[0]
         return None
 
@@ -1068,7 +980,6 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
                 Otherwise, it is ``UnauthorizedOperation``.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_images")
         args: dict[str, Any] = dict(
             ExecutableUsers=self.serialize(ExecutableUsers),
             ImageIds=self.serialize(ImageIds),
@@ -1078,26 +989,7 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeImagesResult(**_response)
-            if response.Images:
-                results.extend(response.Images)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_images", DescribeImagesResult, "Images", args)
 
     def copy(
         self,
@@ -1190,13 +1082,12 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.copy_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CopyImageResult(**_response)
+        response = self.parse(CopyImageResult, _response)
 
         results: str = None
         if response is not None:
             results = response.ImageId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def enable_deregistration_protection(
@@ -1227,13 +1118,12 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.enable_image_deregistration_protection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EnableImageDeregistrationProtectionResult(**_response)
+        response = self.parse(EnableImageDeregistrationProtectionResult, _response)
 
         results: str = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("str", results)
 
     def disable_deregistration_protection(
@@ -1259,13 +1149,12 @@ class AMIManager(EC2TagsManagerMixin, AMIManagerMixin, Boto3ModelManager):
         _response = self.client.disable_image_deregistration_protection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisableImageDeregistrationProtectionResult(**_response)
+        response = self.parse(DisableImageDeregistrationProtectionResult, _response)
 
         results: str = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -1428,9 +1317,8 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.run_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Reservation(**_response)
+        response = self.parse(Reservation, _response)
 
-        self.sessionize(response.Instances[0])
         return cast("builtins.list[Instance]", response.Instances[0])
 
     @ec2_instance_only
@@ -1467,10 +1355,9 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeInstancesResult(**_response)
+        response = self.parse(DescribeInstancesResult, _response)
 
         if response and response.Reservations:
-            self.sessionize(response.Reservations[0])
             return response.Reservations[0]
         return None
 
@@ -1500,33 +1387,15 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
                 Otherwise, it is ``UnauthorizedOperation``.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_instances")
         args: dict[str, Any] = dict(
             InstanceIds=self.serialize(InstanceIds),
             IncludeManagedResources=self.serialize(IncludeManagedResources),
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_instances", DescribeInstancesResult, "Reservations", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeInstancesResult(**_response)
-            if response.Reservations:
-                results.extend(response.Reservations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def start(
         self,
@@ -1557,13 +1426,12 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.start_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartInstancesResult(**_response)
+        response = self.parse(StartInstancesResult, _response)
 
         results: "builtins.list[InstanceStateChange] | None" = None
         if response is not None:
             results = response.StartingInstances
 
-        self.sessionize(results)
         return cast("builtins.list[InstanceStateChange] | None", results)
 
     def stop(
@@ -1615,13 +1483,12 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.stop_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopInstancesResult(**_response)
+        response = self.parse(StopInstancesResult, _response)
 
         results: "builtins.list[InstanceStateChange] | None" = None
         if response is not None:
             results = response.StoppingInstances
 
-        self.sessionize(results)
         return cast("builtins.list[InstanceStateChange] | None", results)
 
     def reboot(
@@ -1691,13 +1558,12 @@ class InstanceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.terminate_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = TerminateInstancesResult(**_response)
+        response = self.parse(TerminateInstancesResult, _response)
 
         results: "builtins.list[InstanceStateChange] | None" = None
         if response is not None:
             results = response.TerminatingInstances
 
-        self.sessionize(results)
         return cast("builtins.list[InstanceStateChange] | None", results)
 
     def modify_instance_type(
@@ -2406,9 +2272,8 @@ class LaunchTemplateManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_launch_template(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLaunchTemplateResult(**_response)
+        response = self.parse(CreateLaunchTemplateResult, _response)
 
-        self.sessionize(response.LaunchTemplateInstance)
         return cast("LaunchTemplate", response.LaunchTemplateInstance)
 
     def delete(
@@ -2441,7 +2306,7 @@ class LaunchTemplateManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_launch_template(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteLaunchTemplateResult(**_response)
+        response = self.parse(DeleteLaunchTemplateResult, _response)
         return cast("LaunchTemplate", response.LaunchTemplateInstance)
 
     def get(
@@ -2477,10 +2342,9 @@ class LaunchTemplateManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_launch_templates(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLaunchTemplatesResult(**_response)
+        response = self.parse(DescribeLaunchTemplatesResult, _response)
 
         if response and response.LaunchTemplates:
-            self.sessionize(response.LaunchTemplates[0])
             return response.LaunchTemplates[0]
         return None
 
@@ -2511,7 +2375,6 @@ class LaunchTemplateManager(EC2TagsManagerMixin, Boto3ModelManager):
                 Services services, even if managed resource
                 visibility is set to hidden.
         """
-        paginator = self.client.get_paginator("describe_launch_templates")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             LaunchTemplateIds=self.serialize(LaunchTemplateIds),
@@ -2519,26 +2382,12 @@ class LaunchTemplateManager(EC2TagsManagerMixin, Boto3ModelManager):
             Filters=self.serialize(Filters),
             IncludeManagedResources=self.serialize(IncludeManagedResources),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_launch_templates",
+            DescribeLaunchTemplatesResult,
+            "LaunchTemplates",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeLaunchTemplatesResult(**_response)
-            if response.LaunchTemplates:
-                results.extend(response.LaunchTemplates)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class LaunchTemplateVersionManager(Boto3ModelManager):
@@ -2591,9 +2440,8 @@ class LaunchTemplateVersionManager(Boto3ModelManager):
         _response = self.client.create_launch_template_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLaunchTemplateVersionResult(**_response)
+        response = self.parse(CreateLaunchTemplateVersionResult, _response)
 
-        self.sessionize(response.LaunchTemplateVersionInstance)
         return cast("LaunchTemplateVersion", response.LaunchTemplateVersionInstance)
 
     def delete(
@@ -2679,10 +2527,9 @@ class LaunchTemplateVersionManager(Boto3ModelManager):
         _response = self.client.describe_launch_template_versions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLaunchTemplateVersionsResult(**_response)
+        response = self.parse(DescribeLaunchTemplateVersionsResult, _response)
 
         if response and response.LaunchTemplateVersions:
-            self.sessionize(response.LaunchTemplateVersions[0])
             return response.LaunchTemplateVersions[0]
         return None
 
@@ -2732,7 +2579,6 @@ class LaunchTemplateVersionManager(Boto3ModelManager):
                 Services services, even if managed resource
                 visibility is set to hidden.
         """
-        paginator = self.client.get_paginator("describe_launch_template_versions")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             LaunchTemplateId=self.serialize(LaunchTemplateId),
@@ -2744,26 +2590,12 @@ class LaunchTemplateVersionManager(Boto3ModelManager):
             ResolveAlias=self.serialize(ResolveAlias),
             IncludeManagedResources=self.serialize(IncludeManagedResources),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_launch_template_versions",
+            DescribeLaunchTemplateVersionsResult,
+            "LaunchTemplateVersions",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeLaunchTemplateVersionsResult(**_response)
-            if response.LaunchTemplateVersions:
-                results.extend(response.LaunchTemplateVersions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
@@ -2858,9 +2690,8 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_network_interface(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateNetworkInterfaceResult(**_response)
+        response = self.parse(CreateNetworkInterfaceResult, _response)
 
-        self.sessionize(response.NetworkInterfaceInstance)
         return cast("NetworkInterface", response.NetworkInterfaceInstance)
 
     def delete(self, NetworkInterfaceId: str, *, DryRun: bool = False) -> None:
@@ -2919,10 +2750,9 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_network_interfaces(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeNetworkInterfacesResult(**_response)
+        response = self.parse(DescribeNetworkInterfacesResult, _response)
 
         if response and response.NetworkInterfaces:
-            self.sessionize(response.NetworkInterfaces[0])
             return response.NetworkInterfaces[0]
         return None
 
@@ -2951,33 +2781,18 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
             NetworkInterfaceIds: The network interface IDs.
             Filters: One or more filters.
         """
-        paginator = self.client.get_paginator("describe_network_interfaces")
         args: dict[str, Any] = dict(
             IncludeManagedResources=self.serialize(IncludeManagedResources),
             DryRun=self.serialize(DryRun),
             NetworkInterfaceIds=self.serialize(NetworkInterfaceIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_network_interfaces",
+            DescribeNetworkInterfacesResult,
+            "NetworkInterfaces",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeNetworkInterfacesResult(**_response)
-            if response.NetworkInterfaces:
-                results.extend(response.NetworkInterfaces)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def attach(
         self,
@@ -3024,13 +2839,12 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.attach_network_interface(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AttachNetworkInterfaceResult(**_response)
+        response = self.parse(AttachNetworkInterfaceResult, _response)
 
         results: "AttachNetworkInterfaceResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AttachNetworkInterfaceResult", results)
 
     def detach(
@@ -3116,13 +2930,12 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
         results: "builtins.list[NetworkInterfacePermission]" = []
 
         for _response in response_iterator:
-            response = DescribeNetworkInterfacePermissionsResult(**_response)
+            response = self.parse(DescribeNetworkInterfacePermissionsResult, _response)
             if response.NetworkInterfacePermissions is not None:
                 results.extend(response.NetworkInterfacePermissions)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[NetworkInterfacePermission]", results)
 
     def assign_private_ips(
@@ -3174,13 +2987,12 @@ class NetworkInterfaceManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.assign_private_ip_addresses(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssignPrivateIpAddressesResult(**_response)
+        response = self.parse(AssignPrivateIpAddressesResult, _response)
 
         results: "AssignPrivateIpAddressesResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssignPrivateIpAddressesResult", results)
 
     def unassign_private_ips(
@@ -3350,10 +3162,9 @@ class EC2InstanceTypeManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_instance_types(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeInstanceTypesResult(**_response)
+        response = self.parse(DescribeInstanceTypesResult, _response)
 
         if response and response.InstanceTypes:
-            self.sessionize(response.InstanceTypes[0])
             return response.InstanceTypes[0]
         return None
 
@@ -3385,33 +3196,18 @@ class EC2InstanceTypeManager(ReadonlyBoto3ModelManager):
                 types that are not supported in the current
                 Region, in addition to the supported types. Default: ``false``.
         """
-        paginator = self.client.get_paginator("describe_instance_types")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             InstanceTypes=self.serialize(InstanceTypes),
             Filters=self.serialize(Filters),
             IncludeUnsupportedInRegion=self.serialize(IncludeUnsupportedInRegion),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_instance_types",
+            DescribeInstanceTypesResult,
+            "InstanceTypes",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeInstanceTypesResult(**_response)
-            if response.InstanceTypes:
-                results.extend(response.InstanceTypes)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
@@ -3448,9 +3244,8 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_snapshot(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Snapshot(**_response)
+        response = self.parse(Snapshot, _response)
 
-        self.sessionize(response)
         return cast("Snapshot", response)
 
     def get(
@@ -3489,10 +3284,9 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_snapshots(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeSnapshotsResult(**_response)
+        response = self.parse(DescribeSnapshotsResult, _response)
 
         if response and response.Snapshots:
-            self.sessionize(response.Snapshots[0])
             return response.Snapshots[0]
         return None
 
@@ -3523,7 +3317,6 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
                 Otherwise, it is ``UnauthorizedOperation``.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_snapshots")
         args: dict[str, Any] = dict(
             OwnerIds=self.serialize(OwnerIds),
             RestorableByUserIds=self.serialize(RestorableByUserIds),
@@ -3531,26 +3324,9 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_snapshots", DescribeSnapshotsResult, "Snapshots", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeSnapshotsResult(**_response)
-            if response.Snapshots:
-                results.extend(response.Snapshots)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, SnapshotId: str, *, DryRun: bool = False) -> None:
         """
@@ -3603,13 +3379,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.enable_snapshot_block_public_access(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EnableSnapshotBlockPublicAccessResult(**_response)
+        response = self.parse(EnableSnapshotBlockPublicAccessResult, _response)
 
         results: Literal["block-all-sharing", "block-new-sharing", "unblocked"] = None
         if response is not None:
             results = response.State
 
-        self.sessionize(results)
         return cast(
             "Literal['block-all-sharing', 'block-new-sharing', 'unblocked']", results
         )
@@ -3634,13 +3409,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.disable_snapshot_block_public_access(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisableSnapshotBlockPublicAccessResult(**_response)
+        response = self.parse(DisableSnapshotBlockPublicAccessResult, _response)
 
         results: Literal["block-all-sharing", "block-new-sharing", "unblocked"] = None
         if response is not None:
             results = response.State
 
-        self.sessionize(results)
         return cast(
             "Literal['block-all-sharing', 'block-new-sharing', 'unblocked']", results
         )
@@ -3663,13 +3437,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.get_snapshot_block_public_access_state(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSnapshotBlockPublicAccessStateResult(**_response)
+        response = self.parse(GetSnapshotBlockPublicAccessStateResult, _response)
 
         results: Literal["block-all-sharing", "block-new-sharing", "unblocked"] = None
         if response is not None:
             results = response.State
 
-        self.sessionize(results)
         return cast(
             "Literal['block-all-sharing', 'block-new-sharing', 'unblocked']", results
         )
@@ -3725,13 +3498,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.lock_snapshot(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = LockSnapshotResult(**_response)
+        response = self.parse(LockSnapshotResult, _response)
 
         results: "LockSnapshotResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("LockSnapshotResult", results)
 
     def list_locked(
@@ -3773,13 +3545,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_locked_snapshots(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLockedSnapshotsResult(**_response)
+        response = self.parse(DescribeLockedSnapshotsResult, _response)
 
         results: "builtins.list[LockedSnapshotsInfo]" = None
         if response is not None:
             results = response.Snapshots
 
-        self.sessionize(results)
         return cast("builtins.list[LockedSnapshotsInfo]", results)
 
     def unlock(self, SnapshotId: str, *, DryRun: bool = False) -> str:
@@ -3804,13 +3575,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.unlock_snapshot(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UnlockSnapshotResult(**_response)
+        response = self.parse(UnlockSnapshotResult, _response)
 
         results: str = None
         if response is not None:
             results = response.SnapshotId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def copy(
@@ -3890,13 +3660,12 @@ class SnapshotManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.copy_snapshot(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CopySnapshotResult(**_response)
+        response = self.parse(CopySnapshotResult, _response)
 
         results: str = None
         if response is not None:
             results = response.SnapshotId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -3935,9 +3704,8 @@ class KeyPairManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_key_pair(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = KeyPair(**_response)
+        response = self.parse(KeyPair, _response)
 
-        self.sessionize(response)
         return cast("KeyPair", response)
 
     def get(
@@ -3966,10 +3734,9 @@ class KeyPairManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_key_pairs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeKeyPairsResult(**_response)
+        response = self.parse(DescribeKeyPairsResult, _response)
 
         if response and response.KeyPairs:
-            self.sessionize(response.KeyPairs[0])
             return response.KeyPairs[0]
         return None
 
@@ -4007,9 +3774,8 @@ class KeyPairManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_key_pairs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeKeyPairsResult(**_response)
+        response = self.parse(DescribeKeyPairsResult, _response)
         if response and response.KeyPairs:
-            self.sessionize(response.KeyPairs)
             return PrimaryBoto3ModelQuerySet(response.KeyPairs)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -4033,7 +3799,7 @@ class KeyPairManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_key_pair(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteKeyPairResult(**_response)
+        response = self.parse(DeleteKeyPairResult, _response)
         return response
 
     def import_key_pair(
@@ -4074,13 +3840,12 @@ class KeyPairManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.import_key_pair(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ImportKeyPairResult(**_response)
+        response = self.parse(ImportKeyPairResult, _response)
 
         results: "ImportKeyPairResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ImportKeyPairResult", results)
 
 
@@ -4113,9 +3878,8 @@ class PlacementGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_placement_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePlacementGroupResult(**_response)
+        response = self.parse(CreatePlacementGroupResult, _response)
 
-        self.sessionize(response.PlacementGroupInstance)
         return cast("PlacementGroup", response.PlacementGroupInstance)
 
     def get(self, GroupName: str, *, DryRun: bool = False) -> "PlacementGroup | None":
@@ -4138,10 +3902,9 @@ class PlacementGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_placement_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribePlacementGroupsResult(**_response)
+        response = self.parse(DescribePlacementGroupsResult, _response)
 
         if response and response.PlacementGroups:
-            self.sessionize(response.PlacementGroups[0])
             return response.PlacementGroups[0]
         return None
 
@@ -4175,9 +3938,8 @@ class PlacementGroupManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_placement_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribePlacementGroupsResult(**_response)
+        response = self.parse(DescribePlacementGroupsResult, _response)
         if response and response.PlacementGroups:
-            self.sessionize(response.PlacementGroups)
             return PrimaryBoto3ModelQuerySet(response.PlacementGroups)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -4233,9 +3995,8 @@ class DhcpOptionsManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_dhcp_options(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDhcpOptionsResult(**_response)
+        response = self.parse(CreateDhcpOptionsResult, _response)
 
-        self.sessionize(response.DhcpOptionsInstance)
         return cast("DhcpOptions", response.DhcpOptionsInstance)
 
     def get(self, DhcpOptionsId: str, *, DryRun: bool = False) -> "DhcpOptions | None":
@@ -4263,10 +4024,9 @@ class DhcpOptionsManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_dhcp_options(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDhcpOptionsResult(**_response)
+        response = self.parse(DescribeDhcpOptionsResult, _response)
 
         if response and response.DhcpOptions:
-            self.sessionize(response.DhcpOptions[0])
             return response.DhcpOptions[0]
         return None
 
@@ -4293,32 +4053,14 @@ class DhcpOptionsManager(EC2TagsManagerMixin, Boto3ModelManager):
                 Otherwise, it is ``UnauthorizedOperation``.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_dhcp_options")
         args: dict[str, Any] = dict(
             DhcpOptionsIds=self.serialize(DhcpOptionsIds),
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_dhcp_options", DescribeDhcpOptionsResult, "DhcpOptions", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeDhcpOptionsResult(**_response)
-            if response.DhcpOptions:
-                results.extend(response.DhcpOptions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, DhcpOptionsId: str, *, DryRun: bool = False) -> None:
         """
@@ -4378,9 +4120,8 @@ class CustomerGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_customer_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCustomerGatewayResult(**_response)
+        response = self.parse(CreateCustomerGatewayResult, _response)
 
-        self.sessionize(response.CustomerGatewayInstance)
         return cast("CustomerGateway", response.CustomerGatewayInstance)
 
     def get(
@@ -4406,10 +4147,9 @@ class CustomerGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_customer_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeCustomerGatewaysResult(**_response)
+        response = self.parse(DescribeCustomerGatewaysResult, _response)
 
         if response and response.CustomerGateways:
-            self.sessionize(response.CustomerGateways[0])
             return response.CustomerGateways[0]
         return None
 
@@ -4440,9 +4180,8 @@ class CustomerGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_customer_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeCustomerGatewaysResult(**_response)
+        response = self.parse(DescribeCustomerGatewaysResult, _response)
         if response and response.CustomerGateways:
-            self.sessionize(response.CustomerGateways)
             return PrimaryBoto3ModelQuerySet(response.CustomerGateways)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -4497,9 +4236,8 @@ class VpnGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_vpn_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVpnGatewayResult(**_response)
+        response = self.parse(CreateVpnGatewayResult, _response)
 
-        self.sessionize(response.VpnGatewayInstance)
         return cast("VpnGateway", response.VpnGatewayInstance)
 
     def get(self, VpnGatewayId: str, *, DryRun: bool = False) -> "VpnGateway | None":
@@ -4522,10 +4260,9 @@ class VpnGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpn_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpnGatewaysResult(**_response)
+        response = self.parse(DescribeVpnGatewaysResult, _response)
 
         if response and response.VpnGateways:
-            self.sessionize(response.VpnGateways[0])
             return response.VpnGateways[0]
         return None
 
@@ -4556,9 +4293,8 @@ class VpnGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpn_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpnGatewaysResult(**_response)
+        response = self.parse(DescribeVpnGatewaysResult, _response)
         if response and response.VpnGateways:
-            self.sessionize(response.VpnGateways)
             return PrimaryBoto3ModelQuerySet(response.VpnGateways)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -4614,13 +4350,12 @@ class VpnGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.attach_vpn_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AttachVpnGatewayResult(**_response)
+        response = self.parse(AttachVpnGatewayResult, _response)
 
         results: "EC2VpcAttachment" = None
         if response is not None:
             results = response.VpcAttachment
 
-        self.sessionize(results)
         return cast("EC2VpcAttachment", results)
 
     def detach(self, VpcId: str, VpnGatewayId: str, *, DryRun: bool = False) -> None:
@@ -4677,9 +4412,8 @@ class InternetGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_internet_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateInternetGatewayResult(**_response)
+        response = self.parse(CreateInternetGatewayResult, _response)
 
-        self.sessionize(response.InternetGatewayInstance)
         return cast("InternetGateway", response.InternetGatewayInstance)
 
     def get(
@@ -4709,10 +4443,9 @@ class InternetGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_internet_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeInternetGatewaysResult(**_response)
+        response = self.parse(DescribeInternetGatewaysResult, _response)
 
         if response and response.InternetGateways:
-            self.sessionize(response.InternetGateways[0])
             return response.InternetGateways[0]
         return None
 
@@ -4739,32 +4472,17 @@ class InternetGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
             InternetGatewayIds: The IDs of the internet gateways.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_internet_gateways")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             InternetGatewayIds=self.serialize(InternetGatewayIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_internet_gateways",
+            DescribeInternetGatewaysResult,
+            "InternetGateways",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeInternetGatewaysResult(**_response)
-            if response.InternetGateways:
-                results.extend(response.InternetGateways)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, InternetGatewayId: str, *, DryRun: bool = False) -> None:
         """
@@ -4890,9 +4608,8 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_volume(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Volume(**_response)
+        response = self.parse(Volume, _response)
 
-        self.sessionize(response)
         return cast("Volume", response)
 
     def get(
@@ -4928,10 +4645,9 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_volumes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVolumesResult(**_response)
+        response = self.parse(DescribeVolumesResult, _response)
 
         if response and response.Volumes:
-            self.sessionize(response.Volumes[0])
             return response.Volumes[0]
         return None
 
@@ -4961,33 +4677,13 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
                 Otherwise, it is ``UnauthorizedOperation``.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_volumes")
         args: dict[str, Any] = dict(
             VolumeIds=self.serialize(VolumeIds),
             IncludeManagedResources=self.serialize(IncludeManagedResources),
             DryRun=self.serialize(DryRun),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeVolumesResult(**_response)
-            if response.Volumes:
-                results.extend(response.Volumes)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_volumes", DescribeVolumesResult, "Volumes", args)
 
     def delete(self, VolumeId: str, *, DryRun: bool = False) -> None:
         """
@@ -5046,9 +4742,8 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.modify_volume(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyVolumeResult(**_response)
+        response = self.parse(ModifyVolumeResult, _response)
 
-        self.sessionize(response.VolumeModification)
         return cast("EC2VolumeModification", response.VolumeModification)
 
     def attach(
@@ -5090,13 +4785,12 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.attach_volume(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = VolumeAttachment(**_response)
+        response = self.parse(VolumeAttachment, _response)
 
         results: "VolumeAttachment" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("VolumeAttachment", results)
 
     def detach(
@@ -5153,13 +4847,12 @@ class VolumeManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.detach_volume(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = VolumeAttachment(**_response)
+        response = self.parse(VolumeAttachment, _response)
 
         results: "VolumeAttachment" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("VolumeAttachment", results)
 
 
@@ -5195,9 +4888,8 @@ class RouteTableManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_route_table(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRouteTableResult(**_response)
+        response = self.parse(CreateRouteTableResult, _response)
 
-        self.sessionize(response.RouteTableInstance)
         return cast("RouteTable", response.RouteTableInstance)
 
     def get(self, RouteTableId: str, *, DryRun: bool = False) -> "RouteTable | None":
@@ -5224,10 +4916,9 @@ class RouteTableManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_route_tables(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeRouteTablesResult(**_response)
+        response = self.parse(DescribeRouteTablesResult, _response)
 
         if response and response.RouteTables:
-            self.sessionize(response.RouteTables[0])
             return response.RouteTables[0]
         return None
 
@@ -5254,32 +4945,14 @@ class RouteTableManager(EC2TagsManagerMixin, Boto3ModelManager):
             RouteTableIds: The IDs of the route tables.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_route_tables")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             RouteTableIds=self.serialize(RouteTableIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_route_tables", DescribeRouteTablesResult, "RouteTables", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeRouteTablesResult(**_response)
-            if response.RouteTables:
-                results.extend(response.RouteTables)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, RouteTableId: str, *, DryRun: bool = False) -> None:
         """
@@ -5388,13 +5061,12 @@ class RouteTableManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_route(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRouteResult(**_response)
+        response = self.parse(CreateRouteResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
     def delete_route(
@@ -5557,13 +5229,12 @@ class RouteTableManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.associate_route_table(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssociateRouteTableResult(**_response)
+        response = self.parse(AssociateRouteTableResult, _response)
 
         results: "AssociateRouteTableResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssociateRouteTableResult", results)
 
     def disassociate(self, AssociationId: str, *, DryRun: bool = False) -> None:
@@ -5666,9 +5337,8 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_nat_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateNatGatewayResult(**_response)
+        response = self.parse(CreateNatGatewayResult, _response)
 
-        self.sessionize(response.NatGatewayInstance)
         return cast("NatGateway", response.NatGatewayInstance)
 
     def get(
@@ -5704,10 +5374,9 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_nat_gateways(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeNatGatewaysResult(**_response)
+        response = self.parse(DescribeNatGatewaysResult, _response)
 
         if response and response.NatGateways:
-            self.sessionize(response.NatGateways[0])
             return response.NatGateways[0]
         return None
 
@@ -5734,32 +5403,14 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
             Filter: The filters.
             NatGatewayIds: The IDs of the NAT gateways.
         """
-        paginator = self.client.get_paginator("describe_nat_gateways")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             Filter=self.serialize(Filter),
             NatGatewayIds=self.serialize(NatGatewayIds),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_nat_gateways", DescribeNatGatewaysResult, "NatGateways", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeNatGatewaysResult(**_response)
-            if response.NatGateways:
-                results.extend(response.NatGateways)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, NatGatewayId: str, *, DryRun: bool = False) -> "NatGateway":
         """
@@ -5786,7 +5437,7 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_nat_gateway(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteNatGatewayResult(**_response)
+        response = self.parse(DeleteNatGatewayResult, _response)
         return response
 
     def associate_address(
@@ -5842,13 +5493,12 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.associate_nat_gateway_address(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssociateNatGatewayAddressResult(**_response)
+        response = self.parse(AssociateNatGatewayAddressResult, _response)
 
         results: "AssociateNatGatewayAddressResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssociateNatGatewayAddressResult", results)
 
     def disassociate_address(
@@ -5890,13 +5540,12 @@ class NatGatewayManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.disassociate_nat_gateway_address(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisassociateNatGatewayAddressResult(**_response)
+        response = self.parse(DisassociateNatGatewayAddressResult, _response)
 
         results: "DisassociateNatGatewayAddressResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DisassociateNatGatewayAddressResult", results)
 
 
@@ -5928,9 +5577,8 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_vpc_peering_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVpcPeeringConnectionResult(**_response)
+        response = self.parse(CreateVpcPeeringConnectionResult, _response)
 
-        self.sessionize(response.VpcPeeringConnectionInstance)
         return cast("VpcPeeringConnection", response.VpcPeeringConnectionInstance)
 
     def get(
@@ -5961,10 +5609,9 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpc_peering_connections(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcPeeringConnectionsResult(**_response)
+        response = self.parse(DescribeVpcPeeringConnectionsResult, _response)
 
         if response and response.VpcPeeringConnections:
-            self.sessionize(response.VpcPeeringConnections[0])
             return response.VpcPeeringConnections[0]
         return None
 
@@ -5992,32 +5639,17 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
             VpcPeeringConnectionIds: The IDs of the VPC peering connections.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_vpc_peering_connections")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             VpcPeeringConnectionIds=self.serialize(VpcPeeringConnectionIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_vpc_peering_connections",
+            DescribeVpcPeeringConnectionsResult,
+            "VpcPeeringConnections",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeVpcPeeringConnectionsResult(**_response)
-            if response.VpcPeeringConnections:
-                results.extend(response.VpcPeeringConnections)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def accept(
         self, VpcPeeringConnectionId: str, *, DryRun: bool = False
@@ -6048,13 +5680,12 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.accept_vpc_peering_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AcceptVpcPeeringConnectionResult(**_response)
+        response = self.parse(AcceptVpcPeeringConnectionResult, _response)
 
         results: "VpcPeeringConnection" = None
         if response is not None:
             results = response.VpcPeeringConnectionInstance
 
-        self.sessionize(results)
         return cast("VpcPeeringConnection", results)
 
     def reject(self, VpcPeeringConnectionId: str, *, DryRun: bool = False) -> bool:
@@ -6085,13 +5716,12 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.reject_vpc_peering_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RejectVpcPeeringConnectionResult(**_response)
+        response = self.parse(RejectVpcPeeringConnectionResult, _response)
 
         results: bool = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool", results)
 
     def delete(
@@ -6124,7 +5754,7 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_vpc_peering_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteVpcPeeringConnectionResult(**_response)
+        response = self.parse(DeleteVpcPeeringConnectionResult, _response)
         return response
 
     def modify_options(
@@ -6166,13 +5796,12 @@ class VpcPeeringConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.modify_vpc_peering_connection_options(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyVpcPeeringConnectionOptionsResult(**_response)
+        response = self.parse(ModifyVpcPeeringConnectionOptionsResult, _response)
 
         results: "ModifyVpcPeeringConnectionOptionsResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ModifyVpcPeeringConnectionOptionsResult", results)
 
 
@@ -6235,9 +5864,8 @@ class EC2VpcEndpointManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_vpc_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVpcEndpointResult(**_response)
+        response = self.parse(CreateVpcEndpointResult, _response)
 
-        self.sessionize(response.VpcEndpointInstance)
         return cast("EC2VpcEndpoint", response.VpcEndpointInstance)
 
     def get(
@@ -6267,10 +5895,9 @@ class EC2VpcEndpointManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpc_endpoints(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcEndpointsResult(**_response)
+        response = self.parse(DescribeVpcEndpointsResult, _response)
 
         if response and response.VpcEndpoints:
-            self.sessionize(response.VpcEndpoints[0])
             return response.VpcEndpoints[0]
         return None
 
@@ -6297,32 +5924,14 @@ class EC2VpcEndpointManager(EC2TagsManagerMixin, Boto3ModelManager):
             VpcEndpointIds: The IDs of the VPC endpoints.
             Filters: The filters.
         """
-        paginator = self.client.get_paginator("describe_vpc_endpoints")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             VpcEndpointIds=self.serialize(VpcEndpointIds),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_vpc_endpoints", DescribeVpcEndpointsResult, "VpcEndpoints", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeVpcEndpointsResult(**_response)
-            if response.VpcEndpoints:
-                results.extend(response.VpcEndpoints)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(
         self, VpcEndpointId: str, *, DryRun: bool = False
@@ -6347,7 +5956,7 @@ class EC2VpcEndpointManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.delete_vpc_endpoints(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteVpcEndpointsResult(**_response)
+        response = self.parse(DeleteVpcEndpointsResult, _response)
         return response
 
     def modify(
@@ -6431,13 +6040,12 @@ class EC2VpcEndpointManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.modify_vpc_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyVpcEndpointResult(**_response)
+        response = self.parse(ModifyVpcEndpointResult, _response)
 
         results: bool | None = None
         if response is not None:
             results = response.Return
 
-        self.sessionize(results)
         return cast("bool | None", results)
 
 
@@ -6479,9 +6087,8 @@ class VpnConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.create_vpn_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVpnConnectionResult(**_response)
+        response = self.parse(CreateVpnConnectionResult, _response)
 
-        self.sessionize(response.VpnConnectionInstance)
         return cast("VpnConnection", response.VpnConnectionInstance)
 
     def get(
@@ -6507,10 +6114,9 @@ class VpnConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpn_connections(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpnConnectionsResult(**_response)
+        response = self.parse(DescribeVpnConnectionsResult, _response)
 
         if response and response.VpnConnections:
-            self.sessionize(response.VpnConnections[0])
             return response.VpnConnections[0]
         return None
 
@@ -6541,9 +6147,8 @@ class VpnConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.describe_vpn_connections(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpnConnectionsResult(**_response)
+        response = self.parse(DescribeVpnConnectionsResult, _response)
         if response and response.VpnConnections:
-            self.sessionize(response.VpnConnections)
             return PrimaryBoto3ModelQuerySet(response.VpnConnections)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -6609,13 +6214,12 @@ class VpnConnectionManager(EC2TagsManagerMixin, Boto3ModelManager):
         _response = self.client.modify_vpn_connection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyVpnConnectionResult(**_response)
+        response = self.parse(ModifyVpnConnectionResult, _response)
 
         results: "VpnConnection" = None
         if response is not None:
             results = response.VpnConnectionInstance
 
-        self.sessionize(results)
         return cast("VpnConnection", results)
 
 
@@ -6662,9 +6266,8 @@ class FlowLogManager(Boto3ModelManager):
         _response = self.client.create_flow_logs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFlowLogsResult(**_response)
+        response = self.parse(CreateFlowLogsResult, _response)
 
-        self.sessionize(response)
         return cast("CreateFlowLogsResult", response)
 
     def delete(self, FlowLogId: str, *, DryRun: bool = False) -> "DeleteFlowLogsResult":
@@ -6687,7 +6290,7 @@ class FlowLogManager(Boto3ModelManager):
         _response = self.client.delete_flow_logs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteFlowLogsResult(**_response)
+        response = self.parse(DeleteFlowLogsResult, _response)
         return response
 
     def get(self, FlowLogId: str, *, DryRun: bool = False) -> "FlowLog | None":
@@ -6710,10 +6313,9 @@ class FlowLogManager(Boto3ModelManager):
         _response = self.client.describe_flow_logs(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeFlowLogsResult(**_response)
+        response = self.parse(DescribeFlowLogsResult, _response)
 
         if response and response.FlowLogs:
-            self.sessionize(response.FlowLogs[0])
             return response.FlowLogs[0]
         return None
 
@@ -6736,32 +6338,14 @@ class FlowLogManager(Boto3ModelManager):
             Filter: One or more filters.
             FlowLogIds: One or more flow log IDs.
         """
-        paginator = self.client.get_paginator("describe_flow_logs")
         args: dict[str, Any] = dict(
             DryRun=self.serialize(DryRun),
             Filter=self.serialize(Filter),
             FlowLogIds=self.serialize(FlowLogIds),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_flow_logs", DescribeFlowLogsResult, "FlowLogs", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeFlowLogsResult(**_response)
-            if response.FlowLogs:
-                results.extend(response.FlowLogs)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -7095,7 +6679,7 @@ class Vpc(TagsDictMixin, VpcModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -7117,7 +6701,7 @@ class Vpc(TagsDictMixin, VpcModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def network_acls(self) -> "list[NetworkAcl] | None":
@@ -7139,7 +6723,7 @@ class Vpc(TagsDictMixin, VpcModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return NetworkAcl.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(NetworkAcl).list(**pk)  # type: ignore[arg-type]
 
 
 class SubnetCidrBlockState(Boto3Model):
@@ -7425,7 +7009,7 @@ class Subnet(TagsDictMixin, SubnetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def instances(self) -> "list[Instance] | None":
@@ -7447,7 +7031,7 @@ class Subnet(TagsDictMixin, SubnetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Instance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).list(**pk)  # type: ignore[arg-type]
 
 
 class UserIdGroupPair(Boto3Model):
@@ -7695,7 +7279,7 @@ class SecurityGroup(TagsDictMixin, SecurityGroupModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 class NetworkAclAssociation(Boto3Model):
     """
     Describes an association between a network ACL and a subnet.
@@ -7890,7 +7474,7 @@ class NetworkAcl(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -7914,7 +7498,7 @@ class NetworkAcl(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
 
 class ProductCode(Boto3Model):
@@ -8409,7 +7993,7 @@ before that usage is reported.
             )
         except AttributeError:
             return []
-        return Instance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def snapshot(self) -> "Snapshot | None":
@@ -8431,7 +8015,7 @@ before that usage is reported.
             )
         except AttributeError:
             return None
-        return Snapshot.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Snapshot).get(**pk)  # type: ignore[arg-type]
 
     def enable_deregistration_protection(self) -> "str":
         """
@@ -9754,7 +9338,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AMI.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AMI).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def vpc(self) -> "Vpc | None":
         """
@@ -9775,7 +9359,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnet(self) -> "Subnet | None":
@@ -9797,7 +9381,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Subnet.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -9825,7 +9409,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def network_interfaces(self) -> "list[NetworkInterface] | None":
@@ -9849,7 +9433,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return NetworkInterface.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(NetworkInterface).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def instance_type(self) -> "EC2InstanceType | None":
@@ -9871,7 +9455,7 @@ class Instance(TagsDictMixin, InstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return EC2InstanceType.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(EC2InstanceType).get(**pk)  # type: ignore[arg-type]
 
     def start(
         self, DryRun: bool = False
@@ -10061,7 +9645,7 @@ class LaunchTemplate(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return LaunchTemplateVersion.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchTemplateVersion).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def default_version(self) -> "LaunchTemplateVersion | None":
@@ -10085,7 +9669,7 @@ class LaunchTemplate(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return LaunchTemplateVersion.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchTemplateVersion).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def latest_version(self) -> "LaunchTemplateVersion | None":
         """
@@ -10108,7 +9692,7 @@ class LaunchTemplate(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return LaunchTemplateVersion.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchTemplateVersion).get(**pk)  # type: ignore[arg-type]
 
 
 class LaunchTemplateIamInstanceProfileSpecification(Boto3Model):
@@ -11626,7 +11210,7 @@ class LaunchTemplateVersion(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AMI.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AMI).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def instance_type(self) -> "EC2InstanceType | None":
         """
@@ -11647,7 +11231,7 @@ class LaunchTemplateVersion(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return EC2InstanceType.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(EC2InstanceType).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def launch_template(self) -> "LaunchTemplate | None":
@@ -11670,7 +11254,7 @@ class LaunchTemplateVersion(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return LaunchTemplate.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LaunchTemplate).get(**pk)  # type: ignore[arg-type]
 
 class NetworkInterfaceAssociation(Boto3Model):
     """
@@ -12246,7 +11830,7 @@ class NetworkInterface(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Subnet.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -12274,7 +11858,7 @@ class NetworkInterface(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     def reset(
         self, DryRun: bool = False, SourceDestCheck: "str | None" = None
@@ -13342,7 +12926,7 @@ class EC2InstanceType(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Instance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).list(**pk)  # type: ignore[arg-type]
 
 
 class TagSpecification(TagsDictMixin, Boto3Model):
@@ -13579,7 +13163,7 @@ class Snapshot(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return AMI.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AMI).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def instances(self) -> "list[Instance] | None":
@@ -13606,7 +13190,7 @@ class Snapshot(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Instance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).list(**pk)  # type: ignore[arg-type]
     def copy(self) -> "str":
         """
         Copy the snapshot.
@@ -59,9 +59,8 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.create_repository(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRepositoryResponse(**_response)
+        response = self.parse(CreateRepositoryResponse, _response)
 
-        self.sessionize(response.repository)
         return cast("Repository", response.repository)
 
     def delete(
@@ -93,7 +92,7 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.delete_repository(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteRepositoryResponse(**_response)
+        response = self.parse(DeleteRepositoryResponse, _response)
         return cast("Repository", response.repository)
 
     @repo_get_add_tags
@@ -128,10 +127,9 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.describe_repositories(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeRepositoriesResponse(**_response)
+        response = self.parse(DescribeRepositoriesResponse, _response)
 
         if response and response.repositories:
-            self.sessionize(response.repositories[0])
             return response.repositories[0]
         return None
 
@@ -158,31 +156,13 @@ class RepositoryManager(Boto3ModelManager):
                 retrieve because they need a second, slow
                 API call, so you have to request them specifically.
         """
-        paginator = self.client.get_paginator("describe_repositories")
         args: dict[str, Any] = dict(
             registryId=self.serialize(registryId),
             repositoryNames=self.serialize(repositoryNames),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_repositories", DescribeRepositoriesResponse, "repositories", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeRepositoriesResponse(**_response)
-            if response.repositories:
-                results.extend(response.repositories)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @repo_list_images_ecr_images_only
     def list_images(
@@ -219,13 +199,12 @@ class RepositoryManager(Boto3ModelManager):
         results: "builtins.list[ImageIdentifier]" = []
 
         for _response in response_iterator:
-            response = ListImagesResponse(**_response)
+            response = self.parse(ListImagesResponse, _response)
             if response.imageIds is not None:
                 results.extend(response.imageIds)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[ImageIdentifier]", results)
 
     def get_images(
@@ -259,13 +238,12 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.batch_get_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetImageResponse(**_response)
+        response = self.parse(BatchGetImageResponse, _response)
 
         results: "list[ECRImage] | None" = None
         if response is not None:
             results = response.images
 
-        self.sessionize(results)
         return cast("list[ECRImage] | None", results)
 
     def get_image(
@@ -298,13 +276,12 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.batch_get_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetImageResponse(**_response)
+        response = self.parse(BatchGetImageResponse, _response)
 
         results: "ECRImage" = None
         if response is not None:
             results = response.images[0]
 
-        self.sessionize(results)
         return cast("ECRImage", results)
 
     def get_tags(self, resourceArn: str) -> "builtins.list[Tag]":
@@ -320,18 +297,20 @@ class RepositoryManager(Boto3ModelManager):
         _response = self.client.list_tags_for_resource(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListTagsForResourceResponse(**_response)
+        response = self.parse(ListTagsForResourceResponse, _response)
 
         results: "builtins.list[Tag]" = None
         if response is not None:
             results = response.tags
 
-        self.sessionize(results)
         return cast("builtins.list[Tag]", results)
 
 
 class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
     service_name: str = "ecr"
+    get_many_operation: ClassVar[str] = "batch_get_image"
+    get_many_arg: ClassVar[tuple[str, str]] = ("imageId", "imageIds")
+    get_many_batch_size: ClassVar[int] = 100
 
     def get(
         self,
@@ -363,10 +342,9 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
         _response = self.client.batch_get_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetImageResponse(**_response)
+        response = self.parse(BatchGetImageResponse, _response)
 
         if response and response.images:
-            self.sessionize(response.images[0])
             return response.images[0]
         return None
 
@@ -400,9 +378,8 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
         _response = self.client.batch_get_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetImageResponse(**_response)
+        response = self.parse(BatchGetImageResponse, _response)
 
-        self.sessionize(response)
         return response
 
     @image_list_images_ecr_images_only
@@ -419,30 +396,10 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
             filter: The filter key and value with which to filter your ``ListImages``
                 results.
         """
-        paginator = self.client.get_paginator("list_images")
         args: dict[str, Any] = dict(
             repositoryName=self.serialize(repositoryName), filter=self.serialize(filter)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListImagesResponse(**_response)
-            if response.imageIds:
-                results.extend(response.imageIds)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_images", ListImagesResponse, "imageIds", args)
 
     def delete(
         self, repositoryName: str, imageId: "ImageIdentifier"
@@ -465,7 +422,7 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
         _response = self.client.batch_delete_image(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchDeleteImageResponse(**_response)
+        response = self.parse(BatchDeleteImageResponse, _response)
         return response
 
     def replication_status(
@@ -486,13 +443,12 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
         _response = self.client.describe_image_replication_status(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeImageReplicationStatusResponse(**_response)
+        response = self.parse(DescribeImageReplicationStatusResponse, _response)
 
         results: "DescribeImageReplicationStatusResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DescribeImageReplicationStatusResponse", results)
 
     def scan_findings(
@@ -541,13 +497,12 @@ class ECRImageManager(ECRImageManagerMixin, Boto3ModelManager):
         _response = self.client.describe_image_scan_findings(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeImageScanFindingsResponse(**_response)
+        response = self.parse(DescribeImageScanFindingsResponse, _response)
 
         results: "list[DescribeImageScanFindingsResponse]" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("list[DescribeImageScanFindingsResponse]", results)
 
 
@@ -818,7 +773,7 @@ class ECRImage(ECRImageMixin, ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Repository.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Repository).get(**pk)  # type: ignore[arg-type]
 
     def replication_status(self) -> "DescribeImageReplicationStatusResponse":
         """
@@ -58,6 +58,9 @@ from datetime import datetime
 
 class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_capacity_providers"
+    get_many_arg: ClassVar[tuple[str, str]] = ("capacityProvider", "capacityProviders")
+    get_many_batch_size: ClassVar[int] = 100
 
     def create(self, model: "CapacityProvider") -> "CapacityProvider":
         """
@@ -83,9 +86,8 @@ class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
         _response = self.client.create_capacity_provider(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCapacityProviderResponse(**_response)
+        response = self.parse(CreateCapacityProviderResponse, _response)
 
-        self.sessionize(response.capacityProvider)
         return cast("CapacityProvider", response.capacityProvider)
 
     def get(
@@ -120,10 +122,9 @@ class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
         _response = self.client.describe_capacity_providers(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeCapacityProvidersResponse(**_response)
+        response = self.parse(DescribeCapacityProvidersResponse, _response)
 
         if response and response.capacityProviders:
-            self.sessionize(response.capacityProviders[0])
             return response.capacityProviders[0]
         return None
 
@@ -175,15 +176,14 @@ class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
             maxResults=self.serialize(maxResults),
             nextToken=self.serialize(nextToken),
         )
-        _response = self.client.describe_capacity_providers(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_capacity_providers",
+            DescribeCapacityProvidersResponse,
+            "capacityProviders",
+            args,
+            batch_arg="capacityProviders",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeCapacityProvidersResponse(**_response)
-
-        if response.capacityProviders:
-            self.sessionize(response.capacityProviders)
-            return PrimaryBoto3ModelQuerySet(response.capacityProviders)
-        return PrimaryBoto3ModelQuerySet([])
 
     def update(self, model: "CapacityProvider") -> "CapacityProvider":
         """
@@ -202,9 +202,8 @@ class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
         _response = self.client.update_capacity_provider(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateCapacityProviderResponse(**_response)
+        response = self.parse(UpdateCapacityProviderResponse, _response)
 
-        self.sessionize(response.capacityProvider)
         return cast("CapacityProvider", response.capacityProvider)
 
     def delete(
@@ -230,12 +229,15 @@ class CapacityProviderManager(CapacityProviderManagerMixin, Boto3ModelManager):
         _response = self.client.delete_capacity_provider(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteCapacityProviderResponse(**_response)
+        response = self.parse(DeleteCapacityProviderResponse, _response)
         return cast("CapacityProvider", response.capacityProvider)
 
 
 class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_services"
+    get_many_arg: ClassVar[tuple[str, str]] = ("service", "services")
+    get_many_batch_size: ClassVar[int] = 10
 
     def create(
         self,
@@ -298,9 +300,8 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
         _response = self.client.create_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateServiceResponse(**_response)
+        response = self.parse(CreateServiceResponse, _response)
 
-        self.sessionize(response.service)
         return cast("Service", response.service)
 
     def delete(
@@ -328,7 +329,7 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
         _response = self.client.delete_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteServiceResponse(**_response)
+        response = self.parse(DeleteServiceResponse, _response)
         return cast("Service", response.service)
 
     def get(
@@ -364,10 +365,9 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
         _response = self.client.describe_services(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeServicesResponse(**_response)
+        response = self.parse(DescribeServicesResponse, _response)
 
         if response and response.services:
-            self.sessionize(response.services[0])
             return response.services[0]
         return None
 
@@ -401,15 +401,14 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
             cluster=self.serialize(cluster),
             include=self.serialize(include),
         )
-        _response = self.client.describe_services(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_services",
+            DescribeServicesResponse,
+            "services",
+            args,
+            batch_arg="services",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeServicesResponse(**_response)
-
-        if response.services:
-            self.sessionize(response.services)
-            return PrimaryBoto3ModelQuerySet(response.services)
-        return PrimaryBoto3ModelQuerySet([])
 
     @ecs_services_only
     def list(
@@ -436,33 +435,13 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
                     resourceManagementType: The resourceManagementType type to use when
                         filtering the ``ListServices`` results.
         """
-        paginator = self.client.get_paginator("list_services")
         args: dict[str, Any] = dict(
             cluster=self.serialize(cluster),
             launchType=self.serialize(launchType),
             schedulingStrategy=self.serialize(schedulingStrategy),
             resourceManagementType=self.serialize(resourceManagementType),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListServicesResponse(**_response)
-            if response.serviceArns:
-                results.extend(response.serviceArns)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_services", ListServicesResponse, "serviceArns", args)
 
     def update(
         self,
@@ -529,9 +508,8 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
         _response = self.client.update_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateServiceResponse(**_response)
+        response = self.parse(UpdateServiceResponse, _response)
 
-        self.sessionize(response.service)
         return cast("Service", response.service)
 
     def partial_update(
@@ -681,14 +659,16 @@ class ServiceManager(ECSServiceManagerMixin, Boto3ModelManager):
         _response = self.client.update_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateServiceResponse(**_response)
+        response = self.parse(UpdateServiceResponse, _response)
 
-        self.sessionize(response.service)
         return cast("Service", response.service)
 
 
 class ClusterManager(Boto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_clusters"
+    get_many_arg: ClassVar[tuple[str, str]] = ("cluster", "clusters")
+    get_many_batch_size: ClassVar[int] = 100
 
     def create(self, model: "Cluster") -> "Cluster":
         """
@@ -710,9 +690,8 @@ class ClusterManager(Boto3ModelManager):
         _response = self.client.create_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateClusterResponse(**_response)
+        response = self.parse(CreateClusterResponse, _response)
 
-        self.sessionize(response.cluster)
         return cast("Cluster", response.cluster)
 
     def delete(self, cluster: str) -> "Cluster":
@@ -727,7 +706,7 @@ class ClusterManager(Boto3ModelManager):
         _response = self.client.delete_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteClusterResponse(**_response)
+        response = self.parse(DeleteClusterResponse, _response)
         return cast("Cluster", response.cluster)
 
     def get(
@@ -760,10 +739,9 @@ class ClusterManager(Boto3ModelManager):
         _response = self.client.describe_clusters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeClustersResponse(**_response)
+        response = self.parse(DescribeClustersResponse, _response)
 
         if response and response.clusters:
-            self.sessionize(response.clusters[0])
             return response.clusters[0]
         return None
 
@@ -793,15 +771,14 @@ class ClusterManager(Boto3ModelManager):
         args: dict[str, Any] = dict(
             clusters=self.serialize(clusters), include=self.serialize(include)
         )
-        _response = self.client.describe_clusters(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_clusters",
+            DescribeClustersResponse,
+            "clusters",
+            args,
+            batch_arg="clusters",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeClustersResponse(**_response)
-
-        if response.clusters:
-            self.sessionize(response.clusters)
-            return PrimaryBoto3ModelQuerySet(response.clusters)
-        return PrimaryBoto3ModelQuerySet([])
 
     @ecs_clusters_only
     def list(
@@ -810,28 +787,8 @@ class ClusterManager(Boto3ModelManager):
         """
         Returns a list of existing clusters.
         """
-        paginator = self.client.get_paginator("list_clusters")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListClustersResponse(**_response)
-            if response.clusterArns:
-                results.extend(response.clusterArns)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_clusters", ListClustersResponse, "clusterArns", args)
 
     def update(self, model: "Cluster") -> "Cluster":
         """
@@ -850,9 +807,8 @@ class ClusterManager(Boto3ModelManager):
         _response = self.client.update_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateClusterResponse(**_response)
+        response = self.parse(UpdateClusterResponse, _response)
 
-        self.sessionize(response.cluster)
         return cast("Cluster", response.cluster)
 
     def partial_update(
@@ -891,9 +847,8 @@ class ClusterManager(Boto3ModelManager):
         _response = self.client.update_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateClusterResponse(**_response)
+        response = self.parse(UpdateClusterResponse, _response)
 
-        self.sessionize(response.cluster)
         return cast("Cluster", response.cluster)
 
 
@@ -945,9 +900,8 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         _response = self.client.register_task_definition(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RegisterTaskDefinitionResponse(**_response)
+        response = self.parse(RegisterTaskDefinitionResponse, _response)
 
-        self.sessionize(response.taskDefinition)
         return cast("TaskDefinition", response.taskDefinition)
 
     @ecs_task_definition_delete_all
@@ -964,7 +918,7 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         _response = self.client.delete_task_definitions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteTaskDefinitionsResponse(**_response)
+        response = self.parse(DeleteTaskDefinitionsResponse, _response)
         return response
 
     @ecs_task_definition_include_tags
@@ -1000,10 +954,9 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         _response = self.client.describe_task_definition(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTaskDefinitionResponse(**_response)
+        response = self.parse(DescribeTaskDefinitionResponse, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1042,32 +995,17 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
                 family name and revision. This is so that the newest task definitions in
                 a family are listed first.
         """
-        paginator = self.client.get_paginator("list_task_definitions")
         args: dict[str, Any] = dict(
             familyPrefix=self.serialize(familyPrefix),
             status=self.serialize(status),
             sort=self.serialize(sort),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_task_definitions",
+            ListTaskDefinitionsResponse,
+            "taskDefinitionArns",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTaskDefinitionsResponse(**_response)
-            if response.taskDefinitionArns:
-                results.extend(response.taskDefinitionArns)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self, model: "TaskDefinition", tags: "builtins.list[ECSTag] | None" = None
@@ -1114,9 +1052,8 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         _response = self.client.register_task_definition(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RegisterTaskDefinitionResponse(**_response)
+        response = self.parse(RegisterTaskDefinitionResponse, _response)
 
-        self.sessionize(response.taskDefinition)
         return cast("TaskDefinition", response.taskDefinition)
 
     def deregister(self, taskDefinition: str) -> "TaskDefinition":
@@ -1141,13 +1078,12 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         _response = self.client.deregister_task_definition(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeregisterTaskDefinitionResponse(**_response)
+        response = self.parse(DeregisterTaskDefinitionResponse, _response)
 
         results: "TaskDefinition" = None
         if response is not None:
             results = response.taskDefinition
 
-        self.sessionize(results)
         return cast("TaskDefinition", results)
 
     def families(
@@ -1190,18 +1126,20 @@ class TaskDefinitionManager(TaskDefinitionManagerMixin, Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListTaskDefinitionFamiliesResponse(**_response)
+            response = self.parse(ListTaskDefinitionFamiliesResponse, _response)
             if response.families is not None:
                 results.extend(response.families)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
 
 class ContainerInstanceManager(ReadonlyBoto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_container_instances"
+    get_many_arg: ClassVar[tuple[str, str]] = ("containerInstance", "containerInstances")
+    get_many_batch_size: ClassVar[int] = 100
 
     def get(
         self,
@@ -1247,10 +1185,9 @@ class ContainerInstanceManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_container_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeContainerInstancesResponse(**_response)
+        response = self.parse(DescribeContainerInstancesResponse, _response)
 
         if response and response.containerInstances:
-            self.sessionize(response.containerInstances[0])
             return response.containerInstances[0]
         return None
 
@@ -1294,15 +1231,14 @@ class ContainerInstanceManager(ReadonlyBoto3ModelManager):
             cluster=self.serialize(cluster),
             include=self.serialize(include),
         )
-        _response = self.client.describe_container_instances(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_container_instances",
+            DescribeContainerInstancesResponse,
+            "containerInstances",
+            args,
+            batch_arg="containerInstances",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeContainerInstancesResponse(**_response)
-
-        if response.containerInstances:
-            self.sessionize(response.containerInstances)
-            return PrimaryBoto3ModelQuerySet(response.containerInstances)
-        return PrimaryBoto3ModelQuerySet([])
 
     @ecs_container_instances_only
     def list(
@@ -1338,32 +1274,17 @@ class ContainerInstanceManager(ReadonlyBoto3ModelManager):
                 specify this parameter, the The default is to include container
                 instances set to all states other than ``INACTIVE``.
         """
-        paginator = self.client.get_paginator("list_container_instances")
         args: dict[str, Any] = dict(
             cluster=self.serialize(cluster),
             filter=self.serialize(filter),
             status=self.serialize(status),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_container_instances",
+            ListContainerInstancesResponse,
+            "containerInstanceArns",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListContainerInstancesResponse(**_response)
-            if response.containerInstanceArns:
-                results.extend(response.containerInstanceArns)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def list_tasks(
         self,
@@ -1436,18 +1357,20 @@ class ContainerInstanceManager(ReadonlyBoto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListTasksResponse(**_response)
+            response = self.parse(ListTasksResponse, _response)
             if response.taskArns is not None:
                 results.extend(response.taskArns)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
 
 class TaskManager(Boto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_tasks"
+    get_many_arg: ClassVar[tuple[str, str]] = ("task", "tasks")
+    get_many_batch_size: ClassVar[int] = 100
 
     @ecs_task_populate_taskDefinition
     def get(
@@ -1481,10 +1404,9 @@ class TaskManager(Boto3ModelManager):
         _response = self.client.describe_tasks(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTasksResponse(**_response)
+        response = self.parse(DescribeTasksResponse, _response)
 
         if response and response.tasks:
-            self.sessionize(response.tasks[0])
             return response.tasks[0]
         return None
 
@@ -1516,15 +1438,14 @@ class TaskManager(Boto3ModelManager):
             cluster=self.serialize(cluster),
             include=self.serialize(include),
         )
-        _response = self.client.describe_tasks(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_tasks",
+            DescribeTasksResponse,
+            "tasks",
+            args,
+            batch_arg="tasks",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeTasksResponse(**_response)
-
-        if response.tasks:
-            self.sessionize(response.tasks)
-            return PrimaryBoto3ModelQuerySet(response.tasks)
-        return PrimaryBoto3ModelQuerySet([])
 
     @ecs_tasks_only
     def list(
@@ -1578,7 +1499,6 @@ class TaskManager(Boto3ModelManager):
                 results. Specifying a ``daemonName``
                 limits the results to tasks that belong to that daemon.
         """
-        paginator = self.client.get_paginator("list_tasks")
         args: dict[str, Any] = dict(
             cluster=self.serialize(cluster),
             containerInstance=self.serialize(containerInstance),
@@ -1589,26 +1509,7 @@ class TaskManager(Boto3ModelManager):
             launchType=self.serialize(launchType),
             daemonName=self.serialize(daemonName),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTasksResponse(**_response)
-            if response.taskArns:
-                results.extend(response.taskArns)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_tasks", ListTasksResponse, "taskArns", args)
 
     def create(
         self,
@@ -1700,9 +1601,8 @@ class TaskManager(Boto3ModelManager):
         _response = self.client.run_task(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RunTaskResponse(**_response)
+        response = self.parse(RunTaskResponse, _response)
 
-        self.sessionize(response.tasks[0])
         return cast("builtins.list[Task]", response.tasks[0])
 
     def delete(
@@ -1734,12 +1634,14 @@ class TaskManager(Boto3ModelManager):
         _response = self.client.stop_task(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopTaskResponse(**_response)
+        response = self.parse(StopTaskResponse, _response)
         return cast("Task", response.task)
 
 
 class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_task_sets"
+    get_many_arg: ClassVar[tuple[str, str]] = ("taskSet", "taskSets")
 
     def create(self, model: "TaskSet", clientToken: "str | None" = None) -> "TaskSet":
         """
@@ -1778,9 +1680,8 @@ class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
         _response = self.client.create_task_set(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateTaskSetResponse(**_response)
+        response = self.parse(CreateTaskSetResponse, _response)
 
-        self.sessionize(response.taskSet)
         return cast("TaskSet", response.taskSet)
 
     def get(
@@ -1823,10 +1724,9 @@ class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
         _response = self.client.describe_task_sets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTaskSetsResponse(**_response)
+        response = self.parse(DescribeTaskSetsResponse, _response)
 
         if response and response.taskSets:
-            self.sessionize(response.taskSets[0])
             return response.taskSets[0]
         return None
 
@@ -1870,10 +1770,9 @@ class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
         _response = self.client.describe_task_sets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTaskSetsResponse(**_response)
+        response = self.parse(DescribeTaskSetsResponse, _response)
 
         if response.taskSets:
-            self.sessionize(response.taskSets)
             return PrimaryBoto3ModelQuerySet(response.taskSets)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -1897,9 +1796,8 @@ class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
         _response = self.client.update_task_set(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateTaskSetResponse(**_response)
+        response = self.parse(UpdateTaskSetResponse, _response)
 
-        self.sessionize(response.taskSet)
         return cast("TaskSet", response.taskSet)
 
     def delete(
@@ -1935,12 +1833,15 @@ class TaskSetManager(TaskSetManagerMixin, Boto3ModelManager):
         _response = self.client.delete_task_set(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteTaskSetResponse(**_response)
+        response = self.parse(DeleteTaskSetResponse, _response)
         return cast("TaskSet", response.taskSet)
 
 
 class ServiceDeploymentManager(ReadonlyBoto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_service_deployments"
+    get_many_arg: ClassVar[tuple[str, str]] = ("serviceDeploymentArn", "serviceDeploymentArns")
+    get_many_batch_size: ClassVar[int] = 20
 
     def get(self, serviceDeploymentArn: str) -> "ServiceDeployment | None":
         """
@@ -1957,10 +1858,9 @@ class ServiceDeploymentManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_service_deployments(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeServiceDeploymentsResponse(**_response)
+        response = self.parse(DescribeServiceDeploymentsResponse, _response)
 
         if response and response.serviceDeployments:
-            self.sessionize(response.serviceDeployments[0])
             return response.serviceDeployments[0]
         return None
 
@@ -1976,15 +1876,14 @@ class ServiceDeploymentManager(ReadonlyBoto3ModelManager):
         args: dict[str, Any] = dict(
             serviceDeploymentArns=self.serialize(serviceDeploymentArns)
         )
-        _response = self.client.describe_service_deployments(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_service_deployments",
+            DescribeServiceDeploymentsResponse,
+            "serviceDeployments",
+            args,
+            batch_arg="serviceDeploymentArns",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeServiceDeploymentsResponse(**_response)
-
-        if response.serviceDeployments:
-            self.sessionize(response.serviceDeployments)
-            return PrimaryBoto3ModelQuerySet(response.serviceDeployments)
-        return PrimaryBoto3ModelQuerySet([])
 
     @ecs_service_deployments_only
     def list(
@@ -2047,9 +1946,8 @@ class ServiceDeploymentManager(ReadonlyBoto3ModelManager):
         _response = self.client.list_service_deployments(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListServiceDeploymentsResponse(**_response)
+        response = self.parse(ListServiceDeploymentsResponse, _response)
         if response and response.serviceDeployments:
-            self.sessionize(response.serviceDeployments)
             return PrimaryBoto3ModelQuerySet(response.serviceDeployments)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -2076,18 +1974,20 @@ class ServiceDeploymentManager(ReadonlyBoto3ModelManager):
         _response = self.client.stop_service_deployment(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopServiceDeploymentResponse(**_response)
+        response = self.parse(StopServiceDeploymentResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.serviceDeploymentArn
 
-        self.sessionize(results)
         return cast("str", results)
 
 
 class ServiceRevisionManager(ServiceRevisionManagerMixin, ReadonlyBoto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_service_revisions"
+    get_many_arg: ClassVar[tuple[str, str]] = ("serviceRevisionArn", "serviceRevisionArns")
+    get_many_batch_size: ClassVar[int] = 20
 
     def get(self, serviceRevisionArn: str) -> "ServiceRevision | None":
         """
@@ -2103,10 +2003,9 @@ class ServiceRevisionManager(ServiceRevisionManagerMixin, ReadonlyBoto3ModelMana
         _response = self.client.describe_service_revisions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeServiceRevisionsResponse(**_response)
+        response = self.parse(DescribeServiceRevisionsResponse, _response)
 
         if response and response.serviceRevisions:
-            self.sessionize(response.serviceRevisions[0])
             return response.serviceRevisions[0]
         return None
 
@@ -2122,15 +2021,14 @@ class ServiceRevisionManager(ServiceRevisionManagerMixin, ReadonlyBoto3ModelMana
         args: dict[str, Any] = dict(
             serviceRevisionArns=self.serialize(serviceRevisionArns)
         )
-        _response = self.client.describe_service_revisions(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "describe_service_revisions",
+            DescribeServiceRevisionsResponse,
+            "serviceRevisions",
+            args,
+            batch_arg="serviceRevisionArns",
+            batch_size=self.get_many_batch_size,
         )
-        response = DescribeServiceRevisionsResponse(**_response)
-
-        if response.serviceRevisions:
-            self.sessionize(response.serviceRevisions)
-            return PrimaryBoto3ModelQuerySet(response.serviceRevisions)
-        return PrimaryBoto3ModelQuerySet([])
 
 
 class DaemonManager(DaemonManagerMixin, Boto3ModelManager):
@@ -2147,10 +2045,9 @@ class DaemonManager(DaemonManagerMixin, Boto3ModelManager):
         _response = self.client.describe_daemon(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDaemonResponse(**_response)
+        response = self.parse(DescribeDaemonResponse, _response)
 
         if response and response.daemon:
-            self.sessionize(response.daemon)
             return response.daemon
         return None
 
@@ -2175,16 +2072,17 @@ class DaemonTaskDefinitionManager(DaemonTaskDefinitionManagerMixin, Boto3ModelMa
         _response = self.client.describe_daemon_task_definition(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDaemonTaskDefinitionResponse(**_response)
+        response = self.parse(DescribeDaemonTaskDefinitionResponse, _response)
 
         if response and response.daemonTaskDefinition:
-            self.sessionize(response.daemonTaskDefinition)
             return response.daemonTaskDefinition
         return None
 
 
 class DaemonRevisionManager(ReadonlyBoto3ModelManager):
     service_name: str = "ecs"
+    get_many_operation: ClassVar[str] = "describe_daemon_revisions"
+    get_many_arg: ClassVar[tuple[str, str]] = ("daemonRevisionArn", "daemonRevisionArns")
 
     def get(self, daemonRevisionArn: str) -> "DaemonRevision | None":
         """
@@ -2200,10 +2098,9 @@ class DaemonRevisionManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_daemon_revisions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDaemonRevisionsResponse(**_response)
+        response = self.parse(DescribeDaemonRevisionsResponse, _response)
 
         if response and response.daemonRevisions:
-            self.sessionize(response.daemonRevisions[0])
             return response.daemonRevisions[0]
         return None
 
@@ -2223,10 +2120,9 @@ class DaemonRevisionManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_daemon_revisions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDaemonRevisionsResponse(**_response)
+        response = self.parse(DescribeDaemonRevisionsResponse, _response)
 
         if response.daemonRevisions:
-            self.sessionize(response.daemonRevisions)
             return PrimaryBoto3ModelQuerySet(response.daemonRevisions)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -2314,9 +2210,8 @@ class ExpressGatewayServiceManager(
         _response = self.client.create_express_gateway_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateExpressGatewayServiceResponse(**_response)
+        response = self.parse(CreateExpressGatewayServiceResponse, _response)
 
-        self.sessionize(response.service)
         return cast("ExpressGatewayService", response.service)
 
     def get(
@@ -2344,10 +2239,9 @@ class ExpressGatewayServiceManager(
         _response = self.client.describe_express_gateway_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeExpressGatewayServiceResponse(**_response)
+        response = self.parse(DescribeExpressGatewayServiceResponse, _response)
 
         if response and response.service:
-            self.sessionize(response.service)
             return response.service
         return None
 
@@ -2369,7 +2263,7 @@ class ExpressGatewayServiceManager(
         _response = self.client.delete_express_gateway_service(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteExpressGatewayServiceResponse(**_response)
+        response = self.parse(DeleteExpressGatewayServiceResponse, _response)
         return cast("ExpressGatewayService", response.service)
 
 
@@ -4114,7 +4008,7 @@ class TaskSet(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Service.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def cluster(self) -> "Cluster | None":
@@ -4136,7 +4030,7 @@ class TaskSet(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def task_definition(self) -> "TaskDefinition | None":
@@ -4158,7 +4052,7 @@ class TaskSet(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return TaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskDefinition).get(**pk)  # type: ignore[arg-type]
 
 
 class ServiceConnectTestTrafficHeaderMatchRules(Boto3Model):
@@ -5423,7 +5317,7 @@ network interface by using the
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def task_definition(self) -> "TaskDefinition | None":
@@ -5445,7 +5339,7 @@ network interface by using the
             )
         except AttributeError:
             return None
-        return TaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskDefinition).get(**pk)  # type: ignore[arg-type]
 
     @property
     def tasks(self) -> "list[Task] | None":
@@ -5461,7 +5355,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return Task.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Task).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def target_groups(self) -> "list[TargetGroup] | None":
@@ -5487,7 +5381,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return TargetGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TargetGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def scalable_targets(self) -> "list[ScalableTarget] | None":
@@ -5510,7 +5404,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return ScalableTarget.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ScalableTarget).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def service_deployments(self) -> "list[ServiceDeployment] | None":
@@ -5534,7 +5428,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return ServiceDeployment.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceDeployment).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def current_service_deployment(self) -> "ServiceDeployment | None":
@@ -5557,7 +5451,7 @@ network interface by using the
             )
         except AttributeError:
             return None
-        return ServiceDeployment.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceDeployment).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def current_service_revisions(self) -> "list[ServiceRevision] | None":
@@ -5583,7 +5477,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return ServiceRevision.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceRevision).list(**pk)  # type: ignore[arg-type]
     @cached_property
     def task_sets(self) -> "list[TaskSet] | None":
         """
@@ -5615,7 +5509,7 @@ network interface by using the
             )
         except AttributeError:
             return []
-        return TaskSet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskSet).list(**pk)  # type: ignore[arg-type]
 class ExecuteCommandLogConfiguration(Boto3Model):
     """
     The log configuration for the results of the execute command actions.
@@ -5986,7 +5880,7 @@ class Cluster(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Service.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).list(**pk)  # type: ignore[arg-type]
     @cached_property
     def container_instances(self) -> "list[ContainerInstance] | None":
         """
@@ -6008,7 +5902,7 @@ class Cluster(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return ContainerInstance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ContainerInstance).list(**pk)  # type: ignore[arg-type]
     @cached_property
     def capacity_providers(self) -> "list[CapacityProvider] | None":
         """
@@ -6031,7 +5925,7 @@ class Cluster(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return CapacityProvider.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CapacityProvider).list(**pk)  # type: ignore[arg-type]
 
 
 class RepositoryCredentials(Boto3Model):
@@ -7249,7 +7143,7 @@ class ContainerDefinition(Boto3Model):
             )
         except AttributeError:
             return None
-        return ECRImage.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ECRImage).get(**pk)  # type: ignore[arg-type]
 
 
 class Attribute(Boto3Model):
@@ -8388,7 +8282,7 @@ class Task(TagsDictMixin, ECSTaskModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def task_definition(self) -> "TaskDefinition | None":
         """
@@ -8409,7 +8303,7 @@ class Task(TagsDictMixin, ECSTaskModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return TaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskDefinition).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def container_instance(self) -> "ContainerInstance | None":
@@ -8432,7 +8326,7 @@ class Task(TagsDictMixin, ECSTaskModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ContainerInstance.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ContainerInstance).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def service(self) -> "Service | None":
         """
@@ -8454,7 +8348,7 @@ class Task(TagsDictMixin, ECSTaskModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Service.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def capacity_provider(self) -> "CapacityProvider | None":
         """
@@ -8476,7 +8370,7 @@ class Task(TagsDictMixin, ECSTaskModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return CapacityProvider.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CapacityProvider).get(**pk)  # type: ignore[arg-type]
 
 
 class VersionInfo(Boto3Model):
@@ -8812,7 +8706,7 @@ operation.
             )
         except AttributeError:
             return None
-        return Instance.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).get(**pk)  # type: ignore[arg-type]
 
     @property
     def tasks(self) -> "list[Task] | None":
@@ -8830,7 +8724,7 @@ operation.
             )
         except AttributeError:
             return []
-        return Task.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Task).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def cluster(self) -> "Cluster | None":
@@ -8853,7 +8747,7 @@ operation.
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def capacity_provider(self) -> "CapacityProvider | None":
@@ -8877,7 +8771,7 @@ operation.
             )
         except AttributeError:
             return None
-        return CapacityProvider.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CapacityProvider).get(**pk)  # type: ignore[arg-type]
 class ContainerImage(Boto3Model):
     """
     The details about the container image a service revision uses.
@@ -9544,7 +9438,7 @@ class ServiceRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Service.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def cluster(self) -> "Cluster | None":
         """
@@ -9565,7 +9459,7 @@ class ServiceRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def task_definition(self) -> "TaskDefinition | None":
         """
@@ -9586,7 +9480,7 @@ class ServiceRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return TaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskDefinition).get(**pk)  # type: ignore[arg-type]
 
 
 class ServiceRevisionSummary(Boto3Model):
@@ -9945,7 +9839,7 @@ class ServiceDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Service.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def cluster(self) -> "Cluster | None":
         """
@@ -9966,7 +9860,7 @@ class ServiceDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def target_service_revision(self) -> "ServiceRevision | None":
         """
@@ -9988,7 +9882,7 @@ class ServiceDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ServiceRevision.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceRevision).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def source_service_revisions(self) -> "list[ServiceRevision] | None":
         """
@@ -10014,7 +9908,7 @@ class ServiceDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return ServiceRevision.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceRevision).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def target_task_definition(self) -> "TaskDefinition | None":
@@ -10036,7 +9930,7 @@ class ServiceDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return TaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(TaskDefinition).get(**pk)  # type: ignore[arg-type]
 
 
 class DaemonCapacityProvider(Boto3Model):
@@ -10212,7 +10106,7 @@ class Daemon(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def current_revisions(self) -> "list[DaemonRevision] | None":
@@ -10238,7 +10132,7 @@ class Daemon(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return DaemonRevision.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(DaemonRevision).list(**pk)  # type: ignore[arg-type]
 
 
 class DaemonLinuxParameters(Boto3Model):
@@ -10741,7 +10635,7 @@ class DaemonRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Daemon.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Daemon).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def cluster(self) -> "Cluster | None":
@@ -10763,7 +10657,7 @@ class DaemonRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def daemon_task_definition(self) -> "DaemonTaskDefinition | None":
@@ -10786,7 +10680,7 @@ class DaemonRevision(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return DaemonTaskDefinition.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(DaemonTaskDefinition).get(**pk)  # type: ignore[arg-type]
 
 
 class DaemonDeployment(ReadonlyPrimaryBoto3Model):
@@ -10895,7 +10789,7 @@ class DaemonDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Daemon.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Daemon).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def cluster(self) -> "Cluster | None":
@@ -10917,7 +10811,7 @@ class DaemonDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def target_revision(self) -> "DaemonRevision | None":
         """
@@ -10939,7 +10833,7 @@ class DaemonDeployment(ReadonlyPrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return DaemonRevision.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(DaemonRevision).get(**pk)  # type: ignore[arg-type]
 
 
 class ExpressGatewayServiceStatus(Boto3Model):
@@ -11349,7 +11243,7 @@ class ExpressGatewayService(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Cluster.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Cluster).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def service(self) -> "Service | None":
         """
@@ -11372,7 +11266,7 @@ class ExpressGatewayService(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Service.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Service).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def active_service_revisions(self) -> "list[ServiceRevision] | None":
@@ -11399,7 +11293,7 @@ class ExpressGatewayService(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return ServiceRevision.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ServiceRevision).list(**pk)  # type: ignore[arg-type]
 # =======================
 # Request/Response Models
 # =======================
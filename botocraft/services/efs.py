@@ -74,9 +74,8 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.create_file_system(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = FileSystem(**_response)
+        response = self.parse(FileSystem, _response)
 
-        self.sessionize(response)
         return cast("FileSystem", response)
 
     @efs_file_system_add_tags
@@ -115,10 +114,9 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.describe_file_systems(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeFileSystemsResponse(**_response)
+        response = self.parse(DescribeFileSystemsResponse, _response)
 
         if response and response.FileSystems:
-            self.sessionize(response.FileSystems[0])
             return response.FileSystems[0]
         return None
 
@@ -148,32 +146,14 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
             FileSystemId: (Optional) ID of the file system whose description you want to
                 retrieve (String).
         """
-        paginator = self.client.get_paginator("describe_file_systems")
         args: dict[str, Any] = dict(
             MaxItems=self.serialize(MaxItems),
             CreationToken=self.serialize(CreationToken),
             FileSystemId=self.serialize(FileSystemId),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_file_systems", DescribeFileSystemsResponse, "FileSystems", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeFileSystemsResponse(**_response)
-            if response.FileSystems:
-                results.extend(response.FileSystems)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, FileSystemId: str) -> None:
         """
@@ -202,13 +182,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.describe_backup_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BackupPolicyDescription(**_response)
+        response = self.parse(BackupPolicyDescription, _response)
 
         results: "BackupPolicyDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("BackupPolicyDescription", results)
 
     def put_backup_policy(
@@ -231,13 +210,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.put_backup_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BackupPolicyDescription(**_response)
+        response = self.parse(BackupPolicyDescription, _response)
 
         results: "BackupPolicyDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("BackupPolicyDescription", results)
 
     def get_file_system_policy(
@@ -254,13 +232,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.describe_file_system_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = FileSystemPolicyDescription(**_response)
+        response = self.parse(FileSystemPolicyDescription, _response)
 
         results: "FileSystemPolicyDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("FileSystemPolicyDescription", results)
 
     def put_file_system_policy(
@@ -316,13 +293,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.put_file_system_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = FileSystemPolicyDescription(**_response)
+        response = self.parse(FileSystemPolicyDescription, _response)
 
         results: "FileSystemPolicyDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("FileSystemPolicyDescription", results)
 
     def delete_file_system_policy(self, FileSystemId: str) -> None:
@@ -363,13 +339,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.describe_lifecycle_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = LifecycleConfigurationDescription(**_response)
+        response = self.parse(LifecycleConfigurationDescription, _response)
 
         results: "LifecycleConfigurationDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("LifecycleConfigurationDescription", results)
 
     def put_lifecycle_configuration(
@@ -396,13 +371,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.put_lifecycle_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = LifecycleConfigurationDescription(**_response)
+        response = self.parse(LifecycleConfigurationDescription, _response)
 
         results: "LifecycleConfigurationDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("LifecycleConfigurationDescription", results)
 
     def update_file_system_protection(
@@ -430,13 +404,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.update_file_system_protection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = FileSystemProtectionDescription(**_response)
+        response = self.parse(FileSystemProtectionDescription, _response)
 
         results: "FileSystemProtectionDescription" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("FileSystemProtectionDescription", results)
 
     def create_replication_configuration(
@@ -465,13 +438,12 @@ class FileSystemManager(FileSystemManagerMixin, Boto3ModelManager):
         _response = self.client.create_replication_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ReplicationConfiguration(**_response)
+        response = self.parse(ReplicationConfiguration, _response)
 
         results: "ReplicationConfiguration" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ReplicationConfiguration", results)
 
     def delete_replication_configuration(
@@ -548,9 +520,8 @@ class AccessPointManager(AccessPointManagerMixin, Boto3ModelManager):
         _response = self.client.create_access_point(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AccessPoint(**_response)
+        response = self.parse(AccessPoint, _response)
 
-        self.sessionize(response)
         return cast("AccessPoint", response)
 
     @efs_access_point_add_tags
@@ -582,10 +553,9 @@ class AccessPointManager(AccessPointManagerMixin, Boto3ModelManager):
         _response = self.client.describe_access_points(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeAccessPointsResponse(**_response)
+        response = self.parse(DescribeAccessPointsResponse, _response)
 
         if response and response.AccessPoints:
-            self.sessionize(response.AccessPoints[0])
             return response.AccessPoints[0]
         return None
 
@@ -609,31 +579,13 @@ class AccessPointManager(AccessPointManagerMixin, Boto3ModelManager):
                 access points for that file system;
                 mutually exclusive with ``AccessPointId``.
         """
-        paginator = self.client.get_paginator("describe_access_points")
         args: dict[str, Any] = dict(
             AccessPointId=self.serialize(AccessPointId),
             FileSystemId=self.serialize(FileSystemId),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_access_points", DescribeAccessPointsResponse, "AccessPoints", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeAccessPointsResponse(**_response)
-            if response.AccessPoints:
-                results.extend(response.AccessPoints)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, AccessPointId: str) -> None:
         """
@@ -685,9 +637,8 @@ class MountTargetManager(MountTargetManagerMixin, Boto3ModelManager):
         _response = self.client.create_mount_target(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = MountTarget(**_response)
+        response = self.parse(MountTarget, _response)
 
-        self.sessionize(response)
         return cast("MountTarget", response)
 
     def get(
@@ -737,10 +688,9 @@ class MountTargetManager(MountTargetManagerMixin, Boto3ModelManager):
         _response = self.client.describe_mount_targets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeMountTargetsResponse(**_response)
+        response = self.parse(DescribeMountTargetsResponse, _response)
 
         if response and response.MountTargets:
-            self.sessionize(response.MountTargets[0])
             return response.MountTargets[0]
         return None
 
@@ -780,33 +730,15 @@ class MountTargetManager(MountTargetManagerMixin, Boto3ModelManager):
                 included in your request. Accepts either an access
                 point ID or ARN as input.
         """
-        paginator = self.client.get_paginator("describe_mount_targets")
         args: dict[str, Any] = dict(
             MaxItems=self.serialize(MaxItems),
             FileSystemId=self.serialize(FileSystemId),
             MountTargetId=self.serialize(MountTargetId),
             AccessPointId=self.serialize(AccessPointId),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_mount_targets", DescribeMountTargetsResponse, "MountTargets", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeMountTargetsResponse(**_response)
-            if response.MountTargets:
-                results.extend(response.MountTargets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def modify_security_groups(
         self, MountTargetId: str, SecurityGroups: "builtins.list[str]"
@@ -861,9 +793,8 @@ class ReplicationConfigurationManager(Boto3ModelManager):
         _response = self.client.create_replication_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ReplicationConfiguration(**_response)
+        response = self.parse(ReplicationConfiguration, _response)
 
-        self.sessionize(response)
         return cast("ReplicationConfiguration", response)
 
     def get(self, SourceFileSystemId: str) -> "ReplicationConfiguration | None":
@@ -884,10 +815,9 @@ class ReplicationConfigurationManager(Boto3ModelManager):
         _response = self.client.describe_replication_configurations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeReplicationConfigurationsResponse(**_response)
+        response = self.parse(DescribeReplicationConfigurationsResponse, _response)
 
         if response and response.Replications:
-            self.sessionize(response.Replications[0])
             return response.Replications[0]
         return None
 
@@ -905,28 +835,13 @@ class ReplicationConfigurationManager(Boto3ModelManager):
                 describe the replication configuration for a
                 file system in its own Region.
         """
-        paginator = self.client.get_paginator("describe_replication_configurations")
         args: dict[str, Any] = dict(FileSystemId=self.serialize(FileSystemId))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_replication_configurations",
+            DescribeReplicationConfigurationsResponse,
+            "Replications",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeReplicationConfigurationsResponse(**_response)
-            if response.Replications:
-                results.extend(response.Replications)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(
         self,
@@ -1357,7 +1272,7 @@ class FileSystem(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return AccessPoint.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(AccessPoint).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def mount_targets(self) -> "list[MountTarget] | None":
@@ -1379,7 +1294,7 @@ class FileSystem(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return MountTarget.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(MountTarget).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def replication_configuration(self) -> "ReplicationConfiguration | None":
@@ -1401,7 +1316,7 @@ class FileSystem(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return ReplicationConfiguration.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(ReplicationConfiguration).get(**pk)  # type: ignore[arg-type]
 
     def get_backup_policy(self) -> "BackupPolicyDescription":
         """
@@ -1814,7 +1729,7 @@ class AccessPoint(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FileSystem.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FileSystem).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def mount_targets(self) -> "list[MountTarget] | None":
@@ -1836,7 +1751,7 @@ class AccessPoint(TagsDictMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return MountTarget.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(MountTarget).list(**pk)  # type: ignore[arg-type]
 
 
 class MountTarget(MountTargetModelMixin, PrimaryBoto3Model):
@@ -1956,7 +1871,7 @@ class MountTarget(MountTargetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FileSystem.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FileSystem).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnet(self) -> "Subnet | None":
@@ -1978,7 +1893,7 @@ class MountTarget(MountTargetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Subnet.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -2000,7 +1915,7 @@ class MountTarget(MountTargetModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
 class EFSDestination(Boto3Model):
     """
@@ -2155,7 +2070,7 @@ class ReplicationConfiguration(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return FileSystem.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(FileSystem).get(**pk)  # type: ignore[arg-type]
 
 
 class FileSystemPolicyDescription(Boto3Model):
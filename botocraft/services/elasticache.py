@@ -137,9 +137,8 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.create_cache_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCacheClusterResult(**_response)
+        response = self.parse(CreateCacheClusterResult, _response)
 
-        self.sessionize(response.ElasticacheCluster)
         return cast("CacheCluster", response.ElasticacheCluster)
 
     def update(
@@ -240,9 +239,8 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.modify_cache_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyCacheClusterResult(**_response)
+        response = self.parse(ModifyCacheClusterResult, _response)
 
-        self.sessionize(response.ElasticacheCluster)
         return cast("CacheCluster", response.ElasticacheCluster)
 
     def delete(
@@ -273,7 +271,7 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.delete_cache_cluster(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteCacheClusterResult(**_response)
+        response = self.parse(DeleteCacheClusterResult, _response)
         return cast("CacheCluster", response.ElasticacheCluster)
 
     def get(
@@ -313,10 +311,9 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.describe_cache_clusters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheClusterMessage(**_response)
+        response = self.parse(CacheClusterMessage, _response)
 
         if response and response.CacheClusters:
-            self.sessionize(response.CacheClusters[0])
             return response.CacheClusters[0]
         return None
 
@@ -345,7 +342,6 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
                     replication group. In practice, this means
                     Memcached and single node Valkey or Redis OSS clusters.
         """
-        paginator = self.client.get_paginator("describe_cache_clusters")
         args: dict[str, Any] = dict(
             CacheClusterId=self.serialize(CacheClusterId),
             ShowCacheNodeInfo=self.serialize(ShowCacheNodeInfo),
@@ -353,26 +349,9 @@ class CacheClusterManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
                 ShowCacheClustersNotInReplicationGroups
             ),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_cache_clusters", CacheClusterMessage, "CacheClusters", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = CacheClusterMessage(**_response)
-            if response.CacheClusters:
-                results.extend(response.CacheClusters)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CacheParameterGroupManager(Boto3ModelManager):
@@ -407,9 +386,8 @@ class CacheParameterGroupManager(Boto3ModelManager):
         _response = self.client.create_cache_parameter_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCacheParameterGroupResult(**_response)
+        response = self.parse(CreateCacheParameterGroupResult, _response)
 
-        self.sessionize(response.ElasticacheParameterGroup)
         return cast("CacheParameterGroup", response.ElasticacheParameterGroup)
 
     def update(self, model: "CacheParameterGroup") -> str:
@@ -430,9 +408,8 @@ class CacheParameterGroupManager(Boto3ModelManager):
         _response = self.client.modify_cache_parameter_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheParameterGroupNameMessage(**_response)
+        response = self.parse(CacheParameterGroupNameMessage, _response)
 
-        self.sessionize(response.CacheParameterGroupName)
         return cast("str", response.CacheParameterGroupName)
 
     def delete(self, CacheParameterGroupName: str) -> None:
@@ -469,10 +446,9 @@ class CacheParameterGroupManager(Boto3ModelManager):
         _response = self.client.describe_cache_parameter_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheParameterGroupsMessage(**_response)
+        response = self.parse(CacheParameterGroupsMessage, _response)
 
         if response and response.CacheParameterGroups:
-            self.sessionize(response.CacheParameterGroups[0])
             return response.CacheParameterGroups[0]
         return None
 
@@ -489,30 +465,15 @@ class CacheParameterGroupManager(Boto3ModelManager):
             CacheParameterGroupName: The name of a specific cache parameter group to
                 return details for.
         """
-        paginator = self.client.get_paginator("describe_cache_parameter_groups")
         args: dict[str, Any] = dict(
             CacheParameterGroupName=self.serialize(CacheParameterGroupName)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_cache_parameter_groups",
+            CacheParameterGroupsMessage,
+            "CacheParameterGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = CacheParameterGroupsMessage(**_response)
-            if response.CacheParameterGroups:
-                results.extend(response.CacheParameterGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def reset(
         self,
@@ -551,13 +512,12 @@ class CacheParameterGroupManager(Boto3ModelManager):
         _response = self.client.reset_cache_parameter_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheParameterGroupNameMessage(**_response)
+        response = self.parse(CacheParameterGroupNameMessage, _response)
 
         results: str = None
         if response is not None:
             results = response.CacheParameterGroupName
 
-        self.sessionize(results)
         return cast("str", results)
 
     def parameters(
@@ -585,13 +545,12 @@ class CacheParameterGroupManager(Boto3ModelManager):
         results: "builtins.list[CacheParameter]" = []
 
         for _response in response_iterator:
-            response = CacheParameterGroupDetails(**_response)
+            response = self.parse(CacheParameterGroupDetails, _response)
             if response.Parameters is not None:
                 results.extend(response.Parameters)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[CacheParameter]", results)
 
 
@@ -622,9 +581,8 @@ class CacheSubnetGroupManager(Boto3ModelManager):
         _response = self.client.create_cache_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCacheSubnetGroupResult(**_response)
+        response = self.parse(CreateCacheSubnetGroupResult, _response)
 
-        self.sessionize(response.ElasticacheSubnetGroup)
         return cast("CacheSubnetGroup", response.ElasticacheSubnetGroup)
 
     def update(
@@ -648,9 +606,8 @@ class CacheSubnetGroupManager(Boto3ModelManager):
         _response = self.client.modify_cache_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyCacheSubnetGroupResult(**_response)
+        response = self.parse(ModifyCacheSubnetGroupResult, _response)
 
-        self.sessionize(response.ElasticacheSubnetGroup)
         return cast("CacheSubnetGroup", response.ElasticacheSubnetGroup)
 
     def delete(self, CacheSubnetGroupName: str) -> None:
@@ -686,10 +643,9 @@ class CacheSubnetGroupManager(Boto3ModelManager):
         _response = self.client.describe_cache_subnet_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheSubnetGroupMessage(**_response)
+        response = self.parse(CacheSubnetGroupMessage, _response)
 
         if response and response.CacheSubnetGroups:
-            self.sessionize(response.CacheSubnetGroups[0])
             return response.CacheSubnetGroups[0]
         return None
 
@@ -708,30 +664,15 @@ class CacheSubnetGroupManager(Boto3ModelManager):
             CacheSubnetGroupName: The name of the cache subnet group to return details
                 for.
         """
-        paginator = self.client.get_paginator("describe_cache_subnet_groups")
         args: dict[str, Any] = dict(
             CacheSubnetGroupName=self.serialize(CacheSubnetGroupName)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_cache_subnet_groups",
+            CacheSubnetGroupMessage,
+            "CacheSubnetGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = CacheSubnetGroupMessage(**_response)
-            if response.CacheSubnetGroups:
-                results.extend(response.CacheSubnetGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CacheSecurityGroupManager(Boto3ModelManager):
@@ -761,9 +702,8 @@ class CacheSecurityGroupManager(Boto3ModelManager):
         _response = self.client.create_cache_security_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCacheSecurityGroupResult(**_response)
+        response = self.parse(CreateCacheSecurityGroupResult, _response)
 
-        self.sessionize(response.ElasticacheSecurityGroup)
         return cast("CacheSecurityGroup", response.ElasticacheSecurityGroup)
 
     def delete(self, CacheSecurityGroupName: str) -> None:
@@ -798,10 +738,9 @@ class CacheSecurityGroupManager(Boto3ModelManager):
         _response = self.client.describe_cache_security_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheSecurityGroupMessage(**_response)
+        response = self.parse(CacheSecurityGroupMessage, _response)
 
         if response and response.CacheSecurityGroups:
-            self.sessionize(response.CacheSecurityGroups[0])
             return response.CacheSecurityGroups[0]
         return None
 
@@ -819,30 +758,15 @@ class CacheSecurityGroupManager(Boto3ModelManager):
             CacheSecurityGroupName: The name of the cache security group to return
                 details for.
         """
-        paginator = self.client.get_paginator("describe_cache_security_groups")
         args: dict[str, Any] = dict(
             CacheSecurityGroupName=self.serialize(CacheSecurityGroupName)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_cache_security_groups",
+            CacheSecurityGroupMessage,
+            "CacheSecurityGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = CacheSecurityGroupMessage(**_response)
-            if response.CacheSecurityGroups:
-                results.extend(response.CacheSecurityGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def authorize_ingress(
         self,
@@ -874,13 +798,12 @@ class CacheSecurityGroupManager(Boto3ModelManager):
         _response = self.client.authorize_cache_security_group_ingress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AuthorizeCacheSecurityGroupIngressResult(**_response)
+        response = self.parse(AuthorizeCacheSecurityGroupIngressResult, _response)
 
         results: "CacheSecurityGroup" = None
         if response is not None:
             results = response.ElasticacheSecurityGroup
 
-        self.sessionize(results)
         return cast("CacheSecurityGroup", results)
 
     def revoke_ingress(
@@ -913,13 +836,12 @@ class CacheSecurityGroupManager(Boto3ModelManager):
         _response = self.client.revoke_cache_security_group_ingress(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RevokeCacheSecurityGroupIngressResult(**_response)
+        response = self.parse(RevokeCacheSecurityGroupIngressResult, _response)
 
         results: "CacheSecurityGroup" = None
         if response is not None:
             results = response.ElasticacheSecurityGroup
 
-        self.sessionize(results)
         return cast("CacheSecurityGroup", results)
 
 
@@ -1094,9 +1016,8 @@ class ReplicationGroupManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.create_replication_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateReplicationGroupResult(**_response)
+        response = self.parse(CreateReplicationGroupResult, _response)
 
-        self.sessionize(response.ElasticacheReplicationGroup)
         return cast("ReplicationGroup", response.ElasticacheReplicationGroup)
 
     def update(
@@ -1220,9 +1141,8 @@ class ReplicationGroupManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.modify_replication_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyReplicationGroupResult(**_response)
+        response = self.parse(ModifyReplicationGroupResult, _response)
 
-        self.sessionize(response.ElasticacheReplicationGroup)
         return cast("ReplicationGroup", response.ElasticacheReplicationGroup)
 
     def delete(
@@ -1263,7 +1183,7 @@ class ReplicationGroupManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.delete_replication_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteReplicationGroupResult(**_response)
+        response = self.parse(DeleteReplicationGroupResult, _response)
         return cast("ReplicationGroup", response.ElasticacheReplicationGroup)
 
     def get(self, ReplicationGroupId: str) -> "ReplicationGroup | None":
@@ -1283,10 +1203,9 @@ class ReplicationGroupManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
         _response = self.client.describe_replication_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ReplicationGroupMessage(**_response)
+        response = self.parse(ReplicationGroupMessage, _response)
 
         if response and response.ReplicationGroups:
-            self.sessionize(response.ReplicationGroups[0])
             return response.ReplicationGroups[0]
         return None
 
@@ -1303,30 +1222,15 @@ class ReplicationGroupManager(ElastiCacheManagerTagsMixin, Boto3ModelManager):
             ReplicationGroupId: The identifier for the replication group to be
                 described. This parameter is not case sensitive.
         """
-        paginator = self.client.get_paginator("describe_replication_groups")
         args: dict[str, Any] = dict(
             ReplicationGroupId=self.serialize(ReplicationGroupId)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_replication_groups",
+            ReplicationGroupMessage,
+            "ReplicationGroups",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ReplicationGroupMessage(**_response)
-            if response.ReplicationGroups:
-                results.extend(response.ReplicationGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class CacheParameterManager(ReadonlyBoto3ModelManager):
@@ -1352,10 +1256,9 @@ class CacheParameterManager(ReadonlyBoto3ModelManager):
         _response = self.client.describe_cache_parameters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CacheParameterGroupDetails(**_response)
+        response = self.parse(CacheParameterGroupDetails, _response)
 
         if response and response.Parameters:
-            self.sessionize(response.Parameters[0])
             return response.Parameters[0]
         return None
 
@@ -1384,13 +1287,12 @@ class CacheParameterManager(ReadonlyBoto3ModelManager):
         results: "builtins.list[CacheParameter]" = []
 
         for _response in response_iterator:
-            response = CacheParameterGroupDetails(**_response)
+            response = self.parse(CacheParameterGroupDetails, _response)
             if response.Parameters is not None:
                 results.extend(response.Parameters)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[CacheParameter]", results)
 
 
@@ -1432,9 +1334,8 @@ class ElastiCacheUserManager(Boto3ModelManager):
         _response = self.client.create_user(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUser(**_response)
+        response = self.parse(ElastiCacheUser, _response)
 
-        self.sessionize(response)
         return cast("ElastiCacheUser", response)
 
     def update(
@@ -1470,9 +1371,8 @@ class ElastiCacheUserManager(Boto3ModelManager):
         _response = self.client.modify_user(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUser(**_response)
+        response = self.parse(ElastiCacheUser, _response)
 
-        self.sessionize(response)
         return cast("ElastiCacheUser", response)
 
     def delete(self, UserId: str) -> "ElastiCacheUser":
@@ -1490,7 +1390,7 @@ class ElastiCacheUserManager(Boto3ModelManager):
         _response = self.client.delete_user(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUser(**_response)
+        response = self.parse(ElastiCacheUser, _response)
         return response
 
     @elasticache_user_add_tags
@@ -1512,10 +1412,9 @@ class ElastiCacheUserManager(Boto3ModelManager):
         _response = self.client.describe_users(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeUsersResult(**_response)
+        response = self.parse(DescribeUsersResult, _response)
 
         if response and response.Users:
-            self.sessionize(response.Users[0])
             return response.Users[0]
         return None
 
@@ -1535,32 +1434,12 @@ class ElastiCacheUserManager(Boto3ModelManager):
             UserId: The ID of the user.
             Filters: Filter to determine the list of User IDs to return.
         """
-        paginator = self.client.get_paginator("describe_users")
         args: dict[str, Any] = dict(
             Engine=self.serialize(Engine),
             UserId=self.serialize(UserId),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeUsersResult(**_response)
-            if response.Users:
-                results.extend(response.Users)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_users", DescribeUsersResult, "Users", args)
 
 
 class ElastiCacheUserGroupManager(Boto3ModelManager):
@@ -1586,9 +1465,8 @@ class ElastiCacheUserGroupManager(Boto3ModelManager):
         _response = self.client.create_user_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUserGroup(**_response)
+        response = self.parse(ElastiCacheUserGroup, _response)
 
-        self.sessionize(response)
         return cast("ElastiCacheUserGroup", response)
 
     def update(
@@ -1617,9 +1495,8 @@ class ElastiCacheUserGroupManager(Boto3ModelManager):
         _response = self.client.modify_user_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUserGroup(**_response)
+        response = self.parse(ElastiCacheUserGroup, _response)
 
-        self.sessionize(response)
         return cast("ElastiCacheUserGroup", response)
 
     def delete(self, UserGroupId: str) -> "ElastiCacheUserGroup":
@@ -1638,7 +1515,7 @@ class ElastiCacheUserGroupManager(Boto3ModelManager):
         _response = self.client.delete_user_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ElastiCacheUserGroup(**_response)
+        response = self.parse(ElastiCacheUserGroup, _response)
         return response
 
     @elasticache_user_group_add_tags
@@ -1653,10 +1530,9 @@ class ElastiCacheUserGroupManager(Boto3ModelManager):
         _response = self.client.describe_user_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeUserGroupsResult(**_response)
+        response = self.parse(DescribeUserGroupsResult, _response)
 
         if response and response.UserGroups:
-            self.sessionize(response.UserGroups[0])
             return response.UserGroups[0]
         return None
 
@@ -1668,28 +1544,10 @@ class ElastiCacheUserGroupManager(Boto3ModelManager):
         Keyword Args:
             UserGroupId: The ID of the user group.
         """
-        paginator = self.client.get_paginator("describe_user_groups")
         args: dict[str, Any] = dict(UserGroupId=self.serialize(UserGroupId))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_user_groups", DescribeUserGroupsResult, "UserGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeUserGroupsResult(**_response)
-            if response.UserGroups:
-                results.extend(response.UserGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -2400,7 +2258,7 @@ class CacheCluster(CacheClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return CacheParameterGroup.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CacheParameterGroup).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnet_group(self) -> "CacheSubnetGroup | None":
@@ -2422,7 +2280,7 @@ class CacheCluster(CacheClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return CacheSubnetGroup.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(CacheSubnetGroup).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -2444,7 +2302,7 @@ class CacheCluster(CacheClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -2470,7 +2328,7 @@ class CacheCluster(CacheClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -2496,7 +2354,7 @@ class CacheCluster(CacheClusterModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
 
 class ParameterNameValue(Boto3Model):
@@ -2793,7 +2651,7 @@ class CacheSubnetGroup(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
 
 class EC2SecurityGroup(Boto3Model):
@@ -2916,7 +2774,7 @@ class CacheSecurityGroup(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     def authorize_ingress(
         self, EC2SecurityGroupName: str, EC2SecurityGroupOwnerId: str
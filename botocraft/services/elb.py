@@ -66,10 +66,9 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_load_balancers(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeAccessPointsOutput(**_response)
+        response = self.parse(DescribeAccessPointsOutput, _response)
 
         if response and response.LoadBalancerDescriptions:
-            self.sessionize(response.LoadBalancerDescriptions[0])
             return response.LoadBalancerDescriptions[0]
         return None
 
@@ -87,28 +86,13 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         Keyword Args:
             LoadBalancerNames: The names of the load balancers.
         """
-        paginator = self.client.get_paginator("describe_load_balancers")
         args: dict[str, Any] = dict(LoadBalancerNames=self.serialize(LoadBalancerNames))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_load_balancers",
+            DescribeAccessPointsOutput,
+            "LoadBalancerDescriptions",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeAccessPointsOutput(**_response)
-            if response.LoadBalancerDescriptions:
-                results.extend(response.LoadBalancerDescriptions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def add_tags(
         self, LoadBalancerNames: "builtins.list[str]", Tags: "builtins.list[Tag]"
@@ -141,13 +125,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_tags(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTagsOutput(**_response)
+        response = self.parse(DescribeTagsOutput, _response)
 
         results: "builtins.list[ClassicELBTagDescription]" = None
         if response is not None:
             results = response.TagDescriptions
 
-        self.sessionize(results)
         return cast("builtins.list[ClassicELBTagDescription]", results)
 
     def remove_tags(
@@ -186,13 +169,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.enable_availability_zones_for_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AddAvailabilityZonesOutput(**_response)
+        response = self.parse(AddAvailabilityZonesOutput, _response)
 
         results: "builtins.list[str]" = None
         if response is not None:
             results = response.AvailabilityZones
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def disable_availability_zones(
@@ -213,13 +195,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.disable_availability_zones_for_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RemoveAvailabilityZonesOutput(**_response)
+        response = self.parse(RemoveAvailabilityZonesOutput, _response)
 
         results: "builtins.list[str]" = None
         if response is not None:
             results = response.AvailabilityZones
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def configure_health_check(
@@ -258,13 +239,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.register_instances_with_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RegisterEndPointsOutput(**_response)
+        response = self.parse(RegisterEndPointsOutput, _response)
 
         results: "builtins.list[ClassicELBInstance]" = None
         if response is not None:
             results = response.Instances
 
-        self.sessionize(results)
         return cast("builtins.list[ClassicELBInstance]", results)
 
     def instance_health(
@@ -296,13 +276,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_instance_health(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeEndPointStateOutput(**_response)
+        response = self.parse(DescribeEndPointStateOutput, _response)
 
         results: "builtins.list[ClassicELBInstanceState]" = None
         if response is not None:
             results = response.InstanceStates
 
-        self.sessionize(results)
         return cast("builtins.list[ClassicELBInstanceState]", results)
 
     def deregister_instances(
@@ -325,13 +304,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.deregister_instances_from_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeregisterEndPointsOutput(**_response)
+        response = self.parse(DeregisterEndPointsOutput, _response)
 
         results: "builtins.list[ClassicELBInstance]" = None
         if response is not None:
             results = response.Instances
 
-        self.sessionize(results)
         return cast("builtins.list[ClassicELBInstance]", results)
 
     def add_listeners(
@@ -387,13 +365,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_load_balancer_attributes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeClassicELBAttributesResponse(**_response)
+        response = self.parse(DescribeClassicELBAttributesResponse, _response)
 
         results: "ClassicELBLoadBalancerAttributes" = None
         if response is not None:
             results = response.LoadBalancerAttributes
 
-        self.sessionize(results)
         return cast("ClassicELBLoadBalancerAttributes", results)
 
     def modify_attributes(
@@ -415,13 +392,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.modify_load_balancer_attributes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyLoadBalancerAttributesOutput(**_response)
+        response = self.parse(ModifyLoadBalancerAttributesOutput, _response)
 
         results: "ClassicELBLoadBalancerAttributes" = None
         if response is not None:
             results = response.LoadBalancerAttributes
 
-        self.sessionize(results)
         return cast("ClassicELBLoadBalancerAttributes", results)
 
     def detach_from_subnets(
@@ -442,13 +418,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.detach_load_balancer_from_subnets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DetachLoadBalancerFromSubnetsOutput(**_response)
+        response = self.parse(DetachLoadBalancerFromSubnetsOutput, _response)
 
         results: "builtins.list[str]" = None
         if response is not None:
             results = response.Subnets
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def attach_to_subnets(
@@ -470,13 +445,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.attach_load_balancer_to_subnets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AttachLoadBalancerToSubnetsOutput(**_response)
+        response = self.parse(AttachLoadBalancerToSubnetsOutput, _response)
 
         results: "builtins.list[str]" = None
         if response is not None:
             results = response.Subnets
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def apply_security_groups(
@@ -502,13 +476,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.apply_security_groups_to_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ApplySecurityGroupsToLoadBalancerOutput(**_response)
+        response = self.parse(ApplySecurityGroupsToLoadBalancerOutput, _response)
 
         results: "builtins.list[str]" = None
         if response is not None:
             results = response.SecurityGroups
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def set_ssl_certificate(
@@ -641,13 +614,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_load_balancer_policies(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLoadBalancerPoliciesOutput(**_response)
+        response = self.parse(DescribeLoadBalancerPoliciesOutput, _response)
 
         results: "builtins.list[PolicyDescription]" = None
         if response is not None:
             results = response.PolicyDescriptions
 
-        self.sessionize(results)
         return cast("builtins.list[PolicyDescription]", results)
 
     def delete_policy(self, LoadBalancerName: str, PolicyName: str) -> None:
@@ -683,13 +655,12 @@ class ClassicELBManager(ClassicELBManagerMixin, Boto3ModelManager):
         _response = self.client.describe_load_balancer_policy_types(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLoadBalancerPolicyTypesOutput(**_response)
+        response = self.parse(DescribeLoadBalancerPolicyTypesOutput, _response)
 
         results: "builtins.list[PolicyTypeDescription]" = None
         if response is not None:
             results = response.PolicyTypeDescriptions
 
-        self.sessionize(results)
         return cast("builtins.list[PolicyTypeDescription]", results)
 
 
@@ -1087,7 +1058,7 @@ class ClassicELB(ClassicELBModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -1109,7 +1080,7 @@ class ClassicELB(ClassicELBModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -1131,7 +1102,7 @@ class ClassicELB(ClassicELBModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def instances(self) -> "list[Instance] | None":
@@ -1153,7 +1124,7 @@ class ClassicELB(ClassicELBModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Instance.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Instance).list(**pk)  # type: ignore[arg-type]
 
     def add_listeners(self, Listeners: builtins.list[ClassicELBListener]) -> "None":
         """
@@ -66,9 +66,8 @@ class LoadBalancerManager(LoadBalancerManagerMixin, Boto3ModelManager):
         _response = self.client.create_load_balancer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLoadBalancerOutput(**_response)
+        response = self.parse(CreateLoadBalancerOutput, _response)
 
-        self.sessionize(response.LoadBalancers[0])
         return cast("builtins.list[LoadBalancer]", response.LoadBalancers[0])
 
     def delete(self, LoadBalancerArn: str) -> None:
@@ -101,31 +100,16 @@ class LoadBalancerManager(LoadBalancerManagerMixin, Boto3ModelManager):
                 a single call.
             Names: The names of the load balancers.
         """
-        paginator = self.client.get_paginator("describe_load_balancers")
         args: dict[str, Any] = dict(
             LoadBalancerArns=self.serialize(LoadBalancerArns),
             Names=self.serialize(Names),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_load_balancers",
+            DescribeLoadBalancersOutput,
+            "LoadBalancers",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeLoadBalancersOutput(**_response)
-            if response.LoadBalancers:
-                results.extend(response.LoadBalancers)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @load_balancer_attributes_to_dict
     def attributes(
@@ -142,13 +126,12 @@ class LoadBalancerManager(LoadBalancerManagerMixin, Boto3ModelManager):
         _response = self.client.describe_load_balancer_attributes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLoadBalancerAttributesOutput(**_response)
+        response = self.parse(DescribeLoadBalancerAttributesOutput, _response)
 
         results: "builtins.list[LoadBalancerAttribute]" = None
         if response is not None:
             results = response.Attributes
 
-        self.sessionize(results)
         return cast("builtins.list[LoadBalancerAttribute]", results)
 
 
@@ -183,9 +166,8 @@ class ListenerManager(Boto3ModelManager):
         _response = self.client.create_listener(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateListenerOutput(**_response)
+        response = self.parse(CreateListenerOutput, _response)
 
-        self.sessionize(response.Listeners[0])
         return cast("builtins.list[Listener]", response.Listeners[0])
 
     def update(self, model: "Listener") -> "builtins.list[Listener]":
@@ -210,9 +192,8 @@ class ListenerManager(Boto3ModelManager):
         _response = self.client.modify_listener(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyListenerOutput(**_response)
+        response = self.parse(ModifyListenerOutput, _response)
 
-        self.sessionize(response.Listeners[0])
         return cast("builtins.list[Listener]", response.Listeners[0])
 
     def delete(self, ListenerArn: str) -> None:
@@ -238,10 +219,9 @@ class ListenerManager(Boto3ModelManager):
         _response = self.client.describe_listeners(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeListenersOutput(**_response)
+        response = self.parse(DescribeListenersOutput, _response)
 
         if response and response.Listeners:
-            self.sessionize(response.Listeners[0])
             return response.Listeners[0]
         return None
 
@@ -260,31 +240,13 @@ class ListenerManager(Boto3ModelManager):
             LoadBalancerArn: The Amazon Resource Name (ARN) of the load balancer.
             ListenerArns: The Amazon Resource Names (ARN) of the listeners.
         """
-        paginator = self.client.get_paginator("describe_listeners")
         args: dict[str, Any] = dict(
             LoadBalancerArn=self.serialize(LoadBalancerArn),
             ListenerArns=self.serialize(ListenerArns),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_listeners", DescribeListenersOutput, "Listeners", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeListenersOutput(**_response)
-            if response.Listeners:
-                results.extend(response.Listeners)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class RuleManager(Boto3ModelManager):
@@ -316,9 +278,8 @@ class RuleManager(Boto3ModelManager):
         _response = self.client.create_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRuleOutput(**_response)
+        response = self.parse(CreateRuleOutput, _response)
 
-        self.sessionize(response.Rules[0])
         return cast("builtins.list[Rule]", response.Rules[0])
 
     def update(
@@ -347,9 +308,8 @@ class RuleManager(Boto3ModelManager):
         _response = self.client.modify_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyRuleOutput(**_response)
+        response = self.parse(ModifyRuleOutput, _response)
 
-        self.sessionize(response.Rules[0])
         return cast("builtins.list[Rule]", response.Rules[0])
 
     def delete(self, RuleArn: str) -> None:
@@ -374,10 +334,9 @@ class RuleManager(Boto3ModelManager):
         _response = self.client.describe_rules(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeRulesOutput(**_response)
+        response = self.parse(DescribeRulesOutput, _response)
 
         if response and response.Rules:
-            self.sessionize(response.Rules[0])
             return response.Rules[0]
         return None
 
@@ -395,30 +354,10 @@ class RuleManager(Boto3ModelManager):
                     ListenerArn: The Amazon Resource Name (ARN) of the listener.
                     RuleArns: The Amazon Resource Names (ARN) of the rules.
         """
-        paginator = self.client.get_paginator("describe_rules")
         args: dict[str, Any] = dict(
             ListenerArn=self.serialize(ListenerArn), RuleArns=self.serialize(RuleArns)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeRulesOutput(**_response)
-            if response.Rules:
-                results.extend(response.Rules)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("describe_rules", DescribeRulesOutput, "Rules", args)
 
 
 class TargetGroupManager(Boto3ModelManager):
@@ -461,9 +400,8 @@ class TargetGroupManager(Boto3ModelManager):
         _response = self.client.create_target_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateTargetGroupOutput(**_response)
+        response = self.parse(CreateTargetGroupOutput, _response)
 
-        self.sessionize(response.TargetGroups[0])
         return cast("builtins.list[TargetGroup]", response.TargetGroups[0])
 
     def update(self, model: "TargetGroup") -> "builtins.list[TargetGroup]":
@@ -490,9 +428,8 @@ class TargetGroupManager(Boto3ModelManager):
         _response = self.client.modify_target_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyTargetGroupOutput(**_response)
+        response = self.parse(ModifyTargetGroupOutput, _response)
 
-        self.sessionize(response.TargetGroups[0])
         return cast("builtins.list[TargetGroup]", response.TargetGroups[0])
 
     def delete(self, TargetGroupArn: str) -> None:
@@ -530,10 +467,9 @@ class TargetGroupManager(Boto3ModelManager):
         _response = self.client.describe_target_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTargetGroupsOutput(**_response)
+        response = self.parse(DescribeTargetGroupsOutput, _response)
 
         if response and response.TargetGroups:
-            self.sessionize(response.TargetGroups[0])
             return response.TargetGroups[0]
         return None
 
@@ -556,32 +492,14 @@ class TargetGroupManager(Boto3ModelManager):
             TargetGroupArns: The Amazon Resource Names (ARN) of the target groups.
             Names: The names of the target groups.
         """
-        paginator = self.client.get_paginator("describe_target_groups")
         args: dict[str, Any] = dict(
             LoadBalancerArn=self.serialize(LoadBalancerArn),
             TargetGroupArns=self.serialize(TargetGroupArns),
             Names=self.serialize(Names),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_target_groups", DescribeTargetGroupsOutput, "TargetGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeTargetGroupsOutput(**_response)
-            if response.TargetGroups:
-                results.extend(response.TargetGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def targets(
         self,
@@ -608,13 +526,12 @@ class TargetGroupManager(Boto3ModelManager):
         _response = self.client.describe_target_health(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeTargetHealthOutput(**_response)
+        response = self.parse(DescribeTargetHealthOutput, _response)
 
         results: "builtins.list[TargetHealthDescription] | None" = None
         if response is not None:
             results = response.TargetHealthDescriptions
 
-        self.sessionize(results)
         return cast("builtins.list[TargetHealthDescription] | None", results)
 
 
@@ -909,7 +826,7 @@ class LoadBalancer(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Listener.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Listener).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -931,7 +848,7 @@ class LoadBalancer(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
         """
@@ -953,7 +870,7 @@ class LoadBalancer(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     def attributes(self) -> "builtins.list[LoadBalancerAttribute]":
         """
@@ -1546,7 +1463,7 @@ class Listener(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return LoadBalancer.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LoadBalancer).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def rules(self) -> "list[Rule] | None":
@@ -1569,7 +1486,7 @@ class Listener(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Rule.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Rule).list(**pk)  # type: ignore[arg-type]
 
 
 class HostHeaderConditionConfig(Boto3Model):
@@ -2191,7 +2108,7 @@ class TargetGroup(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return LoadBalancer.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(LoadBalancer).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -2213,7 +2130,7 @@ class TargetGroup(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
     def targets(self) -> "builtins.list[TargetHealthDescription] | None":
         """
         Return the targets for the target group.
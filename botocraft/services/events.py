@@ -59,9 +59,8 @@ class EventRuleManager(Boto3ModelManager):
         _response = self.client.put_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutRuleResponse(**_response)
+        response = self.parse(PutRuleResponse, _response)
 
-        self.sessionize(response.RuleArn)
         return cast("str", response.RuleArn)
 
     @EventRule_purge_CreatedBy_attribute
@@ -93,9 +92,8 @@ class EventRuleManager(Boto3ModelManager):
         _response = self.client.put_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutRuleResponse(**_response)
+        response = self.parse(PutRuleResponse, _response)
 
-        self.sessionize(response.RuleArn)
         return cast("str", response.RuleArn)
 
     def delete(
@@ -147,10 +145,9 @@ class EventRuleManager(Boto3ModelManager):
         _response = self.client.describe_rule(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeRuleResponse(**_response)
+        response = self.parse(DescribeRuleResponse, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -174,32 +171,12 @@ class EventRuleManager(Boto3ModelManager):
                 used.
             Limit: The maximum number of results to return.
         """
-        paginator = self.client.get_paginator("list_rules")
         args: dict[str, Any] = dict(
             NamePrefix=self.serialize(NamePrefix),
             EventBusName=self.serialize(EventBusName),
             Limit=self.serialize(Limit),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListRulesResponse(**_response)
-            if response.Rules:
-                results.extend(response.Rules)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_rules", ListRulesResponse, "Rules", args)
 
     @event_rules_only
     def list_by_target(
@@ -236,13 +213,12 @@ class EventRuleManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListRuleNamesByTargetResponse(**_response)
+            response = self.parse(ListRuleNamesByTargetResponse, _response)
             if response.RuleNames is not None:
                 results.extend(response.RuleNames)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     def list_targets(
@@ -277,13 +253,12 @@ class EventRuleManager(Boto3ModelManager):
         results: "builtins.list[EventTarget]" = []
 
         for _response in response_iterator:
-            response = ListTargetsByRuleResponse(**_response)
+            response = self.parse(ListTargetsByRuleResponse, _response)
             if response.Targets is not None:
                 results.extend(response.Targets)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[EventTarget]", results)
 
     def enable(self, Name: str, *, EventBusName: "str | None" = None) -> None:
@@ -352,9 +327,8 @@ class EventTargetManager(Boto3ModelManager):
         _response = self.client.put_targets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutTargetsResponse(**_response)
+        response = self.parse(PutTargetsResponse, _response)
 
-        self.sessionize(response)
         return cast("PutTargetsResponse", response)
 
     def update(
@@ -381,9 +355,8 @@ class EventTargetManager(Boto3ModelManager):
         _response = self.client.put_targets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutTargetsResponse(**_response)
+        response = self.parse(PutTargetsResponse, _response)
 
-        self.sessionize(response)
         return cast("PutTargetsResponse", response)
 
     def delete(
@@ -424,7 +397,7 @@ class EventTargetManager(Boto3ModelManager):
         _response = self.client.remove_targets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RemoveTargetsResponse(**_response)
+        response = self.parse(RemoveTargetsResponse, _response)
         return response
 
     def list(
@@ -446,32 +419,14 @@ class EventTargetManager(Boto3ModelManager):
                 used.
             Limit: The maximum number of results to return.
         """
-        paginator = self.client.get_paginator("list_targets_by_rule")
         args: dict[str, Any] = dict(
             Rule=self.serialize(Rule),
             EventBusName=self.serialize(EventBusName),
             Limit=self.serialize(Limit),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_targets_by_rule", ListTargetsByRuleResponse, "Targets", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTargetsByRuleResponse(**_response)
-            if response.Targets:
-                results.extend(response.Targets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @event_rules_only
     def list_rules(
@@ -508,13 +463,12 @@ class EventTargetManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListRuleNamesByTargetResponse(**_response)
+            response = self.parse(ListRuleNamesByTargetResponse, _response)
             if response.RuleNames is not None:
                 results.extend(response.RuleNames)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
 
@@ -567,9 +521,8 @@ class EventBusManager(Boto3ModelManager):
         _response = self.client.create_event_bus(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateEventBusResponse(**_response)
+        response = self.parse(CreateEventBusResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateEventBusResponse", response)
 
     def update(
@@ -606,9 +559,8 @@ class EventBusManager(Boto3ModelManager):
         _response = self.client.update_event_bus(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateEventBusResponse(**_response)
+        response = self.parse(UpdateEventBusResponse, _response)
 
-        self.sessionize(response)
         return cast("UpdateEventBusResponse", response)
 
     def delete(self, Name: str) -> None:
@@ -642,10 +594,9 @@ class EventBusManager(Boto3ModelManager):
         _response = self.client.describe_event_bus(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EventBus(**_response)
+        response = self.parse(EventBus, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -679,9 +630,8 @@ class EventBusManager(Boto3ModelManager):
         _response = self.client.list_event_buses(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListEventBusesResponse(**_response)
+        response = self.parse(ListEventBusesResponse, _response)
         if response and response.EventBuses:
-            self.sessionize(response.EventBuses)
             return PrimaryBoto3ModelQuerySet(response.EventBuses)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -711,13 +661,12 @@ class EventBusManager(Boto3ModelManager):
         _response = self.client.put_events(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutEventsResponse(**_response)
+        response = self.parse(PutEventsResponse, _response)
 
         results: "PutEventsResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutEventsResponse", results)
 
     def list_rules(
@@ -753,13 +702,12 @@ class EventBusManager(Boto3ModelManager):
         results: builtins.list["EventRule"] = []
 
         for _response in response_iterator:
-            response = ListRulesResponse(**_response)
+            response = self.parse(ListRulesResponse, _response)
             if response.Rules is not None:
                 results.extend(response.Rules)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[EventRule]", results)
 
 
@@ -897,7 +845,7 @@ class EventRule(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return EventTarget.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(EventTarget).list(**pk)  # type: ignore[arg-type]
 
     def enable(self) -> "None":
         """
@@ -1693,7 +1641,7 @@ class EventTarget(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return EventRule.objects.using(self.session).list_by_target(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(EventRule).list_by_target(**pk)  # type: ignore[arg-type]
 class PutEventsRequestEntry(Boto3Model):
     """
     Represents an event to be submitted.
@@ -13,3 +13,6 @@ class CannotDeleteError(BotocraftError):
 class CannotCreateError(BotocraftError):
     """Exception raised when a resource cannot be created."""
 
+
+class MultipleObjectsReturnedError(BotocraftError):
+    """Exception raised when a lookup expected one object but found several."""
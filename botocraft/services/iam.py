@@ -49,9 +49,8 @@ class IAMAccessKeyManager(Boto3ModelManager):
         _response = self.client.create_access_key(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateAccessKeyResponse(**_response)
+        response = self.parse(CreateAccessKeyResponse, _response)
 
-        self.sessionize(response.AccessKey)
         return cast("IAMAccessKey", response.AccessKey)
 
     def delete(self, AccessKeyId: str, *, UserName: "str | None" = None) -> None:
@@ -88,30 +87,12 @@ class IAMAccessKeyManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_access_keys")
         args: dict[str, Any] = dict(
             UserName=self.serialize(UserName), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_access_keys", ListAccessKeysResponse, "AccessKeyMetadata", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListAccessKeysResponse(**_response)
-            if response.AccessKeyMetadata:
-                results.extend(response.AccessKeyMetadata)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(self, model: "IAMAccessKey") -> None:
         """
@@ -150,13 +131,12 @@ class IAMAccessKeyManager(Boto3ModelManager):
         _response = self.client.get_access_key_last_used(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetAccessKeyLastUsedResponse(**_response)
+        response = self.parse(GetAccessKeyLastUsedResponse, _response)
 
         results: "GetAccessKeyLastUsedResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetAccessKeyLastUsedResponse", results)
 
 
@@ -175,9 +155,8 @@ class IAMGroupManager(Boto3ModelManager):
         _response = self.client.create_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateGroupResponse(**_response)
+        response = self.parse(CreateGroupResponse, _response)
 
-        self.sessionize(response.Group)
         return cast("IAMGroup", response.Group)
 
     def delete(self, GroupName: str) -> None:
@@ -244,10 +223,9 @@ class IAMGroupManager(Boto3ModelManager):
         _response = self.client.get_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetGroupResponse(**_response)
+        response = self.parse(GetGroupResponse, _response)
 
         if response and response.Group:
-            self.sessionize(response.Group)
             return response.Group
         return None
 
@@ -266,13 +244,12 @@ class IAMGroupManager(Boto3ModelManager):
         _response = self.client.get_group_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetGroupPolicyResponse(**_response)
+        response = self.parse(GetGroupPolicyResponse, _response)
 
         results: "GetGroupPolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetGroupPolicyResponse", results)
 
     def list(
@@ -291,30 +268,10 @@ class IAMGroupManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_groups")
         args: dict[str, Any] = dict(
             PathPrefix=self.serialize(PathPrefix), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListGroupsResponse(**_response)
-            if response.Groups:
-                results.extend(response.Groups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_groups", ListGroupsResponse, "Groups", args)
 
     def list_for_user(
         self, UserName: str, *, MaxItems: "int | None" = None
@@ -342,13 +299,12 @@ class IAMGroupManager(Boto3ModelManager):
         results: "builtins.list[IAMGroup]" = []
 
         for _response in response_iterator:
-            response = ListGroupsForUserResponse(**_response)
+            response = self.parse(ListGroupsForUserResponse, _response)
             if response.Groups is not None:
                 results.extend(response.Groups)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[IAMGroup]", results)
 
     @group_inline_policies_only
@@ -379,13 +335,12 @@ class IAMGroupManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListGroupPoliciesResponse(**_response)
+            response = self.parse(ListGroupPoliciesResponse, _response)
             if response.PolicyNames is not None:
                 results.extend(response.PolicyNames)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     @group_attached_policies_only
@@ -425,13 +380,12 @@ class IAMGroupManager(Boto3ModelManager):
         results: "builtins.list[AttachedPolicy]" = []
 
         for _response in response_iterator:
-            response = ListAttachedGroupPoliciesResponse(**_response)
+            response = self.parse(ListAttachedGroupPoliciesResponse, _response)
             if response.AttachedPolicies is not None:
                 results.extend(response.AttachedPolicies)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AttachedPolicy]", results)
 
     def update(
@@ -545,9 +499,8 @@ class InstanceProfileManager(Boto3ModelManager):
         _response = self.client.create_instance_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateInstanceProfileResponse(**_response)
+        response = self.parse(CreateInstanceProfileResponse, _response)
 
-        self.sessionize(response.InstanceProfile)
         return cast("InstanceProfile", response.InstanceProfile)
 
     def delete(self, InstanceProfileName: str) -> None:
@@ -583,10 +536,9 @@ class InstanceProfileManager(Boto3ModelManager):
         _response = self.client.get_instance_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetInstanceProfileResponse(**_response)
+        response = self.parse(GetInstanceProfileResponse, _response)
 
         if response and response.InstanceProfile:
-            self.sessionize(response.InstanceProfile)
             return response.InstanceProfile
         return None
 
@@ -611,30 +563,15 @@ class InstanceProfileManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_instance_profiles")
         args: dict[str, Any] = dict(
             PathPrefix=self.serialize(PathPrefix), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_instance_profiles",
+            ListInstanceProfilesResponse,
+            "InstanceProfiles",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListInstanceProfilesResponse(**_response)
-            if response.InstanceProfiles:
-                results.extend(response.InstanceProfiles)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def list_for_role(
         self, RoleName: str, *, MaxItems: "int | None" = None
@@ -667,13 +604,12 @@ class InstanceProfileManager(Boto3ModelManager):
         results: "builtins.list[InstanceProfile]" = []
 
         for _response in response_iterator:
-            response = ListInstanceProfilesForRoleResponse(**_response)
+            response = self.parse(ListInstanceProfilesForRoleResponse, _response)
             if response.InstanceProfiles is not None:
                 results.extend(response.InstanceProfiles)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[InstanceProfile]", results)
 
     def add_role(self, InstanceProfileName: str, RoleName: str) -> "None":
@@ -728,9 +664,8 @@ class IAMLoginProfileManager(Boto3ModelManager):
         _response = self.client.create_login_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateLoginProfileResponse(**_response)
+        response = self.parse(CreateLoginProfileResponse, _response)
 
-        self.sessionize(response.LoginProfile)
         return cast("IAMLoginProfile", response.LoginProfile)
 
     def delete(self, UserName: str) -> None:
@@ -761,10 +696,9 @@ class IAMLoginProfileManager(Boto3ModelManager):
         _response = self.client.get_login_profile(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetLoginProfileResponse(**_response)
+        response = self.parse(GetLoginProfileResponse, _response)
 
         if response and response.LoginProfile:
-            self.sessionize(response.LoginProfile)
             return response.LoginProfile
         return None
 
@@ -810,9 +744,8 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
         _response = self.client.create_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePolicyResponse(**_response)
+        response = self.parse(CreatePolicyResponse, _response)
 
-        self.sessionize(response.Policy)
         return cast("IAMPolicy", response.Policy)
 
     def delete(self, PolicyArn: str) -> None:
@@ -847,10 +780,9 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
         _response = self.client.get_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetPolicyResponse(**_response)
+        response = self.parse(GetPolicyResponse, _response)
 
         if response and response.Policy:
-            self.sessionize(response.Policy)
             return response.Policy
         return None
 
@@ -887,7 +819,6 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_policies")
         args: dict[str, Any] = dict(
             Scope=self.serialize(Scope),
             OnlyAttached=self.serialize(OnlyAttached),
@@ -895,26 +826,7 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
             PolicyUsageFilter=self.serialize(PolicyUsageFilter),
             MaxItems=self.serialize(MaxItems),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListPoliciesResponse(**_response)
-            if response.Policies:
-                results.extend(response.Policies)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_policies", ListPoliciesResponse, "Policies", args)
 
     def list_entities(
         self,
@@ -961,13 +873,12 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
         _response = self.client.list_entities_for_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListEntitiesForPolicyResponse(**_response)
+        response = self.parse(ListEntitiesForPolicyResponse, _response)
 
         results: "ListEntitiesForPolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ListEntitiesForPolicyResponse", results)
 
     def list_versions(
@@ -998,13 +909,12 @@ class IAMPolicyManager(IAMPolicyManagerMixin, Boto3ModelManager):
         results: "builtins.list[IAMPolicyVersion]" = []
 
         for _response in response_iterator:
-            response = ListPolicyVersionsResponse(**_response)
+            response = self.parse(ListPolicyVersionsResponse, _response)
             if response.Versions is not None:
                 results.extend(response.Versions)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[IAMPolicyVersion]", results)
 
     def set_default_version(self, PolicyArn: str, VersionId: str) -> "None":
@@ -1057,9 +967,8 @@ class IAMPolicyVersionManager(Boto3ModelManager):
         _response = self.client.create_policy_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePolicyVersionResponse(**_response)
+        response = self.parse(CreatePolicyVersionResponse, _response)
 
-        self.sessionize(response.PolicyVersion)
         return cast("IAMPolicyVersion", response.PolicyVersion)
 
     def delete(self, PolicyArn: str, VersionId: str) -> None:
@@ -1094,10 +1003,9 @@ class IAMPolicyVersionManager(Boto3ModelManager):
         _response = self.client.get_policy_version(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetPolicyVersionResponse(**_response)
+        response = self.parse(GetPolicyVersionResponse, _response)
 
         if response and response.PolicyVersion:
-            self.sessionize(response.PolicyVersion)
             return response.PolicyVersion
         return None
 
@@ -1118,30 +1026,12 @@ class IAMPolicyVersionManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_policy_versions")
         args: dict[str, Any] = dict(
             PolicyArn=self.serialize(PolicyArn), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_policy_versions", ListPolicyVersionsResponse, "Versions", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListPolicyVersionsResponse(**_response)
-            if response.Versions:
-                results.extend(response.Versions)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def set_default(self, PolicyArn: str, VersionId: str) -> "None":
         """
@@ -1185,9 +1075,8 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.create_role(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRoleResponse(**_response)
+        response = self.parse(CreateRoleResponse, _response)
 
-        self.sessionize(response.Role)
         return cast("IAMRole", response.Role)
 
     def create_service_linked_role(
@@ -1223,13 +1112,12 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.create_service_linked_role(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateServiceLinkedRoleResponse(**_response)
+        response = self.parse(CreateServiceLinkedRoleResponse, _response)
 
         results: "IAMRole" = None
         if response is not None:
             results = response.Role
 
-        self.sessionize(results)
         return cast("IAMRole", results)
 
     def delete_service_linked_role(self, RoleName: str) -> str:
@@ -1243,13 +1131,12 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.delete_service_linked_role(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteServiceLinkedRoleResponse(**_response)
+        response = self.parse(DeleteServiceLinkedRoleResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.DeletionTaskId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete(self, RoleName: str) -> None:
@@ -1307,10 +1194,9 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.get_role(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetRoleResponse(**_response)
+        response = self.parse(GetRoleResponse, _response)
 
         if response and response.Role:
-            self.sessionize(response.Role)
             return response.Role
         return None
 
@@ -1328,13 +1214,12 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.get_role_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetRolePolicyResponse(**_response)
+        response = self.parse(GetRolePolicyResponse, _response)
 
         results: "GetRolePolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetRolePolicyResponse", results)
 
     def list(
@@ -1356,30 +1241,10 @@ class IAMRoleManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_roles")
         args: dict[str, Any] = dict(
             PathPrefix=self.serialize(PathPrefix), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListRolesResponse(**_response)
-            if response.Roles:
-                results.extend(response.Roles)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_roles", ListRolesResponse, "Roles", args)
 
     @role_inline_policies_only
     def list_policies(
@@ -1408,13 +1273,12 @@ class IAMRoleManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListRolePoliciesResponse(**_response)
+            response = self.parse(ListRolePoliciesResponse, _response)
             if response.PolicyNames is not None:
                 results.extend(response.PolicyNames)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     @role_attached_policies_only
@@ -1454,13 +1318,12 @@ class IAMRoleManager(Boto3ModelManager):
         results: "builtins.list[AttachedPolicy]" = []
 
         for _response in response_iterator:
-            response = ListAttachedRolePoliciesResponse(**_response)
+            response = self.parse(ListAttachedRolePoliciesResponse, _response)
             if response.AttachedPolicies is not None:
                 results.extend(response.AttachedPolicies)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AttachedPolicy]", results)
 
     def list_instance_profiles(
@@ -1494,13 +1357,12 @@ class IAMRoleManager(Boto3ModelManager):
         results: "builtins.list[InstanceProfile]" = []
 
         for _response in response_iterator:
-            response = ListInstanceProfilesForRoleResponse(**_response)
+            response = self.parse(ListInstanceProfilesForRoleResponse, _response)
             if response.InstanceProfiles is not None:
                 results.extend(response.InstanceProfiles)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[InstanceProfile]", results)
 
     def update(self, model: "IAMRole") -> None:
@@ -1557,13 +1419,12 @@ class IAMRoleManager(Boto3ModelManager):
         _response = self.client.update_role_description(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateRoleDescriptionResponse(**_response)
+        response = self.parse(UpdateRoleDescriptionResponse, _response)
 
         results: "UpdateRoleDescriptionResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("UpdateRoleDescriptionResponse", results)
 
     def add_to_instance_profile(
@@ -1684,9 +1545,8 @@ class IAMUserManager(Boto3ModelManager):
         _response = self.client.create_user(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateUserResponse(**_response)
+        response = self.parse(CreateUserResponse, _response)
 
-        self.sessionize(response.User)
         return cast("IAMUser", response.User)
 
     def delete(self, UserName: str) -> None:
@@ -1711,10 +1571,9 @@ class IAMUserManager(Boto3ModelManager):
         _response = self.client.get_user(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetUserResponse(**_response)
+        response = self.parse(GetUserResponse, _response)
 
         if response and response.User:
-            self.sessionize(response.User)
             return response.User
         return None
 
@@ -1732,13 +1591,12 @@ class IAMUserManager(Boto3ModelManager):
         _response = self.client.get_user_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetUserPolicyResponse(**_response)
+        response = self.parse(GetUserPolicyResponse, _response)
 
         results: "GetUserPolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetUserPolicyResponse", results)
 
     def list(
@@ -1760,30 +1618,10 @@ class IAMUserManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_users")
         args: dict[str, Any] = dict(
             PathPrefix=self.serialize(PathPrefix), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListUsersResponse(**_response)
-            if response.Users:
-                results.extend(response.Users)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_users", ListUsersResponse, "Users", args)
 
     def update(
         self,
@@ -1867,13 +1705,12 @@ class IAMUserManager(Boto3ModelManager):
         results: "builtins.list[IAMGroup]" = []
 
         for _response in response_iterator:
-            response = ListGroupsForUserResponse(**_response)
+            response = self.parse(ListGroupsForUserResponse, _response)
             if response.Groups is not None:
                 results.extend(response.Groups)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[IAMGroup]", results)
 
     def attach_policy(self, UserName: str, PolicyArn: str) -> "None":
@@ -1936,13 +1773,12 @@ class IAMUserManager(Boto3ModelManager):
         results: "builtins.list[str]" = []
 
         for _response in response_iterator:
-            response = ListUserPoliciesResponse(**_response)
+            response = self.parse(ListUserPoliciesResponse, _response)
             if response.PolicyNames is not None:
                 results.extend(response.PolicyNames)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[str]", results)
 
     @iam_attached_policies_only
@@ -1982,13 +1818,12 @@ class IAMUserManager(Boto3ModelManager):
         results: "builtins.list[AttachedPolicy]" = []
 
         for _response in response_iterator:
-            response = ListAttachedUserPoliciesResponse(**_response)
+            response = self.parse(ListAttachedUserPoliciesResponse, _response)
             if response.AttachedPolicies is not None:
                 results.extend(response.AttachedPolicies)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AttachedPolicy]", results)
 
     def put_policy(self, UserName: str, PolicyName: str, PolicyDocument: str) -> "None":
@@ -2074,9 +1909,8 @@ class IAMSSHPublicKeyManager(Boto3ModelManager):
         _response = self.client.upload_ssh_public_key(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UploadSSHPublicKeyResponse(**_response)
+        response = self.parse(UploadSSHPublicKeyResponse, _response)
 
-        self.sessionize(response.SSHPublicKey)
         return cast("IAMSSHPublicKey", response.SSHPublicKey)
 
     def delete(self, UserName: str, SSHPublicKeyId: str) -> None:
@@ -2117,10 +1951,9 @@ class IAMSSHPublicKeyManager(Boto3ModelManager):
         _response = self.client.get_ssh_public_key(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSSHPublicKeyResponse(**_response)
+        response = self.parse(GetSSHPublicKeyResponse, _response)
 
         if response and response.SSHPublicKey:
-            self.sessionize(response.SSHPublicKey)
             return response.SSHPublicKey
         return None
 
@@ -2142,30 +1975,12 @@ class IAMSSHPublicKeyManager(Boto3ModelManager):
                 additional items exist beyond the maximum you specify, the
                 ``IsTruncated`` response element is ``true``.
         """
-        paginator = self.client.get_paginator("list_ssh_public_keys")
         args: dict[str, Any] = dict(
             UserName=self.serialize(UserName), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_ssh_public_keys", ListSSHPublicKeysResponse, "SSHPublicKeys", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListSSHPublicKeysResponse(**_response)
-            if response.SSHPublicKeys:
-                results.extend(response.SSHPublicKeys)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(self, model: "IAMSSHPublicKey") -> None:
         """
@@ -2288,7 +2103,7 @@ class IAMAccessKey(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return IAMUser.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(IAMUser).get(**pk)  # type: ignore[arg-type]
 
     def last_used(self) -> "GetAccessKeyLastUsedResponse":
         """
@@ -2418,7 +2233,7 @@ The date and time, in `ISO 8601 date-time format <http://www.iso.org/iso/iso8601
             )
         except AttributeError:
             return []
-        return IAMUser.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(IAMUser).list(**pk)  # type: ignore[arg-type]
 
     def add_user(self, UserName: str) -> "None":
         """
@@ -0,0 +1,439 @@
+"""
+Identity maps: reuse models fetched with ``get()`` across model instances.
+
+Relationship properties are cached on each model instance, so 1,000 tasks
+that all belong to the same cluster still describe that cluster 1,000 times.
+An :py:class:`IdentityMap` remembers what each manager's ``get()`` returned,
+keyed by session, manager class and arguments (and by ARN), so within a unit
+of work each resource is described at most once per refresh window.
+
+Identity maps are off by default.  Bind one to a block of code with
+:py:func:`identity_map`, or turn on a process-wide map for every session with
+the ``identity_map.enabled`` setting in
+:py:class:`botocraft.config.BotocraftSettings`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any
+
+from botocraft.clients import PoolStats
+
+from .trusted import parse_mode, shaped
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from botocraft.config import IdentityMapSettings
+
+    from .abstract import Boto3ModelManager
+
+#: The identity map bound by :py:func:`identity_map` for the current thread or
+#: task, if any.
+_SCOPED_MAP: ContextVar[IdentityMap | None] = ContextVar(
+    "botocraft_identity_map", default=None
+)
+#: Guards creation of the process-wide identity map.
+_DEFAULT_MAP_LOCK = threading.Lock()
+#: The process-wide identity map, once created.
+_DEFAULT_MAP: IdentityMap | None = None
+
+#: Manager methods that change AWS resources, and so invalidate the
+#: identity map entries of their manager.
+WRITE_METHODS: frozenset[str] = frozenset(
+    {"create", "update", "partial_update", "delete"}
+)
+
+
+@lru_cache(maxsize=1)
+def _settings() -> IdentityMapSettings:
+    """
+    Load the identity map settings once per process.
+
+    Returns:
+        The configured identity map settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().identity_map
+
+
+class IdentityMap:
+    """
+    A thread-safe map of fetched models, bounded by age and size.
+
+    Entries are keyed by the ``get()`` call that fetched them, and by the
+    model's ARN, so ``get(cluster="prod")`` and a later
+    ``get(cluster="arn:aws:ecs:...:cluster/prod")`` share one model.  Each
+    entry keeps a strong reference to its session, so the ``id()`` in the key
+    cannot be recycled while the entry is live.
+
+    Args:
+        ttl_seconds: How long an entry is reused, or ``None`` to read it from
+            :py:class:`botocraft.config.BotocraftSettings`.
+        max_size: Maximum number of entries, or ``None`` to read it from
+            :py:class:`botocraft.config.BotocraftSettings`.
+
+    """
+
+    def __init__(
+        self, ttl_seconds: float | None = None, max_size: int | None = None
+    ) -> None:
+        settings = _settings()
+        #: Seconds an entry is reused before it expires.
+        self.ttl_seconds = settings.ttl_seconds if ttl_seconds is None else ttl_seconds
+        #: Maximum number of entries to keep.
+        self.max_size = settings.max_size if max_size is None else max_size
+        self._entries: OrderedDict[tuple[Any, ...], tuple[Any, float, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _keys(
+        manager: Boto3ModelManager, arguments: tuple[tuple[str, Any], ...]
+    ) -> list[tuple[Any, ...]]:
+        """
+        Return the keys a ``get()`` call with ``arguments`` may be stored under.
+
+        Args:
+            manager: The manager ``get()`` was called on.
+            arguments: The frozen call arguments.
+
+        Returns:
+            The call key, then the ARN key if the only argument is an ARN.
+
+        """
+        base = (id(manager.session), manager.__class__, parse_mode())
+        keys = [(*base, "call", arguments)]
+        if len(arguments) == 1:
+            value = arguments[0][1]
+            if isinstance(value, str) and value.startswith("arn:"):
+                keys.append((*base, "arn", value))
+        return keys
+
+    def lookup(
+        self, manager: Boto3ModelManager, arguments: tuple[tuple[str, Any], ...]
+    ) -> tuple[bool, Any]:
+        """
+        Look up the model a ``get()`` call would return.
+
+        Args:
+            manager: The manager ``get()`` is being called on.
+            arguments: The frozen call arguments, from :py:func:`freeze`.
+
+        Returns:
+            ``(True, model)`` on a hit, or ``(False, None)``.
+
+        """
+        session = manager.session
+        now = time.monotonic()
+        with self._lock:
+            for key in self._keys(manager, arguments):
+                entry = self._entries.get(key)
+                if entry is None or entry[0] is not session:
+                    continue
+                if entry[1] <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, entry[2]
+            self._misses += 1
+        return False, None
+
+    def store(
+        self,
+        manager: Boto3ModelManager,
+        arguments: tuple[tuple[str, Any], ...],
+        model: Any,
+    ) -> None:
+        """
+        Remember that ``get()`` with ``arguments`` returned ``model``.
+
+        Args:
+            manager: The manager ``get()`` was called on.
+            arguments: The frozen call arguments, from :py:func:`freeze`.
+            model: The model returned.
+
+        """
+        session = manager.session
+        keys = self._keys(manager, arguments)
+        base = keys[0][:3]
+        try:
+            arn = model.arn
+        except (AttributeError, NotImplementedError, ValueError):
+            arn = None
+        if isinstance(arn, str):
+            keys.append((*base, "arn", arn))
+        entry = (session, time.monotonic() + self.ttl_seconds, model)
+        with self._lock:
+            for key in keys:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > max(self.max_size, 0):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, manager_class: type[Boto3ModelManager]) -> None:
+        """
+        Drop every entry fetched through ``manager_class``.
+
+        Args:
+            manager_class: The manager class whose entries to drop.
+
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[1] is manager_class]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> PoolStats:
+        """
+        Return the current reuse counters for this map.
+
+        Returns:
+            A snapshot of the map counters.
+
+        """
+        with self._lock:
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def default_identity_map() -> IdentityMap | None:
+    """
+    Return the process-wide identity map, if the settings enable it.
+
+    Returns:
+        The process-wide identity map, or ``None``.
+
+    """
+    global _DEFAULT_MAP  # noqa: PLW0603
+    if _DEFAULT_MAP is None and _settings().enabled:
+        with _DEFAULT_MAP_LOCK:
+            if _DEFAULT_MAP is None:
+                _DEFAULT_MAP = IdentityMap()
+    return _DEFAULT_MAP
+
+
+def current_identity_map() -> IdentityMap | None:
+    """
+    Return the identity map ``get()`` should consult, if any.
+
+    This is the map bound by the innermost :py:func:`identity_map` block in
+    the current thread or asyncio task, falling back to
+    :py:func:`default_identity_map`.
+
+    Returns:
+        The identity map in scope, or ``None``.
+
+    """
+    mapping = _SCOPED_MAP.get()
+    return default_identity_map() if mapping is None else mapping
+
+
+def mapped() -> bool:
+    """
+    Return whether :py:func:`identity_mapped` and
+    :py:func:`invalidates_identity` methods have an identity map to use.
+
+    Returns:
+        Whether an identity map is in scope.
+
+    """
+    return current_identity_map() is not None
+
+
+@contextmanager
+def identity_map(
+    ttl_seconds: float | None = None, max_size: int | None = None
+) -> Iterator[IdentityMap]:
+    """
+    Reuse models fetched with ``get()`` within a block.
+
+    Inside the block, each manager ``get()`` call, and so each relationship
+    property, first looks in a fresh :py:class:`IdentityMap`.  The binding
+    lives in a :py:class:`contextvars.ContextVar`, like
+    :py:func:`botocraft.clients.using_session`.
+
+    Example:
+        .. code-block:: python
+
+            with identity_map():
+                for task in Task.objects.list(cluster="prod"):
+                    # Describes the cluster once, not once per task
+                    print(task.cluster.clusterName)
+
+    Args:
+        ttl_seconds: How long a fetched model is reused.  Defaults to the
+            ``identity_map.ttl_seconds`` setting.
+        max_size: Maximum number of entries.  Defaults to the
+            ``identity_map.max_size`` setting.
+
+    Yields:
+        The identity map now in scope.
+
+    """
+    mapping = IdentityMap(ttl_seconds=ttl_seconds, max_size=max_size)
+    token = _SCOPED_MAP.set(mapping)
+    try:
+        yield mapping
+    finally:
+        _SCOPED_MAP.reset(token)
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Make an argument value hashable.
+
+    Args:
+        value: The argument value.
+
+    Returns:
+        A hashable equivalent of ``value``.
+
+    """
+    if isinstance(value, list | tuple):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_value(v)) for k, v in value.items()))
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    Return the signature of ``func``.  Cached per function.
+
+    Args:
+        func: The function to inspect.
+
+    Returns:
+        Its signature.
+
+    """
+    return inspect.signature(func)
+
+
+def freeze(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[tuple[str, Any], ...] | None:
+    """
+    Build the hashable identity map key for a call of the method ``func``.
+
+    Positional and keyword arguments are normalised to names, and ``None``
+    arguments are dropped, so ``get("prod")`` and ``get(cluster="prod")``
+    share a key.
+
+    Args:
+        func: The unbound manager method being called.
+        args: The positional arguments, excluding ``self``.
+        kwargs: The keyword arguments.
+
+    Returns:
+        The frozen arguments, or ``None`` if they cannot be made hashable.
+
+    """
+    try:
+        bound = _signature(func).bind(None, *args, **kwargs)
+        arguments = list(bound.arguments.items())[1:]
+        frozen = tuple(
+            sorted(
+                (name, _freeze_value(value))
+                for name, value in arguments
+                if value is not None
+            )
+        )
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+def identity_mapped(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a manager ``get()`` method consult the identity map in scope.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    every ``get()`` its subclasses define.  Calls that return ``None``, and
+    calls given ``only`` or ``raw``, are not remembered.  Models validated
+    and models built without validation or lazily are remembered apart (see
+    :py:func:`~botocraft.services.trusted.parse_mode`).
+
+    Args:
+        func: The ``get()`` method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        mapping = current_identity_map()
+        if mapping is None or shaped():
+            return func(self, *args, **kwargs)
+        arguments = freeze(func, args, kwargs)
+        if arguments is None:
+            return func(self, *args, **kwargs)
+        found, model = mapping.lookup(self, arguments)
+        if found:
+            return model
+        model = func(self, *args, **kwargs)
+        if model is not None:
+            mapping.store(self, arguments, model)
+        return model
+
+    return wrapper
+
+
+def invalidates_identity(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make a manager write method drop its manager's identity map entries.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    every method named in :py:data:`WRITE_METHODS` its subclasses define.
+
+    Args:
+        func: The write method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            for mapping in {_SCOPED_MAP.get(), _DEFAULT_MAP} - {None}:
+                mapping.invalidate(self.__class__)  # type: ignore[union-attr]
+
+    return wrapper
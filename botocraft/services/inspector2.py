@@ -45,9 +45,8 @@ class CisScanConfigurationManager(CisScanConfigurationManagerMixin, Boto3ModelMa
         _response = self.client.create_cis_scan_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCisScanConfigurationResponse(**_response)
+        response = self.parse(CreateCisScanConfigurationResponse, _response)
 
-        self.sessionize(response.scanConfigurationArn)
         return cast("str", response.scanConfigurationArn)
 
     def delete(self, scanConfigurationArn: str) -> "CisScanConfiguration":
@@ -63,7 +62,7 @@ class CisScanConfigurationManager(CisScanConfigurationManagerMixin, Boto3ModelMa
         _response = self.client.delete_cis_scan_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteCisScanConfigurationResponse(**_response)
+        response = self.parse(DeleteCisScanConfigurationResponse, _response)
         return cast("CisScanConfiguration", response.scanConfigurationArn)
 
     def update(self, model: "CisScanConfiguration") -> str:
@@ -84,9 +83,8 @@ class CisScanConfigurationManager(CisScanConfigurationManagerMixin, Boto3ModelMa
         _response = self.client.update_cis_scan_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateCisScanConfigurationResponse(**_response)
+        response = self.parse(UpdateCisScanConfigurationResponse, _response)
 
-        self.sessionize(response.scanConfigurationArn)
         return cast("str", response.scanConfigurationArn)
 
     def list(
@@ -104,32 +102,17 @@ class CisScanConfigurationManager(CisScanConfigurationManagerMixin, Boto3ModelMa
             sortBy: The CIS scan configuration sort by order.
             sortOrder: The CIS scan configuration sort order order.
         """
-        paginator = self.client.get_paginator("list_cis_scan_configurations")
         args: dict[str, Any] = dict(
             filterCriteria=self.serialize(filterCriteria),
             sortBy=self.serialize(sortBy),
             sortOrder=self.serialize(sortOrder),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_cis_scan_configurations",
+            ListCisScanConfigurationsResponse,
+            "scanConfigurations",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListCisScanConfigurationsResponse(**_response)
-            if response.scanConfigurations:
-                results.extend(response.scanConfigurations)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class Inspector2FilterManager(Boto3ModelManager):
@@ -158,9 +141,8 @@ class Inspector2FilterManager(Boto3ModelManager):
         _response = self.client.create_filter(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFilterResponse(**_response)
+        response = self.parse(CreateFilterResponse, _response)
 
-        self.sessionize(response.arn)
         return cast("str", response.arn)
 
     def delete(self, arn: str) -> "Inspector2Filter":
@@ -174,7 +156,7 @@ class Inspector2FilterManager(Boto3ModelManager):
         _response = self.client.delete_filter(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteFilterResponse(**_response)
+        response = self.parse(DeleteFilterResponse, _response)
         return cast("Inspector2Filter", response.arn)
 
     def update(
@@ -205,9 +187,8 @@ class Inspector2FilterManager(Boto3ModelManager):
         _response = self.client.update_filter(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateFilterResponse(**_response)
+        response = self.parse(UpdateFilterResponse, _response)
 
-        self.sessionize(response.arn)
         return cast("str", response.arn)
 
     def get(self, arn: str) -> "Inspector2Filter | None":
@@ -221,10 +202,9 @@ class Inspector2FilterManager(Boto3ModelManager):
         _response = self.client.list_filters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListFiltersResponse(**_response)
+        response = self.parse(ListFiltersResponse, _response)
 
         if response and response.filters:
-            self.sessionize(response.filters[0])
             return response.filters[0]
         return None
 
@@ -241,30 +221,10 @@ class Inspector2FilterManager(Boto3ModelManager):
             arns: The Amazon resource number (ARN) of the filter.
             action: The action the filter applies to matched findings.
         """
-        paginator = self.client.get_paginator("list_filters")
         args: dict[str, Any] = dict(
             arns=self.serialize(arns), action=self.serialize(action)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListFiltersResponse(**_response)
-            if response.filters:
-                results.extend(response.filters)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_filters", ListFiltersResponse, "filters", args)
 
 
 class FindingManager(ReadonlyBoto3ModelManager):
@@ -290,10 +250,9 @@ class FindingManager(ReadonlyBoto3ModelManager):
         _response = self.client.list_findings(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListFindingsResponse(**_response)
+        response = self.parse(ListFindingsResponse, _response)
 
         if response and response.findings:
-            self.sessionize(response.findings[0])
             return response.findings[0]
         return None
 
@@ -310,31 +269,11 @@ class FindingManager(ReadonlyBoto3ModelManager):
             filterCriteria: Details on the filters to apply to your finding results.
             sortCriteria: Details on the sort criteria to apply to your finding results.
         """
-        paginator = self.client.get_paginator("list_findings")
         args: dict[str, Any] = dict(
             filterCriteria=self.serialize(filterCriteria),
             sortCriteria=self.serialize(sortCriteria),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListFindingsResponse(**_response)
-            if response.findings:
-                results.extend(response.findings)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_findings", ListFindingsResponse, "findings", args)
 
     def list_aggregations(
         self,
@@ -381,13 +320,12 @@ class FindingManager(ReadonlyBoto3ModelManager):
         results: "builtins.list[AggregationResponse]" = []
 
         for _response in response_iterator:
-            response = ListFindingAggregationsResponse(**_response)
+            response = self.parse(ListFindingAggregationsResponse, _response)
             if response.responses is not None:
                 results.extend(response.responses)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[AggregationResponse]", results)
 
     def batch_get_finding_details(
@@ -403,13 +341,12 @@ class FindingManager(ReadonlyBoto3ModelManager):
         _response = self.client.batch_get_finding_details(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = BatchGetFindingDetailsResponse(**_response)
+        response = self.parse(BatchGetFindingDetailsResponse, _response)
 
         results: "BatchGetFindingDetailsResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("BatchGetFindingDetailsResponse", results)
 
 
@@ -436,9 +373,8 @@ class FindingsReportManager(Boto3ModelManager):
         _response = self.client.create_findings_report(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFindingsReportResponse(**_response)
+        response = self.parse(CreateFindingsReportResponse, _response)
 
-        self.sessionize(response.reportId)
         return cast("str", response.reportId)
 
     def get_status(
@@ -454,13 +390,12 @@ class FindingsReportManager(Boto3ModelManager):
         _response = self.client.get_findings_report_status(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetFindingsReportStatusResponse(**_response)
+        response = self.parse(GetFindingsReportStatusResponse, _response)
 
         results: "GetFindingsReportStatusResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetFindingsReportStatusResponse", results)
 
     def create_report(
@@ -493,13 +428,12 @@ class FindingsReportManager(Boto3ModelManager):
         _response = self.client.create_findings_report(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateFindingsReportResponse(**_response)
+        response = self.parse(CreateFindingsReportResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.reportId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def cancel_report(self, reportId: str) -> str:
@@ -513,13 +447,12 @@ class FindingsReportManager(Boto3ModelManager):
         _response = self.client.cancel_findings_report(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CancelFindingsReportResponse(**_response)
+        response = self.parse(CancelFindingsReportResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.reportId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -534,28 +467,13 @@ class DelegatedAdminAccountManager(Boto3ModelManager):
         Lists information about the Amazon Inspector delegated administrator of your
         organization.
         """
-        paginator = self.client.get_paginator("list_delegated_admin_accounts")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_delegated_admin_accounts",
+            ListDelegatedAdminAccountsResponse,
+            "delegatedAdminAccounts",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListDelegatedAdminAccountsResponse(**_response)
-            if response.delegatedAdminAccounts:
-                results.extend(response.delegatedAdminAccounts)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     @convert_delegated_admin
     def get(
@@ -569,10 +487,9 @@ class DelegatedAdminAccountManager(Boto3ModelManager):
         _response = self.client.get_delegated_admin_account(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetDelegatedAdminAccountResponse(**_response)
+        response = self.parse(GetDelegatedAdminAccountResponse, _response)
 
         if response and response.delegatedAdmin:
-            self.sessionize(response.delegatedAdmin)
             return response.delegatedAdmin
         return None
 
@@ -597,13 +514,12 @@ class DelegatedAdminAccountManager(Boto3ModelManager):
         _response = self.client.enable_delegated_admin_account(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EnableDelegatedAdminAccountResponse(**_response)
+        response = self.parse(EnableDelegatedAdminAccountResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.delegatedAdminAccountId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def disable(self, delegatedAdminAccountId: str) -> str:
@@ -620,13 +536,12 @@ class DelegatedAdminAccountManager(Boto3ModelManager):
         _response = self.client.disable_delegated_admin_account(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisableDelegatedAdminAccountResponse(**_response)
+        response = self.parse(DisableDelegatedAdminAccountResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.delegatedAdminAccountId
 
-        self.sessionize(results)
         return cast("str", results)
 
 
@@ -643,28 +558,13 @@ class VulnerabilityManager(VulnerabilityManagerMixin, ReadonlyBoto3ModelManager)
             filterCriteria: The criteria used to filter the results of a vulnerability
                 search.
         """
-        paginator = self.client.get_paginator("search_vulnerabilities")
         args: dict[str, Any] = dict(filterCriteria=self.serialize(filterCriteria))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "search_vulnerabilities",
+            SearchVulnerabilitiesResponse,
+            "vulnerabilities",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = SearchVulnerabilitiesResponse(**_response)
-            if response.vulnerabilities:
-                results.extend(response.vulnerabilities)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
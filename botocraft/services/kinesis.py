@@ -60,10 +60,9 @@ class KinesisStreamManager(KinesisStreamManagerMixin, Boto3ModelManager):
         _response = self.client.describe_stream_summary(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeStreamSummaryOutput(**_response)
+        response = self.parse(DescribeStreamSummaryOutput, _response)
 
         if response and response.StreamDescriptionSummary:
-            self.sessionize(response.StreamDescriptionSummary)
             return response.StreamDescriptionSummary
         return None
 
@@ -83,31 +82,11 @@ class KinesisStreamManager(KinesisStreamManagerMixin, Boto3ModelManager):
                 most 100 results are returned.
             ExclusiveStartStreamName: The name of the stream to start the list with.
         """
-        paginator = self.client.get_paginator("list_streams")
         args: dict[str, Any] = dict(
             Limit=self.serialize(Limit),
             ExclusiveStartStreamName=self.serialize(ExclusiveStartStreamName),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListStreamsOutput(**_response)
-            if response.StreamSummaries:
-                results.extend(response.StreamSummaries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_streams", ListStreamsOutput, "StreamSummaries", args)
 
     def delete(
         self,
@@ -181,13 +160,12 @@ class KinesisStreamManager(KinesisStreamManagerMixin, Boto3ModelManager):
         _response = self.client.update_shard_count(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateShardCountOutput(**_response)
+        response = self.parse(UpdateShardCountOutput, _response)
 
         results: "UpdateShardCountOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("UpdateShardCountOutput", results)
 
     def update_stream_mode(
@@ -267,13 +245,12 @@ class KinesisStreamManager(KinesisStreamManagerMixin, Boto3ModelManager):
         _response = self.client.update_stream_warm_throughput(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateStreamWarmThroughputOutput(**_response)
+        response = self.parse(UpdateStreamWarmThroughputOutput, _response)
 
         results: "UpdateStreamWarmThroughputOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("UpdateStreamWarmThroughputOutput", results)
 
     def update_max_record_size(
@@ -356,10 +333,9 @@ class KinesisConsumerManager(KinesisConsumerManagerMixin, Boto3ModelManager):
         _response = self.client.describe_stream_consumer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeStreamConsumerOutput(**_response)
+        response = self.parse(DescribeStreamConsumerOutput, _response)
 
         if response and response.ConsumerDescription:
-            self.sessionize(response.ConsumerDescription)
             return response.ConsumerDescription
         return None
 
@@ -391,32 +367,14 @@ class KinesisConsumerManager(KinesisConsumerManagerMixin, Boto3ModelManager):
                 streams you want to list the consumers for.
             StreamId: Not Implemented. Reserved for future use.
         """
-        paginator = self.client.get_paginator("list_stream_consumers")
         args: dict[str, Any] = dict(
             StreamARN=self.serialize(StreamARN),
             StreamCreationTimestamp=self.serialize(StreamCreationTimestamp),
             StreamId=self.serialize(StreamId),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_stream_consumers", ListStreamConsumersOutput, "Consumers", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListStreamConsumersOutput(**_response)
-            if response.Consumers:
-                results.extend(response.Consumers)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(
         self,
@@ -691,7 +649,7 @@ class KinesisStream(TagsDictMixin, KinesisStreamModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return KinesisShard.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(KinesisShard).list(**pk)  # type: ignore[arg-type]
 
     def update_shard_count(
         self, TargetShardCount: int, ScalingType: Literal["UNIFORM_SCALING"]
@@ -79,9 +79,8 @@ class KMSKeyManager(Boto3ModelManager):
         _response = self.client.create_key(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateKeyResponse(**_response)
+        response = self.parse(CreateKeyResponse, _response)
 
-        self.sessionize(response.KeyMetadata)
         return cast("KMSKey", response.KeyMetadata)
 
     def get(
@@ -105,10 +104,9 @@ class KMSKeyManager(Boto3ModelManager):
         _response = self.client.describe_key(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeKeyResponse(**_response)
+        response = self.parse(DescribeKeyResponse, _response)
 
         if response and response.KeyMetadata:
-            self.sessionize(response.KeyMetadata)
             return response.KeyMetadata
         return None
 
@@ -124,28 +122,8 @@ class KMSKeyManager(Boto3ModelManager):
                 return more than the specified number of items, but it might return
                 fewer.
         """
-        paginator = self.client.get_paginator("list_keys")
         args: dict[str, Any] = dict(Limit=self.serialize(Limit))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListKeysResponse(**_response)
-            if response.Keys:
-                results.extend(response.Keys)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_keys", ListKeysResponse, "Keys", args)
 
     def delete(
         self, KeyId: str, *, PendingWindowInDays: int = 7
@@ -179,7 +157,7 @@ class KMSKeyManager(Boto3ModelManager):
         _response = self.client.schedule_key_deletion(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ScheduleKeyDeletionResponse(**_response)
+        response = self.parse(ScheduleKeyDeletionResponse, _response)
         return response
 
     def enable(self, KeyId: str) -> None:
@@ -220,13 +198,12 @@ class KMSKeyManager(Boto3ModelManager):
         _response = self.client.cancel_key_deletion(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CancelKeyDeletionResponse(**_response)
+        response = self.parse(CancelKeyDeletionResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.KeyId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def create_alias(self, AliasName: str, TargetKeyId: str) -> "None":
@@ -113,10 +113,9 @@ class LogGroupManager(LogGroupManagerMixin, Boto3ModelManager):
         _response = self.client.describe_log_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeLogGroupsResponse(**_response)
+        response = self.parse(DescribeLogGroupsResponse, _response)
 
         if response and response.logGroups:
-            self.sessionize(response.logGroups[0])
             return response.logGroups[0]
         return None
 
@@ -165,7 +164,6 @@ class LogGroupManager(LogGroupManagerMixin, Boto3ModelManager):
                 only other filter that you can choose to specify is
                 ``includeLinkedAccounts``.
         """
-        paginator = self.client.get_paginator("describe_log_groups")
         args: dict[str, Any] = dict(
             accountIdentifiers=self.serialize(accountIdentifiers),
             logGroupNamePrefix=self.serialize(logGroupNamePrefix),
@@ -175,26 +173,9 @@ class LogGroupManager(LogGroupManagerMixin, Boto3ModelManager):
             logGroupClass=self.serialize(logGroupClass),
             logGroupIdentifiers=self.serialize(logGroupIdentifiers),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_log_groups", DescribeLogGroupsResponse, "logGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeLogGroupsResponse(**_response)
-            if response.logGroups:
-                results.extend(response.logGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def get_fields(
         self,
@@ -228,13 +209,12 @@ class LogGroupManager(LogGroupManagerMixin, Boto3ModelManager):
         _response = self.client.get_log_group_fields(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetLogGroupFieldsResponse(**_response)
+        response = self.parse(GetLogGroupFieldsResponse, _response)
 
         results: "builtins.list[LogGroupField]" = None
         if response is not None:
             results = response.logGroupFields
 
-        self.sessionize(results)
         return cast("builtins.list[LogGroupField]", results)
 
 
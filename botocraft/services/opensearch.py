@@ -78,9 +78,8 @@ class OpenSearchDomainManager(OpenSearchDomainManagerMixin, Boto3ModelManager):
         _response = self.client.create_domain(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDomainResponse(**_response)
+        response = self.parse(CreateDomainResponse, _response)
 
-        self.sessionize(response.DomainStatus)
         return cast("OpenSearchDomain", response.DomainStatus)
 
     @single_opensearch_domain_update_include_tags
@@ -134,9 +133,8 @@ class OpenSearchDomainManager(OpenSearchDomainManagerMixin, Boto3ModelManager):
         _response = self.client.update_domain_config(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateDomainConfigResponse(**_response)
+        response = self.parse(UpdateDomainConfigResponse, _response)
 
-        self.sessionize(response)
         return cast("OpenSearchDomain", response)
 
     def delete(self, DomainName: str) -> "OpenSearchDomain":
@@ -151,7 +149,7 @@ class OpenSearchDomainManager(OpenSearchDomainManagerMixin, Boto3ModelManager):
         _response = self.client.delete_domain(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteDomainResponse(**_response)
+        response = self.parse(DeleteDomainResponse, _response)
         return cast("OpenSearchDomain", response.DomainStatus)
 
     @single_opensearch_domain_include_tags
@@ -167,10 +165,9 @@ class OpenSearchDomainManager(OpenSearchDomainManagerMixin, Boto3ModelManager):
         _response = self.client.describe_domain(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDomainResponse(**_response)
+        response = self.parse(DescribeDomainResponse, _response)
 
         if response and response.DomainStatus:
-            self.sessionize(response.DomainStatus)
             return response.DomainStatus
         return None
 
@@ -200,9 +197,8 @@ class OpenSearchVpcEndpointManager(Boto3ModelManager):
         _response = self.client.create_vpc_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVpcEndpointResponse(**_response)
+        response = self.parse(CreateVpcEndpointResponse, _response)
 
-        self.sessionize(response.VpcEndpoint)
         return cast("OpenSearchVpcEndpoint", response.VpcEndpoint)
 
     def update(self, model: "OpenSearchVpcEndpoint") -> "OpenSearchVpcEndpoint":
@@ -219,9 +215,8 @@ class OpenSearchVpcEndpointManager(Boto3ModelManager):
         _response = self.client.update_vpc_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateVpcEndpointResponse(**_response)
+        response = self.parse(UpdateVpcEndpointResponse, _response)
 
-        self.sessionize(response.VpcEndpoint)
         return cast("OpenSearchVpcEndpoint", response.VpcEndpoint)
 
     def delete(self, VpcEndpointId: str) -> "OpenSearchVpcEndpoint":
@@ -235,7 +230,7 @@ class OpenSearchVpcEndpointManager(Boto3ModelManager):
         _response = self.client.delete_vpc_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteVpcEndpointResponse(**_response)
+        response = self.parse(DeleteVpcEndpointResponse, _response)
         return cast("OpenSearchVpcEndpoint", response.VpcEndpointSummary)
 
     def get(self, VpcEndpointId: str) -> "OpenSearchVpcEndpoint | None":
@@ -250,10 +245,9 @@ class OpenSearchVpcEndpointManager(Boto3ModelManager):
         _response = self.client.describe_vpc_endpoints(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcEndpointsResponse(**_response)
+        response = self.parse(DescribeVpcEndpointsResponse, _response)
 
         if response and response.VpcEndpoints:
-            self.sessionize(response.VpcEndpoints[0])
             return response.VpcEndpoints[0]
         return None
 
@@ -269,9 +263,8 @@ class OpenSearchVpcEndpointManager(Boto3ModelManager):
         _response = self.client.describe_vpc_endpoints(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeVpcEndpointsResponse(**_response)
+        response = self.parse(DescribeVpcEndpointsResponse, _response)
         if response and response.VpcEndpoints:
-            self.sessionize(response.VpcEndpoints)
             return PrimaryBoto3ModelQuerySet(response.VpcEndpoints)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -312,9 +305,8 @@ class OpenSearchPackageManager(OpenSearchPackageManagerMixin, Boto3ModelManager)
         _response = self.client.create_package(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreatePackageResponse(**_response)
+        response = self.parse(CreatePackageResponse, _response)
 
-        self.sessionize(response.PackageDetails)
         return cast("OpenSearchPackage", response.PackageDetails)
 
     def update(
@@ -350,9 +342,8 @@ class OpenSearchPackageManager(OpenSearchPackageManagerMixin, Boto3ModelManager)
         _response = self.client.update_package(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdatePackageResponse(**_response)
+        response = self.parse(UpdatePackageResponse, _response)
 
-        self.sessionize(response.PackageDetails)
         return cast("OpenSearchPackage", response.PackageDetails)
 
     def delete(self, PackageID: str) -> "OpenSearchPackage":
@@ -369,7 +360,7 @@ class OpenSearchPackageManager(OpenSearchPackageManagerMixin, Boto3ModelManager)
         _response = self.client.delete_package(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeletePackageResponse(**_response)
+        response = self.parse(DeletePackageResponse, _response)
         return cast("OpenSearchPackage", response.PackageDetails)
 
     def list(
@@ -403,9 +394,8 @@ class OpenSearchPackageManager(OpenSearchPackageManagerMixin, Boto3ModelManager)
         _response = self.client.describe_packages(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribePackagesResponse(**_response)
+        response = self.parse(DescribePackagesResponse, _response)
         if response and response.PackageDetailsList:
-            self.sessionize(response.PackageDetailsList)
             return PrimaryBoto3ModelQuerySet(response.PackageDetailsList)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -1604,7 +1594,7 @@ class OpenSearchDomain(TagsDictMixin, DomainModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -1628,7 +1618,7 @@ class OpenSearchDomain(TagsDictMixin, DomainModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -1652,7 +1642,7 @@ class OpenSearchDomain(TagsDictMixin, DomainModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
 
 class OpenSearchVpcEndpoint(PrimaryBoto3Model):
@@ -1756,7 +1746,7 @@ class OpenSearchVpcEndpoint(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return OpenSearchDomain.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(OpenSearchDomain).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -1778,7 +1768,7 @@ class OpenSearchVpcEndpoint(PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -1802,7 +1792,7 @@ class OpenSearchVpcEndpoint(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
         """
@@ -1826,7 +1816,7 @@ class OpenSearchVpcEndpoint(PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 class OpenSearchErrorDetails(Boto3Model):
     """
     Additional information if the package is in an error state.
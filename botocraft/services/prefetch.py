@@ -0,0 +1,396 @@
+"""
+Batched loading of relationship properties across many models.
+
+Generated relationship properties (``Service.cluster``, ``TaskSet.task_definition``
+and so on) are ``cached_property`` attributes whose body builds a primary key
+and calls ``self.relationship_manager(Model).get(**pk)``.  Touching one on
+every model of a listing costs one AWS call per model.
+
+:py:func:`prefetch_related_objects` avoids that by running each property's
+body once per model while *recording* the manager call it makes instead of
+making it.  The recorded calls are then de-duplicated, ``get`` calls are
+folded into ``get_many`` calls where the manager supports it, everything that
+is left runs concurrently through :py:func:`botocraft.hydration.hydrate`,
+and each result is stored in the models' ``cached_property`` slots.  Errors
+raised while loading, by AWS or by a relationship body, are raised by
+:py:func:`prefetch_related_objects`.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from functools import cached_property, lru_cache, partial
+from typing import TYPE_CHECKING, Any
+
+from .batching import batch_size, fetch_many
+from .identity import current_identity_map, freeze
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .abstract import Boto3ModelManager
+
+#: Lookups recorded by :py:class:`LookupRecorder` while
+#: :py:func:`prefetch_related_objects` runs relationship bodies, or ``None``.
+RECORDED_LOOKUPS: ContextVar[list[RecordedLookup] | None] = ContextVar(
+    "botocraft_recorded_lookups", default=None
+)
+
+
+class RecordedLookup:
+    """
+    A manager call recorded instead of made.
+
+    The recording is also what the recorded call returns, so after a
+    relationship body has run, ``value is lookup`` tells whether the body
+    returned the manager call's result unchanged.
+
+    Args:
+        manager: The manager the call was made on.
+        method: The manager method name.
+        args: The positional arguments.
+        kwargs: The keyword arguments.
+
+    """
+
+    def __init__(
+        self,
+        manager: Boto3ModelManager,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        #: The manager the call was made on.
+        self.manager = manager
+        #: The manager method name.
+        self.method = method
+        #: The positional arguments.
+        self.args = args
+        #: The keyword arguments.
+        self.kwargs = kwargs
+
+    @property
+    def key(self) -> tuple[Any, ...] | None:
+        """
+        A hashable key identifying the call, or ``None`` if the arguments
+        are not hashable.
+        """
+        key = (
+            self.manager,
+            self.method,
+            self.args,
+            tuple(sorted(self.kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __call__(self) -> Any:
+        """
+        Make the recorded call.
+
+        Returns:
+            Whatever the manager method returns.
+
+        """
+        return getattr(self.manager, self.method)(*self.args, **self.kwargs)
+
+
+class LookupRecorder:
+    """
+    Stand in for a manager while relationship lookups are being recorded.
+
+    :py:meth:`botocraft.services.abstract.Boto3Model.relationship_manager`
+    returns one of these instead of the manager while
+    :py:data:`RECORDED_LOOKUPS` is set.  Any method called on it is recorded
+    and returns the recording.
+
+    Args:
+        manager: The manager to record calls for.
+        recorded: Where to append the recorded calls.
+
+    """
+
+    def __init__(
+        self, manager: Boto3ModelManager, recorded: list[RecordedLookup]
+    ) -> None:
+        self._manager = manager
+        self._recorded = recorded
+
+    def __getattr__(self, name: str) -> Any:
+        def record(*args: Any, **kwargs: Any) -> RecordedLookup:
+            lookup = RecordedLookup(self._manager, name, args, kwargs)
+            self._recorded.append(lookup)
+            return lookup
+
+        return record
+
+
+@lru_cache(maxsize=4096)
+def is_relationship(cls: type, name: str) -> bool:
+    """
+    Check whether ``name`` is a relationship on ``cls``.  Cached per class.
+
+    Relationships are the ``cached_property`` attributes that load related
+    models from AWS.
+
+    Args:
+        cls: The class to inspect
+        name: The attribute name
+
+    Returns:
+        True if ``name`` is a relationship
+    """
+    return isinstance(getattr(cls, name, None), cached_property)
+
+
+def _load_relationship(name: str, objects: list[Any]) -> list[Any]:
+    """
+    Load the relationship ``name`` on each of ``objects``.
+
+    Args:
+        name: The relationship name
+        objects: The objects to load it on
+
+    Returns:
+        An empty list; the values are cached on the objects.
+    """
+    for obj in objects:
+        getattr(obj, name)
+    return []
+
+
+def _record(
+    objects: list[Any], name: str
+) -> tuple[dict[Any, tuple[RecordedLookup, list[Any]]], list[Any]]:
+    """
+    Run the ``name`` relationship body on each object, recording its lookup.
+
+    Bodies that make no manager call are simply stored.  Bodies that fail
+    while being recorded, e.g. because they use the recorded lookup as if it
+    were the related model, are loaded for real later, so any real error is
+    raised then.
+
+    Args:
+        objects: The objects to load ``name`` on.
+        name: The relationship name.
+
+    Returns:
+        The recorded lookups, de-duplicated, each with the objects waiting on
+        it; and the objects whose body did something other than return the
+        result of a single manager call.
+    """
+    groups: dict[Any, tuple[RecordedLookup, list[Any]]] = {}
+    leftover: list[Any] = []
+    for obj in objects:
+        function = getattr(obj.__class__, name).func
+        recorded: list[RecordedLookup] = []
+        token = RECORDED_LOOKUPS.set(recorded)
+        try:
+            value = function(obj)
+        except Exception:  # noqa: BLE001
+            leftover.append(obj)
+            continue
+        finally:
+            RECORDED_LOOKUPS.reset(token)
+        if not recorded:
+            vars(obj)[name] = value
+        elif len(recorded) == 1 and value is recorded[0]:
+            lookup = recorded[0]
+            groups.setdefault(lookup.key or id(obj), (lookup, []))[1].append(obj)
+        else:
+            leftover.append(obj)
+    return groups, leftover
+
+
+def _batch_gets(
+    groups: dict[Any, tuple[RecordedLookup, list[Any]]],
+) -> dict[Any, Any]:
+    """
+    Serve recorded ``get`` lookups from the identity map in scope, if any,
+    or with ``get_many`` calls where possible.
+
+    Args:
+        groups: The recorded lookups, as returned by :py:func:`_record`.
+
+    Returns:
+        The models found, keyed like ``groups``.
+    """
+    from botocraft.hydration import hydrate
+
+    mapping = current_identity_map()
+    results: dict[Any, Any] = {}
+    frozen: dict[Any, Any] = {}
+    batches: dict[Any, tuple[Boto3ModelManager, dict[str, Any], dict[str, Any]]] = {}
+    for key, (lookup, _) in groups.items():
+        manager = lookup.manager
+        if lookup.method != "get":
+            continue
+        if mapping is not None:
+            arguments = freeze(type(manager).get, lookup.args, lookup.kwargs)
+            if arguments is not None:
+                found, model = mapping.lookup(manager, arguments)
+                if found:
+                    results[key] = model
+                    continue
+                frozen[key] = arguments
+        get_many_arg = getattr(manager, "get_many_arg", None)
+        if lookup.args or get_many_arg is None:
+            continue
+        kwargs = dict(lookup.kwargs)
+        identifier = kwargs.pop(get_many_arg[0], None)
+        if not isinstance(identifier, str):
+            continue
+        try:
+            batch_key = (manager, tuple(sorted(kwargs.items())))
+            batch = batches.setdefault(batch_key, (manager, kwargs, {}))
+        except TypeError:
+            continue
+        batch[2][identifier] = key
+    for manager, kwargs, keys in batches.values():
+        for identifier, model in hydrate(
+            list(keys),
+            partial(fetch_many, manager, kwargs),
+            batch_size=batch_size(manager),
+        ):
+            results[keys[identifier]] = model
+            if keys[identifier] in frozen:
+                mapping.store(manager, frozen[keys[identifier]], model)  # type: ignore[union-attr]
+    return results
+
+
+def _call(lookups: list[RecordedLookup]) -> list[Any]:
+    """
+    Make each recorded call.
+
+    Args:
+        lookups: The calls to make.
+
+    Returns:
+        The results, in order.
+    """
+    return [lookup() for lookup in lookups]
+
+
+def load_relationships(objects: Iterable[Any], name: str) -> None:
+    """
+    Load the relationship ``name`` on every object that has it, in bulk.
+
+    Each distinct lookup is made once.  ``get`` lookups on managers that
+    declare ``get_many_arg`` are folded into ``get_many`` calls.  The
+    remaining lookups, and relationships whose body does more than return a
+    single manager call, are loaded concurrently.
+
+    Args:
+        objects: The objects to load ``name`` on.
+        name: The relationship name.
+    """
+    from botocraft.hydration import hydrate
+
+    pending = {
+        id(obj): obj
+        for obj in objects
+        if is_relationship(obj.__class__, name) and name not in vars(obj)
+    }
+    groups, leftover = _record(list(pending.values()), name)
+    results = _batch_gets(groups)
+    remaining = [key for key in groups if key not in results]
+    values = hydrate([groups[key][0] for key in remaining], _call, batch_size=1)
+    results.update(zip(remaining, values, strict=True))
+    for key, (_, waiting) in groups.items():
+        for obj in waiting:
+            vars(obj)[name] = results[key]
+    hydrate(leftover, partial(_load_relationship, name), batch_size=1)
+
+
+def _walk(level: list[Any], name: str) -> list[Any]:
+    """
+    Step from each of ``level`` to its ``name`` value, flattening lists.
+
+    Args:
+        level: The objects to step from.
+        name: The attribute to step through.
+
+    Returns:
+        The non-``None`` values.
+    """
+    from .abstract import PrimaryBoto3ModelQuerySet
+
+    next_level: list[Any] = []
+    for obj in level:
+        if isinstance(obj, dict):
+            value = obj.get(name)
+        elif is_relationship(obj.__class__, name):
+            # Loaded by load_relationships() already, if it could be
+            value = vars(obj).get(name)
+        else:
+            value = getattr(obj, name, None)
+        if isinstance(value, (list, tuple, PrimaryBoto3ModelQuerySet)):
+            next_level.extend(item for item in value if item is not None)
+        elif value is not None:
+            next_level.append(value)
+    return next_level
+
+
+def prefetch_relationships(objects: Iterable[Any], parts: tuple[str, ...]) -> None:
+    """
+    Load every relationship along the field path ``parts`` on ``objects``.
+
+    Relationships are loaded in bulk with :py:func:`load_relationships`,
+    level by level, and end up cached on the objects, so walking the path
+    afterwards makes no AWS calls.  Parts that are not relationships are
+    simply walked through.
+
+    Args:
+        objects: The objects the path starts from
+        parts: The split field path
+    """
+    level = [obj for obj in objects if obj is not None]
+    last = len(parts) - 1
+    for i, part in enumerate(parts):
+        if not level:
+            return
+        if any(is_relationship(cls, part) for cls in {obj.__class__ for obj in level}):
+            load_relationships(level, part)
+        if i == last:
+            return
+        level = _walk(level, part)
+
+
+def prefetch_related_objects(objects: Iterable[Any], *lookups: str) -> None:
+    """
+    Load the relationships named by ``lookups`` on ``objects`` in bulk.
+
+    Like Django's ``prefetch_related_objects()``.  Each lookup is a
+    relationship name, or a ``__``-separated path of relationship names to
+    load relationships of the related objects too.
+
+    Example:
+        .. code-block:: python
+
+            services = Service.objects.list(cluster="prod")
+            prefetch_related_objects(services, "cluster", "task_definition")
+
+    Args:
+        objects: The models to load relationships on.
+        *lookups: The relationships to load.
+
+    Raises:
+        ValueError: If a lookup names something that is not a relationship
+            on any of the objects it applies to.
+    """
+    objects = [obj for obj in objects if obj is not None]
+    for lookup in lookups:
+        level = objects
+        for name in lookup.split("__"):
+            if not level:
+                break
+            classes = {obj.__class__ for obj in level}
+            if not any(is_relationship(cls, name) for cls in classes):
+                names = ", ".join(sorted(cls.__name__ for cls in classes))
+                msg = f"{lookup!r}: {name!r} is not a relationship on {names}"
+                raise ValueError(msg)
+            load_relationships(level, name)
+            level = _walk(level, name)
@@ -0,0 +1,211 @@
+"""
+Field projections and raw responses for generated manager methods.
+
+A dashboard that shows three attributes of each instance should not pay for
+building dozens of nested models per instance.  Every generated manager method
+takes two keyword arguments that change what the models in the response are
+built as:
+
+* ``only=[...]`` builds each model as a :py:func:`~collections.namedtuple`
+  of just the named fields.  Paths use ``__`` to reach into nested models,
+  the same way :py:meth:`~botocraft.services.abstract.PrimaryBoto3ModelQuerySet.filter`
+  does; a field named without a nested path is built in full.
+* ``raw=True`` leaves each model as the dict botocore returned.
+
+.. code-block:: python
+
+    rows = Instance.objects.list(only=["InstanceId", "State__Name", "Tags"])
+    rows = Instance.objects.list(raw=True)
+
+Either way the response goes through the same pagination and queryset as
+usual, so ``filter()``, ``order_by()`` and slicing still work, and nothing but
+the projected fields is built.  Projections and raw responses are never cached,
+coalesced or kept in the identity map, and have no relationships or session.
+"""
+
+from __future__ import annotations
+
+import types
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Union, cast, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .summary import summary_class
+from .trusted import _converter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+#: Built projections, keyed by model class and projected paths.
+_PROJECTIONS: dict[tuple[type[BaseModel], tuple[str, ...]], Callable[[Any], Any]] = {}
+
+
+def _model_in(annotation: Any) -> tuple[type[BaseModel], bool] | None:
+    """
+    Find the model a field holds.
+
+    Args:
+        annotation: The field's type.
+
+    Returns:
+        The model class, and whether the field holds a list of them, or
+        ``None`` if the field does not hold models.
+
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _model_in(members[0]) if len(members) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item, True
+    return None
+
+
+def _each(convert: Callable[[Any], Any], many: bool) -> Callable[[Any], Any]:
+    """
+    Apply ``convert`` to a value, or to each member of a list value.
+
+    Args:
+        convert: Converts one dict.
+        many: Whether values are lists.
+
+    Returns:
+        The converter for the whole value.
+
+    """
+    if many:
+        return lambda value: [
+            convert(member) if isinstance(member, dict) else member for member in value
+        ]
+    return lambda value: convert(value) if isinstance(value, dict) else value
+
+
+def projection(
+    model_class: type[BaseModel], paths: tuple[str, ...]
+) -> Callable[[Any], Any]:
+    """
+    Return a function building a projection of ``model_class`` from a
+    botocore dict.
+
+    Args:
+        model_class: The model being projected.
+        paths: The field paths to keep, e.g. ``("InstanceId", "State__Name")``.
+
+    Raises:
+        ValueError: If a path names a field ``model_class`` does not have, or
+            reaches into a field that does not hold models.
+
+    Returns:
+        The function, whose results are :py:func:`~collections.namedtuple`
+        instances named after ``model_class``.
+
+    """
+    key = (model_class, paths)
+    build = _PROJECTIONS.get(key)
+    if build is not None:
+        return build
+    nested: dict[str, list[str]] = {}
+    whole: set[str] = set()
+    for path in paths:
+        head, _, rest = path.partition("__")
+        nested.setdefault(head, [])
+        if rest:
+            nested[head].append(rest)
+        else:
+            whole.add(head)
+    fields: list[tuple[str, Callable[[Any], Any] | None]] = []
+    for name, rests in nested.items():
+        field = model_class.model_fields.get(name)
+        if field is None:
+            msg = f"{model_class.__name__} has no field {name!r} to project"
+            raise ValueError(msg)
+        if name in whole:
+            convert = _converter(field.annotation)
+        else:
+            found = _model_in(field.annotation)
+            if found is None:
+                msg = f"{model_class.__name__}.{name} holds no model to project into"
+                raise ValueError(msg)
+            inner, many = found
+            convert = _each(projection(inner, tuple(rests)), many)
+        fields.append((field.alias or name, convert))
+    row = namedtuple(model_class.__name__, list(nested))  # type: ignore[misc]  # noqa: PYI024
+
+    def build(data: dict[str, Any]) -> Any:
+        values = []
+        for key, convert in fields:
+            value = data.get(key)
+            if convert is not None and value is not None:
+                value = convert(value)
+            values.append(value)
+        return row._make(values)
+
+    _PROJECTIONS[key] = build
+    return build
+
+
+class ShapedResponse:
+    """
+    A response whose models are left as botocore dicts, or built as
+    projections or summaries.
+
+    Attributes are looked up like the response model's fields, so generated
+    code reads it the way it reads the response model.
+
+    Args:
+        model_class: The response model.
+        data: The botocore response.
+        only: The field paths to project each model to, or ``None`` to leave
+            models as dicts.
+
+    Keyword Args:
+        summary: Build each model that has a summary class (see
+            :py:mod:`botocraft.services.summary`) as its summary, leaving the
+            rest as dicts.
+
+    """
+
+    __slots__ = ("_data", "_model_class", "_only", "_summary")
+
+    def __init__(
+        self,
+        model_class: type[BaseModel],
+        data: dict[str, Any],
+        only: tuple[str, ...] | None,
+        *,
+        summary: bool = False,
+    ) -> None:
+        self._model_class = model_class
+        self._data = data
+        self._only = only
+        self._summary = summary
+
+    def __getattr__(self, name: str) -> Any:
+        field = (
+            None if name.startswith("_") else self._model_class.model_fields.get(name)
+        )
+        if field is None:
+            msg = f"{self._model_class.__name__} has no field {name!r}"
+            raise AttributeError(msg)
+        value = self._data.get(field.alias or name)
+        if value is None or (self._only is None and not self._summary):
+            return value
+        found = _model_in(field.annotation)
+        if found is None:
+            return value
+        inner, many = found
+        if self._summary:
+            summary = summary_class(inner)
+            if summary is None:
+                return value
+            build = _each(summary.from_response, many)
+        else:
+            build = _each(projection(inner, cast("tuple[str, ...]", self._only)), many)
+        return build(value)
+
+    def __repr__(self) -> str:
+        return f"ShapedResponse({self._model_class.__name__}, {self._data!r})"
@@ -175,9 +175,8 @@ class DBInstanceManager(Boto3ModelManager):
         _response = self.client.create_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDBInstanceResult(**_response)
+        response = self.parse(CreateDBInstanceResult, _response)
 
-        self.sessionize(response.RDSDBInstance)
         return cast("DBInstance", response.RDSDBInstance)
 
     def update(
@@ -377,9 +376,8 @@ class DBInstanceManager(Boto3ModelManager):
         _response = self.client.modify_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyDBInstanceResult(**_response)
+        response = self.parse(ModifyDBInstanceResult, _response)
 
-        self.sessionize(response.RDSDBInstance)
         return cast("DBInstance", response.RDSDBInstance)
 
     def delete(
@@ -427,7 +425,7 @@ class DBInstanceManager(Boto3ModelManager):
         _response = self.client.delete_db_instance(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteDBInstanceResult(**_response)
+        response = self.parse(DeleteDBInstanceResult, _response)
         return cast("DBInstance", response.RDSDBInstance)
 
     def get(
@@ -458,10 +456,9 @@ class DBInstanceManager(Boto3ModelManager):
         _response = self.client.describe_db_instances(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DBInstanceMessage(**_response)
+        response = self.parse(DBInstanceMessage, _response)
 
         if response and response.DBInstances:
-            self.sessionize(response.DBInstances[0])
             return response.DBInstances[0]
         return None
 
@@ -484,31 +481,13 @@ class DBInstanceManager(Boto3ModelManager):
                     Filters: A filter that specifies one or more DB instances to
                         describe.
         """
-        paginator = self.client.get_paginator("describe_db_instances")
         args: dict[str, Any] = dict(
             DBInstanceIdentifier=self.serialize(DBInstanceIdentifier),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_db_instances", DBInstanceMessage, "DBInstances", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DBInstanceMessage(**_response)
-            if response.DBInstances:
-                results.extend(response.DBInstances)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class RDSDBSubnetGroupManager(Boto3ModelManager):
@@ -537,9 +516,8 @@ class RDSDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.create_db_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDBSubnetGroupResult(**_response)
+        response = self.parse(CreateDBSubnetGroupResult, _response)
 
-        self.sessionize(response.DBSubnetGroup)
         return cast("RDSDBSubnetGroup", response.DBSubnetGroup)
 
     def update(
@@ -564,9 +542,8 @@ class RDSDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.modify_db_subnet_group(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ModifyDBSubnetGroupResult(**_response)
+        response = self.parse(ModifyDBSubnetGroupResult, _response)
 
-        self.sessionize(response.DBSubnetGroup)
         return cast("RDSDBSubnetGroup", response.DBSubnetGroup)
 
     def delete(self, DBSubnetGroupName: str) -> None:
@@ -595,10 +572,9 @@ class RDSDBSubnetGroupManager(Boto3ModelManager):
         _response = self.client.describe_db_subnet_groups(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DBSubnetGroupMessage(**_response)
+        response = self.parse(DBSubnetGroupMessage, _response)
 
         if response and response.DBSubnetGroups:
-            self.sessionize(response.DBSubnetGroups[0])
             return response.DBSubnetGroups[0]
         return None
 
@@ -618,31 +594,13 @@ class RDSDBSubnetGroupManager(Boto3ModelManager):
             DBSubnetGroupName: The name of the DB subnet group to return details for.
             Filters: This parameter isn't currently supported.
         """
-        paginator = self.client.get_paginator("describe_db_subnet_groups")
         args: dict[str, Any] = dict(
             DBSubnetGroupName=self.serialize(DBSubnetGroupName),
             Filters=self.serialize(Filters),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_db_subnet_groups", DBSubnetGroupMessage, "DBSubnetGroups", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DBSubnetGroupMessage(**_response)
-            if response.DBSubnetGroups:
-                results.extend(response.DBSubnetGroups)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -1835,7 +1793,7 @@ class DBInstance(TagsDictMixin, RDSInstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return RDSDBSubnetGroup.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(RDSDBSubnetGroup).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def security_groups(self) -> "list[SecurityGroup] | None":
@@ -1861,7 +1819,7 @@ class DBInstance(TagsDictMixin, RDSInstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return SecurityGroup.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(SecurityGroup).list(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def vpc(self) -> "Vpc | None":
@@ -1883,7 +1841,7 @@ class DBInstance(TagsDictMixin, RDSInstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return None
-        return Vpc.objects.using(self.session).get(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Vpc).get(**pk)  # type: ignore[arg-type]
 
     @cached_property
     def subnets(self) -> "list[Subnet] | None":
@@ -1909,7 +1867,7 @@ class DBInstance(TagsDictMixin, RDSInstanceModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Subnet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Subnet).list(**pk)  # type: ignore[arg-type]
 
 
 class RDSAvailabilityZone(Boto3Model):
@@ -70,9 +70,8 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.create_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateHostedZoneResponse(**_response)
+        response = self.parse(CreateHostedZoneResponse, _response)
 
-        self.sessionize(response.HostedZone)
         return cast("HostedZone", response.HostedZone)
 
     def delete(self, Id: str) -> "HostedZone":
@@ -86,7 +85,7 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.delete_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteHostedZoneResponse(**_response)
+        response = self.parse(DeleteHostedZoneResponse, _response)
         return cast("HostedZone", response.ChangeInfo)
 
     def get(self, Id: str) -> "HostedZone | None":
@@ -101,10 +100,9 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.get_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetHostedZoneResponse(**_response)
+        response = self.parse(GetHostedZoneResponse, _response)
 
         if response and response.HostedZone:
-            self.sessionize(response.HostedZone)
             return response.HostedZone
         return None
 
@@ -134,32 +132,14 @@ class HostedZoneManager(Boto3ModelManager):
                 reusable delegation set.
             HostedZoneType: (Optional) Specifies if the hosted zone is private.
         """
-        paginator = self.client.get_paginator("list_hosted_zones")
         args: dict[str, Any] = dict(
             MaxItems=self.serialize(MaxItems),
             DelegationSetId=self.serialize(DelegationSetId),
             HostedZoneType=self.serialize(HostedZoneType),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_hosted_zones", ListHostedZonesResponse, "HostedZones", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListHostedZonesResponse(**_response)
-            if response.HostedZones:
-                results.extend(response.HostedZones)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def list_records(
         self,
@@ -215,13 +195,12 @@ class HostedZoneManager(Boto3ModelManager):
         results: "builtins.list[Route53ResourceRecordSet]" = []
 
         for _response in response_iterator:
-            response = ListResourceRecordSetsResponse(**_response)
+            response = self.parse(ListResourceRecordSetsResponse, _response)
             if response.ResourceRecordSets is not None:
                 results.extend(response.ResourceRecordSets)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[Route53ResourceRecordSet]", results)
 
     def list_by_name(
@@ -267,13 +246,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.list_hosted_zones_by_name(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListHostedZonesByNameResponse(**_response)
+        response = self.parse(ListHostedZonesByNameResponse, _response)
 
         results: "builtins.list[HostedZone]" = None
         if response is not None:
             results = response.HostedZones
 
-        self.sessionize(results)
         return cast("builtins.list[HostedZone]", results)
 
     def list_by_vpc(
@@ -319,13 +297,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.list_hosted_zones_by_name(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListHostedZonesByNameResponse(**_response)
+        response = self.parse(ListHostedZonesByNameResponse, _response)
 
         results: "builtins.list[HostedZone]" = None
         if response is not None:
             results = response.HostedZones
 
-        self.sessionize(results)
         return cast("builtins.list[HostedZone]", results)
 
     def update_comment(self, Id: str, Comment: str) -> "HostedZone":
@@ -344,13 +321,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.update_hosted_zone_comment(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateHostedZoneCommentResponse(**_response)
+        response = self.parse(UpdateHostedZoneCommentResponse, _response)
 
         results: "HostedZone" = None
         if response is not None:
             results = response.HostedZone
 
-        self.sessionize(results)
         return cast("HostedZone", results)
 
     def count(
@@ -364,13 +340,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.get_hosted_zone_count(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetHostedZoneCountResponse(**_response)
+        response = self.parse(GetHostedZoneCountResponse, _response)
 
         results: int = None
         if response is not None:
             results = response.HostedZoneCount
 
-        self.sessionize(results)
         return cast("int", results)
 
     def limits(
@@ -392,13 +367,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.get_hosted_zone_limit(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetHostedZoneLimitResponse(**_response)
+        response = self.parse(GetHostedZoneLimitResponse, _response)
 
         results: "GetHostedZoneLimitResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetHostedZoneLimitResponse", results)
 
     def associate_vpc(
@@ -424,13 +398,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.associate_vpc_with_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssociateVPCWithHostedZoneResponse(**_response)
+        response = self.parse(AssociateVPCWithHostedZoneResponse, _response)
 
         results: "ChangeInfo" = None
         if response is not None:
             results = response.ChangeInfo
 
-        self.sessionize(results)
         return cast("ChangeInfo", results)
 
     def disassociate_vpc(
@@ -460,13 +433,12 @@ class HostedZoneManager(Boto3ModelManager):
         _response = self.client.disassociate_vpc_from_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisassociateVPCFromHostedZoneResponse(**_response)
+        response = self.parse(DisassociateVPCFromHostedZoneResponse, _response)
 
         results: "ChangeInfo" = None
         if response is not None:
             results = response.ChangeInfo
 
-        self.sessionize(results)
         return cast("ChangeInfo", results)
 
 
@@ -496,13 +468,12 @@ class Route53VPCManager(Boto3ModelManager):
         _response = self.client.associate_vpc_with_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssociateVPCWithHostedZoneResponse(**_response)
+        response = self.parse(AssociateVPCWithHostedZoneResponse, _response)
 
         results: "ChangeInfo" = None
         if response is not None:
             results = response.ChangeInfo
 
-        self.sessionize(results)
         return cast("ChangeInfo", results)
 
     def disassociate(
@@ -532,13 +503,12 @@ class Route53VPCManager(Boto3ModelManager):
         _response = self.client.disassociate_vpc_from_hosted_zone(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DisassociateVPCFromHostedZoneResponse(**_response)
+        response = self.parse(DisassociateVPCFromHostedZoneResponse, _response)
 
         results: "ChangeInfo" = None
         if response is not None:
             results = response.ChangeInfo
 
-        self.sessionize(results)
         return cast("ChangeInfo", results)
 
     def list_hosted_zones(
@@ -632,13 +602,12 @@ class Route53VPCManager(Boto3ModelManager):
         _response = self.client.list_hosted_zones_by_vpc(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListHostedZonesByVPCResponse(**_response)
+        response = self.parse(ListHostedZonesByVPCResponse, _response)
 
         results: "builtins.list[HostedZoneSummary]" = None
         if response is not None:
             results = response.HostedZoneSummaries
 
-        self.sessionize(results)
         return cast("builtins.list[HostedZoneSummary]", results)
 
     def list_authorizations(self, HostedZoneId: str) -> "builtins.list[Route53VPC]":
@@ -661,13 +630,12 @@ class Route53VPCManager(Boto3ModelManager):
         results: "builtins.list[Route53VPC]" = []
 
         for _response in response_iterator:
-            response = ListVPCAssociationAuthorizationsResponse(**_response)
+            response = self.parse(ListVPCAssociationAuthorizationsResponse, _response)
             if response.VPCs is not None:
                 results.extend(response.VPCs)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[Route53VPC]", results)
 
     def create_authorization(
@@ -694,13 +662,12 @@ class Route53VPCManager(Boto3ModelManager):
         _response = self.client.create_vpc_association_authorization(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateVPCAssociationAuthorizationResponse(**_response)
+        response = self.parse(CreateVPCAssociationAuthorizationResponse, _response)
 
         results: "Route53VPC" = None
         if response is not None:
             results = response.VPC
 
-        self.sessionize(results)
         return cast("Route53VPC", results)
 
     def delete_authorization(
@@ -729,13 +696,12 @@ class Route53VPCManager(Boto3ModelManager):
         _response = self.client.delete_vpc_association_authorization(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteVPCAssociationAuthorizationResponse(**_response)
+        response = self.parse(DeleteVPCAssociationAuthorizationResponse, _response)
 
         results: "DeleteVPCAssociationAuthorizationResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DeleteVPCAssociationAuthorizationResponse", results)
 
 
@@ -762,9 +728,8 @@ class Route53CidrCollectionManager(Boto3ModelManager):
         _response = self.client.create_cidr_collection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateCidrCollectionResponse(**_response)
+        response = self.parse(CreateCidrCollectionResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateCidrCollectionResponse", response)
 
     def delete(self, Id: str) -> None:
@@ -788,28 +753,13 @@ class Route53CidrCollectionManager(Boto3ModelManager):
         Returns a paginated list of CIDR collections in the Amazon Web Services account
         (metadata only).
         """
-        paginator = self.client.get_paginator("list_cidr_collections")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_cidr_collections",
+            ListCidrCollectionsResponse,
+            "CidrCollections",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListCidrCollectionsResponse(**_response)
-            if response.CidrCollections:
-                results.extend(response.CidrCollections)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def update(
         self, model: "Route53CidrCollection", CollectionVersion: "int | None" = None
@@ -837,9 +787,8 @@ class Route53CidrCollectionManager(Boto3ModelManager):
         _response = self.client.change_cidr_collection(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ChangeCidrCollectionResponse(**_response)
+        response = self.parse(ChangeCidrCollectionResponse, _response)
 
-        self.sessionize(response.Id)
         return cast("str", response.Id)
 
 
@@ -858,31 +807,13 @@ class CidrBlockSummaryManager(Boto3ModelManager):
         Keyword Args:
             LocationName: The name of the CIDR collection location.
         """
-        paginator = self.client.get_paginator("list_cidr_blocks")
         args: dict[str, Any] = dict(
             CollectionId=self.serialize(CollectionId),
             LocationName=self.serialize(LocationName),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_cidr_blocks", ListCidrBlocksResponse, "CidrBlocks", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListCidrBlocksResponse(**_response)
-            if response.CidrBlocks:
-                results.extend(response.CidrBlocks)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class Route53QueryLoggingConfigManager(Boto3ModelManager):
@@ -906,9 +837,8 @@ class Route53QueryLoggingConfigManager(Boto3ModelManager):
         _response = self.client.create_query_logging_config(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateQueryLoggingConfigResponse(**_response)
+        response = self.parse(CreateQueryLoggingConfigResponse, _response)
 
-        self.sessionize(response.QueryLoggingConfig)
         return cast("Route53QueryLoggingConfig", response.QueryLoggingConfig)
 
     def delete(self, Id: str) -> None:
@@ -939,10 +869,9 @@ class Route53QueryLoggingConfigManager(Boto3ModelManager):
         _response = self.client.get_query_logging_config(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetQueryLoggingConfigResponse(**_response)
+        response = self.parse(GetQueryLoggingConfigResponse, _response)
 
         if response and response.QueryLoggingConfig:
-            self.sessionize(response.QueryLoggingConfig)
             return response.QueryLoggingConfig
         return None
 
@@ -957,28 +886,13 @@ class Route53QueryLoggingConfigManager(Boto3ModelManager):
                 that is associated with a hosted zone,
                 specify the ID in ``HostedZoneId``.
         """
-        paginator = self.client.get_paginator("list_query_logging_configs")
         args: dict[str, Any] = dict(HostedZoneId=self.serialize(HostedZoneId))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_query_logging_configs",
+            ListQueryLoggingConfigsResponse,
+            "QueryLoggingConfigs",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListQueryLoggingConfigsResponse(**_response)
-            if response.QueryLoggingConfigs:
-                results.extend(response.QueryLoggingConfigs)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class Route53ResourceRecordSetManager(Boto3ModelManager):
@@ -1005,13 +919,12 @@ class Route53ResourceRecordSetManager(Boto3ModelManager):
         _response = self.client.change_resource_record_sets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ChangeResourceRecordSetsResponse(**_response)
+        response = self.parse(ChangeResourceRecordSetsResponse, _response)
 
         results: "ChangeInfo" = None
         if response is not None:
             results = response.ChangeInfo
 
-        self.sessionize(results)
         return cast("ChangeInfo", results)
 
     def list(
@@ -1053,7 +966,6 @@ class Route53ResourceRecordSetManager(Boto3ModelManager):
                 identify the first resource record set in the next group of ``maxitems``
                 resource record sets.
         """
-        paginator = self.client.get_paginator("list_resource_record_sets")
         args: dict[str, Any] = dict(
             HostedZoneId=self.serialize(HostedZoneId),
             StartRecordName=self.serialize(StartRecordName),
@@ -1061,26 +973,12 @@ class Route53ResourceRecordSetManager(Boto3ModelManager):
             StartRecordIdentifier=self.serialize(StartRecordIdentifier),
             MaxItems=self.serialize(MaxItems),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_resource_record_sets",
+            ListResourceRecordSetsResponse,
+            "ResourceRecordSets",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListResourceRecordSetsResponse(**_response)
-            if response.ResourceRecordSets:
-                results.extend(response.ResourceRecordSets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 # ==============
@@ -1269,7 +1167,7 @@ class HostedZone(HostedZoneModelMixin, PrimaryBoto3Model):
             )
         except AttributeError:
             return []
-        return Route53ResourceRecordSet.objects.using(self.session).list(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager(Route53ResourceRecordSet).list(**pk)  # type: ignore[arg-type]
 
     def update_comment(self, Comment: str) -> "HostedZone":
         """
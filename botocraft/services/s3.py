@@ -17,6 +17,8 @@ from .abstract import PrimaryBoto3ModelQuerySet
 from botocraft.mixins.s3 import bucket_update_safe_get_lifecycle
 from botocraft.mixins.tags import TagsDictMixin
 from typing import ClassVar, Literal, Any, Type as ModelType, cast
+from dataclasses import dataclass
+from .summary import Boto3Summary
 from botocraft.mixins.s3 import object_list_add_bucket_name_and_tags
 from collections import OrderedDict
 from botocraft.mixins.s3 import GetObjectOutputMixin
@@ -64,33 +66,13 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
                 of the Amazon Web Services Regions, see
                 `Regions and Endpoints <https://docs.aws.amazon.com/general/latest/gr/rande.html#s3_region>`_.
         """
-        paginator = self.client.get_paginator("list_buckets")
         args: dict[str, Any] = dict(
             MaxBuckets=self.serialize(MaxBuckets),
             ContinuationToken=self.serialize(ContinuationToken),
             Prefix=self.serialize(Prefix),
             BucketRegion=self.serialize(BucketRegion),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListBucketsOutput(**_response)
-            if response.Buckets:
-                results.extend(response.Buckets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_buckets", ListBucketsOutput, "Buckets", args)
 
     def get_bucket_policy(
         self, Bucket: str, *, ExpectedBucketOwner: "str | None" = None
@@ -114,13 +96,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.get_bucket_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetBucketPolicyOutput(**_response)
+        response = self.parse(GetBucketPolicyOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.Policy
 
-        self.sessionize(results)
         return cast("str", results)
 
     def put_bucket_policy(
@@ -214,13 +195,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.get_bucket_website(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetBucketWebsiteOutput(**_response)
+        response = self.parse(GetBucketWebsiteOutput, _response)
 
         results: "GetBucketWebsiteOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetBucketWebsiteOutput", results)
 
     def put_website(
@@ -317,13 +297,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.get_bucket_tagging(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetBucketTaggingOutput(**_response)
+        response = self.parse(GetBucketTaggingOutput, _response)
 
         results: "builtins.list[Tag]" = None
         if response is not None:
             results = response.TagSet
 
-        self.sessionize(results)
         return cast("builtins.list[Tag]", results)
 
     def put_tags(
@@ -422,13 +401,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.get_bucket_lifecycle_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetBucketLifecycleConfigurationOutput(**_response)
+        response = self.parse(GetBucketLifecycleConfigurationOutput, _response)
 
         results: "GetBucketLifecycleConfigurationOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetBucketLifecycleConfigurationOutput", results)
 
     def put_lifecycle(
@@ -486,13 +464,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.put_bucket_lifecycle_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutBucketLifecycleConfigurationOutput(**_response)
+        response = self.parse(PutBucketLifecycleConfigurationOutput, _response)
 
         results: "PutBucketLifecycleConfigurationOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutBucketLifecycleConfigurationOutput", results)
 
     def delete_lifecycle(
@@ -547,13 +524,12 @@ class BucketManager(BucketManagerMixin, Boto3ModelManager):
         _response = self.client.get_public_access_block(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetPublicAccessBlockOutput(**_response)
+        response = self.parse(GetPublicAccessBlockOutput, _response)
 
         results: "GetPublicAccessBlockOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetPublicAccessBlockOutput", results)
 
     def put_public_access_block(
@@ -918,9 +894,8 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectOutput(**_response)
+        response = self.parse(PutObjectOutput, _response)
 
-        self.sessionize(response)
         return cast("PutObjectOutput", response)
 
     def update(
@@ -1209,9 +1184,8 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectOutput(**_response)
+        response = self.parse(PutObjectOutput, _response)
 
-        self.sessionize(response)
         return cast("PutObjectOutput", response)
 
     def get(
@@ -1331,10 +1305,9 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = S3Object(**_response)
+        response = self.parse(S3Object, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -1426,7 +1399,6 @@ class S3ObjectManager(Boto3ModelManager):
                 retrieve because they need a second, slow
                 API call, so you have to request them specifically.
         """
-        paginator = self.client.get_paginator("list_objects_v2")
         args: dict[str, Any] = dict(
             Bucket=self.serialize(Bucket),
             Delimiter=self.serialize(Delimiter),
@@ -1440,26 +1412,7 @@ class S3ObjectManager(Boto3ModelManager):
             ExpectedBucketOwner=self.serialize(ExpectedBucketOwner),
             OptionalObjectAttributes=self.serialize(OptionalObjectAttributes),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListObjectsV2Output(**_response)
-            if response.Contents:
-                results.extend(response.Contents)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_objects_v2", ListObjectsV2Output, "Contents", args)
 
     def copy(
         self,
@@ -1721,13 +1674,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.copy_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CopyObjectOutput(**_response)
+        response = self.parse(CopyObjectOutput, _response)
 
         results: "CopyObjectOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("CopyObjectOutput", results)
 
     def rename(
@@ -1811,13 +1763,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.rename_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RenameObjectOutput(**_response)
+        response = self.parse(RenameObjectOutput, _response)
 
         results: "RenameObjectOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("RenameObjectOutput", results)
 
     def restore(
@@ -1877,13 +1828,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.restore_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RestoreObjectOutput(**_response)
+        response = self.parse(RestoreObjectOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.RestoreOutputPath
 
-        self.sessionize(results)
         return cast("str", results)
 
     def select_content(
@@ -1963,13 +1913,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.select_object_content(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SelectObjectContentOutput(**_response)
+        response = self.parse(SelectObjectContentOutput, _response)
 
         results: "SelectObjectContentEventStream" = None
         if response is not None:
             results = response.Payload
 
-        self.sessionize(results)
         return cast("SelectObjectContentEventStream", results)
 
     def delete(
@@ -2038,7 +1987,7 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.delete_objects(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteObjectsOutput(**_response)
+        response = self.parse(DeleteObjectsOutput, _response)
         return cast("S3Object", response.Deleted)
 
     def get_tags(
@@ -2085,13 +2034,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_tagging(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectTaggingOutput(**_response)
+        response = self.parse(GetObjectTaggingOutput, _response)
 
         results: "builtins.list[Tag]" = None
         if response is not None:
             results = response.TagSet
 
-        self.sessionize(results)
         return cast("builtins.list[Tag]", results)
 
     def put_tags(
@@ -2148,13 +2096,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object_tagging(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectTaggingOutput(**_response)
+        response = self.parse(PutObjectTaggingOutput, _response)
 
         results: str = None
         if response is not None:
             results = response.VersionId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete_tags(
@@ -2191,13 +2138,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.delete_object_tagging(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteObjectTaggingOutput(**_response)
+        response = self.parse(DeleteObjectTaggingOutput, _response)
 
         results: "DeleteObjectTaggingOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DeleteObjectTaggingOutput", results)
 
     def get_acl(
@@ -2243,13 +2189,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_acl(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectAclOutput(**_response)
+        response = self.parse(GetObjectAclOutput, _response)
 
         results: "GetObjectAclOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetObjectAclOutput", results)
 
     def put_acl(
@@ -2342,13 +2287,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object_acl(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectAclOutput(**_response)
+        response = self.parse(PutObjectAclOutput, _response)
 
         results: "PutObjectAclOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutObjectAclOutput", results)
 
     def get_legal_hold(
@@ -2396,13 +2340,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_legal_hold(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectLegalHoldOutput(**_response)
+        response = self.parse(GetObjectLegalHoldOutput, _response)
 
         results: "S3ObjectLockLegalHold" = None
         if response is not None:
             results = response.LegalHold
 
-        self.sessionize(results)
         return cast("S3ObjectLockLegalHold", results)
 
     def put_legal_hold(
@@ -2468,13 +2411,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object_legal_hold(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectLegalHoldOutput(**_response)
+        response = self.parse(PutObjectLegalHoldOutput, _response)
 
         results: "PutObjectLegalHoldOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutObjectLegalHoldOutput", results)
 
     def get_lock_configuration(
@@ -2499,13 +2441,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_lock_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectLockConfigurationOutput(**_response)
+        response = self.parse(GetObjectLockConfigurationOutput, _response)
 
         results: "S3ObjectLockConfiguration" = None
         if response is not None:
             results = response.ObjectLockConfiguration
 
-        self.sessionize(results)
         return cast("S3ObjectLockConfiguration", results)
 
     def put_lock_configuration(
@@ -2567,13 +2508,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object_lock_configuration(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectLockConfigurationOutput(**_response)
+        response = self.parse(PutObjectLockConfigurationOutput, _response)
 
         results: "PutObjectLockConfigurationOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutObjectLockConfigurationOutput", results)
 
     def get_retention(
@@ -2621,13 +2561,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_retention(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectRetentionOutput(**_response)
+        response = self.parse(GetObjectRetentionOutput, _response)
 
         results: "ObjectLockRetention" = None
         if response is not None:
             results = response.Retention
 
-        self.sessionize(results)
         return cast("ObjectLockRetention", results)
 
     def put_retention(
@@ -2697,13 +2636,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.put_object_retention(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutObjectRetentionOutput(**_response)
+        response = self.parse(PutObjectRetentionOutput, _response)
 
         results: "PutObjectRetentionOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutObjectRetentionOutput", results)
 
     def get_attributes(
@@ -2789,13 +2727,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object_attributes(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectAttributesOutput(**_response)
+        response = self.parse(GetObjectAttributesOutput, _response)
 
         results: "GetObjectAttributesOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetObjectAttributesOutput", results)
 
     def get_versions(
@@ -2886,13 +2823,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.list_object_versions(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListObjectVersionsOutput(**_response)
+        response = self.parse(ListObjectVersionsOutput, _response)
 
         results: "ListObjectVersionsOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ListObjectVersionsOutput", results)
 
     def download(
@@ -3012,13 +2948,12 @@ class S3ObjectManager(Boto3ModelManager):
         _response = self.client.get_object(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetObjectOutput(**_response)
+        response = self.parse(GetObjectOutput, _response)
 
         results: "GetObjectOutput" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetObjectOutput", results)
 
 
@@ -6496,3 +6431,24 @@ class ListObjectVersionsOutput(Boto3Model):
     in the *Amazon Simple Storage
     Service user guide*.
     """
+
+
+# =========
+# Summaries
+# =========
+
+
+@dataclass(slots=True)
+class S3ObjectSummary(Boto3Summary):
+    """
+    A compact summary of :py:class:`S3Object`.
+    """
+
+    model_class: ClassVar[ModelType[Boto3Model]] = S3Object
+
+    Key: "str | None" = None
+    LastModified: "datetime | None" = None
+    ETag: "str | None" = None
+    Size: "int | None" = None
+    StorageClass: "Literal['STANDARD', 'REDUCED_REDUNDANCY', 'GLACIER', 'STANDARD_IA', 'ONEZONE_IA', 'INTELLIGENT_TIERING', 'DEEP_ARCHIVE', 'OUTPOSTS', 'GLACIER_IR', 'SNOW', 'EXPRESS_ONEZONE', 'FSX_OPENZFS', 'FSX_ONTAP'] | None" = None
+    BucketName: "str | None" = None
@@ -44,9 +44,8 @@ class RegistryManager(Boto3ModelManager):
         _response = self.client.create_registry(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateRegistryResponse(**_response)
+        response = self.parse(CreateRegistryResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateRegistryResponse", response)
 
     @registry_response_to_registry
@@ -64,9 +63,8 @@ class RegistryManager(Boto3ModelManager):
         _response = self.client.update_registry(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateRegistryResponse(**_response)
+        response = self.parse(UpdateRegistryResponse, _response)
 
-        self.sessionize(response)
         return cast("UpdateRegistryResponse", response)
 
     def delete(self, RegistryName: str) -> None:
@@ -91,10 +89,9 @@ class RegistryManager(Boto3ModelManager):
         _response = self.client.describe_registry(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeRegistryResponse(**_response)
+        response = self.parse(DescribeRegistryResponse, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -116,32 +113,14 @@ class RegistryManager(Boto3ModelManager):
             Scope: Can be set to Local or AWS to limit responses to your custom
                 registries, or the ones provided by AWS.
         """
-        paginator = self.client.get_paginator("list_registries")
         args: dict[str, Any] = dict(
             Limit=self.serialize(Limit),
             RegistryNamePrefix=self.serialize(RegistryNamePrefix),
             Scope=self.serialize(Scope),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_registries", ListRegistriesResponse, "Registries", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListRegistriesResponse(**_response)
-            if response.Registries:
-                results.extend(response.Registries)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class DiscovererManager(Boto3ModelManager):
@@ -165,9 +144,8 @@ class DiscovererManager(Boto3ModelManager):
         _response = self.client.create_discoverer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateDiscovererResponse(**_response)
+        response = self.parse(CreateDiscovererResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateDiscovererResponse", response)
 
     @discoverer_response_to_discoverer
@@ -187,9 +165,8 @@ class DiscovererManager(Boto3ModelManager):
         _response = self.client.update_discoverer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateDiscovererResponse(**_response)
+        response = self.parse(UpdateDiscovererResponse, _response)
 
-        self.sessionize(response)
         return cast("UpdateDiscovererResponse", response)
 
     def delete(self, DiscovererId: str) -> None:
@@ -216,10 +193,9 @@ class DiscovererManager(Boto3ModelManager):
         _response = self.client.describe_discoverer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeDiscovererResponse(**_response)
+        response = self.parse(DescribeDiscovererResponse, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -241,32 +217,14 @@ class DiscovererManager(Boto3ModelManager):
             SourceArnPrefix: Specifying this limits the results to only those ARNs that
                 start with the specified prefix.
         """
-        paginator = self.client.get_paginator("list_discoverers")
         args: dict[str, Any] = dict(
             DiscovererIdPrefix=self.serialize(DiscovererIdPrefix),
             Limit=self.serialize(Limit),
             SourceArnPrefix=self.serialize(SourceArnPrefix),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_discoverers", ListDiscoverersResponse, "Discoverers", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListDiscoverersResponse(**_response)
-            if response.Discoverers:
-                results.extend(response.Discoverers)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def start(self, DiscovererId: str) -> "StartDiscovererResponse":
         """
@@ -279,13 +237,12 @@ class DiscovererManager(Boto3ModelManager):
         _response = self.client.start_discoverer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StartDiscovererResponse(**_response)
+        response = self.parse(StartDiscovererResponse, _response)
 
         results: "StartDiscovererResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StartDiscovererResponse", results)
 
     def stop(self, DiscovererId: str) -> "StopDiscovererResponse":
@@ -299,13 +256,12 @@ class DiscovererManager(Boto3ModelManager):
         _response = self.client.stop_discoverer(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = StopDiscovererResponse(**_response)
+        response = self.parse(StopDiscovererResponse, _response)
 
         results: "StopDiscovererResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("StopDiscovererResponse", results)
 
 
@@ -332,9 +288,8 @@ class SchemaManager(Boto3ModelManager):
         _response = self.client.create_schema(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateSchemaResponse(**_response)
+        response = self.parse(CreateSchemaResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateSchemaResponse", response)
 
     @schema_response_to_schema
@@ -362,9 +317,8 @@ class SchemaManager(Boto3ModelManager):
         _response = self.client.update_schema(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateSchemaResponse(**_response)
+        response = self.parse(UpdateSchemaResponse, _response)
 
-        self.sessionize(response)
         return cast("UpdateSchemaResponse", response)
 
     def delete(self, RegistryName: str, SchemaName: str) -> None:
@@ -404,10 +358,9 @@ class SchemaManager(Boto3ModelManager):
         _response = self.client.describe_schema(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DescribeSchemaResponse(**_response)
+        response = self.parse(DescribeSchemaResponse, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -431,32 +384,12 @@ class SchemaManager(Boto3ModelManager):
                 names that start with the specified
                 prefix.
         """
-        paginator = self.client.get_paginator("list_schemas")
         args: dict[str, Any] = dict(
             RegistryName=self.serialize(RegistryName),
             Limit=self.serialize(Limit),
             SchemaNamePrefix=self.serialize(SchemaNamePrefix),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListSchemasResponse(**_response)
-            if response.Schemas:
-                results.extend(response.Schemas)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_schemas", ListSchemasResponse, "Schemas", args)
 
     def list_versions(
         self, RegistryName: str, SchemaName: str, *, Limit: "int | None" = None
@@ -484,13 +417,12 @@ class SchemaManager(Boto3ModelManager):
         results: "builtins.list[SchemaVersionSummary]" = []
 
         for _response in response_iterator:
-            response = ListSchemaVersionsResponse(**_response)
+            response = self.parse(ListSchemaVersionsResponse, _response)
             if response.SchemaVersions is not None:
                 results.extend(response.SchemaVersions)
             else:
                 break
 
-        self.sessionize(results)
         return cast("builtins.list[SchemaVersionSummary]", results)
 
     def export(
@@ -522,13 +454,12 @@ class SchemaManager(Boto3ModelManager):
         _response = self.client.export_schema(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ExportSchemaResponse(**_response)
+        response = self.parse(ExportSchemaResponse, _response)
 
         results: "ExportSchemaResponse | None" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ExportSchemaResponse | None", results)
 
 
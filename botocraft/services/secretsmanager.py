@@ -77,9 +77,8 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.create_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateSecretResponse(**_response)
+        response = self.parse(CreateSecretResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateSecretResponse", response)
 
     def update(
@@ -125,9 +124,8 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.update_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateSecretResponse(**_response)
+        response = self.parse(UpdateSecretResponse, _response)
 
-        self.sessionize(response)
         return cast("UpdateSecretResponse", response)
 
     @secrets_only
@@ -145,10 +143,9 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.describe_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = Secret(**_response)
+        response = self.parse(Secret, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -173,33 +170,13 @@ class SecretManager(Boto3ModelManager):
             SortOrder: Secrets are listed by ``CreatedDate``.
             SortBy: If not specified, secrets are listed by ``CreatedDate``.
         """
-        paginator = self.client.get_paginator("list_secrets")
         args: dict[str, Any] = dict(
             IncludePlannedDeletion=self.serialize(IncludePlannedDeletion),
             Filters=self.serialize(Filters),
             SortOrder=self.serialize(SortOrder),
             SortBy=self.serialize(SortBy),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListSecretsResponse(**_response)
-            if response.SecretList:
-                results.extend(response.SecretList)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_secrets", ListSecretsResponse, "SecretList", args)
 
     def delete(
         self,
@@ -241,7 +218,7 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.delete_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteSecretResponse(**_response)
+        response = self.parse(DeleteSecretResponse, _response)
         return response
 
     def set_value(
@@ -298,13 +275,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.put_secret_value(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutSecretValueResponse(**_response)
+        response = self.parse(PutSecretValueResponse, _response)
 
         results: "PutSecretValueResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutSecretValueResponse", results)
 
     def get_value(
@@ -340,13 +316,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.get_secret_value(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSecretValueResponse(**_response)
+        response = self.parse(GetSecretValueResponse, _response)
 
         results: "GetSecretValueResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetSecretValueResponse", results)
 
     def set_resource_policy(
@@ -384,13 +359,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.put_resource_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutResourcePolicyResponse(**_response)
+        response = self.parse(PutResourcePolicyResponse, _response)
 
         results: "PutResourcePolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("PutResourcePolicyResponse", results)
 
     def get_resource_policy(self, SecretId: str) -> "GetResourcePolicyResponse":
@@ -410,13 +384,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.get_resource_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetResourcePolicyResponse(**_response)
+        response = self.parse(GetResourcePolicyResponse, _response)
 
         results: "GetResourcePolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("GetResourcePolicyResponse", results)
 
     def delete_resource_policy(self, SecretId: str) -> "DeleteResourcePolicyResponse":
@@ -433,13 +406,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.delete_resource_policy(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteResourcePolicyResponse(**_response)
+        response = self.parse(DeleteResourcePolicyResponse, _response)
 
         results: "DeleteResourcePolicyResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DeleteResourcePolicyResponse", results)
 
     def rotate(
@@ -507,13 +479,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.rotate_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RotateSecretResponse(**_response)
+        response = self.parse(RotateSecretResponse, _response)
 
         results: "RotateSecretResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("RotateSecretResponse", results)
 
     def cancel_rotation(self, SecretId: str) -> "CancelRotateSecretResponse":
@@ -528,13 +499,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.cancel_rotate_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CancelRotateSecretResponse(**_response)
+        response = self.parse(CancelRotateSecretResponse, _response)
 
         results: "CancelRotateSecretResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("CancelRotateSecretResponse", results)
 
     def restore(self, SecretId: str) -> "RestoreSecretResponse":
@@ -551,13 +521,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.restore_secret(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = RestoreSecretResponse(**_response)
+        response = self.parse(RestoreSecretResponse, _response)
 
         results: "RestoreSecretResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("RestoreSecretResponse", results)
 
     def random_password(
@@ -622,13 +591,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.get_random_password(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetRandomPasswordResponse(**_response)
+        response = self.parse(GetRandomPasswordResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.RandomPassword
 
-        self.sessionize(results)
         return cast("str", results)
 
     def update_version_stage(
@@ -678,13 +646,12 @@ class SecretManager(Boto3ModelManager):
         _response = self.client.update_secret_version_stage(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = UpdateSecretVersionStageResponse(**_response)
+        response = self.parse(UpdateSecretVersionStageResponse, _response)
 
         results: "UpdateSecretVersionStageResponse" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("UpdateSecretVersionStageResponse", results)
 
 
@@ -730,9 +697,8 @@ class SecretVersionManager(Boto3ModelManager):
         _response = self.client.list_secret_version_ids(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListSecretVersionIdsResponse(**_response)
+        response = self.parse(ListSecretVersionIdsResponse, _response)
         if response and response.Versions:
-            self.sessionize(response.Versions)
             return PrimaryBoto3ModelQuerySet(response.Versions)
         return PrimaryBoto3ModelQuerySet([])
 
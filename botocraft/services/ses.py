@@ -53,30 +53,12 @@ class SESIdentityManager(SESIdentityManagerMixin, Boto3ModelManager):
             MaxItems: The maximum number of identities per page. Possible values are
                 1-1000 inclusive.
         """
-        paginator = self.client.get_paginator("list_identities")
         args: dict[str, Any] = dict(
             IdentityType=self.serialize(IdentityType), MaxItems=self.serialize(MaxItems)
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_identities", ListIdentitiesResponse, "Identities", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListIdentitiesResponse(**_response)
-            if response.Identities:
-                results.extend(response.Identities)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
 
 class SESConfigurationSetManager(SESConfigurationSetManagerMixin, Boto3ModelManager):
@@ -94,28 +76,13 @@ class SESConfigurationSetManager(SESConfigurationSetManagerMixin, Boto3ModelMana
             MaxItems: The number of configuration sets to return.
 
         """
-        paginator = self.client.get_paginator("list_configuration_sets")
         args: dict[str, Any] = dict(MaxItems=self.serialize(MaxItems))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_configuration_sets",
+            SESListConfigurationSetsResponse,
+            "ConfigurationSets",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = SESListConfigurationSetsResponse(**_response)
-            if response.ConfigurationSets:
-                results.extend(response.ConfigurationSets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, name: str) -> None:
         """
@@ -148,10 +115,9 @@ class SESTemplateManager(SESTemplateManagerMixin, Boto3ModelManager):
         _response = self.client.get_template(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetTemplateResponse(**_response)
+        response = self.parse(GetTemplateResponse, _response)
 
         if response and response.Template:
-            self.sessionize(response.Template)
             return response.Template
         return None
 
@@ -168,28 +134,10 @@ class SESTemplateManager(SESTemplateManagerMixin, Boto3ModelManager):
                 to 100. If you do not specify a value, 10 is
                 the default page size.
         """
-        paginator = self.client.get_paginator("list_templates")
         args: dict[str, Any] = dict(MaxItems=self.serialize(MaxItems))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_templates", ListTemplatesResponse, "TemplatesMetadata", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTemplatesResponse(**_response)
-            if response.TemplatesMetadata:
-                results.extend(response.TemplatesMetadata)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, name: str) -> None:
         """
@@ -262,10 +210,9 @@ class SESCustomVerificationEmailTemplateManager(
         _response = self.client.get_custom_verification_email_template(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SESCustomVerificationEmailTemplate(**_response)
+        response = self.parse(SESCustomVerificationEmailTemplate, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -289,14 +236,13 @@ class SESCustomVerificationEmailTemplateManager(
                 break
             if "ResponseMetadata" in _response:
                 del _response["ResponseMetadata"]
-            response = ListCustomVerificationEmailTemplatesResponse(**_response)
+            response = self.parse(ListCustomVerificationEmailTemplatesResponse, _response)
             if response.CustomVerificationEmailTemplates:
                 results.extend(response.CustomVerificationEmailTemplates)
             else:
                 if getattr(response, "NextToken", None):
                     continue
                 break
-        self.sessionize(results)
         if results and isinstance(results[0], Boto3Model):
             return PrimaryBoto3ModelQuerySet(results)
         return results
@@ -328,9 +274,8 @@ class SESReceiptFilterManager(SESReceiptFilterManagerMixin, Boto3ModelManager):
         _response = self.client.list_receipt_filters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListReceiptFiltersResponse(**_response)
+        response = self.parse(ListReceiptFiltersResponse, _response)
         if response and response.Filters:
-            self.sessionize(response.Filters)
             return PrimaryBoto3ModelQuerySet(response.Filters)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -361,28 +306,10 @@ class SESReceiptRuleSetManager(SESReceiptRuleSetManagerMixin, Boto3ModelManager)
         ``NextToken`` that you can provide to the next call to ``ListReceiptRuleSets``
         to retrieve the additional entries.
         """
-        paginator = self.client.get_paginator("list_receipt_rule_sets")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_receipt_rule_sets", ListReceiptRuleSetsResponse, "RuleSets", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListReceiptRuleSetsResponse(**_response)
-            if response.RuleSets:
-                results.extend(response.RuleSets)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, name: str) -> None:
         """
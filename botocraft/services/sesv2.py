@@ -82,10 +82,9 @@ class ConfigurationSetManager(Boto3ModelManager):
         _response = self.client.get_configuration_set(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ConfigurationSet(**_response)
+        response = self.parse(ConfigurationSet, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -113,9 +112,8 @@ class ConfigurationSetManager(Boto3ModelManager):
         _response = self.client.list_configuration_sets(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListConfigurationSetsResponse(**_response)
+        response = self.parse(ListConfigurationSetsResponse, _response)
         if response and response.ConfigurationSets:
-            self.sessionize(response.ConfigurationSets)
             return PrimaryBoto3ModelQuerySet(response.ConfigurationSets)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -216,13 +214,12 @@ class EmailIdentityManager(SESV2EmailIdentityManagerMixin, Boto3ModelManager):
         _response = self.client.send_email(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SendEmailResponse(**_response)
+        response = self.parse(SendEmailResponse, _response)
 
         results: str = None
         if response is not None:
             results = response.MessageId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def send_bulk(
@@ -298,13 +295,12 @@ class EmailIdentityManager(SESV2EmailIdentityManagerMixin, Boto3ModelManager):
         _response = self.client.send_bulk_email(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SendBulkEmailResponse(**_response)
+        response = self.parse(SendBulkEmailResponse, _response)
 
         results: "builtins.list[BulkEmailEntryResult]" = None
         if response is not None:
             results = response.BulkEmailEntryResults
 
-        self.sessionize(results)
         return cast("builtins.list[BulkEmailEntryResult]", results)
 
 
@@ -363,10 +359,9 @@ class ContactListManager(Boto3ModelManager):
         _response = self.client.get_contact_list(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ContactList(**_response)
+        response = self.parse(ContactList, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -394,9 +389,8 @@ class ContactListManager(Boto3ModelManager):
         _response = self.client.list_contact_lists(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListContactListsResponse(**_response)
+        response = self.parse(ListContactListsResponse, _response)
         if response and response.ContactLists:
-            self.sessionize(response.ContactLists)
             return PrimaryBoto3ModelQuerySet(response.ContactLists)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -473,10 +467,9 @@ class EmailTemplateManager(Boto3ModelManager):
         _response = self.client.get_email_template(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = EmailTemplate(**_response)
+        response = self.parse(EmailTemplate, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -503,9 +496,8 @@ class EmailTemplateManager(Boto3ModelManager):
         _response = self.client.list_email_templates(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListEmailTemplatesResponse(**_response)
+        response = self.parse(ListEmailTemplatesResponse, _response)
         if response and response.TemplatesMetadata:
-            self.sessionize(response.TemplatesMetadata)
             return PrimaryBoto3ModelQuerySet(response.TemplatesMetadata)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -551,10 +543,9 @@ class SuppressedDestinationManager(Boto3ModelManager):
         _response = self.client.get_suppressed_destination(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetSuppressedDestinationResponse(**_response)
+        response = self.parse(GetSuppressedDestinationResponse, _response)
 
         if response and response.SuppressedDestinationInstance:
-            self.sessionize(response.SuppressedDestinationInstance)
             return response.SuppressedDestinationInstance
         return None
 
@@ -598,9 +589,8 @@ class SuppressedDestinationManager(Boto3ModelManager):
         _response = self.client.list_suppressed_destinations(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListSuppressedDestinationsResponse(**_response)
+        response = self.parse(ListSuppressedDestinationsResponse, _response)
         if response and response.SuppressedDestinationSummaries:
-            self.sessionize(response.SuppressedDestinationSummaries)
             return PrimaryBoto3ModelQuerySet(response.SuppressedDestinationSummaries)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -649,9 +639,8 @@ class DeliverabilityTestReportManager(
         _response = self.client.list_deliverability_test_reports(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListDeliverabilityTestReportsResponse(**_response)
+        response = self.parse(ListDeliverabilityTestReportsResponse, _response)
         if response and response.DeliverabilityTestReports:
-            self.sessionize(response.DeliverabilityTestReports)
             return PrimaryBoto3ModelQuerySet(response.DeliverabilityTestReports)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -698,10 +687,9 @@ class MultiRegionEndpointManager(Boto3ModelManager):
         _response = self.client.get_multi_region_endpoint(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = MultiRegionEndpoint(**_response)
+        response = self.parse(MultiRegionEndpoint, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
@@ -711,28 +699,13 @@ class MultiRegionEndpointManager(Boto3ModelManager):
         """
         List the multi-region endpoints (global-endpoints).
         """
-        paginator = self.client.get_paginator("list_multi_region_endpoints")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "list_multi_region_endpoints",
+            ListMultiRegionEndpointsResponse,
+            "MultiRegionEndpoints",
+            args,
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListMultiRegionEndpointsResponse(**_response)
-            if response.MultiRegionEndpoints:
-                results.extend(response.MultiRegionEndpoints)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, EndpointName: str) -> None:
         """
@@ -764,9 +737,8 @@ class TenantManager(Boto3ModelManager):
         _response = self.client.create_tenant(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateTenantResponse(**_response)
+        response = self.parse(CreateTenantResponse, _response)
 
-        self.sessionize(response)
         return cast("CreateTenantResponse", response)
 
     def get(self, TenantName: str) -> "Tenant | None":
@@ -781,10 +753,9 @@ class TenantManager(Boto3ModelManager):
         _response = self.client.get_tenant(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetTenantResponse(**_response)
+        response = self.parse(GetTenantResponse, _response)
 
         if response and response.TenantInstance:
-            self.sessionize(response.TenantInstance)
             return response.TenantInstance
         return None
 
@@ -795,28 +766,8 @@ class TenantManager(Boto3ModelManager):
         List all tenants associated with your account in the current Amazon Web Services
         Region.
         """
-        paginator = self.client.get_paginator("list_tenants")
         args: dict[str, Any] = dict()
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListTenantsResponse(**_response)
-            if response.Tenants:
-                results.extend(response.Tenants)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_tenants", ListTenantsResponse, "Tenants", args)
 
     def delete(self, TenantName: str) -> None:
         """
@@ -887,10 +838,9 @@ class DedicatedIpPoolManager(Boto3ModelManager):
         _response = self.client.get_dedicated_ip_pool(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetDedicatedIpPoolResponse(**_response)
+        response = self.parse(GetDedicatedIpPoolResponse, _response)
 
         if response and response.DedicatedIpPoolInstance:
-            self.sessionize(response.DedicatedIpPoolInstance)
             return response.DedicatedIpPoolInstance
         return None
 
@@ -918,9 +868,8 @@ class DedicatedIpPoolManager(Boto3ModelManager):
         _response = self.client.list_dedicated_ip_pools(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ListDedicatedIpPoolsResponse(**_response)
+        response = self.parse(ListDedicatedIpPoolsResponse, _response)
         if response and response.DedicatedIpPools:
-            self.sessionize(response.DedicatedIpPools)
             return PrimaryBoto3ModelQuerySet(response.DedicatedIpPools)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -955,10 +904,9 @@ class DedicatedIpManager(Boto3ModelManager):
         _response = self.client.get_dedicated_ip(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetDedicatedIpResponse(**_response)
+        response = self.parse(GetDedicatedIpResponse, _response)
 
         if response and response.DedicatedIpInstance:
-            self.sessionize(response.DedicatedIpInstance)
             return response.DedicatedIpInstance
         return None
 
@@ -993,9 +941,8 @@ class DedicatedIpManager(Boto3ModelManager):
         _response = self.client.get_dedicated_ips(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetDedicatedIpsResponse(**_response)
+        response = self.parse(GetDedicatedIpsResponse, _response)
         if response and response.DedicatedIps:
-            self.sessionize(response.DedicatedIps)
             return PrimaryBoto3ModelQuerySet(response.DedicatedIps)
         return PrimaryBoto3ModelQuerySet([])
 
@@ -0,0 +1,185 @@
+"""
+Request coalescing ("singleflight") for identical in-flight AWS calls.
+
+When many threads ask for the same ``TaskDefinition`` or ``Cluster`` at once,
+each would otherwise send its own describe call.  :py:class:`SingleFlight`
+lets the first caller make the call while identical concurrent callers wait
+for it and share its parsed response (or its exception).
+
+:py:class:`botocraft.services.abstract.Boto3ModelManager` routes every
+generated ``get()`` and ``get_many()`` through the process-wide
+:py:data:`flights`, keyed on the boto3 client, the method and the normalised
+arguments.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from typing import TYPE_CHECKING, Any
+
+from .identity import freeze
+from .trusted import parse_mode, shaped
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+@dataclass
+class FlightStats:
+    """
+    Counters describing how many calls coalescing saved.
+
+    Args:
+        calls: Calls actually made.
+        coalesced: Calls that shared another call's response instead.
+        in_flight: Calls currently being made.
+
+    """
+
+    #: Calls actually made.
+    calls: int = 0
+    #: Calls that shared another call's response instead of being made.
+    coalesced: int = 0
+    #: Calls currently being made.
+    in_flight: int = 0
+
+
+class _Flight:
+    """
+    One in-flight call, and the result its waiters will share.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.leader = threading.get_ident()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls into one.
+    """
+
+    def __init__(self) -> None:
+        #: Set to ``False`` to make every call on its own.
+        self.enabled = True
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Call ``func``, unless a call with the same ``key`` is already in
+        flight, in which case wait for it and share its result.
+
+        Args:
+            key: Identifies calls that are interchangeable.
+            func: Makes the call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+
+        Returns:
+            The result of the shared call.
+
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.leader != threading.get_ident():
+                self._coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self._calls += 1
+                leader = True
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def reset(self) -> None:
+        """
+        Reset the counters.
+        """
+        with self._lock:
+            self._calls = self._coalesced = 0
+
+    def stats(self) -> FlightStats:
+        """
+        Return the current call counters.
+
+        Returns:
+            A snapshot of the counters.
+
+        """
+        with self._lock:
+            return FlightStats(
+                calls=self._calls,
+                coalesced=self._coalesced,
+                in_flight=len(self._flights),
+            )
+
+
+#: The process-wide coalescer used by manager ``get()`` and ``get_many()``.
+flights = SingleFlight()
+
+
+def coalescing() -> bool:
+    """
+    Return whether :py:func:`coalesced` methods share identical calls.
+
+    Returns:
+        Whether :py:data:`flights` is enabled.
+
+    """
+    return flights.enabled
+
+
+def coalesced(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Make identical concurrent calls of a manager method share one AWS call.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    the ``get()`` and ``get_many()`` each of its subclasses defines.  Calls
+    given ``only`` or ``raw`` are never shared, since their results differ,
+    and calls only share with calls that build their models the same way
+    (see :py:func:`~botocraft.services.trusted.parse_mode`).
+
+    Args:
+        func: The method to wrap.
+
+    Returns:
+        The wrapped method.
+
+    """
+    method = func.__name__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not flights.enabled or shaped():
+            return func(self, *args, **kwargs)
+        arguments = freeze(func, args, kwargs)
+        if arguments is None:
+            return func(self, *args, **kwargs)
+        return flights.do(
+            (self.client, type(self), method, parse_mode(), arguments),
+            lambda: func(self, *args, **kwargs),
+        )
+
+    return wrapper
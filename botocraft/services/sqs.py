@@ -49,9 +49,8 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
         _response = self.client.create_queue(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CreateQueueResult(**_response)
+        response = self.parse(CreateQueueResult, _response)
 
-        self.sessionize(response.QueueUrl)
         return cast("str", response.QueueUrl)
 
     def delete(self, QueueUrl: str) -> None:
@@ -82,28 +81,8 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
                 queues whose name begins with the
                 specified string are returned.
         """
-        paginator = self.client.get_paginator("list_queues")
         args: dict[str, Any] = dict(QueueNamePrefix=self.serialize(QueueNamePrefix))
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
-        )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = ListQueuesResult(**_response)
-            if response.QueueUrls:
-                results.extend(response.QueueUrls)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
+        return self.paginate("list_queues", ListQueuesResult, "QueueUrls", args)
 
     def purge(self, QueueUrl: str) -> "None":
         """
@@ -265,13 +244,12 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
         _response = self.client.receive_message(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ReceiveMessageResult(**_response)
+        response = self.parse(ReceiveMessageResult, _response)
 
         results: "builtins.list[Message]" = None
         if response is not None:
             results = response.Messages
 
-        self.sessionize(results)
         return cast("builtins.list[Message]", results)
 
     def batch_send_messages(
@@ -295,13 +273,12 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
         _response = self.client.send_message_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SendMessageBatchResult(**_response)
+        response = self.parse(SendMessageBatchResult, _response)
 
         results: "SendMessageBatchResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("SendMessageBatchResult", results)
 
     def batch_delete_messages(
@@ -323,13 +300,12 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
         _response = self.client.delete_message_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = DeleteMessageBatchResult(**_response)
+        response = self.parse(DeleteMessageBatchResult, _response)
 
         results: "DeleteMessageBatchResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("DeleteMessageBatchResult", results)
 
     def change_message_visibility(
@@ -388,13 +364,12 @@ class QueueManager(QueueManagerMixin, Boto3ModelManager):
         _response = self.client.change_message_visibility_batch(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = ChangeMessageVisibilityBatchResult(**_response)
+        response = self.parse(ChangeMessageVisibilityBatchResult, _response)
 
         results: "ChangeMessageVisibilityBatchResult" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("ChangeMessageVisibilityBatchResult", results)
 
 
@@ -463,13 +438,12 @@ class MessageManager(Boto3ModelManager):
         _response = self.client.send_message(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = SendMessageResult(**_response)
+        response = self.parse(SendMessageResult, _response)
 
         results: str = None
         if response is not None:
             results = response.MessageId
 
-        self.sessionize(results)
         return cast("str", results)
 
     def delete(self, QueueUrl: str, ReceiptHandle: str) -> None:
@@ -15,6 +15,8 @@ from botocraft.services.common import Tag
 from .abstract import PrimaryBoto3ModelQuerySet
 from botocraft.mixins.tags import TagsDictMixin
 from typing import ClassVar, Literal, Any, Type as ModelType, cast
+from dataclasses import dataclass
+from .summary import Boto3Summary
 
 # ===============
 # Managers
@@ -23,6 +25,9 @@ from typing import ClassVar, Literal, Any, Type as ModelType, cast
 
 class ParameterManager(Boto3ModelManager):
     service_name: str = "ssm"
+    get_many_operation: ClassVar[str] = "get_parameters"
+    get_many_arg: ClassVar[tuple[str, str]] = ("Name", "Names")
+    get_many_batch_size: ClassVar[int] = 10
 
     def create(
         self,
@@ -81,9 +86,8 @@ class ParameterManager(Boto3ModelManager):
         _response = self.client.put_parameter(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutParameterResult(**_response)
+        response = self.parse(PutParameterResult, _response)
 
-        self.sessionize(response.Version)
         return cast("int", response.Version)
 
     def update(
@@ -145,9 +149,8 @@ class ParameterManager(Boto3ModelManager):
         _response = self.client.put_parameter(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = PutParameterResult(**_response)
+        response = self.parse(PutParameterResult, _response)
 
-        self.sessionize(response.Version)
         return cast("int", response.Version)
 
     def get(self, Name: str, *, WithDecryption: bool = True) -> "Parameter | None":
@@ -169,10 +172,9 @@ class ParameterManager(Boto3ModelManager):
         _response = self.client.get_parameters(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = GetParametersResult(**_response)
+        response = self.parse(GetParametersResult, _response)
 
         if response and response.Parameters:
-            self.sessionize(response.Parameters[0])
             return response.Parameters[0]
         return None
 
@@ -196,15 +198,14 @@ class ParameterManager(Boto3ModelManager):
         args: dict[str, Any] = dict(
             Names=self.serialize(Names), WithDecryption=self.serialize(WithDecryption)
         )
-        _response = self.client.get_parameters(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.describe_batched(
+            "get_parameters",
+            GetParametersResult,
+            "Parameters",
+            args,
+            batch_arg="Names",
+            batch_size=self.get_many_batch_size,
         )
-        response = GetParametersResult(**_response)
-
-        if response.Parameters:
-            self.sessionize(response.Parameters)
-            return PrimaryBoto3ModelQuerySet(response.Parameters)
-        return PrimaryBoto3ModelQuerySet([])
 
     def list(
         self,
@@ -225,32 +226,14 @@ class ParameterManager(Boto3ModelManager):
             Shared: Lists parameters that are shared with you.
 
         """
-        paginator = self.client.get_paginator("describe_parameters")
         args: dict[str, Any] = dict(
             Filters=self.serialize(Filters),
             ParameterFilters=self.serialize(ParameterFilters),
             Shared=self.serialize(Shared),
         )
-        response_iterator = paginator.paginate(
-            **{k: v for k, v in args.items() if v is not None}
+        return self.paginate(
+            "describe_parameters", DescribeParametersResult, "Parameters", args
         )
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ["ResponseMetadata"]:
-                break
-            if "ResponseMetadata" in _response:
-                del _response["ResponseMetadata"]
-            response = DescribeParametersResult(**_response)
-            if response.Parameters:
-                results.extend(response.Parameters)
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        return results
 
     def delete(self, Name: str) -> None:
         """
@@ -570,3 +553,23 @@ class DescribeParametersResult(Boto3Model):
 
 class DeleteParameterResult(Boto3Model):
     pass
+
+
+# =========
+# Summaries
+# =========
+
+
+@dataclass(slots=True)
+class ParameterMetadataSummary(Boto3Summary):
+    """
+    A compact summary of :py:class:`ParameterMetadata`.
+    """
+
+    model_class: ClassVar[ModelType[Boto3Model]] = ParameterMetadata
+
+    Name: "str | None" = None
+    Type: "Literal['String', 'StringList', 'SecureString'] | None" = None
+    LastModifiedDate: "datetime | None" = None
+    Version: "int | None" = None
+    DataType: "str | None" = None
@@ -139,13 +139,12 @@ class AssumeRoleManager(Boto3ModelManager):
         _response = self.client.assume_role(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssumeRole(**_response)
+        response = self.parse(AssumeRole, _response)
 
         results: "AssumeRole" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssumeRole", results)
 
     def assume_with_saml(
@@ -214,13 +213,12 @@ class AssumeRoleManager(Boto3ModelManager):
         _response = self.client.assume_role_with_saml(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssumeRoleWithSAMLResponse(**_response)
+        response = self.parse(AssumeRoleWithSAMLResponse, _response)
 
         results: "AssumeRole | None" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssumeRole | None", results)
 
     def assume_with_web_identity(
@@ -298,13 +296,12 @@ class AssumeRoleManager(Boto3ModelManager):
         _response = self.client.assume_role_with_web_identity(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = AssumeRoleWithWebIdentityResponse(**_response)
+        response = self.parse(AssumeRoleWithWebIdentityResponse, _response)
 
         results: "AssumeRole | None" = None
         if response is not None:
             results = response
 
-        self.sessionize(results)
         return cast("AssumeRole | None", results)
 
 
@@ -322,10 +319,9 @@ class CallerIdentityManager(Boto3ModelManager):
         _response = self.client.get_caller_identity(
             **{k: v for k, v in args.items() if v is not None}
         )
-        response = CallerIdentity(**_response)
+        response = self.parse(CallerIdentity, _response)
 
         if response:
-            self.sessionize(response)
             return response
         return None
 
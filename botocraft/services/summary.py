@@ -0,0 +1,306 @@
+"""
+Compact summaries of models, for listings too large to hold as models.
+
+Listing a bucket with a million objects builds a million
+:py:class:`~botocraft.services.s3.S3Object` models, each carrying pydantic's
+per-instance overhead and every field botocore returned.  A model whose
+definition in ``models.yml`` names ``summary`` fields also gets a generated
+summary class: a ``__slots__`` dataclass, named after the model with a
+``Summary`` suffix, holding just those fields.
+
+.. code-block:: yaml
+
+    Object:
+      alternate_name: S3Object
+      summary:
+        - Key
+        - Size
+        - LastModified
+
+Pass ``summary=True`` to any generated manager method to build the models in
+its response as summaries.  Models that have no summary class are left as the
+dicts botocore returned, as with ``raw=True``:
+
+.. code-block:: python
+
+    objects = S3Object.objects.list(Bucket="my-bucket", summary=True)
+    big = objects.filter(Size__gt=2**30)
+    model = big.first().to_model()
+
+For lists too large even for summaries, :py:meth:`Boto3Summary.columns`
+stores them as a :py:class:`SummaryColumns`, with one list per field rather
+than one object per row:
+
+.. code-block:: python
+
+    columns = S3ObjectSummary.columns(objects)
+    total = sum(size for size in columns.column("Size") if size)
+
+Like projections (see :py:mod:`botocraft.services.projection`), summaries
+are never cached, coalesced or kept in the identity map, and have no
+relationships or session.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, ClassVar, overload
+
+from pydantic import BaseModel
+
+from .trusted import _converter, construct
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+#: The summary class of each model class that has one.
+_SUMMARIES: dict[type[BaseModel], type[Boto3Summary]] = {}
+#: How each summary class reads its fields from a botocore dict, as
+#: ``(field name, botocore key, converter)`` in field order.
+_READERS: dict[
+    type[Boto3Summary], tuple[tuple[str, str, Callable[[Any], Any] | None], ...]
+] = {}
+
+
+def summary_class(model_class: type[BaseModel]) -> type[Boto3Summary] | None:
+    """
+    Return the summary class generated for ``model_class``.
+
+    Args:
+        model_class: The model class.
+
+    Returns:
+        The summary class, or ``None`` if ``model_class`` has none.
+
+    """
+    return _SUMMARIES.get(model_class)
+
+
+def _readers(
+    summary: type[Boto3Summary],
+) -> tuple[tuple[str, str, Callable[[Any], Any] | None], ...]:
+    """
+    Work out, once per summary class, how to read its fields from a botocore
+    dict.
+
+    Args:
+        summary: The summary class.
+
+    Raises:
+        TypeError: If a summary field is not a field of the model.
+
+    Returns:
+        ``(field name, botocore key, converter)`` for each field, in order.
+
+    """
+    readers = _READERS.get(summary)
+    if readers is not None:
+        return readers
+    model_fields = summary.model_class.model_fields
+    found = []
+    for field in dataclasses.fields(summary):  # type: ignore[arg-type]
+        model_field = model_fields.get(field.name)
+        if model_field is None:
+            msg = (
+                f"{summary.__name__}.{field.name} is not a field of "
+                f"{summary.model_class.__name__}"
+            )
+            raise TypeError(msg)
+        found.append(
+            (
+                field.name,
+                model_field.alias or field.name,
+                _converter(model_field.annotation),
+            )
+        )
+    readers = _READERS[summary] = tuple(found)
+    return readers
+
+
+class Boto3Summary:
+    """
+    The base class of the summary classes ``botocraft sync`` generates.
+
+    Subclasses are ``__slots__`` dataclasses whose fields are a subset of
+    :py:attr:`model_class`'s fields, with the same names and types.
+    """
+
+    __slots__ = ()
+
+    #: The model this summarizes.
+    model_class: ClassVar[type[BaseModel]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # ``@dataclass(slots=True)`` makes a new class, which replaces the
+        # original here
+        if "model_class" in cls.__dict__:
+            _SUMMARIES[cls.model_class] = cls
+
+    @classmethod
+    def from_response(cls, data: dict[str, Any]) -> Boto3Summary:
+        """
+        Build a summary from botocore's dict for one model.
+
+        Args:
+            data: The botocore dict.
+
+        Returns:
+            The summary.
+
+        """
+        values = []
+        for _, key, convert in _readers(cls):
+            value = data.get(key)
+            if convert is not None and value is not None:
+                value = convert(value)
+            values.append(value)
+        return cls(*values)
+
+    @classmethod
+    def columns(cls, rows: Iterable[Boto3Summary | dict[str, Any]]) -> SummaryColumns:
+        """
+        Store ``rows`` column by column.
+
+        Args:
+            rows: Summaries of this class, or botocore dicts.
+
+        Returns:
+            The columns.
+
+        """
+        return SummaryColumns(cls, rows)
+
+    def to_model(self) -> BaseModel:
+        """
+        Build the full model from this summary.
+
+        Only the fields the summary holds are set; the model's other fields
+        have their defaults.
+
+        Returns:
+            The model.
+
+        """
+        data = {
+            key: value
+            for name, key, _ in _readers(type(self))
+            if (value := getattr(self, name)) is not None
+        }
+        return construct(self.model_class, data)
+
+
+class SummaryColumns:
+    """
+    Summaries stored as one list per field, rather than one object per row.
+
+    Rows are built as summaries when they are read, so holding a million
+    rows costs a few lists rather than a million objects.
+
+    Args:
+        summary: The summary class of the rows.
+        rows: Summaries, or botocore dicts, to start with.
+
+    """
+
+    __slots__ = ("_columns", "summary")
+
+    def __init__(
+        self,
+        summary: type[Boto3Summary],
+        rows: Iterable[Boto3Summary | dict[str, Any]] = (),
+    ) -> None:
+        #: The summary class of the rows.
+        self.summary = summary
+        #: The values of each field, by field name.
+        self._columns: dict[str, list[Any]] = {
+            name: [] for name, _, _ in _readers(summary)
+        }
+        self.extend(rows)
+
+    def extend(self, rows: Iterable[Boto3Summary | dict[str, Any]]) -> None:
+        """
+        Add rows to the end of the columns.
+
+        Args:
+            rows: Summaries, or botocore dicts.
+
+        """
+        readers = [
+            (self._columns[name].append, name, key, convert)
+            for name, key, convert in _readers(self.summary)
+        ]
+        for row in rows:
+            if isinstance(row, dict):
+                for append, _, key, convert in readers:
+                    value = row.get(key)
+                    if convert is not None and value is not None:
+                        value = convert(value)
+                    append(value)
+            else:
+                for append, name, _, _ in readers:
+                    append(getattr(row, name))
+
+    def append(self, row: Boto3Summary | dict[str, Any]) -> None:
+        """
+        Add a row to the end of the columns.
+
+        Args:
+            row: A summary, or a botocore dict.
+
+        """
+        self.extend((row,))
+
+    def column(self, name: str) -> list[Any]:
+        """
+        Return the values of one field, in row order.
+
+        Args:
+            name: The field name.
+
+        Raises:
+            KeyError: If the summary class has no such field.
+
+        Returns:
+            The values.  This is the stored list, so do not change it.
+
+        """
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()), ()))
+
+    @overload
+    def __getitem__(self, index: int) -> Boto3Summary: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SummaryColumns: ...
+
+    def __getitem__(self, index: int | slice) -> Boto3Summary | SummaryColumns:
+        if isinstance(index, slice):
+            sliced = SummaryColumns(self.summary)
+            sliced._columns = {
+                name: values[index] for name, values in self._columns.items()
+            }
+            return sliced
+        return self.summary(*(values[index] for values in self._columns.values()))
+
+    def __iter__(self) -> Iterator[Boto3Summary]:
+        summary = self.summary
+        for values in zip(*self._columns.values(), strict=True):
+            yield summary(*values)
+
+    def to_models(self) -> Iterator[BaseModel]:
+        """
+        Build the full model of each row, as :py:meth:`Boto3Summary.to_model`
+        does.
+
+        Yields:
+            The models, in row order.
+
+        """
+        for row in self:
+            yield row.to_model()
+
+    def __repr__(self) -> str:
+        return f"SummaryColumns({self.summary.__name__}, {len(self)} rows)"
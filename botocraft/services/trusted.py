@@ -0,0 +1,725 @@
+"""
+Building models from AWS responses, with or without validation.
+
+botocore has already parsed each response against the service model, so
+timestamps are ``datetime`` objects, integers are ``int`` and so on.
+:py:func:`construct` builds a model and its nested models from such a response
+the way :py:meth:`pydantic.BaseModel.model_construct` does, trusting botocore
+instead of validating the payload again.  That also accepts values the
+generated models do not know about yet, like an enum value AWS has just added.
+
+pydantic-core validates a response faster than Python can construct one,
+so :py:func:`parse` always tries validation first.  Whether a response the
+models reject raises, or is built by :py:func:`construct` instead, is set by
+the ``responses.validation`` setting, or for one call by passing
+``validate=False`` (or ``True``) to any generated manager method:
+
+.. code-block:: python
+
+    instances = Instance.objects.list(validate=False)
+
+Models you build yourself, like the ones passed to ``create()`` and
+``update()``, are always validated.
+
+Passing ``lazy=True`` (or setting ``responses.lazy``) is what saves time:
+the nested models of models that allow it
+(:py:class:`~botocraft.services.abstract.LazyBoto3Model`, which primary
+models are) are kept as botocore's dicts until they are first read, so a
+listing of task definitions does not build every container definition,
+volume and port mapping up front.  Reading a field, serializing, equality,
+copying and pickling all build what they need first, so a lazy model behaves
+like the model built in full.  Lazy models are not validated, and models of
+frozen classes are built in full.
+
+The ``only`` and ``raw`` arguments build the models in a response as
+projections or leave them as dicts instead; see
+:py:mod:`botocraft.services.projection`.  The ``summary`` argument builds
+them as compact summaries; see :py:mod:`botocraft.services.summary`.
+"""
+
+from __future__ import annotations
+
+import copy
+import enum
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any, NamedTuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from pydantic.fields import FieldInfo
+
+    from botocraft.config import ResponseSettings
+
+
+class ParseOptions(NamedTuple):
+    """
+    How the manager method running builds the responses it parses.
+    """
+
+    #: Whether to validate responses, or ``None`` to follow the
+    #: ``responses.validation`` setting.
+    validate: bool | None = None
+    #: The field paths to project models to, if any.
+    only: tuple[str, ...] | None = None
+    #: Whether to leave models as botocore dicts.
+    raw: bool = False
+    #: Whether to build nested models on first access, or ``None`` to follow
+    #: the ``responses.lazy`` setting.
+    lazy: bool | None = None
+    #: Whether to build models as their summary classes.
+    summary: bool = False
+
+
+#: The options given to the manager method running.  A named tuple is
+#: immutable, so it is safe as the default.
+_OPTIONS: ContextVar[ParseOptions] = ContextVar(
+    "botocraft_parse_options",
+    default=ParseOptions(),  # noqa: B039
+)
+
+#: How to build each model class, keyed by class and whether nested models
+#: are built lazily; see :py:func:`_plan`.
+_PLANS: dict[tuple[type[BaseModel], bool], _Plan | None] = {}
+
+#: The key in a lazily built model's ``__dict__`` holding the fields not
+#: built yet, as field name to ``(converter, botocore value)``.
+PENDING = "__botocraft_pending__"
+
+#: Default values that can be shared between models without copying.
+_IMMUTABLE = (type(None), str, bytes, int, float, bool, enum.Enum, tuple, frozenset)
+#: Stands in for a default that is made fresh for each model.
+_UNSET: Any = object()
+
+
+@lru_cache(maxsize=1)
+def _settings() -> ResponseSettings:
+    """
+    Load the response settings once per process.
+
+    Returns:
+        The configured response settings.
+
+    """
+    from botocraft.config import BotocraftSettings
+
+    return BotocraftSettings().responses
+
+
+def validating() -> bool:
+    """
+    Return whether responses parsed now should be validated.
+
+    Returns:
+        The ``validate`` argument of the manager method running, if it was
+        given, else the ``responses.validation`` setting.
+
+    """
+    validate = _OPTIONS.get().validate
+    return _settings().validation if validate is None else validate
+
+
+def deferring() -> bool:
+    """
+    Return whether nested models in responses parsed now should be built on
+    first access.
+
+    Returns:
+        The ``lazy`` argument of the manager method running, if it was given,
+        else the ``responses.lazy`` setting.
+
+    """
+    lazy = _OPTIONS.get().lazy
+    return _settings().lazy if lazy is None else lazy
+
+
+def parse_mode() -> tuple[bool, bool]:
+    """
+    Return how models parsed now are built, for the identity map, the
+    response cache, coalescing and batching to key the models they share on,
+    so a call never gets a model built less strictly than it asked for.
+
+    Returns:
+        :py:func:`validating` and :py:func:`deferring`.
+
+    """
+    return validating(), deferring()
+
+
+def shaped() -> bool:
+    """
+    Return whether responses parsed now are built as something other than
+    models, because the manager method running was given ``only``, ``raw``
+    or ``summary``.
+
+    Caches, coalescing and the identity map step aside for such calls, since
+    they hold models.
+
+    Returns:
+        Whether responses are projected, summarized or left raw.
+
+    """
+    options = _OPTIONS.get()
+    return options.raw or options.summary or options.only is not None
+
+
+def parse_scoped(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Let the manager method ``func`` take ``validate``, ``lazy``, ``only``,
+    ``raw`` and ``summary`` keyword arguments that decide how the responses
+    it parses are built.
+
+    :py:class:`botocraft.services.abstract.Boto3ModelManager` applies this to
+    every public method its subclasses define.
+
+    Args:
+        func: The manager method to wrap.
+
+    Raises:
+        ValueError: If more than one of ``only``, ``raw`` and ``summary`` is
+            given, or both ``validate=True`` and ``lazy=True``.
+
+    Returns:
+        The wrapped method.
+
+    """
+
+    @wraps(func)
+    def wrapper(
+        *args,
+        validate: bool | None = None,
+        lazy: bool | None = None,
+        only: Iterable[str] | None = None,
+        raw: bool = False,
+        summary: bool = False,
+        **kwargs,
+    ):
+        if (
+            validate is None
+            and lazy is None
+            and only is None
+            and not raw
+            and not summary
+        ):
+            return func(*args, **kwargs)
+        if only is not None and raw:
+            msg = "Pass only or raw, not both"
+            raise ValueError(msg)
+        if summary and (only is not None or raw):
+            msg = "Pass summary without only or raw"
+            raise ValueError(msg)
+        if validate and lazy:
+            msg = "Lazy models are not validated; pass validate or lazy, not both"
+            raise ValueError(msg)
+        options = ParseOptions(
+            validate, None if only is None else tuple(only), raw, lazy, summary
+        )
+        token = _OPTIONS.set(options)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _OPTIONS.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def projected_through(field: str) -> Iterator[None]:
+    """
+    Within a block, apply ``only`` paths to the models held in ``field`` of
+    each model parsed, rather than to the models themselves.
+
+    This is for manager methods that unwrap their models from a container
+    model, like EC2 instances from their reservations, so that ``only``
+    still names the fields of the models the method returns.
+
+    Args:
+        field: The container model's field holding the models.
+
+    """
+    options = _OPTIONS.get()
+    if options.only is None:
+        yield
+        return
+    only = tuple(f"{field}__{path}" for path in options.only)
+    token = _OPTIONS.set(options._replace(only=only))
+    try:
+        yield
+    finally:
+        _OPTIONS.reset(token)
+
+
+def _converter(  # noqa: PLR0911
+    annotation: Any, lazy: bool = False
+) -> Callable[[Any], Any] | None:
+    """
+    Return how to build a field's value from botocore's parsed value.
+
+    Args:
+        annotation: The field's type.
+        lazy: Whether the models built defer their own nested models.
+
+    Returns:
+        A function converting a (non-``None``) value, or ``None`` when the
+        value can be used as is.
+
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return _converter(members[0], lazy)
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: (
+            construct(annotation, value, lazy=lazy)
+            if isinstance(value, dict)
+            else value
+        )
+    elif origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            # The common case, so skip a call per member
+            return lambda value: [
+                construct(item, member, lazy=lazy) if type(member) is dict else member
+                for member in value
+            ]
+        convert = _converter(item, lazy)
+        if convert is None:
+            return None
+        return lambda value: [
+            convert(member) if member is not None else None for member in value
+        ]
+    elif origin is dict:
+        _, item = get_args(annotation) or (Any, Any)
+        convert = _converter(item, lazy)
+        if convert is None:
+            return None
+        return lambda value: {
+            key: convert(member) if member is not None else None
+            for key, member in value.items()
+        }
+    if not _mentions_model(annotation):
+        return None
+    # Anything else that holds models (e.g. a union of two models) is rare
+    # enough to just validate
+    return TypeAdapter(annotation).validate_python
+
+
+def _mentions_model(annotation: Any) -> bool:
+    """
+    Return whether a type is, or contains, a pydantic model.
+
+    Args:
+        annotation: The type to check.
+
+    Returns:
+        Whether building a value of this type may need to build a model.
+
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_mentions_model(arg) for arg in get_args(annotation))
+
+
+class _Plan(NamedTuple):
+    """
+    How to build one model class without validation.
+    """
+
+    #: Every field with a default, in order, holding the default if it can be
+    #: shared or :py:data:`_UNSET` if it is made fresh for each model.
+    template: dict[str, Any]
+    #: The field name for each response key, and how to build its value (or
+    #: ``None`` to use it as is).
+    keys: dict[str, tuple[str, Callable[[Any], Any] | None]]
+    #: The fields whose defaults are made fresh for each model, how to make
+    #: the default, and whether that takes the fields built so far.
+    fresh: list[tuple[str, Callable[..., Any], bool]]
+    #: Whether response keys that fill no field are kept as extra attributes.
+    extra: bool
+    #: The fields holding models, which are left for
+    #: :py:func:`build_pending` when the model is built lazily.
+    deferred: frozenset[str]
+    #: Every response key that fills a field.
+    known: frozenset[str]
+    #: The response keys that fill a field of another name, with that name.
+    renamed: tuple[tuple[str, str], ...]
+    #: How to build the value of each field that needs building.
+    converted: dict[str, Callable[[Any], Any]]
+
+
+def _fresh_default(field: FieldInfo) -> tuple[Callable[..., Any], bool]:
+    """
+    Return how to make ``field``'s default for a new model.
+
+    Args:
+        field: A field whose default must not be shared between models.
+
+    Returns:
+        A function making the default, and whether it takes the fields built
+        so far.
+
+    """
+    if field.default_factory is None:
+        return partial(copy.deepcopy, field.default), False
+    return field.default_factory, bool(field.default_factory_takes_validated_data)
+
+
+def _plan(model_class: type[BaseModel], lazy: bool = False) -> _Plan | None:
+    """
+    Work out, once per class, how to build ``model_class``.
+
+    Args:
+        model_class: The model to build.
+        lazy: Whether to defer building the model's nested models.  Only
+            classes that can build them later (see :py:func:`build_pending`),
+            and are not frozen, defer them.
+
+    Returns:
+        The plan, or ``None`` if the model needs
+        :py:meth:`pydantic.BaseModel.model_construct` (e.g. it has a
+        ``model_post_init`` or validation aliases).
+
+    """
+    try:
+        return _PLANS[model_class, lazy]
+    except KeyError:
+        pass
+    if not model_class.__pydantic_complete__:
+        model_class.model_rebuild()
+    defer = (
+        lazy
+        and getattr(model_class, "_lazy_loadable", False)
+        and not model_class.model_config.get("frozen")
+    )
+    deferred: set[str] = set()
+    plan: _Plan | None = _Plan(
+        {},
+        {},
+        [],
+        model_class.model_config.get("extra") == "allow",
+        frozenset(),
+        frozenset(),
+        (),
+        {},
+    )
+    if model_class.__pydantic_post_init__ or model_class.__pydantic_root_model__:
+        plan = None
+    for name, field in model_class.model_fields.items():
+        if plan is None or field.validation_alias not in (None, field.alias):
+            plan = None
+            break
+        convert = _converter(field.annotation, lazy)
+        plan.keys[field.alias or name] = (name, convert)
+        if convert is not None:
+            plan.converted[name] = convert
+            if defer:
+                deferred.add(name)
+        if field.is_required():
+            continue
+        if field.default_factory is None and isinstance(field.default, _IMMUTABLE):
+            plan.template[name] = field.default
+        else:
+            plan.template[name] = _UNSET
+            plan.fresh.append((name, *_fresh_default(field)))
+    if plan is not None:
+        plan = plan._replace(
+            deferred=frozenset(deferred),
+            known=frozenset(plan.keys),
+            renamed=tuple(
+                (key, name) for key, (name, _) in plan.keys.items() if key != name
+            ),
+        )
+    _PLANS[model_class, lazy] = plan
+    return plan
+
+
+def construct(
+    model_class: type[BaseModel], data: dict[str, Any], *, lazy: bool = False
+) -> Any:
+    """
+    Build ``model_class`` and its nested models from a botocore response
+    without validating it.
+
+    This does what :py:meth:`pydantic.BaseModel.model_construct` does, from a
+    plan made once per class, and recurses into nested models.
+
+    Args:
+        model_class: The model to build.
+        data: The parsed response, or part of it.
+
+    Keyword Args:
+        lazy: Leave nested models to be built on first access.
+
+    Returns:
+        The model.
+
+    """
+    plan = _plan(model_class, lazy)
+    if plan is None:
+        return _construct_unplanned(model_class, data, lazy)
+    if data.keys() <= plan.known:
+        fields, fields_set, pending = _fill(plan, data)
+        extra: dict[str, Any] | None = {} if plan.extra else None
+    else:
+        fields, fields_set, extra, pending = _fill_by_key(plan, data)
+    for name, factory, takes_fields in plan.fresh:
+        if fields.get(name) is _UNSET:
+            fields[name] = factory(fields) if takes_fields else factory()
+    if pending is not None:
+        fields[PENDING] = pending
+    model = model_class.__new__(model_class)
+    object.__setattr__(model, "__dict__", fields)
+    object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(model, "__pydantic_extra__", extra)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def _fill(
+    plan: _Plan, data: dict[str, Any]
+) -> tuple[
+    dict[str, Any], set[str], dict[str, tuple[Callable[[Any], Any], Any]] | None
+]:
+    """
+    Fill a model's fields from a response whose keys all fill fields.
+
+    The response is copied in whole, and only the fields that are renamed or
+    hold models are visited, which is most of the work saved over
+    validation.
+
+    Args:
+        plan: The model class's plan.
+        data: The parsed response, or part of it.
+
+    Returns:
+        The fields, the names of the fields set, and the fields left to
+        build lazily, if any.
+
+    """
+    fields = plan.template.copy()
+    fields.update(data)
+    fields_set = set(data)
+    for key, name in plan.renamed:
+        if key in fields_set:
+            fields[name] = fields.pop(key)
+            fields_set.remove(key)
+            fields_set.add(name)
+    pending: dict[str, tuple[Callable[[Any], Any], Any]] | None = None
+    if plan.converted:
+        for name in plan.converted.keys() & fields_set:
+            value = fields[name]
+            if value is None:
+                continue
+            if value and name in plan.deferred:
+                if pending is None:
+                    pending = {}
+                pending[name] = (plan.converted[name], value)
+                del fields[name]
+            else:
+                fields[name] = plan.converted[name](value)
+    return fields, fields_set, pending
+
+
+def _fill_by_key(
+    plan: _Plan, data: dict[str, Any]
+) -> tuple[
+    dict[str, Any],
+    set[str],
+    dict[str, Any] | None,
+    dict[str, tuple[Callable[[Any], Any], Any]] | None,
+]:
+    """
+    Fill a model's fields from a response key by key, keeping the keys that
+    fill no field as extra attributes if the model allows them.
+
+    Args:
+        plan: The model class's plan.
+        data: The parsed response, or part of it.
+
+    Returns:
+        The fields, the names of the fields set, the extra attributes, and
+        the fields left to build lazily, if any.
+
+    """
+    fields = plan.template.copy()
+    fields_set: set[str] = set()
+    extra: dict[str, Any] | None = {} if plan.extra else None
+    pending: dict[str, tuple[Callable[[Any], Any], Any]] | None = None
+    for key, value in data.items():
+        found = plan.keys.get(key)
+        if found is None:
+            if extra is not None:
+                extra[key] = value
+            continue
+        name, convert = found
+        fields_set.add(name)
+        if convert is None or value is None:
+            fields[name] = value
+        elif value and name in plan.deferred:
+            if pending is None:
+                pending = {}
+            pending[name] = (convert, value)
+            fields.pop(name, None)
+        else:
+            fields[name] = convert(value)
+    return fields, fields_set, extra, pending
+
+
+def build_pending(model: BaseModel, name: str) -> tuple[bool, Any]:
+    """
+    Build the field ``name`` of a lazily built model, if it is not built yet.
+
+    Args:
+        model: The model.
+        name: The field name.
+
+    Returns:
+        Whether the field was pending, and its value.
+
+    """
+    pending = model.__dict__.get(PENDING)
+    if not pending or name not in pending:
+        return False, None
+    convert, value = pending[name]
+    built = convert(value)
+    model.__dict__[name] = built
+    # Another thread may have built it too; either value will do
+    pending.pop(name, None)
+    return True, built
+
+
+def materialize(model: BaseModel) -> None:
+    """
+    Build every field of a lazily built model, and of the models in it, so it
+    is the same as a model built in full.
+
+    Args:
+        model: The model.  Models that were not built lazily are left alone.
+
+    """
+    fields = model.__dict__
+    pending = fields.get(PENDING)
+    if pending is None:
+        return
+    for name, (convert, value) in list(pending.items()):
+        fields[name] = convert(value)
+    # Keep the field order a model built in full has, for serialization
+    model_fields = type(model).model_fields
+    ordered = {name: fields[name] for name in model_fields if name in fields}
+    ordered.update(
+        (key, value)
+        for key, value in fields.items()
+        if key not in model_fields and key != PENDING
+    )
+    object.__setattr__(model, "__dict__", ordered)
+    for value in ordered.values():
+        _materialize_value(value)
+
+
+def _materialize_value(value: Any) -> None:
+    """
+    Materialize any lazily built models in a field value.
+
+    Args:
+        value: The field value.
+
+    """
+    if isinstance(value, BaseModel):
+        materialize(value)
+    elif isinstance(value, list):
+        for member in value:
+            _materialize_value(member)
+    elif isinstance(value, dict):
+        for member in value.values():
+            _materialize_value(member)
+
+
+def _construct_unplanned(
+    model_class: type[BaseModel], data: dict[str, Any], lazy: bool
+) -> Any:
+    """
+    Build a model :py:func:`_plan` has no plan for, with
+    :py:meth:`pydantic.BaseModel.model_construct`.
+
+    Args:
+        model_class: The model to build.
+        data: The parsed response, or part of it.
+        lazy: Whether nested models defer their own nested models.
+
+    Returns:
+        The model.
+
+    """
+    values = dict(data)
+    for name, field in model_class.model_fields.items():
+        key = field.alias or name
+        if values.get(key) is not None:
+            convert = _converter(field.annotation, lazy)
+            if convert is not None:
+                values[key] = convert(values[key])
+    return model_class.model_construct(**values)
+
+
+def parse(
+    model_class: type[BaseModel],
+    data: dict[str, Any],
+    *,
+    validate: bool | None = None,
+) -> Any:
+    """
+    Build ``model_class`` from a botocore response, validating it unless
+    told not to.  If the manager method running was given ``only``, ``raw``
+    or ``summary``, return a
+    :py:class:`~botocraft.services.projection.ShapedResponse` instead.
+
+    With the ``responses.deduplicate`` setting on, the model is then passed
+    through :py:func:`botocraft.services.dedup.deduplicate`.
+
+    Args:
+        model_class: The model to build.
+        data: The parsed response.
+
+    Keyword Args:
+        validate: Whether a response the models reject raises
+            :py:class:`pydantic.ValidationError`, rather than being built
+            without validation by :py:func:`construct`.  Defaults to
+            :py:func:`validating`, unless :py:func:`deferring` says to build
+            the response lazily.
+
+    Returns:
+        The model.
+
+    """
+    options = _OPTIONS.get()
+    if options.raw or options.summary or options.only is not None:
+        from .projection import ShapedResponse
+
+        return ShapedResponse(model_class, data, options.only, summary=options.summary)
+    lazy = deferring()
+    if validate is None:
+        validate = options.validate
+    if validate is None:
+        validate = _settings().validation and not lazy
+    if validate:
+        model = model_class(**data)
+    elif lazy:
+        model = construct(model_class, data, lazy=True)
+    else:
+        # Validation is the fastest way to build a response the models
+        # match, so only responses they reject are built without it
+        try:
+            model = model_class(**data)
+        except ValidationError:
+            model = construct(model_class, data)
+    settings = _settings()
+    if settings.deduplicate:
+        from .dedup import deduplicate
+
+        model = deduplicate(model, settings.intern_fields)
+    return model
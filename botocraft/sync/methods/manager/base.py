@@ -410,14 +410,14 @@ class ManagerMethodGenerator:
     def operation_call(self) -> str:
         """
         A body snippet that does the actual boto3 call.  and assigns the
-        response to ``_response``.  It then uses response to instantiate
+        response to ``_response``.  It then parses response into
         :py:meth:`response_class`.
 
         Example:
             ..code-block:: python
 
                 _response = self.client.create(name=name, description=description)
-                response = ResponseModel(**_response)
+                response = self.parse(ResponseModel, _response)
 
         Returns:
             The code for the boto3 call.
@@ -428,7 +428,7 @@ class ManagerMethodGenerator:
         if self.return_type in ("None", '"None"'):
             return call
         call = "_response = " + call
-        call += f"\n        response = {self.response_class}(**_response)"
+        call += f"\n        response = self.parse({self.response_class}, _response)"
         return call
 
     @property
@@ -168,7 +168,7 @@ class CreateMethodGenerator(ManagerMethodGenerator):
             call += f"\n        self.client.{self.boto3_name}(**{{k: v for k, v in args.items() if v is not None}})"  # noqa: E501
         else:
             call += f"\n        _response = self.client.{self.boto3_name}(**{{k: v for k, v in args.items() if v is not None}})"  # noqa: E501
-            call += f"\n        response = {self.response_class}(**_response)"
+            call += f"\n        response = self.parse({self.response_class}, _response)"
         return call
 
     @property
@@ -198,12 +198,10 @@ class CreateMethodGenerator(ManagerMethodGenerator):
         if self.return_type != "None":
             if response_attr:
                 code += f"""
-        self.sessionize(response.{response_attr})
         return cast({self.return_type}, response.{response_attr})
 """
             else:
                 code += f"""
-        self.sessionize(response)
         return cast({self.return_type}, response)
 """
         return code
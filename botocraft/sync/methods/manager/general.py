@@ -102,7 +102,7 @@ class GeneralMethodGenerator(ManagerMethodGenerator):
             if self.response_attr is not None:
                 code += f"""
         for _response in response_iterator:
-            response = {self.response_class}(**_response)
+            response = self.parse({self.response_class}, _response)
             if response.{self.response_attr} is not None:
                 results.extend(response.{self.response_attr})
             else:
@@ -111,7 +111,7 @@ class GeneralMethodGenerator(ManagerMethodGenerator):
             else:
                 code += f"""
         for _response in response_iterator:
-            response = {self.response_class}(**_response)
+            response = self.parse({self.response_class}, _response)
             results.append(response)
 """
             return code
@@ -146,7 +146,6 @@ class GeneralMethodGenerator(ManagerMethodGenerator):
 """
         if self.return_type not in ("None", '"None"'):
             code += f"""
-        self.sessionize(results)
         return cast({self.return_type}, results)
 """
         return code
@@ -101,21 +101,18 @@ class GetMethodGenerator(ManagerMethodGenerator):
             if self.response_attr_multiplicity == "many":
                 code += f"""
         if response and response.{response_attr}:
-            self.sessionize(response.{response_attr}[0])
             return response.{response_attr}[0]
         return None
 """
             else:
                 code += f"""
         if response and response.{response_attr}:
-            self.sessionize(response.{response_attr})
             return response.{response_attr}
         return None
 """
         else:
             code += """
         if response:
-            self.sessionize(response)
             return response
         return None
 """
@@ -42,9 +42,51 @@ class GetManyMethodGenerator(ManagerMethodGenerator):
         return_type = return_type.strip('"')
         return f'"{return_type}"'
 
+    @property
+    def batch_arg(self) -> str | None:
+        """
+        Return the name of the boto3 operation argument that takes the list of
+        identifiers to describe, for chunking when
+        :py:attr:`botocraft.sync.models.ManagerMethodDefinition.batch_size` is
+        set.
+
+        This is :py:attr:`botocraft.sync.models.ManagerMethodDefinition.batch_arg`
+        if given, otherwise the first list argument of the operation.
+
+        Returns:
+            The argument name, or ``None`` if the operation takes no list.
+
+        """
+        if self.method_def.batch_arg:
+            return self.method_def.batch_arg
+        if self.input_shape is None:
+            return None
+        for arg_name, arg_shape in self.input_shape.members.items():
+            if arg_shape.type_name == "list":
+                return arg_name
+        return None
+
     @property
     def body(self) -> str:
         self.imports.add("from .abstract import PrimaryBoto3ModelQuerySet")
+        batch_arg = self.batch_arg
+        if (
+            self.method_def.batch_size
+            and self.response_attr is not None
+            and batch_arg is not None
+        ):
+            # Describe the identifiers in concurrent chunks the operation accepts
+            return f"""
+        {self.operation_args}
+        return self.describe_batched(
+            "{self.boto3_name}",
+            {self.response_class},
+            "{self.response_attr}",
+            args,
+            batch_arg="{batch_arg}",
+            batch_size=self.get_many_batch_size,
+        )
+"""
         code = f"""
         {self.operation_args}
         {self.operation_call}
@@ -52,13 +94,11 @@ class GetManyMethodGenerator(ManagerMethodGenerator):
         if self.response_attr is not None:
             code += f"""
         if response.{self.response_attr}:
-            self.sessionize(response.{self.response_attr})
             return PrimaryBoto3ModelQuerySet(response.{self.response_attr})
         return PrimaryBoto3ModelQuerySet([])
 """
         else:
             code += """
-        self.sessionize(response)
         return response
 """
         return code
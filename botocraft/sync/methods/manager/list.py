@@ -64,35 +64,19 @@ class ListMethodGenerator(ManagerMethodGenerator):
         # lowercase plural of the model name.
         self.imports.add("from .abstract import PrimaryBoto3ModelQuerySet")
         if self.client.can_paginate(self.boto3_name):
+            # ``paginate`` streams pages lazily into a queryset; see
+            # :py:meth:`botocraft.services.abstract.Boto3ModelManager.paginate`.
             code = f"""
-        paginator = self.client.get_paginator('{self.boto3_name}')
         {self.operation_args}
-        response_iterator = paginator.paginate(**{{k: v for k, v in args.items() if v is not None}})
-        results = []
-        for _response in response_iterator:
-            if list(_response.keys()) == ['ResponseMetadata']:
-                break
-            if 'ResponseMetadata' in _response:
-                del _response['ResponseMetadata']
-            response = {self.response_class}(**_response)
-            if response.{self.response_attr}:
-                results.extend(response.{self.response_attr})
-            else:
-                if getattr(response, "NextToken", None):
-                    continue
-                break
-        self.sessionize(results)
-        if results and isinstance(results[0], Boto3Model):
-            return PrimaryBoto3ModelQuerySet(results)
-        else:
-            return results
-"""  # noqa: E501
+        return self.paginate(
+            '{self.boto3_name}', {self.response_class}, '{self.response_attr}', args
+        )
+"""
         else:
             code = f"""
         {self.operation_args}
         {self.operation_call}
         if response and response.{self.response_attr}:
-            self.sessionize(response.{self.response_attr})
             return PrimaryBoto3ModelQuerySet(response.{self.response_attr})
         return PrimaryBoto3ModelQuerySet([])
 """
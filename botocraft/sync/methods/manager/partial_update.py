@@ -29,7 +29,6 @@ class PartialUpdateMethodGenerator(ManagerMethodGenerator):
 """
         if response_attr is not None:
             code += f"""
-        self.sessionize(response.{response_attr})
         return cast({self.return_type}, response.{response_attr})
 """
         return code
@@ -162,7 +162,7 @@ class ModelRelationGenerator:
             self.transform(value, r"{self.property_def.transformer.regex.regex}")
             for value in self.{self.property_def.transformer.regex.attribute}
         ]
-        return {self.property_def.primary_model_name}.objects.using(self.session).list(**pks)
+        return self.relationship_manager({self.property_def.primary_model_name}).list(**pks)
 """  # noqa: E501
         else:
             code = f"""
@@ -172,7 +172,7 @@ class ModelRelationGenerator:
             "{self.property_def.transformer.regex.attribute}",
             r"{self.property_def.transformer.regex.regex}",
         )
-        return {self.property_def.primary_model_name}.objects.using(self.session).get(**pk)
+        return self.relationship_manager({self.property_def.primary_model_name}).get(**pk)
 """  # noqa: E501
         return code
 
@@ -203,7 +203,7 @@ class ModelRelationGenerator:
             }})
         except AttributeError:
             return []
-        return {self.property_def.primary_model_name}.objects.using(self.session).{method}(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager({self.property_def.primary_model_name}).{method}(**pk)  # type: ignore[arg-type]
 """  # noqa: E501
         else:
             method = self.property_def.method or "get"
@@ -211,7 +211,7 @@ class ModelRelationGenerator:
         }})
         except AttributeError:
             return None
-        return {self.property_def.primary_model_name}.objects.using(self.session).{method}(**pk)  # type: ignore[arg-type]
+        return self.relationship_manager({self.property_def.primary_model_name}).{method}(**pk)  # type: ignore[arg-type]
 """  # noqa: E501
         return code
 
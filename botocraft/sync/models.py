@@ -1,4 +1,6 @@
+import importlib
 import re
+import sys
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -416,6 +418,10 @@ class ModelDefinition(BaseModel):
     #: created during sync.  This is used for things like S3 buckets
     #: and SQS queues, which have no full shapes in botocore.
     force_create: bool = False
+    #: If specified, also generate a compact ``__slots__`` dataclass named
+    #: ``<model>Summary`` holding just these fields of the model.  Manager
+    #: methods build it instead of the model when passed ``summary=True``.
+    summary: list[str] | None = None
 
     def unalias_field_name(self, field_name: str) -> str:
         """
@@ -552,6 +558,16 @@ class ManagerMethodDefinition(BaseModel):
     extra_args: dict[str, MethodArgumentDefinition] = {}
     #: Decorators to wrap the method in
     decorators: list[Importable] = []
+    #: ``get_many`` only: the most identifiers the boto3 operation accepts in
+    #: one call.  If set, it is recorded on the manager as
+    #: ``get_many_batch_size``, and a method that returns a response attribute
+    #: splits longer lists into chunks of this size, describes them
+    #: concurrently and merges the results into one queryset.
+    batch_size: int | None = None
+    #: ``get_many`` only: the boto3 operation argument that takes the list of
+    #: identifiers to chunk when :py:attr:`batch_size` is set.  If not
+    #: specified, we'll use the first list argument of the operation.
+    batch_arg: str | None = None
 
     @property
     def explicit_args(self) -> list[str]:
@@ -829,6 +845,154 @@ class ServiceDefinition(BaseModel):
 # Global
 # ------
 
+#: The ``__init__.py`` of the ``botocraft.services`` package.  ``{imports}`` is
+#: the star import of each service module, for type checkers.
+INIT_PY_TEMPLATE = '''"""
+The botocraft service models and managers.
+
+This file is automatically generated by ``botocraft sync``.  Do not edit it
+directly.
+
+Every public name of every service module can be imported from here, but a
+service module is only imported the first time one of its names is used, so
+``from botocraft.services import Queue`` imports just
+:py:mod:`botocraft.services.sqs`.  :py:mod:`botocraft.services._index` lists
+the module each name is imported from.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from ._index import NAMES
+
+if TYPE_CHECKING:
+{imports}
+
+__all__ = list(NAMES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in NAMES:
+        value = getattr(import_module(NAMES[name]), name)
+    else:
+        try:
+            value = import_module(f"{{__name__}}.{{name}}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{{__name__}}.{{name}}":
+                raise
+            msg = f"module {{__name__!r}} has no attribute {{name!r}}"
+            raise AttributeError(msg) from None
+    # Later lookups find the name without calling us
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(NAMES))
+'''
+
+#: The ``_index.py`` of the ``botocraft.services`` package.
+INDEX_PY_TEMPLATE = '''"""
+The module each name in :py:mod:`botocraft.services` is imported from.
+
+This file is automatically generated by ``botocraft sync``.  Do not edit it
+directly.
+"""
+
+#: The service modules, in the order their names were looked up.
+MODULES: tuple[str, ...] = (
+{modules}
+)
+
+#: The import path of the module each name is imported from.
+NAMES: dict[str, str] = {{
+{names}
+}}
+'''
+
+
+def services_in_init_py() -> list[str]:
+    """
+    Return the service modules the ``botocraft.services`` package imports.
+
+    Returns:
+        The module names, relative to ``botocraft.services``, in order.
+
+    """
+    path = SERVICES_DIR / "_index.py"
+    if path.exists():
+        with path.open(encoding="utf-8") as f:
+            contents = f.read()
+        block = contents[contents.index("MODULES") : contents.index("NAMES")]
+        return re.findall(r'^    "(\w+)",$', block, re.MULTILINE)
+    # An ``__init__.py`` from before the index was generated
+    with (SERVICES_DIR / "__init__.py").open(encoding="utf-8") as f:
+        return re.findall(r"^from \.(\w+) import \*", f.read(), re.MULTILINE)
+
+
+def services_index(modules: list[str]) -> dict[str, str]:
+    """
+    Work out the module each public name of the service ``modules`` should
+    be imported from.
+
+    Names are looked up as ``from .<module> import *`` would, so when two
+    modules export the same name the later one wins.  A class or function is
+    imported from the module that defines it, when that module still holds
+    it under the same name, so that names like ``Tag`` do not import a whole
+    service module.
+
+    Args:
+        modules: The service modules, relative to ``botocraft.services``.
+
+    Returns:
+        The import path of the module to import each name from.
+
+    """
+    names: dict[str, str] = {}
+    for module_name in modules:
+        path = f"botocraft.services.{module_name}"
+        module = importlib.import_module(path)
+        for name, value in vars(module).items():
+            if name.startswith("_"):
+                continue
+            names[name] = path
+            defined_in = getattr(value, "__module__", None)
+            if (
+                isinstance(defined_in, str)
+                and defined_in != path
+                and getattr(sys.modules.get(defined_in), name, None) is value
+            ):
+                names[name] = defined_in
+    return names
+
+
+def write_init_py(modules: list[str]) -> None:
+    """
+    Write the ``__init__.py`` and ``_index.py`` files in the
+    ``botocraft.services`` package, for the service ``modules``.
+
+    This imports every service module, so run it after the modules are
+    generated.
+
+    Args:
+        modules: The service modules, relative to ``botocraft.services``.
+
+    """
+    names = services_index(modules)
+    index = INDEX_PY_TEMPLATE.format(
+        modules="\n".join(f'    "{module}",' for module in modules),
+        names="\n".join(f'    "{name}": "{names[name]}",' for name in sorted(names)),
+    )
+    with (SERVICES_DIR / "_index.py").open("w", encoding="utf-8") as f:
+        f.write(index)
+    init = INIT_PY_TEMPLATE.format(
+        imports="\n".join(
+            f"    from .{module} import *  # noqa: F403" for module in modules
+        )
+    )
+    with (SERVICES_DIR / "__init__.py").open("w", encoding="utf-8") as f:
+        f.write(init)
+
 
 class BotocraftInterface(BaseModel):
     #: The services to generate
@@ -905,15 +1069,10 @@ class BotocraftInterface(BaseModel):
 
     def populate_init_py(self):
         """
-        Populate the ``__init__.py`` file in the ``botocraft.models``
-        package with import statements for all of our models.
+        Populate the ``__init__.py`` file in the ``botocraft.services``
+        package, and its name index ``_index.py``, for all of our services.
         """
-        init_path = SERVICES_DIR / "__init__.py"
-        with init_path.open("w", encoding="utf-8") as f:
-            for service in self.services.values():
-                f.write(
-                    f"from .{service.safe_service_name} import *  # noqa: F401,F403\n"
-                )
+        write_init_py([service.safe_service_name for service in self.services.values()])
 
     def populate_services_toc(self):
         """
@@ -948,24 +1107,20 @@ class BotocraftInterface(BaseModel):
 
     def update_init_py(self, service: str) -> None:
         """
-        Update the ``__init__.py`` file in the ``botocraft.models``
-        package with import statements for the given service.
+        Update the ``__init__.py`` file in the ``botocraft.services``
+        package, and its name index ``_index.py``, to include the given
+        service.
 
         Args:
             service: The name of the service to update the ``__init__.py``
                 file for.
 
         """
-        init_path = SERVICES_DIR / "__init__.py"
-        import_line = (
-            f"from .{self.services[service].safe_service_name} import *  "
-            "# noqa: F401,F403"
-        )
-        with init_path.open(encoding="utf-8") as f:
-            contents = f.read()
-        if import_line not in contents:
-            with init_path.open("a", encoding="utf-8") as f:
-                f.write(f"{import_line}\n")
+        modules = list(services_in_init_py())
+        name = self.services[service].safe_service_name
+        if name not in modules:
+            modules.append(name)
+        write_init_py(modules)
 
     def update_services_toc(self, service: str) -> None:
         """
@@ -606,6 +606,16 @@ class ModelGenerator(AbstractGenerator):
         self.extra_fields_formatter = ExtraFieldsFormatter(self)
         #: Module-level aliases needed to avoid forward-ref shadowing in list fields
         self.forward_ref_aliases: dict[str, list[str]] = {}
+        #: The summary classes we've generated for this service.  The key is
+        #: the class name, and the value is the code for the class.
+        self.summaries: OrderedDict[str, str] = OrderedDict()
+
+    def clear(self) -> None:
+        """
+        Clear the generated classes, summary classes and imports.
+        """
+        super().clear()
+        self.summaries = OrderedDict()
 
     def register_forward_ref_alias(self, model_name: str, alias_line: str) -> None:
         """
@@ -1290,8 +1300,69 @@ class ModelGenerator(AbstractGenerator):
             f"Model {model_name} has no fields or properties defined.  This is "
             "probably a bug in the botocraft model definition or generator code."
         )
+        if model_def.summary:
+            self.generate_summary(orig_model_name, model_name, model_def)
         return model_name
 
+    def generate_summary(
+        self, orig_model_name: str, model_name: str, model_def: ModelDefinition
+    ) -> None:
+        """
+        Generate the compact summary class for a model whose definition lists
+        ``summary`` fields, and save it to :py:attr:`summaries`.
+
+        The summary is a ``__slots__`` dataclass subclassing
+        :py:class:`botocraft.services.summary.Boto3Summary`, with the listed
+        fields of the model, each optional.
+
+        Args:
+            orig_model_name: The botocore name of the model.
+            model_name: The name of the model class.
+            model_def: The botocraft model definition for the model.
+
+        Raises:
+            KeyError: a summary field is not a field or alias on the model
+            NoPythonTypeError: a summary field of a bespoke model has no
+                ``python_type``
+
+        """
+        field_defs = self.botocore_shape_field_defs(orig_model_name)
+        # Summary fields are named as on the model, so by their aliases
+        botocore_names = {
+            field_def.rename or name: name for name, field_def in field_defs.items()
+        }
+        field_code: list[str] = []
+        for field_name in cast("list[str]", model_def.summary):
+            botocore_name = botocore_names.get(field_name)
+            if botocore_name is None:
+                msg = f'{model_name}: No field or alias named "{field_name}"'
+                raise KeyError(msg)
+            field_def = field_defs[botocore_name]
+            if model_def.bespoke or field_def.botocore_shape is None:
+                python_type = field_def.python_type
+                if not python_type:
+                    raise NoPythonTypeError(field_name, model_name)
+            else:
+                python_type = self.get_python_type_for_field(
+                    orig_model_name,
+                    botocore_name,
+                    field_def=field_def,
+                    field_shape=field_def.botocore_shape,
+                )
+            python_type = python_type.strip('"')
+            if not python_type.endswith(" | None"):
+                python_type = f"{python_type} | None"
+            field_code.append(f'    {field_name}: "{python_type}" = None')
+        self.imports.add("from dataclasses import dataclass")
+        self.imports.add("from .summary import Boto3Summary")
+        self.summaries[f"{model_name}Summary"] = (
+            "@dataclass(slots=True)\n"
+            f"class {model_name}Summary(Boto3Summary):\n"
+            f'    """\n    A compact summary of :py:class:`{model_name}`.\n    """\n\n'
+            f"    model_class: ClassVar[ModelType[Boto3Model]] = {model_name}\n\n"
+            + "\n".join(field_code)
+        )
+
 
 class ManagerGenerator(AbstractGenerator):
     """
@@ -1384,17 +1455,55 @@ class ManagerGenerator(AbstractGenerator):
             base_class = ", ".join(
                 [mixin.name for mixin in manager_def.mixins] + [base_class]
             )
+        batch_get = self._batch_get_attributes(manager_def)
         code = f"""
 
 
 class {manager_name}({base_class}):
 
-    service_name: str = '{self.service_name}'
+    service_name: str = '{self.service_name}'{batch_get}
 
 {method_code}
 """
         self.classes[manager_name] = code
 
+    def _batch_get_attributes(self, manager_def: ManagerDefinition) -> str:
+        """
+        Return the class attributes that let ``get`` lookups be batched.
+
+        When ``get`` and ``get_many`` call the same boto3 operation, and ``get``
+        wraps its identifier argument in a list (``source_arg: "[cluster]"``),
+        several ``get`` calls can be served by one ``get_many`` call.  This
+        records which ``get_many`` argument takes the list of identifiers, so
+        :py:meth:`botocraft.services.abstract.PrimaryBoto3ModelQuerySet.prefetch_related`
+        can do that.  It also records how many identifiers ``get_many`` takes
+        in one call, from
+        :py:attr:`botocraft.sync.models.ManagerMethodDefinition.batch_size`.
+
+        Args:
+            manager_def: The botocraft manager definition for the manager.
+
+        Returns:
+            The class attribute code, or an empty string.
+
+        """
+        get_def = manager_def.methods.get("get")
+        get_many_def = manager_def.methods.get("get_many")
+        if get_many_def is None:
+            return ""
+        code = ""
+        if get_def is not None and get_def.boto3_name == get_many_def.boto3_name:
+            for arg_name, arg_def in get_def.args.items():
+                if arg_def.rename and arg_def.source_arg == f"[{arg_def.rename}]":
+                    code = f"""
+    get_many_operation: ClassVar[str] = '{get_many_def.boto3_name}'
+    get_many_arg: ClassVar[tuple[str, str]] = ('{arg_def.rename}', '{arg_name}')"""
+                    break
+        if get_many_def.batch_size:
+            code += f"""
+    get_many_batch_size: ClassVar[int] = {get_many_def.batch_size}"""
+        return code
+
     def get_method_generator(
         self, model_name: str, method_name: str, method_def: ManagerMethodDefinition
     ) -> ManagerMethodGenerator:
@@ -1474,6 +1583,9 @@ class ServiceGenerator:
         #: A dictionary of manager classes names to class code. This is populated
         #: when we build the manager classes
         self.manager_classes: dict[str, str] = {}
+        #: A dictionary of summary class names to class code.  This is populated
+        #: for models whose definitions list ``summary`` fields
+        self.summary_classes: dict[str, str] = {}
         #: The :py:class:`ModelGenerator` class we will use to generate models
         self.model_generator = ModelGenerator(self)
         #: The :py:class:`ManagerGenerator` class we will use to generate managers
@@ -1516,6 +1628,7 @@ class ServiceGenerator:
             **self.model_classes,
             **self.response_classes,
             **self.manager_classes,
+            **self.summary_classes,
         }
 
     @property
@@ -1527,6 +1640,16 @@ class ServiceGenerator:
         model_classes = "\n\n".join(self.model_classes.values())
         response_classes = "\n\n".join(self.response_classes.values())
         manager_classes = "\n\n".join(self.manager_classes.values())
+        summary_classes = ""
+        if self.summary_classes:
+            summary_classes = "\n\n".join(self.summary_classes.values())
+            summary_classes = f"""
+# =========
+# Summaries
+# =========
+
+{summary_classes}
+"""
         return f"""
 # This file is automatically generated by botocraft.  Do not edit directly.
 # mypy: disable-error-code="index, override, assignment, union-attr, misc"
@@ -1552,6 +1675,7 @@ class ServiceGenerator:
 
 {response_classes}
 
+{summary_classes}
 """
 
     def generate(self) -> None:
@@ -1574,7 +1698,9 @@ class ServiceGenerator:
             if k not in self.model_classes
         }
         self.manager_classes = deepcopy(self.manager_generator.classes)
+        self.summary_classes = deepcopy(self.model_generator.summaries)
         self.imports.update(self.manager_generator.imports)
+        self.imports.update(self.model_generator.imports)
         self.model_generator.clear()
         self.manager_generator.clear()
 
@@ -1590,6 +1716,8 @@ class ServiceGenerator:
             self.interface.add_model(model_name, self.service_def.name)
         for model_name in self.manager_classes:
             self.interface.add_model(model_name, self.service_def.name)
+        for model_name in self.summary_classes:
+            self.interface.add_model(model_name, self.service_def.name)
 
     def write(self) -> None:
         """
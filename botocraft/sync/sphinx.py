@@ -164,6 +164,19 @@ class ServiceSphinxDocBuilder:
         secondary_models_doc = self.classes(secondary_models)
         response_models = list(self.generator.response_classes.keys())
         response_models_doc = self.classes(response_models)
+        summaries = list(self.generator.summary_classes.keys())
+        summaries_doc = ""
+        if summaries:
+            summaries_doc = f"""
+Summaries
+---------
+
+Summaries are compact ``__slots__`` dataclasses holding just a few fields of a
+model.  Manager methods build them instead of the models when passed
+``summary=True``, and :py:meth:`~botocraft.services.summary.Boto3Summary.to_model`
+turns one back into its model.
+
+{self.classes(summaries, pydantic=False)}"""
         return f"""
 {self.header}
 
@@ -209,7 +222,7 @@ for completeness, and because occasionally we return them directly to you
 because they have some useful additional information.
 
 {response_models_doc}
-"""
+{summaries_doc}"""
 
     def write(self) -> None:
         """
@@ -0,0 +1,35 @@
+"""Models shared by the queryset benchmarks."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from botocraft.services.abstract import Boto3Model
+
+
+class InventoryItem(Boto3Model):
+    """A flat model shaped like a typical describe result."""
+
+    InstanceId: str
+    InstanceType: str
+    State: str
+    LaunchTime: datetime
+    Tags: dict[str, str]
+
+
+def inventory(count: int) -> list[InventoryItem]:
+    """
+    Build ``count`` inventory items.  Their launch times are the hours from
+    2024-01-01 on, in scrambled order, so sorting them does real work.
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        InventoryItem(
+            InstanceId=f"i-{index:017x}",
+            InstanceType=("t3.micro", "m5.large", "c6g.xlarge")[index % 3],
+            State=("running", "stopped")[index % 2],
+            LaunchTime=start + timedelta(hours=(index * 7919) % count),
+            Tags={"Name": f"web-{index}", "Environment": ("prod", "dev")[index % 2]},
+        )
+        for index in range(count)
+    ]
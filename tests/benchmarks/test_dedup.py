@@ -0,0 +1,89 @@
+"""Benchmarks for the memory held by 10k instances, with and without dedup."""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from botocraft.config import ResponseSettings
+from botocraft.services.ec2 import DescribeInstancesResult
+from botocraft.services.trusted import parse
+
+from .test_response_parsing import instance
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of instances in the ``DescribeInstances`` response.
+INSTANCE_COUNT = 10_000
+#: Instances per reservation.
+RESERVATION_SIZE = 50
+#: Timed rounds per benchmark; each round parses the whole response.
+ROUNDS = 3
+
+#: The response settings parsed with, before and after deduplication.
+SETTINGS = [
+    pytest.param(ResponseSettings(validation=False), id="plain"),
+    pytest.param(ResponseSettings(validation=False, deduplicate=True), id="dedup"),
+]
+
+
+def fresh(value: Any) -> Any:
+    """Copy ``value`` with new string objects, as botocore's parser makes them."""
+    if isinstance(value, str):
+        return value.encode().decode()
+    if isinstance(value, list):
+        return [fresh(item) for item in value]
+    if isinstance(value, dict):
+        return {key: fresh(item) for key, item in value.items()}
+    return value
+
+
+def response() -> dict[str, Any]:
+    return fresh(
+        {
+            "Reservations": [
+                {
+                    "ReservationId": f"r-{start:017x}",
+                    "OwnerId": "123456789012",
+                    "Instances": [
+                        instance(index)
+                        for index in range(start, start + RESERVATION_SIZE)
+                    ],
+                }
+                for start in range(0, INSTANCE_COUNT, RESERVATION_SIZE)
+            ]
+        }
+    )
+
+
+def bytes_per_instance() -> float:
+    """Return the memory held by each parsed instance, strings included."""
+    tracemalloc.start()
+    try:
+        result = parse(DescribeInstancesResult, response())
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(result.Reservations) == INSTANCE_COUNT // RESERVATION_SIZE
+    return size / INSTANCE_COUNT
+
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_instances(benchmark, settings) -> None:
+    """Parse 10k instances, then measure what the parsed models hold."""
+    with patch("botocraft.services.trusted._settings", return_value=settings):
+        result = benchmark.pedantic(
+            lambda data: parse(DescribeInstancesResult, data),
+            setup=lambda: ((response(),), {}),
+            rounds=ROUNDS,
+            iterations=1,
+        )
+        assert len(result.Reservations) == INSTANCE_COUNT // RESERVATION_SIZE
+        if not benchmark.disabled:
+            benchmark.extra_info["instances_per_second"] = (
+                INSTANCE_COUNT / benchmark.stats["mean"]
+            )
+        benchmark.extra_info["bytes_per_instance"] = bytes_per_instance()
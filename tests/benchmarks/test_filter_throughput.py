@@ -0,0 +1,65 @@
+"""Benchmarks for queryset filtering throughput on large listings."""
+
+from __future__ import annotations
+
+import pytest
+
+from botocraft.services.abstract import Boto3ModelManagerFilter
+
+from .conftest import InventoryItem, inventory
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of models to filter per round.
+MODEL_COUNT = 100_000
+#: Timed rounds per benchmark; each round filters every model.
+ROUNDS = 3
+
+
+@pytest.fixture(scope="module")
+def models() -> list[InventoryItem]:
+    return inventory(MODEL_COUNT)
+
+
+FILTERS = {
+    "State": "running",
+    "InstanceType__in": ["m5.large", "c6g.xlarge"],
+    "Tags__Name__regex": r"^web-\d+$",
+    "LaunchTime__year": 2025,
+}
+
+
+def test_compiled_filter_plan(benchmark, models) -> None:
+    """Filter 100k models with the compiled plan."""
+
+    def run() -> list[InventoryItem]:
+        return Boto3ModelManagerFilter(models, **FILTERS)()
+
+    result = benchmark.pedantic(
+        run,
+        rounds=ROUNDS,
+        iterations=1,
+    )
+    assert result
+    if not benchmark.disabled:
+        benchmark.extra_info["models_per_second"] = (
+            MODEL_COUNT / benchmark.stats["mean"]
+        )
+
+
+def test_per_model_filter_application(benchmark, models) -> None:
+    """Filter 100k models one filter application at a time, for comparison."""
+    filter_obj = Boto3ModelManagerFilter(models)
+
+    def run() -> list[InventoryItem]:
+        return [
+            model
+            for model in models
+            if all(
+                filter_obj._apply_filter(model, field, value)  # noqa: SLF001
+                for field, value in FILTERS.items()
+            )
+        ]
+
+    result = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    assert result
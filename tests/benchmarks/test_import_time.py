@@ -0,0 +1,56 @@
+"""Benchmarks for the time taken to import names from ``botocraft.services``."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Timed rounds per benchmark; each round starts a fresh interpreter.
+ROUNDS = 3
+
+#: What the shell or a script imports: one small service, one large service,
+#: and everything, as ``botocraft shell`` used to.
+IMPORTS = [
+    pytest.param("import botocraft.services", id="package"),
+    pytest.param("from botocraft.services import Queue", id="sqs"),
+    pytest.param("from botocraft.services import Instance", id="ec2"),
+    pytest.param("from botocraft.services import *", id="everything"),
+]
+
+
+def import_seconds(statement: str) -> float:
+    """Return the seconds a fresh interpreter takes to run ``statement``."""
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.parametrize("statement", IMPORTS)
+def test_import(benchmark, statement) -> None:
+    """Import from ``botocraft.services`` in a fresh interpreter."""
+    seconds = benchmark.pedantic(
+        import_seconds, args=(statement,), rounds=ROUNDS, iterations=1
+    )
+    assert seconds > 0
+    benchmark.extra_info["import_seconds"] = seconds
+
+
+def test_one_service_is_faster_than_everything() -> None:
+    """Importing one service must not import every service."""
+    one = min(import_seconds("from botocraft.services import Queue") for _ in range(3))
+    everything = import_seconds("from botocraft.services import *")
+    assert one < everything / 2
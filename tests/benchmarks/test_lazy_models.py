@@ -0,0 +1,138 @@
+"""Benchmarks for parsing 5k task definitions eagerly and lazily."""
+
+from __future__ import annotations
+
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+import pytest
+
+from botocraft.services.ecs import DescribeTaskDefinitionResponse
+from botocraft.services.trusted import construct, parse
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of task definitions parsed.
+TASK_DEFINITION_COUNT = 5_000
+#: Timed rounds per benchmark; each round parses every task definition.
+ROUNDS = 3
+
+REGISTERED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+#: Validated and constructed models built in full, then lazy models.
+BUILDERS = [
+    pytest.param(partial(parse, validate=True), id="validated"),
+    pytest.param(construct, id="constructed"),
+    pytest.param(partial(construct, lazy=True), id="lazy"),
+]
+
+
+def container(family: str, index: int) -> dict[str, Any]:
+    return {
+        "name": f"{family}-{index}",
+        "image": f"123456789012.dkr.ecr.us-west-2.amazonaws.com/{family}:{index}",
+        "cpu": 256,
+        "memory": 512,
+        "essential": index == 0,
+        "portMappings": [
+            {"containerPort": 8000 + index, "hostPort": 8000 + index, "protocol": "tcp"}
+        ],
+        "environment": [
+            {"name": f"SETTING_{number}", "value": f"value-{number}"}
+            for number in range(10)
+        ],
+        "secrets": [
+            {
+                "name": "DATABASE_URL",
+                "valueFrom": f"arn:aws:ssm:us-west-2:123456789012:parameter/{family}",
+            }
+        ],
+        "mountPoints": [
+            {"sourceVolume": "data", "containerPath": "/data", "readOnly": False}
+        ],
+        "logConfiguration": {
+            "logDriver": "awslogs",
+            "options": {
+                "awslogs-group": f"/ecs/{family}",
+                "awslogs-region": "us-west-2",
+                "awslogs-stream-prefix": "ecs",
+            },
+        },
+        "healthCheck": {
+            "command": ["CMD-SHELL", "curl -f http://localhost/ || exit 1"],
+            "interval": 30,
+            "timeout": 5,
+            "retries": 3,
+        },
+    }
+
+
+def task_definition(index: int) -> dict[str, Any]:
+    family = f"service-{index}"
+    return {
+        "taskDefinition": {
+            "taskDefinitionArn": (
+                f"arn:aws:ecs:us-west-2:123456789012:task-definition/{family}:1"
+            ),
+            "family": family,
+            "revision": 1,
+            "status": "ACTIVE",
+            "networkMode": "awsvpc",
+            "cpu": "1024",
+            "memory": "2048",
+            "registeredAt": REGISTERED_AT,
+            "containerDefinitions": [container(family, number) for number in range(3)],
+            "volumes": [
+                {"name": "data", "efsVolumeConfiguration": {"fileSystemId": "fs-1"}},
+                {"name": "scratch", "host": {}},
+            ],
+            "requiresAttributes": [
+                {"name": f"com.amazonaws.ecs.capability.feature-{number}"}
+                for number in range(5)
+            ],
+            "compatibilities": ["EC2", "FARGATE"],
+            "requiresCompatibilities": ["FARGATE"],
+        },
+        "tags": [{"key": "team", "value": "platform"}],
+    }
+
+
+@pytest.fixture(scope="module")
+def responses() -> list[dict[str, Any]]:
+    return [task_definition(index) for index in range(TASK_DEFINITION_COUNT)]
+
+
+def retained_bytes(build, responses: list[dict[str, Any]]) -> int:
+    """Return the memory held by the parsed models, after reading a few fields."""
+    tracemalloc.start()
+    try:
+        models = [build(DescribeTaskDefinitionResponse, data) for data in responses]
+        for model in models:
+            assert model.taskDefinition.revision == 1
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+@pytest.mark.parametrize("build", BUILDERS)
+def test_task_definitions(benchmark, responses, build) -> None:
+    """Parse 5k task definitions and read their family and revision."""
+
+    def run() -> list[tuple[str, int]]:
+        return [
+            (model.taskDefinition.family, model.taskDefinition.revision)
+            for model in (
+                build(DescribeTaskDefinitionResponse, data) for data in responses
+            )
+        ]
+
+    result = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    assert len(result) == TASK_DEFINITION_COUNT
+    if not benchmark.disabled:
+        benchmark.extra_info["task_definitions_per_second"] = (
+            TASK_DEFINITION_COUNT / benchmark.stats["mean"]
+        )
+    benchmark.extra_info["retained_bytes"] = retained_bytes(build, responses)
@@ -0,0 +1,40 @@
+"""Benchmarks for manager and client construction overhead."""
+
+from __future__ import annotations
+
+import pytest
+
+from botocraft.services.ecs import Cluster, ClusterManager, Service
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of relationship-style lookups per benchmark round.
+LOOKUPS = 500
+
+
+def test_pooled_objects_access(benchmark) -> None:
+    """Resolve ``Model.objects.using(session)`` the way relationships do."""
+    session = Service.objects.session
+
+    def lookups() -> None:
+        for _ in range(LOOKUPS):
+            Cluster.objects.using(session)
+
+    benchmark(lookups)
+
+
+def test_unpooled_manager_construction(benchmark) -> None:
+    """Build a manager and client from scratch, as ``objects`` used to."""
+    session = Service.objects.session
+
+    def construct() -> None:
+        manager = ClusterManager.__new__(ClusterManager)
+        manager.session = session
+        manager.client = session.client("ecs", region_name="us-west-2")
+
+    benchmark(construct)
+
+
+def test_manager_instantiation(benchmark) -> None:
+    """Track the cost of building a manager that never makes an API call."""
+    benchmark(ClusterManager)
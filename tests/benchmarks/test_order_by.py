@@ -0,0 +1,58 @@
+"""Benchmarks for multi-key ordering of large querysets."""
+
+from __future__ import annotations
+
+import pytest
+
+from botocraft.services.abstract import (
+    Boto3ModelManagerFilter,
+    PrimaryBoto3ModelQuerySet,
+)
+
+from .conftest import InventoryItem, inventory
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of models to sort per round.
+MODEL_COUNT = 50_000
+#: Timed rounds per benchmark; each round sorts every model.
+ROUNDS = 3
+
+
+@pytest.fixture(scope="module")
+def models() -> list[InventoryItem]:
+    return inventory(MODEL_COUNT)
+
+
+def test_multi_key_order_by(benchmark, models) -> None:
+    """Sort 50k models on two keys with precomputed sort keys."""
+
+    def run() -> list[InventoryItem]:
+        return PrimaryBoto3ModelQuerySet(models).order_by(
+            "InstanceType", "-LaunchTime"
+        )[:]
+
+    result = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    assert len(result) == MODEL_COUNT
+    if not benchmark.disabled:
+        benchmark.extra_info["models_per_second"] = (
+            MODEL_COUNT / benchmark.stats["mean"]
+        )
+
+
+def test_per_element_filter_sort_keys(benchmark, models) -> None:
+    """Sort 50k models building a filter per element, for comparison."""
+
+    def key(field: str):
+        def get(model: InventoryItem):
+            filter_obj = Boto3ModelManagerFilter([model], dummy=True)
+            return filter_obj._get_field_value(model, field)  # noqa: SLF001
+
+        return get
+
+    def run() -> list[InventoryItem]:
+        ordered = sorted(models, key=key("LaunchTime"), reverse=True)
+        return sorted(ordered, key=key("InstanceType"))
+
+    result = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    assert len(result) == MODEL_COUNT
@@ -0,0 +1,72 @@
+"""Benchmarks for listing 10k instances in full, projected, and raw."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.ec2 import Instance
+
+from .test_response_parsing import instance
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of instances listed.
+INSTANCE_COUNT = 10_000
+#: Instances per reservation, and reservations per page.
+RESERVATION_SIZE = 50
+PAGE_SIZE = 20
+#: Timed rounds per benchmark; each round lists every instance.
+ROUNDS = 5
+
+#: The same listing as full models, an ``only=`` projection, and raw dicts.
+SHAPES = [
+    pytest.param({}, id="models"),
+    pytest.param({"only": ["InstanceId", "State__Name", "Tags"]}, id="only"),
+    pytest.param({"raw": True}, id="raw"),
+]
+
+
+@pytest.fixture(scope="module")
+def pages() -> list[dict[str, Any]]:
+    reservations = [
+        {
+            "ReservationId": f"r-{start:017x}",
+            "OwnerId": "123456789012",
+            "Instances": [
+                instance(index) for index in range(start, start + RESERVATION_SIZE)
+            ],
+        }
+        for start in range(0, INSTANCE_COUNT, RESERVATION_SIZE)
+    ]
+    return [
+        {"Reservations": reservations[start : start + PAGE_SIZE]}
+        for start in range(0, len(reservations), PAGE_SIZE)
+    ]
+
+
+@pytest.fixture
+def ec2_client(pages):
+    client = MagicMock()
+    # botocore hands out fresh page dicts; the manager pops ResponseMetadata
+    client.get_paginator.return_value.paginate.side_effect = lambda **_: [
+        dict(page) for page in pages
+    ]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+@pytest.mark.usefixtures("ec2_client")
+@pytest.mark.parametrize("shape", SHAPES)
+def test_list_instances(benchmark, shape) -> None:
+    """List 10k instances and read every one."""
+    result = benchmark.pedantic(
+        lambda: list(Instance.objects.list(**shape)), rounds=ROUNDS, iterations=1
+    )
+    assert len(result) == INSTANCE_COUNT
+    if not benchmark.disabled:
+        benchmark.extra_info["instances_per_second"] = (
+            INSTANCE_COUNT / benchmark.stats["mean"]
+        )
@@ -0,0 +1,129 @@
+"""Benchmarks for building models from large EC2 and ECS responses."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+import pytest
+
+from botocraft.services.ec2 import DescribeInstancesResult
+from botocraft.services.ecs import DescribeServicesResponse
+from botocraft.services.trusted import construct, parse
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of instances in the ``DescribeInstances`` response.
+INSTANCE_COUNT = 10_000
+#: Number of services in the ``DescribeServices`` response.
+SERVICE_COUNT = 2_000
+#: Timed rounds per benchmark; each round parses the whole response.
+ROUNDS = 3
+
+LAUNCH_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+#: A bare constructor call, as generated code made before, :py:func:`parse`,
+#: and :py:func:`construct`, which builds lazy responses and the ones the
+#: models reject.
+BUILDERS = [
+    pytest.param(lambda cls, data: cls(**data), id="constructor"),
+    pytest.param(partial(parse, validate=True), id="validated"),
+    pytest.param(construct, id="constructed"),
+]
+
+
+def instance(index: int) -> dict[str, Any]:
+    return {
+        "InstanceId": f"i-{index:017x}",
+        "ImageId": "ami-0123456789abcdef0",
+        "InstanceType": ("t3.micro", "m5.large", "c6g.xlarge")[index % 3],
+        "LaunchTime": LAUNCH_TIME,
+        "State": {"Code": 16, "Name": "running"},
+        "PrivateIpAddress": f"10.0.{index // 256 % 256}.{index % 256}",
+        "SubnetId": "subnet-0123456789abcdef0",
+        "VpcId": "vpc-0123456789abcdef0",
+        "Placement": {"AvailabilityZone": "us-west-2a", "Tenancy": "default"},
+        "SecurityGroups": [{"GroupId": "sg-0123456789abcdef0", "GroupName": "web"}],
+        "BlockDeviceMappings": [
+            {
+                "DeviceName": "/dev/xvda",
+                "Ebs": {"VolumeId": f"vol-{index:017x}", "Status": "attached"},
+            }
+        ],
+        "Tags": [
+            {"Key": "Name", "Value": f"web-{index}"},
+            {"Key": "Environment", "Value": ("prod", "dev")[index % 2]},
+        ],
+    }
+
+
+def service(index: int) -> dict[str, Any]:
+    return {
+        "serviceName": f"web-{index}",
+        "serviceArn": f"arn:aws:ecs:us-west-2:123456789012:service/prod/web-{index}",
+        "clusterArn": "arn:aws:ecs:us-west-2:123456789012:cluster/prod",
+        "taskDefinition": f"web-{index}:1",
+        "desiredCount": 2,
+        "runningCount": 2,
+        "launchType": "FARGATE",
+        "schedulingStrategy": "REPLICA",
+        "createdAt": LAUNCH_TIME,
+        "deployments": [
+            {"id": f"ecs-svc/{index}", "status": "PRIMARY", "createdAt": LAUNCH_TIME}
+        ],
+        "events": [
+            {
+                "id": f"event-{index}-{number}",
+                "createdAt": LAUNCH_TIME,
+                "message": f"(service web-{index}) has reached a steady state.",
+            }
+            for number in range(10)
+        ],
+        "tags": [{"key": "team", "value": "platform"}],
+    }
+
+
+@pytest.fixture(scope="module")
+def instances() -> dict[str, Any]:
+    return {
+        "Reservations": [
+            {
+                "ReservationId": f"r-{start:017x}",
+                "OwnerId": "123456789012",
+                "Instances": [instance(index) for index in range(start, start + 50)],
+            }
+            for start in range(0, INSTANCE_COUNT, 50)
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def services() -> dict[str, Any]:
+    return {"services": [service(index) for index in range(SERVICE_COUNT)]}
+
+
+@pytest.mark.parametrize("build", BUILDERS)
+def test_ec2(benchmark, instances, build) -> None:
+    """Parse 10k instances."""
+    result = benchmark.pedantic(
+        build, args=(DescribeInstancesResult, instances), rounds=ROUNDS, iterations=1
+    )
+    assert sum(len(r.Instances) for r in result.Reservations) == INSTANCE_COUNT
+    if not benchmark.disabled:
+        benchmark.extra_info["models_per_second"] = (
+            INSTANCE_COUNT / benchmark.stats["mean"]
+        )
+
+
+@pytest.mark.parametrize("build", BUILDERS)
+def test_ecs(benchmark, services, build) -> None:
+    """Parse 2k services."""
+    result = benchmark.pedantic(
+        build, args=(DescribeServicesResponse, services), rounds=ROUNDS, iterations=1
+    )
+    assert len(result.services) == SERVICE_COUNT
+    if not benchmark.disabled:
+        benchmark.extra_info["models_per_second"] = (
+            SERVICE_COUNT / benchmark.stats["mean"]
+        )
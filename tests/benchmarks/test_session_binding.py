@@ -0,0 +1,82 @@
+"""Benchmarks for giving parsed models their session on a large listing."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from botocraft.services.abstract import Boto3ModelManager
+from botocraft.services.ec2 import DescribeInstancesResult
+
+from .test_response_parsing import instance
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Number of instances in the ``DescribeInstances`` response.
+INSTANCE_COUNT = 10_000
+#: Instances per reservation.
+RESERVATION_SIZE = 50
+#: Timed rounds per benchmark; each round parses the whole response.
+ROUNDS = 3
+
+
+class ParsingManager(Boto3ModelManager):
+    service_name = "ec2"
+
+    def parse(self, response: dict[str, Any]) -> DescribeInstancesResult:
+        return DescribeInstancesResult(**response)
+
+
+@pytest.fixture(scope="module")
+def response() -> dict[str, Any]:
+    return {
+        "Reservations": [
+            {
+                "ReservationId": f"r-{start:017x}",
+                "OwnerId": "123456789012",
+                "Instances": [
+                    instance(index) for index in range(start, start + RESERVATION_SIZE)
+                ],
+            }
+            for start in range(0, INSTANCE_COUNT, RESERVATION_SIZE)
+        ]
+    }
+
+
+@pytest.fixture
+def manager() -> ParsingManager:
+    manager = ParsingManager.__new__(ParsingManager)
+    manager.session = object()
+    return manager
+
+
+def test_session_bound_at_construction(benchmark, manager, response) -> None:
+    """Parse 10k instances inside a manager method, which binds the session."""
+    result = benchmark.pedantic(
+        manager.parse, args=(response,), rounds=ROUNDS, iterations=1
+    )
+    instances = [i for r in result.Reservations for i in r.Instances]
+    assert len(instances) == INSTANCE_COUNT
+    assert all(i.session is manager.session for i in instances)
+    if not benchmark.disabled:
+        benchmark.extra_info["instances_per_second"] = (
+            INSTANCE_COUNT / benchmark.stats["mean"]
+        )
+
+
+def test_sessionize_after_construction(benchmark, manager, response) -> None:
+    """Parse 10k instances then walk them with ``sessionize()``, for comparison."""
+
+    def run() -> DescribeInstancesResult:
+        result = DescribeInstancesResult(**response)
+        manager.sessionize(result)
+        return result
+
+    result = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    instances = [i for r in result.Reservations for i in r.Instances]
+    assert all(i.session is manager.session for i in instances)
+    if not benchmark.disabled:
+        benchmark.extra_info["instances_per_second"] = (
+            INSTANCE_COUNT / benchmark.stats["mean"]
+        )
@@ -0,0 +1,100 @@
+"""Benchmarks for listing a million S3 objects as summaries and columns."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.s3 import S3Object, S3ObjectSummary
+
+pytestmark = pytest.mark.slow_benchmark
+
+#: Objects per ``ListObjectsV2`` page, as S3 returns them.
+PAGE_SIZE = 1_000
+#: Timed rounds per benchmark; each round lists and reads every object.
+ROUNDS = 3
+
+LAST_MODIFIED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+#: Full models, summaries, and summaries stored as columns.  A million full
+#: models take over a gigabyte, so they are listed 100k at a time.
+SHAPES = [
+    pytest.param("models", 100_000, id="models-100k"),
+    pytest.param("summary", 1_000_000, id="summary-1m"),
+    pytest.param("columns", 1_000_000, id="columns-1m"),
+]
+
+
+def s3_object(index: int) -> dict[str, Any]:
+    return {
+        "Key": f"logs/2024/01/01/{index:08d}.json.gz",
+        "LastModified": LAST_MODIFIED,
+        "ETag": f'"{index:032x}"',
+        "ChecksumAlgorithm": ["CRC32"],
+        "ChecksumType": "FULL_OBJECT",
+        "Size": index % 65_536,
+        "StorageClass": "STANDARD",
+    }
+
+
+def pages(count: int):
+    # Made as they are listed, so only what the listing keeps stays in memory
+    for start in range(0, count, PAGE_SIZE):
+        yield {
+            "Contents": [s3_object(index) for index in range(start, start + PAGE_SIZE)],
+            "IsTruncated": start + PAGE_SIZE < count,
+        }
+
+
+@pytest.fixture
+def s3_client():
+    client = MagicMock()
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+def listing(shape: str) -> Any:
+    """List the objects, built as ``shape``."""
+    if shape == "models":
+        return S3Object.objects.list(Bucket="logs")
+    objects = S3Object.objects.list(Bucket="logs", summary=True)
+    if shape == "columns":
+        return S3ObjectSummary.columns(objects)
+    return objects
+
+
+def bytes_per_object(shape: str, count: int) -> float:
+    """Return the memory the listing holds for each object."""
+    tracemalloc.start()
+    try:
+        objects = listing(shape)
+        # Querysets refer to themselves, so free the ones left over
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == count
+    return size / count
+
+
+@pytest.mark.parametrize(("shape", "count"), SHAPES)
+def test_list_objects(benchmark, s3_client, shape, count) -> None:
+    """List the objects, then add up their sizes."""
+    s3_client.get_paginator.return_value.paginate.side_effect = lambda **_: pages(count)
+
+    def run() -> int:
+        objects = listing(shape)
+        if shape == "columns":
+            return sum(objects.column("Size"))
+        return sum(o.Size for o in objects)
+
+    total = benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
+    assert total == sum(index % 65_536 for index in range(count))
+    if not benchmark.disabled:
+        benchmark.extra_info["objects_per_second"] = count / benchmark.stats["mean"]
+    benchmark.extra_info["bytes_per_object"] = bytes_per_object(shape, count)
@@ -0,0 +1,68 @@
+import json
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from botocraft.clients import clear_pools
+
+pytest_plugins = ["botocraft.pytest_plugin"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_pools():
+    """
+    Give every test fresh client and manager pools, so tests that patch
+    ``boto3.client`` never see a client pooled by an earlier test.
+    """
+    clear_pools()
+    yield
+    clear_pools()
+
+
+class _FakeRaw:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def stream(self, **_):
+        yield self.body
+
+
+@pytest.fixture
+def ecs_responses(monkeypatch):
+    """
+    Serve ECS calls from a real botocore client whose requests are answered
+    from the returned dict instead of the network, so botocore's event hooks
+    run as they would against AWS.
+
+    Keys are operation names (``DescribeClusters``); values are a
+    ``(status, body)`` tuple, or a callable taking the request parameters and
+    returning one.  Calls are not retried.
+    """
+    responses: dict = {}
+
+    def respond(request, **_) -> AWSResponse:
+        operation = request.headers["X-Amz-Target"].decode().rsplit(".", 1)[-1]
+        response = responses[operation]
+        if callable(response):
+            response = response(json.loads(request.body or b"{}"))
+        status, body = response
+        return AWSResponse(
+            request.url,
+            status,
+            {"Content-Type": "application/x-amz-json-1.1"},
+            _FakeRaw(json.dumps(body).encode()),
+        )
+
+    session = boto3.session.Session(
+        aws_access_key_id="AKID",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-west-2",
+    )
+    client = session.client(
+        "ecs", config=Config(retries={"mode": "standard", "total_max_attempts": 1})
+    )
+    client.meta.events.register("before-send", respond)
+    monkeypatch.setattr(boto3, "client", lambda *_, **__: client)
+    return responses
@@ -1,3 +1,4 @@
+import re
 from datetime import date, datetime, time, timedelta, timezone
 from zoneinfo import ZoneInfo
 
@@ -751,3 +752,70 @@ class TestRelationshipValuesAndValuesList:
         assert len(values) == 1
         assert values[0]["id"] == "2"
         assert values[0]["name"] == "Second"
+
+
+class TestCompiledFilterPlan:
+    """Test that filters are compiled once into a reusable plan."""
+
+    def test_compile_splits_paths_and_lookups(self):
+        """Split field paths and strip the lookup suffix."""
+        plan = Boto3ModelManagerFilter(
+            [], name__icontains="WEB", tags__Value="production"
+        ).compile()
+
+        assert [parts for parts, _ in plan] == [("name",), ("tags", "Value")]
+        predicate = plan[0][1]
+        assert predicate("my-web-host")
+        assert not predicate("db-host")
+
+    def test_regex_is_compiled_once(self, test_models, monkeypatch):
+        """Compile the regex once per filter, not once per model."""
+        compiled: list[str] = []
+        original = re.compile
+
+        def counting_compile(pattern, *args):
+            compiled.append(pattern)
+            return original(pattern, *args)
+
+        monkeypatch.setattr(
+            Boto3ModelManagerFilter,
+            "PREPARE",
+            {**Boto3ModelManagerFilter.PREPARE, "regex": counting_compile},
+        )
+        result = Boto3ModelManagerFilter(test_models, name__regex=r"server-\d")()
+
+        assert len(result) == len(
+            [model for model in test_models if re.search(r"server-\d", model.name)]
+        )
+        assert compiled == [r"server-\d"]
+
+    def test_in_lookup_keeps_substring_semantics_for_strings(self, test_models):
+        """Treat a string ``in`` value as a substring test, as before."""
+        result = Boto3ModelManagerFilter(test_models, status__in="running|stopped")()
+
+        assert {model.status for model in result} <= {"running", "stopped"}
+        assert result
+
+    def test_in_lookup_handles_unhashable_values(self):
+        """Fall back to a scan for unhashable field values."""
+        models = [
+            TestModel(name="a", status="x", type="t", count=1, metadata={"k": 1}),
+            TestModel(name="b", status="x", type="t", count=1, metadata={"k": 2}),
+        ]
+
+        result = Boto3ModelManagerFilter(models, metadata__in=[{"k": 2}])()
+
+        assert [model.name for model in result] == ["b"]
+
+    def test_custom_lookup_without_compiled_version(self, test_models, monkeypatch):
+        """Fall back to ``LOOKUPS`` for lookups added only there."""
+        monkeypatch.setitem(
+            Boto3ModelManagerFilter.LOOKUPS,
+            "divisible_by",
+            lambda field_val, filter_val: field_val % filter_val == 0,
+        )
+
+        result = Boto3ModelManagerFilter(test_models, count__divisible_by=5)()
+
+        assert result
+        assert all(model.count % 5 == 0 for model in result)
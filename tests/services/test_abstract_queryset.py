@@ -1,13 +1,22 @@
 import re
 from datetime import datetime
+from functools import cached_property
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic import Field
 
+from botocraft.instrumentation import _CALLER, attributed
 from botocraft.services.abstract import (
     Boto3Model,
+    Boto3ModelManager,
     PrimaryBoto3ModelQuerySet,
+    layered,
 )
+from botocraft.services.exceptions import MultipleObjectsReturnedError
+
+PAGE_SIZE = 5
+PAGE_COUNT = 4
 
 
 class SimpleTestModel(Boto3Model):
@@ -736,3 +745,422 @@ class TestValuesAndValuesList:
         assert len(values) == 2
         assert values[0] == "Alice"
         assert values[1] == "Charlie"
+
+
+class PageListResponse(Boto3Model):
+    """One page of a paginated list response."""
+
+    Items: list[SimpleTestModel] | None = None
+    NextToken: str | None = None
+
+
+class PagedManager(Boto3ModelManager):
+    service_name = "test"
+
+
+def paged_manager(pages: list[list[SimpleTestModel]], fetched: list[int]):
+    """Build a manager whose paginator records which pages were fetched."""
+
+    def paginate(**_kwargs):
+        for number, items in enumerate(pages):
+            fetched.append(number)
+            yield {
+                "Items": [item.model_dump() for item in items],
+                "NextToken": "more" if number < len(pages) - 1 else None,
+                "ResponseMetadata": {},
+            }
+
+    manager = PagedManager.__new__(PagedManager)
+    manager.client = MagicMock()
+    manager.client.get_paginator.return_value.paginate.side_effect = paginate
+    manager.session = MagicMock()
+    return manager
+
+
+class TestLazyPagination:
+    """Test that paginated listings are fetched page by page on demand."""
+
+    @pytest.fixture
+    def pages(self):
+        return [
+            [
+                SimpleTestModel(name=f"model-{page}-{index}", type="a")
+                for index in range(PAGE_SIZE)
+            ]
+            for page in range(PAGE_COUNT)
+        ]
+
+    def list_models(self, pages, fetched):
+        return paged_manager(pages, fetched).paginate(
+            "list_models", PageListResponse, "Items", {"Filter": None}
+        )
+
+    def test_first_fetches_one_page(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        assert queryset.first().name == "model-0-0"
+        assert queryset.exists()
+        assert fetched == [0]
+
+    def test_slice_fetches_only_needed_pages(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        head = queryset[: PAGE_SIZE + 1]
+
+        assert [model.name for model in head][-1] == "model-1-0"
+        assert fetched == [0, 1]
+
+    def test_break_stops_pagination(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        for model in queryset:
+            if model.name == "model-1-2":
+                break
+
+        assert fetched == [0, 1]
+
+    def test_len_materializes_all_pages(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        assert queryset.first() is not None
+        assert len(queryset) == PAGE_COUNT * PAGE_SIZE
+        assert fetched == list(range(PAGE_COUNT))
+        assert [model.name for model in queryset][PAGE_SIZE] == "model-1-0"
+
+    def test_iteration_is_repeatable(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        assert queryset[1].name == "model-0-1"
+        assert len(list(queryset)) == len(list(queryset)) == PAGE_COUNT * PAGE_SIZE
+        assert fetched == list(range(PAGE_COUNT))
+
+    def test_binds_session_to_each_page(self, pages):
+        manager = paged_manager(pages, [])
+
+        queryset = manager.paginate("list_models", PageListResponse, "Items", {})
+
+        models = list(queryset)
+        assert len(models) == PAGE_COUNT * PAGE_SIZE
+        assert all(model.session is manager.session for model in models)
+
+    def test_later_pages_fetched_in_callers_context(self, pages):
+        callers: list[str | None] = []
+
+        def paginate(**_kwargs):
+            for number, items in enumerate(pages):
+                callers.append(_CALLER.get())
+                yield {
+                    "Items": [item.model_dump() for item in items],
+                    "NextToken": "more" if number < len(pages) - 1 else None,
+                }
+
+        manager = paged_manager(pages, [])
+        manager.client.get_paginator.return_value.paginate.side_effect = paginate
+        list_models = attributed("PagedManager.list", manager.paginate)
+
+        queryset = list_models("list_models", PageListResponse, "Items", {})
+
+        assert len(list(queryset)) == PAGE_COUNT * PAGE_SIZE
+        assert callers == ["PagedManager.list"] * PAGE_COUNT
+
+    def test_non_model_items_are_returned_as_list(self):
+        manager = PagedManager.__new__(PagedManager)
+        manager.client = MagicMock()
+        manager.client.get_paginator.return_value.paginate.return_value = [
+            {"Arns": ["a", "b"]},
+            {"Arns": ["c"]},
+        ]
+
+        class ArnListResponse(Boto3Model):
+            Arns: list[str] | None = None
+
+        assert manager.paginate("list_arns", ArnListResponse, "Arns", {}) == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_empty_listing_returns_empty_list(self):
+        assert self.list_models([[]], []) == []
+
+    def test_filter_fetches_only_needed_pages(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        assert queryset.filter(name__endswith="-1-3").first().name == "model-1-3"
+        assert fetched == [0, 1]
+
+    def test_derived_querysets_share_pages(self, pages):
+        fetched: list[int] = []
+        queryset = self.list_models(pages, fetched)
+
+        first_page = queryset.filter(name__startswith="model-0-")
+        rest = queryset.exclude(name__startswith="model-0-")
+
+        assert len(first_page) == PAGE_SIZE
+        assert len(rest) == (PAGE_COUNT - 1) * PAGE_SIZE
+        assert fetched == list(range(PAGE_COUNT))
+
+
+class TestChainedQuerySet:
+    """Test that chained operations build new querysets evaluated in one pass."""
+
+    def test_filter_does_not_modify_base(self, test_queryset, test_models):
+        active = test_queryset.filter(active=True)
+
+        assert len(active) == 3
+        assert test_queryset.results == test_models
+
+    def test_base_reused_for_many_reports(self, test_queryset):
+        type_a = test_queryset.filter(type="a")
+        high = test_queryset.filter(score__gte=30)
+
+        assert [m.name for m in type_a] == ["model-1", "model-3"]
+        assert [m.name for m in high] == ["model-3", "model-4"]
+        assert len(test_queryset) == 4
+
+    def test_chaining_does_not_modify_parent(self, test_queryset):
+        active = test_queryset.filter(active=True)
+        ordered = active.order_by("-score")
+
+        assert [m.score for m in ordered] == [30, 20, 10]
+        assert [m.score for m in active] == [10, 20, 30]
+
+    def test_nothing_evaluated_until_used(self):
+        calls: list[str] = []
+
+        class CountingModel(SimpleTestModel):
+            @property
+            def label(self) -> str:
+                calls.append(self.name)
+                return self.name
+
+        queryset = PrimaryBoto3ModelQuerySet([CountingModel(name="model-1", type="a")])
+        filtered = queryset.filter(label="model-1").order_by("label")
+
+        assert calls == []
+        assert filtered.first().name == "model-1"
+        assert calls
+
+    def test_exclude(self, test_queryset):
+        result = test_queryset.exclude(type="a")
+
+        assert [m.name for m in result] == ["model-2", "model-4"]
+
+    def test_exclude_requires_all_criteria(self, test_queryset):
+        result = test_queryset.exclude(type="a", score__gt=15)
+
+        assert [m.name for m in result] == ["model-1", "model-2", "model-4"]
+
+    def test_fused_pipeline(self, test_queryset):
+        result = (
+            test_queryset.filter(score__gt=5)
+            .exclude(type="c")
+            .order_by("-score")
+            .values_list("name", flat=True)
+        )
+
+        assert result == ["model-3", "model-2", "model-1"]
+
+    def test_filter_empty_queryset(self, empty_queryset):
+        assert list(empty_queryset.filter(type="a")) == []
+
+
+class TestIndexes:
+    """Test hash indexes and in-memory lookups on querysets."""
+
+    def test_index_by(self, test_queryset, test_models):
+        index = test_queryset.index_by("type")
+
+        assert index["a"] == [test_models[0], test_models[2]]
+        assert index["c"] == [test_models[3]]
+        assert test_queryset.index_by("type") is index
+
+    def test_index_by_list_field(self, test_queryset, test_models):
+        index = test_queryset.index_by("tags")
+
+        assert index["tag2"] == [test_models[0], test_models[1]]
+        assert "tag5" not in index
+
+    def test_index_by_nested_field(self, test_queryset, test_models):
+        test_models[0].metadata = {"region": "us-west-2"}
+        test_models[1].metadata = {"region": "us-east-1"}
+
+        index = test_queryset.index_by("metadata__region")
+
+        assert index["us-west-2"] == [test_models[0]]
+        assert index[None] == [test_models[2], test_models[3]]
+
+    def test_in_bulk(self, test_queryset, test_models):
+        by_name = test_queryset.in_bulk(field_name="name")
+
+        assert by_name["model-2"] is test_models[1]
+        assert test_queryset.in_bulk(["model-3", "missing"], field_name="name") == {
+            "model-3": test_models[2]
+        }
+
+    def test_get(self, test_queryset, test_models):
+        assert test_queryset.get(name="model-3") is test_models[2]
+        assert test_queryset.get(name="missing") is None
+        assert "name" in test_queryset._indexes  # noqa: SLF001
+
+    def test_get_checks_every_lookup(self, test_queryset, test_models):
+        assert test_queryset.get(type="a", score__gt=15) is test_models[2]
+        assert test_queryset.get(type="a", active=False) is None
+
+    def test_get_multiple(self, test_queryset):
+        with pytest.raises(MultipleObjectsReturnedError):
+            test_queryset.get(type="a")
+
+    def test_get_unhashable_field(self, test_queryset, test_models):
+        test_models[0].metadata = {"env": "prod"}
+
+        assert test_queryset.get(metadata={"env": "prod"}) is test_models[0]
+
+    def test_filter_served_from_index(self, test_queryset, test_models):
+        test_queryset.index_by("name")
+        tested: list[Boto3Model] = []
+        compile_matcher = test_queryset._matcher  # noqa: SLF001
+
+        def counting_matcher(filters):
+            match = compile_matcher(filters)
+            return lambda model: tested.append(model) or match(model)
+
+        test_queryset._matcher = counting_matcher  # noqa: SLF001
+
+        assert list(test_queryset.filter(name="model-2")) == [test_models[1]]
+        assert tested == [test_models[1]]
+
+    def test_in_served_from_index_keeps_order(self, test_queryset, test_models):
+        test_queryset.index_by("name")
+
+        result = test_queryset.filter(name__in=["model-4", "model-1", "missing"])
+
+        assert list(result) == [test_models[0], test_models[3]]
+
+    def test_index_reset_with_results(self, test_queryset, test_models):
+        test_queryset.index_by("name")
+        test_queryset.results = test_models[:1]
+
+        assert test_queryset.get(name="model-2") is None
+
+
+class Owner(Boto3Model):
+    """A model loaded through a relationship."""
+
+    name: str
+    rank: int
+
+
+class Owned(Boto3Model):
+    """A model with a ``cached_property`` relationship, like generated models."""
+
+    name: str
+    owner_name: str
+
+    @cached_property
+    def owner(self) -> Owner:
+        LOADED.append(self.name)
+        return Owner(name=self.owner_name, rank=int(self.owner_name[-1]))
+
+
+#: The model name for each :py:attr:`Owned.owner` load.
+LOADED: list[str] = []
+
+
+class TestOrderBy:
+    """Test multi-key ordering."""
+
+    def test_multiple_keys(self, test_queryset):
+        ordered = test_queryset.order_by("type", "score")
+
+        assert [m.name for m in ordered] == ["model-1", "model-3", "model-2", "model-4"]
+
+    def test_mixed_directions(self, test_queryset):
+        ordered = test_queryset.order_by("-active", "-score")
+
+        assert [m.score for m in ordered] == [30, 20, 10, 40]
+
+    def test_all_descending(self, test_queryset):
+        ordered = test_queryset.order_by("-type", "-score")
+
+        assert [m.name for m in ordered] == ["model-4", "model-2", "model-3", "model-1"]
+
+    def test_requires_a_field(self, test_queryset):
+        with pytest.raises(ValueError, match="at least one field"):
+            test_queryset.order_by()
+
+    def test_relationships_prefetched(self):
+        LOADED.clear()
+        models = [
+            Owned(name=f"owned-{index}", owner_name=f"owner-{index % 3}")
+            for index in range(6)
+        ]
+
+        ordered = PrimaryBoto3ModelQuerySet(models).order_by("-owner__rank", "name")
+
+        assert [m.name for m in ordered] == [
+            "owned-2",
+            "owned-5",
+            "owned-1",
+            "owned-4",
+            "owned-0",
+            "owned-3",
+        ]
+        assert sorted(LOADED) == sorted(m.name for m in models)
+
+
+class TestLayered:
+    """Verify manager methods only enter the layers whose feature is on."""
+
+    @staticmethod
+    def _layer(name, entered):
+        def decorate(func):
+            def wrapper(self, *args, **kwargs):
+                entered.append(name)
+                return func(self, *args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def test_enters_only_layers_that_are_on(self):
+        entered = []
+        on = {"outer": False, "inner": False}
+        method = layered(
+            lambda _self: "result",
+            [
+                (lambda: on["outer"], self._layer("outer", entered)),
+                (lambda: on["inner"], self._layer("inner", entered)),
+            ],
+        )
+
+        assert method(None) == "result"
+        assert entered == []
+
+        on["inner"] = True
+        method(None)
+        assert entered == ["inner"]
+
+        entered.clear()
+        on["outer"] = True
+        method(None)
+        assert entered == ["outer", "inner"]
+
+    def test_wraps_each_combination_once(self):
+        wrapped = []
+
+        def decorate(func):
+            wrapped.append(func)
+            return func
+
+        method = layered(lambda _self: None, [(lambda: True, decorate)])
+        method(None)
+        method(None)
+
+        assert len(wrapped) == 1
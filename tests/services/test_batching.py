@@ -0,0 +1,169 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.batching import BatchFuture
+from botocraft.services.ecs import Cluster, TaskDefinition
+
+CLUSTER_COUNT = 250
+WORKERS = 20
+
+
+def cluster_arn(index: int) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/cluster-{index}"
+
+
+def describe_clusters(clusters, **_):
+    return {
+        "clusters": [
+            {"clusterArn": arn, "clusterName": arn.rsplit("/", 1)[-1]}
+            for arn in clusters
+            if not arn.endswith("missing")
+        ]
+    }
+
+
+@pytest.fixture
+def ecs_client():
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    client.describe_task_definition.return_value = {
+        "taskDefinition": {
+            "taskDefinitionArn": "arn:td",
+            "family": "app",
+            "containerDefinitions": [],
+        }
+    }
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestBatch:
+    def test_gets_merged_into_get_many(self, ecs_client):
+        with Cluster.objects.batch():
+            futures = [
+                Cluster.objects.load(cluster_arn(i)) for i in range(CLUSTER_COUNT)
+            ]
+
+        assert all(isinstance(future, BatchFuture) for future in futures)
+        clusters = [future.result() for future in futures]
+        assert [c.clusterArn for c in clusters] == [
+            cluster_arn(i) for i in range(CLUSTER_COUNT)
+        ]
+        sizes = [
+            len(call.kwargs["clusters"])
+            for call in ecs_client.describe_clusters.call_args_list
+        ]
+        assert sizes == [100, 100, 50]
+
+    def test_duplicate_lookups_share_a_slot(self, ecs_client):
+        with Cluster.objects.batch():
+            first = Cluster.objects.load(cluster_arn(0))
+            second = Cluster.objects.load(cluster_arn(0))
+
+        assert first.result() is second.result()
+        assert ecs_client.describe_clusters.call_args.kwargs["clusters"] == [
+            cluster_arn(0)
+        ]
+
+    def test_result_inside_block_sends_batch(self, ecs_client):
+        with Cluster.objects.batch():
+            first = Cluster.objects.load(cluster_arn(0))
+            second = Cluster.objects.load(cluster_arn(1))
+            assert first.result().clusterArn == cluster_arn(0)
+            assert second.done()
+            assert ecs_client.describe_clusters.call_count == 1
+
+    def test_missing_falls_back_to_get(self, ecs_client):
+        with Cluster.objects.batch():
+            found = Cluster.objects.load(cluster_arn(0))
+            missing = Cluster.objects.load(cluster_arn(1) + "-missing")
+
+        assert found.result() is not None
+        assert missing.result() is None
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_errors_delivered_to_futures(self, ecs_client):
+        ecs_client.describe_clusters.side_effect = RuntimeError("boom")
+        with Cluster.objects.batch():
+            future = Cluster.objects.load(cluster_arn(0))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result()
+
+    @pytest.mark.usefixtures("ecs_client")
+    def test_unbatchable_manager_returns_resolved_future(self):
+        with TaskDefinition.objects.batch():
+            future = TaskDefinition.objects.load("app")
+
+        assert future.done()
+        assert future.result().family == "app"
+
+    @pytest.mark.usefixtures("ecs_client")
+    def test_other_managers_unaffected(self):
+        with TaskDefinition.objects.batch():
+            cluster = Cluster.objects.get(cluster_arn(0))
+
+        assert cluster.clusterArn == cluster_arn(0)
+
+    def test_get_returns_models_inside_block(self, ecs_client):
+        with Cluster.objects.batch():
+            cluster = Cluster.objects.get(cluster_arn(0))
+            assert isinstance(cluster, Cluster)
+            assert cluster.clusterArn == cluster_arn(0)
+
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_load_outside_block_resolves_right_away(self, ecs_client):
+        future = Cluster.objects.load(cluster_arn(0))
+
+        assert future.done()
+        assert future.result().clusterArn == cluster_arn(0)
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_no_batching_by_default(self, ecs_client):
+        cluster = Cluster.objects.get(cluster_arn(0))
+
+        assert cluster.clusterArn == cluster_arn(0)
+        assert ecs_client.describe_clusters.call_args.kwargs["clusters"] == [
+            cluster_arn(0)
+        ]
+
+
+class TestWindowBatching:
+    def test_concurrent_gets_merged(self, ecs_client):
+        barrier = threading.Barrier(WORKERS)
+
+        def get(index):
+            barrier.wait()
+            return Cluster.objects.get(cluster_arn(index))
+
+        settings = MagicMock(window_seconds=0.5)
+        with (
+            patch("botocraft.services.batching._settings", return_value=settings),
+            ThreadPoolExecutor(WORKERS) as pool,
+        ):
+            clusters = list(pool.map(get, range(WORKERS)))
+
+        assert [c.clusterArn for c in clusters] == [
+            cluster_arn(i) for i in range(WORKERS)
+        ]
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_timer_sends_batch_in_callers_context(self, ecs_client):
+        caller = ContextVar("caller", default=None)
+        seen = []
+        ecs_client.describe_clusters.side_effect = lambda **kwargs: (
+            seen.append(caller.get()) or describe_clusters(**kwargs)
+        )
+
+        settings = MagicMock(window_seconds=0.01)
+        caller.set("test")
+        with patch("botocraft.services.batching._settings", return_value=settings):
+            cluster = Cluster.objects.get(cluster_arn(0))
+
+        assert cluster.clusterArn == cluster_arn(0)
+        assert seen == ["test"]
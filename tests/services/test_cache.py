@@ -0,0 +1,218 @@
+import pickle
+import sqlite3
+import stat
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+
+from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+from botocraft.services.cache import (
+    MemoryCache,
+    NullCache,
+    SQLiteCache,
+    response_cache,
+    set_response_cache,
+)
+from botocraft.services.ecs import Cluster
+
+
+def cluster_arn(name: str) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/{name}"
+
+
+def describe_clusters(clusters, **_):
+    return {
+        "clusters": [
+            {"clusterArn": cluster_arn(name), "clusterName": name} for name in clusters
+        ]
+    }
+
+
+@pytest.fixture
+def ecs_client():
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    client.delete_cluster.return_value = {"cluster": {"clusterName": "prod"}}
+    client.get_paginator.return_value.paginate.return_value = [
+        {"clusterArns": [cluster_arn("prod"), cluster_arn("dev")]}
+    ]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryCache()
+    else:
+        backend = SQLiteCache(tmp_path / "cache.sqlite3")
+    set_response_cache(backend)
+    yield backend
+    set_response_cache(None)
+
+
+def settings(**kwargs):
+    values = {"ttl_seconds": 30.0, "ttls": {}, "max_size": 1024, **kwargs}
+    return patch("botocraft.services.cache._settings", return_value=MagicMock(**values))
+
+
+class TestResponseCache:
+    def test_off_by_default(self, ecs_client):
+        assert isinstance(response_cache(), NullCache)
+
+        Cluster.objects.get("prod")
+        Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_get_cached(self, ecs_client, cache):
+        first = Cluster.objects.get("prod")
+        second = Cluster.objects.get(cluster="prod")
+
+        assert ecs_client.describe_clusters.call_count == 1
+        assert second == first
+        assert second.session is Cluster.objects.session
+        assert cache.stats().hits == 1
+
+    @pytest.mark.usefixtures("ecs_client")
+    def test_memory_hits_are_same_models(self, cache):
+        if not isinstance(cache, MemoryCache):
+            pytest.skip("only the memory backend shares objects")
+
+        assert Cluster.objects.get("prod") is Cluster.objects.get("prod")
+
+    @pytest.mark.usefixtures("cache")
+    def test_list_cached(self, ecs_client):
+        first = Cluster.objects.list()
+        second = Cluster.objects.list()
+
+        assert isinstance(second, PrimaryBoto3ModelQuerySet)
+        assert [c.clusterName for c in second] == [c.clusterName for c in first]
+        assert ecs_client.get_paginator.return_value.paginate.call_count == 1
+
+    @pytest.mark.usefixtures("ecs_client")
+    def test_memory_hits_skip_validation(self, cache):
+        if not isinstance(cache, MemoryCache):
+            pytest.skip("the SQLite backend validates what it reads back")
+
+        Cluster.objects.get("prod")
+        with patch.object(Cluster, "__pydantic_validator__") as validator:
+            cluster = Cluster.objects.get("prod")
+
+        assert cluster.clusterName == "prod"
+        validator.validate_python.assert_not_called()
+
+    @pytest.mark.usefixtures("cache")
+    def test_delete_invalidates(self, ecs_client):
+        Cluster.objects.get("prod")
+        Cluster.objects.get("dev")
+        Cluster.objects.list()
+        Cluster.objects.delete("prod")
+
+        Cluster.objects.get("prod")
+        Cluster.objects.get("dev")
+        Cluster.objects.list()
+
+        # Listing hydrates the ARNs with describe_clusters too
+        assert ecs_client.describe_clusters.call_count == 5
+        assert ecs_client.get_paginator.return_value.paginate.call_count == 2
+
+    @pytest.mark.usefixtures("cache")
+    def test_per_operation_ttl(self, ecs_client):
+        with settings(ttls={"ClusterManager.get": 0}):
+            Cluster.objects.get("prod")
+            Cluster.objects.get("prod")
+            Cluster.objects.list()
+            Cluster.objects.list()
+
+        # Two gets, and one listing that hydrates the ARNs
+        assert ecs_client.describe_clusters.call_count == 3
+        assert ecs_client.get_paginator.return_value.paginate.call_count == 1
+
+    @pytest.mark.usefixtures("cache")
+    def test_expired_entries_refetched(self, ecs_client):
+        with settings(ttl_seconds=-1):
+            Cluster.objects.get("prod")
+        with settings(ttls={"ecs": 1e-9}):
+            Cluster.objects.get("prod")
+            Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 3
+
+    def test_lru_bound(self, ecs_client, cache):
+        cache.max_size = 1
+        Cluster.objects.get("prod")
+        Cluster.objects.get("dev")
+        Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 3
+        assert cache.stats().evictions == 2
+
+    def test_sqlite_shared_between_instances(self, ecs_client, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        set_response_cache(SQLiteCache(path))
+        try:
+            Cluster.objects.get("prod")
+            set_response_cache(SQLiteCache(path))
+            cluster = Cluster.objects.get("prod")
+        finally:
+            set_response_cache(None)
+
+        assert cluster.clusterArn == cluster_arn("prod")
+        assert ecs_client.describe_clusters.call_count == 1
+
+    @pytest.mark.usefixtures("ecs_client")
+    def test_sqlite_stores_json(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        set_response_cache(SQLiteCache(path))
+        try:
+            Cluster.objects.get("prod")
+        finally:
+            set_response_cache(None)
+
+        (value,) = sqlite3.connect(path).execute("SELECT value FROM entries").fetchone()
+        assert '"clusterName": "prod"' in value
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_sqlite_never_unpickles(self, ecs_client, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        set_response_cache(SQLiteCache(path))
+        try:
+            Cluster.objects.get("prod")
+            with sqlite3.connect(path) as connection:
+                connection.execute(
+                    "UPDATE entries SET value = ?",
+                    (pickle.dumps(Cluster(clusterName="evil")),),
+                )
+            with patch("pickle.loads") as loads, patch("pickle.Unpickler") as unpickler:
+                cluster = Cluster.objects.get("prod")
+        finally:
+            set_response_cache(None)
+
+        loads.assert_not_called()
+        unpickler.assert_not_called()
+        assert cluster.clusterName == "prod"
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_sqlite_refuses_writable_file(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        path.touch()
+        path.chmod(0o620)
+
+        with pytest.raises(PermissionError, match="another user"):
+            SQLiteCache(path)
+
+    @pytest.mark.usefixtures("cache")
+    def test_credentials_read_once_per_session(self, ecs_client):
+        session = boto3.Session(region_name="us-west-2")
+        objects = Cluster.objects.using(session)
+        with (
+            patch.object(session, "client", return_value=ecs_client),
+            patch.object(session, "get_credentials") as get_credentials,
+        ):
+            objects.get("prod")
+            objects.get("dev")
+            objects.list()
+
+        assert get_credentials.call_count == 1
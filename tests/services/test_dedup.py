@@ -0,0 +1,151 @@
+"""Tests for interning strings and sharing frozen models in responses."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from botocraft.config import ResponseSettings
+from botocraft.services.dedup import deduplicate
+from botocraft.services.ec2 import DescribeInstancesResult
+from botocraft.services.ecs import DescribeServicesResponse
+from botocraft.services.trusted import construct, parse
+
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+INTERN_FIELDS = ResponseSettings().intern_fields
+
+
+def new(value: str) -> str:
+    """Return a new string object, as botocore makes for each response."""
+    return value.encode().decode()
+
+
+def instance(index: int) -> dict:
+    return {
+        "InstanceId": f"i-{index}",
+        "InstanceType": new("t3.micro"),
+        "State": {"Code": 16, "Name": new("running")},
+        "Placement": {"AvailabilityZone": new("us-west-2a")},
+        "Tags": [{"Key": new("Name"), "Value": f"web-{index}"}],
+    }
+
+
+def reservations() -> dict:
+    return {"Reservations": [{"Instances": [instance(1), instance(2)]}]}
+
+
+def deployment() -> dict:
+    return {"id": "ecs-svc/1", "status": "PRIMARY", "createdAt": CREATED_AT}
+
+
+def services() -> dict:
+    return {
+        "services": [
+            {
+                "serviceName": f"web-{index}",
+                "deployments": [deployment()],
+                "tags": [{"key": "team", "value": "platform"}],
+            }
+            for index in range(2)
+        ]
+    }
+
+
+class TestDeduplicate:
+    def test_interns_named_and_enum_fields(self) -> None:
+        result = deduplicate(
+            construct(DescribeInstancesResult, reservations()), INTERN_FIELDS
+        )
+
+        first, second = result.Reservations[0].Instances
+        assert first.InstanceType is second.InstanceType
+        assert first.State.Name is second.State.Name
+        assert first.Placement.AvailabilityZone is second.Placement.AvailabilityZone
+        assert first.Tags[0].Key is second.Tags[0].Key
+
+    def test_leaves_other_fields(self) -> None:
+        result = deduplicate(
+            construct(DescribeInstancesResult, reservations()), INTERN_FIELDS
+        )
+
+        first = result.Reservations[0].Instances[0]
+        assert first.InstanceId == "i-1"
+        assert first.Tags[0].Value == "web-1"
+
+    def test_shares_equal_frozen_models(self) -> None:
+        result = deduplicate(construct(DescribeServicesResponse, services()), [])
+
+        first, second = result.services
+        assert first.deployments[0] is second.deployments[0]
+
+    def test_keeps_unequal_frozen_models(self) -> None:
+        data = services()
+        data["services"][1]["deployments"][0]["status"] = "ACTIVE"
+
+        result = deduplicate(construct(DescribeServicesResponse, data), [])
+
+        first, second = result.services
+        assert first.deployments[0].status == "PRIMARY"
+        assert second.deployments[0].status == "ACTIVE"
+
+    def test_keeps_frozen_models_with_different_extras(self) -> None:
+        data = {"services": [*services()["services"], *services()["services"][:1]]}
+        data["services"][0]["deployments"][0]["extra1"] = 1
+        data["services"][1]["deployments"][0]["extra1"] = 2
+
+        result = deduplicate(construct(DescribeServicesResponse, data), [])
+
+        dumped = [
+            service.deployments[0].model_dump(exclude_unset=True)
+            for service in result.services
+        ]
+        assert [deployment.get("extra1") for deployment in dumped] == [1, 2, None]
+
+    def test_keeps_frozen_models_with_different_fields_set(self) -> None:
+        data = services()
+        data["services"][1]["deployments"][0]["taskDefinition"] = None
+
+        result = deduplicate(construct(DescribeServicesResponse, data), [])
+
+        first, second = result.services
+        assert first.deployments[0] is not second.deployments[0]
+        assert "taskDefinition" in second.deployments[0].model_fields_set
+
+    def test_does_not_share_mutable_models(self) -> None:
+        result = deduplicate(construct(DescribeServicesResponse, services()), [])
+
+        first, second = result.services
+        assert first.Tags[0] == second.Tags[0]
+        assert first.Tags[0] is not second.Tags[0]
+
+
+class TestParse:
+    def test_off_by_default(self) -> None:
+        result = parse(DescribeServicesResponse, services(), validate=False)
+
+        first, second = result.services
+        assert first.deployments[0] is not second.deployments[0]
+
+    def test_deduplicates_when_configured(self) -> None:
+        with patch(
+            "botocraft.services.trusted._settings",
+            return_value=ResponseSettings(deduplicate=True),
+        ):
+            for validate in (True, False):
+                result = parse(
+                    DescribeInstancesResult, reservations(), validate=validate
+                )
+
+                first, second = result.Reservations[0].Instances
+                assert first.InstanceType is second.InstanceType
+
+    def test_skips_lazy_fields(self) -> None:
+        with patch(
+            "botocraft.services.trusted._settings",
+            return_value=ResponseSettings(deduplicate=True, lazy=True),
+        ):
+            result = parse(DescribeInstancesResult, reservations())
+
+        first, second = result.Reservations[0].Instances
+        assert first.InstanceType == second.InstanceType == "t3.micro"
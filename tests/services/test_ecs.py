@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from botocraft.services.ecs import (
     CapacityProvider,
     CapacityProviderManager,
@@ -1271,3 +1273,45 @@ class TestECSRelations:
         revision_manager.list.assert_called_once_with(
             serviceRevisionArns=["revision-arn-1", "revision-arn-2"]
         )
+
+
+class TestSessionBinding:
+    CLUSTER_ARN = "arn:aws:ecs:us-west-2:123456789012:cluster/prod"
+
+    @pytest.fixture(autouse=True)
+    def _responses(self, ecs_responses):
+        ecs_responses.update(
+            {
+                "DescribeClusters": (
+                    200,
+                    {
+                        "clusters": [
+                            {"clusterArn": self.CLUSTER_ARN, "clusterName": "prod"}
+                        ]
+                    },
+                ),
+                "ListClusters": (200, {"clusterArns": [self.CLUSTER_ARN]}),
+            }
+        )
+
+    def test_models_built_with_manager_session(self):
+        cluster = Cluster.objects.get("prod")
+
+        assert cluster.session is Cluster.objects.session
+
+    def test_paginated_models_built_with_manager_session(self):
+        clusters = Cluster.objects.list()
+
+        assert [cluster.session for cluster in clusters] == [Cluster.objects.session]
+
+    def test_models_built_outside_managers_have_no_session(self):
+        assert Cluster(clusterName="prod").session is None
+
+    def test_set_session_on_frozen_model(self):
+        session = MagicMock()
+        revision = ServiceRevision(serviceRevisionArn="revision-arn")
+
+        revision.set_session(session)
+
+        assert revision.session is session
+        assert ServiceRevision.model_config["frozen"] is True
@@ -0,0 +1,160 @@
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+
+from botocraft.services.ecs import Cluster, Task
+from botocraft.services.identity import (
+    IdentityMap,
+    current_identity_map,
+    identity_map,
+)
+from botocraft.services.prefetch import prefetch_related_objects
+
+TASK_COUNT = 1000
+
+
+def cluster_arn(name: str) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/{name}"
+
+
+def describe_clusters(clusters, **_):
+    return {
+        "clusters": [
+            {
+                "clusterArn": cluster
+                if cluster.startswith("arn:")
+                else cluster_arn(cluster),
+                "clusterName": cluster.rsplit("/", 1)[-1],
+            }
+            for cluster in clusters
+        ]
+    }
+
+
+def make_tasks(count: int = TASK_COUNT) -> list[Task]:
+    return [
+        Task(
+            taskArn=f"arn:aws:ecs:us-west-2:123456789012:task/prod/{index}",
+            clusterArn=cluster_arn("prod"),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def ecs_client():
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    client.delete_cluster.return_value = {"cluster": {"clusterName": "prod"}}
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestIdentityMap:
+    def test_off_by_default(self, ecs_client):
+        assert current_identity_map() is None
+
+        Cluster.objects.get("prod")
+        Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_get_described_once(self, ecs_client):
+        with identity_map() as mapping:
+            first = Cluster.objects.get("prod")
+            second = Cluster.objects.get(cluster="prod")
+
+        assert first is second
+        assert ecs_client.describe_clusters.call_count == 1
+        assert mapping.stats().hits == 1
+
+    def test_get_by_arn_after_get_by_name(self, ecs_client):
+        with identity_map():
+            by_name = Cluster.objects.get("prod")
+            by_arn = Cluster.objects.get(cluster_arn("prod"))
+
+        assert by_name is by_arn
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_relationships_share_one_fetch(self, ecs_client):
+        with identity_map():
+            clusters = {id(task.cluster) for task in make_tasks()}
+
+        assert len(clusters) == 1
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_prefetch_consults_identity_map(self, ecs_client):
+        with identity_map():
+            cluster = Cluster.objects.get(cluster_arn("prod"))
+            tasks = make_tasks(10)
+            prefetch_related_objects(tasks, "cluster")
+
+        assert all(task.cluster is cluster for task in tasks)
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_scoped_to_block(self, ecs_client):
+        with identity_map():
+            Cluster.objects.get("prod")
+        Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_separate_per_session(self, ecs_client):
+        other = boto3.session.Session(region_name="us-east-1")
+        with (
+            patch.object(other, "client", return_value=ecs_client),
+            identity_map(),
+        ):
+            default = Cluster.objects.get("prod")
+            scoped = Cluster.objects.using(other).get("prod")
+
+        assert default is not scoped
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_ttl_expires_entries(self, ecs_client):
+        with identity_map(ttl_seconds=0):
+            Cluster.objects.get("prod")
+            Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_lru_bound(self, ecs_client):
+        with identity_map(max_size=2) as mapping:
+            Cluster.objects.get("a")
+            Cluster.objects.get("b")
+            Cluster.objects.get("c")
+            Cluster.objects.get("a")
+
+        assert len(mapping) <= 2
+        assert mapping.stats().evictions > 0
+        assert ecs_client.describe_clusters.call_count == 4
+
+    def test_writes_invalidate(self, ecs_client):
+        with identity_map():
+            Cluster.objects.get("prod")
+            Cluster.objects.delete("prod")
+            Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_missing_not_remembered(self, ecs_client):
+        ecs_client.describe_clusters.side_effect = None
+        ecs_client.describe_clusters.return_value = {"clusters": []}
+        with identity_map() as mapping:
+            assert Cluster.objects.get("nope") is None
+            assert Cluster.objects.get("nope") is None
+
+        assert len(mapping) == 0
+
+    def test_enabled_by_settings(self, ecs_client):
+        settings = MagicMock(enabled=True, ttl_seconds=60.0, max_size=10)
+        with (
+            patch("botocraft.services.identity._settings", return_value=settings),
+            patch("botocraft.services.identity._DEFAULT_MAP", None),
+        ):
+            assert isinstance(current_identity_map(), IdentityMap)
+            Cluster.objects.get("prod")
+            Cluster.objects.get("prod")
+
+        assert ecs_client.describe_clusters.call_count == 1
@@ -0,0 +1,66 @@
+"""Tests for importing names from ``botocraft.services`` lazily."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import botocraft.services
+from botocraft.services import sqs
+from botocraft.services._index import MODULES, NAMES
+
+
+def imported_services(statement: str) -> list[str]:
+    """Return the service modules a fresh interpreter imports to run ``statement``."""
+    script = (
+        f"import sys\n{statement}\n"
+        f"print(' '.join(m for m in {list(MODULES)!r} "
+        "if 'botocraft.services.' + m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+def test_name_is_the_service_module_attribute() -> None:
+    assert botocraft.services.Queue is sqs.Queue
+    assert botocraft.services.QueueManager is sqs.QueueManager
+
+
+def test_shared_names_come_from_their_defining_module() -> None:
+    assert NAMES["Tag"] == "botocraft.services.common"
+    assert botocraft.services.Tag is sqs.Tag
+
+
+def test_submodules_are_attributes() -> None:
+    assert botocraft.services.sqs is sqs
+
+
+def test_unknown_name() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        botocraft.services.Nope  # noqa: B018
+
+
+def test_dir_lists_every_name() -> None:
+    assert set(NAMES) <= set(dir(botocraft.services))
+    assert set(botocraft.services.__all__) == set(NAMES)
+
+
+def test_importing_the_package_imports_no_services() -> None:
+    assert imported_services("import botocraft.services") == []
+
+
+def test_importing_a_name_imports_only_its_service() -> None:
+    assert imported_services("from botocraft.services import Queue") == ["sqs"]
+
+
+def test_star_import_imports_every_service() -> None:
+    imported = imported_services("from botocraft.services import *")
+
+    assert sorted(imported) == sorted(MODULES)
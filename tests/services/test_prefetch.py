@@ -0,0 +1,181 @@
+from functools import cached_property
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from botocraft.services.ecs import (
+    Cluster,
+    ClusterManager,
+    PrimaryBoto3ModelQuerySet,
+    Service,
+)
+from botocraft.services.prefetch import (
+    RECORDED_LOOKUPS,
+    LookupRecorder,
+    prefetch_related_objects,
+)
+
+SERVICE_COUNT = 300
+CLUSTER_COUNT = 4
+
+
+def cluster_arn(index: int) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/cluster-{index}"
+
+
+def task_definition_arn(index: int) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:task-definition/app-{index}:1"
+
+
+def make_services() -> list[Service]:
+    return [
+        Service(
+            serviceName=f"service-{index}",
+            serviceArn=f"arn:aws:ecs:us-west-2:123456789012:service/service-{index}",
+            clusterArn=cluster_arn(index % CLUSTER_COUNT),
+            taskDefinition=task_definition_arn(index % 2),
+            desiredCount=1,
+            launchType="FARGATE",
+            schedulingStrategy="REPLICA",
+        )
+        for index in range(SERVICE_COUNT)
+    ]
+
+
+def describe_clusters(clusters, **_):
+    return {
+        "clusters": [
+            {"clusterArn": arn, "clusterName": arn.rsplit("/", 1)[-1]}
+            for arn in clusters
+            if not arn.endswith("missing")
+        ]
+    }
+
+
+def describe_task_definition(**kwargs):
+    arn = kwargs["taskDefinition"]
+    family = arn.rsplit("/", 1)[-1].split(":")[0]
+    return {
+        "taskDefinition": {
+            "taskDefinitionArn": arn,
+            "family": family,
+            "containerDefinitions": [],
+        }
+    }
+
+
+@pytest.fixture
+def ecs_client():
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    client.describe_task_definition.side_effect = describe_task_definition
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestPrefetchRelated:
+    def test_get_lookups_batched_into_get_many(self, ecs_client):
+        services = PrimaryBoto3ModelQuerySet(make_services()).prefetch_related(
+            "cluster"
+        )
+
+        clusters = {service.serviceName: service.cluster for service in services}
+
+        assert ecs_client.describe_clusters.call_count == 1
+        requested = ecs_client.describe_clusters.call_args.kwargs["clusters"]
+        assert sorted(requested) == [cluster_arn(i) for i in range(CLUSTER_COUNT)]
+        assert isinstance(clusters["service-5"], Cluster)
+        assert clusters["service-5"].clusterArn == cluster_arn(1)
+        assert clusters["service-1"] is clusters["service-5"]
+
+    def test_distinct_lookups_made_once(self, ecs_client):
+        services = make_services()
+
+        prefetch_related_objects(services, "task_definition")
+        arns = {service.task_definition.taskDefinitionArn for service in services}
+
+        assert ecs_client.describe_task_definition.call_count == len(arns) == 2
+
+    def test_several_relationships(self, ecs_client):
+        services = PrimaryBoto3ModelQuerySet(make_services()).prefetch_related(
+            "cluster", "task_definition"
+        )
+
+        assert all(service.cluster and service.task_definition for service in services)
+        assert ecs_client.describe_clusters.call_count == 1
+        assert ecs_client.describe_task_definition.call_count == 2
+
+    def test_missing_from_get_many_falls_back_to_get(self, ecs_client):
+        services = make_services()[:2]
+        services[0].clusterArn = cluster_arn(0) + "-missing"
+
+        prefetch_related_objects(services, "cluster")
+
+        assert services[0].cluster is None
+        assert services[1].cluster.clusterArn == cluster_arn(1)
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_prefetch_is_lazy(self, ecs_client):
+        queryset = PrimaryBoto3ModelQuerySet(make_services())
+        prefetched = queryset.prefetch_related("cluster")
+
+        assert ecs_client.describe_clusters.call_count == 0
+        assert prefetched.first().cluster is not None
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_not_a_relationship(self):
+        with pytest.raises(ValueError, match="not a relationship"):
+            prefetch_related_objects(make_services()[:1], "serviceName")
+
+    def test_order_by_relationship_uses_batch(self, ecs_client):
+        ordered = PrimaryBoto3ModelQuerySet(make_services()).order_by(
+            "-cluster__clusterName", "serviceName"
+        )
+
+        assert ordered.first().clusterArn == cluster_arn(CLUSTER_COUNT - 1)
+        assert ecs_client.describe_clusters.call_count == 1
+
+    def test_load_errors_are_raised(self, ecs_client):
+        ecs_client.describe_task_definition.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "no"}},
+            "DescribeTaskDefinition",
+        )
+
+        with pytest.raises(ClientError, match="AccessDenied"):
+            prefetch_related_objects(make_services(), "task_definition")
+
+    def test_body_using_the_lookup_is_loaded_for_real(self, ecs_client):
+        class NamedService(Service):
+            @cached_property
+            def cluster_name(self):
+                return (
+                    self.relationship_manager(Cluster)
+                    .get(cluster=self.clusterArn)
+                    .clusterName
+                )
+
+        services = [
+            NamedService(**s.model_dump(exclude_none=True)) for s in make_services()[:3]
+        ]
+
+        prefetch_related_objects(services, "cluster_name")
+
+        assert [vars(s)["cluster_name"] for s in services] == [
+            "cluster-0",
+            "cluster-1",
+            "cluster-2",
+        ]
+        assert ecs_client.describe_clusters.call_count == 3
+
+    def test_using_is_not_recorded(self):
+        recorded = []
+        token = RECORDED_LOOKUPS.set(recorded)
+        try:
+            manager = Cluster.objects.using(MagicMock())
+            relationship = make_services()[0].relationship_manager(Cluster)
+        finally:
+            RECORDED_LOOKUPS.reset(token)
+
+        assert isinstance(manager, ClusterManager)
+        assert isinstance(relationship, LookupRecorder)
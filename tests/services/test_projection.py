@@ -0,0 +1,180 @@
+"""Tests for ``only=`` projections and ``raw=True`` responses."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+from botocraft.services.cache import MemoryCache, set_response_cache
+from botocraft.services.ec2 import Instance
+from botocraft.services.ecs import Cluster
+from botocraft.services.identity import identity_map
+from botocraft.services.projection import projection
+
+RESERVATIONS = {
+    "Reservations": [
+        {
+            "ReservationId": "r-1",
+            "Instances": [
+                {"InstanceId": "i-1", "State": {"Code": 16, "Name": "running"}},
+                {"InstanceId": "i-2", "State": {"Code": 80, "Name": "stopped"}},
+            ],
+        }
+    ]
+}
+
+
+def cluster_arn(name: str) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/{name}"
+
+
+def describe_clusters(clusters, **_):
+    return {
+        "clusters": [
+            {
+                "clusterArn": cluster_arn(name),
+                "clusterName": name.rsplit("/", 1)[-1],
+                "status": "ACTIVE",
+                "tags": [{"key": "team", "value": "platform"}],
+            }
+            for name in clusters
+        ]
+    }
+
+
+@pytest.fixture
+def ecs_client():
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    client.get_paginator.return_value.paginate.return_value = [
+        {"clusterArns": [cluster_arn("prod"), cluster_arn("dev")]}
+    ]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def ec2_client():
+    client = MagicMock()
+    client.describe_instances.return_value = RESERVATIONS
+    client.get_paginator.return_value.paginate.return_value = [RESERVATIONS]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestProjection:
+    def test_builds_named_tuple_of_fields(self):
+        build = projection(Instance, ("InstanceId", "State__Name"))
+
+        row = build({"InstanceId": "i-1", "State": {"Code": 16, "Name": "running"}})
+
+        assert row.InstanceId == "i-1"
+        assert row.State.Name == "running"
+        assert row.State._fields == ("Name",)
+
+    def test_whole_field_is_built_as_model(self):
+        row = projection(Instance, ("Tags",))({"Tags": [{"Key": "a", "Value": "b"}]})
+
+        assert row.Tags[0].Key == "a"
+        assert row.Tags[0].Value == "b"
+
+    def test_missing_fields_are_none(self):
+        assert projection(Instance, ("InstanceId", "State__Name"))({}) == (None, None)
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="no field 'Nope'"):
+            projection(Instance, ("Nope",))
+
+    def test_path_into_non_model_field(self):
+        with pytest.raises(ValueError, match="holds no model"):
+            projection(Instance, ("InstanceId__foo",))
+
+
+@pytest.mark.usefixtures("ecs_client")
+class TestManagerMethods:
+    def test_get_only(self):
+        cluster = Cluster.objects.get("prod", only=["clusterName", "Tags__key"])
+
+        assert cluster.clusterName == "prod"
+        assert [tag.key for tag in cluster.Tags] == ["team"]
+        assert cluster._fields == ("clusterName", "Tags")
+
+    def test_get_raw(self):
+        cluster = Cluster.objects.get("prod", raw=True)
+
+        assert cluster == describe_clusters(["prod"])["clusters"][0]
+
+    def test_list_only_is_a_queryset(self):
+        clusters = Cluster.objects.list(only=["clusterName", "status"])
+
+        assert isinstance(clusters, PrimaryBoto3ModelQuerySet)
+        assert [c.clusterName for c in clusters.filter(status="ACTIVE")] == [
+            "prod",
+            "dev",
+        ]
+        assert [c.clusterName for c in clusters.order_by("clusterName")] == [
+            "dev",
+            "prod",
+        ]
+
+    def test_list_raw(self):
+        clusters = Cluster.objects.list(raw=True)
+
+        assert [c["clusterName"] for c in clusters.filter(clusterName="dev")] == ["dev"]
+
+    def test_only_and_raw_together(self):
+        with pytest.raises(ValueError, match="only or raw"):
+            Cluster.objects.get("prod", only=["clusterName"], raw=True)
+
+    def test_options_do_not_leak(self):
+        Cluster.objects.get("prod", raw=True)
+
+        assert isinstance(Cluster.objects.get("prod"), Cluster)
+
+    def test_skips_identity_map(self, ecs_client):
+        with identity_map():
+            model = Cluster.objects.get("prod")
+            row = Cluster.objects.get("prod", only=["clusterName"])
+
+            assert Cluster.objects.get("prod") is model
+        assert isinstance(row, tuple)
+        assert ecs_client.describe_clusters.call_count == 2
+
+    def test_skips_response_cache(self, ecs_client):
+        set_response_cache(MemoryCache())
+        try:
+            with patch(
+                "botocraft.services.cache._settings",
+                return_value=MagicMock(ttl_seconds=30.0, ttls={}, max_size=1024),
+            ):
+                Cluster.objects.get("prod")
+                raw = Cluster.objects.get("prod", raw=True)
+                Cluster.objects.get("prod")
+        finally:
+            set_response_cache(None)
+        assert isinstance(raw, dict)
+        assert ecs_client.describe_clusters.call_count == 2
+
+
+@pytest.mark.usefixtures("ec2_client")
+class TestInstances:
+    """Instances are unwrapped from reservations, projected or not."""
+
+    def test_list_only(self):
+        instances = Instance.objects.list(only=["InstanceId", "State__Name"])
+
+        assert [i.InstanceId for i in instances.filter(State__Name="running")] == [
+            "i-1"
+        ]
+
+    def test_list_raw(self):
+        instances = Instance.objects.list(raw=True)
+
+        assert [i["InstanceId"] for i in instances] == ["i-1", "i-2"]
+
+    def test_get_only(self):
+        instance = Instance.objects.get("i-1", only=["InstanceId"])
+
+        assert instance == ("i-1",)
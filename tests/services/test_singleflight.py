@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.ecs import Cluster
+from botocraft.services.singleflight import SingleFlight, flights
+
+WORKERS = 8
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+@pytest.fixture(autouse=True)
+def _reset_flights():
+    flights.reset()
+    yield
+    flights.reset()
+
+
+@pytest.fixture
+def ecs_client():
+    def describe_clusters(clusters, **_):
+        # Hold the first call open until every other worker is waiting on it
+        wait_for(lambda: flights.stats().coalesced == WORKERS - 1)
+        return {
+            "clusters": [
+                {"clusterArn": f"arn:{name}", "clusterName": name} for name in clusters
+            ]
+        }
+
+    client = MagicMock()
+    client.describe_clusters.side_effect = describe_clusters
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestSingleFlight:
+    def test_concurrent_gets_share_one_call(self, ecs_client):
+        with ThreadPoolExecutor(WORKERS) as pool:
+            clusters = list(
+                pool.map(lambda _: Cluster.objects.get("prod"), range(WORKERS))
+            )
+
+        assert ecs_client.describe_clusters.call_count == 1
+        assert all(cluster is clusters[0] for cluster in clusters)
+        stats = flights.stats()
+        assert (stats.calls, stats.coalesced, stats.in_flight) == (1, WORKERS - 1, 0)
+
+    def test_sequential_calls_not_coalesced(self):
+        client = MagicMock()
+        client.describe_clusters.return_value = {"clusters": []}
+        with patch("boto3.client", return_value=client):
+            Cluster.objects.get("prod")
+            Cluster.objects.get("prod")
+
+        assert client.describe_clusters.call_count == 2
+        assert flights.stats().coalesced == 0
+
+    def test_different_arguments_not_coalesced(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def call(value):
+            release.wait(5)
+            return value
+
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(flight.do, "a", lambda: call("a"))
+            second = pool.submit(flight.do, "b", lambda: call("b"))
+            wait_for(lambda: flight.stats().in_flight == 2)
+            release.set()
+
+        assert (first.result(), second.result()) == ("a", "b")
+        assert flight.stats().coalesced == 0
+
+    def test_errors_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        error = RuntimeError("throttled")
+
+        def call():
+            release.wait(5)
+            raise error
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(flight.do, "key", call)
+            wait_for(lambda: flight.stats().in_flight == 1)
+            waiter = pool.submit(flight.do, "key", call)
+            wait_for(lambda: flight.stats().coalesced == 1)
+            release.set()
+
+        assert leader.exception() is error
+        assert waiter.exception() is error
+        assert flight.stats().in_flight == 0
+
+    def test_reentrant_call_not_deadlocked(self):
+        flight = SingleFlight()
+
+        def outer():
+            return flight.do("key", lambda: "inner")
+
+        assert flight.do("key", outer) == "inner"
@@ -0,0 +1,158 @@
+"""Tests for generated summary classes and ``summary=True`` responses."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+from botocraft.services.s3 import S3Object, S3ObjectSummary
+from botocraft.services.ssm import (
+    Parameter,
+    ParameterMetadata,
+    ParameterMetadataSummary,
+)
+from botocraft.services.summary import SummaryColumns, summary_class
+
+MODIFIED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+CONTENTS = [
+    {
+        "Key": f"logs/{index}.gz",
+        "LastModified": MODIFIED,
+        "ETag": f'"{index:032x}"',
+        "Size": index * 1024,
+        "StorageClass": "STANDARD",
+        "Owner": {"ID": "owner"},
+    }
+    for index in range(3)
+]
+
+
+@pytest.fixture
+def s3_client():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = lambda **_: [
+        {"Contents": [dict(item) for item in CONTENTS]}
+    ]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def ssm_client():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {"Name": "/app/db", "Type": "SecureString", "Version": 3},
+                {"Name": "/app/url", "Type": "String", "Version": 1},
+            ]
+        }
+    ]
+    with patch("boto3.client", return_value=client):
+        yield client
+
+
+class TestSummary:
+    def test_is_registered_for_its_model(self):
+        assert summary_class(S3Object) is S3ObjectSummary
+        assert summary_class(ParameterMetadata) is ParameterMetadataSummary
+        assert summary_class(Parameter) is None
+
+    def test_has_slots(self):
+        summary = S3ObjectSummary(Key="a")
+
+        assert not hasattr(summary, "__dict__")
+
+    def test_from_response_keeps_summary_fields(self):
+        summary = S3ObjectSummary.from_response(CONTENTS[1])
+
+        assert summary == S3ObjectSummary(
+            Key="logs/1.gz",
+            LastModified=MODIFIED,
+            ETag=f'"{1:032x}"',
+            Size=1024,
+            StorageClass="STANDARD",
+        )
+
+    def test_to_model(self):
+        model = S3ObjectSummary.from_response(CONTENTS[1]).to_model()
+
+        assert isinstance(model, S3Object)
+        assert model.Key == "logs/1.gz"
+        assert model.Size == 1024
+        assert model.Owner is None
+
+
+class TestColumns:
+    def test_stores_rows_by_column(self):
+        columns = S3ObjectSummary.columns(CONTENTS)
+
+        assert len(columns) == 3
+        assert columns.column("Size") == [0, 1024, 2048]
+
+    def test_rows_are_summaries(self):
+        columns = S3ObjectSummary.columns(CONTENTS)
+
+        assert columns[1] == S3ObjectSummary.from_response(CONTENTS[1])
+        assert list(columns) == [S3ObjectSummary.from_response(c) for c in CONTENTS]
+
+    def test_accepts_summaries(self):
+        rows = [S3ObjectSummary.from_response(c) for c in CONTENTS]
+
+        assert list(SummaryColumns(S3ObjectSummary, rows)) == rows
+
+    def test_slice(self):
+        columns = S3ObjectSummary.columns(CONTENTS)[1:]
+
+        assert isinstance(columns, SummaryColumns)
+        assert columns.column("Key") == ["logs/1.gz", "logs/2.gz"]
+
+    def test_to_models(self):
+        models = list(S3ObjectSummary.columns(CONTENTS).to_models())
+
+        assert [model.Key for model in models] == [c["Key"] for c in CONTENTS]
+
+
+class TestManagerMethods:
+    @pytest.mark.usefixtures("s3_client")
+    def test_list_summary(self):
+        objects = S3Object.objects.list(Bucket="logs", summary=True)
+
+        assert isinstance(objects, PrimaryBoto3ModelQuerySet)
+        assert all(isinstance(o, S3ObjectSummary) for o in objects)
+        assert [o.Key for o in objects.filter(Size__gt=0)] == [
+            "logs/1.gz",
+            "logs/2.gz",
+        ]
+        assert {o.BucketName for o in objects} == {"logs"}
+
+    @pytest.mark.usefixtures("s3_client")
+    def test_list_raw_gets_bucket_name(self):
+        objects = S3Object.objects.list(Bucket="logs", raw=True)
+
+        assert {o["BucketName"] for o in objects} == {"logs"}
+
+    @pytest.mark.usefixtures("ssm_client")
+    def test_list_summary_of_listed_model(self):
+        parameters = Parameter.objects.list(summary=True)
+
+        assert [p.Name for p in parameters.order_by("Version")] == [
+            "/app/url",
+            "/app/db",
+        ]
+        assert isinstance(parameters.first(), ParameterMetadataSummary)
+
+    @pytest.mark.usefixtures("s3_client")
+    def test_summary_with_only(self):
+        with pytest.raises(ValueError, match="summary without only or raw"):
+            S3Object.objects.list(Bucket="logs", summary=True, only=["Key"])
+
+    @pytest.mark.usefixtures("s3_client")
+    def test_options_do_not_leak(self):
+        S3Object.objects.list(Bucket="logs", summary=True)
+
+        assert isinstance(S3Object.objects.list(Bucket="logs").first(), S3Object)
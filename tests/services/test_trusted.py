@@ -0,0 +1,290 @@
+"""Tests for building models from AWS responses without validation."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from botocraft.config import ResponseSettings
+from botocraft.services.abstract import _MODEL_SESSION
+from botocraft.services.cache import MemoryCache, set_response_cache
+from botocraft.services.ec2 import DescribeInstancesResult
+from botocraft.services.ecs import (
+    Cluster,
+    DescribeServiceRevisionsResponse,
+    DescribeServicesResponse,
+    ECSTag,
+    Service,
+)
+from botocraft.services.identity import identity_map
+from botocraft.services.singleflight import flights
+from botocraft.services.trusted import PENDING, construct
+
+CLUSTER_ARN = "arn:aws:ecs:us-west-2:123456789012:cluster/prod"
+
+INSTANCES = {
+    "Reservations": [
+        {
+            "ReservationId": "r-1",
+            "Instances": [
+                {
+                    "InstanceId": "i-1",
+                    "LaunchTime": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    "State": {"Code": 16, "Name": "running"},
+                    "SecurityGroups": [{"GroupId": "sg-1", "GroupName": "web"}],
+                    "Tags": [{"Key": "Name", "Value": "web"}],
+                }
+            ],
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+SERVICES = {
+    "services": [
+        {
+            "serviceName": "web",
+            "serviceArn": "arn:aws:ecs:us-west-2:123456789012:service/prod/web",
+            "clusterArn": CLUSTER_ARN,
+            "taskDefinition": "web:1",
+            "desiredCount": 2,
+            "launchType": "FARGATE",
+            "schedulingStrategy": "REPLICA",
+            "deployments": [{"id": "ecs-svc/1", "status": "PRIMARY"}],
+            "tags": [{"key": "team", "value": "platform"}],
+        }
+    ],
+    "failures": [],
+}
+
+
+def describe_clusters(name: object) -> tuple[int, dict]:
+    return 200, {"clusters": [{"clusterArn": CLUSTER_ARN, "clusterName": name}]}
+
+
+class TestConstruct:
+    """Verify trusted construction builds the same models as validation."""
+
+    @pytest.mark.parametrize(
+        ("response_class", "response"),
+        [
+            (DescribeInstancesResult, INSTANCES),
+            (DescribeServicesResponse, SERVICES),
+        ],
+    )
+    def test_matches_validated_models(self, response_class, response) -> None:
+        trusted = construct(response_class, response)
+
+        assert trusted == response_class(**response)
+
+    def test_builds_nested_models_from_aliased_keys(self) -> None:
+        response = construct(DescribeServicesResponse, SERVICES)
+
+        (service,) = response.services
+        assert service.Tags == [ECSTag(key="team", value="platform")]
+        assert service.deployments[0].status == "PRIMARY"
+
+
+class TestValidateArgument:
+    """Verify how managers choose whether to validate responses."""
+
+    @pytest.fixture(autouse=True)
+    def _responses(self, ecs_responses):
+        ecs_responses["DescribeClusters"] = describe_clusters(123)
+
+    def test_validates_by_default(self) -> None:
+        with pytest.raises(ValidationError):
+            Cluster.objects.get("prod")
+
+    def test_skips_validation_for_one_call(self) -> None:
+        cluster = Cluster.objects.get("prod", validate=False)
+
+        assert cluster.clusterName == 123
+        assert cluster.session is Cluster.objects.session
+
+    def test_skips_validation_when_configured(self) -> None:
+        with patch(
+            "botocraft.services.trusted._settings",
+            return_value=ResponseSettings(validation=False),
+        ):
+            assert Cluster.objects.get("prod").clusterName == 123
+            with pytest.raises(ValidationError):
+                Cluster.objects.get("prod", validate=True)
+
+    def test_accepted_responses_validated_anyway(self, ecs_responses) -> None:
+        ecs_responses["DescribeClusters"] = describe_clusters("prod")
+        with patch("botocraft.services.trusted.construct") as trusted:
+            cluster = Cluster.objects.get("prod", validate=False)
+
+        assert cluster.clusterName == "prod"
+        trusted.assert_not_called()
+
+    def test_identity_map_keeps_unvalidated_models_apart(self) -> None:
+        with identity_map():
+            assert Cluster.objects.get("prod", validate=False).clusterName == 123
+            with pytest.raises(ValidationError):
+                Cluster.objects.get("prod", validate=True)
+            with pytest.raises(ValidationError):
+                Cluster.objects.get("prod")
+
+    def test_cache_keeps_unvalidated_models_apart(self) -> None:
+        set_response_cache(MemoryCache())
+        try:
+            assert Cluster.objects.get("prod", validate=False).clusterName == 123
+            with pytest.raises(ValidationError):
+                Cluster.objects.get("prod", validate=True)
+        finally:
+            set_response_cache(None)
+
+    def test_unvalidated_calls_not_coalesced_with_validated(self) -> None:
+        keys = []
+
+        def do(key, func):
+            keys.append(key)
+            return func()
+
+        with patch.object(flights, "do", side_effect=do):
+            Cluster.objects.get("prod", validate=False)
+            with pytest.raises(ValidationError):
+                Cluster.objects.get("prod", validate=True)
+
+        assert len(keys) == 2
+        assert keys[0] != keys[1]
+
+    def test_user_models_still_validated(self) -> None:
+        with pytest.raises(ValidationError):
+            Cluster(clusterName=123)
+
+
+class TestLazy:
+    """Verify lazily built models behave like models built in full."""
+
+    @pytest.mark.parametrize(
+        ("response_class", "response"),
+        [
+            (DescribeInstancesResult, INSTANCES),
+            (DescribeServicesResponse, SERVICES),
+        ],
+    )
+    def test_same_as_validated(self, response_class, response) -> None:
+        validated = response_class(**response)
+
+        assert construct(response_class, response, lazy=True) == validated
+        assert validated == construct(response_class, response, lazy=True)
+        lazy = construct(response_class, response, lazy=True)
+        assert lazy.model_dump() == validated.model_dump()
+        lazy = construct(response_class, response, lazy=True)
+        assert lazy.model_dump_json() == validated.model_dump_json()
+        lazy = construct(response_class, response, lazy=True)
+        assert pickle.loads(pickle.dumps(lazy)) == validated  # noqa: S301
+        assert copy.deepcopy(construct(response_class, response, lazy=True)) == (
+            validated
+        )
+
+    def test_serialized_in_full_anywhere(self) -> None:
+        class Parent(BaseModel):
+            service: Service
+
+        validated = DescribeServicesResponse(**SERVICES).services[0]
+        expected = validated.model_dump()
+        assert expected["Tags"]
+        assert expected["deployments"]
+
+        def lazy_service() -> Service:
+            return construct(DescribeServicesResponse, SERVICES, lazy=True).services[0]
+
+        assert TypeAdapter(Service).dump_python(lazy_service()) == expected
+        assert TypeAdapter(Service).dump_json(lazy_service()) == (
+            TypeAdapter(Service).dump_json(validated)
+        )
+        assert Parent(service=lazy_service()).model_dump() == {"service": expected}
+        assert Parent.model_construct(service=lazy_service()).model_dump_json() == (
+            Parent(service=validated).model_dump_json()
+        )
+
+    def test_builds_nested_models_on_access(self) -> None:
+        response = construct(DescribeServicesResponse, SERVICES, lazy=True)
+
+        # Only primary models defer their nested models
+        assert PENDING not in response.__dict__
+        (service,) = response.services
+        assert set(service.__dict__[PENDING]) == {"deployments", "Tags"}
+        assert service.Tags == [ECSTag(key="team", value="platform")]
+        assert set(service.__dict__[PENDING]) == {"deployments"}
+
+    def test_assignment_replaces_pending_field(self) -> None:
+        (service,) = construct(DescribeServicesResponse, SERVICES, lazy=True).services
+
+        service.Tags = [ECSTag(key="env", value="prod")]
+
+        assert service.model_dump()["Tags"] == [{"key": "env", "value": "prod"}]
+
+    def test_nested_models_get_the_session(self) -> None:
+        session = object()
+        token = _MODEL_SESSION.set(session)
+        try:
+            response = construct(DescribeServicesResponse, SERVICES, lazy=True)
+        finally:
+            _MODEL_SESSION.reset(token)
+
+        assert response.services[0].deployments[0].session is session
+
+    def test_readonly_models_built_in_full(self) -> None:
+        response = construct(
+            DescribeServiceRevisionsResponse,
+            {
+                "serviceRevisions": [
+                    {
+                        "serviceRevisionArn": "revision-arn",
+                        "containerImages": [{"containerName": "web"}],
+                    }
+                ]
+            },
+            lazy=True,
+        )
+
+        (revision,) = response.serviceRevisions
+        assert PENDING not in revision.__dict__
+        assert revision.containerImages[0].containerName == "web"
+
+
+class TestLazyArgument:
+    """Verify how managers choose whether to build responses lazily."""
+
+    @pytest.fixture(autouse=True)
+    def _responses(self, ecs_responses):
+        ecs_responses["DescribeClusters"] = (
+            200,
+            {
+                "clusters": [
+                    {
+                        "clusterArn": CLUSTER_ARN,
+                        "clusterName": "prod",
+                        "tags": [{"key": "team", "value": "platform"}],
+                    }
+                ]
+            },
+        )
+
+    def test_lazy_for_one_call(self) -> None:
+        cluster = Cluster.objects.get("prod", lazy=True)
+
+        assert PENDING in cluster.__dict__
+        assert cluster == Cluster.objects.get("prod")
+
+    def test_lazy_when_configured(self) -> None:
+        with patch(
+            "botocraft.services.trusted._settings",
+            return_value=ResponseSettings(lazy=True),
+        ):
+            assert PENDING in Cluster.objects.get("prod").__dict__
+            assert PENDING not in Cluster.objects.get("prod", validate=True).__dict__
+
+    def test_validate_and_lazy_conflict(self) -> None:
+        with pytest.raises(ValueError, match="validate or lazy"):
+            Cluster.objects.get("prod", validate=True, lazy=True)
@@ -0,0 +1,56 @@
+import importlib
+
+from botocraft.sync.methods.manager.get_many import GetManyMethodGenerator
+from botocraft.sync.models import BotocraftInterface
+from botocraft.sync.service import ServiceGenerator
+
+
+def build_get_many_method_generator(
+    service_name: str, model_name: str
+) -> GetManyMethodGenerator:
+    interface = BotocraftInterface()
+    interface.load()
+    service = interface.services[service_name]
+    generator = ServiceGenerator(service)
+    manager_def = service.managers[model_name]
+    return GetManyMethodGenerator(
+        generator.manager_generator,
+        model_name,
+        manager_def.methods["get_many"],
+    )
+
+
+def test_get_many_with_batch_size_chunks_the_identifier_list() -> None:
+    generator = build_get_many_method_generator("ecs", "Service")
+
+    assert generator.batch_arg == "services"
+    assert "return self.describe_batched(" in generator.body
+    assert 'batch_arg="services"' in generator.body
+    assert "batch_size=self.get_many_batch_size" in generator.body
+
+
+def test_get_many_without_batch_size_calls_once() -> None:
+    generator = build_get_many_method_generator("ecs", "TaskSet")
+
+    assert "describe_batched" not in generator.body
+    assert "self.client.describe_task_sets(" in generator.body
+
+
+def test_generated_managers_record_get_many_batch_size() -> None:
+    interface = BotocraftInterface()
+    interface.load()
+    checked = 0
+    for service_name, service in interface.services.items():
+        for model_name, manager_def in service.managers.items():
+            get_many = manager_def.methods.get("get_many")
+            if get_many is None or not get_many.batch_size:
+                continue
+            generator = ServiceGenerator(service)
+            module = importlib.import_module(f"botocraft.services.{service_name}")
+            model_def = generator.model_generator.get_model_def(model_name)
+            manager_name = f"{model_def.alternate_name or model_name}Manager"
+            manager_class = getattr(module, manager_name)
+            assert manager_class.get_many_batch_size == get_many.batch_size
+            checked += 1
+
+    assert checked
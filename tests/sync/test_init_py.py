@@ -0,0 +1,27 @@
+from botocraft.sync.models import services_in_init_py, services_index
+
+
+def test_index_finds_every_public_name() -> None:
+    names = services_index(["sqs"])
+
+    assert names["Queue"] == "botocraft.services.sqs"
+    assert names["QueueManager"] == "botocraft.services.sqs"
+    assert not any(name.startswith("_") for name in names)
+
+
+def test_index_prefers_the_defining_module() -> None:
+    names = services_index(["sqs"])
+
+    assert names["Tag"] == "botocraft.services.common"
+    assert names["PrimaryBoto3ModelQuerySet"] == "botocraft.services.abstract"
+
+
+def test_index_imports_other_services_models_from_their_service() -> None:
+    # ``ecs`` imports ``Instance`` from ``ec2`` for its field types
+    assert services_index(["ecs"])["Instance"] == "botocraft.services.ec2"
+
+
+def test_index_is_up_to_date() -> None:
+    from botocraft.services._index import NAMES
+
+    assert services_index(services_in_init_py()) == NAMES
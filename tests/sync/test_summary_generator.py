@@ -0,0 +1,44 @@
+import pytest
+
+from botocraft.sync.models import BotocraftInterface, ModelDefinition
+from botocraft.sync.service import ModelGenerator, ServiceGenerator
+
+
+def build_model_generator(service: str) -> ModelGenerator:
+    interface = BotocraftInterface()
+    interface.load()
+    return ServiceGenerator(interface.services[service]).model_generator
+
+
+def test_summary_is_generated_for_models_listing_summary_fields() -> None:
+    generator = build_model_generator("s3")
+
+    generator.generate_single_model("Object")
+
+    code = generator.summaries["S3ObjectSummary"]
+    assert code.startswith(
+        "@dataclass(slots=True)\nclass S3ObjectSummary(Boto3Summary):"
+    )
+    assert "model_class: ClassVar[ModelType[Boto3Model]] = S3Object" in code
+    assert '    Key: "str | None" = None' in code
+    assert '    Size: "int | None" = None' in code
+    assert '    LastModified: "datetime | None" = None' in code
+    # An extra field, typed by its python_type
+    assert '    BucketName: "str | None" = None' in code
+    assert "from .summary import Boto3Summary" in generator.imports
+
+
+def test_summary_is_not_generated_by_default() -> None:
+    generator = build_model_generator("s3")
+
+    generator.generate_single_model("Bucket")
+
+    assert not generator.summaries
+
+
+def test_summary_field_must_exist() -> None:
+    generator = build_model_generator("ssm")
+    model_def = ModelDefinition(name="ParameterMetadata", summary=["Nope"])
+
+    with pytest.raises(KeyError, match='No field or alias named "Nope"'):
+        generator.generate_summary("ParameterMetadata", "ParameterMetadata", model_def)
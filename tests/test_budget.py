@@ -0,0 +1,173 @@
+"""Tests for call budgets and the pytest plugin."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import warnings
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+import botocraft
+from botocraft.budget import CallBudgetExceededError, CallBudgetWarning
+from botocraft.config import InstrumentationSettings
+from botocraft.services.ecs import Cluster, ClusterManager, TaskSet
+
+CLUSTER_COUNT = 12
+
+
+def cluster_arn(index: int) -> str:
+    return f"arn:aws:ecs:us-west-2:123456789012:cluster/cluster-{index}"
+
+
+def describe_clusters(params):
+    return 200, {
+        "clusters": [
+            {"clusterArn": arn, "clusterName": arn.rsplit("/", 1)[-1]}
+            for arn in params["clusters"]
+        ]
+    }
+
+
+def get_clusters(count: int) -> None:
+    for index in range(count):
+        Cluster.objects.get(cluster_arn(index))
+
+
+def touch_clusters(task_sets: list[TaskSet]) -> None:
+    for task_set in task_sets:
+        _ = task_set.cluster
+
+
+@pytest.fixture(autouse=True)
+def _ecs(ecs_responses):
+    ecs_responses["DescribeClusters"] = describe_clusters
+
+
+class TestCallBudget:
+    """Verify call counting, N+1 detection and reporting."""
+
+    def test_over_budget_raises(self) -> None:
+        with (
+            pytest.raises(CallBudgetExceededError, match="3 AWS calls") as error,
+            botocraft.call_budget(max_calls=2),
+        ):
+            get_clusters(3)
+
+        message = str(error.value)
+        assert "ecs.describe_clusters x3" in message
+        assert "via ClusterManager.get" in message
+        assert "test_budget.py" in message
+
+    def test_within_budget(self) -> None:
+        with botocraft.call_budget(max_calls=2) as budget:
+            Cluster.objects.get(cluster_arn(0))
+            Cluster.objects.get_many(
+                clusters=[cluster_arn(index) for index in range(CLUSTER_COUNT)]
+            )
+
+        assert budget.calls == 2  # noqa: PLR2004
+        assert budget.operations == {"ecs.describe_clusters": 2}
+
+    def test_n_plus_one_names_relationship(self) -> None:
+        task_sets = [TaskSet(clusterArn=cluster_arn(i)) for i in range(CLUSTER_COUNT)]
+
+        with (
+            pytest.raises(CallBudgetExceededError, match="single-item") as error,
+            botocraft.call_budget(max_repeats=10),
+        ):
+            touch_clusters(task_sets)
+
+        assert "from TaskSet.cluster via ClusterManager.get" in str(error.value)
+        assert "test_budget.py" in str(error.value)
+
+    def test_repeats_of_one_lookup_not_n_plus_one(self) -> None:
+        with botocraft.call_budget(max_repeats=1) as budget:
+            for _ in range(3):
+                Cluster.objects.get(cluster_arn(0))
+
+        assert budget.calls == 3  # noqa: PLR2004
+
+    def test_pages_of_a_listing_not_n_plus_one(self, ecs_responses) -> None:
+        def list_clusters(params):
+            page = int(params.get("nextToken", 0))
+            body = {"clusterArns": [cluster_arn(page)]}
+            if page < CLUSTER_COUNT - 1:
+                body["nextToken"] = str(page + 1)
+            return 200, body
+
+        ecs_responses["ListClusters"] = list_clusters
+        with botocraft.call_budget(max_repeats=10) as budget:
+            clusters = Cluster.objects.list()
+
+        assert len(clusters) == CLUSTER_COUNT
+        assert budget.operations["ecs.list_clusters"] == CLUSTER_COUNT
+
+    def test_warn_once(self) -> None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with botocraft.call_budget(max_calls=1, action="warn"):
+                get_clusters(3)
+
+        assert [w.category for w in caught] == [CallBudgetWarning]
+
+    def test_nested_budgets_all_count(self) -> None:
+        with (
+            botocraft.call_budget() as outer,
+            botocraft.call_budget() as inner,
+        ):
+            Cluster.objects.get(cluster_arn(0))
+
+        assert outer.calls == inner.calls == 1
+
+    def test_counts_clients_set_by_hand(self) -> None:
+        manager = ClusterManager()
+        manager.client = boto3.client("ecs")
+
+        with (
+            pytest.raises(CallBudgetExceededError, match="1 AWS calls"),
+            botocraft.call_budget(max_calls=0),
+        ):
+            manager.get(cluster_arn(0))
+
+    def test_refuses_to_count_nothing(self) -> None:
+        with (
+            patch(
+                "botocraft.instrumentation._settings",
+                return_value=InstrumentationSettings(enabled=False),
+            ),
+            pytest.raises(RuntimeError, match=r"instrumentation\.enabled"),
+            botocraft.call_budget(max_calls=0),
+        ):
+            get_clusters(1)
+
+
+class TestPytestPlugin:
+    """Verify the ``call_budget`` fixture and marker."""
+
+    @pytest.mark.call_budget(max_calls=5)
+    def test_marker_sets_limits(self, call_budget) -> None:
+        Cluster.objects.get(cluster_arn(0))
+
+        assert call_budget.max_calls == 5  # noqa: PLR2004
+        assert call_budget.calls == 1
+
+    @pytest.mark.call_budget(max_calls=0)
+    def test_marker_applies_without_fixture(self) -> None:
+        with pytest.raises(CallBudgetExceededError):
+            Cluster.objects.get(cluster_arn(0))
+
+
+def test_importing_botocraft_does_not_import_boto3() -> None:
+    script = (
+        "import sys, botocraft\n"
+        "print(sorted({'boto3', 'botocore', 'botocraft.budget'} & set(sys.modules)))\n"
+        "botocraft.call_budget\n"
+        "print('botocraft.budget' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.split("\n")[:2] == ["[]", "True"]
@@ -0,0 +1,282 @@
+"""Tests for the shared boto3 client and manager pools."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import boto3
+from botocore.config import Config
+
+from botocraft.clients import (
+    ClientPool,
+    ManagerPool,
+    client_pool,
+    default_session,
+    using_session,
+)
+from botocraft.services.ecs import Cluster, ClusterManager, Service
+
+DISTINCT_CLIENTS = 3
+POOL_SIZE = 2
+WORKERS = 8
+ROUNDS = 25
+
+
+class TestClientPool:
+    """Verify client reuse, keying and eviction."""
+
+    def test_reuses_client_for_same_session_and_service(self) -> None:
+        """Build one client per session/service pair."""
+        pool = ClientPool(max_size=4)
+        session = MagicMock()
+
+        first = pool.get("ecs", session=session)
+        second = pool.get("ecs", session=session)
+
+        assert first is second
+        session.client.assert_called_once_with("ecs")
+        stats = pool.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_keys_on_region_and_config(self) -> None:
+        """Build separate clients for different regions and configs."""
+        pool = ClientPool(max_size=8)
+        session = MagicMock()
+        session.client.side_effect = lambda *_args, **_kwargs: MagicMock()
+
+        default = pool.get("ecs", session=session)
+        east = pool.get("ecs", session=session, region_name="us-east-1")
+        retries = pool.get(
+            "ecs", session=session, config=Config(retries={"max_attempts": 3})
+        )
+
+        assert len({id(default), id(east), id(retries)}) == DISTINCT_CLIENTS
+        assert retries is pool.get(
+            "ecs", session=session, config=Config(retries={"max_attempts": 3})
+        )
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Drop the oldest client once the pool is full."""
+        pool = ClientPool(max_size=POOL_SIZE)
+        session = MagicMock()
+        session.client.side_effect = lambda *_args, **_kwargs: MagicMock()
+
+        ecs = pool.get("ecs", session=session)
+        pool.get("ec2", session=session)
+        pool.get("ecs", session=session)
+        pool.get("s3", session=session)
+
+        assert pool.get("ecs", session=session) is ecs
+        assert pool.stats().evictions == 1
+        assert len(pool) == POOL_SIZE
+
+    def test_default_session_goes_through_boto3_client(self) -> None:
+        """Build default-session clients with ``boto3.client`` so patches apply."""
+        with patch("boto3.client") as mock_client:
+            client = client_pool.get("ecs")
+
+        assert client is mock_client.return_value
+        assert default_session() is boto3.DEFAULT_SESSION
+
+    def test_slow_build_does_not_block_other_lookups(self) -> None:
+        """Serve other keys while one client is still being built."""
+        pool = ClientPool(max_size=4)
+        session, slow_session = MagicMock(), MagicMock()
+        ecs = pool.get("ecs", session=session)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_client(*_args, **_kwargs) -> MagicMock:
+            started.set()
+            release.wait(5)
+            return MagicMock()
+
+        slow_session.client.side_effect = slow_client
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            building = executor.submit(pool.get, "ec2", session=slow_session)
+            assert started.wait(5)
+            try:
+                assert pool.get("ecs", session=session) is ecs
+                pool.get("s3", session=MagicMock())
+            finally:
+                release.set()
+            building.result()
+
+    def test_racing_threads_build_one_client(self) -> None:
+        """Build a key once, however many threads ask for it at once."""
+        pool = ClientPool(max_size=4)
+        session = MagicMock()
+        barrier = threading.Barrier(WORKERS)
+
+        def get() -> object:
+            barrier.wait()
+            return pool.get("ecs", session=session)
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            clients = [
+                f.result() for f in [executor.submit(get) for _ in range(WORKERS)]
+            ]
+
+        assert all(client is clients[0] for client in clients)
+        session.client.assert_called_once_with("ecs")
+        assert pool.stats().misses == 1
+
+
+class TestManagerPool:
+    """Verify ``objects`` and ``using`` share pooled managers."""
+
+    @patch("boto3.client")
+    def test_objects_returns_shared_manager(self, mock_client) -> None:
+        """Return the same manager and client on every ``objects`` access."""
+        manager = Cluster.objects
+
+        assert manager is Cluster.objects
+        assert isinstance(manager, ClusterManager)
+        assert manager.session is default_session()
+        assert manager.client is Cluster.objects.client
+        mock_client.assert_called_once_with("ecs")
+
+    @patch("boto3.client")
+    def test_services_share_one_client(self, mock_client) -> None:
+        """Share one ECS client between managers of different models."""
+        assert Cluster.objects.client is Service.objects.client
+        mock_client.assert_called_once_with("ecs")
+
+    @patch("boto3.client")
+    def test_using_returns_pooled_manager_without_mutating(self, mock_client) -> None:
+        """Leave the shared manager alone when binding another session."""
+        session = MagicMock()
+        manager = Cluster.objects
+
+        bound = manager.using(session)
+
+        assert bound is not manager
+        assert bound is Cluster.objects.using(session)
+        assert bound.session is session
+        assert bound.client is session.client.return_value
+        assert manager.session is default_session()
+        assert manager.client is mock_client.return_value
+        session.client.assert_called_once_with("ecs")
+
+    def test_using_same_or_no_session_returns_self(self) -> None:
+        """Return ``self`` when the session would not change."""
+        manager = ManagerPool(max_size=2).get(ClusterManager, MagicMock())
+
+        assert manager.using(None) is manager
+        assert manager.using(manager.session) is manager
+
+
+class TestLazyManagers:
+    """Verify managers defer session and client resolution until use."""
+
+    @patch("boto3.client")
+    def test_construction_builds_no_client(self, mock_client) -> None:
+        """Build the client on first ``client`` access only."""
+        manager = ClusterManager()
+
+        mock_client.assert_not_called()
+        assert manager.client is mock_client.return_value
+        assert manager.client is mock_client.return_value
+        mock_client.assert_called_once_with("ecs")
+
+    def test_session_assigned_before_use_drives_client(self) -> None:
+        """Build the client from a session assigned after construction."""
+        session = MagicMock()
+        manager = ClusterManager()
+
+        manager.session = session
+
+        assert manager.client is session.client.return_value
+
+    def test_manager_built_without_init_resolves_lazily(self) -> None:
+        """Support managers made with ``__new__`` and an injected client."""
+        client = MagicMock()
+        manager = ClusterManager.__new__(ClusterManager)
+        manager.client = client
+        manager.session = None
+
+        assert manager.client is client
+        assert manager.session is default_session()
+
+
+class TestScopedSessions:
+    """Verify ``using_session`` scoping and cross-thread isolation."""
+
+    @patch("boto3.client")
+    def test_using_session_rebinds_objects_within_block(self, mock_client) -> None:
+        """Resolve ``objects`` to the scoped session only inside the block."""
+        session = MagicMock()
+
+        with using_session(session) as scoped:
+            inside = Cluster.objects
+
+        assert scoped is session
+        assert inside.session is session
+        assert Cluster.objects.session is default_session()
+        assert Cluster.objects.client is mock_client.return_value
+
+    @patch("boto3.client")
+    def test_objects_is_not_bound_by_first_use_in_a_block(self, mock_client) -> None:
+        """Keep ``objects`` on the default session when first read in a block."""
+        other = MagicMock()
+        other.client.return_value.meta.region_name = "eu-west-1"
+        manager = Cluster.objects
+
+        with using_session(other):
+            assert manager.session is default_session()
+            manager.client  # noqa: B018
+            manager.using(other)
+
+        assert Cluster.objects.session is default_session()
+        assert Cluster.objects.client is mock_client.return_value
+        other.client.assert_not_called()
+
+    def test_unbound_manager_follows_session_in_scope(self) -> None:
+        """Resolve an unbound manager's session and client on every use."""
+        first, second = MagicMock(), MagicMock()
+        manager = ClusterManager()
+
+        with using_session(first):
+            assert manager.session is first
+            assert manager.client is first.client.return_value
+        with using_session(second):
+            assert manager.session is second
+            assert manager.client is second.client.return_value
+
+    def test_threads_keep_their_own_sessions(self) -> None:
+        """Give each worker thread the manager for its own session."""
+        sessions = [MagicMock(name=f"session-{index}") for index in range(WORKERS)]
+        barrier = threading.Barrier(WORKERS)
+
+        def work(session: MagicMock) -> list[tuple[object, object]]:
+            seen = []
+            barrier.wait()
+            for _ in range(ROUNDS):
+                with using_session(session):
+                    manager = Cluster.objects
+                    seen.append((manager.session, manager.client))
+            return seen
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            results = list(executor.map(work, sessions))
+
+        for session, seen in zip(sessions, results, strict=True):
+            assert {id(bound) for bound, _ in seen} == {id(session)}
+            assert {id(client) for _, client in seen} == {
+                id(session.client.return_value)
+            }
+            session.client.assert_called_once_with("ecs")
+
+    @patch("boto3.client")
+    def test_shared_manager_serves_many_threads(self, mock_client) -> None:
+        """Bind sessions concurrently through one manager without mutating it."""
+        manager = Cluster.objects
+        sessions = [MagicMock(name=f"session-{index}") for index in range(WORKERS)]
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            bound = list(executor.map(manager.using, sessions * ROUNDS))
+
+        assert [item.session for item in bound] == sessions * ROUNDS
+        assert manager.session is default_session()
+        assert manager.client is mock_client.return_value
@@ -0,0 +1,211 @@
+"""Tests for the concurrent batch-describe hydration engine."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from botocraft.config import HydrationSettings
+from botocraft.hydration import hydrate
+from botocraft.mixins.ecs import ecs_services_only
+from botocraft.services.abstract import PrimaryBoto3ModelQuerySet
+
+SERVICE_COUNT = 25
+MAX_WORKERS = 4
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Describe")
+
+
+@pytest.fixture(autouse=True)
+def _fast_settings():
+    """Use a known worker limit."""
+    settings = HydrationSettings(max_workers=MAX_WORKERS)
+    with patch("botocraft.hydration._settings", return_value=settings):
+        yield
+
+
+class TestHydrate:
+    """Verify chunking, ordering, concurrency and retries."""
+
+    def test_keeps_input_order_across_concurrent_chunks(self) -> None:
+        """Return results in input order even when chunks finish out of order."""
+
+        def fetch(chunk: list[int]) -> list[int]:
+            time.sleep(random.uniform(0, 0.01))  # noqa: S311
+            return [item * 10 for item in chunk]
+
+        result = hydrate(range(97), fetch, batch_size=10)
+
+        assert result == [item * 10 for item in range(97)]
+
+    def test_chunks_respect_batch_size_and_worker_limit(self) -> None:
+        """Never send more than ``batch_size`` items or run too many workers."""
+        sizes: list[int] = []
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(chunk: list[int]) -> list[int]:
+            nonlocal active, peak
+            with lock:
+                sizes.append(len(chunk))
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.005)
+            with lock:
+                active -= 1
+            return chunk
+
+        hydrate(list(range(95)), fetch, batch_size=10)
+
+        assert sorted(sizes) == [5] + [10] * 9
+        assert peak <= MAX_WORKERS
+
+    def test_accepts_querysets_and_none(self) -> None:
+        """Flatten querysets and skip chunks that describe nothing."""
+        responses = {0: PrimaryBoto3ModelQuerySet(["a", "b"]), 2: None}
+
+        result = hydrate(
+            [0, 1, 2], lambda chunk: responses.get(chunk[0], ["c"]), batch_size=1
+        )
+
+        assert result == ["a", "b", "c"]
+
+    def test_leaves_throttling_retries_to_botocore(self) -> None:
+        """Raise a throttled chunk's error rather than retrying it again."""
+        fetch = MagicMock(side_effect=_client_error("Throttling"))
+
+        with pytest.raises(ClientError):
+            hydrate([1], fetch, batch_size=1)
+
+        fetch.assert_called_once()
+
+    def test_stops_after_first_error(self) -> None:
+        """Skip the chunks not yet started once one chunk fails."""
+        fetch = MagicMock(side_effect=_client_error("AccessDeniedException"))
+
+        with pytest.raises(ClientError):
+            hydrate(list(range(100)), fetch, batch_size=1)
+
+        assert fetch.call_count <= MAX_WORKERS
+
+    def test_runs_on_one_shared_pool(self) -> None:
+        """Run every call's chunks on the same, bounded set of threads."""
+        threads: set[str] = set()
+        lock = threading.Lock()
+
+        def fetch(chunk: list[int]) -> list[int]:
+            with lock:
+                threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            return chunk
+
+        for _ in range(5):
+            hydrate(list(range(40)), fetch, batch_size=1)
+
+        assert all(name.startswith("botocraft-hydrate") for name in threads)
+        assert len(threads) <= HydrationSettings().max_workers
+
+    def test_nested_hydration_runs_inline(self) -> None:
+        """Describe nested chunks on the worker already running the outer one."""
+        inner_threads: list[tuple[str, str]] = []
+        lock = threading.Lock()
+
+        def inner(chunk: list[int]) -> list[int]:
+            return chunk
+
+        def outer(chunk: list[int]) -> list[int]:
+            outer_thread = threading.current_thread().name
+
+            def record(inner_chunk: list[int]) -> list[int]:
+                with lock:
+                    inner_threads.append(
+                        (outer_thread, threading.current_thread().name)
+                    )
+                return inner(inner_chunk)
+
+            return hydrate(chunk, record, batch_size=1)
+
+        result = hydrate(list(range(20)), outer, batch_size=5)
+
+        assert result == list(range(20))
+        assert len(inner_threads) == 20  # noqa: PLR2004
+        assert all(outer == inner for outer, inner in inner_threads)
+
+
+class TestEcsServicesOnly:
+    """Verify ``ecs_services_only`` hands the listing to ``get_many``."""
+
+    def test_passes_every_arn_to_get_many(self) -> None:
+        """Leave chunking to ``get_many`` and keep listing order."""
+        arns = [f"arn:service/{index}" for index in range(SERVICE_COUNT)]
+        manager = MagicMock()
+        manager.get_many.side_effect = lambda chunk, **_: PrimaryBoto3ModelQuerySet(
+            list(chunk)
+        )
+
+        @ecs_services_only
+        def list_services(_self, **_kwargs) -> list[str]:
+            return arns
+
+        result = list_services(manager, cluster="prod")
+
+        assert result.results == arns
+        manager.get_many.assert_called_once_with(arns, cluster="prod", include=["TAGS"])
+
+
+class TestBatchedGetMany:
+    """Verify generated ``get_many`` methods chunk to the API limit."""
+
+    def test_describes_services_in_limit_sized_chunks(self) -> None:
+        """Describe services ten at a time and merge them in order."""
+        from botocraft.services.ecs import Service
+
+        arns = [f"arn:service/{index}" for index in range(SERVICE_COUNT)]
+        client = MagicMock()
+        client.describe_services.side_effect = lambda services, **_: {
+            "services": [
+                {
+                    "serviceArn": arn,
+                    "serviceName": arn.rsplit("/", 1)[-1],
+                    "clusterArn": "arn:cluster/prod",
+                    "taskDefinition": "app:1",
+                    "desiredCount": 1,
+                    "launchType": "FARGATE",
+                    "schedulingStrategy": "REPLICA",
+                }
+                for arn in services
+            ]
+        }
+        with patch("boto3.client", return_value=client):
+            services = Service.objects.get_many(arns, cluster="prod")
+
+        assert isinstance(services, PrimaryBoto3ModelQuerySet)
+        assert [service.serviceArn for service in services] == arns
+        assert all(service.session is not None for service in services)
+        sizes = sorted(
+            len(c.kwargs["services"]) for c in client.describe_services.call_args_list
+        )
+        assert sizes == [5, 10, 10]
+        assert Service.objects.get_many_batch_size == 10  # noqa: PLR2004
+
+    def test_no_identifiers_makes_one_call(self) -> None:
+        """Describe once, unchunked, when no identifiers are given."""
+        from botocraft.services.ecs import CapacityProvider
+
+        client = MagicMock()
+        client.describe_capacity_providers.return_value = {
+            "capacityProviders": [{"name": "FARGATE"}]
+        }
+        with patch("boto3.client", return_value=client):
+            providers = CapacityProvider.objects.get_many()
+
+        assert [provider.name for provider in providers] == ["FARGATE"]
+        client.describe_capacity_providers.assert_called_once_with()
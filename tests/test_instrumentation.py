@@ -0,0 +1,127 @@
+"""Tests for the AWS API call instrumentation."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+import botocraft
+from botocraft.instrumentation import LATENCY_BUCKETS, OperationStats, instrumentation
+from botocraft.services.ecs import Cluster
+
+CLUSTER_ARN = "arn:aws:ecs:us-west-2:123456789012:cluster/prod"
+
+RESPONSES = {
+    "DescribeClusters": (
+        200,
+        {"clusters": [{"clusterArn": CLUSTER_ARN, "clusterName": "prod"}]},
+    ),
+    "ListClusters": (200, {"clusterArns": [CLUSTER_ARN]}),
+    "DeleteCluster": (400, {"__type": "ThrottlingException", "message": "slow"}),
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    botocraft.reset_stats()
+    yield
+    botocraft.reset_stats()
+
+
+@pytest.fixture
+def ecs_client(ecs_responses):
+    ecs_responses.update(RESPONSES)
+
+
+@pytest.mark.usefixtures("ecs_client")
+class TestInstrumentation:
+    """Verify what is recorded for each call, and who it is attributed to."""
+
+    def test_records_call_latency_and_size(self) -> None:
+        Cluster.objects.get("prod")
+
+        stats = botocraft.stats()["ecs.describe_clusters"]
+        assert stats.calls == 1
+        assert stats.errors == 0
+        assert stats.bytes > 0
+        assert sum(stats.latency_buckets) == 1
+        assert stats.callers == {"ClusterManager.get": 1}
+
+    def test_attributes_hydration_to_list(self) -> None:
+        Cluster.objects.list()
+
+        stats = botocraft.stats()
+        assert stats["ecs.list_clusters"].pages == 1
+        assert stats["ecs.list_clusters"].callers == {"ClusterManager.list": 1}
+        assert stats["ecs.describe_clusters"].callers == {"ClusterManager.list": 1}
+
+    def test_attributes_later_pages_to_list(self, ecs_responses) -> None:
+        def list_clusters(params):
+            if params.get("nextToken"):
+                return 200, {"clusterArns": [CLUSTER_ARN]}
+            return 200, {"clusterArns": [CLUSTER_ARN], "nextToken": "page-2"}
+
+        ecs_responses["ListClusters"] = list_clusters
+        list(Cluster.objects.list())
+
+        stats = botocraft.stats()["ecs.list_clusters"]
+        assert stats.calls == 2  # noqa: PLR2004
+        assert stats.callers == {"ClusterManager.list": 2}
+
+    def test_records_errors_and_throttles(self) -> None:
+        with pytest.raises(ClientError):
+            Cluster.objects.delete("prod")
+
+        stats = botocraft.stats()["ecs.delete_cluster"]
+        assert (stats.calls, stats.errors, stats.throttles) == (1, 1, 1)
+
+    def test_reset(self) -> None:
+        Cluster.objects.get("prod")
+        botocraft.reset_stats()
+
+        assert botocraft.stats() == {}
+
+    def test_exports_to_opentelemetry(self) -> None:
+        meter = MagicMock()
+        instrumentation.enable_opentelemetry(meter)
+        try:
+            Cluster.objects.get("prod")
+        finally:
+            instrumentation._exporter = None  # noqa: SLF001
+
+        calls = meter.create_counter.return_value.add.call_args_list
+        assert calls[0].args == (
+            1,
+            {
+                "rpc.system": "aws-api",
+                "rpc.service": "ecs",
+                "rpc.method": "describe_clusters",
+                "botocraft.method": "ClusterManager.get",
+            },
+        )
+        meter.create_histogram.return_value.record.assert_called_once()
+
+
+class TestOperationStats:
+    """Verify the derived latency figures."""
+
+    def test_percentile_from_histogram(self) -> None:
+        stats = OperationStats("ecs", "describe_services", calls=4, total_seconds=1)
+        stats.latency_buckets[0] = 3
+        stats.latency_buckets[-1] = 1
+
+        assert stats.mean_seconds == 0.25  # noqa: PLR2004
+        assert stats.percentile(50) == LATENCY_BUCKETS[0]
+        assert stats.percentile(99) == float("inf")
+
+
+def test_importing_botocraft_does_not_import_instrumentation() -> None:
+    script = "import sys, botocraft; print('botocraft.instrumentation' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.strip() == "False"
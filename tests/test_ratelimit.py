@@ -0,0 +1,185 @@
+"""Tests for the adaptive per-operation rate limiter."""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from botocraft.clients import client_pool
+from botocraft.config import RateLimitSettings
+from botocraft.ratelimit import RateLimiter, TokenBucket, rate_limiter
+
+WORKERS = 8
+CALLS = 40
+
+
+class FakeClock:
+    """A clock that only moves when something sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self.lock:
+            self.now += seconds
+
+
+class FakeRaw:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def stream(self, **_):
+        yield self.body
+
+
+def respond(status: int, body: dict) -> AWSResponse:
+    return AWSResponse(
+        "https://ecs.us-west-2.amazonaws.com/",
+        status,
+        {"Content-Type": "application/x-amz-json-1.1"},
+        FakeRaw(json.dumps(body).encode()),
+    )
+
+
+@pytest.fixture
+def enabled():
+    settings = RateLimitSettings(enabled=True, rate=10, rates={"ecs": 4})
+    with patch("botocraft.ratelimit._settings", return_value=settings):
+        rate_limiter.reset()
+        yield settings
+    rate_limiter.reset()
+
+
+def rate_limit_events(client: MagicMock) -> list[str]:
+    return [
+        c.args[0]
+        for c in client.meta.events.register.call_args_list
+        if c.kwargs["unique_id"].startswith("botocraft-rate-limit")
+    ]
+
+
+def bucket(clock: FakeClock, **kwargs) -> TokenBucket:
+    return TokenBucket(10, burst=2, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestTokenBucket:
+    """Verify token accounting and AIMD rate adaptation."""
+
+    def test_bursts_then_waits_for_the_rate(self) -> None:
+        clock = FakeClock()
+        limiter = bucket(clock)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        assert waits[:2] == [0, 0]
+        assert waits[2:] == pytest.approx([0.1, 0.1])
+        assert limiter.stats().calls == 4  # noqa: PLR2004
+
+    def test_throttling_shrinks_rate_once_per_cooldown(self) -> None:
+        clock = FakeClock()
+        limiter = bucket(clock, min_rate=2)
+
+        limiter.record_throttle()
+        limiter.record_throttle()
+        assert limiter.rate == 5  # noqa: PLR2004
+
+        clock.sleep(1)
+        limiter.record_throttle()
+        clock.sleep(1)
+        limiter.record_throttle()
+        assert limiter.rate == 2  # noqa: PLR2004
+        assert limiter.stats().throttles == 4  # noqa: PLR2004
+
+    def test_success_recovers_additively_to_ceiling(self) -> None:
+        clock = FakeClock()
+        limiter = bucket(clock, increase=1)
+        limiter.record_throttle()
+
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.rate == 8  # noqa: PLR2004
+
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.rate == 10  # noqa: PLR2004
+
+    def test_shared_across_threads(self) -> None:
+        limiter = TokenBucket(1000, burst=CALLS)
+
+        with ThreadPoolExecutor(WORKERS) as pool:
+            list(pool.map(lambda _: limiter.acquire(), range(CALLS)))
+
+        assert limiter.stats().calls == CALLS
+
+
+class TestRateLimiter:
+    """Verify per-operation buckets and the botocore event hooks."""
+
+    def test_rates_looked_up_most_specific_first(self) -> None:
+        limiter = RateLimiter()
+        with patch(
+            "botocraft.ratelimit._settings",
+            return_value=RateLimitSettings(
+                rate=10, rates={"ecs": 4, "ecs.describe_tasks": 2}
+            ),
+        ):
+            assert limiter.bucket("ecs", "describe_tasks").max_rate == 2  # noqa: PLR2004
+            assert limiter.bucket("ecs", "describe_services").max_rate == 4  # noqa: PLR2004
+            assert limiter.bucket("ec2", "describe_instances").max_rate == 10  # noqa: PLR2004
+        assert limiter.bucket("ecs", "describe_tasks") is limiter.bucket(
+            "ecs", "describe_tasks"
+        )
+
+    @pytest.mark.usefixtures("enabled")
+    def test_adapts_to_throttled_calls(self) -> None:
+        session = boto3.session.Session(
+            aws_access_key_id="AKID",
+            aws_secret_access_key="secret",  # noqa: S106
+            region_name="us-west-2",
+        )
+        client = session.client(
+            "ecs", config=Config(retries={"mode": "standard", "total_max_attempts": 1})
+        )
+        responses = iter(
+            [
+                respond(400, {"__type": "ThrottlingException", "message": "slow"}),
+                respond(200, {"clusters": [], "failures": []}),
+            ]
+        )
+        client.meta.events.register("before-send", lambda **_: next(responses))
+        rate_limiter.install(client, "ecs")
+
+        with pytest.raises(ClientError):
+            client.describe_clusters()
+        throttled = rate_limiter.stats()["ecs.describe_clusters"]
+        client.describe_clusters()
+        recovered = rate_limiter.stats()["ecs.describe_clusters"]
+
+        assert (throttled.max_rate, throttled.rate, throttled.throttles) == (4, 2, 1)
+        assert recovered.calls == 2  # noqa: PLR2004
+        assert recovered.rate == pytest.approx(2.1)
+
+    def test_pooled_clients_not_limited_by_default(self) -> None:
+        client = MagicMock()
+        with patch("boto3.client", return_value=client):
+            client_pool.get("ecs")
+        assert not rate_limit_events(client)
+
+    @pytest.mark.usefixtures("enabled")
+    def test_pooled_clients_limited_when_enabled(self) -> None:
+        client = MagicMock()
+        with patch("boto3.client", return_value=client):
+            client_pool.get("ecs")
+        assert rate_limit_events(client) == ["before-send", "needs-retry"]